@@ -5,13 +5,19 @@ import subprocess
 import os
 import time
 import logging
+import math
+import csv
+import itertools
 import random
 import json
+import queue
+import traceback
 import h5py
 import numpy as np
 import threading
 import multiprocessing
 
+from .latency_histogram import LatencyHistogram
 from .utils import csr_read_all, gt_read_all, calculate_recall
 
 class BaseClient:
@@ -43,6 +49,8 @@ class BaseClient:
         self.mp_done_queries = multiprocessing.Value("i", 0, lock=False)
         self.mp_active_workers = multiprocessing.Value("i", 0, lock=False)
         self.mp_results = self.mp_manager.list()
+        # Extra query parameters, set per point by the parameter sweep
+        self.search_params = dict()
 
     @abstractmethod
     def upload(self):
@@ -59,6 +67,18 @@ class BaseClient:
     def do_single_query(self, query_id, client_id) -> list[Any]:
         pass
 
+    def create_sweep_index(self, index_params: dict) -> str:
+        """
+        Build (or reuse) an index with the given parameters for the parameter sweep, return the name to query it by.
+        """
+        raise NotImplementedError(f"{type(self).__name__} doesn't support index parameter sweep")
+
+    def index_size(self, index_name: str) -> int | None:
+        """
+        Size in bytes of an index built for the parameter sweep, None if the engine can't tell.
+        """
+        return None
+
     def download_data(self, url, target_path):
         """
         Download dataset and extract it into path.
@@ -88,9 +108,7 @@ class BaseClient:
         else:
             subprocess.run(["wget", "-O", target_path, url], check=True)
 
-    def search_mt(self, is_express=False, num_workers=1):
-        self.setup_clients(num_workers)
-
+    def load_queries(self):
         query_path = os.path.join(self.path_prefix, self.data["query_path"])
         _, ext = os.path.splitext(query_path)
         if self.data["mode"] == "fulltext":
@@ -103,7 +121,7 @@ class BaseClient:
                 with h5py.File(query_path, "r") as f:
                     self.queries = list(f["test"])
             else:
-                assert ext == "jsonl"
+                assert ext == ".jsonl"
                 for line in open(query_path, "r"):
                     query = json.loads(line)["vector"]
                     self.queries.append(query)
@@ -116,6 +134,10 @@ class BaseClient:
         else:
             raise TypeError("Unsupported type")
 
+    def search_mt(self, is_express=False, num_workers=1):
+        self.setup_clients(num_workers)
+        self.load_queries()
+
         self.mt_active_workers = num_workers
         threads = []
         for i in range(num_workers):
@@ -225,25 +247,7 @@ class BaseClient:
             self.mt_active_workers -= 1
 
     def search_mp(self, is_express=False, num_workers=1):
-        query_path = os.path.join(self.path_prefix, self.data["query_path"])
-        _, ext = os.path.splitext(query_path)
-        if self.data["mode"] == "fulltext":
-            assert ext == ".txt"
-            for line in open(query_path, "r"):
-                line = line.strip()
-                self.queries.append(line)
-        elif self.data["mode"] == "vector":
-            if ext == ".hdf5":
-                with h5py.File(query_path, "r") as f:
-                    self.queries = list(f["test"])
-        elif self.data["mode"] == "sparse_vector":
-            assert ext == ".csr"
-            query_mat = csr_read_all(query_path)
-            for query_id in range(query_mat.nrow):
-                indices, values = query_mat.at(query_id)
-                self.queries.append((indices, values))
-        else:
-            raise TypeError("Unsupported type")
+        self.load_queries()
 
         self.mp_active_workers.value = num_workers
         workers = []
@@ -360,9 +364,267 @@ class BaseClient:
         with self.mp_lock:
             self.mp_active_workers.value -= 1
 
+    def search_open_loop(self, args, num_workers=1):
+        """
+        Open-loop load: every worker sends random queries at Poisson arrival times with rate target_qps / num_workers.
+        Latency is measured from the scheduled send time, so the time a query waits behind slow ones is counted instead
+        of being hidden by a lower sending rate (coordinated omission). Workers record into latency histograms which are
+        merged per report interval.
+        A worker sends one query at a time, so a query scheduled while the previous one is still running is sent late.
+        Such sends are counted as late, use more workers if there are many of them.
+        """
+        self.load_queries()
+        rate = args.target_qps / num_workers
+        # leave the workers time to connect before the first arrival
+        start_at = time.time() + 2
+        deadline = start_at + args.duration
+        worker_args = [rate, start_at, deadline, args.report_interval]
+        if args.concurrency == "mp":
+            report_queue = self.mp_manager.Queue()
+            workers = [
+                multiprocessing.Process(
+                    target=self.open_loop_process_mainloop,
+                    args=worker_args + [report_queue],
+                    daemon=True,
+                )
+                for _ in range(num_workers)
+            ]
+        else:
+            self.setup_clients(num_workers)
+            report_queue = queue.Queue()
+            workers = [
+                threading.Thread(
+                    target=self.open_loop_mainloop,
+                    args=[i] + worker_args + [report_queue],
+                    daemon=True,
+                )
+                for i in range(num_workers)
+            ]
+        for worker in workers:
+            worker.start()
+        logging.info(
+            f"Sending {args.target_qps} QPS with Poisson arrivals from {num_workers} workers for {args.duration} seconds"
+        )
+
+        # every worker reports every interval once, print an interval when all workers have reported it
+        pending = {}
+        next_interval = 0
+        finished_workers = 0
+        total = LatencyHistogram()
+        total_late = 0
+        interval_reports = []
+        worker_errors = []
+        while finished_workers < num_workers:
+            message = report_queue.get()
+            if message is None:
+                finished_workers += 1
+                continue
+            if message[0] == "error":
+                worker_errors.append(message[1])
+                continue
+            interval, encoded, late = message
+            histogram, reported, interval_late = pending.get(interval, (LatencyHistogram(), 0, 0))
+            histogram.merge(LatencyHistogram.decode(encoded))
+            pending[interval] = (histogram, reported + 1, interval_late + late)
+            while next_interval in pending and pending[next_interval][1] == num_workers:
+                histogram, _, late = pending.pop(next_interval)
+                total.merge(histogram)
+                total_late += late
+                report = {
+                    "interval": next_interval,
+                    "start_sec": next_interval * args.report_interval,
+                    "qps": histogram.total_count / args.report_interval,
+                    "late": late,
+                    **histogram.summary(),
+                }
+                interval_reports.append(report)
+                logging.info(
+                    f"interval {next_interval}: {report['qps']:.1f} QPS, p50 {report['p50_ms']:.3f} ms, "
+                    f"p90 {report['p90_ms']:.3f} ms, p99 {report['p99_ms']:.3f} ms, p999 {report['p999_ms']:.3f} ms, "
+                    f"max {report['max_ms']:.3f} ms, {late} late sends"
+                )
+                next_interval += 1
+        for worker in workers:
+            worker.join()
+        if worker_errors:
+            raise RuntimeError(f"{len(worker_errors)} open-loop workers failed, the first one:\n{worker_errors[0]}")
+
+        total_report = {"qps": total.total_count / args.duration, "late": total_late, **total.summary()}
+        logging.info(
+            f"target QPS {args.target_qps}, achieved QPS {total_report['qps']:.1f}, "
+            f"mean {total_report['mean_ms']:.3f} ms, p50 {total_report['p50_ms']:.3f} ms, "
+            f"p90 {total_report['p90_ms']:.3f} ms, p99 {total_report['p99_ms']:.3f} ms, "
+            f"p999 {total_report['p999_ms']:.3f} ms, max {total_report['max_ms']:.3f} ms, "
+            f"{total_late} sends late behind a running query"
+        )
+        if args.report_json:
+            with open(args.report_json, "w") as f:
+                json.dump(
+                    {
+                        "engine": args.engine,
+                        "dataset": args.dataset,
+                        "target_qps": args.target_qps,
+                        "workers": num_workers,
+                        "concurrency": args.concurrency,
+                        "duration_sec": args.duration,
+                        "report_interval_sec": args.report_interval,
+                        "intervals": interval_reports,
+                        "total": total_report,
+                    },
+                    f,
+                    indent=2,
+                )
+            logging.info(f"report saved to {args.report_json}")
+
+    def open_loop_mainloop(self, client_id: int, rate: float, start_at: float, deadline: float,
+                           report_interval: float, report_queue, setup_client: bool = False):
+        # the parent waits for a None from every worker, a failure is sent as an error message before it
+        try:
+            if setup_client:
+                self.setup_clients(1)  # socket is unsafe to share among workers
+            num_queries = len(self.queries)
+            num_intervals = math.ceil((deadline - start_at) / report_interval)
+            local_rng = random.Random()  # random number generator per worker
+            interval = 0
+            histogram = LatencyHistogram()
+            late = 0
+            scheduled = start_at + local_rng.expovariate(rate)
+            while scheduled < deadline:
+                while scheduled >= start_at + (interval + 1) * report_interval:
+                    report_queue.put((interval, histogram.encode(), late))
+                    interval += 1
+                    histogram = LatencyHistogram()
+                    late = 0
+                delay = scheduled - time.time()
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    # still busy with the previous query at the scheduled time
+                    late += 1
+                _ = self.do_single_query(local_rng.randrange(0, num_queries), client_id)
+                histogram.record((time.time() - scheduled) * 1000 * 1000)
+                scheduled += local_rng.expovariate(rate)
+            while interval < num_intervals:
+                report_queue.put((interval, histogram.encode(), late))
+                interval += 1
+                histogram = LatencyHistogram()
+                late = 0
+        except Exception:
+            report_queue.put(("error", traceback.format_exc()))
+        finally:
+            report_queue.put(None)
+
+    def open_loop_process_mainloop(self, rate: float, start_at: float, deadline: float, report_interval: float,
+                                   report_queue):
+        self.open_loop_mainloop(0, rate, start_at, deadline, report_interval, report_queue, setup_client=True)
+
+    def run_query_set(self, concurrency: str, num_workers: int):
+        """
+        Run the loaded query set once with the recording workers, return the results and the wall time in seconds.
+        """
+        if concurrency == "mp":
+            self.mp_next_begin.value = 0
+            self.mp_done_queries.value = 0
+            self.mp_active_workers.value = num_workers
+            del self.mp_results[:]
+            workers = [
+                multiprocessing.Process(target=self.search_process_mainloop, args=[False], daemon=True)
+                for _ in range(num_workers)
+            ]
+        else:
+            self.mt_next_begin = 0
+            self.mt_done_queries = 0
+            self.mt_active_workers = num_workers
+            self.mt_results = []
+            workers = [
+                threading.Thread(target=self.search_thread_mainloop, args=[False, i], daemon=True)
+                for i in range(num_workers)
+            ]
+        start = time.time()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.time() - start
+        results = list(self.mp_results) if concurrency == "mp" else self.mt_results
+        return results, elapsed
+
+    def search_sweep(self, args):
+        """
+        Measure recall and QPS for every point of a parameter grid, and mark the Pareto frontier
+        (points no other point beats in both recall and QPS). The grid file looks like
+        {"index": {"M": [16, 32], "ef_construction": [200]}, "search": {"ef": [50, 100, 200]}}:
+        "index" parameters are merged into the configured vector index and built once per combination,
+        "search" parameters are passed with every query.
+        """
+        with open(args.sweep, "r") as f:
+            grid = json.load(f)
+        index_grid = grid.get("index", {})
+        search_grid = grid.get("search", {})
+        self.load_queries()
+        num_workers = max(args.query, 1)
+        if args.concurrency != "mp":
+            self.setup_clients(num_workers)
+
+        points = []
+        for index_values in itertools.product(*index_grid.values()):
+            index_params = dict(zip(index_grid.keys(), index_values))
+            index_name = None
+            index_mb = None
+            if index_params:
+                index_name = self.create_sweep_index(index_params)
+                index_bytes = self.index_size(index_name)
+                index_mb = index_bytes / (1 << 20) if index_bytes is not None else None
+            warmed_up = False
+            for search_values in itertools.product(*search_grid.values()):
+                search_params = dict(zip(search_grid.keys(), search_values))
+                self.search_params = dict(search_params)
+                if index_name is not None:
+                    self.search_params["index_name"] = index_name
+                if not warmed_up:
+                    # the first pass over a new index mostly measures loading it
+                    self.run_query_set(args.concurrency, num_workers)
+                    warmed_up = True
+                results, elapsed = self.run_query_set(args.concurrency, num_workers)
+                recall = self.save_and_check_results(results)
+                latencies = [result[0][1] for result in results]
+                point = {
+                    **index_params,
+                    **search_params,
+                    "recall": recall,
+                    "qps": len(results) / elapsed,
+                    "mean_ms": np.mean(latencies),
+                    "p99_ms": np.percentile(latencies, 99),
+                    "index_mb": index_mb,
+                }
+                logging.info(f"sweep point {point}")
+                points.append(point)
+        self.search_params = dict()
+
+        # walk the points from the highest QPS down, a point is on the frontier if it has the best recall so far
+        best_recall = -math.inf
+        for point in sorted(points, key=lambda p: (-p["qps"], -(p["recall"] or 0))):
+            point["pareto"] = point["recall"] is not None and point["recall"] > best_recall
+            if point["pareto"]:
+                best_recall = point["recall"]
+
+        columns = list(index_grid.keys()) + list(search_grid.keys()) + ["recall", "qps", "mean_ms", "p99_ms", "index_mb",
+                                                                        "pareto"]
+        csv_path = args.sweep_csv or os.path.splitext(args.sweep)[0] + ".csv"
+        with open(csv_path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(points)
+        lines = ["".join(f"{column:>16}" for column in columns)]
+        for point in sorted(points, key=lambda p: -(p["recall"] or 0)):
+            lines.append("".join(f"{point[column]:>16.4f}" if isinstance(point[column], float) else f"{str(point[column]):>16}"
+                                 for column in columns))
+        logging.info("recall vs QPS:\n" + "\n".join(lines))
+        logging.info(f"sweep result saved to {csv_path}")
+
     def save_and_check_results(self, results: list[list[Any]]):
         """
-        Compare the search results with ground truth to calculate recall.
+        Compare the search results with ground truth to calculate recall, return the mean recall if there is a ground truth.
         """
         results = sorted(results, key=lambda x: x[0][0])
         if "result_path" in self.data:
@@ -437,6 +699,8 @@ class BaseClient:
                         )
                         precisions.append(precision)
             logging.info(f"""mean_precisions: {np.mean(precisions)}""")
+            return np.mean(precisions)
+        return None
 
     def run_experiment(self, args):
         """
@@ -447,6 +711,10 @@ class BaseClient:
             self.upload()
             finish_time = time.time()
             logging.info(f"upload finish, cost time = {finish_time - start_time}")
+        elif args.sweep:
+            self.search_sweep(args)
+        elif args.query_express >= 1 and args.target_qps > 0:
+            self.search_open_loop(args, args.query_express)
         elif args.query >= 1 or args.query_express >= 1:
             is_express = True if args.query_express >= 1 else False
             search_func = self.search_mp if args.concurrency == "mp" else self.search_mt
@@ -10,6 +10,8 @@ print(sys.path)
 from infinity_http import infinity_http
 import json
 import os
+import re
+import time
 import h5py
 from typing import Any
 import logging
@@ -18,6 +20,7 @@ import requests
 import infinity
 import infinity.index as index
 from infinity import NetworkAddress
+from infinity.common import ConflictType
 from infinity.common import SparseVector
 from infinity.remote_thrift.query_builder import InfinityThriftQueryBuilder
 from .base_client import BaseClient
@@ -53,8 +56,41 @@ class InfinityClient(BaseClient):
                 for param, v in value["params"].items():
                     params[param] = str(v)
                 indexs.append(index.IndexInfo(key, index.IndexType.BMP, params))
+            elif value["type"] == "IVF":
+                params = {}
+                for param, v in value["params"].items():
+                    params[param] = str(v)
+                indexs.append(index.IndexInfo(key, index.IndexType.IVF, params))
         return indexs
 
+    def create_sweep_index(self, index_params: dict) -> str:
+        """
+        Create an index on the vector column with the configured parameters overridden by index_params,
+        an index created by a previous sweep with the same parameters is reused.
+        """
+        column, schema = next(
+            (key, value) for key, value in self.data["index"].items() if value["type"] in ["HNSW", "IVF", "BMP"]
+        )
+        index_name = re.sub(r"\W", "_", "sweep_" + "_".join(f"{k}{v}" for k, v in index_params.items()))
+        table_obj = self.client.get_database("default_db").get_table(self.table_name)
+        if index_name in table_obj.list_indexes().index_names:
+            logging.info(f"reuse index {index_name}")
+            return index_name
+        params = {**schema.get("params", {}), **index_params}
+        idx = self._parse_index_schema({column: {"type": schema["type"], "params": params}})[0]
+        start_time = time.time()
+        table_obj.create_index(index_name, idx, ConflictType.Ignore)
+        logging.info(f"create index {index_name}, cost time = {time.time() - start_time}")
+        return index_name
+
+    def index_size(self, index_name: str) -> int | None:
+        # the index directory is only visible when the server runs on this machine
+        table_obj = self.client.get_database("default_db").get_table(self.table_name)
+        store_dir = table_obj.show_index(index_name).store_dir
+        if not os.path.isdir(store_dir):
+            return None
+        return sum(os.path.getsize(os.path.join(root, file)) for root, _, files in os.walk(store_dir) for file in files)
+
     def upload(self):
         """
         Upload data and build indexes (parameters are parsed by __init__).
@@ -79,31 +115,20 @@ class InfinityClient(BaseClient):
         features = list(self.data["schema"].keys())
         _, ext = os.path.splitext(dataset_path)
         if ext == ".json":
-            with open(dataset_path, "r") as f:
-                actions = []
-                for i, line in enumerate(f):
-                    if i % batch_size == 0 and i != 0:
-                        table_obj.insert(actions)
-                        actions = []
+            with open(dataset_path, "r") as f, table_obj.bulk_loader(batch_size=batch_size) as writer:
+                for line in f:
                     record = json.loads(line)
                     action = {}
                     for feature in features:
                         action[feature] = record.get(feature, "")
-                    actions.append(action)
-                if actions:
-                    table_obj.insert(actions)
+                    writer.add(action)
+            logging.info(f"upload: {writer.stats}")
         elif ext == ".hdf5":
-            with h5py.File(dataset_path, "r") as f:
-                actions = []
-                # line is vector
-                for i, line in enumerate(f["train"]):
-                    if i % batch_size == 0 and i != 0:
-                        table_obj.insert(actions)
-                        actions = []
-                    record = {self.data["vector_name"]: line.tolist()}
-                    actions.append(record)
-                if actions:
-                    table_obj.insert(actions)
+            with h5py.File(dataset_path, "r") as f, table_obj.bulk_loader(batch_size=batch_size) as writer:
+                train = f["train"]
+                for i in range(0, len(train), batch_size):
+                    writer.insert_columns({self.data["vector_name"]: train[i:i + batch_size]})
+            logging.info(f"upload: {writer.stats}")
         elif ext == ".csv":
             if self.data["use_import"]:
                 table_obj.import_data(dataset_path, import_options={"delimiter": "\t"})
@@ -173,6 +198,7 @@ class InfinityClient(BaseClient):
                     "float",
                     self.data["metric_type"],
                     self.data["topK"],
+                    {k: str(v) for k, v in self.search_params.items()},
                 )
                 .to_result()
             )
@@ -198,7 +224,7 @@ class InfinityClient(BaseClient):
                 SparseVector(**{"indices": indices, "values": values}),
                 self.data["metric_type"],#ip
                 self.data["topK"],
-                {"alpha": str(self.data["alpha"]), "beta": str(self.data["beta"])},
+                {k: str(v) for k, v in {"alpha": self.data["alpha"], "beta": self.data["beta"], **self.search_params}.items()},
             )
             res, _ = query_builder.to_result()
             result = res["ROW_ID"]
@@ -0,0 +1,101 @@
+import math
+
+import numpy as np
+
+
+class LatencyHistogram:
+    """
+    HDR style latency histogram. Values are integer microseconds, recorded into log-linear buckets which keep
+    3 significant digits from 1us up to max_value_us, so memory and merge cost do not grow with the sample count.
+    Histograms recorded by different workers are merged by adding their counts.
+    """
+
+    SUB_BUCKET_BITS = 11  # 2048 linear sub buckets per power of two, relative error below 0.1%
+    SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+    SUB_BUCKET_HALF = SUB_BUCKET_COUNT >> 1
+
+    def __init__(self, max_value_us: int = 3600 * 1000 * 1000):
+        self.max_value_us = max_value_us
+        self.counts = np.zeros(self._index_of(max_value_us) + 1, dtype=np.int64)
+        self.total_count = 0
+        self.min_value = math.inf
+        self.max_value = 0
+        self.sum_value = 0
+
+    @classmethod
+    def _index_of(cls, value: int) -> int:
+        if value < cls.SUB_BUCKET_COUNT:
+            return value
+        shift = value.bit_length() - cls.SUB_BUCKET_BITS
+        return (shift + 1) * cls.SUB_BUCKET_HALF + (value >> shift) - cls.SUB_BUCKET_HALF
+
+    @classmethod
+    def _highest_equivalent_value(cls, index: int) -> int:
+        if index < cls.SUB_BUCKET_COUNT:
+            return index
+        shift = index // cls.SUB_BUCKET_HALF - 1
+        sub_bucket = index % cls.SUB_BUCKET_HALF + cls.SUB_BUCKET_HALF
+        return ((sub_bucket + 1) << shift) - 1
+
+    def record(self, value_us: float, count: int = 1):
+        value = min(max(int(value_us), 0), self.max_value_us)
+        self.counts[self._index_of(value)] += count
+        self.total_count += count
+        self.min_value = min(self.min_value, value)
+        self.max_value = max(self.max_value, value)
+        self.sum_value += value * count
+
+    def merge(self, other: "LatencyHistogram"):
+        assert self.max_value_us == other.max_value_us
+        self.counts += other.counts
+        self.total_count += other.total_count
+        self.min_value = min(self.min_value, other.min_value)
+        self.max_value = max(self.max_value, other.max_value)
+        self.sum_value += other.sum_value
+
+    def percentile(self, percentile: float) -> int:
+        """
+        Smallest recorded value (up to bucket precision) that percentile% of the samples are less than or equal to.
+        """
+        if self.total_count == 0:
+            return 0
+        rank = max(1, math.ceil(percentile / 100 * self.total_count))
+        index = int(np.searchsorted(np.cumsum(self.counts), rank))
+        return min(self._highest_equivalent_value(index), self.max_value)
+
+    def mean(self) -> float:
+        return self.sum_value / self.total_count if self.total_count else 0.0
+
+    def encode(self) -> dict:
+        """
+        Compact picklable form to send a histogram to another process, only non-empty buckets are kept.
+        """
+        indices = np.flatnonzero(self.counts)
+        return {
+            "max_value_us": self.max_value_us,
+            "indices": indices.tolist(),
+            "counts": self.counts[indices].tolist(),
+            "min": self.min_value,
+            "max": self.max_value,
+            "sum": self.sum_value,
+        }
+
+    @classmethod
+    def decode(cls, encoded: dict) -> "LatencyHistogram":
+        histogram = cls(encoded["max_value_us"])
+        histogram.counts[encoded["indices"]] = encoded["counts"]
+        histogram.total_count = int(sum(encoded["counts"]))
+        histogram.min_value = encoded["min"]
+        histogram.max_value = encoded["max"]
+        histogram.sum_value = encoded["sum"]
+        return histogram
+
+    def summary(self, percentiles=(50, 90, 99, 99.9)) -> dict:
+        """
+        Count and latencies in milliseconds, keyed mean_ms, p50_ms, p90_ms, p99_ms, p999_ms, max_ms
+        """
+        result = {"count": self.total_count, "mean_ms": self.mean() / 1000}
+        for percentile in percentiles:
+            result["p" + f"{percentile:g}".replace(".", "") + "_ms"] = self.percentile(percentile) / 1000
+        result["max_ms"] = self.max_value / 1000
+        return result
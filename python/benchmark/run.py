@@ -44,6 +44,48 @@ def parse_args() -> argparse.Namespace:
         dest="query_express",
         help="Run the query set randomly using given number of clients without recording the result and latency. This is for QPS measurement.",
     )
+    parser.add_argument(
+        "--target-qps",
+        type=float,
+        default=0,
+        dest="target_qps",
+        help="Together with --query-express, send queries open-loop at this total rate with Poisson arrivals and report latency percentiles per interval, instead of running the workers as fast as possible. Queries sent late behind a running one are counted.",
+    )
+    parser.add_argument(
+        "--duration",
+        type=int,
+        default=60,
+        dest="duration",
+        help="Seconds to send queries in open-loop mode.",
+    )
+    parser.add_argument(
+        "--report-interval",
+        type=float,
+        default=10,
+        dest="report_interval",
+        help="Seconds between latency reports in open-loop mode.",
+    )
+    parser.add_argument(
+        "--report-json",
+        type=str,
+        default=None,
+        dest="report_json",
+        help="Write the open-loop latency report to this JSON file.",
+    )
+    parser.add_argument(
+        "--sweep",
+        type=str,
+        default=None,
+        dest="sweep",
+        help="Measure recall and QPS for every point of the index and search parameter grid in this JSON file, using the number of clients given by --query, and report the Pareto frontier.",
+    )
+    parser.add_argument(
+        "--sweep-csv",
+        type=str,
+        default=None,
+        dest="sweep_csv",
+        help="Write the sweep result to this CSV file, defaults to the grid file name with a .csv extension.",
+    )
     parser.add_argument(
         "--concurrency",
         type=str,
@@ -0,0 +1,113 @@
+# Copyright(C) 2024 InfiniFlow, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Measures the client side cost of encoding and decoding thrift messages for every protocol the SDK supports,
+# no server is needed:
+#   python thrift_codec_benchmark.py --rows 1000 --dimension 128 --rounds 20
+
+import argparse
+import time
+
+import numpy as np
+from thrift.transport import TTransport
+
+try:
+    from thrift.protocol import fastbinary
+except ImportError:
+    # thrift was installed without its C extension, the accelerated protocols fall back to pure python
+    fastbinary = None
+
+from infinity.remote_thrift.client import THRIFT_PROTOCOLS, make_thrift_protocol
+from infinity.remote_thrift.infinity_thrift_rpc import ttypes
+from infinity.remote_thrift.table import RemoteTable
+
+
+def insert_request(rows: int, dimension: int) -> ttypes.InsertRequest:
+    rng = np.random.default_rng(0)
+    data = [{"id": i, "title": f"document {i}", "vec": rng.random(dimension).tolist()} for i in range(rows)]
+    return ttypes.InsertRequest(db_name="default_db", table_name="bench", session_id=1,
+                                fields=RemoteTable._get_insert_fields(data))
+
+
+def select_response(rows: int, dimension: int) -> ttypes.SelectResponse:
+    rng = np.random.default_rng(0)
+    column_defs = [
+        ttypes.ColumnDef(id=0, name="id", data_type=ttypes.DataType(logic_type=ttypes.LogicType.Integer)),
+        ttypes.ColumnDef(id=1, name="vec", data_type=ttypes.DataType(logic_type=ttypes.LogicType.Embedding)),
+    ]
+    column_fields = [
+        ttypes.ColumnField(column_type=ttypes.ColumnType.ColumnInt32,
+                           column_vectors=[np.arange(rows, dtype=np.int32).tobytes()], column_name="id"),
+        ttypes.ColumnField(column_type=ttypes.ColumnType.ColumnEmbedding,
+                           column_vectors=[rng.random((rows, dimension), dtype=np.float32).tobytes()],
+                           column_name="vec", dimension=dimension),
+    ]
+    return ttypes.SelectResponse(error_code=0, error_msg="", column_defs=column_defs, column_fields=column_fields)
+
+
+def encode(message, protocol: str, accelerate: bool) -> bytes:
+    trans = TTransport.TMemoryBuffer()
+    message.write(make_thrift_protocol(protocol, trans, accelerate))
+    return trans.getvalue()
+
+
+def decode(message_type, payload: bytes, protocol: str, accelerate: bool):
+    message = message_type()
+    message.read(make_thrift_protocol(protocol, TTransport.TMemoryBuffer(payload), accelerate))
+    return message
+
+
+def measure(message, protocol: str, accelerate: bool, rounds: int):
+    payload = encode(message, protocol, accelerate)
+    assert decode(type(message), payload, protocol, accelerate) == message
+
+    begin = time.perf_counter()
+    for _ in range(rounds):
+        encode(message, protocol, accelerate)
+    encode_ms = (time.perf_counter() - begin) * 1000 / rounds
+
+    begin = time.perf_counter()
+    for _ in range(rounds):
+        decode(type(message), payload, protocol, accelerate)
+    decode_ms = (time.perf_counter() - begin) * 1000 / rounds
+    return len(payload), encode_ms, decode_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Thrift codec benchmark")
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--dimension", type=int, default=128)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    codecs = (True, False)
+    if fastbinary is None:
+        print("thrift.protocol.fastbinary is not available, accelerated protocols fall back to pure python")
+        codecs = (False,)
+
+    messages = {
+        "insert": insert_request(args.rows, args.dimension),
+        "select": select_response(args.rows, args.dimension),
+    }
+    print(f"{'message':<8}{'protocol':<10}{'codec':<8}{'bytes':>12}{'encode ms':>12}{'decode ms':>12}")
+    for name, message in messages.items():
+        for protocol in THRIFT_PROTOCOLS:
+            for accelerate in codecs:
+                size, encode_ms, decode_ms = measure(message, protocol, accelerate, args.rounds)
+                codec = "c" if accelerate else "python"
+                print(f"{name:<8}{protocol:<10}{codec:<8}{size:>12}{encode_ms:>12.2f}{decode_ms:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+# Copyright(C) 2024 InfiniFlow, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from infinity_embedded.common import InfinityException
+from infinity_embedded.errors import ErrorCode
+
+
+class BulkWriterStats:
+    def __init__(self):
+        self.rows = 0
+        self.batches = 0
+        # seconds spent on each batch, encoding included
+        self.batch_latencies = []
+        self.start_time = time.perf_counter()
+        self.end_time = None
+
+    @property
+    def elapsed(self) -> float:
+        end_time = self.end_time if self.end_time is not None else time.perf_counter()
+        return end_time - self.start_time
+
+    @property
+    def rows_per_second(self) -> float:
+        elapsed = self.elapsed
+        return self.rows / elapsed if elapsed > 0 else 0.0
+
+    def latency_percentile(self, percentile: float) -> float:
+        if not self.batch_latencies:
+            return 0.0
+        latencies = sorted(self.batch_latencies)
+        return latencies[min(len(latencies) - 1, int(len(latencies) * percentile / 100))]
+
+    def __repr__(self):
+        return (f"BulkWriterStats(rows={self.rows}, batches={self.batches}, elapsed={self.elapsed:.3f}s, "
+                f"rows_per_second={self.rows_per_second:.1f}, "
+                f"p50={self.latency_percentile(50) * 1000:.2f}ms, p99={self.latency_percentile(99) * 1000:.2f}ms)")
+
+
+class BulkWriter:
+    """
+    Pipelined ingestion: batches are encoded and inserted on a pool of workers, each worker owning its own
+    table handle (and so its own connection), while at most max_in_flight batches are queued or running.
+    """
+
+    def __init__(self, open_table, close_table, batch_size: int = 1024, max_in_flight: int = 8, workers: int = 4):
+        if batch_size <= 0 or max_in_flight <= 0 or workers <= 0:
+            raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                                    f"batch_size, max_in_flight and workers should be positive, "
+                                    f"got {batch_size}, {max_in_flight}, {workers}")
+        self._open_table = open_table
+        self._close_table = close_table
+        self._batch_size = batch_size
+        self._in_flight = threading.BoundedSemaphore(max_in_flight)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._tables = []
+        self._futures = set()
+        self._pending_rows = []
+        self._error = None
+        self._closed = False
+        self.stats = BulkWriterStats()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="BulkWriter")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            # don't hide the original exception behind a failed flush
+            try:
+                self.close()
+            except Exception:
+                pass
+
+    def add(self, row: dict):
+        self._check_open()
+        self._pending_rows.append(row)
+        if len(self._pending_rows) >= self._batch_size:
+            rows, self._pending_rows = self._pending_rows, []
+            self.insert(rows)
+
+    def insert(self, rows: list[dict]):
+        self._check_open()
+        if isinstance(rows, dict):
+            rows = [rows]
+        if rows:
+            self._submit("insert", rows, len(rows))
+
+    def flush(self):
+        self._check_open()
+        if self._pending_rows:
+            rows, self._pending_rows = self._pending_rows, []
+            self.insert(rows)
+        with self._lock:
+            futures = list(self._futures)
+        wait(futures)
+        self._raise_if_failed()
+
+    def close(self):
+        if self._closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self._closed = True
+            self._executor.shutdown(wait=True)
+            for table in self._tables:
+                self._close_table(table)
+            self._tables.clear()
+            self.stats.end_time = time.perf_counter()
+
+    def _check_open(self):
+        if self._closed:
+            raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE, "BulkWriter is closed")
+        self._raise_if_failed()
+
+    def _raise_if_failed(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _submit(self, method: str, data, row_count: int):
+        # backpressure: block the producer while max_in_flight batches are pending
+        self._in_flight.acquire()
+        try:
+            future = self._executor.submit(self._run, method, data, row_count)
+        except BaseException:
+            self._in_flight.release()
+            raise
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(self._on_done)
+
+    def _on_done(self, future):
+        with self._lock:
+            self._futures.discard(future)
+
+    def _worker_table(self):
+        table = getattr(self._local, "table", None)
+        if table is None:
+            table = self._open_table()
+            self._local.table = table
+            with self._lock:
+                self._tables.append(table)
+        return table
+
+    def _run(self, method: str, data, row_count: int):
+        start = time.perf_counter()
+        try:
+            getattr(self._worker_table(), method)(data)
+        except BaseException as e:
+            with self._lock:
+                if self._error is None:
+                    self._error = e
+            return
+        finally:
+            self._in_flight.release()
+        latency = time.perf_counter() - start
+        with self._lock:
+            self.stats.rows += row_count
+            self.stats.batches += 1
+            self.stats.batch_latencies.append(latency)
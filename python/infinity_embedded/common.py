@@ -107,3 +107,6 @@ class InfinityException(Exception):
 
 DEFAULT_MATCH_VECTOR_TOPN = 10
 DEFAULT_MATCH_SPARSE_TOPN = 10
+
+# scheduling classes of option({"priority": ...}), highest first
+QUERY_PRIORITIES = ("interactive", "batch", "background")
@@ -23,7 +23,7 @@ class LocalQueryResult:
                  column_defs=None, column_fields=None, database_name=None, store_dir=None, table_count=None,
                  comment=None,
                  table_name=None, index_name=None, index_type=None, index_comment=None, deleted_rows=0,
-                 extra_result=None):
+                 extra_result=None, profile=None):
         self.error_code = error_code
         self.error_msg = error_msg
         self.db_names = db_names
@@ -42,6 +42,7 @@ class LocalQueryResult:
         self.index_comment = index_comment
         self.deleted_rows = deleted_rows
         self.extra_result = extra_result
+        self.profile = profile
 
 
 class LocalInfinityClient:
@@ -62,6 +63,9 @@ class LocalInfinityClient:
     def hello(self):
         self.client.Hello()
 
+    def new_session(self):
+        return LocalInfinitySession(self.path)
+
     # convert embedded_error code to python error code
     def convert_res(self, res, has_db_names=False, has_table_names=False, has_result_data=False, has_db_name=False,
                     has_index_names=False, has_index_info=False, has_deleted_rows=False):
@@ -71,7 +75,8 @@ class LocalInfinityClient:
             return LocalQueryResult(PyErrorCode(res.error_code.value), res.error_msg, table_names=res.names)
         if has_result_data:
             return LocalQueryResult(PyErrorCode(res.error_code.value), res.error_msg, column_defs=res.column_defs,
-                                    column_fields=res.column_fields, extra_result=res.extra_result)
+                                    column_fields=res.column_fields, extra_result=res.extra_result,
+                                    profile=res.profile)
         if has_db_name:
             return LocalQueryResult(PyErrorCode(res.error_code.value), res.error_msg, database_name=res.database_name,
                                     store_dir=res.store_dir, table_count=res.table_count, comment=res.comment)
@@ -212,7 +217,9 @@ class LocalInfinityClient:
                search_expr: WrapSearchExpr = None,
                where_expr: WrapParsedExpr = None,
                limit_expr: WrapParsedExpr = None,
-               offset_expr: WrapParsedExpr = None):
+               offset_expr: WrapParsedExpr = None,
+               priority: str = "interactive",
+               profile: bool = False):
         if self.client is None:
             raise Exception("Local infinity is not connected")
         return self.convert_res(self.client.Search(db_name,
@@ -226,7 +233,9 @@ class LocalInfinityClient:
                                                    search_expr,
                                                    where_expr,
                                                    limit_expr,
-                                                   offset_expr),
+                                                   offset_expr,
+                                                   priority,
+                                                   profile),
                                 has_result_data=True)
 
     def explain(self,
@@ -316,3 +325,15 @@ class LocalInfinityClient:
 
     def drop_columns(self, db_name: str, table_name: str, column_names: list[str]):
         return self.convert_res(self.client.DropColumns(db_name, table_name, column_names))
+
+
+class LocalInfinitySession(LocalInfinityClient):
+    # an extra session on the instance initialized by LocalInfinityClient, disconnecting it keeps the instance alive
+    def __init__(self, path: str = LOCAL_INFINITY_PATH):
+        self.path = path
+        self.client = Infinity.LocalConnect()
+
+    def disconnect(self):
+        self.client.LocalDisconnect()
+        self.client = None
+        return LocalQueryResult(PyErrorCode.OK, "")
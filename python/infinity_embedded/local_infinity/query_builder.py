@@ -24,9 +24,9 @@ import pyarrow as pa
 from pyarrow import Table
 from sqlglot import condition, maybe_parse
 
-from infinity_embedded.common import VEC, SparseVector, InfinityException, SortType
+from infinity_embedded.common import VEC, SparseVector, InfinityException, SortType, QUERY_PRIORITIES
 from infinity_embedded.embedded_infinity_ext import *
-from infinity_embedded.local_infinity.types import logic_type_to_dtype, make_match_tensor_expr
+from infinity_embedded.local_infinity.types import logic_type_to_dtype, make_match_tensor_expr, check_sparse_format
 from infinity_embedded.local_infinity.utils import traverse_conditions, parse_expr
 from infinity_embedded.local_infinity.utils import get_search_optional_filter_from_opt_params
 from infinity_embedded.table import ExplainType as BaseExplainType
@@ -45,7 +45,9 @@ class Query(ABC):
             limit: Optional[WrapParsedExpr],
             offset: Optional[WrapParsedExpr],
             sort: Optional[List[WrapOrderByExpr]],
-            total_hits_count: Optional[bool]
+            total_hits_count: Optional[bool],
+            priority: Optional[str] = None,
+            profile: bool = False,
     ):
         self.columns = columns
         self.highlight = highlight
@@ -57,6 +59,8 @@ class Query(ABC):
         self.offset = offset
         self.sort = sort
         self.total_hits_count = total_hits_count
+        self.priority = priority
+        self.profile = profile
 
 
 class ExplainQuery(Query):
@@ -90,6 +94,7 @@ class InfinityLocalQueryBuilder(ABC):
         self._offset = None
         self._sort = None
         self._total_hits_count = None
+        self._priority = None
 
     def reset(self):
         self._columns = None
@@ -102,6 +107,7 @@ class InfinityLocalQueryBuilder(ABC):
         self._offset = None
         self._sort = None
         self._total_hits_count = None
+        self._priority = None
 
     def match_dense(
             self,
@@ -575,6 +581,12 @@ class InfinityLocalQueryBuilder(ABC):
         if 'total_hits_count' in option_kv:
             if isinstance(option_kv['total_hits_count'], bool):
                 self._total_hits_count = option_kv['total_hits_count']
+        if 'priority' in option_kv:
+            priority = option_kv['priority']
+            if not isinstance(priority, str) or priority.lower() not in QUERY_PRIORITIES:
+                raise InfinityException(ErrorCode.INVALID_QUERY_OPTION,
+                                        f"Unknown priority: {priority}, expect one of {', '.join(QUERY_PRIORITIES)}")
+            self._priority = priority.lower()
         return self
 
     def sort(self, order_by_expr_list: Optional[List[list[str, SortType]]]) -> InfinityLocalQueryBuilder:
@@ -703,39 +715,56 @@ class InfinityLocalQueryBuilder(ABC):
         self._sort = sort_list
         return self
 
-    def to_result(self) -> tuple[dict[str, list[Any]], dict[str, Any], {}]:
-        query = Query(
+    def _build_query(self) -> Query:
+        return Query(
             columns=self._columns,
             highlight=self._highlight,
             search=self._search,
             filter=self._filter,
             group_by=self._group_by,
-            having = self._having,
+            having=self._having,
             limit=self._limit,
             offset=self._offset,
             sort=self._sort,
             total_hits_count=self._total_hits_count,
+            priority=self._priority,
         )
+
+    def to_result(self, to_numpy: bool = False, sparse_format: str = "dict", profile: bool = False) -> \
+            tuple[dict[str, list[Any]], dict[str, Any], {}]:
+        # sparse_format: "dict", "csr" (needs scipy) or "arrow"
+        # profile: also return the per-operator profile of the query as extra_result["profile"], see profile_to_polars
+        check_sparse_format(sparse_format)
+        query = self._build_query()
+        query.profile = profile
         self.reset()
-        return self._table._execute_query(query)
+        return self._table._execute_query(query, to_numpy, sparse_format)
 
     def to_df(self) -> (pd.DataFrame, {}):
         df_dict = {}
-        data_dict, data_type_dict, extra_result = self.to_result()
+        data_dict, data_type_dict, extra_result = self.to_result(to_numpy=True)
         for k, v in data_dict.items():
+            if isinstance(v, np.ndarray) and v.ndim > 1:
+                # embedding cells stay python lists in the dataframe
+                v = v.tolist()
             data_series = pd.Series(v, dtype=logic_type_to_dtype(data_type_dict[k]))
             df_dict[k] = data_series
         return pd.DataFrame(df_dict), extra_result
 
     def to_pl(self) -> (pl.DataFrame, {}):
-        dataframe, extra_result = self.to_df()
-        return pl.from_pandas(dataframe), extra_result
+        table, extra_result = self.to_arrow()
+        return pl.from_arrow(table, rechunk=False), extra_result
 
     def to_arrow(self) -> (Table, {}):
-        dataframe, extra_result = self.to_df()
-        return pa.Table.from_pandas(dataframe), extra_result
+        query = self._build_query()
+        self.reset()
+        return self._table._execute_query_arrow(query)
 
     def explain(self, explain_type=ExplainType.kPhysical) -> Any:
+        if explain_type is BaseExplainType.Analyze:
+            # run the query and return its per-operator profile instead of the rendered text
+            _, _, extra_result = self.to_result(profile=True)
+            return extra_result["profile"]
         query = ExplainQuery(
             columns=self._columns,
             highlight=self._highlight,
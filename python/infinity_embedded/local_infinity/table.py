@@ -23,8 +23,9 @@ from infinity_embedded.common import ConflictType, DEFAULT_MATCH_VECTOR_TOPN, So
 from infinity_embedded.common import INSERT_DATA, VEC, SparseVector, InfinityException
 from infinity_embedded.errors import ErrorCode
 from infinity_embedded.index import IndexInfo
+from infinity_embedded.bulk_writer import BulkWriter
 from infinity_embedded.local_infinity.query_builder import Query, InfinityLocalQueryBuilder, ExplainQuery
-from infinity_embedded.local_infinity.types import build_result
+from infinity_embedded.local_infinity.types import build_result, build_arrow_result
 from infinity_embedded.local_infinity.utils import traverse_conditions, select_res_to_polars
 from infinity_embedded.local_infinity.utils import get_local_constant_expr_from_python_value
 from infinity_embedded.local_infinity.utils import name_validity_check, check_valid_name, get_ordinary_info
@@ -177,6 +178,17 @@ class LocalTable():
         else:
             raise InfinityException(res.error_code, res.error_msg)
 
+    def bulk_loader(self, batch_size: int = 1024, max_in_flight: int = 8, workers: int = 4):
+        # every worker inserts through its own session on the local instance
+        def open_table():
+            return LocalTable(self._conn.new_session(), self._db_name, self._table_name)
+
+        def close_table(table):
+            table._conn.disconnect()
+
+        return BulkWriter(open_table, close_table, batch_size=batch_size, max_in_flight=max_in_flight,
+                          workers=workers)
+
     def import_data(self, file_path: str, import_options: {} = None):
         options = ImportOptions()
         options.header = False
@@ -199,6 +211,8 @@ class LocalTable():
                         options.copy_file_type = CopyFileType.kCSR
                     elif file_type == 'bvecs':
                         options.copy_file_type = CopyFileType.kBVECS
+                    elif file_type == 'parquet':
+                        options.copy_file_type = CopyFileType.kPARQUET
                     else:
                         raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR,
                                                 f"Unrecognized export file type: {file_type}")
@@ -242,6 +256,8 @@ class LocalTable():
                         options.copy_file_type = CopyFileType.kJSONL
                     elif file_type == 'fvecs':
                         options.copy_file_type = CopyFileType.kFVECS
+                    elif file_type == 'parquet':
+                        options.copy_file_type = CopyFileType.kPARQUET
                     else:
                         raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR,
                                                 f"Unrecognized export file type: {file_type}")
@@ -364,8 +380,8 @@ class LocalTable():
         self.query_builder.highlight(columns)
         return self
 
-    def to_result(self):
-        return self.query_builder.to_result()
+    def to_result(self, to_numpy: bool = False, sparse_format: str = "dict", profile: bool = False):
+        return self.query_builder.to_result(to_numpy, sparse_format, profile)
 
     def filter(self, filter: Optional[str]):
         self.query_builder.filter(filter)
@@ -447,8 +463,7 @@ class LocalTable():
 
         return ""
 
-    def _execute_query(self, query: Query):
-        # execute the query
+    def _search(self, query: Query):
         highlight = []
         if query.highlight is not None:
             highlight = query.highlight
@@ -475,13 +490,20 @@ class LocalTable():
                                 search_expr=query.search,
                                 where_expr=query.filter,
                                 limit_expr=query.limit,
-                                offset_expr=query.offset)
+                                offset_expr=query.offset,
+                                priority=query.priority or "interactive",
+                                profile=query.profile)
 
-        # process the results
-        if res.error_code == ErrorCode.OK:
-            return build_result(res)
-        else:
+        if res.error_code != ErrorCode.OK:
             raise InfinityException(res.error_code, res.error_msg)
+        return res
+
+    def _execute_query(self, query: Query, to_numpy: bool = False, sparse_format: str = "dict"):
+        return build_result(self._search(query), to_numpy, sparse_format)
+
+    def _execute_query_arrow(self, query: Query):
+        # numeric and embedding columns are wrapped without copying the engine buffers
+        return build_arrow_result(self._search(query))
 
     def _explain_query(self, query: ExplainQuery) -> Any:
         highlight = []
@@ -15,14 +15,21 @@
 import struct
 import json
 from collections import defaultdict
+from itertools import islice
 from typing import Any
 import numpy as np
+import polars as pl
+import pyarrow as pa
 from numpy import dtype
 from infinity_embedded.common import VEC, SparseVector, InfinityException
 from infinity_embedded.embedded_infinity_ext import *
 from infinity_embedded.errors import ErrorCode
 from datetime import date, time, datetime, timedelta
 
+# how to_result returns sparse columns: one {"index": value} dict per row, a scipy csr_matrix or an arrow List<Struct>
+SPARSE_FORMATS = ("dict", "csr", "arrow")
+
+
 def logic_type_to_dtype(ttype: WrapDataType):
     match ttype.logical_type:
         case LogicalType.kBoolean:
@@ -71,12 +78,64 @@ def logic_type_to_dtype(ttype: WrapDataType):
             raise NotImplementedError(f"Unsupported type {ttype}")
 
 
+def bf16_bytes_to_float32_array(binary_data) -> np.ndarray:
+    tmp_u16 = np.frombuffer(binary_data, dtype='<u2')
+    return (tmp_u16.astype('<u4') << 16).view('<f4')
+
+
 def bf16_bytes_to_float32_list(binary_data):
-    tmp_u16 = np.frombuffer(binary_data, dtype='<i2')
-    result_arr = np.zeros(2 * len(tmp_u16), dtype='<i2')
-    result_arr[1::2] = tmp_u16
-    view_float32 = result_arr.view('<f4')
-    return list(view_float32)
+    return list(bf16_bytes_to_float32_array(binary_data))
+
+
+# column types the engine hands out as column_arrays views over its own buffers
+pod_column_type_to_numpy_dtype = {
+    LogicalType.kTinyInt: dtype('<i1'),
+    LogicalType.kSmallInt: dtype('<i2'),
+    LogicalType.kInteger: dtype('<i4'),
+    LogicalType.kBigInt: dtype('<i8'),
+    LogicalType.kFloat: dtype('<f4'),
+    LogicalType.kDouble: dtype('<f8'),
+    LogicalType.kFloat16: dtype('<f2'),
+}
+
+embedding_element_type_to_numpy_dtype = {
+    EmbeddingDataType.kElemUInt8: dtype('<u1'),
+    EmbeddingDataType.kElemInt8: dtype('<i1'),
+    EmbeddingDataType.kElemInt16: dtype('<i2'),
+    EmbeddingDataType.kElemInt32: dtype('<i4'),
+    EmbeddingDataType.kElemInt64: dtype('<i8'),
+    EmbeddingDataType.kElemFloat: dtype('<f4'),
+    EmbeddingDataType.kElemDouble: dtype('<f8'),
+    EmbeddingDataType.kElemFloat16: dtype('<f2'),
+}
+
+
+def embedding_bytes_to_ndarray(element_type, dimension: int, binary_data) -> np.ndarray:
+    if element_type == EmbeddingDataType.kElemBFloat16:
+        flat = bf16_bytes_to_float32_array(binary_data)
+    elif element_type in embedding_element_type_to_numpy_dtype:
+        flat = np.frombuffer(binary_data, dtype=embedding_element_type_to_numpy_dtype[element_type])
+    else:
+        raise NotImplementedError(f"Unsupported type {element_type}")
+    return flat.reshape(-1, dimension)
+
+
+def column_arrays_to_ndarray(column_type, column_data_type, column_arrays) -> np.ndarray:
+    # column_arrays are read only uint8 views, a single block is reinterpreted in place without a copy
+    if len(column_arrays) == 1:
+        raw = column_arrays[0]
+    else:
+        raw = np.concatenate(column_arrays)
+    if column_type in pod_column_type_to_numpy_dtype:
+        return raw.view(pod_column_type_to_numpy_dtype[column_type])
+    match column_type:
+        case LogicalType.kBFloat16:
+            return bf16_bytes_to_float32_array(raw)
+        case LogicalType.kEmbedding:
+            embedding_type = column_data_type.embedding_type
+            return embedding_bytes_to_ndarray(embedding_type.element_type, embedding_type.dimension, raw)
+        case _:
+            raise NotImplementedError(f"Unsupported type {column_type}")
 
 
 def tensor_to_list(column_data_type, binary_data) -> list[list[Any]]:
@@ -394,12 +453,9 @@ def parse_interval_bytes(column_vector):
 
 
 def parse_sparse_bytes(column_data_type: WrapDataType, column_vector):
-    res = []
-    offset = 0
-    while offset < len(column_vector):
-        sparse_vector, offset = parse_single_sparse_bytes(column_data_type, column_vector, offset)
-        res.append(sparse_vector)
-    return res
+    indptr, indices, values = sparse_bytes_to_csr_arrays(column_data_type, column_vector)
+    entries = zip(map(str, indices.tolist()), values.tolist())
+    return [dict(islice(entries, nnz)) for nnz in np.diff(indptr).tolist()]
 
 
 def parse_single_sparse_bytes(column_data_type: WrapDataType, column_vector, offset):
@@ -461,12 +517,9 @@ def parse_single_sparse_bytes(column_data_type: WrapDataType, column_vector, off
 
 
 def parse_bytes(bytes_data):
-    results = []
-    offset = 0
-    while offset < len(bytes_data):
-        string_data, offset = parse_single_str_bytes(None, bytes_data, offset)
-        results.append(string_data)
-    return results
+    starts, lengths = scan_length_prefixed_bytes(bytes_data)
+    ends = (starts + lengths).tolist()
+    return [bytes_data[start:end].decode('utf-8') for start, end in zip(starts.tolist(), ends)]
 
 
 def parse_single_str_bytes(_, bytes_data, offset):
@@ -477,6 +530,149 @@ def parse_single_str_bytes(_, bytes_data, offset):
     return string_data, offset
 
 
+def scan_length_prefixed_bytes(bytes_data, item_size: int = 1) -> tuple[np.ndarray, np.ndarray]:
+    # start offset and item count of every payload in a sequence of [u32 count][count * item_size bytes] values.
+    # Every prefix position depends on the previous one, so the loop only collects them and the rest is vectorized.
+    prefixes = []
+    append_prefix = prefixes.append
+    unpack_count = struct.Struct('<I').unpack_from
+    offset = 0
+    total_length = len(bytes_data)
+    while offset < total_length:
+        append_prefix(offset)
+        offset += 4 + unpack_count(bytes_data, offset)[0] * item_size
+    prefixes.append(offset)
+    bounds = np.array(prefixes, dtype=np.int64)
+    starts = bounds[:-1] + 4
+    return starts, (bounds[1:] - starts) // item_size
+
+
+def strip_length_prefixes(bytes_data, starts: np.ndarray) -> np.ndarray:
+    raw = np.frombuffer(bytes_data, dtype=np.uint8)
+    keep = np.ones(len(raw), dtype=bool)
+    keep[((starts - 4)[:, None] + np.arange(4)).ravel()] = False
+    return raw[keep]
+
+
+def lengths_to_offsets(lengths: np.ndarray) -> np.ndarray:
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets
+
+
+def varchar_bytes_to_arrow(bytes_data) -> pa.Array:
+    starts, lengths = scan_length_prefixed_bytes(bytes_data)
+    offsets = lengths_to_offsets(lengths)
+    data = strip_length_prefixes(bytes_data, starts)
+    if offsets[-1] < 2 ** 31:
+        arrow_type = pa.string()
+        offsets = offsets.astype(np.int32)
+    else:
+        arrow_type = pa.large_string()
+    return pa.Array.from_buffers(arrow_type, len(lengths), [None, pa.py_buffer(offsets), pa.py_buffer(data)])
+
+
+def sparse_bytes_to_csr_arrays(column_data_type: WrapDataType, bytes_data) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # indptr, indices and values of a sparse column whose rows are [u32 nnz][nnz indices][nnz values],
+    # bit sparse rows only store their indices
+    sparse_type = column_data_type.sparse_type
+    if sparse_type.index_type not in embedding_element_type_to_numpy_dtype:
+        raise NotImplementedError(f"Unsupported type {sparse_type.index_type}")
+    index_dtype = embedding_element_type_to_numpy_dtype[sparse_type.index_type]
+    if sparse_type.element_type == EmbeddingDataType.kElemBit:
+        value_size = 0
+    elif sparse_type.element_type == EmbeddingDataType.kElemBFloat16:
+        value_size = 2
+    elif sparse_type.element_type in embedding_element_type_to_numpy_dtype:
+        value_size = embedding_element_type_to_numpy_dtype[sparse_type.element_type].itemsize
+    else:
+        raise NotImplementedError(f"Unsupported type {sparse_type.element_type}")
+
+    starts, nnz = scan_length_prefixed_bytes(bytes_data, index_dtype.itemsize + value_size)
+    data = strip_length_prefixes(bytes_data, starts)
+    row_bytes = nnz * (index_dtype.itemsize + value_size)
+    # the first nnz * index_size bytes of every row are its indices
+    position_in_row = np.arange(len(data)) - np.repeat(lengths_to_offsets(row_bytes)[:-1], row_bytes)
+    is_index = position_in_row < np.repeat(nnz * index_dtype.itemsize, row_bytes)
+    indices = data[is_index].view(index_dtype)
+    if sparse_type.element_type == EmbeddingDataType.kElemBit:
+        values = np.ones(len(indices), dtype=bool)
+    elif sparse_type.element_type == EmbeddingDataType.kElemBFloat16:
+        values = bf16_bytes_to_float32_array(data[~is_index])
+    else:
+        values = data[~is_index].view(embedding_element_type_to_numpy_dtype[sparse_type.element_type])
+    return lengths_to_offsets(nnz), indices, values
+
+
+def sparse_bytes_to_csr(column_data_type: WrapDataType, bytes_data):
+    # scipy is optional, only needed for sparse_format="csr"
+    import scipy.sparse
+    indptr, indices, values = sparse_bytes_to_csr_arrays(column_data_type, bytes_data)
+    if values.dtype == np.float16:
+        values = values.astype(np.float32)
+    dimension = column_data_type.sparse_type.dimension
+    return scipy.sparse.csr_matrix((values, indices, indptr), shape=(len(indptr) - 1, dimension))
+
+
+def sparse_bytes_to_arrow(column_data_type: WrapDataType, bytes_data) -> pa.Array:
+    indptr, indices, values = sparse_bytes_to_csr_arrays(column_data_type, bytes_data)
+    if values.dtype == np.float16:
+        values = values.astype(np.float32)
+    entries = pa.StructArray.from_arrays([pa.array(indices), pa.array(values)], names=["index", "value"])
+    if indptr[-1] < 2 ** 31:
+        return pa.ListArray.from_arrays(pa.array(indptr.astype(np.int32)), entries)
+    return pa.LargeListArray.from_arrays(pa.array(indptr), entries)
+
+
+def embedding_ndarray_to_arrow(embeddings: np.ndarray) -> pa.Array:
+    if embeddings.dtype == np.float16:
+        embeddings = embeddings.astype(np.float32)
+    return pa.FixedSizeListArray.from_arrays(pa.array(embeddings.reshape(-1)), embeddings.shape[1])
+
+
+def tensor_bytes_to_arrow(column_data_type: WrapDataType, bytes_data) -> pa.Array:
+    embedding_type = column_data_type.embedding_type
+    if embedding_type.element_type == EmbeddingDataType.kElemBit:
+        return pa.array(parse_tensor_bytes(column_data_type, bytes_data))
+    starts, lengths = scan_length_prefixed_bytes(bytes_data)
+    data = strip_length_prefixes(bytes_data, starts)
+    embeddings = embedding_bytes_to_ndarray(embedding_type.element_type, embedding_type.dimension, data)
+    # list offsets count embeddings, not bytes
+    bytes_per_embedding = len(data) // len(embeddings) if len(embeddings) > 0 else 1
+    offsets = (lengths_to_offsets(lengths) // bytes_per_embedding).astype(np.int32)
+    return pa.ListArray.from_arrays(pa.array(offsets), embedding_ndarray_to_arrow(embeddings))
+
+
+def column_arrays_to_arrow(column_type, column_data_type, column_arrays) -> pa.ChunkedArray:
+    # one chunk per result block, numeric chunks wrap the engine buffers without a copy
+    chunks = []
+    for column_array in column_arrays:
+        array = column_arrays_to_ndarray(column_type, column_data_type, [column_array])
+        if array.ndim > 1:
+            chunks.append(embedding_ndarray_to_arrow(array))
+        else:
+            if array.dtype == np.float16:
+                array = array.astype(np.float32)
+            chunks.append(pa.array(array))
+    return pa.chunked_array(chunks)
+
+
+def column_field_to_arrow(column_field, column_data_type: WrapDataType) -> pa.Array | pa.ChunkedArray:
+    column_type = column_field.column_type
+    if column_field.column_arrays:
+        return column_arrays_to_arrow(column_type, column_data_type, column_field.column_arrays)
+    column_vector = b''.join(column_field.column_vectors)
+    match column_type:
+        case LogicalType.kVarchar:
+            return varchar_bytes_to_arrow(column_vector)
+        case LogicalType.kMultiVector | LogicalType.kTensor:
+            return tensor_bytes_to_arrow(column_data_type, column_vector)
+        case LogicalType.kSparse:
+            return sparse_bytes_to_arrow(column_data_type, column_vector)
+        case _:
+            return pa.array(column_vector_to_list(column_type, column_data_type, [column_vector]))
+
+
 def make_match_tensor_expr(vector_column_name: str, embedding_data: VEC, embedding_data_type: str,
                            method_type: str, extra_option: str = None) -> WrapMatchTensorExpr:
     match_tensor_expr = WrapMatchTensorExpr()
@@ -526,30 +722,97 @@ def make_match_tensor_expr(vector_column_name: str, embedding_data: VEC, embeddi
     match_tensor_expr.embedding_data = data
     return match_tensor_expr
 
-def build_result(res: WrapQueryResult) -> tuple[dict[str | Any, list[Any, Any]], dict[str | Any, Any], Any]:
-    data_dict = {}
-    data_type_dict = {}
+def get_result_column_names(res: WrapQueryResult) -> list[str]:
+    # duplicated output columns are named c1, c1_2, c1_3, ...
+    column_names = []
     column_counter = defaultdict(int)
-    for column_def, column_field in zip(res.column_defs, res.column_fields):
+    for column_def in res.column_defs:
         original_column_name = column_def.column_name
         column_counter[original_column_name] += 1
         column_name = f"{original_column_name}_{column_counter[original_column_name]}" \
             if column_counter[original_column_name] > 1 \
             else original_column_name
+        column_names.append(column_name)
+    return column_names
 
-        column_type = column_field.column_type
-        column_data_type = column_def.column_type
-        column_vectors = column_field.column_vectors
-        data_list = column_vector_to_list(column_type, column_data_type, column_vectors)
-
-        data_dict[column_name] = data_list
-        data_type_dict[column_name] = column_data_type
 
+def get_extra_result(res: WrapQueryResult):
     extra_result = None
-    if res.extra_result is not None:
+    # explain responses share this path, they carry neither extra_result nor profile
+    if getattr(res, "extra_result", None) is not None:
         try:
             extra_result = json.loads(res.extra_result)
         except json.JSONDecodeError:
             pass
+    if getattr(res, "profile", None):
+        extra_result = extra_result or {}
+        extra_result["profile"] = profile_to_polars(res.profile)
+    return extra_result
+
+
+def profile_to_polars(profile: str) -> pl.DataFrame:
+    # One row per operator per task run, a task runs its operators once for each batch of input.
+    # elapsed_ns is the wall time of the operator in that run, filter_skipped_blocks the blocks (segments for an
+    # index scan) the fast rough filter pruned, index the index searched by a knn scan.
+    schema = {
+        "fragment_id": pl.UInt64,
+        "task_id": pl.Int64,
+        "run": pl.UInt64,
+        "operator": pl.String,
+        "input_rows": pl.UInt64,
+        "output_rows": pl.UInt64,
+        "output_data_size": pl.UInt64,
+        "elapsed_ns": pl.Int64,
+        "filter_skipped_blocks": pl.UInt64,
+        "index": pl.String,
+    }
+    rows = []
+    for fragment in json.loads(profile).get("fragments", []):
+        for task in fragment.get("tasks", []):
+            for run in task.get("operators", []):
+                for info in run.get("infos", []):
+                    rows.append((fragment["fragment_id"], task["task_id"], run["times"], info["name"],
+                                 info["input_rows"], info["output_rows"], info["output_data_size"], info["elapsed"],
+                                 info.get("filter_skipped_blocks", 0), info.get("index") or None))
+    return pl.DataFrame(rows, schema=schema, orient="row")
+
+
+def check_sparse_format(sparse_format: str):
+    if sparse_format not in SPARSE_FORMATS:
+        raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                                f"sparse_format should be one of {', '.join(SPARSE_FORMATS)}, got {sparse_format}")
+
+
+def build_result(res: WrapQueryResult, to_numpy: bool = False, sparse_format: str = "dict") -> \
+        tuple[dict[str | Any, list[Any, Any]], dict[str | Any, Any], Any]:
+    # to_numpy: keep fixed-width columns (including non-bit embeddings) as numpy arrays instead of python lists
+    # sparse_format: see SPARSE_FORMATS
+    data_dict = {}
+    data_type_dict = {}
+    column_names = get_result_column_names(res)
+    for column_name, column_def, column_field in zip(column_names, res.column_defs, res.column_fields):
+        column_type = column_field.column_type
+        column_data_type = column_def.column_type
+        if column_field.column_arrays:
+            data_list = column_arrays_to_ndarray(column_type, column_data_type, column_field.column_arrays)
+            if not to_numpy:
+                data_list = data_list.tolist()
+        elif column_type == LogicalType.kSparse and sparse_format == "csr":
+            data_list = sparse_bytes_to_csr(column_data_type, b''.join(column_field.column_vectors))
+        elif column_type == LogicalType.kSparse and sparse_format == "arrow":
+            data_list = sparse_bytes_to_arrow(column_data_type, b''.join(column_field.column_vectors))
+        else:
+            data_list = column_vector_to_list(column_type, column_data_type, column_field.column_vectors)
 
-    return data_dict, data_type_dict, extra_result
+        data_dict[column_name] = data_list
+        data_type_dict[column_name] = column_data_type
+
+    return data_dict, data_type_dict, get_extra_result(res)
+
+
+def build_arrow_result(res: WrapQueryResult) -> tuple[pa.Table, Any]:
+    column_names = get_result_column_names(res)
+    arrays = []
+    for column_def, column_field in zip(res.column_defs, res.column_fields):
+        arrays.append(column_field_to_arrow(column_field, column_def.column_type))
+    return pa.Table.from_arrays(arrays, names=column_names), get_extra_result(res)
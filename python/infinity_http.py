@@ -2,6 +2,8 @@ import re
 import time
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 import json
 from test_pysdk.common.common_data import *
@@ -23,9 +25,20 @@ class http_network_util:
     response_dict = baseResponse
     data_dict = baseData
 
-    def __init__(self, url: str = default_url):
+    def __init__(self, url: str = default_url, pool_size: int = 16, connect_retries: int = 3):
         self.base_url = url
         self.retry = False
+        # one keep-alive session per client instead of a new connection per request. Only failures to connect are
+        # retried: a request which reached the server may have been applied already
+        retries = Retry(total=connect_retries, connect=connect_retries, read=0, status=0, other=0,
+                        backoff_factor=0.1)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retries)
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def close(self):
+        self.session.close()
 
     def set_retry(self, retry: bool = True):
         self.retry = retry
@@ -91,13 +104,13 @@ class http_network_util:
     def request_inner(self, url, method, header={}, data={}):
         match method:
             case "get":
-                response = requests.get(url, headers=header, json=data)
+                response = self.session.get(url, headers=header, json=data)
             case "post":
-                response = requests.post(url, headers=header, json=data)
+                response = self.session.post(url, headers=header, json=data)
             case "put":
-                response = requests.put(url, headers=header, json=data)
+                response = self.session.put(url, headers=header, json=data)
             case "delete":
-                response = requests.delete(url, headers=header, json=data)
+                response = self.session.delete(url, headers=header, json=data)
         return response
 
     def raise_exception(self, resp, expect={}):
@@ -928,44 +941,24 @@ class table_http_result:
         col_types = self.table_http.show_columns_type()
         for output_col in self._output:
             if output_col in col_types:
-                df_dict[output_col] = ()
+                df_dict[output_col] = []
         # when output["*"] and output_res is empty
         for output_col in self._output:
             if output_col == "*":
                 for col in col_types:
-                    df_dict[col] = ()
+                    df_dict[col] = []
 
-        line_i = 0
+        # gather the raw values column by column, then convert every column at once
         for res in self.output_res:
+            seen = set()
             for col in res:
                 col_name = next(iter(col))
-                v = col[col_name]
-                if col_name not in df_dict:
-                    df_dict[col_name] = ()
-                tup = df_dict[col_name]
-                if len(tup) == line_i + 1:
+                if col_name in seen:
                     continue
-                if isinstance(v, (int, float)):
-                    new_tup = tup + (v,)
-                elif is_list(v):
-                    new_tup = tup + (ast.literal_eval(v),)
-                elif is_date(v):
-                    new_tup = tup + (v,)
-                elif is_time(v):
-                    new_tup = tup + (v,)
-                elif is_datetime(v):
-                    new_tup = tup + (v,)
-                elif is_sparse(v):  # sparse vector
-                    sparse_vec = str2sparse(v)
-                    new_tup = tup + (sparse_vec,)
-                else:
-                    if v.lower() == 'true':
-                        v = True
-                    elif v.lower() == 'false':
-                        v = False
-                    new_tup = tup + (v,)
-                df_dict[col_name] = new_tup
-            line_i += 1
+                seen.add(col_name)
+                df_dict.setdefault(col_name, []).append(col[col_name])
+        for col_name, values in df_dict.items():
+            df_dict[col_name] = tuple(convert_http_column(values))
         # print(self.output_res)
         # print(df_dict)
         extra_result = None
@@ -1025,6 +1018,58 @@ class table_http_result:
         return pa.Table.from_pandas(dataframe), extra_result
 
 
+def convert_http_value(v):
+    if isinstance(v, (int, float)):
+        return v
+    elif v.startswith("[") and is_list(v):
+        return ast.literal_eval(v)
+    elif is_date(v):
+        return v
+    elif is_time(v):
+        return v
+    elif is_datetime(v):
+        return v
+    elif is_sparse(v):  # sparse vector
+        return str2sparse(v)
+    else:
+        if v.lower() == 'true':
+            v = True
+        elif v.lower() == 'false':
+            v = False
+        return v
+
+
+_http_bool_values = {"true": True, "false": False}
+_http_sparse_index = re.compile(r"(-?\d+)\s*:")
+
+
+def convert_http_column(values: list) -> list:
+    # same result as convert_http_value on every value, but whole columns are converted at once where possible
+    if all(isinstance(v, (int, float)) for v in values):
+        return values
+    if not all(isinstance(v, str) for v in values):
+        return [convert_http_value(v) for v in values]
+    if all(v.startswith("[") for v in values):
+        # vectors, multivectors and tensors: parse the column as one json document instead of literal_eval per value
+        try:
+            parsed = json.loads("[" + ",".join(values) + "]")
+            if all(isinstance(v, list) for v in parsed):
+                return parsed
+        except ValueError:
+            pass
+        # sparse vectors: [1:0.5,3:1.5] -> {"1":0.5,"3":1.5}
+        if all(len(v) > 2 and v.endswith("]") for v in values):
+            try:
+                return json.loads("[" + ",".join("{" + _http_sparse_index.sub(r'"\1":', v[1:-1]) + "}"
+                                                 for v in values) + "]")
+            except ValueError:
+                pass
+    elif not any(":" in v or v.startswith("[") for v in values):
+        # plain strings, dates and booleans
+        return [_http_bool_values.get(v.lower(), v) for v in values]
+    return [convert_http_value(v) for v in values]
+
+
 @dataclass
 class database_result():
     def __init__(self, list=[], database_name: str = "", error_code=ErrorCode.OK, columns=[], index_list=[],
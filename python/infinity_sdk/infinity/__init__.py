@@ -25,10 +25,16 @@ from infinity.common import URI, NetworkAddress, LOCAL_HOST, LOCAL_INFINITY_PATH
 from infinity.infinity import InfinityConnection
 from infinity.remote_thrift.infinity import RemoteThriftInfinityConnection
 from infinity.errors import ErrorCode
+from infinity.result_cache import ResultCache
 
 
-def connect(uri=LOCAL_HOST, logger: logging.Logger = None) -> InfinityConnection:
+def connect(uri=LOCAL_HOST, logger: logging.Logger = None, result_cache: ResultCache = None, protocol: str = "binary",
+            transport: str = "buffered", accelerate: bool = True) -> InfinityConnection:
+    # result_cache: opt-in client side cache of select results, can be shared by several connections
+    # protocol ("binary" or "compact") and transport ("buffered" or "framed") must match the server's
+    # client_protocol / client_transport, accelerate uses thrift's C codec when it is installed
     if isinstance(uri, NetworkAddress):
-        return RemoteThriftInfinityConnection(uri, logger)
+        return RemoteThriftInfinityConnection(uri, logger, result_cache=result_cache, protocol=protocol,
+                                              transport=transport, accelerate=accelerate)
     else:
         raise InfinityException(ErrorCode.INVALID_SERVER_ADDRESS, f"Unknown uri: {uri}")
@@ -0,0 +1,40 @@
+# Copyright(C) 2024 InfiniFlow, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# asyncio flavour of the thrift sdk:
+#
+#     conn = await infinity.asyncio.connect(infinity.common.LOCAL_HOST, pool_size=8)
+#     table = await (await conn.get_database("default_db")).get_table("my_table")
+#     res = await table.output(["*"]).match_dense("vec", [1.0, 2.0], "float", "ip", 10).to_pl()
+#     await conn.disconnect()
+
+import logging
+
+from infinity.common import LOCAL_HOST, NetworkAddress, InfinityException
+from infinity.errors import ErrorCode
+from infinity.asyncio.client import AsyncThriftInfinityClient
+from infinity.asyncio.infinity import AsyncRemoteThriftInfinityConnection
+from infinity.asyncio.db import AsyncRemoteDatabase
+from infinity.asyncio.table import AsyncRemoteTable
+
+
+async def connect(uri=LOCAL_HOST, pool_size: int = 4, logger: logging.Logger = None, protocol: str = "binary",
+                  transport: str = "buffered", accelerate: bool = True) -> AsyncRemoteThriftInfinityConnection:
+    # protocol / transport / accelerate: see infinity.connect()
+    if not isinstance(uri, NetworkAddress):
+        raise InfinityException(ErrorCode.INVALID_SERVER_ADDRESS, f"Unknown uri: {uri}")
+    conn = AsyncRemoteThriftInfinityConnection(uri, pool_size=pool_size, logger=logger, protocol=protocol,
+                                               transport=transport, accelerate=accelerate)
+    await conn.client.connect()
+    return conn
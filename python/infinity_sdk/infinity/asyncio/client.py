@@ -0,0 +1,317 @@
+# Copyright(C) 2024 InfiniFlow, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+import struct
+from collections import deque
+
+from readerwriterlock import rwlock
+from thrift.Thrift import TApplicationException, TMessageType, TType
+from thrift.transport import TTransport
+from thrift.transport.TTransport import TTransportException
+
+from infinity import URI
+from infinity.common import InfinityException
+from infinity.errors import ErrorCode
+from infinity.remote_thrift.client import ThriftInfinityClient, TRY_TIMES, check_thrift_options, make_thrift_protocol
+from infinity.remote_thrift.infinity_thrift_rpc import InfinityService
+from infinity.remote_thrift.infinity_thrift_rpc.ttypes import CommonRequest, CommonResponse, ConnectRequest
+
+CLIENT_VERSION = 29  # 0.6.0.dev3, keep in sync with ThriftInfinityClient
+
+_i16 = struct.Struct('!h')
+_i32 = struct.Struct('!i')
+
+_fixed_type_width = {
+    TType.BOOL: 1,
+    TType.BYTE: 1,
+    TType.I16: 2,
+    TType.I32: 4,
+    TType.I64: 8,
+    TType.DOUBLE: 8,
+}
+
+
+class _MessageReader:
+    # collects the raw bytes of one binary protocol message, so it can be decoded by the generated code afterwards
+
+    def __init__(self, stream: asyncio.StreamReader):
+        self._stream = stream
+        self._chunks = []
+
+    async def _read(self, n: int) -> bytes:
+        data = await self._stream.readexactly(n)
+        self._chunks.append(data)
+        return data
+
+    async def _read_i32(self) -> int:
+        return _i32.unpack(await self._read(4))[0]
+
+    async def _skip(self, ttype: int):
+        if ttype in _fixed_type_width:
+            await self._read(_fixed_type_width[ttype])
+        elif ttype == TType.STRING:
+            await self._read(await self._read_i32())
+        elif ttype == TType.STRUCT:
+            while True:
+                field_type = (await self._read(1))[0]
+                if field_type == TType.STOP:
+                    break
+                await self._read(2)
+                await self._skip(field_type)
+        elif ttype == TType.MAP:
+            key_type, value_type = await self._read(2)
+            size = await self._read_i32()
+            for _ in range(size):
+                await self._skip(key_type)
+                await self._skip(value_type)
+        elif ttype in (TType.LIST, TType.SET):
+            element_type = (await self._read(1))[0]
+            size = await self._read_i32()
+            if element_type in _fixed_type_width:
+                await self._read(size * _fixed_type_width[element_type])
+            else:
+                for _ in range(size):
+                    await self._skip(element_type)
+        else:
+            raise TTransportException(TTransportException.INVALID_CLIENT_TYPE, f"Unknown thrift type {ttype}")
+
+    async def read_message(self) -> bytes:
+        self._chunks = []
+        version = await self._read_i32()
+        if version < 0:
+            # strict: version | type, name, seqid
+            await self._read(await self._read_i32())
+            await self._read(4)
+        else:
+            # old style: name, type, seqid
+            await self._read(version)
+            await self._read(5)
+        await self._skip(TType.STRUCT)
+        return b''.join(self._chunks)
+
+
+class _AsyncThriftChannel:
+    # one socket and one session; requests are pipelined and the server answers them in order
+
+    def __init__(self, uri: URI, protocol: str = "binary", transport: str = "buffered", accelerate: bool = True):
+        self.uri = uri
+        self.protocol_name = protocol
+        self.framed = transport == "framed"
+        self.accelerate = accelerate
+        self.session_id = -1
+        self._writer = None
+        self._reader_task = None
+        self._pending = deque()
+        self._seqid = 0
+        self._open_lock = asyncio.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self._writer is not None and self.session_id != -1
+
+    @property
+    def load(self) -> int:
+        return len(self._pending)
+
+    async def open(self):
+        async with self._open_lock:
+            if self.is_open:
+                return
+            reader, self._writer = await asyncio.open_connection(self.uri.ip, self.uri.port)
+            self._reader_task = asyncio.get_running_loop().create_task(self._read_loop(reader))
+            try:
+                res = await self._call("Connect", ConnectRequest(client_version=CLIENT_VERSION))
+            except BaseException:
+                await self.close()
+                raise
+            if res.error_code != 0:
+                await self.close()
+                raise InfinityException(res.error_code, res.error_msg)
+            self.session_id = res.session_id
+
+    async def close(self):
+        writer, self._writer = self._writer, None
+        self.session_id = -1
+        if writer is not None:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            self._reader_task = None
+        self._fail_pending(TTransportException(TTransportException.NOT_OPEN, "Connection closed"))
+
+    async def call(self, method: str, request):
+        if not self.is_open:
+            await self.open()
+        if hasattr(request, "session_id"):
+            request.session_id = self.session_id
+        return await self._call(method, request)
+
+    async def _call(self, method: str, request):
+        if self._writer is None:
+            # the read loop closed the connection, call() opens a new one on the next try
+            raise TTransportException(TTransportException.NOT_OPEN, "Connection closed")
+        self._seqid += 1
+        seqid = self._seqid
+        buffer = TTransport.TMemoryBuffer()
+        protocol = make_thrift_protocol(self.protocol_name, buffer, self.accelerate)
+        protocol.writeMessageBegin(method, TMessageType.CALL, seqid)
+        getattr(InfinityService, f"{method}_args")(request=request).write(protocol)
+        protocol.writeMessageEnd()
+        message = buffer.getvalue()
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((method, seqid, future))
+        if self.framed:
+            self._writer.write(_i32.pack(len(message)))
+        self._writer.write(message)
+        try:
+            await self._writer.drain()
+        except (ConnectionError, OSError) as e:
+            await self.close()
+            raise TTransportException(TTransportException.NOT_OPEN, str(e))
+        return self._decode(method, seqid, await future)
+
+    def _decode(self, method: str, seqid: int, data: bytes):
+        protocol = make_thrift_protocol(self.protocol_name, TTransport.TMemoryBuffer(data), self.accelerate)
+        (_, message_type, response_seqid) = protocol.readMessageBegin()
+        if message_type == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(protocol)
+            raise x
+        if response_seqid != seqid:
+            raise TApplicationException(TApplicationException.BAD_SEQUENCE_ID, f"{method} failed: out of sequence")
+        result = getattr(InfinityService, f"{method}_result")()
+        result.read(protocol)
+        if result.success is None:
+            raise TApplicationException(TApplicationException.MISSING_RESULT, f"{method} failed: unknown result")
+        return result.success
+
+    async def _read_loop(self, stream: asyncio.StreamReader):
+        message_reader = _MessageReader(stream)
+        try:
+            while True:
+                if self.framed:
+                    data = await stream.readexactly(_i32.unpack(await stream.readexactly(4))[0])
+                else:
+                    data = await message_reader.read_message()
+                _, _, future = self._pending.popleft()
+                if not future.done():
+                    future.set_result(data)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # this task is the reader, so close() is not used, it would cancel it
+            writer, self._writer = self._writer, None
+            self._reader_task = None
+            self.session_id = -1
+            if writer is not None:
+                writer.close()
+            self._fail_pending(TTransportException(TTransportException.END_OF_FILE, str(e)))
+
+    def _fail_pending(self, exception: Exception):
+        while self._pending:
+            _, _, future = self._pending.popleft()
+            if not future.done():
+                future.set_exception(exception)
+
+
+class _AsyncServiceClient:
+    # stands in for InfinityService.Client: every rpc returns a coroutine sent on the least loaded channel
+
+    def __init__(self, channels: list[_AsyncThriftChannel]):
+        self._channels = channels
+
+    def __getattr__(self, method: str):
+        if not hasattr(InfinityService.Client, method):
+            raise AttributeError(method)
+
+        def rpc(request):
+            channel = min(self._channels, key=lambda c: c.load)
+            return channel.call(method, request)
+
+        return rpc
+
+
+class AsyncThriftInfinityClient(ThriftInfinityClient):
+    """
+    Same request building as ThriftInfinityClient, but every method returns an awaitable. Requests are
+    multiplexed over pool_size non-blocking connections, each holding its own session.
+    """
+
+    def __init__(self, uri: URI, *, pool_size: int = 4, try_times: int = TRY_TIMES, logger: logging.Logger = None,
+                 protocol: str = "binary", transport: str = "buffered", accelerate: bool = True):
+        if pool_size <= 0:
+            raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE, f"pool_size should be positive, got {pool_size}")
+        check_thrift_options(protocol, transport)
+        if protocol == "compact" and transport != "framed":
+            # unframed responses are split by walking the binary encoding, see _MessageReader
+            raise InfinityException(ErrorCode.NOT_SUPPORTED,
+                                    "The asyncio client only supports the compact protocol over the framed transport")
+        self.lock = rwlock.RWLockRead()
+        self.uri = uri
+        self.session_id = -1
+        self.session_i = 0
+        self.try_times = try_times
+        self._init_logger(logger)
+        # responses are not cached, see infinity.result_cache for the blocking client
+        self.result_cache = None
+        self.protocol_name = protocol
+        self.transport_name = transport
+        self.accelerate = accelerate
+        self._channels = [_AsyncThriftChannel(uri, protocol, transport, accelerate) for _ in range(pool_size)]
+        self.client = _AsyncServiceClient(self._channels)
+        self._is_connected = False
+
+    def __del__(self):
+        pass
+
+    async def connect(self):
+        await asyncio.gather(*(channel.open() for channel in self._channels))
+        self._is_connected = True
+
+    def _reconnect(self):
+        # channels reconnect lazily on their next call
+        pass
+
+    async def _retry_call(self, func, *args, **kwargs):
+        # func returns the coroutine of the rpc, the transport errors are only raised once it is awaited
+        for i in range(self.try_times):
+            try:
+                return await func(self, *args, **kwargs)
+            except TTransportException as e:
+                self.logger.debug(f"Tried {i} times, exception: {str(e)}")
+        return CommonResponse(ErrorCode.TOO_MANY_CONNECTIONS, f"Try {self.try_times} times, but still failed")
+
+    async def disconnect(self):
+        if not self._is_connected:
+            return CommonResponse(ErrorCode.OK, "Already disconnected")
+        res = CommonResponse(ErrorCode.OK, "")
+        for channel in self._channels:
+            if not channel.is_open:
+                continue
+            try:
+                channel_res = await channel.call("Disconnect", CommonRequest(session_id=channel.session_id))
+                if channel_res.error_code != ErrorCode.OK:
+                    res = channel_res
+            except Exception as e:
+                res = CommonResponse(ErrorCode.CLIENT_CLOSE, str(e))
+            await channel.close()
+        self._is_connected = False
+        return res
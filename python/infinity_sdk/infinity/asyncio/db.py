@@ -0,0 +1,63 @@
+# Copyright(C) 2024 InfiniFlow, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from infinity.asyncio.table import AsyncRemoteTable, check_response
+from infinity.common import ConflictType
+from infinity.remote_thrift.utils import (
+    check_valid_name,
+    name_validity_check,
+    select_res_to_polars,
+    get_ordinary_info,
+    get_remote_create_conflict,
+    get_remote_drop_conflict,
+)
+
+
+class AsyncRemoteDatabase:
+    def __init__(self, conn, name: str):
+        self._conn = conn
+        self._db_name = name
+
+    @name_validity_check("table_name", "Table")
+    async def create_table(self, table_name: str, columns_definition,
+                           conflict_type: ConflictType = ConflictType.Error):
+        column_defs = []
+        for index, (column_name, column_info) in enumerate(columns_definition.items()):
+            check_valid_name(column_name, "Column")
+            get_ordinary_info(column_info, column_defs, column_name, index)
+
+        check_response(await self._conn.create_table(db_name=self._db_name, table_name=table_name,
+                                                     column_defs=column_defs,
+                                                     conflict_type=get_remote_create_conflict(conflict_type)))
+        return AsyncRemoteTable(self._conn, self._db_name, table_name)
+
+    @name_validity_check("table_name", "Table")
+    async def drop_table(self, table_name, conflict_type: ConflictType = ConflictType.Error):
+        return await self._conn.drop_table(db_name=self._db_name, table_name=table_name,
+                                           conflict_type=get_remote_drop_conflict(conflict_type))
+
+    async def list_tables(self):
+        return check_response(await self._conn.list_tables(self._db_name))
+
+    @name_validity_check("table_name", "Table")
+    async def show_table(self, table_name):
+        return check_response(await self._conn.show_table(db_name=self._db_name, table_name=table_name))
+
+    @name_validity_check("table_name", "Table")
+    async def get_table(self, table_name):
+        check_response(await self._conn.get_table(db_name=self._db_name, table_name=table_name))
+        return AsyncRemoteTable(self._conn, self._db_name, table_name)
+
+    async def show_tables(self):
+        return select_res_to_polars(check_response(await self._conn.show_tables(self._db_name)))
@@ -0,0 +1,71 @@
+# Copyright(C) 2024 InfiniFlow, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+
+from infinity.asyncio.client import AsyncThriftInfinityClient
+from infinity.asyncio.db import AsyncRemoteDatabase
+from infinity.asyncio.table import check_response
+from infinity.common import ConflictType
+from infinity.remote_thrift.utils import name_validity_check, get_remote_create_conflict, get_remote_drop_conflict
+
+
+class AsyncRemoteThriftInfinityConnection:
+    def __init__(self, uri, pool_size: int = 4, logger: logging.Logger = None, protocol: str = "binary",
+                 transport: str = "buffered", accelerate: bool = True):
+        self._uri = uri
+        self.db_name = "default_db"
+        self._client = AsyncThriftInfinityClient(uri, pool_size=pool_size, logger=logger, protocol=protocol,
+                                                 transport=transport, accelerate=accelerate)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.disconnect()
+
+    @name_validity_check("db_name", "DB")
+    async def create_database(self, db_name: str, conflict_type: ConflictType = ConflictType.Error,
+                              comment: str = None):
+        check_response(await self._client.create_database(db_name=db_name,
+                                                          conflict_type=get_remote_create_conflict(conflict_type),
+                                                          comment=comment))
+        return AsyncRemoteDatabase(self._client, db_name)
+
+    async def list_databases(self):
+        return check_response(await self._client.list_databases())
+
+    @name_validity_check("db_name", "DB")
+    async def show_database(self, db_name: str):
+        return check_response(await self._client.show_database(db_name=db_name))
+
+    @name_validity_check("db_name", "DB")
+    async def drop_database(self, db_name: str, conflict_type: ConflictType = ConflictType.Error):
+        return check_response(await self._client.drop_database(db_name=db_name,
+                                                               conflict_type=get_remote_drop_conflict(conflict_type)))
+
+    @name_validity_check("db_name", "DB")
+    async def get_database(self, db_name: str):
+        check_response(await self._client.get_database(db_name))
+        return AsyncRemoteDatabase(self._client, db_name)
+
+    async def show_current_node(self):
+        return check_response(await self._client.show_current_node())
+
+    async def disconnect(self):
+        return check_response(await self._client.disconnect())
+
+    @property
+    def client(self):
+        return self._client
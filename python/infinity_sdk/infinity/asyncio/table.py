@@ -0,0 +1,228 @@
+# Copyright(C) 2024 InfiniFlow, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Awaitable, Optional, Union, Any
+
+import numpy as np
+
+import infinity.remote_thrift.infinity_thrift_rpc.ttypes as ttypes
+from infinity.common import INSERT_DATA, InfinityException, ConflictType, DEFAULT_MATCH_VECTOR_TOPN
+from infinity.errors import ErrorCode
+from infinity.index import IndexInfo
+from infinity.remote_thrift.query_builder import Query, ExplainQuery, InfinityThriftQueryBuilder, PreparedQuery
+from infinity.remote_thrift.table import RemoteTable
+from infinity.remote_thrift.types import build_result, build_arrow_result, check_sparse_format
+from infinity.remote_thrift.utils import (
+    get_filter_expr,
+    name_validity_check,
+    select_res_to_polars,
+    get_remote_create_conflict,
+    get_remote_drop_conflict,
+)
+from infinity.table import ExplainType
+from infinity.utils import LazyModule
+
+pl = LazyModule("polars")
+pa = LazyModule("pyarrow")
+
+
+def check_response(res):
+    if res.error_code == ErrorCode.OK:
+        return res
+    else:
+        raise InfinityException(res.error_code, res.error_msg)
+
+
+class AsyncPreparedQuery(PreparedQuery):
+    def to_df(self, **params) -> Awaitable:
+        result = self.to_result(to_numpy=True, **params)
+
+        async def to_df():
+            data_dict, data_type_dict, extra_result = await result
+            return InfinityThriftQueryBuilder._result_to_df(data_dict, data_type_dict), extra_result
+
+        return to_df()
+
+    def to_pl(self, **params) -> Awaitable:
+        result = self.to_arrow(**params)
+
+        async def to_pl():
+            table, extra_result = await result
+            return pl.from_arrow(table), extra_result
+
+        return to_pl()
+
+
+class AsyncInfinityThriftQueryBuilder(InfinityThriftQueryBuilder):
+    # Terminal methods capture and reset the query before returning the awaitable, so the builder can be reused
+    # to start the next query before this one is awaited.
+    prepared_query_type = AsyncPreparedQuery
+
+    def to_result(self, to_numpy: bool = False, sparse_format: str = "dict", profile: bool = False) -> Awaitable:
+        check_sparse_format(sparse_format)
+        query = self._build_query()
+        query.profile = profile
+        self.reset()
+        return self._table._execute_query(query, to_numpy, sparse_format)
+
+    def to_df(self) -> Awaitable:
+        result = self.to_result(to_numpy=True)
+
+        async def to_df():
+            data_dict, data_type_dict, extra_result = await result
+            return self._result_to_df(data_dict, data_type_dict), extra_result
+
+        return to_df()
+
+    def to_pl(self) -> Awaitable:
+        result = self.to_arrow()
+
+        async def to_pl():
+            table, extra_result = await result
+            return pl.from_arrow(table), extra_result
+
+        return to_pl()
+
+    def to_arrow(self) -> Awaitable:
+        query = self._build_query()
+        self.reset()
+        return self._table._execute_query_arrow(query)
+
+    def explain(self, explain_type=ExplainType.Physical) -> Awaitable:
+        if explain_type is ExplainType.Analyze:
+            result = self.to_result(profile=True)
+
+            async def explain():
+                _, _, extra_result = await result
+                return extra_result["profile"]
+
+            return explain()
+        return self._table._explain_query(self._build_explain_query(explain_type))
+
+    def iter_batches(self, batch_rows: int = 8192, to_numpy: bool = False):
+        # a cursor lives in one session, while requests here are spread over several
+        raise InfinityException(ErrorCode.NOT_SUPPORTED, "iter_batches is not supported by the asyncio client")
+
+
+class AsyncRemoteTable(RemoteTable):
+    # search/output/filter chaining is inherited from RemoteTable, the rest returns awaitables
+
+    def __init__(self, conn, db_name, table_name):
+        super().__init__(conn, db_name, table_name)
+        self.query_builder = AsyncInfinityThriftQueryBuilder(table=self)
+
+    async def create_index(self, index_name: str, index_info: IndexInfo,
+                           conflict_type: ConflictType = ConflictType.Error, index_comment=""):
+        return check_response(await self._conn.create_index(db_name=self._db_name,
+                                                            table_name=self._table_name,
+                                                            index_name=index_name.strip(),
+                                                            index_info=index_info.to_ttype(),
+                                                            conflict_type=get_remote_create_conflict(conflict_type),
+                                                            index_comment=index_comment))
+
+    @name_validity_check("index_name", "Index")
+    async def drop_index(self, index_name: str, conflict_type: ConflictType = ConflictType.Error):
+        return check_response(await self._conn.drop_index(db_name=self._db_name, table_name=self._table_name,
+                                                          index_name=index_name,
+                                                          conflict_type=get_remote_drop_conflict(conflict_type)))
+
+    @name_validity_check("index_name", "Index")
+    async def show_index(self, index_name: str):
+        return check_response(await self._conn.show_index(db_name=self._db_name, table_name=self._table_name,
+                                                          index_name=index_name))
+
+    async def list_indexes(self):
+        return check_response(await self._conn.list_indexes(db_name=self._db_name, table_name=self._table_name))
+
+    async def show_columns(self):
+        res = check_response(await self._conn.show_columns(db_name=self._db_name, table_name=self._table_name))
+        return select_res_to_polars(res)
+
+    async def insert(self, data: Union[INSERT_DATA, list[INSERT_DATA]]):
+        return check_response(await self._conn.insert(db_name=self._db_name, table_name=self._table_name,
+                                                      fields=self._get_insert_fields(data)))
+
+    async def insert_columns(self, data: dict[str, Union[np.ndarray, "pa.Array", "pa.ChunkedArray", list]]):
+        return check_response(await self._conn.insert(db_name=self._db_name, table_name=self._table_name,
+                                                      column_fields=self._get_insert_column_fields(data)))
+
+    async def insert_arrow(self, data: "pa.Table"):
+        return await self.insert_columns(dict(zip(data.column_names, data.columns)))
+
+    async def import_data(self, file_path: str, import_options: {} = None):
+        return check_response(await self._conn.import_data(db_name=self._db_name,
+                                                           table_name=self._table_name,
+                                                           file_name=file_path,
+                                                           import_options=self._get_import_options(import_options)))
+
+    async def export_data(self, file_path: str, export_options: {} = None, columns: [str] = None):
+        return check_response(await self._conn.export_data(db_name=self._db_name,
+                                                           table_name=self._table_name,
+                                                           file_name=file_path,
+                                                           export_options=self._get_export_options(export_options),
+                                                           columns=columns))
+
+    async def delete(self, cond: Optional[str] = None, **params):
+        where_expr = get_filter_expr(cond, params) if cond is not None else None
+        return check_response(await self._conn.delete(db_name=self._db_name, table_name=self._table_name,
+                                                      where_expr=where_expr))
+
+    async def update(self, cond: str, data: dict[str, Any], **params):
+        return check_response(await self._conn.update(db_name=self._db_name, table_name=self._table_name,
+                                                      where_expr=get_filter_expr(cond, params),
+                                                      update_expr_array=self._get_update_exprs(data)))
+
+    async def match_dense_batch(self, vector_column_name: str, embedding_data, embedding_data_type: str,
+                                distance_type: str, topn: int = DEFAULT_MATCH_VECTOR_TOPN, knn_params: {} = None,
+                                filter: Optional[str] = None, priority: Optional[str] = None):
+        res = check_response(await self._conn.match_dense_batch(**self._get_match_dense_batch_args(
+            vector_column_name, embedding_data, embedding_data_type, distance_type, topn, knn_params, filter,
+            priority)))
+        return self._get_match_dense_batch_result(res)
+
+    async def _select(self, query: Query) -> ttypes.SelectResponse:
+        return check_response(await self._conn.select(db_name=self._db_name,
+                                                      table_name=self._table_name,
+                                                      select_list=query.columns,
+                                                      highlight_list=query.highlight,
+                                                      search_expr=query.search,
+                                                      where_expr=query.filter,
+                                                      group_by_list=query.groupby,
+                                                      having_expr=query.having,
+                                                      limit_expr=query.limit,
+                                                      offset_expr=query.offset,
+                                                      order_by_list=query.sort,
+                                                      total_hits_count=query.total_hits_count,
+                                                      priority=query.priority,
+                                                      profile=query.profile or None))
+
+    async def _execute_query(self, query: Query, to_numpy: bool = False, sparse_format: str = "dict") -> \
+            tuple[dict[str, list[Any]], dict[str, Any]]:
+        return build_result(await self._select(query), to_numpy, sparse_format)
+
+    async def _execute_query_arrow(self, query: Query) -> tuple["pa.Table", Any]:
+        return build_arrow_result(await self._select(query))
+
+    async def _explain_query(self, query: ExplainQuery) -> Any:
+        res = check_response(await self._conn.explain(db_name=self._db_name,
+                                                      table_name=self._table_name,
+                                                      select_list=query.columns,
+                                                      highlight_list=query.highlight,
+                                                      search_expr=query.search,
+                                                      where_expr=query.filter,
+                                                      group_by_list=None,
+                                                      limit_expr=query.limit,
+                                                      offset_expr=query.offset,
+                                                      explain_type=query.explain_type.to_ttype()))
+        return select_res_to_polars(res)
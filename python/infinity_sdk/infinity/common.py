@@ -76,6 +76,12 @@ class Array:
         return str(self)
 
 
+@dataclass(frozen=True)
+class QueryParam:
+    # stands for a query vector / text in a prepared query, given when the query is executed
+    name: str
+
+
 URI = Union[NetworkAddress, Path]
 VEC = Union[list, np.ndarray]
 INSERT_DATA = dict[str, Union[str, int, float, list[Union[int, float]]], SparseVector, dict, Array]
@@ -105,3 +111,6 @@ class InfinityException(Exception):
 
 DEFAULT_MATCH_VECTOR_TOPN = 10
 DEFAULT_MATCH_SPARSE_TOPN = 10
+
+# scheduling classes of option({"priority": ...}), highest first
+QUERY_PRIORITIES = ("interactive", "batch", "background")
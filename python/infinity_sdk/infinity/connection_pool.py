@@ -12,35 +12,152 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from threading import Lock
+import copy
+import time
+import weakref
+from contextlib import contextmanager
+from threading import Condition, Event, Thread
 import infinity
-from infinity.common import NetworkAddress
+from infinity.common import NetworkAddress, InfinityException
+from infinity.errors import ErrorCode
+from infinity.result_cache import ResultCache
+from infinity.remote_thrift.client import check_thrift_options
 import logging
 
 
+class ConnectionPoolStats(object):
+    def __init__(self):
+        self.created = 0
+        # connections dropped by the pool: idle too long, failed health check or broken while in use
+        self.evicted = 0
+        self.in_use = 0
+        self.idle = 0
+        self.acquired = 0
+        # acquires that had to wait for a connection to be released
+        self.waited = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    @property
+    def avg_wait_time(self) -> float:
+        return self.total_wait_time / self.acquired if self.acquired > 0 else 0.0
+
+    def __repr__(self):
+        return (f"ConnectionPoolStats(created={self.created}, evicted={self.evicted}, in_use={self.in_use}, "
+                f"idle={self.idle}, acquired={self.acquired}, waited={self.waited}, "
+                f"avg_wait={self.avg_wait_time * 1000:.2f}ms, max_wait={self.max_wait_time * 1000:.2f}ms)")
+
+
 class ConnectionPool(object):
-    def __init__(self, uri=NetworkAddress("127.0.0.1", 23817), max_size=16):
+    """
+    Connections are opened lazily up to max_size, at least min_size are kept open. get_conn() blocks for at most
+    timeout seconds (forever if None) when all of them are in use. A background thread pings idle connections
+    every health_check_interval seconds, dropping the dead ones and the ones idle for more than idle_timeout.
+    """
+
+    def __init__(self, uri=NetworkAddress("127.0.0.1", 23817), max_size=16, min_size=0, timeout=None,
+                 idle_timeout=300.0, health_check_interval=30.0, result_cache: ResultCache = None,
+                 protocol: str = "binary", transport: str = "buffered", accelerate: bool = True):
+        if max_size <= 0 or min_size < 0 or min_size > max_size:
+            raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                                    f"Invalid pool size, min_size: {min_size}, max_size: {max_size}")
         self.uri_ = uri
         self.max_size_ = max_size
+        self.min_size_ = min_size
+        self.timeout_ = timeout
+        self.idle_timeout_ = idle_timeout
+        self.health_check_interval_ = health_check_interval
+        # shared by all the connections of the pool, so a write through any of them invalidates it
+        self.result_cache_ = result_cache
+        check_thrift_options(protocol, transport)
+        self.connect_options_ = dict(protocol=protocol, transport=transport, accelerate=accelerate)
+        # idle connections, the most recently released last
         self.free_pool_ = []
-        self.lock_ = Lock()
-        for i in range(max_size):
-            self._create_conn()
+        self.last_used_ = {}
+        # weak, so a connection the user never releases frees its slot once it is garbage collected
+        self.in_use_ = weakref.WeakSet()
+        # connections being opened or health checked, they count against max_size
+        self.pending_ = 0
+        self.lock_ = Condition()
+        self.stats_ = ConnectionPoolStats()
+        self.closed_ = False
+        self.stop_event_ = Event()
+        for i in range(min_size):
+            self._put_free(self._create_conn())
+        self.health_thread_ = None
+        if health_check_interval is not None and health_check_interval > 0:
+            # the thread only holds a weak reference, so an unreferenced pool is still destroyed by __del__
+            self.health_thread_ = Thread(target=ConnectionPool._health_check_loop,
+                                         args=(weakref.ref(self), self.stop_event_, health_check_interval),
+                                         name="ConnectionPoolHealthCheck", daemon=True)
+            self.health_thread_.start()
 
-    def _del__(self):
-        self.destroy()
+    def __del__(self):
+        if hasattr(self, "stop_event_"):
+            self.destroy()
 
     def _create_conn(self):
-        infinity_coon = infinity.connect(self.uri_)
-        self.free_pool_.append(infinity_coon)
+        infinity_conn = infinity.connect(self.uri_, result_cache=self.result_cache_, **self.connect_options_)
+        with self.lock_:
+            self.stats_.created += 1
+        return infinity_conn
+
+    def _put_free(self, conn):
+        with self.lock_:
+            self.free_pool_.append(conn)
+            self.last_used_[id(conn)] = time.monotonic()
+            self.lock_.notify()
 
-    def get_conn(self):
+    def _size(self):
+        return len(self.free_pool_) + len(self.in_use_) + self.pending_
+
+    def get_conn(self, timeout=-1):
+        """
+        timeout: seconds to wait for a free connection, -1 means the pool's timeout, None means wait forever.
+        """
+        if timeout == -1:
+            timeout = self.timeout_
+        start = time.monotonic()
+        waited = False
+        with self.lock_:
+            while True:
+                if self.closed_:
+                    raise InfinityException(ErrorCode.CLIENT_CLOSE, "Connection pool is destroyed")
+                if self.free_pool_:
+                    conn = self.free_pool_.pop()
+                    self.last_used_.pop(id(conn), None)
+                    self.in_use_.add(conn)
+                    break
+                if self._size() < self.max_size_:
+                    conn = None
+                    self.pending_ += 1
+                    break
+                remaining = None if timeout is None else timeout - (time.monotonic() - start)
+                if remaining is not None and remaining <= 0:
+                    raise InfinityException(ErrorCode.TOO_MANY_CONNECTIONS,
+                                            f"No free connection in {timeout}s, pool max_size: {self.max_size_}")
+                waited = True
+                self.lock_.wait(remaining)
+
+        if conn is None:
+            try:
+                conn = self._create_conn()
+            finally:
+                with self.lock_:
+                    self.pending_ -= 1
+                    if conn is None:
+                        self.lock_.notify()
+                    else:
+                        self.in_use_.add(conn)
+
+        wait_time = time.monotonic() - start
         with self.lock_:
-            if (len(self.free_pool_) == 0):
-                self._create_conn()
-            conn = self.free_pool_.pop()
-            logging.debug("get_conn")
-            return conn
+            self.stats_.acquired += 1
+            self.stats_.waited += waited
+            self.stats_.total_wait_time += wait_time
+            self.stats_.max_wait_time = max(self.stats_.max_wait_time, wait_time)
+        logging.debug("get_conn")
+        return conn
 
     def release_conn(self, conn):
         """
@@ -49,11 +166,154 @@ class ConnectionPool(object):
         with self.lock_:
             if (self.free_pool_.count(conn)):
                 raise Exception("the connection has been released")
-            if (len(self.free_pool_) < self.max_size_):
+            if conn in self.in_use_:
+                self.in_use_.discard(conn)
+            elif self._size() >= self.max_size_:
+                # not ours and no room for it
+                return
+            if not self.closed_:
                 self.free_pool_.append(conn)
-            logging.debug("release_conn")
+                self.last_used_[id(conn)] = time.monotonic()
+                self.lock_.notify()
+                logging.debug("release_conn")
+                return
+        self._disconnect(conn)
 
-    def destroy(self):
-        for conn in iter(self.free_pool_):
+    def discard_conn(self, conn):
+        """
+        Drop a connection which is broken or in an unknown state instead of returning it to the pool.
+        """
+        with self.lock_:
+            if conn in self.in_use_:
+                self.in_use_.discard(conn)
+                self.stats_.evicted += 1
+                self.lock_.notify()
+        self._disconnect(conn)
+
+    @contextmanager
+    def connection(self, timeout=-1):
+        conn = self.get_conn(timeout)
+        try:
+            yield conn
+        except InfinityException:
+            # the server answered, the connection itself is fine
+            self.release_conn(conn)
+            raise
+        except BaseException:
+            self.discard_conn(conn)
+            raise
+        else:
+            self.release_conn(conn)
+
+    def stats(self) -> ConnectionPoolStats:
+        with self.lock_:
+            stats = copy.copy(self.stats_)
+            stats.in_use = len(self.in_use_)
+            stats.idle = len(self.free_pool_)
+        return stats
+
+    @staticmethod
+    def _disconnect(conn):
+        try:
             conn.disconnect()
-        self.free_pool_.clear()
+        except Exception as e:
+            logging.debug(f"disconnect failed: {e}")
+
+    @staticmethod
+    def _is_alive(conn):
+        try:
+            conn.list_databases()
+            return True
+        except Exception as e:
+            logging.warning(f"connection health check failed: {e}")
+            return False
+
+    @staticmethod
+    def _health_check_loop(pool_ref, stop_event, interval):
+        while not stop_event.wait(interval):
+            pool = pool_ref()
+            if pool is None:
+                return
+            try:
+                pool.health_check()
+            except Exception as e:
+                logging.error(f"connection pool health check failed: {e}")
+            del pool
+
+    def health_check(self):
+        now = time.monotonic()
+        expired = []
+        with self.lock_:
+            # free_pool_ is ordered by release time, the least recently used ones are evicted first
+            size = self._size()
+            for conn in self.free_pool_:
+                if size - len(expired) <= self.min_size_ or self.idle_timeout_ is None:
+                    break
+                if now - self.last_used_[id(conn)] < self.idle_timeout_:
+                    break
+                expired.append(conn)
+            del self.free_pool_[:len(expired)]
+            to_check = list(self.free_pool_)
+            for conn in expired:
+                self.last_used_.pop(id(conn), None)
+            self.stats_.evicted += len(expired)
+        for conn in expired:
+            self._disconnect(conn)
+
+        # ping one connection at a time, the others stay available to get_conn meanwhile
+        for conn in to_check:
+            with self.lock_:
+                if self.closed_:
+                    break
+                if conn not in self.free_pool_:
+                    # taken by get_conn since
+                    continue
+                self.free_pool_.remove(conn)
+                last_used = self.last_used_.pop(id(conn))
+                self.pending_ += 1
+            is_alive = self._is_alive(conn)
+            with self.lock_:
+                self.pending_ -= 1
+                if is_alive and not self.closed_:
+                    # keep free_pool_ ordered by release time
+                    pos = 0
+                    while pos < len(self.free_pool_) and self.last_used_[id(self.free_pool_[pos])] <= last_used:
+                        pos += 1
+                    self.free_pool_.insert(pos, conn)
+                    self.last_used_[id(conn)] = last_used
+                    conn = None
+                elif not is_alive:
+                    self.stats_.evicted += 1
+                self.lock_.notify()
+            if conn is not None:
+                self._disconnect(conn)
+
+        with self.lock_:
+            missing = 0 if self.closed_ else max(self.min_size_ - self._size(), 0)
+            self.pending_ += missing
+        for i in range(missing):
+            conn = None
+            try:
+                conn = self._create_conn()
+            finally:
+                with self.lock_:
+                    self.pending_ -= 1
+                    if conn is not None and not self.closed_:
+                        self.free_pool_.append(conn)
+                        self.last_used_[id(conn)] = time.monotonic()
+                        conn = None
+                    self.lock_.notify()
+            if conn is not None:
+                self._disconnect(conn)
+
+    def destroy(self):
+        with self.lock_:
+            if self.closed_:
+                return
+            self.closed_ = True
+            free_pool, self.free_pool_ = self.free_pool_, []
+            self.last_used_.clear()
+            self.lock_.notify_all()
+        self.stop_event_.set()
+        for conn in free_pool:
+            self._disconnect(conn)
@@ -16,7 +16,7 @@ import logging
 from functools import wraps
 from readerwriterlock import rwlock
 
-from thrift.protocol import TBinaryProtocol
+from thrift.protocol import TBinaryProtocol, TCompactProtocol
 from thrift.transport import TSocket
 from thrift.transport.TTransport import TTransportException
 
@@ -25,13 +25,46 @@ from infinity.remote_thrift.infinity_thrift_rpc import *
 from infinity.remote_thrift.infinity_thrift_rpc.ttypes import *
 from infinity.errors import ErrorCode
 from infinity.common import InfinityException
+from infinity.result_cache import ResultCache
 
 TRY_TIMES = 10
 
+# must match client_protocol / client_transport in the [network] section of the server config
+THRIFT_PROTOCOLS = ("binary", "compact")
+THRIFT_TRANSPORTS = ("buffered", "framed")
+
+
+def check_thrift_options(protocol: str, transport: str):
+    if protocol not in THRIFT_PROTOCOLS:
+        raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                                f"Unknown thrift protocol: {protocol}, expect one of {THRIFT_PROTOCOLS}")
+    if transport not in THRIFT_TRANSPORTS:
+        raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                                f"Unknown thrift transport: {transport}, expect one of {THRIFT_TRANSPORTS}")
+
+
+def make_thrift_protocol(protocol: str, trans, accelerate: bool = True):
+    # the accelerated protocols encode and decode whole structs in C (thrift.protocol.fastbinary), falling back to
+    # the pure python implementation if the extension is not available
+    if protocol == "compact":
+        if accelerate:
+            return TCompactProtocol.TCompactProtocolAccelerated(trans)
+        return TCompactProtocol.TCompactProtocol(trans)
+    if accelerate:
+        return TBinaryProtocol.TBinaryProtocolAccelerated(trans)
+    return TBinaryProtocol.TBinaryProtocol(trans)
+
 
 class ThriftInfinityClient:
-    def __init__(self, uri: URI, *, try_times: int = TRY_TIMES, logger: logging.Logger = None):
+    def __init__(self, uri: URI, *, try_times: int = TRY_TIMES, logger: logging.Logger = None,
+                 result_cache: ResultCache = None, protocol: str = "binary", transport: str = "buffered",
+                 accelerate: bool = True):
+        check_thrift_options(protocol, transport)
         self.lock = rwlock.RWLockRead()
+        self.result_cache = result_cache
+        self.protocol_name = protocol
+        self.transport_name = transport
+        self.accelerate = accelerate
 
         self.session_id = -1
         self.uri = uri
@@ -63,11 +96,12 @@ class ThriftInfinityClient:
         if self.transport is not None:
             self.transport.close()
             self.transport = None
-        # self.transport = TTransport.TFramedTransport(TSocket.TSocket(self.uri.ip, self.uri.port))  # async
-        self.transport = TTransport.TBufferedTransport(
-            TSocket.TSocket(self.uri.ip, self.uri.port))  # sync
-        self.protocol = TBinaryProtocol.TBinaryProtocol(self.transport)
-        # self.protocol = TCompactProtocol.TCompactProtocol(self.transport)
+        socket = TSocket.TSocket(self.uri.ip, self.uri.port)
+        if self.transport_name == "framed":
+            self.transport = TTransport.TFramedTransport(socket)
+        else:
+            self.transport = TTransport.TBufferedTransport(socket)
+        self.protocol = make_thrift_protocol(self.protocol_name, self.transport, self.accelerate)
         self.client = InfinityService.Client(self.protocol)
         self.transport.open()
 
@@ -105,27 +139,43 @@ class ThriftInfinityClient:
             raise InfinityException(res.error_code, res.error_msg)
         self.session_id = res.session_id
 
+    def _retry_call(self, func, *args, **kwargs):
+        for i in range(self.try_times):
+            try:
+                with self.lock.gen_rlock():
+                    old_session_i = self.session_i
+                    ret = func(self, *args, **kwargs)
+                    break
+            except TTransportException as e:
+                with self.lock.gen_wlock():
+                    if old_session_i == self.session_i:
+                        self._reconnect()
+                        self.session_i += 1
+                        self.logger.debug(
+                            f"Tried {i} times, session_id: {self.session_id}, session_i: {self.session_i}, exception: {str(e)}")
+            except Exception as e:
+                raise
+        else:
+            return CommonResponse(ErrorCode.TOO_MANY_CONNECTIONS, f"Try {self.try_times} times, but still failed")
+        return ret
+
     def retry_wrapper(func):
+        # the retry loop is a method, so the asyncio client can run it on the awaited response
         @wraps(func)
         def wrapper(self, *args, **kwargs):
-            for i in range(self.try_times):
-                try:
-                    with self.lock.gen_rlock():
-                        old_session_i = self.session_i
-                        ret = func(self, *args, **kwargs)
-                        break
-                except TTransportException as e:
-                    with self.lock.gen_wlock():
-                        if old_session_i == self.session_i:
-                            self._reconnect()
-                            self.session_i += 1
-                            self.logger.debug(
-                                f"Tried {i} times, session_id: {self.session_id}, session_i: {self.session_i}, exception: {str(e)}")
-                except Exception as e:
-                    raise
-            else:
-                return CommonResponse(ErrorCode.TOO_MANY_CONNECTIONS, f"Try {self.try_times} times, but still failed")
-            return ret
+            return self._retry_call(func, *args, **kwargs)
+
+        return wrapper
+
+    def invalidate_wrapper(func):
+        # a write drops the cached results of the table it touches, whether it succeeded or not
+        @wraps(func)
+        def wrapper(self, db_name: str, table_name: str, *args, **kwargs):
+            try:
+                return func(self, db_name, table_name, *args, **kwargs)
+            finally:
+                if self.result_cache is not None:
+                    self.result_cache.invalidate(db_name, table_name)
 
         return wrapper
 
@@ -144,9 +194,12 @@ class ThriftInfinityClient:
 
     @retry_wrapper
     def drop_database(self, db_name: str, conflict_type: DropConflict = DropConflict.Error):
-        return self.client.DropDatabase(DropDatabaseRequest(session_id=self.session_id,
-                                                            db_name=db_name,
-                                                            drop_option=DropOption(conflict_type=conflict_type)))
+        res = self.client.DropDatabase(DropDatabaseRequest(session_id=self.session_id,
+                                                           db_name=db_name,
+                                                           drop_option=DropOption(conflict_type=conflict_type)))
+        if self.result_cache is not None:
+            self.result_cache.invalidate_database(db_name)
+        return res
 
     @retry_wrapper
     def list_databases(self):
@@ -162,6 +215,7 @@ class ThriftInfinityClient:
         return self.client.GetDatabase(GetDatabaseRequest(session_id=self.session_id,
                                                           db_name=db_name))
 
+    @invalidate_wrapper
     @retry_wrapper
     def create_table(self, db_name: str, table_name: str, column_defs,
                      conflict_type: CreateConflict = CreateConflict.Error, properties: list = None):
@@ -172,6 +226,7 @@ class ThriftInfinityClient:
                                                           create_option=CreateOption(conflict_type=conflict_type,
                                                                                      properties=properties)))
 
+    @invalidate_wrapper
     @retry_wrapper
     def drop_table(self, db_name: str, table_name: str, conflict_type: DropConflict = DropConflict.Error):
         return self.client.DropTable(DropTableRequest(session_id=self.session_id,
@@ -202,6 +257,7 @@ class ThriftInfinityClient:
                                                     db_name=db_name,
                                                     table_name=table_name))
 
+    @invalidate_wrapper
     @retry_wrapper
     def create_index(self, db_name: str, table_name: str, index_name: str, index_info: IndexInfo,
                      conflict_type: CreateConflict = CreateConflict.Error, index_comment: str = ""):
@@ -213,6 +269,7 @@ class ThriftInfinityClient:
                                                           index_info=index_info,
                                                           create_option=CreateOption(conflict_type=conflict_type)))
 
+    @invalidate_wrapper
     @retry_wrapper
     def drop_index(self, db_name: str, table_name: str, index_name: str,
                    conflict_type: DropConflict = DropConflict.Error):
@@ -235,17 +292,20 @@ class ThriftInfinityClient:
                                                       db_name=db_name,
                                                       table_name=table_name))
 
+    @invalidate_wrapper
     @retry_wrapper
-    def insert(self, db_name: str, table_name: str, fields: list[Field]):
+    def insert(self, db_name: str, table_name: str, fields: list[Field] = None, column_fields: list[ColumnField] = None):
         return self.client.Insert(
             InsertRequest(
                 session_id=self.session_id,
                 db_name=db_name,
                 table_name=table_name,
-                fields=fields,
+                fields=fields if fields is not None else [],
+                column_fields=column_fields if column_fields is not None else [],
             )
         )
 
+    @invalidate_wrapper
     @retry_wrapper
     def import_data(self, db_name: str, table_name: str, file_name: str, import_options):
         return self.client.Import(ImportRequest(session_id=self.session_id,
@@ -263,23 +323,56 @@ class ThriftInfinityClient:
                                                 file_name=file_name,
                                                 export_option=export_options))
 
-    @retry_wrapper
     def select(self, db_name: str, table_name: str, select_list, highlight_list, search_expr,
-               where_expr, group_by_list, having_expr, limit_expr, offset_expr, order_by_list, total_hits_count):
-        return self.client.Select(SelectRequest(session_id=self.session_id,
-                                                db_name=db_name,
-                                                table_name=table_name,
-                                                select_list=select_list,
-                                                highlight_list=highlight_list,
-                                                search_expr=search_expr,
-                                                where_expr=where_expr,
-                                                group_by_list=group_by_list,
-                                                having_expr=having_expr,
-                                                limit_expr=limit_expr,
-                                                offset_expr=offset_expr,
-                                                order_by_list=order_by_list,
-                                                total_hits_count=total_hits_count
-                                                ))
+               where_expr, group_by_list, having_expr, limit_expr, offset_expr, order_by_list, total_hits_count,
+               batch_rows: int = None, priority: str = None, profile: bool = None):
+        request = SelectRequest(db_name=db_name,
+                                table_name=table_name,
+                                select_list=select_list,
+                                highlight_list=highlight_list,
+                                search_expr=search_expr,
+                                where_expr=where_expr,
+                                group_by_list=group_by_list,
+                                having_expr=having_expr,
+                                limit_expr=limit_expr,
+                                offset_expr=offset_expr,
+                                order_by_list=order_by_list,
+                                total_hits_count=total_hits_count,
+                                batch_rows=batch_rows,
+                                priority=priority,
+                                profile=profile
+                                )
+        # a cursor is consumed by fetch_cursor and a profile belongs to one execution, neither can be cached
+        if self.result_cache is None or batch_rows is not None or profile:
+            return self._select(request)
+        return self.result_cache.get_or_load(db_name, table_name, request, self._select)
+
+    @retry_wrapper
+    def _select(self, request: SelectRequest):
+        request.session_id = self.session_id
+        return self.client.Select(request)
+
+    @retry_wrapper
+    def fetch_cursor(self, cursor_id: int, close: bool = False):
+        return self.client.FetchCursor(FetchCursorRequest(session_id=self.session_id, cursor_id=cursor_id, close=close))
+
+    @retry_wrapper
+    def match_dense_batch(self, db_name: str, table_name: str, column_name: str, element_type, distance_type,
+                          dimension: int, query_count: int, query_data: bytes, topn: int, opt_params,
+                          where_expr=None, priority: str = None):
+        return self.client.MatchDenseBatch(MatchDenseBatchRequest(session_id=self.session_id,
+                                                                  db_name=db_name,
+                                                                  table_name=table_name,
+                                                                  column_name=column_name,
+                                                                  element_type=element_type,
+                                                                  distance_type=distance_type,
+                                                                  dimension=dimension,
+                                                                  query_count=query_count,
+                                                                  query_data=query_data,
+                                                                  topn=topn,
+                                                                  opt_params=opt_params,
+                                                                  where_expr=where_expr,
+                                                                  priority=priority))
 
     @retry_wrapper
     def explain(self, db_name: str, table_name: str, select_list, highlight_list, search_expr,
@@ -297,6 +390,7 @@ class ThriftInfinityClient:
                                                   explain_type=explain_type
                                                   ))
 
+    @invalidate_wrapper
     @retry_wrapper
     def delete(self, db_name: str, table_name: str, where_expr):
         return self.client.Delete(DeleteRequest(session_id=self.session_id,
@@ -304,6 +398,7 @@ class ThriftInfinityClient:
                                                 table_name=table_name,
                                                 where_expr=where_expr))
 
+    @invalidate_wrapper
     @retry_wrapper
     def update(self, db_name: str, table_name: str, where_expr, update_expr_array):
         return self.client.Update(UpdateRequest(session_id=self.session_id,
@@ -362,17 +457,20 @@ class ThriftInfinityClient:
     def show_current_node(self):
         return self.client.ShowCurrentNode(ShowCurrentNodeRequest(session_id=self.session_id))
 
+    @invalidate_wrapper
     @retry_wrapper
     def optimize(self, db_name: str, table_name: str, optimize_opt: ttypes.OptimizeOptions):
         return self.client.Optimize(OptimizeRequest(session_id=self.session_id, db_name=db_name, table_name=table_name,
                                                     optimize_options=optimize_opt))
 
+    @invalidate_wrapper
     @retry_wrapper
     def add_columns(self, db_name: str, table_name: str, column_defs: list):
         return self.client.AddColumns(
             AddColumnsRequest(session_id=self.session_id, db_name=db_name, table_name=table_name,
                               column_defs=column_defs))
 
+    @invalidate_wrapper
     @retry_wrapper
     def drop_columns(self, db_name: str, table_name: str, column_names: list):
         return self.client.DropColumns(
@@ -400,6 +498,7 @@ class ThriftInfinityClient:
         flush_request.session_id = self.session_id
         return self.client.Flush(flush_request)
 
+    @invalidate_wrapper
     @retry_wrapper
     def compact(self, db_name: str, table_name: str):
         return self.client.Compact(CompactRequest(session_id=self.session_id, db_name=db_name, table_name=table_name))
@@ -22,13 +22,16 @@ from infinity.remote_thrift.client import ThriftInfinityClient
 from infinity.remote_thrift.db import RemoteDatabase
 from infinity.remote_thrift.utils import name_validity_check, select_res_to_polars
 from infinity.common import ConflictType, InfinityException
+from infinity.result_cache import ResultCache
 
 
 class RemoteThriftInfinityConnection(InfinityConnection, ABC):
-    def __init__(self, uri, logger: logging.Logger = None):
+    def __init__(self, uri, logger: logging.Logger = None, result_cache: ResultCache = None, protocol: str = "binary",
+                 transport: str = "buffered", accelerate: bool = True):
         super().__init__(uri)
         self.db_name = "default_db"
-        self._client = ThriftInfinityClient(uri, logger=logger)
+        self._client = ThriftInfinityClient(uri, logger=logger, result_cache=result_cache, protocol=protocol,
+                                            transport=transport, accelerate=accelerate)
         self._is_connected = True
 
     def __del__(self):
@@ -140,3 +143,7 @@ class RemoteThriftInfinityConnection(InfinityConnection, ABC):
     @property
     def client(self):
         return self._client
+
+    @property
+    def result_cache(self) -> ResultCache | None:
+        return self._client.result_cache
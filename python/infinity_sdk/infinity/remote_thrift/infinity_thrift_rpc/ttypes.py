@@ -284,6 +284,7 @@ class CopyFileType(object):
     FVECS = 3
     CSR = 4
     BVECS = 5
+    PARQUET = 6
 
     _VALUES_TO_NAMES = {
         0: "CSV",
@@ -292,6 +293,7 @@ class CopyFileType(object):
         3: "FVECS",
         4: "CSR",
         5: "BVECS",
+        6: "PARQUET",
     }
 
     _NAMES_TO_VALUES = {
@@ -301,6 +303,7 @@ class CopyFileType(object):
         "FVECS": 3,
         "CSR": 4,
         "BVECS": 5,
+        "PARQUET": 6,
     }
 
 
@@ -1448,11 +1451,12 @@ class EmbeddingData(object):
      - f64_array_value
      - f16_array_value
      - bf16_array_value
+     - bytes_value
 
     """
 
 
-    def __init__(self, bool_array_value=None, u8_array_value=None, i8_array_value=None, i16_array_value=None, i32_array_value=None, i64_array_value=None, f32_array_value=None, f64_array_value=None, f16_array_value=None, bf16_array_value=None,):
+    def __init__(self, bool_array_value=None, u8_array_value=None, i8_array_value=None, i16_array_value=None, i32_array_value=None, i64_array_value=None, f32_array_value=None, f64_array_value=None, f16_array_value=None, bf16_array_value=None, bytes_value=None,):
         self.bool_array_value = bool_array_value
         self.u8_array_value = u8_array_value
         self.i8_array_value = i8_array_value
@@ -1463,6 +1467,7 @@ class EmbeddingData(object):
         self.f64_array_value = f64_array_value
         self.f16_array_value = f16_array_value
         self.bf16_array_value = bf16_array_value
+        self.bytes_value = bytes_value
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -1573,6 +1578,11 @@ class EmbeddingData(object):
                     iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
+            elif fid == 11:
+                if ftype == TType.STRING:
+                    self.bytes_value = iprot.readBinary()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -1653,6 +1663,10 @@ class EmbeddingData(object):
                 oprot.writeDouble(iter83)
             oprot.writeListEnd()
             oprot.writeFieldEnd()
+        if self.bytes_value is not None:
+            oprot.writeFieldBegin('bytes_value', TType.STRING, 11)
+            oprot.writeBinary(self.bytes_value)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -3385,18 +3399,20 @@ class ColumnField(object):
      - column_type
      - column_vectors
      - column_name
+     - dimension
 
     """
 
 
     def __init__(self, column_type=None, column_vectors=[
-    ], column_name=None,):
+    ], column_name=None, dimension=0,):
         self.column_type = column_type
         if column_vectors is self.thrift_spec[2][4]:
             column_vectors = [
             ]
         self.column_vectors = column_vectors
         self.column_name = column_name
+        self.dimension = dimension
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -3427,6 +3443,11 @@ class ColumnField(object):
                     self.column_name = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
                 else:
                     iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.I64:
+                    self.dimension = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -3452,6 +3473,10 @@ class ColumnField(object):
             oprot.writeFieldBegin('column_name', TType.STRING, 3)
             oprot.writeString(self.column_name.encode('utf-8') if sys.version_info[0] == 2 else self.column_name)
             oprot.writeFieldEnd()
+        if self.dimension is not None:
+            oprot.writeFieldBegin('dimension', TType.I64, 4)
+            oprot.writeI64(self.dimension)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -6139,12 +6164,14 @@ class InsertRequest(object):
      - table_name
      - fields
      - session_id
+     - column_fields
 
     """
 
 
     def __init__(self, db_name=None, table_name=None, fields=[
-    ], session_id=None,):
+    ], session_id=None, column_fields=[
+    ],):
         self.db_name = db_name
         self.table_name = table_name
         if fields is self.thrift_spec[3][4]:
@@ -6152,6 +6179,10 @@ class InsertRequest(object):
             ]
         self.fields = fields
         self.session_id = session_id
+        if column_fields is self.thrift_spec[5][4]:
+            column_fields = [
+            ]
+        self.column_fields = column_fields
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -6188,6 +6219,17 @@ class InsertRequest(object):
                     self.session_id = iprot.readI64()
                 else:
                     iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.LIST:
+                    self.column_fields = []
+                    (_etype430, _size427) = iprot.readListBegin()
+                    for _i431 in range(_size427):
+                        _elem432 = ColumnField()
+                        _elem432.read(iprot)
+                        self.column_fields.append(_elem432)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -6217,6 +6259,13 @@ class InsertRequest(object):
             oprot.writeFieldBegin('session_id', TType.I64, 4)
             oprot.writeI64(self.session_id)
             oprot.writeFieldEnd()
+        if self.column_fields is not None:
+            oprot.writeFieldBegin('column_fields', TType.LIST, 5)
+            oprot.writeListBegin(TType.STRUCT, len(self.column_fields))
+            for iter433 in self.column_fields:
+                iter433.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -6836,6 +6885,9 @@ class SelectRequest(object):
      - offset_expr
      - order_by_list
      - total_hits_count
+     - batch_rows
+     - priority
+     - profile
 
     """
 
@@ -6844,7 +6896,7 @@ class SelectRequest(object):
     ], highlight_list=[
     ], search_expr=None, where_expr=None, group_by_list=[
     ], having_expr=None, limit_expr=None, offset_expr=None, order_by_list=[
-    ], total_hits_count=None,):
+    ], total_hits_count=None, batch_rows=None, priority=None, profile=None,):
         self.session_id = session_id
         self.db_name = db_name
         self.table_name = table_name
@@ -6870,6 +6922,9 @@ class SelectRequest(object):
             ]
         self.order_by_list = order_by_list
         self.total_hits_count = total_hits_count
+        self.batch_rows = batch_rows
+        self.priority = priority
+        self.profile = profile
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -6974,6 +7029,21 @@ class SelectRequest(object):
                     self.total_hits_count = iprot.readBool()
                 else:
                     iprot.skip(ftype)
+            elif fid == 14:
+                if ftype == TType.I64:
+                    self.batch_rows = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 15:
+                if ftype == TType.STRING:
+                    self.priority = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 16:
+                if ftype == TType.BOOL:
+                    self.profile = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -7048,6 +7118,18 @@ class SelectRequest(object):
             oprot.writeFieldBegin('total_hits_count', TType.BOOL, 13)
             oprot.writeBool(self.total_hits_count)
             oprot.writeFieldEnd()
+        if self.batch_rows is not None:
+            oprot.writeFieldBegin('batch_rows', TType.I64, 14)
+            oprot.writeI64(self.batch_rows)
+            oprot.writeFieldEnd()
+        if self.priority is not None:
+            oprot.writeFieldBegin('priority', TType.STRING, 15)
+            oprot.writeString(self.priority.encode('utf-8') if sys.version_info[0] == 2 else self.priority)
+            oprot.writeFieldEnd()
+        if self.profile is not None:
+            oprot.writeFieldBegin('profile', TType.BOOL, 16)
+            oprot.writeBool(self.profile)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -7074,13 +7156,15 @@ class SelectResponse(object):
      - column_defs
      - column_fields
      - extra_result
+     - cursor_id
+     - profile
 
     """
 
 
     def __init__(self, error_code=None, error_msg=None, column_defs=[
     ], column_fields=[
-    ], extra_result=None,):
+    ], extra_result=None, cursor_id=None, profile=None,):
         self.error_code = error_code
         self.error_msg = error_msg
         if column_defs is self.thrift_spec[3][4]:
@@ -7092,6 +7176,8 @@ class SelectResponse(object):
             ]
         self.column_fields = column_fields
         self.extra_result = extra_result
+        self.cursor_id = cursor_id
+        self.profile = profile
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -7139,6 +7225,16 @@ class SelectResponse(object):
                     self.extra_result = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
                 else:
                     iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.I64:
+                    self.cursor_id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 7:
+                if ftype == TType.STRING:
+                    self.profile = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -7175,6 +7271,408 @@ class SelectResponse(object):
             oprot.writeFieldBegin('extra_result', TType.STRING, 5)
             oprot.writeString(self.extra_result.encode('utf-8') if sys.version_info[0] == 2 else self.extra_result)
             oprot.writeFieldEnd()
+        if self.cursor_id is not None:
+            oprot.writeFieldBegin('cursor_id', TType.I64, 6)
+            oprot.writeI64(self.cursor_id)
+            oprot.writeFieldEnd()
+        if self.profile is not None:
+            oprot.writeFieldBegin('profile', TType.STRING, 7)
+            oprot.writeString(self.profile.encode('utf-8') if sys.version_info[0] == 2 else self.profile)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class MatchDenseBatchRequest(object):
+    """
+    Attributes:
+     - session_id
+     - db_name
+     - table_name
+     - column_name
+     - element_type
+     - distance_type
+     - dimension
+     - query_count
+     - query_data
+     - topn
+     - opt_params
+     - where_expr
+     - priority
+
+    """
+
+
+    def __init__(self, session_id=None, db_name=None, table_name=None, column_name=None, element_type=None, distance_type=None, dimension=None, query_count=None, query_data=None, topn=None, opt_params=[
+    ], where_expr=None, priority=None,):
+        self.session_id = session_id
+        self.db_name = db_name
+        self.table_name = table_name
+        self.column_name = column_name
+        self.element_type = element_type
+        self.distance_type = distance_type
+        self.dimension = dimension
+        self.query_count = query_count
+        self.query_data = query_data
+        self.topn = topn
+        if opt_params is self.thrift_spec[11][4]:
+            opt_params = [
+            ]
+        self.opt_params = opt_params
+        self.where_expr = where_expr
+        self.priority = priority
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I64:
+                    self.session_id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.db_name = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.table_name = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.STRING:
+                    self.column_name = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.I32:
+                    self.element_type = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.I32:
+                    self.distance_type = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 7:
+                if ftype == TType.I64:
+                    self.dimension = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 8:
+                if ftype == TType.I64:
+                    self.query_count = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 9:
+                if ftype == TType.STRING:
+                    self.query_data = iprot.readBinary()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 10:
+                if ftype == TType.I64:
+                    self.topn = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 11:
+                if ftype == TType.LIST:
+                    self.opt_params = []
+                    (_etype9001, _size9002) = iprot.readListBegin()
+                    for _i9003 in range(_size9002):
+                        _elem9004 = InitParameter()
+                        _elem9004.read(iprot)
+                        self.opt_params.append(_elem9004)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 12:
+                if ftype == TType.STRUCT:
+                    self.where_expr = ParsedExpr()
+                    self.where_expr.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 13:
+                if ftype == TType.STRING:
+                    self.priority = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('MatchDenseBatchRequest')
+        if self.session_id is not None:
+            oprot.writeFieldBegin('session_id', TType.I64, 1)
+            oprot.writeI64(self.session_id)
+            oprot.writeFieldEnd()
+        if self.db_name is not None:
+            oprot.writeFieldBegin('db_name', TType.STRING, 2)
+            oprot.writeString(self.db_name.encode('utf-8') if sys.version_info[0] == 2 else self.db_name)
+            oprot.writeFieldEnd()
+        if self.table_name is not None:
+            oprot.writeFieldBegin('table_name', TType.STRING, 3)
+            oprot.writeString(self.table_name.encode('utf-8') if sys.version_info[0] == 2 else self.table_name)
+            oprot.writeFieldEnd()
+        if self.column_name is not None:
+            oprot.writeFieldBegin('column_name', TType.STRING, 4)
+            oprot.writeString(self.column_name.encode('utf-8') if sys.version_info[0] == 2 else self.column_name)
+            oprot.writeFieldEnd()
+        if self.element_type is not None:
+            oprot.writeFieldBegin('element_type', TType.I32, 5)
+            oprot.writeI32(self.element_type)
+            oprot.writeFieldEnd()
+        if self.distance_type is not None:
+            oprot.writeFieldBegin('distance_type', TType.I32, 6)
+            oprot.writeI32(self.distance_type)
+            oprot.writeFieldEnd()
+        if self.dimension is not None:
+            oprot.writeFieldBegin('dimension', TType.I64, 7)
+            oprot.writeI64(self.dimension)
+            oprot.writeFieldEnd()
+        if self.query_count is not None:
+            oprot.writeFieldBegin('query_count', TType.I64, 8)
+            oprot.writeI64(self.query_count)
+            oprot.writeFieldEnd()
+        if self.query_data is not None:
+            oprot.writeFieldBegin('query_data', TType.STRING, 9)
+            oprot.writeBinary(self.query_data)
+            oprot.writeFieldEnd()
+        if self.topn is not None:
+            oprot.writeFieldBegin('topn', TType.I64, 10)
+            oprot.writeI64(self.topn)
+            oprot.writeFieldEnd()
+        if self.opt_params is not None:
+            oprot.writeFieldBegin('opt_params', TType.LIST, 11)
+            oprot.writeListBegin(TType.STRUCT, len(self.opt_params))
+            for iter9005 in self.opt_params:
+                iter9005.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.where_expr is not None:
+            oprot.writeFieldBegin('where_expr', TType.STRUCT, 12)
+            self.where_expr.write(oprot)
+            oprot.writeFieldEnd()
+        if self.priority is not None:
+            oprot.writeFieldBegin('priority', TType.STRING, 13)
+            oprot.writeString(self.priority.encode('utf-8') if sys.version_info[0] == 2 else self.priority)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class MatchDenseBatchResponse(object):
+    """
+    Attributes:
+     - error_code
+     - error_msg
+     - query_count
+     - topn
+     - row_ids
+     - distances
+
+    """
+
+
+    def __init__(self, error_code=None, error_msg=None, query_count=None, topn=None, row_ids=None, distances=None,):
+        self.error_code = error_code
+        self.error_msg = error_msg
+        self.query_count = query_count
+        self.topn = topn
+        self.row_ids = row_ids
+        self.distances = distances
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I64:
+                    self.error_code = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.error_msg = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.I64:
+                    self.query_count = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.I64:
+                    self.topn = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.STRING:
+                    self.row_ids = iprot.readBinary()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.STRING:
+                    self.distances = iprot.readBinary()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('MatchDenseBatchResponse')
+        if self.error_code is not None:
+            oprot.writeFieldBegin('error_code', TType.I64, 1)
+            oprot.writeI64(self.error_code)
+            oprot.writeFieldEnd()
+        if self.error_msg is not None:
+            oprot.writeFieldBegin('error_msg', TType.STRING, 2)
+            oprot.writeString(self.error_msg.encode('utf-8') if sys.version_info[0] == 2 else self.error_msg)
+            oprot.writeFieldEnd()
+        if self.query_count is not None:
+            oprot.writeFieldBegin('query_count', TType.I64, 3)
+            oprot.writeI64(self.query_count)
+            oprot.writeFieldEnd()
+        if self.topn is not None:
+            oprot.writeFieldBegin('topn', TType.I64, 4)
+            oprot.writeI64(self.topn)
+            oprot.writeFieldEnd()
+        if self.row_ids is not None:
+            oprot.writeFieldBegin('row_ids', TType.STRING, 5)
+            oprot.writeBinary(self.row_ids)
+            oprot.writeFieldEnd()
+        if self.distances is not None:
+            oprot.writeFieldBegin('distances', TType.STRING, 6)
+            oprot.writeBinary(self.distances)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class FetchCursorRequest(object):
+    """
+    Attributes:
+     - session_id
+     - cursor_id
+     - close
+
+    """
+
+
+    def __init__(self, session_id=None, cursor_id=None, close=None,):
+        self.session_id = session_id
+        self.cursor_id = cursor_id
+        self.close = close
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I64:
+                    self.session_id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I64:
+                    self.cursor_id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.BOOL:
+                    self.close = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('FetchCursorRequest')
+        if self.session_id is not None:
+            oprot.writeFieldBegin('session_id', TType.I64, 1)
+            oprot.writeI64(self.session_id)
+            oprot.writeFieldEnd()
+        if self.cursor_id is not None:
+            oprot.writeFieldBegin('cursor_id', TType.I64, 2)
+            oprot.writeI64(self.cursor_id)
+            oprot.writeFieldEnd()
+        if self.close is not None:
+            oprot.writeFieldBegin('close', TType.BOOL, 3)
+            oprot.writeBool(self.close)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -9217,6 +9715,7 @@ EmbeddingData.thrift_spec = (
     (8, TType.LIST, 'f64_array_value', (TType.DOUBLE, None, False), None, ),  # 8
     (9, TType.LIST, 'f16_array_value', (TType.DOUBLE, None, False), None, ),  # 9
     (10, TType.LIST, 'bf16_array_value', (TType.DOUBLE, None, False), None, ),  # 10
+    (11, TType.STRING, 'bytes_value', 'BINARY', None, ),  # 11
 )
 all_structs.append(InitParameter)
 InitParameter.thrift_spec = (
@@ -9361,6 +9860,7 @@ ColumnField.thrift_spec = (
     (2, TType.LIST, 'column_vectors', (TType.STRING, 'BINARY', False), [
     ], ),  # 2
     (3, TType.STRING, 'column_name', 'UTF8', None, ),  # 3
+    (4, TType.I64, 'dimension', None, 0, ),  # 4
 )
 all_structs.append(ImportOption)
 ImportOption.thrift_spec = (
@@ -9607,6 +10107,8 @@ InsertRequest.thrift_spec = (
     (3, TType.LIST, 'fields', (TType.STRUCT, [Field, None], False), [
     ], ),  # 3
     (4, TType.I64, 'session_id', None, None, ),  # 4
+    (5, TType.LIST, 'column_fields', (TType.STRUCT, [ColumnField, None], False), [
+    ], ),  # 5
 )
 all_structs.append(ImportRequest)
 ImportRequest.thrift_spec = (
@@ -9678,6 +10180,9 @@ SelectRequest.thrift_spec = (
     (12, TType.LIST, 'order_by_list', (TType.STRUCT, [OrderByExpr, None], False), [
     ], ),  # 12
     (13, TType.BOOL, 'total_hits_count', None, None, ),  # 13
+    (14, TType.I64, 'batch_rows', None, None, ),  # 14
+    (15, TType.STRING, 'priority', 'UTF8', None, ),  # 15
+    (16, TType.BOOL, 'profile', None, None, ),  # 16
 )
 all_structs.append(SelectResponse)
 SelectResponse.thrift_spec = (
@@ -9689,6 +10194,43 @@ SelectResponse.thrift_spec = (
     (4, TType.LIST, 'column_fields', (TType.STRUCT, [ColumnField, None], False), [
     ], ),  # 4
     (5, TType.STRING, 'extra_result', 'UTF8', None, ),  # 5
+    (6, TType.I64, 'cursor_id', None, None, ),  # 6
+    (7, TType.STRING, 'profile', 'UTF8', None, ),  # 7
+)
+all_structs.append(MatchDenseBatchRequest)
+MatchDenseBatchRequest.thrift_spec = (
+    None,  # 0
+    (1, TType.I64, 'session_id', None, None, ),  # 1
+    (2, TType.STRING, 'db_name', 'UTF8', None, ),  # 2
+    (3, TType.STRING, 'table_name', 'UTF8', None, ),  # 3
+    (4, TType.STRING, 'column_name', 'UTF8', None, ),  # 4
+    (5, TType.I32, 'element_type', None, None, ),  # 5
+    (6, TType.I32, 'distance_type', None, None, ),  # 6
+    (7, TType.I64, 'dimension', None, None, ),  # 7
+    (8, TType.I64, 'query_count', None, None, ),  # 8
+    (9, TType.STRING, 'query_data', 'BINARY', None, ),  # 9
+    (10, TType.I64, 'topn', None, None, ),  # 10
+    (11, TType.LIST, 'opt_params', (TType.STRUCT, [InitParameter, None], False), [
+    ], ),  # 11
+    (12, TType.STRUCT, 'where_expr', [ParsedExpr, None], None, ),  # 12
+    (13, TType.STRING, 'priority', 'UTF8', None, ),  # 13
+)
+all_structs.append(MatchDenseBatchResponse)
+MatchDenseBatchResponse.thrift_spec = (
+    None,  # 0
+    (1, TType.I64, 'error_code', None, None, ),  # 1
+    (2, TType.STRING, 'error_msg', 'UTF8', None, ),  # 2
+    (3, TType.I64, 'query_count', None, None, ),  # 3
+    (4, TType.I64, 'topn', None, None, ),  # 4
+    (5, TType.STRING, 'row_ids', 'BINARY', None, ),  # 5
+    (6, TType.STRING, 'distances', 'BINARY', None, ),  # 6
+)
+all_structs.append(FetchCursorRequest)
+FetchCursorRequest.thrift_spec = (
+    None,  # 0
+    (1, TType.I64, 'session_id', None, None, ),  # 1
+    (2, TType.I64, 'cursor_id', None, None, ),  # 2
+    (3, TType.BOOL, 'close', None, None, ),  # 3
 )
 all_structs.append(DeleteRequest)
 DeleteRequest.thrift_spec = (
@@ -14,25 +14,35 @@
 
 from __future__ import annotations
 
+import copy
 from abc import ABC
 from typing import List, Optional, Any
 
 import numpy as np
-import pandas as pd
-import polars as pl
-import pyarrow as pa
-from pyarrow import Table
-from sqlglot import condition, maybe_parse
 
-from infinity.common import VEC, SparseVector, InfinityException, SortType
+from infinity.common import VEC, SparseVector, InfinityException, SortType, QueryParam, QUERY_PRIORITIES
 from infinity.errors import ErrorCode
+from infinity.utils import LazyModule
 from infinity.remote_thrift.infinity_thrift_rpc.ttypes import *
 from infinity.remote_thrift.types import (
     logic_type_to_dtype,
     make_match_tensor_expr,
     make_match_sparse_expr,
+    make_sparse_constant_expr,
+    embedding_to_bytes,
+    check_sparse_format,
 )
-from infinity.remote_thrift.utils import traverse_conditions, parse_expr, get_search_optional_filter_from_opt_params
+from infinity.remote_thrift.utils import (
+    parse_expr_str,
+    get_search_optional_filter_from_opt_params,
+    get_filter_expr,
+    compile_filter,
+    bind_filter_params,
+)
+
+pd = LazyModule("pandas")
+pl = LazyModule("polars")
+pa = LazyModule("pyarrow")
 
 """FIXME: How to disable validation of only the search field?"""
 
@@ -49,7 +59,9 @@ class Query(ABC):
             limit: Optional[ParsedExpr],
             offset: Optional[ParsedExpr],
             sort: Optional[List[OrderByExpr]],
-            total_hits_count: Optional[bool]
+            total_hits_count: Optional[bool],
+            priority: Optional[str] = None,
+            profile: bool = False,
     ):
         self.columns = columns
         self.highlight = highlight
@@ -61,6 +73,8 @@ class Query(ABC):
         self.offset = offset
         self.sort = sort
         self.total_hits_count = total_hits_count
+        self.priority = priority
+        self.profile = profile
 
 
 class ExplainQuery(Query):
@@ -81,7 +95,83 @@ class ExplainQuery(Query):
         self.explain_type = explain_type
 
 
+def bind_match_param(generic_match_expr: GenericMatchExpr, value) -> GenericMatchExpr:
+    # a copy of the match expression with value as its query, the template is left untouched
+    if generic_match_expr.match_vector_expr is not None:
+        knn_expr = copy.copy(generic_match_expr.match_vector_expr)
+        knn_expr.embedding_data = EmbeddingData(
+            bytes_value=embedding_to_bytes(knn_expr.embedding_data_type, np.ravel(value)))
+        return GenericMatchExpr(match_vector_expr=knn_expr)
+    if generic_match_expr.match_sparse_expr is not None:
+        match_sparse_expr = copy.copy(generic_match_expr.match_sparse_expr)
+        match_sparse_expr.query_sparse_expr = make_sparse_constant_expr(value)
+        return GenericMatchExpr(match_sparse_expr=match_sparse_expr)
+    if generic_match_expr.match_tensor_expr is not None:
+        match_tensor_expr = copy.copy(generic_match_expr.match_tensor_expr)
+        match_tensor_expr.embedding_data = EmbeddingData(
+            bytes_value=embedding_to_bytes(match_tensor_expr.embedding_data_type, value))
+        return GenericMatchExpr(match_tensor_expr=match_tensor_expr)
+    if not isinstance(value, str):
+        raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                                f"Matching text should be a string, but get {type(value)}")
+    match_expr = copy.copy(generic_match_expr.match_text_expr)
+    match_expr.matching_text = value
+    return GenericMatchExpr(match_text_expr=match_expr)
+
+
+class PreparedQuery:
+    """
+    A query built once by table.<...>.prepare() and executed with new parameter values each time.
+    QueryParam("name") stands for the query of a match_dense / match_sparse / match_tensor / match_text,
+    ":name" for a literal in the filter. Only the parts holding a parameter are rebuilt per execution.
+    """
+
+    def __init__(self, table, query: Query, match_params: list[tuple[int, str]], filter_params: frozenset[str]):
+        self._table = table
+        self._query = query
+        self._match_params = match_params
+        self._filter_params = filter_params
+        self.param_names = frozenset(name for _, name in match_params) | filter_params
+
+    def bind(self, **params) -> Query:
+        missing = self.param_names - params.keys()
+        if missing:
+            raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE, f"Missing query parameters: {sorted(missing)}")
+        unknown = params.keys() - self.param_names
+        if unknown:
+            raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE, f"Unknown query parameters: {sorted(unknown)}")
+        query = copy.copy(self._query)
+        if self._match_params:
+            match_exprs = list(query.search.match_exprs)
+            for match_idx, name in self._match_params:
+                match_exprs[match_idx] = bind_match_param(match_exprs[match_idx], params[name])
+            query.search = SearchExpr(match_exprs=match_exprs, fusion_exprs=query.search.fusion_exprs)
+        if self._filter_params:
+            query.filter = bind_filter_params(query.filter, params)
+        return query
+
+    def to_result(self, to_numpy: bool = False, sparse_format: str = "dict", profile: bool = False, **params) -> \
+            tuple[dict[str, list[Any]], dict[str, Any], {}]:
+        check_sparse_format(sparse_format)
+        query = self.bind(**params)
+        query.profile = profile
+        return self._table._execute_query(query, to_numpy, sparse_format)
+
+    def to_df(self, **params) -> (pd.DataFrame, {}):
+        data_dict, data_type_dict, extra_result = self.to_result(to_numpy=True, **params)
+        return InfinityThriftQueryBuilder._result_to_df(data_dict, data_type_dict), extra_result
+
+    def to_pl(self, **params) -> (pl.DataFrame, {}):
+        table, extra_result = self.to_arrow(**params)
+        return pl.from_arrow(table), extra_result
+
+    def to_arrow(self, **params) -> (pa.Table, {}):
+        return self._table._execute_query_arrow(self.bind(**params))
+
+
 class InfinityThriftQueryBuilder(ABC):
+    prepared_query_type = PreparedQuery
+
     def __init__(self, table):
         self._table = table
         self._columns = None
@@ -94,6 +184,10 @@ class InfinityThriftQueryBuilder(ABC):
         self._offset = None
         self._sort = None
         self._total_hits_count = None
+        self._priority = None
+        # (index in match_exprs, name) of the QueryParam queries, and the unbound ":name" of the filter
+        self._match_params = []
+        self._filter_params = frozenset()
 
     def reset(self):
         self._columns = None
@@ -106,6 +200,12 @@ class InfinityThriftQueryBuilder(ABC):
         self._offset = None
         self._sort = None
         self._total_hits_count = None
+        self._priority = None
+        self._match_params = []
+        self._filter_params = frozenset()
+
+    def _add_match_param(self, param: QueryParam):
+        self._match_params.append((len(self._search.match_exprs), param.name))
 
     def match_dense(
             self,
@@ -127,77 +227,41 @@ class InfinityThriftQueryBuilder(ABC):
                 ErrorCode.INVALID_TOPK_TYPE, f"Invalid topn, type should be embedded, but get {type(topn)}"
             )
 
-        # type casting
-        if isinstance(embedding_data, list):
-            embedding_data = embedding_data
-        elif isinstance(embedding_data, tuple):
-            embedding_data = embedding_data
-        elif isinstance(embedding_data, np.ndarray):
-            embedding_data = embedding_data.tolist()
-        else:
+        if not isinstance(embedding_data, (list, tuple, np.ndarray, QueryParam)):
             raise InfinityException(
                 ErrorCode.INVALID_DATA_TYPE,
                 f"Invalid embedding data, type should be embedded, but get {type(embedding_data)}",
             )
 
-        if embedding_data_type == "bit":
-            if len(embedding_data) % 8 != 0:
-                raise InfinityException(
-                    ErrorCode.INVALID_EMBEDDING_DATA_TYPE,
-                    f"Embeddings with data bit must have dimension of times of 8!"
-                )
-            else:
-                new_embedding_data = []
-                dimesions = int(len(embedding_data) / 8)
-                for i in range(dimesions):
-                    bitunit = 0
-                    for bit_idx in range(8):
-                        if embedding_data[i * 8 + bit_idx] > 0:
-                            bitunit |= (1 << bit_idx)
-                    new_embedding_data.append(bitunit)
-                embedding_data = new_embedding_data
-
-        if embedding_data_type in ["uint8", "int8", "int16", "int32", "int", "int64"]:
-            embedding_data = [int(x) for x in embedding_data]
-
-        if embedding_data_type in ["float", "float32", "double", "float64", "float16", "bfloat16"]:
-            embedding_data = [float(x) for x in embedding_data]
-
-        data = EmbeddingData()
-        elem_type = ElementType.ElementFloat32
         if embedding_data_type == "bit":
             elem_type = ElementType.ElementBit
-            data.u8_array_value = embedding_data
         elif embedding_data_type == "uint8":
             elem_type = ElementType.ElementUInt8
-            data.u8_array_value = embedding_data
         elif embedding_data_type == "int8":
             elem_type = ElementType.ElementInt8
-            data.i8_array_value = embedding_data
         elif embedding_data_type == "int16":
             elem_type = ElementType.ElementInt16
-            data.i16_array_value = embedding_data
         elif embedding_data_type in ["int", "int32"]:
             elem_type = ElementType.ElementInt32
-            data.i32_array_value = embedding_data
         elif embedding_data_type == "int64":
             elem_type = ElementType.ElementInt64
-            data.i64_array_value = embedding_data
         elif embedding_data_type in ["float", "float32"]:
             elem_type = ElementType.ElementFloat32
-            data.f32_array_value = embedding_data
         elif embedding_data_type in ["double", "float64"]:
             elem_type = ElementType.ElementFloat64
-            data.f64_array_value = embedding_data
         elif embedding_data_type == "float16":
             elem_type = ElementType.ElementFloat16
-            data.f16_array_value = embedding_data
         elif embedding_data_type == "bfloat16":
             elem_type = ElementType.ElementBFloat16
-            data.bf16_array_value = embedding_data
         else:
             raise InfinityException(ErrorCode.INVALID_EMBEDDING_DATA_TYPE,
-                                    f"Invalid embedding {embedding_data[0]} type")
+                                    f"Invalid embedding data type {embedding_data_type}")
+        # sent as the raw little endian elements, bits packed 8 per byte
+        if isinstance(embedding_data, QueryParam):
+            self._add_match_param(embedding_data)
+            data = EmbeddingData()
+        else:
+            data = EmbeddingData(bytes_value=embedding_to_bytes(elem_type, np.ravel(embedding_data)))
 
         dist_type = KnnDistanceType.L2
         if distance_type == "l2":
@@ -246,6 +310,10 @@ class InfinityThriftQueryBuilder(ABC):
             self._search.match_exprs = list()
 
         optional_filter = None if opt_params is None else get_search_optional_filter_from_opt_params(opt_params)
+        if isinstance(sparse_data, QueryParam):
+            self._add_match_param(sparse_data)
+            # placeholder query, replaced when the prepared query is bound
+            sparse_data = {0: 0.0}
         match_sparse_expr = make_match_sparse_expr(
             vector_column_name, sparse_data, metric_type, topn, opt_params, optional_filter
         )
@@ -261,6 +329,9 @@ class InfinityThriftQueryBuilder(ABC):
             self._search.match_exprs = list()
         match_expr = MatchExpr()
         match_expr.fields = fields
+        if isinstance(matching_text, QueryParam):
+            self._add_match_param(matching_text)
+            matching_text = ""
         match_expr.matching_text = matching_text
         options_text = f"topn={topn}"
         if extra_options is not None:
@@ -289,6 +360,9 @@ class InfinityThriftQueryBuilder(ABC):
             optional_filter = get_search_optional_filter_from_opt_params(extra_option)
             for k, v in extra_option.items():
                 option_str += f";{k}={v}"
+        if isinstance(query_data, QueryParam):
+            self._add_match_param(query_data)
+            query_data = []
         match_tensor_expr = make_match_tensor_expr(
             vector_column_name=column_name,
             embedding_data=query_data,
@@ -325,8 +399,14 @@ class InfinityThriftQueryBuilder(ABC):
         self._search.fusion_exprs.append(fusion_expr)
         return self
 
-    def filter(self, where: Optional[str]) -> InfinityThriftQueryBuilder:
-        where_expr = traverse_conditions(condition(where))
+    def filter(self, where: Optional[str], params: Optional[dict[str, Any]] = None) -> InfinityThriftQueryBuilder:
+        where_expr, param_names = compile_filter(where)
+        if param_names and not params:
+            # bound by the prepared query
+            self._filter_params = param_names
+        else:
+            self._filter_params = frozenset()
+            where_expr = get_filter_expr(where, params)
         self._filter = where_expr
         return self
 
@@ -349,14 +429,14 @@ class InfinityThriftQueryBuilder(ABC):
         if isinstance(columns, list):
             for column in columns:
                 column = column.lower()
-                group_by_list.append(parse_expr(maybe_parse(column)))
+                group_by_list.append(parse_expr_str(column))
         else:
-            group_by_list.append(parse_expr(maybe_parse(columns)))
+            group_by_list.append(parse_expr_str(columns))
         self._groupby = group_by_list
         return self
     
     def having(self, having: Optional[str]) -> InfinityThriftQueryBuilder:
-        having_expr = traverse_conditions(condition(having))
+        having_expr = get_filter_expr(having)
         self._having = having_expr
         return self
 
@@ -419,7 +499,7 @@ class InfinityThriftQueryBuilder(ABC):
                     parsed_expr = ParsedExpr(type=expr_type)
                     select_list.append(parsed_expr)
                 case _:
-                    select_list.append(parse_expr(maybe_parse(column)))
+                    select_list.append(parse_expr_str(column))
 
         self._columns = select_list
         return self
@@ -429,7 +509,7 @@ class InfinityThriftQueryBuilder(ABC):
         for column in columns:
             if isinstance(column, str):
                 column = column.lower()
-            highlight_list.append(parse_expr(maybe_parse(column)))
+            highlight_list.append(parse_expr_str(column))
 
         self._highlight = highlight_list
         return self
@@ -438,6 +518,12 @@ class InfinityThriftQueryBuilder(ABC):
         if 'total_hits_count' in option_kv:
             if isinstance(option_kv['total_hits_count'], bool):
                 self._total_hits_count = option_kv['total_hits_count']
+        if 'priority' in option_kv:
+            priority = option_kv['priority']
+            if not isinstance(priority, str) or priority.lower() not in QUERY_PRIORITIES:
+                raise InfinityException(ErrorCode.INVALID_QUERY_OPTION,
+                                        f"Unknown priority: {priority}, expect one of {', '.join(QUERY_PRIORITIES)}")
+            self._priority = priority.lower()
         return self
 
     def sort(self, order_by_expr_list: Optional[List[list[str, SortType]]]) -> InfinityThriftQueryBuilder:
@@ -520,7 +606,7 @@ class InfinityThriftQueryBuilder(ABC):
                     order_by_expr = OrderByExpr(expr=parsed_expr, asc=order_by_flag)
                     sort_list.append(order_by_expr)
                 case _:
-                    parsed_expr = parse_expr(maybe_parse(order_by_expr_str))
+                    parsed_expr = parse_expr_str(order_by_expr_str)
                     order_by_flag: bool = order_by_expr[1] == SortType.Asc
                     sort_list.append(OrderByExpr(expr=parsed_expr, asc=order_by_flag))
 
@@ -538,11 +624,19 @@ class InfinityThriftQueryBuilder(ABC):
             offset=self._offset,
             sort=self._sort,
             total_hits_count=self._total_hits_count,
+            priority=self._priority,
         )
         return self._table._to_string(query)
 
-    def to_result(self) -> tuple[dict[str, list[Any]], dict[str, Any], {}]:
-        query = Query(
+    def _check_params(self):
+        if self._match_params or self._filter_params:
+            names = sorted({name for _, name in self._match_params} | self._filter_params)
+            raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                                    f"Query parameters {names} are not bound, use prepare() to run a query with parameters")
+
+    def _build_query(self) -> Query:
+        self._check_params()
+        return Query(
             columns=self._columns,
             highlight=self._highlight,
             search=self._search,
@@ -553,28 +647,79 @@ class InfinityThriftQueryBuilder(ABC):
             offset=self._offset,
             sort=self._sort,
             total_hits_count=self._total_hits_count,
+            priority=self._priority,
         )
+
+    def to_result(self, to_numpy: bool = False, sparse_format: str = "dict", profile: bool = False) -> \
+            tuple[dict[str, list[Any]], dict[str, Any], {}]:
+        # sparse_format: "dict", "csr" (needs scipy) or "arrow"
+        # profile: also return the per-operator profile of the query as extra_result["profile"], see profile_to_polars
+        check_sparse_format(sparse_format)
+        query = self._build_query()
+        query.profile = profile
         self.reset()
-        return self._table._execute_query(query)
+        return self._table._execute_query(query, to_numpy, sparse_format)
 
     def to_df(self) -> (pd.DataFrame, {}):
+        data_dict, data_type_dict, extra_result = self.to_result(to_numpy=True)
+        return self._result_to_df(data_dict, data_type_dict), extra_result
+
+    @staticmethod
+    def _result_to_df(data_dict: dict[str, Any], data_type_dict: dict[str, Any]) -> pd.DataFrame:
         df_dict = {}
-        data_dict, data_type_dict, extra_result = self.to_result()
         for k, v in data_dict.items():
+            if isinstance(v, np.ndarray) and v.ndim > 1:
+                # embedding cells stay python lists in the dataframe
+                v = v.tolist()
             data_series = pd.Series(v, dtype=logic_type_to_dtype(data_type_dict[k]))
             df_dict[k] = data_series
-        return pd.DataFrame(df_dict), extra_result
+        return pd.DataFrame(df_dict)
 
     def to_pl(self) -> (pl.DataFrame, {}):
-        dataframe, extra_result = self.to_df()
-        return pl.from_pandas(dataframe), extra_result
+        table, extra_result = self.to_arrow()
+        return pl.from_arrow(table), extra_result
 
-    def to_arrow(self) -> (Table, {}):
-        dataframe, extra_result = self.to_df()
-        return pa.Table.from_pandas(dataframe), extra_result
+    def to_arrow(self) -> (pa.Table, {}):
+        query = self._build_query()
+        self.reset()
+        return self._table._execute_query_arrow(query)
+
+    def iter_batches(self, batch_rows: int = 8192, to_numpy: bool = False):
+        # yields pyarrow RecordBatches, or dicts of numpy columns with to_numpy, of at most batch_rows rows
+        if batch_rows <= 0:
+            raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                                    f"batch_rows should be greater than 0, got {batch_rows}")
+        query = self._build_query()
+        self.reset()
+        return self._table._execute_query_batches(query, batch_rows, to_numpy)
 
     def explain(self, explain_type=ExplainType.Physical) -> Any:
-        query = ExplainQuery(
+        if explain_type is ExplainType.Analyze:
+            # run the query and return its per-operator profile instead of the rendered text
+            _, _, extra_result = self.to_result(profile=True)
+            return extra_result["profile"]
+        return self._table._explain_query(self._build_explain_query(explain_type))
+
+    def prepare(self) -> PreparedQuery:
+        prepared_query = self.prepared_query_type(self._table, Query(
+            columns=self._columns,
+            highlight=self._highlight,
+            search=self._search,
+            filter=self._filter,
+            groupby=self._groupby,
+            having=self._having,
+            limit=self._limit,
+            offset=self._offset,
+            sort=self._sort,
+            total_hits_count=self._total_hits_count,
+            priority=self._priority,
+        ), self._match_params, self._filter_params)
+        self.reset()
+        return prepared_query
+
+    def _build_explain_query(self, explain_type: ExplainType) -> ExplainQuery:
+        self._check_params()
+        return ExplainQuery(
             columns=self._columns,
             highlight=self._highlight,
             search=self._search,
@@ -586,4 +731,3 @@ class InfinityThriftQueryBuilder(ABC):
             sort=self._sort,
             explain_type=explain_type,
         )
-        return self._table._explain_query(query)
@@ -17,27 +17,34 @@ import functools
 import inspect
 from typing import Optional, Union, List, Any
 
-from sqlglot import condition
+import numpy as np
 
 import infinity.remote_thrift.infinity_thrift_rpc.ttypes as ttypes
-from infinity.common import INSERT_DATA, VEC, InfinityException, SparseVector
+from infinity.common import INSERT_DATA, VEC, InfinityException, SparseVector, QueryParam, QUERY_PRIORITIES
 from infinity.errors import ErrorCode
 from infinity.index import IndexInfo
-from infinity.remote_thrift.query_builder import Query, InfinityThriftQueryBuilder, ExplainQuery
-from infinity.remote_thrift.types import build_result
+from infinity.bulk_writer import BulkWriter
+from infinity.remote_thrift.client import ThriftInfinityClient
+from infinity.remote_thrift.query_builder import Query, InfinityThriftQueryBuilder, ExplainQuery, PreparedQuery
+from infinity.remote_thrift.types import build_result, build_arrow_result
 from infinity.remote_thrift.utils import (
-    traverse_conditions,
     name_validity_check,
     select_res_to_polars,
     check_valid_name,
     get_remote_constant_expr_from_python_value,
+    get_remote_column_field_from_column_data,
+    get_embedding_batch_data,
+    get_filter_expr,
+    get_knn_distance_type,
     get_ordinary_info,
     parsed_expression_to_string,
     search_to_string
 )
 from infinity.table import ExplainType
 from infinity.common import ConflictType, DEFAULT_MATCH_VECTOR_TOPN, SortType
-from infinity.utils import deprecated_api
+from infinity.utils import deprecated_api, LazyModule
+
+pa = LazyModule("pyarrow")
 
 
 class RemoteTable():
@@ -179,8 +186,14 @@ class RemoteTable():
 
     def insert(self, data: Union[INSERT_DATA, list[INSERT_DATA]]):
         # [{"c1": 1, "c2": 1.1}, {"c1": 2, "c2": 2.2}]
-        db_name = self._db_name
-        table_name = self._table_name
+        res = self._conn.insert(db_name=self._db_name, table_name=self._table_name, fields=self._get_insert_fields(data))
+        if res.error_code == ErrorCode.OK:
+            return res
+        else:
+            raise InfinityException(res.error_code, res.error_msg)
+
+    @staticmethod
+    def _get_insert_fields(data: Union[INSERT_DATA, list[INSERT_DATA]]) -> list[ttypes.Field]:
         fields: list[ttypes.Field] = []
 
         if isinstance(data, dict):
@@ -198,14 +211,56 @@ class RemoteTable():
 
             field = ttypes.Field(column_names=column_names, parse_exprs=parse_exprs)
             fields.append(field)
+        return fields
 
-        res = self._conn.insert(db_name=db_name, table_name=table_name, fields=fields)
+    def insert_columns(self, data: dict[str, Union[np.ndarray, "pa.Array", "pa.ChunkedArray", list]]):
+        # {"c1": np.array([1, 2]), "c2": np.array([[1.1, 1.2], [2.1, 2.2]])}
+        res = self._conn.insert(db_name=self._db_name, table_name=self._table_name,
+                                column_fields=self._get_insert_column_fields(data))
         if res.error_code == ErrorCode.OK:
             return res
         else:
             raise InfinityException(res.error_code, res.error_msg)
 
+    @staticmethod
+    def _get_insert_column_fields(data: dict[str, Union[np.ndarray, "pa.Array", "pa.ChunkedArray", list]]) -> list[
+        ttypes.ColumnField]:
+        if not data:
+            raise InfinityException(ErrorCode.INSERT_WITHOUT_VALUES, "Insert without values")
+        return [get_remote_column_field_from_column_data(column_name, column_data)
+                for column_name, column_data in data.items()]
+
+    def insert_arrow(self, data: "pa.Table"):
+        return self.insert_columns(dict(zip(data.column_names, data.columns)))
+
+    def bulk_loader(self, batch_size: int = 1024, max_in_flight: int = 8, workers: int = 4):
+        # every worker inserts over its own connection
+        def open_table():
+            return RemoteTable(ThriftInfinityClient(self._conn.uri, logger=self._conn.logger,
+                                                    result_cache=self._conn.result_cache,
+                                                    protocol=self._conn.protocol_name,
+                                                    transport=self._conn.transport_name,
+                                                    accelerate=self._conn.accelerate),
+                               self._db_name, self._table_name)
+
+        def close_table(table):
+            table._conn.disconnect()
+
+        return BulkWriter(open_table, close_table, batch_size=batch_size, max_in_flight=max_in_flight,
+                          workers=workers)
+
     def import_data(self, file_path: str, import_options: {} = None):
+        res = self._conn.import_data(db_name=self._db_name,
+                                     table_name=self._table_name,
+                                     file_name=file_path,
+                                     import_options=self._get_import_options(import_options))
+        if res.error_code == ErrorCode.OK:
+            return res
+        else:
+            raise InfinityException(res.error_code, res.error_msg)
+
+    @staticmethod
+    def _get_import_options(import_options: {} = None) -> ttypes.ImportOption:
         options = ttypes.ImportOption()
         options.has_header = False
         options.delimiter = ','
@@ -227,6 +282,8 @@ class RemoteTable():
                         options.copy_file_type = ttypes.CopyFileType.CSR
                     elif file_type == 'bvecs':
                         options.copy_file_type = ttypes.CopyFileType.BVECS
+                    elif file_type == 'parquet':
+                        options.copy_file_type = ttypes.CopyFileType.PARQUET
                     else:
                         raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR,
                                                 f"Unrecognized import file type: {file_type}")
@@ -244,17 +301,21 @@ class RemoteTable():
                                                 "Boolean value is expected in header field")
                 else:
                     raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR, f"Unknown import parameter: {k}")
+        return options
 
-        res = self._conn.import_data(db_name=self._db_name,
+    def export_data(self, file_path: str, export_options: {} = None, columns: [str] = None):
+        res = self._conn.export_data(db_name=self._db_name,
                                      table_name=self._table_name,
                                      file_name=file_path,
-                                     import_options=options)
+                                     export_options=self._get_export_options(export_options),
+                                     columns=columns)
         if res.error_code == ErrorCode.OK:
             return res
         else:
             raise InfinityException(res.error_code, res.error_msg)
 
-    def export_data(self, file_path: str, export_options: {} = None, columns: [str] = None):
+    @staticmethod
+    def _get_export_options(export_options: {} = None) -> ttypes.ExportOption:
         options = ttypes.ExportOption()
         options.has_header = False
         options.delimiter = ','
@@ -274,6 +335,8 @@ class RemoteTable():
                         options.copy_file_type = ttypes.CopyFileType.JSONL
                     elif file_type == 'fvecs':
                         options.copy_file_type = ttypes.CopyFileType.FVECS
+                    elif file_type == 'parquet':
+                        options.copy_file_type = ttypes.CopyFileType.PARQUET
                     else:
                         raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR,
                                                 f"Unrecognized export file type: {file_type}")
@@ -309,23 +372,14 @@ class RemoteTable():
                                                 "Integer value is expected in 'row_limit' field")
                 else:
                     raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR, f"Unknown export parameter: {k}")
+        return options
 
-        res = self._conn.export_data(db_name=self._db_name,
-                                     table_name=self._table_name,
-                                     file_name=file_path,
-                                     export_options=options,
-                                     columns=columns)
-        if res.error_code == ErrorCode.OK:
-            return res
-        else:
-            raise InfinityException(res.error_code, res.error_msg)
-
-    def delete(self, cond: Optional[str] = None):
+    def delete(self, cond: Optional[str] = None, **params):
         match cond:
             case None:
                 where_expr = None
             case _:
-                where_expr = traverse_conditions(condition(cond))
+                where_expr = get_filter_expr(cond, params)
         res = self._conn.delete(
             db_name=self._db_name, table_name=self._table_name, where_expr=where_expr)
         if res.error_code == ErrorCode.OK:
@@ -333,9 +387,18 @@ class RemoteTable():
         else:
             raise InfinityException(res.error_code, res.error_msg)
 
-    def update(self, cond: str, data: dict[str, Any]):
+    def update(self, cond: str, data: dict[str, Any], **params):
         # {"c1": 1, "c2": 1.1}
-        where_expr = traverse_conditions(condition(cond))
+        res = self._conn.update(db_name=self._db_name, table_name=self._table_name,
+                                where_expr=get_filter_expr(cond, params),
+                                update_expr_array=self._get_update_exprs(data))
+        if res.error_code == ErrorCode.OK:
+            return res
+        else:
+            raise InfinityException(res.error_code, res.error_msg)
+
+    @staticmethod
+    def _get_update_exprs(data: dict[str, Any]) -> list[ttypes.UpdateExpr]:
         update_expr_array: list[ttypes.UpdateExpr] = []
         for column_name, value in data.items():
             constant_expression = get_remote_constant_expr_from_python_value(value)
@@ -343,12 +406,7 @@ class RemoteTable():
             paser_expr = ttypes.ParsedExpr(type=expr_type)
             update_expr = ttypes.UpdateExpr(column_name=column_name, value=paser_expr)
             update_expr_array.append(update_expr)
-        res = self._conn.update(db_name=self._db_name, table_name=self._table_name, where_expr=where_expr,
-                                update_expr_array=update_expr_array)
-        if res.error_code == ErrorCode.OK:
-            return res
-        else:
-            raise InfinityException(res.error_code, res.error_msg)
+        return update_expr_array
 
     def match_dense(self, vector_column_name: str, embedding_data: VEC, embedding_data_type: str, distance_type: str,
                     topn: int = DEFAULT_MATCH_VECTOR_TOPN, knn_params: {} = None):
@@ -361,7 +419,7 @@ class RemoteTable():
         return self.match_dense(*args, **kwargs)
 
     @params_type_check
-    def match_text(self, fields: str, matching_text: str, topn: int, extra_options: Optional[dict] = None):
+    def match_text(self, fields: str, matching_text: str | QueryParam, topn: int, extra_options: Optional[dict] = None):
         self.query_builder.match_text(fields, matching_text, topn, extra_options)
         return self
 
@@ -370,7 +428,7 @@ class RemoteTable():
         return self.match_text(*args, **kwargs)
 
     @params_type_check
-    def match_tensor(self, column_name: str, query_data: VEC, query_data_type: str, topn: int,
+    def match_tensor(self, column_name: str, query_data: VEC | QueryParam, query_data_type: str, topn: int,
                      extra_option: Optional[dict] = None):
         self.query_builder.match_tensor(column_name, query_data, query_data_type, topn, extra_option)
         return self
@@ -393,8 +451,9 @@ class RemoteTable():
         self.query_builder.highlight(columns)
         return self
 
-    def filter(self, filter: Optional[str]):
-        self.query_builder.filter(filter)
+    def filter(self, filter: Optional[str], **params):
+        # filter("price < :p", p=10), the parsed filter is cached and only the parameters change
+        self.query_builder.filter(filter, params)
         return self
 
     def limit(self, limit: Optional[int]):
@@ -433,8 +492,8 @@ class RemoteTable():
     def to_string(self):
         return self.query_builder.to_string()
 
-    def to_result(self):
-        return self.query_builder.to_result()
+    def to_result(self, to_numpy: bool = False, sparse_format: str = "dict", profile: bool = False):
+        return self.query_builder.to_result(to_numpy, sparse_format, profile)
 
     def to_df(self):
         return self.query_builder.to_df()
@@ -445,9 +504,64 @@ class RemoteTable():
     def to_arrow(self):
         return self.query_builder.to_arrow()
 
+    def iter_batches(self, batch_rows: int = 8192, to_numpy: bool = False):
+        return self.query_builder.iter_batches(batch_rows, to_numpy)
+
     def explain(self, explain_type: ExplainType = ExplainType.Physical):
         return self.query_builder.explain(explain_type)
 
+    def prepare(self) -> PreparedQuery:
+        # table.match_dense("vec", QueryParam("q"), ...).filter("c1 > :lo").prepare().to_result(q=..., lo=...)
+        return self.query_builder.prepare()
+
+    def match_dense_batch(self, vector_column_name: str, embedding_data, embedding_data_type: str, distance_type: str,
+                          topn: int = DEFAULT_MATCH_VECTOR_TOPN, knn_params: {} = None, filter: Optional[str] = None,
+                          priority: Optional[str] = None):
+        """
+        Run one knn search per row of embedding_data in a single request.
+        Returns (row_ids, distances), both shaped (query_count, topn) and padded with -1 / nan.
+        priority is the scheduling class of the queries, as option({"priority": ...}) of a select.
+        """
+        res = self._conn.match_dense_batch(**self._get_match_dense_batch_args(
+            vector_column_name, embedding_data, embedding_data_type, distance_type, topn, knn_params, filter, priority))
+        if res.error_code == ErrorCode.OK:
+            return self._get_match_dense_batch_result(res)
+        else:
+            raise InfinityException(res.error_code, res.error_msg)
+
+    def _get_match_dense_batch_args(self, vector_column_name: str, embedding_data, embedding_data_type: str,
+                                    distance_type: str, topn: int, knn_params: {} = None,
+                                    filter: Optional[str] = None, priority: Optional[str] = None) -> dict[str, Any]:
+        if priority is not None:
+            if not isinstance(priority, str) or priority.lower() not in QUERY_PRIORITIES:
+                raise InfinityException(ErrorCode.INVALID_QUERY_OPTION,
+                                        f"Unknown priority: {priority}, expect one of {', '.join(QUERY_PRIORITIES)}")
+            priority = priority.lower()
+        element_type, query_count, dimension, query_data = get_embedding_batch_data(embedding_data,
+                                                                                    embedding_data_type)
+        opt_params = []
+        if knn_params is not None:
+            opt_params = [ttypes.InitParameter(k.lower(), v.lower()) for k, v in knn_params.items()]
+        return dict(db_name=self._db_name,
+                    table_name=self._table_name,
+                    column_name=vector_column_name,
+                    element_type=element_type,
+                    distance_type=get_knn_distance_type(distance_type),
+                    dimension=dimension,
+                    query_count=query_count,
+                    query_data=query_data,
+                    topn=topn,
+                    opt_params=opt_params,
+                    where_expr=get_filter_expr(filter) if filter is not None else None,
+                    priority=priority)
+
+    @staticmethod
+    def _get_match_dense_batch_result(res: ttypes.MatchDenseBatchResponse) -> tuple[np.ndarray, np.ndarray]:
+        shape = (res.query_count, res.topn)
+        row_ids = np.frombuffer(res.row_ids, dtype='<i8').reshape(shape)
+        distances = np.frombuffer(res.distances, dtype='<f4').reshape(shape)
+        return row_ids, distances
+
     def optimize(self, index_name: str, opt_params: dict[str, str]):
         opt_options = ttypes.OptimizeOptions()
         opt_options.index_name = index_name
@@ -508,9 +622,7 @@ class RemoteTable():
 
         return json.dumps(res)
 
-    def _execute_query(self, query: Query) -> tuple[dict[str, list[Any]], dict[str, Any]]:
-
-        # execute the query
+    def _select(self, query: Query, batch_rows: int = None) -> ttypes.SelectResponse:
         res = self._conn.select(db_name=self._db_name,
                                 table_name=self._table_name,
                                 select_list=query.columns,
@@ -522,14 +634,47 @@ class RemoteTable():
                                 limit_expr=query.limit,
                                 offset_expr=query.offset,
                                 order_by_list=query.sort,
-                                total_hits_count=query.total_hits_count)
-
-        # process the results
+                                total_hits_count=query.total_hits_count,
+                                batch_rows=batch_rows,
+                                priority=query.priority,
+                                profile=query.profile or None)
         if res.error_code == ErrorCode.OK:
-            return build_result(res)
+            return res
         else:
             raise InfinityException(res.error_code, res.error_msg)
 
+    def _execute_query(self, query: Query, to_numpy: bool = False, sparse_format: str = "dict") -> \
+            tuple[dict[str, list[Any]], dict[str, Any]]:
+        return build_result(self._select(query), to_numpy, sparse_format)
+
+    def _execute_query_batches(self, query: Query, batch_rows: int, to_numpy: bool = False):
+        # the server keeps the result under a cursor and sends it batch_rows rows at a time, so only one batch is
+        # held here whatever the size of the result. A result over the server's cursor memory limit per session fails.
+        res = self._select(query, batch_rows)
+        try:
+            while True:
+                if to_numpy:
+                    data_dict, _, _ = build_result(res, to_numpy=True)
+                    row_count = len(next(iter(data_dict.values()), ()))
+                    for offset in range(0, row_count, batch_rows):
+                        yield {name: column[offset:offset + batch_rows] for name, column in data_dict.items()}
+                else:
+                    table, _ = build_arrow_result(res)
+                    yield from table.to_batches(max_chunksize=batch_rows)
+                if not res.cursor_id:
+                    return
+                cursor_id, res = res.cursor_id, None
+                res = self._conn.fetch_cursor(cursor_id)
+                if res.error_code != ErrorCode.OK:
+                    raise InfinityException(res.error_code, res.error_msg)
+        finally:
+            # the generator was closed early, release the rest of the result on the server
+            if res is not None and res.cursor_id:
+                self._conn.fetch_cursor(res.cursor_id, close=True)
+
+    def _execute_query_arrow(self, query: Query) -> tuple["pa.Table", Any]:
+        return build_arrow_result(self._select(query))
+
     def _explain_query(self, query: ExplainQuery) -> Any:
         res = self._conn.explain(db_name=self._db_name,
                                  table_name=self._table_name,
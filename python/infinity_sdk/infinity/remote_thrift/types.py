@@ -12,21 +12,31 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 import struct
 import json
 import numpy as np
 from infinity.common import VEC, SparseVector, InfinityException
 from infinity.remote_thrift.infinity_thrift_rpc.ttypes import *
 from collections import defaultdict
+from itertools import islice
 from typing import Any, Optional
 from datetime import date, time, datetime, timedelta
 
-import polars as pl
 from numpy import dtype
 from infinity.errors import ErrorCode
+from infinity.utils import LazyModule
 
 import infinity.remote_thrift.infinity_thrift_rpc.ttypes as ttypes
 
+pa = LazyModule("pyarrow")
+pl = LazyModule("polars")
+scipy_sparse = LazyModule("scipy.sparse")
+
+# how to_result returns sparse columns: one {"index": value} dict per row, a scipy csr_matrix or an arrow List<Struct>
+SPARSE_FORMATS = ("dict", "csr", "arrow")
+
 
 def logic_type_to_dtype(ttype: ttypes.DataType):
     match ttype.logic_type:
@@ -76,85 +86,116 @@ def logic_type_to_dtype(ttype: ttypes.DataType):
             raise NotImplementedError(f"Unsupported type {ttype}")
 
 
+def bf16_bytes_to_float32_array(column_vector) -> np.ndarray:
+    tmp_u16 = np.frombuffer(column_vector, dtype='<u2')
+    return (tmp_u16.astype('<u4') << 16).view('<f4')
+
+
 def bf16_bytes_to_float32_list(column_vector):
-    tmp_u16 = np.frombuffer(column_vector, dtype='<i2')
-    result_arr = np.zeros(2 * len(tmp_u16), dtype='<i2')
-    result_arr[1::2] = tmp_u16
-    view_float32 = result_arr.view('<f4')
-    return list(view_float32)
+    return bf16_bytes_to_float32_array(column_vector).tolist()
+
+
+def float32_array_to_bf16_bytes(array) -> bytes:
+    # keep the upper half of the float32, rounded to nearest even
+    bits = np.ascontiguousarray(array, dtype='<f4').view('<u4')
+    return ((bits + 0x7FFF + ((bits >> 16) & 1)) >> 16).astype('<u2').tobytes()
+
+
+# fixed-width column types which are decoded with a single np.frombuffer call
+pod_column_type_to_numpy_dtype = {
+    ttypes.ColumnType.ColumnBool: dtype('?'),
+    ttypes.ColumnType.ColumnInt8: dtype('<i1'),
+    ttypes.ColumnType.ColumnInt16: dtype('<i2'),
+    ttypes.ColumnType.ColumnInt32: dtype('<i4'),
+    ttypes.ColumnType.ColumnInt64: dtype('<i8'),
+    ttypes.ColumnType.ColumnFloat32: dtype('<f4'),
+    ttypes.ColumnType.ColumnFloat64: dtype('<f8'),
+    ttypes.ColumnType.ColumnFloat16: dtype('<f2'),
+    ttypes.ColumnType.ColumnRowID: dtype('<i8'),
+}
+
+embedding_element_type_to_numpy_dtype = {
+    ttypes.ElementType.ElementUInt8: dtype('<u1'),
+    ttypes.ElementType.ElementInt8: dtype('<i1'),
+    ttypes.ElementType.ElementInt16: dtype('<i2'),
+    ttypes.ElementType.ElementInt32: dtype('<i4'),
+    ttypes.ElementType.ElementInt64: dtype('<i8'),
+    ttypes.ElementType.ElementFloat32: dtype('<f4'),
+    ttypes.ElementType.ElementFloat64: dtype('<f8'),
+    ttypes.ElementType.ElementFloat16: dtype('<f2'),
+}
+
+
+def is_numpy_column_type(column_type: ttypes.ColumnType, column_data_type: ttypes.DataType) -> bool:
+    if column_type in pod_column_type_to_numpy_dtype or column_type == ttypes.ColumnType.ColumnBFloat16:
+        return True
+    if column_type == ttypes.ColumnType.ColumnEmbedding:
+        return column_data_type.physical_type.embedding_type.element_type != ttypes.ElementType.ElementBit
+    return False
+
+
+def embedding_bytes_to_ndarray(element_type: ttypes.ElementType, dimension: int, binary_data) -> np.ndarray:
+    if element_type == ttypes.ElementType.ElementBFloat16:
+        flat = bf16_bytes_to_float32_array(binary_data)
+    elif element_type in embedding_element_type_to_numpy_dtype:
+        flat = np.frombuffer(binary_data, dtype=embedding_element_type_to_numpy_dtype[element_type])
+    else:
+        raise NotImplementedError(f"Unsupported type {element_type}")
+    return flat.reshape(-1, dimension)
+
+
+def bit_embedding_bytes_to_list(dimension: int, binary_data) -> list[list[str]]:
+    if dimension % 8 != 0:
+        raise ValueError(f"Unsupported dimension {dimension}")
+    # bit i of an embedding is stored in bit (i % 8) of byte (i // 8)
+    bits = np.unpackbits(np.frombuffer(binary_data, dtype=np.uint8), bitorder='little')
+    chars = (bits + ord('0')).reshape(-1, dimension)
+    return [[row.tobytes().decode('ascii')] for row in chars]
+
+
+def embedding_to_bytes(element_type: ttypes.ElementType, embedding_data) -> bytes:
+    # inverse of embedding_bytes_to_ndarray, rows of a 2-D input are packed one after another
+    if element_type == ttypes.ElementType.ElementBit:
+        bits = np.asarray(embedding_data)
+        if bits.shape[-1] % 8 != 0:
+            raise InfinityException(ErrorCode.INVALID_EMBEDDING_DATA_TYPE,
+                                    f"Embeddings with data bit must have dimension of times of 8!")
+        return np.packbits(bits > 0, axis=-1, bitorder='little').tobytes()
+    if element_type == ttypes.ElementType.ElementBFloat16:
+        return float32_array_to_bf16_bytes(embedding_data)
+    if element_type in embedding_element_type_to_numpy_dtype:
+        # astype wraps out of range integers like the server side casts do
+        return np.asarray(embedding_data).astype(embedding_element_type_to_numpy_dtype[element_type], copy=False).tobytes()
+    raise InfinityException(ErrorCode.INVALID_EMBEDDING_DATA_TYPE, f"Unsupported embedding type {element_type}")
+
+
+def column_vector_to_ndarray(column_type: ttypes.ColumnType, column_data_type: ttypes.DataType,
+                             column_vectors) -> np.ndarray:
+    # Only valid when is_numpy_column_type() holds. Embeddings come back as a (rows, dimension) array.
+    column_vector = b''.join(column_vectors)
+    if column_type in pod_column_type_to_numpy_dtype:
+        return np.frombuffer(column_vector, dtype=pod_column_type_to_numpy_dtype[column_type])
+    match column_type:
+        case ttypes.ColumnType.ColumnBFloat16:
+            return bf16_bytes_to_float32_array(column_vector)
+        case ttypes.ColumnType.ColumnEmbedding:
+            embedding_type = column_data_type.physical_type.embedding_type
+            return embedding_bytes_to_ndarray(embedding_type.element_type, embedding_type.dimension, column_vector)
+        case _:
+            raise NotImplementedError(f"Unsupported type {column_type}")
 
 
 def column_vector_to_list(column_type: ttypes.ColumnType, column_data_type: ttypes.DataType, column_vectors) -> \
         list[Any, ...]:
+    if is_numpy_column_type(column_type, column_data_type):
+        return column_vector_to_ndarray(column_type, column_data_type, column_vectors).tolist()
     column_vector = b''.join(column_vectors)
     match column_type:
-        case ttypes.ColumnType.ColumnInt32:
-            return list(struct.unpack('<{}i'.format(len(column_vector) // 4), column_vector))
-        case ttypes.ColumnType.ColumnInt64:
-            return list(struct.unpack('<{}q'.format(len(column_vector) // 8), column_vector))
-        case ttypes.ColumnType.ColumnFloat32:
-            return list(struct.unpack('<{}f'.format(len(column_vector) // 4), column_vector))
-        case ttypes.ColumnType.ColumnFloat64:
-            return list(struct.unpack('<{}d'.format(len(column_vector) // 8), column_vector))
-        case ttypes.ColumnType.ColumnFloat16:
-            return list(struct.unpack('<{}e'.format(len(column_vector) // 2), column_vector))
-        case ttypes.ColumnType.ColumnBFloat16:
-            return bf16_bytes_to_float32_list(column_vector)
         case ttypes.ColumnType.ColumnVarchar:
             return list(parse_bytes(column_vector))
-        case ttypes.ColumnType.ColumnBool:
-            return list(struct.unpack('<{}?'.format(len(column_vector)), column_vector))
-        case ttypes.ColumnType.ColumnInt8:
-            return list(struct.unpack('<{}b'.format(len(column_vector)), column_vector))
-        case ttypes.ColumnType.ColumnInt16:
-            return list(struct.unpack('<{}h'.format(len(column_vector) // 2), column_vector))
-        case ttypes.ColumnType.ColumnRowID:
-            return list(struct.unpack('<{}q'.format(len(column_vector) // 8), column_vector))
         case ttypes.ColumnType.ColumnEmbedding:
             dimension = column_data_type.physical_type.embedding_type.dimension
-            if column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementUInt8:
-                all_list = list(struct.unpack('<{}B'.format(len(column_vector)), column_vector))
-                return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-            elif column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementInt8:
-                all_list = list(struct.unpack('<{}b'.format(len(column_vector)), column_vector))
-                return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-            elif column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementInt16:
-                all_list = list(struct.unpack('<{}h'.format(len(column_vector) // 2), column_vector))
-                return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-            elif column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementInt32:
-                all_list = list(struct.unpack('<{}i'.format(len(column_vector) // 4), column_vector))
-                return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-            elif column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementInt64:
-                all_list = list(struct.unpack('<{}q'.format(len(column_vector) // 8), column_vector))
-                return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-            elif column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementFloat32:
-                all_list = list(struct.unpack('<{}f'.format(len(column_vector) // 4), column_vector))
-                return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-            elif column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementFloat64:
-                all_list = list(struct.unpack('<{}d'.format(len(column_vector) // 8), column_vector))
-                return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-            elif column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementFloat16:
-                all_list = list(struct.unpack('<{}e'.format(len(column_vector) // 2), column_vector))
-                return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-            elif column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementBFloat16:
-                all_list = bf16_bytes_to_float32_list(column_vector)
-                return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-            elif column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementBit:
-                all_list = list(struct.unpack('<{}B'.format(len(column_vector)), column_vector))
-                result = []
-                if dimension % 8 != 0:
-                    raise ValueError(f"Unsupported dimension {dimension}")
-                sub_dim: int = dimension // 8
-                for i in range(0, len(all_list), sub_dim):
-                    mid_res = all_list[i:i + sub_dim]
-                    mid_res_int: int = 0
-                    for j in reversed(mid_res):
-                        mid_res_int = mid_res_int * 256 + j
-                    result.append([f"\u007b0:0{dimension}b\u007d".format(mid_res_int)[::-1]])
-                return result
-            else:
-                raise NotImplementedError(
-                    f"Unsupported type {column_data_type.physical_type.embedding_type.element_type}")
+            return bit_embedding_bytes_to_list(dimension, column_vector)
         case ttypes.ColumnType.ColumnMultiVector:
             return parse_tensor_bytes(column_data_type, column_vector)
         case ttypes.ColumnType.ColumnTensor:
@@ -333,12 +374,9 @@ def parse_single_array_bytes(column_data_type: ttypes.DataType, bytes_data, offs
 
 
 def parse_bytes(bytes_data):
-    results = []
-    offset = 0
-    while offset < len(bytes_data):
-        string_data, offset = parse_single_str_bytes(None, bytes_data, offset)
-        results.append(string_data)
-    return results
+    starts, lengths = scan_length_prefixed_bytes(bytes_data)
+    ends = (starts + lengths).tolist()
+    return [bytes_data[start:end].decode('utf-8') for start, end in zip(starts.tolist(), ends)]
 
 
 def parse_single_str_bytes(_, bytes_data, offset):
@@ -387,59 +425,16 @@ def parse_single_tensorarray_bytes(column_data_type: ttypes.DataType, bytes_data
 
 def tensor_to_list(column_data_type: ttypes.DataType, binary_data) -> list[list[Any]]:
     dimension = column_data_type.physical_type.embedding_type.dimension
-    if column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementBit:
-        all_list = list(struct.unpack('<{}B'.format(len(binary_data)), binary_data))
-        result = []
-        if dimension % 8 != 0:
-            raise ValueError(f"Unsupported dimension {dimension}")
-        sub_dim: int = dimension // 8
-        for i in range(0, len(all_list), sub_dim):
-            mid_res = all_list[i:i + sub_dim]
-            mid_res_int: int = 0
-            for j in reversed(mid_res):
-                mid_res_int = mid_res_int * 256 + j
-            result.append([f"\u007b0:0{dimension}b\u007d".format(mid_res_int)[::-1]])
-        return result
-    elif column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementUInt8:
-        all_list = list(struct.unpack('<{}B'.format(len(binary_data)), binary_data))
-        return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-    elif column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementInt8:
-        all_list = list(struct.unpack('<{}b'.format(len(binary_data)), binary_data))
-        return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-    elif column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementInt16:
-        all_list = list(struct.unpack('<{}h'.format(len(binary_data) // 2), binary_data))
-        return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-    elif column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementInt32:
-        all_list = list(struct.unpack('<{}i'.format(len(binary_data) // 4), binary_data))
-        return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-    elif column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementInt64:
-        all_list = list(struct.unpack('<{}q'.format(len(binary_data) // 8), binary_data))
-        return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-    elif column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementFloat32:
-        all_list = list(struct.unpack('<{}f'.format(len(binary_data) // 4), binary_data))
-        return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-    elif column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementFloat64:
-        all_list = list(struct.unpack('<{}d'.format(len(binary_data) // 8), binary_data))
-        return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-    elif column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementFloat16:
-        all_list = list(struct.unpack('<{}e'.format(len(binary_data) // 2), binary_data))
-        return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-    elif column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementBFloat16:
-        all_list = bf16_bytes_to_float32_list(binary_data)
-        return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-    else:
-        raise NotImplementedError(
-            f"Unsupported type {column_data_type.physical_type.embedding_type.element_type}")
+    element_type = column_data_type.physical_type.embedding_type.element_type
+    if element_type == ttypes.ElementType.ElementBit:
+        return bit_embedding_bytes_to_list(dimension, binary_data)
+    return embedding_bytes_to_ndarray(element_type, dimension, binary_data).tolist()
 
 
 def parse_sparse_bytes(column_data_type: ttypes.DataType, column_vector):
-    res = []
-    offset = 0
-    # print(len(column_vector))
-    while offset < len(column_vector):
-        sparse_vector, offset = parse_single_sparse_bytes(column_data_type, column_vector, offset)
-        res.append(sparse_vector)
-    return res
+    indptr, indices, values = sparse_bytes_to_csr_arrays(column_data_type, column_vector)
+    entries = zip(map(str, indices.tolist()), values.tolist())
+    return [dict(islice(entries, nnz)) for nnz in np.diff(indptr).tolist()]
 
 
 def parse_single_sparse_bytes(column_data_type: ttypes.DataType, column_vector, offset):
@@ -500,6 +495,148 @@ def parse_single_sparse_bytes(column_data_type: ttypes.DataType, column_vector,
     return SparseVector(list(indices), list(values)).to_dict(), offset
 
 
+def scan_length_prefixed_bytes(bytes_data, item_size: int = 1) -> tuple[np.ndarray, np.ndarray]:
+    # start offset and item count of every payload in a sequence of [u32 count][count * item_size bytes] values.
+    # Every prefix position depends on the previous one, so the loop only collects them and the rest is vectorized.
+    prefixes = []
+    append_prefix = prefixes.append
+    unpack_count = struct.Struct('<I').unpack_from
+    offset = 0
+    total_length = len(bytes_data)
+    while offset < total_length:
+        append_prefix(offset)
+        offset += 4 + unpack_count(bytes_data, offset)[0] * item_size
+    prefixes.append(offset)
+    bounds = np.array(prefixes, dtype=np.int64)
+    starts = bounds[:-1] + 4
+    return starts, (bounds[1:] - starts) // item_size
+
+
+def strip_length_prefixes(bytes_data, starts: np.ndarray) -> np.ndarray:
+    # payloads are laid out back to back, so dropping the 4-byte prefixes leaves them concatenated
+    raw = np.frombuffer(bytes_data, dtype=np.uint8)
+    keep = np.ones(len(raw), dtype=bool)
+    keep[((starts - 4)[:, None] + np.arange(4)).ravel()] = False
+    return raw[keep]
+
+
+def add_length_prefixes(data: np.ndarray, offsets: np.ndarray) -> bytes:
+    # inverse of strip_length_prefixes: prepend every payload with its u32 length
+    lengths = np.diff(offsets)
+    payload_starts = offsets[:-1] - offsets[0] + 4 * np.arange(1, len(lengths) + 1)
+    raw = np.empty(int(offsets[-1] - offsets[0]) + 4 * len(lengths), dtype=np.uint8)
+    prefix_positions = (payload_starts - 4)[:, None] + np.arange(4)
+    raw[prefix_positions.ravel()] = lengths.astype('<u4').view(np.uint8)
+    keep = np.ones(len(raw), dtype=bool)
+    keep[prefix_positions.ravel()] = False
+    raw[keep] = data[offsets[0]:offsets[-1]]
+    return raw.tobytes()
+
+
+def lengths_to_offsets(lengths: np.ndarray) -> np.ndarray:
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets
+
+
+def varchar_bytes_to_arrow(bytes_data) -> pa.Array:
+    starts, lengths = scan_length_prefixed_bytes(bytes_data)
+    offsets = lengths_to_offsets(lengths)
+    data = strip_length_prefixes(bytes_data, starts)
+    if offsets[-1] < 2 ** 31:
+        arrow_type = pa.string()
+        offsets = offsets.astype(np.int32)
+    else:
+        arrow_type = pa.large_string()
+    return pa.Array.from_buffers(arrow_type, len(lengths), [None, pa.py_buffer(offsets), pa.py_buffer(data)])
+
+
+def sparse_bytes_to_csr_arrays(column_data_type: ttypes.DataType, bytes_data) -> \
+        tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # indptr, indices and values of a sparse column whose rows are [u32 nnz][nnz indices][nnz values]
+    sparse_type = column_data_type.physical_type.sparse_type
+    if sparse_type.index_type not in embedding_element_type_to_numpy_dtype:
+        raise NotImplementedError(f"Unsupported type {sparse_type.index_type}")
+    index_dtype = embedding_element_type_to_numpy_dtype[sparse_type.index_type]
+    if sparse_type.element_type == ttypes.ElementType.ElementBFloat16:
+        value_size = 2
+    elif sparse_type.element_type in embedding_element_type_to_numpy_dtype:
+        value_size = embedding_element_type_to_numpy_dtype[sparse_type.element_type].itemsize
+    else:
+        raise NotImplementedError(f"Unsupported type {sparse_type.element_type}")
+
+    starts, nnz = scan_length_prefixed_bytes(bytes_data, index_dtype.itemsize + value_size)
+    data = strip_length_prefixes(bytes_data, starts)
+    row_bytes = nnz * (index_dtype.itemsize + value_size)
+    # the first nnz * index_size bytes of every row are its indices
+    position_in_row = np.arange(len(data)) - np.repeat(lengths_to_offsets(row_bytes)[:-1], row_bytes)
+    is_index = position_in_row < np.repeat(nnz * index_dtype.itemsize, row_bytes)
+    indices = data[is_index].view(index_dtype)
+    if sparse_type.element_type == ttypes.ElementType.ElementBFloat16:
+        values = bf16_bytes_to_float32_array(data[~is_index])
+    else:
+        values = data[~is_index].view(embedding_element_type_to_numpy_dtype[sparse_type.element_type])
+    return lengths_to_offsets(nnz), indices, values
+
+
+def sparse_bytes_to_csr(column_data_type: ttypes.DataType, bytes_data) -> scipy_sparse.csr_matrix:
+    indptr, indices, values = sparse_bytes_to_csr_arrays(column_data_type, bytes_data)
+    if values.dtype == np.float16:
+        values = values.astype(np.float32)
+    dimension = column_data_type.physical_type.sparse_type.dimension
+    return scipy_sparse.csr_matrix((values, indices, indptr), shape=(len(indptr) - 1, dimension))
+
+
+def sparse_bytes_to_arrow(column_data_type: ttypes.DataType, bytes_data) -> pa.Array:
+    indptr, indices, values = sparse_bytes_to_csr_arrays(column_data_type, bytes_data)
+    if values.dtype == np.float16:
+        values = values.astype(np.float32)
+    entries = pa.StructArray.from_arrays([pa.array(indices), pa.array(values)], names=["index", "value"])
+    if indptr[-1] < 2 ** 31:
+        return pa.ListArray.from_arrays(pa.array(indptr.astype(np.int32)), entries)
+    return pa.LargeListArray.from_arrays(pa.array(indptr), entries)
+
+
+def embedding_ndarray_to_arrow(embeddings: np.ndarray) -> pa.Array:
+    if embeddings.dtype == np.float16:
+        embeddings = embeddings.astype(np.float32)
+    return pa.FixedSizeListArray.from_arrays(pa.array(embeddings.reshape(-1)), embeddings.shape[1])
+
+
+def tensor_bytes_to_arrow(column_data_type: ttypes.DataType, bytes_data) -> pa.Array:
+    embedding_type = column_data_type.physical_type.embedding_type
+    if embedding_type.element_type == ttypes.ElementType.ElementBit:
+        return pa.array(parse_tensor_bytes(column_data_type, bytes_data))
+    starts, lengths = scan_length_prefixed_bytes(bytes_data)
+    data = strip_length_prefixes(bytes_data, starts)
+    embeddings = embedding_bytes_to_ndarray(embedding_type.element_type, embedding_type.dimension, data)
+    # list offsets count embeddings, not bytes
+    bytes_per_embedding = len(data) // len(embeddings) if len(embeddings) > 0 else 1
+    offsets = (lengths_to_offsets(lengths) // bytes_per_embedding).astype(np.int32)
+    return pa.ListArray.from_arrays(pa.array(offsets), embedding_ndarray_to_arrow(embeddings))
+
+
+def column_vector_to_arrow(column_type: ttypes.ColumnType, column_data_type: ttypes.DataType,
+                           column_vectors) -> pa.Array:
+    if is_numpy_column_type(column_type, column_data_type):
+        array = column_vector_to_ndarray(column_type, column_data_type, column_vectors)
+        if array.ndim > 1:
+            return embedding_ndarray_to_arrow(array)
+        if array.dtype == np.float16:
+            array = array.astype(np.float32)
+        return pa.array(array)
+    column_vector = b''.join(column_vectors)
+    match column_type:
+        case ttypes.ColumnType.ColumnVarchar:
+            return varchar_bytes_to_arrow(column_vector)
+        case ttypes.ColumnType.ColumnMultiVector | ttypes.ColumnType.ColumnTensor:
+            return tensor_bytes_to_arrow(column_data_type, column_vector)
+        case ttypes.ColumnType.ColumnSparse:
+            return sparse_bytes_to_arrow(column_data_type, column_vector)
+        case _:
+            return pa.array(column_vector_to_list(column_type, column_data_type, [column_vector]))
+
+
 def find_data_type(column_name: str, column_defs: list[ttypes.ColumnDef]) -> ttypes.DataType:
     for column_def in column_defs:
         if column_def.name == column_name:
@@ -507,34 +644,101 @@ def find_data_type(column_name: str, column_defs: list[ttypes.ColumnDef]) -> tty
     raise KeyError(f"column name {column_name} not found in column defs")
 
 
-def build_result(res: ttypes.SelectResponse) -> tuple[dict[str | Any, list[Any, Any]], dict[str | Any, Any], {}]:
-    data_dict = {}
-    data_type_dict = {}
+def get_result_column_names(column_defs: list[ttypes.ColumnDef]) -> list[str]:
+    # duplicated output columns are named c1, c1_2, c1_3, ...
+    column_names = []
     column_counter = defaultdict(int)
-    for column_def, column_field in zip(res.column_defs, res.column_fields):
+    for column_def in column_defs:
         original_column_name = column_def.name
         column_counter[original_column_name] += 1
         column_name = f"{original_column_name}_{column_counter[original_column_name]}" \
             if column_counter[original_column_name] > 1 \
             else original_column_name
+        column_names.append(column_name)
+    return column_names
+
 
+def get_extra_result(res: ttypes.SelectResponse):
+    extra_result = None
+    # explain responses share this path, they carry neither extra_result nor profile
+    if getattr(res, "extra_result", None) is not None:
+        try:
+            extra_result = json.loads(res.extra_result)
+        except json.JSONDecodeError:
+            pass
+    if getattr(res, "profile", None):
+        extra_result = extra_result or {}
+        extra_result["profile"] = profile_to_polars(res.profile)
+    return extra_result
+
+
+def profile_to_polars(profile: str) -> "pl.DataFrame":
+    # One row per operator per task run, a task runs its operators once for each batch of input.
+    # elapsed_ns is the wall time of the operator in that run, filter_skipped_blocks the blocks (segments for an
+    # index scan) the fast rough filter pruned, index the index searched by a knn scan.
+    schema = {
+        "fragment_id": pl.UInt64,
+        "task_id": pl.Int64,
+        "run": pl.UInt64,
+        "operator": pl.String,
+        "input_rows": pl.UInt64,
+        "output_rows": pl.UInt64,
+        "output_data_size": pl.UInt64,
+        "elapsed_ns": pl.Int64,
+        "filter_skipped_blocks": pl.UInt64,
+        "index": pl.String,
+    }
+    rows = []
+    for fragment in json.loads(profile).get("fragments", []):
+        for task in fragment.get("tasks", []):
+            for run in task.get("operators", []):
+                for info in run.get("infos", []):
+                    rows.append((fragment["fragment_id"], task["task_id"], run["times"], info["name"],
+                                 info["input_rows"], info["output_rows"], info["output_data_size"], info["elapsed"],
+                                 info.get("filter_skipped_blocks", 0), info.get("index") or None))
+    return pl.DataFrame(rows, schema=schema, orient="row")
+
+
+def check_sparse_format(sparse_format: str):
+    if sparse_format not in SPARSE_FORMATS:
+        raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                                f"sparse_format should be one of {', '.join(SPARSE_FORMATS)}, got {sparse_format}")
+
+
+def build_result(res: ttypes.SelectResponse, to_numpy: bool = False, sparse_format: str = "dict") -> \
+        tuple[dict[str | Any, list[Any, Any]], dict[str | Any, Any], {}]:
+    # to_numpy: keep fixed-width columns (including non-bit embeddings) as numpy arrays instead of python lists
+    # sparse_format: see SPARSE_FORMATS
+    data_dict = {}
+    data_type_dict = {}
+    column_names = get_result_column_names(res.column_defs)
+    for column_name, column_def, column_field in zip(column_names, res.column_defs, res.column_fields):
         column_type = column_field.column_type
         column_data_type = column_def.data_type
         column_vectors = column_field.column_vectors
 
-        data_list = column_vector_to_list(column_type, column_data_type, column_vectors)
+        if to_numpy and is_numpy_column_type(column_type, column_data_type):
+            data_list = column_vector_to_ndarray(column_type, column_data_type, column_vectors)
+        elif column_type == ttypes.ColumnType.ColumnSparse and sparse_format == "csr":
+            data_list = sparse_bytes_to_csr(column_data_type, b''.join(column_vectors))
+        elif column_type == ttypes.ColumnType.ColumnSparse and sparse_format == "arrow":
+            data_list = sparse_bytes_to_arrow(column_data_type, b''.join(column_vectors))
+        else:
+            data_list = column_vector_to_list(column_type, column_data_type, column_vectors)
         # data_series = pd.Series(data_list, dtype=logic_type_to_dtype(column_data_type))
         data_dict[column_name] = data_list
         data_type_dict[column_name] = column_data_type
 
-    extra_result = None
-    if res.extra_result is not None:
-        try:
-            extra_result = json.loads(res.extra_result)
-        except json.JSONDecodeError:
-            pass
+    return data_dict, data_type_dict, get_extra_result(res)
 
-    return data_dict, data_type_dict, extra_result
+
+def build_arrow_result(res: ttypes.SelectResponse) -> tuple[pa.Table, {}]:
+    column_names = get_result_column_names(res.column_defs)
+    arrays = []
+    for column_def, column_field in zip(res.column_defs, res.column_fields):
+        arrays.append(column_vector_to_arrow(column_field.column_type, column_def.data_type,
+                                             column_field.column_vectors))
+    return pa.Table.from_arrays(arrays, names=column_names), get_extra_result(res)
 
 
 def make_match_tensor_expr(vector_column_name: str, embedding_data: VEC, embedding_data_type: str, method_type: str,
@@ -544,41 +748,31 @@ def make_match_tensor_expr(vector_column_name: str, embedding_data: VEC, embeddi
     match_tensor_expr.search_method = method_type
     match_tensor_expr.extra_options = extra_option
     match_tensor_expr.filter_expr = filter_expr
-    data = EmbeddingData()
     if embedding_data_type == 'bit':
-        raise InfinityException(ErrorCode.INVALID_EMBEDDING_DATA_TYPE, f"Invalid embedding {embedding_data[0]} type")
+        raise InfinityException(ErrorCode.INVALID_EMBEDDING_DATA_TYPE, f"Invalid embedding data type {embedding_data_type}")
     elif embedding_data_type in ['unsigned tinyint', 'uint8', 'u8']:
         elem_type = ElementType.ElementUInt8
-        data.u8_array_value = np.asarray(embedding_data, dtype=np.uint8).flatten()
     elif embedding_data_type in ['tinyint', 'int8', 'i8']:
         elem_type = ElementType.ElementInt8
-        data.i8_array_value = np.asarray(embedding_data, dtype=np.int8).flatten()
     elif embedding_data_type in ['smallint', 'int16', 'i16']:
         elem_type = ElementType.ElementInt16
-        data.i16_array_value = np.asarray(embedding_data, dtype=np.int16).flatten()
     elif embedding_data_type in ['int', 'int32', 'i32']:
         elem_type = ElementType.ElementInt32
-        data.i32_array_value = np.asarray(embedding_data, dtype=np.int32).flatten()
     elif embedding_data_type in ['bigint', 'int64', 'i64']:
         elem_type = ElementType.ElementInt64
-        data.i64_array_value = np.asarray(embedding_data, dtype=np.int64).flatten()
     elif embedding_data_type in ['float', 'float32', 'f32']:
         elem_type = ElementType.ElementFloat32
-        data.f32_array_value = np.asarray(embedding_data, dtype=np.float32).flatten()
     elif embedding_data_type in ['double', 'float64', 'f64']:
         elem_type = ElementType.ElementFloat64
-        data.f64_array_value = np.asarray(embedding_data, dtype=np.float64).flatten()
     elif embedding_data_type in ['float16', 'fp16', 'f16']:
         elem_type = ElementType.ElementFloat16
-        data.f16_array_value = np.asarray(embedding_data, dtype=np.float16).flatten()
     elif embedding_data_type in ['bfloat16', 'bf16']:
         elem_type = ElementType.ElementBFloat16
-        data.bf16_array_value = np.asarray(embedding_data, dtype=np.float32).flatten()
     else:
-        raise InfinityException(ErrorCode.INVALID_EMBEDDING_DATA_TYPE, f"Invalid embedding {embedding_data[0]} type")
+        raise InfinityException(ErrorCode.INVALID_EMBEDDING_DATA_TYPE, f"Invalid embedding data type {embedding_data_type}")
 
     match_tensor_expr.embedding_data_type = elem_type
-    match_tensor_expr.embedding_data = data
+    match_tensor_expr.embedding_data = EmbeddingData(bytes_value=embedding_to_bytes(elem_type, embedding_data))
     return match_tensor_expr
 
 
@@ -586,8 +780,31 @@ def make_match_sparse_expr(vector_column_name: str, sparse_data: SparseVector |
                            opt_params: Optional[dict] = None, filter_expr: Optional[ParsedExpr] = None):
     column_expr = ColumnExpr(column_name=[vector_column_name], star=False)
 
+    query_sparse_expr = make_sparse_constant_expr(sparse_data)
+
+    match_sparse_options = []
+    if opt_params is not None:
+        for k, v in opt_params.items():
+            match_sparse_options.append(InitParameter(param_name=k, param_value=v))
+
+    match_sparse_expr = MatchSparseExpr(column_expr=column_expr, query_sparse_expr=query_sparse_expr,
+                                        metric_type=metric_type,
+                                        topn=topn, opt_params=match_sparse_options, filter_expr=filter_expr)
+    return match_sparse_expr
+
+
+def make_sparse_constant_expr(sparse_data: SparseVector | dict) -> ConstantExpr:
     query_sparse_expr = ConstantExpr()
 
+    if isinstance(sparse_data, SparseVector):
+        # numpy indices / values are converted in one call instead of element by element
+        indices, values = sparse_data.indices, sparse_data.values
+        if isinstance(indices, np.ndarray):
+            indices = indices.astype(np.int64, copy=False).tolist()
+        if isinstance(values, np.ndarray):
+            values = values.tolist()
+        sparse_data = SparseVector(indices, values)
+
     match sparse_data:
         case SparseVector([int(), *_] as indices, [int(), *_] as values):
             query_sparse_expr.literal_type = LiteralType.SparseIntegerArray
@@ -617,13 +834,4 @@ def make_match_sparse_expr(vector_column_name: str, sparse_data: SparseVector |
                                             f"Invalid sparse vector value type: {type(next(iter(sparse_data.values())))}")
         case _:
             raise InfinityException(ErrorCode.INVALID_CONSTANT_TYPE, f"Invalid sparse data type {type(sparse_data)}")
-
-    match_sparse_options = []
-    if opt_params is not None:
-        for k, v in opt_params.items():
-            match_sparse_options.append(InitParameter(param_name=k, param_value=v))
-
-    match_sparse_expr = MatchSparseExpr(column_expr=column_expr, query_sparse_expr=query_sparse_expr,
-                                        metric_type=metric_type,
-                                        topn=topn, opt_params=match_sparse_options, filter_expr=filter_expr)
-    return match_sparse_expr
+    return query_sparse_expr
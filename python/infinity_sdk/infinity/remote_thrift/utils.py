@@ -12,21 +12,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 import re
 import functools
 import inspect
 from typing import Any
-import pandas as pd
-import polars as pl
-from sqlglot import condition
-import sqlglot.expressions as exp
 import numpy as np
 import infinity.remote_thrift.infinity_thrift_rpc.ttypes as ttypes
-from infinity.remote_thrift.types import build_result, logic_type_to_dtype
-from infinity.utils import binary_exp_to_paser_exp
-from infinity.common import InfinityException, SparseVector, Array
+from infinity.remote_thrift.types import build_arrow_result, add_length_prefixes, embedding_to_bytes
+from infinity.utils import binary_exp_to_paser_exp, LazyModule
+from infinity.common import InfinityException, SparseVector, Array, ConflictType
 from infinity.errors import ErrorCode
 
+pl = LazyModule("polars")
+pa = LazyModule("pyarrow")
+sqlglot = LazyModule("sqlglot")
+exp = LazyModule("sqlglot.expressions")
+
 
 def parsed_expression_to_string(expr: ttypes.ParsedExpr) -> str:
     if expr is None:
@@ -360,7 +363,8 @@ def traverse_conditions(cons, fn=None) -> ttypes.ParsedExpr:
     elif isinstance(cons, exp.In):
         left_operand = parse_expr(cons.args['this'])
         arguments = []
-        for arg in cons.args['expressions']:
+        # "c1 in :ids" puts the parameter in 'field'
+        for arg in cons.args.get('expressions') or [cons.args.get('field')]:
             if arg:
                 arguments.append(parse_expr(arg))
         in_expr = ttypes.InExpr(
@@ -376,7 +380,7 @@ def traverse_conditions(cons, fn=None) -> ttypes.ParsedExpr:
         raw_in = cons.this
         left_operand = parse_expr(raw_in.args['this'])
         arguments = []
-        for arg in raw_in.args['expressions']:
+        for arg in raw_in.args.get('expressions') or [raw_in.args.get('field')]:
             if arg:
                 arguments.append(parse_expr(arg))
         in_expr = ttypes.InExpr(
@@ -387,6 +391,10 @@ def traverse_conditions(cons, fn=None) -> ttypes.ParsedExpr:
         expr_type = ttypes.ParsedExprType(in_expr=in_expr)
         parsed_expr = ttypes.ParsedExpr(type=expr_type)
         return parsed_expr
+    elif isinstance(cons, exp.Placeholder):
+        if not cons.name or cons.name == "?":
+            raise InfinityException(ErrorCode.INVALID_EXPRESSION, f"Filter parameter should be named, like :p")
+        return FilterParamExpr(cons.name)
     else:
         raise InfinityException(ErrorCode.INVALID_EXPRESSION, f"unknown condition type: {cons}")
 
@@ -407,6 +415,90 @@ def parse_expr(expr) -> ttypes.ParsedExpr:
             raise InfinityException(ErrorCode.INVALID_EXPRESSION, f"unknown expression type: {expr}")
 
 
+_plain_column_name = re.compile(r"[A-Za-z][A-Za-z0-9_]*")
+# bare words which sqlglot doesn't parse as a column: keywords, literals and functions called without parentheses
+_non_column_words = frozenset([
+    "alter", "always", "analyze", "and", "any", "as", "asc", "begin", "between", "cache", "call", "case", "comment",
+    "commit", "copy", "create", "cross", "cube", "current_date", "current_time", "current_timestamp", "current_user",
+    "delete", "desc", "describe", "distinct", "drop", "else", "end", "except", "execute", "explain", "false",
+    "fetch", "for", "from", "glob", "grant", "having", "ilike", "in", "inner", "insert", "intersect", "interval",
+    "into", "join", "lateral", "like", "limit", "merge", "not", "notnull", "null", "on", "optimize", "or", "outer",
+    "over", "overlaps", "partitioned_by", "pragma", "prepare", "qualify", "recursive", "regexp", "replace", "rlike",
+    "rollback", "rollup", "select", "set", "show", "tablesample", "then", "true", "truncate", "uncache", "union",
+    "unnest", "update", "use", "using", "vacuum", "values", "when", "where", "with"
+])
+
+
+def parse_expr_str(expr_str) -> ttypes.ParsedExpr:
+    # plain column names are by far the most common output / sort / group by expression, they don't need sqlglot
+    if isinstance(expr_str, str) and _plain_column_name.fullmatch(expr_str) and expr_str.lower() not in _non_column_words:
+        column_expr = ttypes.ColumnExpr(star=False, column_name=[expr_str.lower()])
+        return ttypes.ParsedExpr(type=ttypes.ParsedExprType(column_expr=column_expr))
+    return parse_expr(sqlglot.maybe_parse(expr_str))
+
+
+class FilterParamExpr(ttypes.ParsedExpr):
+    # ":name" in a filter, replaced by a constant in bind_filter_params()
+    def __init__(self, param_name: str):
+        super().__init__()
+        self.param_name = param_name
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_filter(cond: str) -> tuple[ttypes.ParsedExpr, frozenset[str]]:
+    # the returned tree is shared by every user of the same filter string, it must not be modified
+    tree = sqlglot.condition(cond)
+    param_names = frozenset(placeholder.name for placeholder in tree.find_all(exp.Placeholder))
+    return traverse_conditions(tree), param_names
+
+
+def get_filter_expr(cond: str, params: dict[str, Any] = None) -> ttypes.ParsedExpr:
+    expr, param_names = compile_filter(cond)
+    if not param_names and not params:
+        return expr
+    params = params or {}
+    missing = param_names - params.keys()
+    if missing:
+        raise InfinityException(ErrorCode.INVALID_EXPRESSION,
+                                f"Missing filter parameters: {sorted(missing)}, filter: {cond}")
+    unknown = params.keys() - param_names
+    if unknown:
+        raise InfinityException(ErrorCode.INVALID_EXPRESSION,
+                                f"Unknown filter parameters: {sorted(unknown)}, filter: {cond}")
+    return bind_filter_params(expr, params)
+
+
+def get_param_constant_expr(value) -> ttypes.ParsedExpr:
+    return ttypes.ParsedExpr(type=ttypes.ParsedExprType(constant_expr=get_remote_constant_expr_from_python_value(value)))
+
+
+def bind_filter_params(expr: ttypes.ParsedExpr, params: dict[str, Any]) -> ttypes.ParsedExpr:
+    # only the nodes on the path to a parameter are copied, the rest is shared with the compiled filter
+    if isinstance(expr, FilterParamExpr):
+        return get_param_constant_expr(params[expr.param_name])
+    expr_type = expr.type
+    if expr_type.function_expr is not None:
+        arguments = [bind_filter_params(argument, params) for argument in expr_type.function_expr.arguments]
+        if all(new is old for new, old in zip(arguments, expr_type.function_expr.arguments)):
+            return expr
+        function_expr = ttypes.FunctionExpr(function_name=expr_type.function_expr.function_name, arguments=arguments)
+        return ttypes.ParsedExpr(type=ttypes.ParsedExprType(function_expr=function_expr), alias_name=expr.alias_name)
+    if expr_type.in_expr is not None:
+        in_expr = expr_type.in_expr
+        arguments = []
+        for argument in in_expr.arguments:
+            if isinstance(argument, FilterParamExpr) and isinstance(params[argument.param_name],
+                                                                    (list, tuple, set, np.ndarray)):
+                # "c1 in :ids" expands to one constant per value
+                arguments.extend(get_param_constant_expr(value) for value in params[argument.param_name])
+            else:
+                arguments.append(bind_filter_params(argument, params))
+        in_expr = ttypes.InExpr(left_operand=bind_filter_params(in_expr.left_operand, params), arguments=arguments,
+                                in_type=in_expr.in_type)
+        return ttypes.ParsedExpr(type=ttypes.ParsedExprType(in_expr=in_expr), alias_name=expr.alias_name)
+    return expr
+
+
 def get_search_optional_filter_from_opt_params(opt_params: dict):
     optional_filter = None
     k_to_pop = []
@@ -418,7 +510,7 @@ def get_search_optional_filter_from_opt_params(opt_params: dict):
             if not isinstance(v, str):
                 raise InfinityException(ErrorCode.INVALID_EXPRESSION,
                                         f"Invalid filter expression '{v}', type should be string, but get {type(v)}")
-            optional_filter = traverse_conditions(condition(v))
+            optional_filter = get_filter_expr(v)
             k_to_pop.append(k)
     for k in k_to_pop:
         opt_params.pop(k)
@@ -525,6 +617,122 @@ def get_remote_constant_expr_from_python_value(value) -> ttypes.ConstantExpr:
 identifier_limit = 65536
 
 
+insert_column_dtype_to_column_type = {
+    'b1': ttypes.ColumnType.ColumnBool,
+    'i1': ttypes.ColumnType.ColumnInt8,
+    'i2': ttypes.ColumnType.ColumnInt16,
+    'i4': ttypes.ColumnType.ColumnInt32,
+    'i8': ttypes.ColumnType.ColumnInt64,
+    'f4': ttypes.ColumnType.ColumnFloat32,
+    'f8': ttypes.ColumnType.ColumnFloat64,
+}
+
+
+def get_remote_varchar_column_field(column_name: str, column_data: pa.Array) -> ttypes.ColumnField:
+    offset_dtype = np.int64 if pa.types.is_large_string(column_data.type) else np.int32
+    _, offsets_buffer, data_buffer = column_data.buffers()
+    offsets = np.frombuffer(offsets_buffer, dtype=offset_dtype)[column_data.offset:column_data.offset + len(column_data) + 1]
+    data = np.frombuffer(data_buffer, dtype=np.uint8) if data_buffer is not None else np.empty(0, dtype=np.uint8)
+    return ttypes.ColumnField(column_type=ttypes.ColumnType.ColumnVarchar,
+                              column_vectors=[add_length_prefixes(data, offsets.astype(np.int64))],
+                              column_name=column_name)
+
+
+def get_remote_column_field_from_column_data(column_name: str, column_data) -> ttypes.ColumnField:
+    # one contiguous little-endian buffer per column, 2-D data is sent as one fixed-width array per row
+    # arrow columns can only be passed in if pyarrow is already imported
+    is_arrow = pa.is_loaded() and isinstance(column_data, (pa.Array, pa.ChunkedArray))
+    if is_arrow and isinstance(column_data, pa.ChunkedArray):
+        column_data = column_data.combine_chunks()
+    if is_arrow:
+        if column_data.null_count > 0:
+            raise InfinityException(ErrorCode.INVALID_EXPRESSION, f"Column {column_name} contains null values")
+        if pa.types.is_string(column_data.type) or pa.types.is_large_string(column_data.type):
+            return get_remote_varchar_column_field(column_name, column_data)
+        if pa.types.is_fixed_size_list(column_data.type):
+            column_data = column_data.flatten().to_numpy(zero_copy_only=False).reshape(len(column_data),
+                                                                                      column_data.type.list_size)
+        else:
+            column_data = column_data.to_numpy(zero_copy_only=False)
+    elif isinstance(column_data, (list, tuple)):
+        column_data = np.asarray(column_data)
+    elif not isinstance(column_data, np.ndarray):
+        raise InfinityException(ErrorCode.INVALID_DATA_TYPE,
+                                f"Invalid column type: {type(column_data)}, column {column_name}")
+
+    if column_data.dtype.kind in 'UO':
+        return get_remote_varchar_column_field(column_name, pa.array(column_data.tolist(), type=pa.large_string()))
+    if column_data.ndim not in (1, 2) or (column_data.ndim == 2 and column_data.shape[1] == 0):
+        raise InfinityException(ErrorCode.INVALID_EXPRESSION,
+                                f"Invalid column shape: {column_data.shape}, column {column_name}")
+
+    element_dtype = column_data.dtype
+    if element_dtype.kind == 'u':
+        # unsigned values are sent in the next wider signed type, uint64 fits in int64 only up to its max
+        if element_dtype.itemsize == 8 and column_data.size > 0 and column_data.max() > np.iinfo(np.int64).max:
+            raise InfinityException(ErrorCode.INVALID_DATA_TYPE,
+                                    f"Column {column_name} has uint64 values out of the int64 range")
+        element_dtype = np.dtype(f'i{min(element_dtype.itemsize * 2, 8)}')
+    elif element_dtype.kind == 'f' and element_dtype.itemsize == 2:
+        element_dtype = np.dtype('f4')
+    dtype_key = f'{element_dtype.kind}{element_dtype.itemsize}'
+    if dtype_key not in insert_column_dtype_to_column_type:
+        raise InfinityException(ErrorCode.INVALID_DATA_TYPE,
+                                f"Invalid column element type: {column_data.dtype}, column {column_name}")
+    buffer = np.ascontiguousarray(column_data, dtype=np.dtype(f'<{dtype_key}')).tobytes()
+    return ttypes.ColumnField(column_type=insert_column_dtype_to_column_type[dtype_key],
+                              column_vectors=[buffer],
+                              column_name=column_name,
+                              dimension=column_data.shape[1] if column_data.ndim == 2 else 0)
+
+
+def get_knn_distance_type(distance_type: str) -> ttypes.KnnDistanceType:
+    match distance_type:
+        case "l2":
+            return ttypes.KnnDistanceType.L2
+        case "cosine" | "cos":
+            return ttypes.KnnDistanceType.Cosine
+        case "ip":
+            return ttypes.KnnDistanceType.InnerProduct
+        case "hamming":
+            return ttypes.KnnDistanceType.Hamming
+        case _:
+            raise InfinityException(ErrorCode.INVALID_KNN_DISTANCE_TYPE, f"Invalid distance type {distance_type}")
+
+
+def get_embedding_batch_data(embedding_data, embedding_data_type: str) -> tuple[ttypes.ElementType, int, int, bytes]:
+    # returns element type, query count, dimension and the queries packed row by row
+    embedding_data = np.asarray(embedding_data)
+    if embedding_data.ndim == 1:
+        embedding_data = embedding_data.reshape(1, -1)
+    if embedding_data.ndim != 2 or embedding_data.shape[1] == 0:
+        raise InfinityException(ErrorCode.INVALID_EXPRESSION,
+                                f"Invalid embedding batch shape: {embedding_data.shape}, expect (query_count, dimension)")
+    query_count, dimension = embedding_data.shape
+    element_type = get_embedding_element_type(embedding_data_type)
+    return element_type, query_count, dimension, embedding_to_bytes(element_type, embedding_data)
+
+
+def get_remote_create_conflict(conflict_type: ConflictType) -> ttypes.CreateConflict:
+    if conflict_type == ConflictType.Error:
+        return ttypes.CreateConflict.Error
+    elif conflict_type == ConflictType.Ignore:
+        return ttypes.CreateConflict.Ignore
+    elif conflict_type == ConflictType.Replace:
+        return ttypes.CreateConflict.Replace
+    else:
+        raise InfinityException(ErrorCode.INVALID_CONFLICT_TYPE, "Invalid conflict type")
+
+
+def get_remote_drop_conflict(conflict_type: ConflictType) -> ttypes.DropConflict:
+    if conflict_type == ConflictType.Error:
+        return ttypes.DropConflict.Error
+    elif conflict_type == ConflictType.Ignore:
+        return ttypes.DropConflict.Ignore
+    else:
+        raise InfinityException(ErrorCode.INVALID_CONFLICT_TYPE, "Invalid conflict type")
+
+
 def check_valid_name(name, name_type: str = "Table"):
     if not isinstance(name, str):
         raise InfinityException(ErrorCode.INVALID_IDENTIFIER_NAME,
@@ -570,13 +778,8 @@ def name_validity_check(arg_name: str, name_type: str = "Table"):
 
 
 def select_res_to_polars(res) -> (pl.DataFrame, Any):
-    df_dict = {}
-    data_dict, data_type_dict, extra_result = build_result(res)
-    for k, v in data_dict.items():
-        data_series = pd.Series(v, dtype=logic_type_to_dtype(data_type_dict[k]))
-        df_dict[k] = data_series
-
-    return pl.from_pandas(pd.DataFrame(df_dict))
+    table, extra_result = build_arrow_result(res)
+    return pl.from_arrow(table)
 
 
 def get_constant_expr(column_info):
@@ -0,0 +1,166 @@
+# Copyright(C) 2024 InfiniFlow, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import time
+from collections import OrderedDict
+from threading import Lock
+
+from thrift import TSerialization
+from thrift.protocol import TBinaryProtocol
+
+from infinity.common import InfinityException
+from infinity.errors import ErrorCode
+
+
+class ResultCacheStats:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        # entries dropped to stay under max_bytes / max_entries
+        self.evictions = 0
+        self.expirations = 0
+        # entries dropped because their table was written through a connection using this cache
+        self.invalidations = 0
+        self.entries = 0
+        self.bytes = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+    def __repr__(self):
+        return (f"ResultCacheStats(hits={self.hits}, misses={self.misses}, evictions={self.evictions}, "
+                f"expirations={self.expirations}, invalidations={self.invalidations}, entries={self.entries}, "
+                f"bytes={self.bytes})")
+
+
+class _CacheEntry:
+    __slots__ = ("table_key", "response", "size", "expire_time")
+
+    def __init__(self, table_key, response, size, expire_time):
+        self.table_key = table_key
+        self.response = response
+        self.size = size
+        self.expire_time = expire_time
+
+
+def _response_size(key: bytes, res) -> int:
+    size = len(key)
+    for column_field in res.column_fields or []:
+        for column_vector in column_field.column_vectors or []:
+            size += len(column_vector)
+    return size + len(res.extra_result or "")
+
+
+class ResultCache(object):
+    """
+    LRU of select responses keyed by the serialized request, opt in with infinity.connect(uri, result_cache=...).
+    An entry lives at most ttl seconds. Inserts, deletes, updates, imports, compaction and DDL sent through a
+    connection sharing this cache drop the entries of the table, writes from other clients are only bounded by ttl.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, ttl: float = 60.0, max_entries: int = None):
+        if max_bytes <= 0 or ttl <= 0 or (max_entries is not None and max_entries <= 0):
+            raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                                    f"Invalid result cache bounds, max_bytes: {max_bytes}, ttl: {ttl}, "
+                                    f"max_entries: {max_entries}")
+        self.max_bytes_ = max_bytes
+        self.ttl_ = ttl
+        self.max_entries_ = max_entries
+        # least recently used first
+        self.entries_ = OrderedDict()
+        self.table_entries_ = {}
+        # bumped by every write, a response loaded across a write is not cached
+        self.table_generations_ = {}
+        self.bytes_ = 0
+        self.lock_ = Lock()
+        self.stats_ = ResultCacheStats()
+        self.protocol_factory_ = TBinaryProtocol.TBinaryProtocolAcceleratedFactory()
+
+    def get_or_load(self, db_name: str, table_name: str, request, load):
+        # the session id must not be part of the key, it is set by load
+        table_key = (db_name, table_name)
+        key = TSerialization.serialize(request, self.protocol_factory_)
+        now = time.monotonic()
+        with self.lock_:
+            entry = self.entries_.get(key)
+            if entry is not None:
+                if entry.expire_time > now:
+                    self.entries_.move_to_end(key)
+                    self.stats_.hits += 1
+                    return entry.response
+                self._remove(key)
+                self.stats_.expirations += 1
+            self.stats_.misses += 1
+            generation = self.table_generations_.setdefault(table_key, 0)
+
+        res = load(request)
+        if res.error_code != ErrorCode.OK:
+            return res
+        size = _response_size(key, res)
+        if size > self.max_bytes_:
+            return res
+        with self.lock_:
+            if self.table_generations_[table_key] != generation:
+                return res
+            if key in self.entries_:
+                self._remove(key)
+            self.entries_[key] = _CacheEntry(table_key, res, size, now + self.ttl_)
+            self.table_entries_.setdefault(table_key, set()).add(key)
+            self.bytes_ += size
+            while self.bytes_ > self.max_bytes_ or (
+                    self.max_entries_ is not None and len(self.entries_) > self.max_entries_):
+                self._remove(next(iter(self.entries_)))
+                self.stats_.evictions += 1
+        return res
+
+    def invalidate(self, db_name: str, table_name: str):
+        table_key = (db_name, table_name)
+        with self.lock_:
+            self.table_generations_[table_key] = self.table_generations_.get(table_key, 0) + 1
+            for key in self.table_entries_.pop(table_key, ()):
+                entry = self.entries_.pop(key)
+                self.bytes_ -= entry.size
+                self.stats_.invalidations += 1
+
+    def invalidate_database(self, db_name: str):
+        with self.lock_:
+            table_names = [table_name for db, table_name in self.table_generations_ if db == db_name]
+        for table_name in table_names:
+            self.invalidate(db_name, table_name)
+
+    def clear(self):
+        with self.lock_:
+            for table_key in self.table_generations_:
+                self.table_generations_[table_key] += 1
+            self.entries_.clear()
+            self.table_entries_.clear()
+            self.bytes_ = 0
+
+    def stats(self) -> ResultCacheStats:
+        with self.lock_:
+            stats = copy.copy(self.stats_)
+            stats.entries = len(self.entries_)
+            stats.bytes = self.bytes_
+        return stats
+
+    def _remove(self, key):
+        entry = self.entries_.pop(key)
+        self.bytes_ -= entry.size
+        keys = self.table_entries_[entry.table_key]
+        keys.discard(key)
+        if not keys:
+            del self.table_entries_[entry.table_key]
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import importlib
+import sys
 import warnings
 from infinity.common import InfinityException
 from infinity.errors import ErrorCode
@@ -50,3 +52,26 @@ def binary_exp_to_paser_exp(binary_expr_key) -> str:
 
 def deprecated_api(message):
     warnings.warn(message, DeprecationWarning, stacklevel=2)
+
+
+class LazyModule:
+    """
+    Placeholder for a module which is imported on first attribute access, so that `import infinity` doesn't pay for
+    pandas, polars, pyarrow or sqlglot until a dataframe or a parsed expression is actually needed.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+    def is_loaded(self) -> bool:
+        # an object of this module can only exist if somebody already imported it
+        return self._name in sys.modules
+
+    def __repr__(self):
+        return f"<lazy module '{self._name}'>"
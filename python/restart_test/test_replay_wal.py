@@ -0,0 +1,83 @@
+import os
+import time
+import pytest
+from common import common_values
+from infinity.common import ConflictType
+from infinity_runner import InfinityRunner, infinity_runner_decorator_factory
+
+TABLE_N = 8
+
+
+def wal_size(infinity_runner: InfinityRunner) -> int:
+    wal_dir = f"{infinity_runner.data_dir}/wal"
+    return sum(
+        os.path.getsize(f"{wal_dir}/{filename}") for filename in os.listdir(wal_dir)
+    )
+
+
+class TestReplayWal:
+    # seconds from launching infinity until it serves requests, replaying a WAL of appends to TABLE_N tables
+    @pytest.mark.slow
+    @pytest.mark.parametrize("insert_n", [100000, 400000, 1600000])
+    @pytest.mark.parametrize(
+        "config",
+        [
+            "test/data/config/restart_test/test_replay_wal/1.toml",
+            "test/data/config/restart_test/test_replay_wal/2.toml",
+        ],
+    )
+    def test_replay_time(self, infinity_runner: InfinityRunner, insert_n: int, config: str):
+        uri = common_values.TEST_LOCAL_HOST
+        infinity_runner.clear()
+
+        # checkpoints are disabled and infinity is killed, every insert is left in the WAL
+        decorator = infinity_runner_decorator_factory(config, uri, infinity_runner, kill=True)
+
+        @decorator
+        def part1(infinity_obj):
+            db_obj = infinity_obj.get_database("default_db")
+            table_objs = []
+            for i in range(TABLE_N):
+                table_objs.append(
+                    db_obj.create_table(
+                        f"test_replay_wal{i}",
+                        {"c1": {"type": "int"}, "c2": {"type": "varchar"}},
+                        ConflictType.Error,
+                    )
+                )
+            batch_size = 1000
+            for start in range(0, insert_n, batch_size):
+                table_obj = table_objs[start // batch_size % TABLE_N]
+                end = min(start + batch_size, insert_n)
+                table_obj.insert([{"c1": i, "c2": f"row {i}"} for i in range(start, end)])
+
+        part1()
+
+        size = wal_size(infinity_runner)
+        begin = time.time()
+        infinity_runner.init(config)
+        infinity_obj = infinity_runner.connect(uri)
+        ready_seconds = time.time() - begin
+        print(
+            f"config: {config}, insert_n: {insert_n}, wal size: {size / 1024 / 1024:.1f}MB, ready in {ready_seconds:.2f}s"
+        )
+
+        try:
+            batch_size = 1000
+            db_obj = infinity_obj.get_database("default_db")
+            for i in range(TABLE_N):
+                expected = [
+                    c1
+                    for start in range(i * batch_size, insert_n, TABLE_N * batch_size)
+                    for c1 in range(start, min(start + batch_size, insert_n))
+                ]
+                table_obj = db_obj.get_table(f"test_replay_wal{i}")
+                data_dict, _, _ = table_obj.output(["count(*)"]).to_result()
+                assert data_dict["count(star)"][0] == len(expected)
+
+                data_dict, _, _ = table_obj.output(["c1", "c2"]).to_result()
+                rows = sorted(zip(data_dict["c1"], data_dict["c2"]))
+                assert rows == [(c1, f"row {c1}") for c1 in expected]
+        finally:
+            infinity_obj.disconnect()
+            infinity_runner.uninit()
@@ -0,0 +1,85 @@
+import asyncio
+import pytest
+from thrift.Thrift import TMessageType
+from thrift.protocol import TBinaryProtocol
+from thrift.transport import TTransport
+from common import common_values
+import infinity.asyncio as infinity_asyncio
+from infinity.asyncio.client import AsyncThriftInfinityClient, _MessageReader
+from infinity.common import ConflictType, InfinityException, NetworkAddress
+from infinity.errors import ErrorCode
+from infinity.remote_thrift.infinity_thrift_rpc import InfinityService
+from infinity.remote_thrift.infinity_thrift_rpc.ttypes import CommonResponse
+
+
+@pytest.mark.usefixtures("skip_if_local_infinity")
+@pytest.mark.usefixtures("skip_if_http")
+@pytest.mark.usefixtures("suffix")
+class TestInfinity:
+    def test_asyncio_concurrent_queries(self, suffix):
+        async def run():
+            async with await infinity_asyncio.connect(common_values.TEST_LOCAL_HOST, pool_size=2) as infinity_obj:
+                db_obj = await infinity_obj.get_database("default_db")
+                await db_obj.drop_table("test_asyncio" + suffix, ConflictType.Ignore)
+                table_obj = await db_obj.create_table("test_asyncio" + suffix,
+                                                      {"c1": {"type": "int"}, "c2": {"type": "vector,3,float"}},
+                                                      ConflictType.Error)
+                res = await table_obj.insert([{"c1": i, "c2": [float(i)] * 3} for i in range(100)])
+                assert res.error_code == ErrorCode.OK
+
+                # queries are built eagerly, so the shared builder can start the next one before awaiting
+                queries = [table_obj.output(["c1"]).filter(f"c1 < {i}").to_pl() for i in range(1, 51)]
+                results = await asyncio.gather(*queries)
+                for i, (res, extra_result) in enumerate(results):
+                    assert res.height == i + 1
+
+                res, extra_result = await (table_obj.output(["c1"])
+                                           .match_dense("c2", [0.0, 0.0, 0.0], "float", "l2", 3).to_pl())
+                assert res["c1"].to_list() == [0, 1, 2]
+
+                with pytest.raises(InfinityException) as e:
+                    await db_obj.create_table("test_asyncio" + suffix, {"c1": {"type": "int"}}, ConflictType.Error)
+                assert e.value.error_code == ErrorCode.DUPLICATE_TABLE_NAME
+
+                res = await db_obj.drop_table("test_asyncio" + suffix, ConflictType.Error)
+                assert res.error_code == ErrorCode.OK
+
+        asyncio.run(run())
+
+
+def test_asyncio_retry_on_dropped_connection():
+    # a fake server which answers Connect, then drops the connection on the next request
+    async def run():
+        connect_n = 0
+
+        async def handle(reader, writer):
+            nonlocal connect_n
+            data = await _MessageReader(reader).read_message()
+            name, _, seqid = TBinaryProtocol.TBinaryProtocol(TTransport.TMemoryBuffer(data)).readMessageBegin()
+            assert name == "Connect"
+            connect_n += 1
+            buffer = TTransport.TMemoryBuffer()
+            protocol = TBinaryProtocol.TBinaryProtocol(buffer)
+            protocol.writeMessageBegin(name, TMessageType.REPLY, seqid)
+            InfinityService.Connect_result(success=CommonResponse(error_code=0, session_id=connect_n)).write(protocol)
+            protocol.writeMessageEnd()
+            writer.write(buffer.getvalue())
+            await writer.drain()
+            await reader.read(1)
+            writer.close()
+
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            client = AsyncThriftInfinityClient(NetworkAddress("127.0.0.1", port), pool_size=1, try_times=3)
+            await client.connect()
+            # both calls share the channel, each try fails and reconnects instead of raising AttributeError
+            results = await asyncio.gather(client.list_databases(), client.list_databases())
+            for res in results:
+                assert res.error_code == ErrorCode.TOO_MANY_CONNECTIONS
+            assert connect_n > 1
+        finally:
+            server.close()
+            await server.wait_closed()
+
+    asyncio.run(run())
@@ -1,9 +1,10 @@
 import sys
 import os
+import threading
 import pytest
 from common import common_values
 from infinity.connection_pool import ConnectionPool
-from infinity.common import ConflictType
+from infinity.common import ConflictType, InfinityException
 
 import infinity
 import infinity_embedded
@@ -39,14 +40,14 @@ class TestInfinity:
     #@pytest.mark.skip(reason = "cluster fail")
     @pytest.mark.usefixtures("skip_if_local_infinity")
     def test_connection_pool(self, suffix):
-        connection_pool = ConnectionPool(uri=self.uri, max_size=8)
-        assert len(connection_pool.free_pool_) == 8
+        connection_pool = ConnectionPool(uri=self.uri, max_size=8, min_size=4)
+        assert len(connection_pool.free_pool_) == 4
 
         infinity_obj = connection_pool.get_conn()
         _ = connection_pool.get_conn() # It's safe for user to not releasing (due to exception or some other reasons) a connection created by ConnectionPool
         _ = connection_pool.get_conn() # It's safe for user to not releasing (due to exception or some other reasons) a connection created by ConnectionPool
         assert infinity_obj
-        assert len(connection_pool.free_pool_) == 5
+        assert len(connection_pool.free_pool_) == 1
 
         infinity_obj.drop_database("my_database"+suffix, conflict_type=ConflictType.Ignore)
         db = infinity_obj.create_database("my_database"+suffix)
@@ -64,11 +65,11 @@ class TestInfinity:
         infinity_obj.drop_database("my_database"+suffix, conflict_type=ConflictType.Error)
 
         connection_pool.release_conn(infinity_obj)
-        assert len(connection_pool.free_pool_) == 6
+        assert len(connection_pool.free_pool_) == 2
 
         external_infinity_obj = infinity.connect(self.uri)
         connection_pool.release_conn(external_infinity_obj)
-        assert len(connection_pool.free_pool_) == 7 # It's safe for user to release a connection not created by ConnectionPool
+        assert len(connection_pool.free_pool_) == 3 # It's safe for user to release a connection not created by ConnectionPool
 
         try:
             connection_pool.release_conn(infinity_obj)
@@ -77,3 +78,43 @@ class TestInfinity:
         else:
             assert "no exception when double release" == 0
         connection_pool.destroy()
+
+    @pytest.mark.usefixtures("skip_if_local_infinity")
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_connection_pool_limits(self, suffix):
+        connection_pool = ConnectionPool(uri=self.uri, max_size=2, timeout=0.5, idle_timeout=0,
+                                         health_check_interval=None)
+        assert len(connection_pool.free_pool_) == 0
+
+        with connection_pool.connection() as infinity_obj:
+            res = infinity_obj.list_databases()
+            assert "default_db" in res.db_names
+        assert len(connection_pool.free_pool_) == 1
+
+        conn1 = connection_pool.get_conn()
+        conn2 = connection_pool.get_conn()
+        with pytest.raises(InfinityException) as e:
+            connection_pool.get_conn()
+        assert e.value.error_code == ErrorCode.TOO_MANY_CONNECTIONS
+
+        # a waiting get_conn() is woken up by release_conn()
+        releaser = threading.Timer(0.1, connection_pool.release_conn, args=[conn1])
+        releaser.start()
+        conn3 = connection_pool.get_conn(timeout=5)
+        releaser.join()
+        assert conn3 is conn1
+
+        stats = connection_pool.stats()
+        assert stats.created == 2
+        assert stats.in_use == 2
+        assert stats.acquired == 4
+        assert stats.waited == 1
+        assert stats.max_wait_time > 0
+
+        connection_pool.release_conn(conn2)
+        connection_pool.release_conn(conn3)
+        connection_pool.health_check()
+        stats = connection_pool.stats()
+        assert stats.idle == 0
+        assert stats.evicted == 2
+        connection_pool.destroy()
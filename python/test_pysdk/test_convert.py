@@ -1,13 +1,16 @@
+import gc
 import importlib
 import sys
 import os
 import pytest
+import numpy as np
+import pyarrow as pa
 from infinity.errors import ErrorCode
 from common import common_values
 import infinity
 import infinity_embedded
 from infinity.remote_thrift.query_builder import InfinityThriftQueryBuilder
-from infinity.common import ConflictType, InfinityException
+from infinity.common import ConflictType, InfinityException, SparseVector, SortType
 current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
 if parent_dir not in sys.path:
@@ -89,6 +92,90 @@ class TestInfinity:
         print(res)
         db_obj.drop_table("test_to_df"+suffix, ConflictType.Error)
 
+    @pytest.mark.usefixtures("skip_if_http")
+    @pytest.mark.usefixtures("skip_if_local_infinity")
+    def test_to_result_numpy(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_to_result_numpy"+suffix, ConflictType.Ignore)
+        db_obj.create_table("test_to_result_numpy"+suffix, {
+            "c1": {"type": "int"}, "c2": {"type": "vector,3,float"}, "c3": {"type": "varchar"}}, ConflictType.Error)
+
+        table_obj = db_obj.get_table("test_to_result_numpy"+suffix)
+        table_obj.insert([{"c1": 1, "c2": [1.0, 2.0, 3.0], "c3": "a"},
+                          {"c1": 2, "c2": [4.0, 5.0, 6.0], "c3": "b"}])
+        res, data_type_dict, extra_result = table_obj.output(["c1", "c2", "c3"]).to_result(to_numpy=True)
+        assert isinstance(res["c1"], np.ndarray)
+        assert res["c1"].tolist() == [1, 2]
+        assert res["c2"].shape == (2, 3)
+        assert res["c2"].dtype == np.float32
+        assert res["c2"].tolist() == [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+        assert res["c3"] == ["a", "b"]
+
+        res, data_type_dict, extra_result = table_obj.output(["c1", "c2"]).to_result()
+        assert res["c1"] == [1, 2]
+        assert res["c2"] == [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+        db_obj.drop_table("test_to_result_numpy"+suffix, ConflictType.Error)
+
+    @pytest.mark.usefixtures("skip_if_http")
+    @pytest.mark.usefixtures("skip_if_local_infinity")
+    def test_to_arrow_column_types(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_to_arrow_column_types"+suffix, ConflictType.Ignore)
+        db_obj.create_table("test_to_arrow_column_types"+suffix, {
+            "c1": {"type": "int"}, "c2": {"type": "vector,3,float"}, "c3": {"type": "varchar"},
+            "c4": {"type": "tensor,2,float"}}, ConflictType.Error)
+
+        table_obj = db_obj.get_table("test_to_arrow_column_types"+suffix)
+        table_obj.insert([{"c1": 1, "c2": [1.0, 2.0, 3.0], "c3": "abc", "c4": [[1.0, 2.0], [3.0, 4.0]]},
+                          {"c1": 2, "c2": [4.0, 5.0, 6.0], "c3": "", "c4": [[5.0, 6.0]]}])
+        res, extra_result = table_obj.output(["c1", "c2", "c3", "c4"]).to_arrow()
+        assert res.schema.field("c1").type == pa.int32()
+        assert res.schema.field("c2").type == pa.list_(pa.float32(), 3)
+        assert res.schema.field("c3").type == pa.string()
+        assert res.schema.field("c4").type == pa.list_(pa.list_(pa.float32(), 2))
+        assert res.column("c3").to_pylist() == ["abc", ""]
+        assert res.column("c4").to_pylist() == [[[1.0, 2.0], [3.0, 4.0]], [[5.0, 6.0]]]
+
+        res, extra_result = table_obj.output(["c1", "c2"]).to_pl()
+        assert res["c1"].to_list() == [1, 2]
+        assert res["c2"].to_list() == [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+        db_obj.drop_table("test_to_arrow_column_types"+suffix, ConflictType.Error)
+
+    @pytest.mark.usefixtures("skip_if_http")
+    @pytest.mark.usefixtures("skip_if_local_infinity")
+    def test_to_result_sparse_format(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_to_result_sparse_format"+suffix, ConflictType.Ignore)
+        db_obj.create_table("test_to_result_sparse_format"+suffix, {
+            "c1": {"type": "int"}, "c2": {"type": "sparse,100,float,int16"}}, ConflictType.Error)
+
+        table_obj = db_obj.get_table("test_to_result_sparse_format"+suffix)
+        table_obj.insert([{"c1": 1, "c2": SparseVector([10, 20], [1.0, 2.0])},
+                          {"c1": 2, "c2": SparseVector([30], [3.0])}])
+        res, data_type_dict, extra_result = table_obj.output(["c1", "c2"]).sort([["c1", SortType.Asc]]).to_result()
+        assert res["c2"] == [{"10": 1.0, "20": 2.0}, {"30": 3.0}]
+
+        res, data_type_dict, extra_result = table_obj.output(["c1", "c2"]).sort(
+            [["c1", SortType.Asc]]).to_result(sparse_format="csr")
+        assert res["c2"].shape == (2, 100)
+        assert res["c2"].indptr.tolist() == [0, 2, 3]
+        assert res["c2"].indices.tolist() == [10, 20, 30]
+        assert res["c2"].data.tolist() == [1.0, 2.0, 3.0]
+
+        res, data_type_dict, extra_result = table_obj.output(["c1", "c2"]).sort(
+            [["c1", SortType.Asc]]).to_result(sparse_format="arrow")
+        assert res["c2"].to_pylist() == [[{"index": 10, "value": 1.0}, {"index": 20, "value": 2.0}],
+                                         [{"index": 30, "value": 3.0}]]
+
+        res, extra_result = table_obj.output(["c2"]).to_arrow()
+        assert res.schema.field("c2").type == pa.list_(
+            pa.struct([pa.field("index", pa.int16()), pa.field("value", pa.float32())]))
+
+        with pytest.raises(InfinityException) as e:
+            table_obj.output(["c2"]).to_result(sparse_format="coo")
+        assert e.value.error_code == ErrorCode.INVALID_PARAMETER_VALUE
+        db_obj.drop_table("test_to_result_sparse_format"+suffix, ConflictType.Error)
+
     @pytest.mark.usefixtures("skip_if_http")
     def test_without_output_select_list(self, suffix):
         #from infinity_embedded.common import ConflictType, InfinityException
@@ -214,4 +301,30 @@ class TestInfinity:
 
         print(e.type)
 
-        db_obj.drop_table("test_output_with_invalid_filter_function"+suffix, ConflictType.Error)
\ No newline at end of file
+        db_obj.drop_table("test_output_with_invalid_filter_function"+suffix, ConflictType.Error)
+
+    @pytest.mark.usefixtures("skip_if_http")
+    @pytest.mark.usefixtures("skip_if_remote_infinity")
+    def test_column_array_outlives_connection(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_column_array_outlives_connection"+suffix, ConflictType.Ignore)
+        db_obj.create_table("test_column_array_outlives_connection"+suffix, {
+            "c1": {"type": "int"}, "c2": {"type": "vector,4,float"}}, ConflictType.Error)
+
+        table_obj = db_obj.get_table("test_column_array_outlives_connection"+suffix)
+        table_obj.insert([{"c1": i, "c2": [float(i)] * 4} for i in range(100)])
+        res, data_type_dict, extra_result = table_obj.output(["c1", "c2"]).to_result(to_numpy=True)
+        c1, c2 = res["c1"], res["c2"]
+        # views over the result column vectors, not copies
+        assert not c1.flags.owndata and not c2.flags.owndata
+
+        # the views keep their column vectors alive once the result, the table and the engine are gone
+        db_obj.drop_table("test_column_array_outlives_connection"+suffix, ConflictType.Error)
+        del res, data_type_dict, extra_result, table_obj, db_obj
+        self.infinity_obj.disconnect()
+        self.infinity_obj = None
+        gc.collect()
+        assert sorted(c1.tolist()) == list(range(100))
+        assert sorted(c2.tolist()) == [[float(i)] * 4 for i in range(100)]
+
+        self.infinity_obj = infinity_embedded.connect(self.uri)
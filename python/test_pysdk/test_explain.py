@@ -7,6 +7,7 @@ import infinity_embedded
 from infinity.errors import ErrorCode
 from infinity.table import ExplainType
 from infinity.common import ConflictType
+import infinity.index as index
 import polars as pl
 import pytest
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -25,6 +26,7 @@ class TestInfinity:
             module = importlib.import_module("infinity_embedded.common")
             func = getattr(module, 'ConflictType')
             globals()['ConflictType'] = func
+            globals()['index'] = importlib.import_module("infinity_embedded.index")
             module = importlib.import_module("infinity_embedded.table")
             func = getattr(module, 'ExplainType')
             globals()['ExplainType'] = func
@@ -87,4 +89,38 @@ class TestInfinity:
             res = table.output(["*"]).explain(ExplainType.Analyze)
             print(res)
 
-        db_obj.drop_table("test_explain_default"+suffix, ConflictType.Error)
\ No newline at end of file
+        db_obj.drop_table("test_explain_default"+suffix, ConflictType.Error)
+
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_profile(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_profile" + suffix, ConflictType.Ignore)
+        table = db_obj.create_table("test_profile" + suffix, {
+            "c1": {"type": "int"}, "c2": {"type": "vector,4,float"}}, ConflictType.Error)
+        table.insert([{"c1": i, "c2": [i, i + 1, i + 2, i + 3]} for i in range(100)])
+
+        res, _, extra_result = table.output(["c1"]).filter("c1 < 10").to_result()
+        assert extra_result is None or "profile" not in extra_result
+
+        res, _, extra_result = table.output(["c1"]).filter("c1 < 10").to_result(profile=True)
+        assert res["c1"] == list(range(10))
+        profile = extra_result["profile"]
+        print(profile)
+        assert isinstance(profile, pl.DataFrame)
+        assert {"operator", "input_rows", "output_rows", "elapsed_ns", "filter_skipped_blocks",
+                "index"} <= set(profile.columns)
+        table_scan = profile.filter(pl.col("operator") == "TableScan")
+        assert table_scan["output_rows"].sum() == 100
+        assert (profile["elapsed_ns"] >= 0).all()
+
+        res = table.create_index("idx_hnsw" + suffix, index.IndexInfo("c2", index.IndexType.Hnsw, {
+            "M": "16", "ef_construction": "50", "metric": "l2"}), ConflictType.Error)
+        assert res.error_code == ErrorCode.OK
+        profile = table.output(["c1"]).match_dense("c2", [0, 1, 2, 3], "float", "l2", 5).explain(
+            ExplainType.Analyze)
+        print(profile)
+        knn_scan = profile.filter(pl.col("operator") == "KnnScan")
+        assert knn_scan.height > 0
+        assert ("idx_hnsw" + suffix) in knn_scan["index"].to_list()
+
+        db_obj.drop_table("test_profile" + suffix, ConflictType.Error)
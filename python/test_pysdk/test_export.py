@@ -216,4 +216,39 @@ class TestInfinity:
         delete_file(test_export_fvecs_file_path+".part1")
 
         res = db_obj.drop_table("test_export_fvecs"+suffix, ConflictType.Error)
+        assert res.error_code == ErrorCode.OK
+
+    def test_export_parquet(self, suffix):
+        file_name = "enwiki_embedding_9999.csv"
+        copy_data(file_name)
+
+        test_csv_dir = common_values.TEST_TMP_DIR + file_name
+        schema = {"doctitle": {"type": "varchar"}, "docdate": {"type": "varchar"}, "body": {"type": "varchar"}, "num": {"type": "integer"}, "vec": {"type": "vector, 4, float"}}
+
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_export_parquet"+suffix, ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_export_parquet"+suffix, schema)
+        res = table_obj.import_data(test_csv_dir, import_options={"file_type": "csv", "delimiter" : "\t"})
+        assert res.error_code == ErrorCode.OK
+
+        test_export_parquet_file_path = common_values.TEST_TMP_DIR + suffix + "test_export_parquet.parquet"
+        delete_file(test_export_parquet_file_path)
+        res = table_obj.export_data(test_export_parquet_file_path, {"file_type": "parquet"})
+        assert res.error_code == ErrorCode.OK
+
+        # import the exported file back
+        db_obj.drop_table("test_export_parquet_import"+suffix, ConflictType.Ignore)
+        import_table_obj = db_obj.create_table("test_export_parquet_import"+suffix, schema)
+        res = import_table_obj.import_data(test_export_parquet_file_path, {"file_type": "parquet"})
+        assert res.error_code == ErrorCode.OK
+        res, extra_result = import_table_obj.output(["count(*)"]).to_pl()
+        assert res.item(0, 0) == 9999
+        expected, extra_result = table_obj.output(["num", "vec"]).to_pl()
+        res, extra_result = import_table_obj.output(["num", "vec"]).to_pl()
+        assert res.equals(expected)
+        delete_file(test_export_parquet_file_path)
+
+        res = db_obj.drop_table("test_export_parquet_import"+suffix, ConflictType.Error)
+        assert res.error_code == ErrorCode.OK
+        res = db_obj.drop_table("test_export_parquet"+suffix, ConflictType.Error)
         assert res.error_code == ErrorCode.OK
\ No newline at end of file
@@ -0,0 +1,68 @@
+# Copyright(C) 2024 InfiniFlow, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import subprocess
+import sys
+
+import pytest
+import infinity
+
+# cumulative `python -X importtime` budget of `import infinity`, in microseconds
+IMPORT_TIME_BUDGET_US = 500 * 1000
+HEAVY_MODULES = ["pandas", "polars", "pyarrow", "sqlglot"]
+
+
+def run_import(statement: str) -> tuple[dict[str, int], str]:
+    # run in a fresh interpreter, the test process already imported everything
+    env = dict(os.environ)
+    sdk_path = os.path.dirname(os.path.dirname(infinity.__file__))
+    env["PYTHONPATH"] = os.pathsep.join([sdk_path, env.get("PYTHONPATH", "")])
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], env=env, capture_output=True,
+                          text=True, check=True)
+    import_times = {}
+    for line in proc.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        import_times[name.strip()] = int(cumulative)
+    return import_times, proc.stdout
+
+
+@pytest.mark.usefixtures("skip_if_local_infinity")
+@pytest.mark.usefixtures("skip_if_http")
+class TestImportTime:
+    def test_import_does_not_load_dataframe_libraries(self):
+        import_times, _ = run_import("import infinity, infinity.asyncio")
+        loaded = [module for module in HEAVY_MODULES if module in import_times]
+        assert loaded == []
+
+    def test_import_time_budget(self):
+        import_times, _ = run_import("import infinity")
+        assert import_times["infinity"] < IMPORT_TIME_BUDGET_US, \
+            f"import infinity took {import_times['infinity'] / 1000:.1f} ms"
+
+    def test_query_builder_loads_lazily(self):
+        statement = ("import sys\n"
+                     "from infinity.remote_thrift.table import RemoteTable\n"
+                     "table = RemoteTable(None, 'default_db', 't')\n"
+                     "table.output(['c1', '_row_id']).sort([['c1', 0]])\n"
+                     "print(sorted(m for m in %r if m in sys.modules))\n"
+                     "table.filter('c1 > 1')\n"
+                     "print('sqlglot' in sys.modules)\n" % HEAVY_MODULES)
+        _, output = run_import(statement)
+        plain_columns, after_filter = output.splitlines()
+        assert plain_columns == "[]"
+        assert after_filter == "True"
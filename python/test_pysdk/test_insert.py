@@ -4,6 +4,7 @@ import os
 import pandas as pd
 import pytest
 import numpy as np
+import pyarrow as pa
 from numpy import dtype
 from common import common_values
 import infinity
@@ -761,6 +762,93 @@ class TestInfinity:
         res = db_obj.drop_table("python_test_insert_rows_mismatch"+suffix, ConflictType.Error)
         assert res.error_code == ErrorCode.OK
 
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_bulk_loader(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_bulk_loader" + suffix, ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_bulk_loader" + suffix,
+                                        {"c1": {"type": "int"}, "c2": {"type": "vector,4,float"}},
+                                        ConflictType.Error)
+        assert table_obj
+        with table_obj.bulk_loader(batch_size=100, max_in_flight=4, workers=2) as writer:
+            for i in range(1050):
+                writer.add({"c1": i, "c2": [float(i)] * 4})
+        assert writer.stats.rows == 1050
+        assert writer.stats.batches == 11
+        assert len(writer.stats.batch_latencies) == 11
+        assert writer.stats.rows_per_second > 0
+
+        res, extra_result = table_obj.output(["count(*)"]).to_pl()
+        assert res.item(0, 0) == 1050
+        res, extra_result = table_obj.output(["sum(c1)"]).to_pl()
+        assert res.item(0, 0) == sum(range(1050))
+
+        # a failed batch is raised back to the producer
+        with pytest.raises(InfinityException):
+            with table_obj.bulk_loader(batch_size=10) as writer:
+                writer.insert([{"c1": 1, "c2": [1.0]}])
+                writer.flush()
+
+        # and the writer stays failed, close() still raises after the error was seen once
+        writer = table_obj.bulk_loader(batch_size=10)
+        writer.insert([{"c1": 1, "c2": [1.0]}])
+        with pytest.raises(InfinityException):
+            writer.flush()
+        with pytest.raises(InfinityException):
+            writer.close()
+        with pytest.raises(InfinityException):
+            writer.close()
+
+        res = db_obj.drop_table("test_bulk_loader" + suffix, ConflictType.Error)
+        assert res.error_code == ErrorCode.OK
+
+    @pytest.mark.usefixtures("skip_if_http")
+    @pytest.mark.usefixtures("skip_if_local_infinity")
+    def test_insert_columns(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_insert_columns" + suffix, ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_insert_columns" + suffix,
+                                        {"c1": {"type": "int"}, "c2": {"type": "bool"}, "c3": {"type": "double"},
+                                         "c4": {"type": "varchar"}, "c5": {"type": "vector,3,float"},
+                                         "c6": {"type": "vector,2,int8"}},
+                                        ConflictType.Error)
+        assert table_obj
+        res = table_obj.insert_columns({"c1": np.array([1, 2, 3], dtype=np.int64),
+                                        "c2": [True, False, True],
+                                        "c3": np.array([0.5, -1.5, 2.5]),
+                                        "c4": ["a", "", "héllo"],
+                                        "c5": np.arange(9, dtype=np.float32).reshape(3, 3),
+                                        "c6": np.array([[1, -1], [2, -2], [3, -3]], dtype=np.int8)})
+        assert res.error_code == ErrorCode.OK
+        res = table_obj.insert_arrow(pa.table({"c1": pa.array([4], pa.int32()),
+                                               "c2": pa.array([False]),
+                                               "c3": pa.array([3.5]),
+                                               "c4": pa.array(["arrow"], pa.large_string()),
+                                               "c5": pa.FixedSizeListArray.from_arrays(
+                                                   pa.array([9.0, 10.0, 11.0], pa.float32()), 3),
+                                               "c6": pa.FixedSizeListArray.from_arrays(
+                                                   pa.array([4, -4], pa.int8()), 2)}))
+        assert res.error_code == ErrorCode.OK
+        res, extra_result = table_obj.output(["*"]).to_df()
+        pd.testing.assert_frame_equal(res, pd.DataFrame(
+            {'c1': (1, 2, 3, 4), 'c2': (True, False, True, False), 'c3': (0.5, -1.5, 2.5, 3.5),
+             'c4': ("a", "", "héllo", "arrow"),
+             'c5': ([0.0, 1.0, 2.0], [3.0, 4.0, 5.0], [6.0, 7.0, 8.0], [9.0, 10.0, 11.0]),
+             'c6': ([1, -1], [2, -2], [3, -3], [4, -4])}).astype({'c1': dtype('int32')}))
+
+        # every column must have the same row count
+        with pytest.raises(InfinityException) as e:
+            table_obj.insert_columns({"c1": np.array([1, 2]), "c4": ["a"]})
+        assert e.value.error_code == ErrorCode.COLUMN_COUNT_MISMATCH
+
+        # uint64 is sent as int64, a value above its max would wrap around
+        with pytest.raises(InfinityException) as e:
+            table_obj.insert_columns({"c1": np.array([1, 2**64 - 1], dtype=np.uint64)})
+        assert e.value.error_code == ErrorCode.INVALID_DATA_TYPE
+
+        res = db_obj.drop_table("test_insert_columns" + suffix, ConflictType.Error)
+        assert res.error_code == ErrorCode.OK
+
     @pytest.mark.parametrize("types", ["vector,16384,int", "vector,16384,float"])
     @pytest.mark.parametrize("types_examples", [[{"c1": [1] * 16384}],
                                                 [{"c1": [4] * 16384}],
@@ -8,8 +8,9 @@ import infinity
 import infinity_embedded
 import infinity.index as index
 from infinity.errors import ErrorCode
-from infinity.common import ConflictType, InfinityException, SparseVector
+from infinity.common import ConflictType, InfinityException, SparseVector, QueryParam
 from common.utils import copy_data, generate_commas_enwiki
+import numpy as np
 import pandas as pd
 from polars.testing import assert_frame_equal as pl_assert_frame_equal
 from polars.testing import assert_frame_not_equal as pl_assert_frame_not_equal
@@ -1889,6 +1890,39 @@ class TestInfinity:
             ).astype({'c1': dtype('int32'), 'DISTANCE': dtype('float32')}))
         db_obj.drop_table("test_binary_knn_hamming_distance" + suffix, ConflictType.Error)
 
+    @pytest.mark.usefixtures("skip_if_http")
+    @pytest.mark.parametrize("query_elem_type, query_dtype", [("float", np.float32), ("double", np.float64),
+                                                              ("float16", np.float16), ("bfloat16", np.float32),
+                                                              ("int8", np.int8), ("uint8", np.uint8),
+                                                              ("int32", np.int64)])
+    def test_knn_ndarray_query(self, query_elem_type, query_dtype, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_knn_ndarray_query" + suffix, ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_knn_ndarray_query" + suffix, {
+            "c1": {"type": "int"},
+            "c2": {"type": "vector,3,float"},
+            "c3": {"type": "vector,16,bit"}
+        }, ConflictType.Error)
+        table_obj.insert([{"c1": i, "c2": [float(i)] * 3, "c3": [0] * (16 - i) + [1] * i} for i in range(5)])
+
+        query = [3, 3, 4]
+        expect, extra_result = table_obj.output(["c1", "_distance"]).match_dense(
+            "c2", query, query_elem_type, "l2", 3).to_pl()
+        res, extra_result = table_obj.output(["c1", "_distance"]).match_dense(
+            "c2", np.array(query, dtype=query_dtype), query_elem_type, "l2", 3).to_pl()
+        pl_assert_frame_equal(res, expect)
+        assert res["c1"].to_list() == [3, 4, 2]
+
+        query = np.array([0] * 14 + [1] * 2, dtype=np.uint8)
+        expect, extra_result = table_obj.output(["c1", "_distance"]).match_dense(
+            "c3", query.tolist(), "bit", "hamming", 3).to_pl()
+        res, extra_result = table_obj.output(["c1", "_distance"]).match_dense(
+            "c3", query.astype(bool), "bit", "hamming", 3).to_pl()
+        pl_assert_frame_equal(res, expect)
+        assert res["c1"][0] == 2
+
+        db_obj.drop_table("test_knn_ndarray_query" + suffix, ConflictType.Error)
+
     @pytest.mark.parametrize("check_data", [{"file_name": "sparse_knn.csv",
                                              "data_dir": common_values.TEST_TMP_DIR}], indirect=True)
     def test_match_sparse_index_hint(self, check_data, suffix):
@@ -2045,3 +2079,139 @@ class TestInfinity:
         res = db_obj.drop_table(
             "test_with_fulltext_match_with_valid_columns" + suffix, ConflictType.Error)
         assert res.error_code == ErrorCode.OK
+
+    @pytest.mark.usefixtures("skip_if_local_infinity")
+    @pytest.mark.usefixtures("skip_if_http")
+    @pytest.mark.parametrize("knn_distance_type", ["l2", "ip"])
+    def test_match_dense_batch(self, knn_distance_type, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_match_dense_batch" + suffix, ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_match_dense_batch" + suffix,
+                                        {"c1": {"type": "int"}, "c2": {"type": "vector,4,float"}},
+                                        ConflictType.Error)
+        rng = np.random.default_rng(0)
+        vectors = rng.random((100, 4), dtype=np.float32)
+        res = table_obj.insert_columns({"c1": np.arange(100, dtype=np.int32), "c2": vectors})
+        assert res.error_code == ErrorCode.OK
+
+        queries = rng.random((8, 4), dtype=np.float32)
+        row_ids, distances = table_obj.match_dense_batch("c2", queries, "float", knn_distance_type, 5)
+        assert row_ids.shape == (8, 5) and distances.shape == (8, 5)
+        distance_column, result_column = ("_distance", "DISTANCE") if knn_distance_type == "l2" else (
+            "_similarity", "SIMILARITY")
+        for i, query in enumerate(queries):
+            res, extra_result = (table_obj.output(["_row_id", distance_column])
+                                 .match_dense("c2", query.tolist(), "float", knn_distance_type, 5).to_pl())
+            assert row_ids[i].tolist() == res["ROW_ID"].to_list()
+            np.testing.assert_allclose(distances[i], res[result_column].to_numpy(), rtol=1e-5)
+
+        # fewer matches than topn are padded
+        row_ids, distances = table_obj.match_dense_batch("c2", queries[:2], "float", knn_distance_type, 5,
+                                                         filter="c1 < 3")
+        assert (row_ids[:, 3:] == -1).all() and np.isnan(distances[:, 3:]).all()
+        assert (row_ids[:, :3] >= 0).all()
+
+        # the priority only changes the scheduling
+        expected_row_ids, expected_distances = table_obj.match_dense_batch("c2", queries, "float", knn_distance_type, 5)
+        for priority in ["batch", "background"]:
+            row_ids, distances = table_obj.match_dense_batch("c2", queries, "float", knn_distance_type, 5,
+                                                             priority=priority)
+            assert (row_ids == expected_row_ids).all()
+            np.testing.assert_allclose(distances, expected_distances, rtol=1e-5)
+
+        with pytest.raises(InfinityException) as e:
+            table_obj.match_dense_batch("c2", queries, "float", "l1", 5)
+        assert e.value.error_code == ErrorCode.INVALID_KNN_DISTANCE_TYPE
+        with pytest.raises(InfinityException) as e:
+            table_obj.match_dense_batch("c2", queries, "float", knn_distance_type, 5, priority="urgent")
+        assert e.value.error_code == ErrorCode.INVALID_QUERY_OPTION
+
+        res = db_obj.drop_table("test_match_dense_batch" + suffix, ConflictType.Error)
+        assert res.error_code == ErrorCode.OK
+
+    @pytest.mark.usefixtures("skip_if_local_infinity")
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_prepared_query(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_prepared_query" + suffix, ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_prepared_query" + suffix,
+                                        {"c1": {"type": "int"}, "c2": {"type": "vector,4,float"}},
+                                        ConflictType.Error)
+        rng = np.random.default_rng(0)
+        vectors = rng.random((100, 4), dtype=np.float32)
+        res = table_obj.insert_columns({"c1": np.arange(100, dtype=np.int32), "c2": vectors})
+        assert res.error_code == ErrorCode.OK
+
+        prepared = (table_obj.output(["c1", "_distance"])
+                    .match_dense("c2", QueryParam("q"), "float", "l2", 5)
+                    .filter("c1 >= :lo").prepare())
+        assert prepared.param_names == {"q", "lo"}
+        for query in rng.random((4, 4), dtype=np.float32):
+            res, extra_result = prepared.to_pl(q=query, lo=50)
+            expected, extra_result = (table_obj.output(["c1", "_distance"])
+                                      .match_dense("c2", query.tolist(), "float", "l2", 5)
+                                      .filter("c1 >= 50").to_pl())
+            pl_assert_frame_equal(res, expected)
+            assert (res["c1"] >= 50).all()
+
+        with pytest.raises(InfinityException) as e:
+            prepared.to_result(q=vectors[0])
+        assert e.value.error_code == ErrorCode.INVALID_PARAMETER_VALUE
+        with pytest.raises(InfinityException) as e:
+            table_obj.output(["c1"]).match_dense("c2", QueryParam("q"), "float", "l2", 5).to_result()
+        assert e.value.error_code == ErrorCode.INVALID_PARAMETER_VALUE
+        with pytest.raises(InfinityException) as e:
+            table_obj.output(["c1"]).match_dense("c2", QueryParam("q"), "float128", "l2", 5)
+        assert e.value.error_code == ErrorCode.INVALID_EMBEDDING_DATA_TYPE
+
+        res = db_obj.drop_table("test_prepared_query" + suffix, ConflictType.Error)
+        assert res.error_code == ErrorCode.OK
+
+    @pytest.mark.usefixtures("skip_if_http")
+    @pytest.mark.parametrize("knn_distance_type", ["l2", "ip", "cosine"])
+    def test_hnsw_rabitq(self, knn_distance_type, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_hnsw_rabitq" + suffix, ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_hnsw_rabitq" + suffix,
+                                        {"c1": {"type": "int"}, "c2": {"type": "vector,64,float"}},
+                                        ConflictType.Error)
+        rng = np.random.default_rng(0)
+        vectors = rng.normal(size=(500, 64)).astype(np.float32)
+        res = table_obj.insert([{"c1": i, "c2": vector.tolist()} for i, vector in enumerate(vectors)])
+        assert res.error_code == ErrorCode.OK
+        res = table_obj.create_index("idx_rabitq", index.IndexInfo("c2", index.IndexType.Hnsw, {
+            "M": "16",
+            "ef_construction": "100",
+            "metric": knn_distance_type,
+            "encode": "rabitq"
+        }), ConflictType.Error)
+        assert res.error_code == ErrorCode.OK
+
+        distance_column, result_column = ("_distance", "DISTANCE") if knn_distance_type == "l2" else (
+            "_similarity", "SIMILARITY")
+        hits = 0
+        for query in rng.normal(size=(10, 64)).astype(np.float32):
+            res, extra_result = (table_obj.output(["c1", distance_column])
+                                 .match_dense("c2", query.tolist(), "float", knn_distance_type, 10).to_pl())
+            expected, extra_result = (table_obj.output(["c1", distance_column])
+                                      .match_dense("c2", query.tolist(), "float", knn_distance_type, 10,
+                                                   {"ignore_index": "true"}).to_pl())
+            hits += len(set(res["c1"].to_list()) & set(expected["c1"].to_list()))
+            # results are reranked on the original vectors, so the reported scores are exact
+            exact = dict(zip(expected["c1"].to_list(), expected[result_column].to_list()))
+            for c1, score in zip(res["c1"].to_list(), res[result_column].to_list()):
+                if c1 in exact:
+                    assert score == pytest.approx(exact[c1], rel=1e-5)
+        assert hits / 100 >= 0.9
+
+        res = table_obj.drop_index("idx_rabitq", ConflictType.Error)
+        assert res.error_code == ErrorCode.OK
+        with pytest.raises(InfinityException):
+            table_obj.create_index("idx_rabitq", index.IndexInfo("c2", index.IndexType.Hnsw, {
+                "metric": knn_distance_type,
+                "encode": "rabitq",
+                "build_type": "lsg"
+            }), ConflictType.Error)
+
+        res = db_obj.drop_table("test_hnsw_rabitq" + suffix, ConflictType.Error)
+        assert res.error_code == ErrorCode.OK
@@ -3,6 +3,8 @@ import sys
 import os
 import os
 import pytest
+import pyarrow as pa
+import pyarrow.parquet as pq
 from common import common_values
 import infinity
 import infinity_embedded
@@ -433,6 +435,34 @@ class TestInfinity:
         assert res.height == 1 and res.width == 1 and res.item(0, 0) == data_size
         db_obj.drop_table("test_import_with_different_size"+suffix, ConflictType.Ignore)
 
+    @pytest.mark.parametrize("row_group_size", [1000, 8192, 12345])
+    def test_import_parquet_row_groups(self, row_group_size, suffix):
+        # row groups are decoded in parallel, rows must keep the file order whatever the row group size is
+        data_size = 5 * 8192 + 100
+        file_path = common_values.TEST_TMP_DIR + "pysdk_test_import_row_groups.parquet"
+        data = pa.table({
+            "c1": pa.array(range(data_size), type=pa.int32()),
+            "c2": pa.array([f"row {i}" for i in range(data_size)], type=pa.string()),
+            "c3": pa.array([[float(i), float(i + 1)] for i in range(data_size)], type=pa.list_(pa.float32(), 2)),
+        })
+        pq.write_table(data, file_path, row_group_size=row_group_size)
+
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_import_parquet_row_groups"+suffix, ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_import_parquet_row_groups"+suffix,
+                                        {"c1": {"type": "int"}, "c2": {"type": "varchar"},
+                                         "c3": {"type": "vector, 2, float"}})
+        res = table_obj.import_data(file_path, import_options={"file_type": "parquet"})
+        assert res.error_code == ErrorCode.OK
+
+        res, extra_result = table_obj.output(["c1", "c2", "c3"]).to_pl()
+        assert res.height == data_size
+        assert res["c1"].to_list() == list(range(data_size))
+        assert res["c2"].to_list() == [f"row {i}" for i in range(data_size)]
+        assert res["c3"].to_list()[-1] == [float(data_size - 1), float(data_size)]
+        db_obj.drop_table("test_import_parquet_row_groups"+suffix, ConflictType.Ignore)
+        os.remove(file_path)
+
     @pytest.mark.parametrize("check_data", [{"file_name": "pysdk_test_big_varchar_rows.csv",
                                              "data_dir": common_values.TEST_TMP_DIR}], indirect=True)
     def test_import_exceeding_rows(self, check_data, suffix):
@@ -2,6 +2,7 @@ import importlib
 import sys
 import os
 import os
+import numpy as np
 import pandas as pd
 import pytest
 from common import common_values
@@ -10,7 +11,8 @@ import infinity.index as index
 import infinity_embedded
 from numpy import dtype
 from infinity.errors import ErrorCode
-from infinity.common import ConflictType, SortType
+from infinity.common import ConflictType, SortType, InfinityException
+from infinity.result_cache import ResultCache
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
@@ -855,6 +857,36 @@ class TestInfinity:
         res = db_obj.drop_table("test_select_varchar_length" + suffix)
         assert res.error_code == ErrorCode.OK
 
+    @pytest.mark.usefixtures("skip_if_local_infinity")
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_select_filter_params(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_select_filter_params" + suffix, ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_select_filter_params" + suffix,
+                                        {"c1": {"type": "int"}, "c2": {"type": "varchar"}}, ConflictType.Error)
+        table_obj.insert([{"c1": i, "c2": str(i)} for i in range(10)])
+
+        for i in range(5):
+            res, extra_res = table_obj.output(["c1"]).filter("c1 < :p and c2 != :s", p=i + 2, s="0").to_pl()
+            assert res["c1"].to_list() == list(range(1, i + 2))
+
+        res, extra_res = table_obj.output(["c1"]).filter("c1 in :ids or c1 = :v", ids=[1, 3], v=5).to_pl()
+        assert sorted(res["c1"].to_list()) == [1, 3, 5]
+
+        with pytest.raises(InfinityException) as e:
+            table_obj.output(["c1"]).filter("c1 < :p", q=1).to_pl()
+        assert e.value.error_code == ErrorCode.INVALID_EXPRESSION
+
+        res = table_obj.update("c1 = :p", {"c2": "updated"}, p=9)
+        assert res.error_code == ErrorCode.OK
+        res = table_obj.delete("c1 >= :p", p=5)
+        assert res.error_code == ErrorCode.OK
+        res, extra_res = table_obj.output(["c1"]).filter("c2 = :s", s="updated").to_pl()
+        assert res.height == 0
+
+        res = db_obj.drop_table("test_select_filter_params" + suffix)
+        assert res.error_code == ErrorCode.OK
+
     def test_select_regex(self, suffix):
         db_obj = self.infinity_obj.get_database("default_db")
         db_obj.drop_table("test_select_regex" + suffix, ConflictType.Ignore)
@@ -1394,3 +1426,98 @@ class TestInfinity:
 
         res = db_obj.drop_table("test_select_date_part" + suffix)
         assert res.error_code == ErrorCode.OK
+
+    @pytest.mark.usefixtures("skip_if_local_infinity")
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_select_result_cache(self, suffix):
+        result_cache = ResultCache(max_bytes=1024 * 1024, ttl=600)
+        infinity_obj = infinity.connect(self.uri, result_cache=result_cache)
+        db_obj = infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_select_result_cache" + suffix, ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_select_result_cache" + suffix,
+                                        {"c1": {"type": "int"}, "c2": {"type": "varchar"}}, ConflictType.Error)
+        table_obj.insert([{"c1": i, "c2": str(i)} for i in range(10)])
+
+        res, extra_res = table_obj.output(["c1", "c2"]).filter("c1 < 5").to_pl()
+        assert len(res) == 5
+        res_cached, extra_res = table_obj.output(["c1", "c2"]).filter("c1 < 5").to_pl()
+        assert res_cached.equals(res)
+        stats = result_cache.stats()
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+
+        # a write through the connection drops the cached results of the table
+        table_obj.insert([{"c1": 0, "c2": "0"}])
+        res, extra_res = table_obj.output(["c1", "c2"]).filter("c1 < 5").to_pl()
+        assert len(res) == 6
+        stats = result_cache.stats()
+        assert (stats.hits, stats.misses, stats.invalidations) == (1, 2, 1)
+
+        res = db_obj.drop_table("test_select_result_cache" + suffix)
+        assert res.error_code == ErrorCode.OK
+        assert result_cache.stats().entries == 0
+        infinity_obj.disconnect()
+
+    @pytest.mark.usefixtures("skip_if_local_infinity")
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_select_iter_batches(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_select_iter_batches" + suffix, ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_select_iter_batches" + suffix,
+                                        {"c1": {"type": "int"}, "c2": {"type": "varchar"}}, ConflictType.Error)
+        row_count = 20000
+        table_obj.insert_columns({"c1": np.arange(row_count, dtype=np.int32), "c2": [str(i) for i in range(row_count)]})
+
+        batches = list(table_obj.output(["c1", "c2"]).filter("c1 >= 100").iter_batches(batch_rows=1000))
+        assert [batch.num_rows for batch in batches] == [1000] * 19 + [900]
+        c1 = np.concatenate([batch.column("c1").to_numpy() for batch in batches])
+        assert sorted(c1.tolist()) == list(range(100, row_count))
+
+        c1 = np.concatenate([batch["c1"] for batch in table_obj.output(["c1"]).iter_batches(batch_rows=3000, to_numpy=True)])
+        assert len(c1) == row_count
+
+        # leaving early releases the cursor on the server
+        conn = table_obj._conn
+        closed_cursor_ids = []
+
+        def fetch_cursor(cursor_id, close=False):
+            if close:
+                closed_cursor_ids.append(cursor_id)
+            return type(conn).fetch_cursor(conn, cursor_id, close)
+
+        conn.fetch_cursor = fetch_cursor
+        try:
+            for batch in table_obj.output(["c1"]).iter_batches(batch_rows=10):
+                assert batch.num_rows == 10
+                break
+        finally:
+            del conn.fetch_cursor
+        assert len(closed_cursor_ids) == 1
+        res = conn.fetch_cursor(closed_cursor_ids[0])
+        assert res.error_code == ErrorCode.INVALID_PARAMETER_VALUE
+        res, extra_result = table_obj.output(["count(*)"]).to_pl()
+        assert res.item(0, 0) == row_count
+
+        with pytest.raises(InfinityException) as e:
+            table_obj.output(["c1"]).iter_batches(batch_rows=0)
+        assert e.value.error_code == ErrorCode.INVALID_PARAMETER_VALUE
+
+        res = db_obj.drop_table("test_select_iter_batches" + suffix)
+        assert res.error_code == ErrorCode.OK
+
+    def test_select_priority(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_select_priority" + suffix, ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_select_priority" + suffix,
+                                        {"c1": {"type": "int"}, "c2": {"type": "int"}}, ConflictType.Error)
+        table_obj.insert([{"c1": i, "c2": i * 2} for i in range(100)])
+
+        for priority in ["interactive", "batch", "background", "BATCH"]:
+            res, extra_res = table_obj.output(["c1", "c2"]).filter("c1 < 10").option({"priority": priority}).to_df()
+            assert res["c1"].tolist() == list(range(10))
+
+        with pytest.raises(InfinityException) as e:
+            table_obj.output(["c1"]).option({"priority": "urgent"}).to_df()
+        assert e.value.error_code == ErrorCode.INVALID_QUERY_OPTION
+
+        res = db_obj.drop_table("test_select_priority" + suffix)
+        assert res.error_code == ErrorCode.OK
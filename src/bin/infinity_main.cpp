@@ -77,7 +77,11 @@ void StartThriftServer() {
 #if THRIFT_SERVER_TYPE == 0
 
     i32 thrift_server_pool_size = InfinityContext::instance().config()->ConnectionPoolSize();
-    pool_thrift_server.Init(InfinityContext::instance().config()->ServerAddress(), thrift_server_port, thrift_server_pool_size);
+    pool_thrift_server.Init(InfinityContext::instance().config()->ServerAddress(),
+                            thrift_server_port,
+                            thrift_server_pool_size,
+                            InfinityContext::instance().config()->ClientProtocol(),
+                            InfinityContext::instance().config()->ClientTransport());
     pool_thrift_thread = pool_thrift_server.Start();
 
 #elif THRIFT_SERVER_TYPE == 1
@@ -173,6 +173,8 @@ export {
     constexpr SizeT HNSW_M = 16;
     constexpr SizeT HNSW_EF_CONSTRUCTION = 200;
     constexpr SizeT HNSW_BLOCK_SIZE = 8192;
+    // candidates fetched per result from a rabitq encoded hnsw index before reranking
+    constexpr SizeT HNSW_RABITQ_RERANK_FACTOR = 8;
 
     constexpr SizeT BMP_BLOCK_SIZE = 16;
 
@@ -250,6 +252,8 @@ export {
     constexpr std::string_view CLIENT_PORT_OPTION_NAME = "client_port";
     constexpr std::string_view CONNECTION_POOL_SIZE_OPTION_NAME = "connection_pool_size";
     constexpr std::string_view PEER_SERVER_CONNECTION_POOL_SIZE_OPTION_NAME = "peer_server_connection_pool_size";
+    constexpr std::string_view CLIENT_PROTOCOL_OPTION_NAME = "client_protocol";
+    constexpr std::string_view CLIENT_TRANSPORT_OPTION_NAME = "client_transport";
     constexpr std::string_view LOG_FILENAME_OPTION_NAME = "log_filename";
 
     constexpr std::string_view LOG_DIR_OPTION_NAME = "log_dir";
@@ -282,6 +286,7 @@ export {
 
     constexpr std::string_view BUFFER_MANAGER_SIZE_OPTION_NAME = "buffer_manager_size";
     constexpr std::string_view LRU_NUM_OPTION_NAME = "lru_num";
+    constexpr std::string_view BUFFER_REPLACEMENT_POLICY_OPTION_NAME = "buffer_replacement_policy";
     constexpr std::string_view TEMP_DIR_OPTION_NAME = "temp_dir";
     constexpr std::string_view MEMINDEX_MEMORY_QUOTA_OPTION_NAME = "memindex_memory_quota";
     constexpr std::string_view RESULT_CACHE_OPTION_NAME = "result_cache";
@@ -301,6 +306,7 @@ export {
 
     constexpr std::string_view RECORD_RUNNING_QUERY_OPTION_NAME = "record_running_query";
     constexpr std::string_view REPLAY_WAL_OPTION_NAME = "replay_wal";
+    constexpr std::string_view REPLAY_WAL_WORKER_OPTION_NAME = "replay_wal_worker";
 
     // Variable name
     constexpr std::string_view QUERY_COUNT_VAR_NAME = "query_count";                         // global and session
@@ -330,6 +336,8 @@ export {
     constexpr std::string_view MEMORY_CACHE_MISS_VAR_NAME = "memory_cache_miss";             // global
     constexpr std::string_view DISK_CACHE_MISS_VAR_NAME = "disk_cache_miss";                 // global
     constexpr std::string_view ENABLE_PROFILE_VAR_NAME = "profile";                          // global
+    constexpr std::string_view SCHEDULER_QUEUE_DEPTH_VAR_NAME = "scheduler_queue_depth";     // global
+    constexpr std::string_view SCHEDULER_WAIT_TIME_VAR_NAME = "scheduler_wait_time";         // global
 
     // Use for meta key encoding
     constexpr std::string_view LATEST_DATABASE_ID = "latest_database_id";
@@ -1108,9 +1108,15 @@ void HandleBoolType(ColumnField &output_column_field, SizeT row_count, const Sha
     output_column_field.column_vectors.emplace_back(dst.c_str(), dst.size());
 }
 
+void HandleColumnArray(ColumnField &output_column_field, SizeT row_count, const SharedPtr<ColumnVector> &column_vector) {
+    SizeT size = column_vector->data_type()->Size() * row_count;
+    auto *owner_ptr = new SharedPtr<ColumnVector>(column_vector);
+    nb::capsule owner(owner_ptr, [](void *ptr) noexcept { delete static_cast<SharedPtr<ColumnVector> *>(ptr); });
+    output_column_field.column_arrays.emplace_back(column_vector->data(), std::initializer_list<size_t>{size}, owner);
+}
+
 void HandlePodType(ColumnField &output_column_field, SizeT row_count, const SharedPtr<ColumnVector> &column_vector) {
-    auto size = column_vector->data_type()->Size() * row_count;
-    output_column_field.column_vectors.emplace_back(column_vector->data(), size);
+    HandleColumnArray(output_column_field, row_count, column_vector);
 }
 
 void HandleVarcharType(ColumnField &output_column_field, SizeT row_count, const SharedPtr<ColumnVector> &column_vector) {
@@ -1136,8 +1142,13 @@ void HandleVarcharType(ColumnField &output_column_field, SizeT row_count, const
 }
 
 void HandleEmbeddingType(ColumnField &output_column_field, SizeT row_count, const SharedPtr<ColumnVector> &column_vector) {
-    auto size = column_vector->data_type()->Size() * row_count;
-    output_column_field.column_vectors.emplace_back(column_vector->data(), size);
+    const auto *embedding_info = static_cast<const EmbeddingInfo *>(column_vector->data_type()->type_info().get());
+    if (embedding_info->Type() == EmbeddingDataType::kElemBit) {
+        auto size = column_vector->data_type()->Size() * row_count;
+        output_column_field.column_vectors.emplace_back(column_vector->data(), size);
+    } else {
+        HandleColumnArray(output_column_field, row_count, column_vector);
+    }
     output_column_field.column_type = column_vector->data_type()->type();
 }
 
@@ -1453,7 +1464,15 @@ WrapQueryResult WrapSearch(Infinity &instance,
                            WrapSearchExpr *wrap_search_expr,
                            WrapParsedExpr *filter_expr,
                            WrapParsedExpr *limit_expr,
-                           WrapParsedExpr *offset_expr) {
+                           WrapParsedExpr *offset_expr,
+                           const String &priority,
+                           bool profile) {
+
+    QueryPriority query_priority = StrToQueryPriority(priority);
+    if (query_priority == QueryPriority::kInvalid) {
+        return WrapQueryResult(ErrorCode::kInvalidQueryOption,
+                               fmt::format("Unknown priority: {}, expect interactive, batch or background", priority).c_str());
+    }
 
     SearchExpr *search_expr = nullptr;
     DeferFn defer_fn1([&]() {
@@ -1639,7 +1658,9 @@ WrapQueryResult WrapSearch(Infinity &instance,
                                         order_by_exprs,
                                         group_by_exprs,
                                         having,
-                                        total_hits_count_flag);
+                                        total_hits_count_flag,
+                                        query_priority,
+                                        profile);
     search_expr = nullptr;
     filter = nullptr;
     limit = nullptr;
@@ -1656,6 +1677,7 @@ WrapQueryResult WrapSearch(Infinity &instance,
     auto &columns = wrap_query_result.column_fields;
     columns.resize(query_result.result_table_->ColumnCount());
     ProcessDataBlocks(query_result, wrap_query_result, columns);
+    wrap_query_result.profile = std::move(query_result.profile_);
     return wrap_query_result;
 }
 
@@ -3,6 +3,7 @@ module;
 #include "parser/type/complex/embedding_type.h"
 #include <cstring>
 #include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
 #include <string>
 
 export module wrap_infinity;
@@ -53,9 +54,14 @@ namespace nb = nanobind;
 // wrap Infinity function for nanobind infinity
 namespace infinity {
 
+// Read only numpy view over the buffer of a result column vector, the view keeps the column vector alive.
+export using ColumnArray = nb::ndarray<nb::numpy, const u8, nb::ndim<1>>;
+
 export struct ColumnField {
     LogicalType column_type;
     Vector<nb::bytes> column_vectors;
+    // fixed-width columns are returned as views instead of copies in column_vectors
+    Vector<ColumnArray> column_arrays;
     String column_name;
 };
 
@@ -128,6 +134,8 @@ export struct WrapQueryResult {
     Vector<WrapColumnDef> column_defs;
     Vector<ColumnField> column_fields;
     String extra_result;
+    // json per-operator profile of a search
+    String profile;
     // show database
     String database_name;
     String store_dir;
@@ -442,7 +450,9 @@ export WrapQueryResult WrapSearch(Infinity &instance,
                                   WrapSearchExpr *wrap_search_expr = nullptr,
                                   WrapParsedExpr *where_expr = nullptr,
                                   WrapParsedExpr *limit_expr = nullptr,
-                                  WrapParsedExpr *offset_expr = nullptr);
+                                  WrapParsedExpr *offset_expr = nullptr,
+                                  const String &priority = "interactive",
+                                  bool profile = false);
 
 export WrapQueryResult WrapOptimize(Infinity &instance, const String &db_name, const String &table_name, WrapOptimizeOptions optimize_options);
 
@@ -1,4 +1,5 @@
 #include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
 #include <nanobind/stl/set.h>
 #include <nanobind/stl/shared_ptr.h>
 #include <nanobind/stl/string.h>
@@ -49,6 +50,7 @@ NB_MODULE(embedded_infinity_ext, m) {
         .def_rw("column_defs", &WrapQueryResult::column_defs)
         .def_rw("column_fields", &WrapQueryResult::column_fields)
         .def_rw("extra_result", &WrapQueryResult::extra_result)
+        .def_rw("profile", &WrapQueryResult::profile)
         .def_rw("database_name", &WrapQueryResult::database_name)
         .def_rw("store_dir", &WrapQueryResult::store_dir)
         .def_rw("table_count", &WrapQueryResult::table_count)
@@ -67,6 +69,7 @@ NB_MODULE(embedded_infinity_ext, m) {
         .def(nb::init<>())
         .def_rw("column_type", &ColumnField::column_type)
         .def_rw("column_vectors", &ColumnField::column_vectors)
+        .def_rw("column_arrays", &ColumnField::column_arrays)
         .def_rw("column_name", &ColumnField::column_name);
 
     nb::class_<WrapDataType>(m, "WrapDataType")
@@ -298,7 +301,7 @@ NB_MODULE(embedded_infinity_ext, m) {
         .def("ShowBlockColumn", &WrapShowBlockColumn)
         .def("ShowCurrentNode", &WrapShowCurrentNode)
 
-        .def("Insert", &WrapInsert)
+        .def("Insert", &WrapInsert, nb::call_guard<nb::gil_scoped_release>())
         .def("Import", &WrapImport)
         .def("Export", &WrapExport)
         .def("Delete", &WrapDelete, nb::arg("db_name"), nb::arg("table_name"), nb::arg("filter") = nullptr)
@@ -335,7 +338,9 @@ NB_MODULE(embedded_infinity_ext, m) {
              nb::arg("wrap_search_expr") = nullptr,
              nb::arg("where_expr") = nullptr,
              nb::arg("limit_expr") = nullptr,
-             nb::arg("offset_expr") = nullptr)
+             nb::arg("offset_expr") = nullptr,
+             nb::arg("priority") = "interactive",
+             nb::arg("profile") = false)
         .def("Optimize", &WrapOptimize, nb::arg("db_name"), nb::arg("table_name"), nb::arg("optimize_options"))
         .def("AddColumns", &WrapAddColumns, nb::arg("db_name"), nb::arg("table_name"), nb::arg("column_defs"))
         .def("DropColumns", &WrapDropColumns, nb::arg("db_name"), nb::arg("table_name"), nb::arg("column_names"));
@@ -355,6 +360,7 @@ NB_MODULE(embedded_infinity_ext, m) {
         .value("kFVECS", CopyFileType::kFVECS)
         .value("kCSR", CopyFileType::kCSR)
         .value("kBVECS", CopyFileType::kBVECS)
+        .value("kPARQUET", CopyFileType::kPARQUET)
         .value("kInvalid", CopyFileType::kInvalid);
 
     nb::class_<InitParameter>(m, "InitParameter")
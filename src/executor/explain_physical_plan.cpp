@@ -1282,6 +1282,20 @@ void ExplainPhysicalPlan::Explain(const PhysicalShow *show_node, SharedPtr<Vecto
             result->emplace_back(MakeShared<String>(output_columns_str));
             break;
         }
+        case ShowStmtType::kBufferCache: {
+            String show_str;
+            if (intent_size != 0) {
+                show_str = String(intent_size - 2, ' ') + "-> SHOW BUFFER CACHE ";
+            } else {
+                show_str = "SHOW BUFFER CACHE ";
+            }
+            show_str += "(" + std::to_string(show_node->node_id()) + ")";
+            result->emplace_back(MakeShared<String>(show_str));
+
+            String output_columns_str = String(intent_size, ' ') + " - output columns: [shard_id, unused_objects, protected_objects, hit_count, miss_count, evict_count]";
+            result->emplace_back(MakeShared<String>(output_columns_str));
+            break;
+        }
         case ShowStmtType::kMemIndex: {
             String show_str;
             if (intent_size != 0) {
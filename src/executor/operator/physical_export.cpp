@@ -81,6 +81,7 @@ void PhysicalExport::Init(QueryContext *query_context) {}
 
 bool PhysicalExport::Execute(QueryContext *query_context, OperatorState *operator_state) {
     ExportOperatorState *export_op_state = static_cast<ExportOperatorState *>(operator_state);
+    BufferNoCacheScope no_cache_scope;
     SizeT exported_row_count{0};
     switch (file_type_) {
         case CopyFileType::kCSV: {
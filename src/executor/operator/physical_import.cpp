@@ -24,6 +24,8 @@ module;
 #include <cstdio>
 #include <cstring>
 
+#include <exception>
+#include <future>
 #include <vector>
 
 module physical_import;
@@ -69,6 +71,7 @@ import virtual_store;
 import local_file_handle;
 import wal_manager;
 import infinity_context;
+import config;
 import statement_common;
 import new_txn;
 import txn_state;
@@ -1905,6 +1908,31 @@ Status CheckParquetColumns(TableInfo *table_info, arrow::ParquetFileReader *arro
     return Status::OK();
 }
 
+std::unique_ptr<arrow::ParquetFileReader> OpenParquetFile(const String &file_path) {
+    arrow::MemoryPool *pool = arrow::DefaultMemoryPool();
+
+    // Configure general Parquet reader settings
+    auto reader_properties = arrow::ParquetReaderProperties(pool);
+    reader_properties.enable_buffered_stream();
+
+    // Configure Arrow-specific Parquet reader settings
+    auto arrow_reader_props = arrow::ParquetArrowReaderProperties();
+    arrow_reader_props.set_batch_size(DEFAULT_BLOCK_CAPACITY);
+
+    arrow::ParquetFileReaderBuilder reader_builder;
+    if (const auto status = reader_builder.OpenFile(file_path, /*memory_map=*/true, reader_properties); !status.ok()) {
+        RecoverableError(Status::IOError(status.ToString()));
+    }
+    reader_builder.memory_pool(pool);
+    reader_builder.properties(arrow_reader_props);
+
+    auto build_result = reader_builder.Build();
+    if (!build_result.ok()) {
+        RecoverableError(Status::ImportFileFormatError(build_result.status().ToString()));
+    }
+    return build_result.MoveValueUnsafe();
+}
+
 } // namespace
 
 void PhysicalImport::ImportPARQUET(QueryContext *query_context, ImportOperatorState *import_op_state) {
@@ -2012,35 +2040,87 @@ void PhysicalImport::ImportPARQUET(QueryContext *query_context, ImportOperatorSt
 }
 
 void PhysicalImport::NewImportPARQUET(QueryContext *query_context, ImportOperatorState *import_op_state, Vector<SharedPtr<DataBlock>> &data_blocks) {
-    arrow::MemoryPool *pool = arrow::DefaultMemoryPool();
-
-    // Configure general Parquet reader settings
-    auto reader_properties = arrow::ParquetReaderProperties(pool);
-    reader_properties.enable_buffered_stream();
+    std::unique_ptr<arrow::ParquetFileReader> arrow_reader = OpenParquetFile(file_path_);
 
-    // Configure Arrow-specific Parquet reader settings
-    auto arrow_reader_props = arrow::ParquetArrowReaderProperties();
-    arrow_reader_props.set_batch_size(DEFAULT_BLOCK_CAPACITY);
-
-    arrow::ParquetFileReaderBuilder reader_builder;
-    if (const auto status = reader_builder.OpenFile(file_path_, /*memory_map=*/true, reader_properties); !status.ok()) {
-        RecoverableError(Status::IOError(status.ToString()));
+    if (Status status = CheckParquetColumns(table_info_.get(), arrow_reader.get()); !status.ok()) {
+        RecoverableError(status);
     }
-    reader_builder.memory_pool(pool);
-    reader_builder.properties(arrow_reader_props);
 
-    auto build_result = reader_builder.Build();
-    if (!build_result.ok()) {
-        RecoverableError(Status::ImportFileFormatError(build_result.status().ToString()));
+    // Row groups are independent, decode consecutive ranges of them on separate threads and concatenate the blocks in file order.
+    const int row_group_count = arrow_reader->num_row_groups();
+    const int task_count = std::max(1, std::min<int>(row_group_count, InfinityContext::instance().config()->CPULimit()));
+    Vector<Vector<SharedPtr<DataBlock>>> task_blocks(task_count);
+    {
+        ThreadPool thread_pool(task_count);
+        Vector<std::future<void>> futs;
+        futs.reserve(task_count);
+        for (int task_id = 0; task_id < task_count; ++task_id) {
+            Vector<int> row_groups;
+            for (int row_group = row_group_count * task_id / task_count; row_group < row_group_count * (task_id + 1) / task_count; ++row_group) {
+                row_groups.push_back(row_group);
+            }
+            futs.emplace_back(thread_pool.push([this, &task_blocks, task_id, row_groups = std::move(row_groups)](int) {
+                task_blocks[task_id] = ReadParquetRowGroups(row_groups);
+            }));
+        }
+        // wait for every task before rethrowing, they write into task_blocks
+        std::exception_ptr task_exception;
+        for (auto &fut : futs) {
+            try {
+                fut.get();
+            } catch (...) {
+                if (!task_exception) {
+                    task_exception = std::current_exception();
+                }
+            }
+        }
+        if (task_exception) {
+            std::rethrow_exception(task_exception);
+        }
     }
-    std::unique_ptr<arrow::ParquetFileReader> arrow_reader = build_result.MoveValueUnsafe();
 
-    if (Status status = CheckParquetColumns(table_info_.get(), arrow_reader.get()); !status.ok()) {
-        RecoverableError(status);
+    // Only the last block may be partially filled. The last block of a task is full when its row groups add up to a multiple of the
+    // block capacity, which is the common case for parquet writers, otherwise the rows after it are moved to fill the gap.
+    SizeT row_count = 0;
+    SharedPtr<DataBlock> pending_block;
+    for (auto &blocks : task_blocks) {
+        for (auto &block : blocks) {
+            row_count += block->row_count();
+            if (pending_block.get() == nullptr && block->row_count() == block->capacity()) {
+                data_blocks.push_back(std::move(block));
+                continue;
+            }
+            SizeT offset = 0;
+            while (offset < block->row_count()) {
+                if (pending_block.get() == nullptr) {
+                    pending_block = MakeShared<DataBlock>();
+                    pending_block->Init(block->types(), DEFAULT_BLOCK_CAPACITY);
+                }
+                SizeT copy_count = std::min(pending_block->available_capacity(), block->row_count() - offset);
+                pending_block->AppendWith(block.get(), offset, copy_count);
+                offset += copy_count;
+                if (pending_block->available_capacity() == 0) {
+                    pending_block->Finalize();
+                    data_blocks.push_back(std::move(pending_block));
+                }
+            }
+        }
+    }
+    if (pending_block.get() != nullptr) {
+        pending_block->Finalize();
+        data_blocks.push_back(std::move(pending_block));
     }
 
+    auto result_msg = MakeUnique<String>(fmt::format("IMPORT {} Rows", row_count));
+    import_op_state->result_msg_ = std::move(result_msg);
+}
+
+Vector<SharedPtr<DataBlock>> PhysicalImport::ReadParquetRowGroups(const Vector<int> &row_groups) {
+    // the file reader is not shared between threads, every task opens the memory mapped file by itself
+    std::unique_ptr<arrow::ParquetFileReader> arrow_reader = OpenParquetFile(file_path_);
+
     std::shared_ptr<arrow::RecordBatchReader> rb_reader;
-    if (auto status = arrow_reader->GetRecordBatchReader(&rb_reader); !status.ok()) {
+    if (auto status = arrow_reader->GetRecordBatchReader(row_groups, &rb_reader); !status.ok()) {
         RecoverableError(Status::ImportFileFormatError(status.ToString()));
     }
 
@@ -2072,10 +2152,7 @@ void PhysicalImport::NewImportPARQUET(QueryContext *query_context, ImportOperato
         }
     }
 
-    data_blocks = std::move(*import_ctx).Finalize();
-
-    auto result_msg = MakeUnique<String>(fmt::format("IMPORT {} Rows", import_ctx->row_count()));
-    import_op_state->result_msg_ = std::move(result_msg);
+    return std::move(*import_ctx).Finalize();
 }
 
 template <typename IndexType, typename IndexArray, typename DataType, typename DataArray>
@@ -123,6 +123,8 @@ public:
 
     void NewImportPARQUET(QueryContext *query_context, ImportOperatorState *import_op_state, Vector<SharedPtr<DataBlock>> &data_blocks);
 
+    Vector<SharedPtr<DataBlock>> ReadParquetRowGroups(const Vector<int> &row_groups);
+
     inline const TableInfo *table_info() const { return table_info_.get(); }
 
     inline CopyFileType FileType() const { return file_type_; }
@@ -125,6 +125,7 @@ void PhysicalIndexScan::ExecuteInternal(QueryContext *query_context, IndexScanOp
     if (!output_data_blocks.empty()) {
         UnrecoverableError("Index scan output data block array should be empty");
     }
+    index_scan_operator_state->filter_skipped_blocks_ = 0;
     // check before execute
     if (next_idx >= segment_ids.size()) {
         // Already finished
@@ -205,6 +206,7 @@ void PhysicalIndexScan::ExecuteInternal(QueryContext *query_context, IndexScanOp
     if (status.ok()) {
         if (fast_rough_filter_evaluator_ and !fast_rough_filter_evaluator_->Evaluate(begin_ts, *segment_filter)) {
             // skip this segment
+            index_scan_operator_state->filter_skipped_blocks_ = 1;
             LOG_TRACE(
                 fmt::format("IndexScan: job number: {}, segment_ids.size(): {}, skipped after FastRoughFilter", next_idx, segment_ids.size()));
             Bitmask result_empty(segment_row_count);
@@ -562,6 +562,7 @@ void PhysicalKnnScan::ExecuteInternalByColumnDataTypeAndQueryDataType(QueryConte
         LOG_TRACE(fmt::format("KnnScan: {} brute force {}/{}", knn_scan_function_data->task_id_, block_column_idx + 1, brute_task_n));
         // brute force
         // TODO: now will try to finish all block scan job in the task
+        BufferNoCacheScope no_cache_scope;
         do {
             BlockMeta *block_meta = knn_scan_shared_data->block_metas_->at(block_column_idx);
             ColumnMeta column_meta(knn_column_id, *block_meta);
@@ -652,6 +653,7 @@ void PhysicalKnnScan::ExecuteInternalByColumnDataTypeAndQueryDataType(QueryConte
                 UnrecoverableError(status.message());
             }
             index_base = index_base_ptr.get();
+            knn_scan_operator_state->index_name_ = *index_base->index_name_;
 
             switch (index_base->index_type_) {
                 case IndexType::kIVF: {
@@ -699,6 +701,13 @@ void PhysicalKnnScan::ExecuteInternalByColumnDataTypeAndQueryDataType(QueryConte
                                     rerank = true;
                                 }
                             }
+                            SizeT search_topk = knn_scan_shared_data->topk_;
+                            if constexpr (std::remove_pointer_t<decltype(hnsw_index)>::kRerank) {
+                                // 1-bit codes only shortlist candidates, the order always comes from the original vectors
+                                rerank = true;
+                                search_topk *= HNSW_RABITQ_RERANK_FACTOR;
+                                search_option.ef_ = std::max(search_option.ef_, search_topk);
+                            }
 
                             i64 result_n = -1;
                             for (u64 query_idx = 0; query_idx < knn_scan_shared_data->query_count_; ++query_idx) {
@@ -713,13 +722,13 @@ void PhysicalKnnScan::ExecuteInternalByColumnDataTypeAndQueryDataType(QueryConte
                                     if (with_lock) {
                                         std::tie(result_n1, d_ptr, l_ptr) =
                                             hnsw_index->template KnnSearch<BitmaskFilter<SegmentOffset>, true>(query,
-                                                                                                               knn_scan_shared_data->topk_,
+                                                                                                               search_topk,
                                                                                                                filter,
                                                                                                                search_option);
                                     } else {
                                         std::tie(result_n1, d_ptr, l_ptr) =
                                             hnsw_index->template KnnSearch<BitmaskFilter<SegmentOffset>, false>(query,
-                                                                                                                knn_scan_shared_data->topk_,
+                                                                                                                search_topk,
                                                                                                                 filter,
                                                                                                                 search_option);
                                     }
@@ -727,12 +736,12 @@ void PhysicalKnnScan::ExecuteInternalByColumnDataTypeAndQueryDataType(QueryConte
                                     SegmentOffset max_segment_offset = block_index->GetSegmentOffset(segment_id);
                                     if (!with_lock) {
                                         std::tie(result_n1, d_ptr, l_ptr) =
-                                            hnsw_index->template KnnSearch<false>(query, knn_scan_shared_data->topk_, search_option);
+                                            hnsw_index->template KnnSearch<false>(query, search_topk, search_option);
                                     } else {
                                         AppendFilter filter(max_segment_offset);
                                         std::tie(result_n1, d_ptr, l_ptr) =
                                             hnsw_index->template KnnSearch<AppendFilter, true>(query,
-                                                                                               knn_scan_shared_data->topk_,
+                                                                                               search_topk,
                                                                                                filter,
                                                                                                search_option);
                                     }
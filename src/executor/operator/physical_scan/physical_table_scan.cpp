@@ -45,6 +45,7 @@ import block_meta;
 import new_catalog;
 import column_meta;
 import status;
+import buffer_manager;
 
 namespace infinity {
 
@@ -52,6 +53,7 @@ void PhysicalTableScan::Init(QueryContext *query_context) {}
 
 bool PhysicalTableScan::Execute(QueryContext *query_context, OperatorState *operator_state) {
     auto *table_scan_operator_state = static_cast<TableScanOperatorState *>(operator_state);
+    BufferNoCacheScope no_cache_scope;
     ExecuteInternal(query_context, table_scan_operator_state);
     return true;
 }
@@ -103,6 +105,7 @@ void PhysicalTableScan::ExecuteInternal(QueryContext *query_context, TableScanOp
     table_scan_operator_state->data_block_array_.emplace_back(DataBlock::MakeUniquePtr());
     DataBlock *output_ptr = table_scan_operator_state->data_block_array_.back().get();
     output_ptr->Init(*GetOutputTypes());
+    table_scan_operator_state->filter_skipped_blocks_ = 0;
 
     TableScanFunctionData *table_scan_function_data_ptr = table_scan_operator_state->table_scan_function_data_.get();
     const BlockIndex *block_index = table_scan_function_data_ptr->block_index_;
@@ -152,6 +155,7 @@ void PhysicalTableScan::ExecuteInternal(QueryContext *query_context, TableScanOp
             if (status.ok()) {
                 if (fast_rough_filter_evaluator_ and !fast_rough_filter_evaluator_->Evaluate(begin_ts, *block_filter)) {
                     // skip this block
+                    ++table_scan_operator_state->filter_skipped_blocks_;
                     LOG_TRACE(fmt::format("TableScan: block_ids_idx: {}, block_ids.size(): {}, skipped after apply FastRoughFilter",
                                           block_ids_idx,
                                           block_ids_count));
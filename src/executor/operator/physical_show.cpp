@@ -92,9 +92,42 @@ import chunk_index_meta;
 import new_txn_manager;
 import kv_store;
 import meta_tree;
+import task_scheduler;
+import statement_common;
 
 namespace infinity {
 
+namespace {
+
+constexpr Array<QueryPriority, kQueryPriorityCount> kSchedulerPriorities = {QueryPriority::kInteractive,
+                                                                             QueryPriority::kBatch,
+                                                                             QueryPriority::kBackground};
+
+// e.g. "interactive: 0, batch: 12, background: 3"
+String SchedulerQueueDepth() {
+    TaskScheduler *task_scheduler = InfinityContext::instance().task_scheduler();
+    Vector<String> items;
+    for (QueryPriority priority : kSchedulerPriorities) {
+        TaskPriorityStats stats = task_scheduler->GetPriorityStats(priority);
+        items.emplace_back(fmt::format("{}: {}", QueryPriorityToStr(priority), stats.queue_depth_));
+    }
+    return fmt::format("{}", fmt::join(items, ", "));
+}
+
+// e.g. "interactive: avg 15us max 310us, batch: ...", the time tasks waited in the scheduler queues before a worker ran them
+String SchedulerWaitTime() {
+    TaskScheduler *task_scheduler = InfinityContext::instance().task_scheduler();
+    Vector<String> items;
+    for (QueryPriority priority : kSchedulerPriorities) {
+        TaskPriorityStats stats = task_scheduler->GetPriorityStats(priority);
+        u64 avg_wait_us = stats.started_count_ == 0 ? 0 : stats.total_wait_us_ / stats.started_count_;
+        items.emplace_back(fmt::format("{}: avg {}us max {}us", QueryPriorityToStr(priority), avg_wait_us, stats.max_wait_us_));
+    }
+    return fmt::format("{}", fmt::join(items, ", "));
+}
+
+} // namespace
+
 void PhysicalShow::Init(QueryContext *query_context) {
     auto varchar_type = MakeShared<DataType>(LogicalType::kVarchar);
     auto bigint_type = MakeShared<DataType>(LogicalType::kBigInt);
@@ -396,6 +429,20 @@ void PhysicalShow::Init(QueryContext *query_context) {
             output_types_->emplace_back(varchar_type);
             break;
         }
+        case ShowStmtType::kBufferCache: {
+            output_names_->reserve(6);
+            output_types_->reserve(6);
+            output_names_->emplace_back("shard_id");
+            output_names_->emplace_back("unused_objects");
+            output_names_->emplace_back("protected_objects");
+            output_names_->emplace_back("hit_count");
+            output_names_->emplace_back("miss_count");
+            output_names_->emplace_back("evict_count");
+            for (SizeT i = 0; i < 6; ++i) {
+                output_types_->emplace_back(bigint_type);
+            }
+            break;
+        }
         case ShowStmtType::kMemIndex: {
             output_names_->reserve(5);
             output_types_->reserve(5);
@@ -722,6 +769,10 @@ bool PhysicalShow::Execute(QueryContext *query_context, OperatorState *operator_
             ExecuteShowBuffer(query_context, show_operator_state);
             break;
         }
+        case ShowStmtType::kBufferCache: {
+            ExecuteShowBufferCache(query_context, show_operator_state);
+            break;
+        }
         case ShowStmtType::kMemIndex: {
             ExecuteShowMemIndex(query_context, show_operator_state);
             break;
@@ -4092,7 +4143,7 @@ void PhysicalShow::ExecuteShowGlobalVariable(QueryContext *query_context, ShowOp
 
             output_block_ptr->Init(output_column_types);
 
-            Value value = Value::MakeVarchar("round robin");
+            Value value = Value::MakeVarchar("priority, work stealing");
             ValueExpression value_expr(value);
             value_expr.AppendToChunk(output_block_ptr->column_vectors[0]);
             break;
@@ -4513,6 +4564,28 @@ void PhysicalShow::ExecuteShowGlobalVariable(QueryContext *query_context, ShowOp
             value_expr.AppendToChunk(output_block_ptr->column_vectors[0]);
             break;
         }
+        case GlobalVariable::kSchedulerQueueDepth:
+        case GlobalVariable::kSchedulerWaitTime: {
+            Vector<SharedPtr<ColumnDef>> output_column_defs = {
+                MakeShared<ColumnDef>(0, varchar_type, "value", std::set<ConstraintType>()),
+            };
+
+            SharedPtr<TableDef> table_def =
+                TableDef::Make(MakeShared<String>("default_db"), MakeShared<String>("variables"), nullptr, output_column_defs);
+            output_ = MakeShared<DataTable>(table_def, TableType::kResult);
+
+            Vector<SharedPtr<DataType>> output_column_types{
+                varchar_type,
+            };
+
+            output_block_ptr->Init(output_column_types);
+
+            String scheduler_stats = global_var == GlobalVariable::kSchedulerQueueDepth ? SchedulerQueueDepth() : SchedulerWaitTime();
+            Value value = Value::MakeVarchar(scheduler_stats);
+            ValueExpression value_expr(value);
+            value_expr.AppendToChunk(output_block_ptr->column_vectors[0]);
+            break;
+        }
         case GlobalVariable::kCleanupTrace: {
             CleanupInfoTracer *tracer = query_context->storage()->cleanup_info_tracer();
             String error_msg = tracer->GetCleanupInfo();
@@ -4747,7 +4820,7 @@ void PhysicalShow::ExecuteShowGlobalVariables(QueryContext *query_context, ShowO
                 }
                 {
                     // option value
-                    Value value = Value::MakeVarchar("round robin");
+                    Value value = Value::MakeVarchar("priority, work stealing");
                     ValueExpression value_expr(value);
                     value_expr.AppendToChunk(output_block_ptr->column_vectors[1]);
                 }
@@ -5205,6 +5278,48 @@ void PhysicalShow::ExecuteShowGlobalVariables(QueryContext *query_context, ShowO
                 }
                 break;
             }
+            case GlobalVariable::kSchedulerQueueDepth: {
+                {
+                    // option name
+                    Value value = Value::MakeVarchar(var_name);
+                    ValueExpression value_expr(value);
+                    value_expr.AppendToChunk(output_block_ptr->column_vectors[0]);
+                }
+                {
+                    // option value
+                    Value value = Value::MakeVarchar(SchedulerQueueDepth());
+                    ValueExpression value_expr(value);
+                    value_expr.AppendToChunk(output_block_ptr->column_vectors[1]);
+                }
+                {
+                    // option description
+                    Value value = Value::MakeVarchar("Scheduled tasks not started yet, per query priority");
+                    ValueExpression value_expr(value);
+                    value_expr.AppendToChunk(output_block_ptr->column_vectors[2]);
+                }
+                break;
+            }
+            case GlobalVariable::kSchedulerWaitTime: {
+                {
+                    // option name
+                    Value value = Value::MakeVarchar(var_name);
+                    ValueExpression value_expr(value);
+                    value_expr.AppendToChunk(output_block_ptr->column_vectors[0]);
+                }
+                {
+                    // option value
+                    Value value = Value::MakeVarchar(SchedulerWaitTime());
+                    ValueExpression value_expr(value);
+                    value_expr.AppendToChunk(output_block_ptr->column_vectors[1]);
+                }
+                {
+                    // option description
+                    Value value = Value::MakeVarchar("Time tasks wait in the scheduler queues, per query priority");
+                    ValueExpression value_expr(value);
+                    value_expr.AppendToChunk(output_block_ptr->column_vectors[2]);
+                }
+                break;
+            }
             case GlobalVariable::kCleanupTrace: {
                 CleanupInfoTracer *tracer = query_context->storage()->cleanup_info_tracer();
                 String error_msg = tracer->GetCleanupInfo();
@@ -5410,6 +5525,35 @@ void PhysicalShow::ExecuteShowBuffer(QueryContext *query_context, ShowOperatorSt
     return;
 }
 
+void PhysicalShow::ExecuteShowBufferCache(QueryContext *query_context, ShowOperatorState *operator_state) {
+    auto bigint_type = MakeShared<DataType>(LogicalType::kBigInt);
+    Vector<SharedPtr<DataType>> column_types(6, bigint_type);
+
+    UniquePtr<DataBlock> output_block_ptr = DataBlock::MakeUniquePtr();
+    output_block_ptr->Init(column_types);
+
+    // lru_num is at most 100, one block is enough
+    BufferManager *buffer_manager = query_context->storage()->buffer_manager();
+    Vector<BufferCacheInfo> cache_info_array = buffer_manager->GetBufferCacheInfo();
+    for (SizeT shard_id = 0; shard_id < cache_info_array.size(); ++shard_id) {
+        const BufferCacheInfo &cache_info = cache_info_array[shard_id];
+        Array<i64, 6> values{static_cast<i64>(shard_id),
+                             static_cast<i64>(cache_info.unused_count_),
+                             static_cast<i64>(cache_info.protected_count_),
+                             static_cast<i64>(cache_info.hit_count_),
+                             static_cast<i64>(cache_info.miss_count_),
+                             static_cast<i64>(cache_info.evict_count_)};
+        for (SizeT column_id = 0; column_id < values.size(); ++column_id) {
+            Value value = Value::MakeBigInt(values[column_id]);
+            ValueExpression value_expr(value);
+            value_expr.AppendToChunk(output_block_ptr->column_vectors[column_id]);
+        }
+    }
+
+    output_block_ptr->Finalize();
+    operator_state->output_.emplace_back(std::move(output_block_ptr));
+}
+
 void PhysicalShow::ExecuteShowMemIndex(QueryContext *query_context, ShowOperatorState *operator_state) {
     auto varchar_type = MakeShared<DataType>(LogicalType::kVarchar);
     auto bigint_type = MakeShared<DataType>(LogicalType::kBigInt);
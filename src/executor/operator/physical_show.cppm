@@ -125,6 +125,8 @@ private:
 
     void ExecuteShowBuffer(QueryContext *query_context, ShowOperatorState *operator_state);
 
+    void ExecuteShowBufferCache(QueryContext *query_context, ShowOperatorState *operator_state);
+
     void ExecuteShowMemIndex(QueryContext *query_context, ShowOperatorState *operator_state);
 
     void ExecuteShowQueries(QueryContext *query_context, ShowOperatorState *operator_state);
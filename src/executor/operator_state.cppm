@@ -65,6 +65,10 @@ export struct OperatorState {
     bool total_hits_count_flag_{};
     SizeT total_hits_count_{};
 
+    // Filled by the scan operators, reported through the task profiler
+    SizeT filter_skipped_blocks_{};
+    String index_name_{};
+
     inline void SetComplete() { complete_ = true; }
 
     inline bool Complete() const { return complete_; }
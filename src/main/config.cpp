@@ -319,6 +319,24 @@ Status Config::Init(const SharedPtr<String> &config_path, DefaultConfig *default
             UnrecoverableError(status.message());
         }
 
+        // Client protocol
+        String client_protocol = "binary";
+        UniquePtr<StringOption> client_protocol_option = MakeUnique<StringOption>(CLIENT_PROTOCOL_OPTION_NAME, client_protocol);
+        status = global_options_.AddOption(std::move(client_protocol_option));
+        if (!status.ok()) {
+            fmt::print("Fatal: {}", status.message());
+            UnrecoverableError(status.message());
+        }
+
+        // Client transport
+        String client_transport = "buffered";
+        UniquePtr<StringOption> client_transport_option = MakeUnique<StringOption>(CLIENT_TRANSPORT_OPTION_NAME, client_transport);
+        status = global_options_.AddOption(std::move(client_transport_option));
+        if (!status.ok()) {
+            fmt::print("Fatal: {}", status.message());
+            UnrecoverableError(status.message());
+        }
+
         // Log file name
         String log_filename = "infinity.log";
         UniquePtr<StringOption> log_file_name_option = MakeUnique<StringOption>(LOG_FILENAME_OPTION_NAME, log_filename);
@@ -495,6 +513,16 @@ Status Config::Init(const SharedPtr<String> &config_path, DefaultConfig *default
             UnrecoverableError(status.message());
         }
 
+        // Buffer replacement policy
+        String buffer_replacement_policy = "lru";
+        UniquePtr<StringOption> buffer_replacement_policy_option =
+            MakeUnique<StringOption>(BUFFER_REPLACEMENT_POLICY_OPTION_NAME, buffer_replacement_policy);
+        status = global_options_.AddOption(std::move(buffer_replacement_policy_option));
+        if (!status.ok()) {
+            fmt::print("Fatal: {}", status.message());
+            UnrecoverableError(status.message());
+        }
+
         // Memory index capacity
         i64 memindex_memory_quota = DEFAULT_MEMINDEX_MEMORY_QUOTA;
         UniquePtr<IntegerOption> memindex_memory_quota_option =
@@ -659,6 +687,15 @@ Status Config::Init(const SharedPtr<String> &config_path, DefaultConfig *default
         if (!status.ok()) {
             UnrecoverableError(status.message());
         }
+
+        // Replay WAL worker
+        i64 replay_wal_worker = 1;
+        UniquePtr<IntegerOption> replay_wal_worker_option =
+            MakeUnique<IntegerOption>(REPLAY_WAL_WORKER_OPTION_NAME, replay_wal_worker, Thread::hardware_concurrency(), 1);
+        status = global_options_.AddOption(std::move(replay_wal_worker_option));
+        if (!status.ok()) {
+            UnrecoverableError(status.message());
+        }
     } else {
         config_toml = toml::parse_file(*config_path);
 
@@ -1155,6 +1192,46 @@ Status Config::Init(const SharedPtr<String> &config_path, DefaultConfig *default
                             }
                             break;
                         }
+                        case GlobalOptionIndex::kClientProtocol: {
+                            // Thrift protocol of the client port
+                            String client_protocol = "binary";
+                            if (elem.second.is_string()) {
+                                client_protocol = elem.second.value_or(client_protocol);
+                            } else {
+                                return Status::InvalidConfig("'client_protocol' field isn't string.");
+                            }
+                            ToLower(client_protocol);
+                            if (client_protocol != "binary" && client_protocol != "compact") {
+                                return Status::InvalidConfig(fmt::format("Invalid client protocol: {}, expect binary or compact", client_protocol));
+                            }
+
+                            UniquePtr<StringOption> client_protocol_option = MakeUnique<StringOption>(CLIENT_PROTOCOL_OPTION_NAME, client_protocol);
+                            Status status = global_options_.AddOption(std::move(client_protocol_option));
+                            if (!status.ok()) {
+                                UnrecoverableError(status.message());
+                            }
+                            break;
+                        }
+                        case GlobalOptionIndex::kClientTransport: {
+                            // Thrift transport of the client port
+                            String client_transport = "buffered";
+                            if (elem.second.is_string()) {
+                                client_transport = elem.second.value_or(client_transport);
+                            } else {
+                                return Status::InvalidConfig("'client_transport' field isn't string.");
+                            }
+                            ToLower(client_transport);
+                            if (client_transport != "buffered" && client_transport != "framed") {
+                                return Status::InvalidConfig(fmt::format("Invalid client transport: {}, expect buffered or framed", client_transport));
+                            }
+
+                            UniquePtr<StringOption> client_transport_option = MakeUnique<StringOption>(CLIENT_TRANSPORT_OPTION_NAME, client_transport);
+                            Status status = global_options_.AddOption(std::move(client_transport_option));
+                            if (!status.ok()) {
+                                UnrecoverableError(status.message());
+                            }
+                            break;
+                        }
                         default: {
                             return Status::InvalidConfig(fmt::format("Unrecognized config parameter: {} in 'network' field", var_name));
                         }
@@ -1297,6 +1374,26 @@ Status Config::Init(const SharedPtr<String> &config_path, DefaultConfig *default
                         UnrecoverableError(status.message());
                     }
                 }
+
+                if (global_options_.GetOptionByIndex(GlobalOptionIndex::kClientProtocol) == nullptr) {
+                    // Client protocol
+                    String client_protocol = "binary";
+                    UniquePtr<StringOption> client_protocol_option = MakeUnique<StringOption>(CLIENT_PROTOCOL_OPTION_NAME, client_protocol);
+                    Status status = global_options_.AddOption(std::move(client_protocol_option));
+                    if (!status.ok()) {
+                        UnrecoverableError(status.message());
+                    }
+                }
+
+                if (global_options_.GetOptionByIndex(GlobalOptionIndex::kClientTransport) == nullptr) {
+                    // Client transport
+                    String client_transport = "buffered";
+                    UniquePtr<StringOption> client_transport_option = MakeUnique<StringOption>(CLIENT_TRANSPORT_OPTION_NAME, client_transport);
+                    Status status = global_options_.AddOption(std::move(client_transport_option));
+                    if (!status.ok()) {
+                        UnrecoverableError(status.message());
+                    }
+                }
             } else {
                 return Status::InvalidConfig("No 'network' section in configure file.");
             }
@@ -1552,6 +1649,25 @@ Status Config::Init(const SharedPtr<String> &config_path, DefaultConfig *default
                             }
                             break;
                         }
+                        case GlobalOptionIndex::kReplayWalWorker: {
+                            // Threads applying appends and deletes of different tables during replay
+                            i64 replay_wal_worker = 1;
+                            if (elem.second.is_integer()) {
+                                replay_wal_worker = elem.second.value_or(replay_wal_worker);
+                            } else {
+                                return Status::InvalidConfig("'replay_wal_worker' field isn't integer.");
+                            }
+                            UniquePtr<IntegerOption> replay_wal_worker_option =
+                                MakeUnique<IntegerOption>(REPLAY_WAL_WORKER_OPTION_NAME, replay_wal_worker, Thread::hardware_concurrency(), 1);
+                            if (!replay_wal_worker_option->Validate()) {
+                                return Status::InvalidConfig(fmt::format("Invalid replay wal worker number: {}", replay_wal_worker));
+                            }
+                            Status status = global_options_.AddOption(std::move(replay_wal_worker_option));
+                            if (!status.ok()) {
+                                UnrecoverableError(status.message());
+                            }
+                            break;
+                        }
                         case GlobalOptionIndex::kDataDir: {
                             // Data Dir
                             String data_dir = "/var/infinity/data";
@@ -1930,6 +2046,16 @@ Status Config::Init(const SharedPtr<String> &config_path, DefaultConfig *default
                     }
                 }
 
+                if (global_options_.GetOptionByIndex(GlobalOptionIndex::kReplayWalWorker) == nullptr) {
+                    i64 replay_wal_worker = 1;
+                    UniquePtr<IntegerOption> replay_wal_worker_option =
+                        MakeUnique<IntegerOption>(REPLAY_WAL_WORKER_OPTION_NAME, replay_wal_worker, Thread::hardware_concurrency(), 1);
+                    Status status = global_options_.AddOption(std::move(replay_wal_worker_option));
+                    if (!status.ok()) {
+                        UnrecoverableError(status.message());
+                    }
+                }
+
                 if (global_options_.GetOptionByIndex(GlobalOptionIndex::kPersistenceDir) == nullptr) {
                     String persistence_dir =
                         (global_options_.GetOptionByIndex(GlobalOptionIndex::kDataDir) == nullptr) ? DEFAULT_PERSISTENCE_DIR.data() : "";
@@ -2125,6 +2251,28 @@ Status Config::Init(const SharedPtr<String> &config_path, DefaultConfig *default
                             global_options_.AddOption(std::move(lru_num_option));
                             break;
                         }
+                        case GlobalOptionIndex::kBufferReplacementPolicy: {
+                            // Eviction order of the unpinned buffer objects
+                            String buffer_replacement_policy = "lru";
+                            if (elem.second.is_string()) {
+                                buffer_replacement_policy = elem.second.value_or(buffer_replacement_policy);
+                            } else {
+                                return Status::InvalidConfig("'buffer_replacement_policy' field isn't string.");
+                            }
+                            ToLower(buffer_replacement_policy);
+                            if (buffer_replacement_policy != "lru" && buffer_replacement_policy != "2q") {
+                                return Status::InvalidConfig(
+                                    fmt::format("Invalid buffer replacement policy: {}, expect lru or 2q", buffer_replacement_policy));
+                            }
+
+                            UniquePtr<StringOption> buffer_replacement_policy_option =
+                                MakeUnique<StringOption>(BUFFER_REPLACEMENT_POLICY_OPTION_NAME, buffer_replacement_policy);
+                            Status status = global_options_.AddOption(std::move(buffer_replacement_policy_option));
+                            if (!status.ok()) {
+                                UnrecoverableError(status.message());
+                            }
+                            break;
+                        }
                         case GlobalOptionIndex::kTempDir: {
                             String temp_dir = "/var/infinity/tmp";
                             if (elem.second.is_string()) {
@@ -2204,6 +2352,17 @@ Status Config::Init(const SharedPtr<String> &config_path, DefaultConfig *default
                     }
                 }
 
+                if (global_options_.GetOptionByIndex(GlobalOptionIndex::kBufferReplacementPolicy) == nullptr) {
+                    // Buffer replacement policy
+                    String buffer_replacement_policy = "lru";
+                    UniquePtr<StringOption> buffer_replacement_policy_option =
+                        MakeUnique<StringOption>(BUFFER_REPLACEMENT_POLICY_OPTION_NAME, buffer_replacement_policy);
+                    Status status = global_options_.AddOption(std::move(buffer_replacement_policy_option));
+                    if (!status.ok()) {
+                        UnrecoverableError(status.message());
+                    }
+                }
+
                 if (global_options_.GetOptionByIndex(GlobalOptionIndex::kTempDir) == nullptr) {
                     // Temp Dir
                     String temp_dir = "/var/infinity/tmp";
@@ -2633,6 +2792,16 @@ i64 Config::PeerServerConnectionPoolSize() {
     return global_options_.GetIntegerValue(GlobalOptionIndex::kPeerServerConnectionPoolSize);
 }
 
+String Config::ClientProtocol() {
+    std::lock_guard<std::mutex> guard(mutex_);
+    return global_options_.GetStringValue(GlobalOptionIndex::kClientProtocol);
+}
+
+String Config::ClientTransport() {
+    std::lock_guard<std::mutex> guard(mutex_);
+    return global_options_.GetStringValue(GlobalOptionIndex::kClientTransport);
+}
+
 i64 Config::PeerRetryDelay() {
     std::lock_guard<std::mutex> guard(mutex_);
     return global_options_.GetIntegerValue(GlobalOptionIndex::kPeerRetryDelay);
@@ -2730,6 +2899,11 @@ bool Config::ReplayWal() {
     return global_options_.GetBoolValue(GlobalOptionIndex::kReplayWal);
 }
 
+i64 Config::ReplayWalWorker() {
+    std::lock_guard<std::mutex> guard(mutex_);
+    return global_options_.GetIntegerValue(GlobalOptionIndex::kReplayWalWorker);
+}
+
 String Config::DataDir() {
     std::lock_guard<std::mutex> guard(mutex_);
     return global_options_.GetStringValue(GlobalOptionIndex::kDataDir);
@@ -2869,6 +3043,11 @@ SizeT Config::LRUNum() {
     return global_options_.GetIntegerValue(GlobalOptionIndex::kLRUNum);
 }
 
+String Config::BufferReplacementPolicy() {
+    std::lock_guard<std::mutex> guard(mutex_);
+    return global_options_.GetStringValue(GlobalOptionIndex::kBufferReplacementPolicy);
+}
+
 String Config::TempDir() {
     std::lock_guard<std::mutex> guard(mutex_);
     return global_options_.GetStringValue(GlobalOptionIndex::kTempDir);
@@ -3047,6 +3226,7 @@ void Config::PrintAll() {
     fmt::print(" - dense_index_building_worker: {}\n", DenseIndexBuildingWorker());
     fmt::print(" - sparse_index_building_worker: {}\n", SparseIndexBuildingWorker());
     fmt::print(" - fulltext_index_building_worker: {}\n", FulltextIndexBuildingWorker());
+    fmt::print(" - replay_wal_worker: {}\n", ReplayWalWorker());
     fmt::print(" - storage_type: {}\n", ToString(StorageType()));
     switch (StorageType()) {
         case StorageType::kLocal: {
@@ -3068,6 +3248,7 @@ void Config::PrintAll() {
 
     // Buffer manager
     fmt::print(" - buffer_manager_size: {}\n", Utility::FormatByteSize(BufferManagerSize()));
+    fmt::print(" - buffer_replacement_policy: {}\n", BufferReplacementPolicy());
     fmt::print(" - temp_dir: {}\n", TempDir());
     fmt::print(" - memindex_memory_quota: {}\n", Utility::FormatByteSize(MemIndexMemoryQuota()));
 
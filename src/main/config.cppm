@@ -73,6 +73,8 @@ public:
     i64 ClientPort();
     i64 ConnectionPoolSize();
     i64 PeerServerConnectionPoolSize();
+    String ClientProtocol();
+    String ClientTransport();
 
     i64 PeerRetryDelay();
     i64 PeerRetryCount();
@@ -96,6 +98,7 @@ public:
 
     // Storage
     bool ReplayWal();
+    i64 ReplayWalWorker();
     String DataDir();
     String CatalogDir();
     String SnapshotDir();
@@ -128,6 +131,7 @@ public:
     // Buffer
     i64 BufferManagerSize();
     SizeT LRUNum();
+    String BufferReplacementPolicy();
     String TempDir();
 
     i64 MemIndexMemoryQuota();
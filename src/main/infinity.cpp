@@ -31,6 +31,7 @@ import infinity_context;
 import session;
 import session_manager;
 import query_context;
+import profiler;
 import parsed_expr;
 import search_expr;
 import statement_common;
@@ -40,6 +41,7 @@ import show_statement;
 import drop_statement;
 import command_statement;
 import select_statement;
+import base_statement;
 import flush_statement;
 import table_reference;
 import insert_statement;
@@ -1148,7 +1150,9 @@ QueryResult Infinity::Search(const String &db_name,
                              Vector<OrderByExpr *> *order_by_list,
                              Vector<ParsedExpr *> *group_by_list,
                              ParsedExpr *having,
-                             bool total_hits_count_flag) {
+                             bool total_hits_count_flag,
+                             QueryPriority priority,
+                             bool profile) {
     if (total_hits_count_flag) {
         if (limit == nullptr) {
             QueryResult query_result;
@@ -1200,6 +1204,10 @@ QueryResult Infinity::Search(const String &db_name,
     });
     UniquePtr<QueryContext> query_context_ptr;
     GET_QUERY_CONTEXT(GetQueryContext(), query_context_ptr);
+    if (profile) {
+        query_context_ptr->set_profile();
+        query_context_ptr->CreateQueryProfiler();
+    }
     UniquePtr<SelectStatement> select_statement = MakeUnique<SelectStatement>();
 
     auto *table_ref = new TableReference();
@@ -1223,6 +1231,7 @@ QueryResult Infinity::Search(const String &db_name,
     select_statement->group_by_list_ = group_by_list;
     select_statement->having_expr_ = having;
     select_statement->total_hits_count_flag_ = total_hits_count_flag;
+    select_statement->priority_ = priority;
 
     output_columns = nullptr;
     highlight_columns = nullptr;
@@ -1231,10 +1240,61 @@ QueryResult Infinity::Search(const String &db_name,
     search_expr = nullptr;
 
     QueryResult result = query_context_ptr->QueryStatement(select_statement.get());
+    if (profile and result.IsOk() and query_context_ptr->query_profiler() != nullptr) {
+        result.profile_ = QueryProfiler::Serialize(query_context_ptr->query_profiler()).dump();
+    }
 
     return result;
 }
 
+Vector<QueryResult> Infinity::SearchBatch(const String &db_name,
+                                          const String &table_name,
+                                          Vector<SearchExpr *> &search_exprs,
+                                          Vector<ParsedExpr *> &filters,
+                                          Vector<Vector<ParsedExpr *> *> &output_columns_list,
+                                          QueryPriority priority) {
+    const SizeT query_count = search_exprs.size();
+    Vector<UniquePtr<SelectStatement>> select_statements;
+    select_statements.reserve(query_count);
+    for (SizeT i = 0; i < query_count; ++i) {
+        UniquePtr<SelectStatement> select_statement = MakeUnique<SelectStatement>();
+
+        auto *table_ref = new TableReference();
+        table_ref->db_name_ = db_name;
+        ToLower(table_ref->db_name_);
+        table_ref->table_name_ = table_name;
+        ToLower(table_ref->table_name_);
+
+        select_statement->table_ref_ = table_ref;
+        select_statement->select_list_ = output_columns_list[i];
+        select_statement->where_expr_ = filters[i];
+        select_statement->search_expr_ = search_exprs[i];
+        select_statement->priority_ = priority;
+        output_columns_list[i] = nullptr;
+        filters[i] = nullptr;
+        search_exprs[i] = nullptr;
+        select_statements.push_back(std::move(select_statement));
+    }
+
+    auto query_context = GetQueryContext();
+    if (std::holds_alternative<QueryResult>(query_context)) {
+        Vector<QueryResult> query_results(query_count);
+        for (auto &query_result : query_results) {
+            query_result.result_table_ = nullptr;
+            query_result.status_ = std::get<QueryResult>(query_context).status_.clone();
+        }
+        return query_results;
+    }
+    UniquePtr<QueryContext> query_context_ptr = std::move(std::get<UniquePtr<QueryContext>>(query_context));
+
+    Vector<const BaseStatement *> statements;
+    statements.reserve(query_count);
+    for (const auto &select_statement : select_statements) {
+        statements.push_back(select_statement.get());
+    }
+    return query_context_ptr->QueryStatements(statements);
+}
+
 QueryResult Infinity::Optimize(const String &db_name, const String &table_name, OptimizeOptions optimize_option) {
     UniquePtr<QueryContext> query_context_ptr;
     GET_QUERY_CONTEXT(GetQueryContext(), query_context_ptr);
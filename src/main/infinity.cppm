@@ -34,6 +34,7 @@ import update_statement;
 import explain_statement;
 import command_statement;
 import select_statement;
+import statement_common;
 import global_resource_usage;
 import query_context;
 
@@ -196,7 +197,17 @@ public:
                        Vector<OrderByExpr *> *order_by_list,
                        Vector<ParsedExpr *> *group_by_list,
                        ParsedExpr *having,
-                       bool total_hits_count_flag);
+                       bool total_hits_count_flag,
+                       QueryPriority priority = QueryPriority::kInteractive,
+                       bool profile = false);
+
+    // The i-th query searches search_exprs[i] with filters[i] (may be nullptr), all of them run in one transaction
+    Vector<QueryResult> SearchBatch(const String &db_name,
+                                    const String &table_name,
+                                    Vector<SearchExpr *> &search_exprs,
+                                    Vector<ParsedExpr *> &filters,
+                                    Vector<Vector<ParsedExpr *> *> &output_columns_list,
+                                    QueryPriority priority = QueryPriority::kInteractive);
 
     QueryResult Optimize(const String &db_name, const String &table_name, OptimizeOptions optimize_options = OptimizeOptions{});
 
@@ -48,6 +48,8 @@ GlobalOptions::GlobalOptions() {
     name2index_[String(CLIENT_PORT_OPTION_NAME)] = GlobalOptionIndex::kClientPort;
     name2index_[String(CONNECTION_POOL_SIZE_OPTION_NAME)] = GlobalOptionIndex::kConnectionPoolSize;
     name2index_[String(PEER_SERVER_CONNECTION_POOL_SIZE_OPTION_NAME)] = GlobalOptionIndex::kPeerServerConnectionPoolSize;
+    name2index_[String(CLIENT_PROTOCOL_OPTION_NAME)] = GlobalOptionIndex::kClientProtocol;
+    name2index_[String(CLIENT_TRANSPORT_OPTION_NAME)] = GlobalOptionIndex::kClientTransport;
     name2index_[String(LOG_FILENAME_OPTION_NAME)] = GlobalOptionIndex::kLogFileName;
 
     name2index_[String(LOG_DIR_OPTION_NAME)] = GlobalOptionIndex::kLogDir;
@@ -77,6 +79,7 @@ GlobalOptions::GlobalOptions() {
 
     name2index_[String(BUFFER_MANAGER_SIZE_OPTION_NAME)] = GlobalOptionIndex::kBufferManagerSize;
     name2index_[String(LRU_NUM_OPTION_NAME)] = GlobalOptionIndex::kLRUNum;
+    name2index_[String(BUFFER_REPLACEMENT_POLICY_OPTION_NAME)] = GlobalOptionIndex::kBufferReplacementPolicy;
     name2index_[String(TEMP_DIR_OPTION_NAME)] = GlobalOptionIndex::kTempDir;
     name2index_[String(MEMINDEX_MEMORY_QUOTA_OPTION_NAME)] = GlobalOptionIndex::kMemIndexMemoryQuota;
 
@@ -99,6 +102,7 @@ GlobalOptions::GlobalOptions() {
 
     name2index_[String(RECORD_RUNNING_QUERY_OPTION_NAME)] = GlobalOptionIndex::kRecordRunningQuery;
     name2index_[String(REPLAY_WAL_OPTION_NAME)] = GlobalOptionIndex::kReplayWal;
+    name2index_[String(REPLAY_WAL_WORKER_OPTION_NAME)] = GlobalOptionIndex::kReplayWalWorker;
 }
 
 Status GlobalOptions::AddOption(UniquePtr<BaseOption> option) {
@@ -174,7 +174,11 @@ export enum class GlobalOptionIndex : i8 {
     kSnapshotDir = 56,
     kCatalogDir = 57,
     kReplayWal = 58,
-    kInvalid = 59,
+    kClientProtocol = 59,
+    kClientTransport = 60,
+    kReplayWalWorker = 61,
+    kBufferReplacementPolicy = 62,
+    kInvalid = 63,
 };
 
 export struct GlobalOptions {
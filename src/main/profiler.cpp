@@ -171,8 +171,15 @@ void TaskProfiler::StopOperator(const OperatorState *operator_state) {
 
     i64 elapsed_time = profiler_.Elapsed();
 
-    OperatorInformation
-        info(active_operator_->GetName(), profiler_.GetBegin(), profiler_.GetEnd(), elapsed_time, input_rows, output_data_size, output_rows);
+    OperatorInformation info(active_operator_->GetName(),
+                             profiler_.GetBegin(),
+                             profiler_.GetEnd(),
+                             elapsed_time,
+                             input_rows,
+                             output_data_size,
+                             output_rows,
+                             operator_state->filter_skipped_blocks_,
+                             operator_state->index_name_);
 
     timings_.push_back(std::move(info));
     active_operator_ = nullptr;
@@ -349,6 +356,8 @@ nlohmann::json QueryProfiler::Serialize(const QueryProfiler *profiler) {
                     json_info["input_rows"] = op.input_rows_;
                     json_info["output_rows"] = op.output_rows_;
                     json_info["output_data_size"] = op.output_data_size_;
+                    json_info["filter_skipped_blocks"] = op.filter_skipped_blocks_;
+                    json_info["index"] = op.index_name_;
                     json_operators["infos"].push_back(json_info);
                 }
                 times++;
@@ -88,15 +88,25 @@ struct OperatorInformation {
 
     OperatorInformation(const OperatorInformation &other)
         : name_(other.name_), start_(other.start_), end_(other.end_), elapsed_(other.elapsed_), input_rows_(other.input_rows_),
-          output_data_size_(other.output_data_size_), output_rows_(other.output_rows_) {}
+          output_data_size_(other.output_data_size_), output_rows_(other.output_rows_), filter_skipped_blocks_(other.filter_skipped_blocks_),
+          index_name_(other.index_name_) {}
 
     OperatorInformation(OperatorInformation &&other)
         : name_(std::move(other.name_)), start_(other.start_), end_(other.end_), elapsed_(other.elapsed_), input_rows_(other.input_rows_),
-          output_data_size_(other.output_data_size_), output_rows_(other.output_rows_) {}
-
-    OperatorInformation(String name, i64 start, i64 end, i64 elapsed, u16 input_rows, i32 output_data_size, u16 output_rows)
+          output_data_size_(other.output_data_size_), output_rows_(other.output_rows_), filter_skipped_blocks_(other.filter_skipped_blocks_),
+          index_name_(std::move(other.index_name_)) {}
+
+    OperatorInformation(String name,
+                        i64 start,
+                        i64 end,
+                        i64 elapsed,
+                        u64 input_rows,
+                        u64 output_data_size,
+                        u64 output_rows,
+                        u64 filter_skipped_blocks,
+                        String index_name)
         : name_(std::move(name)), start_(start), end_(end), elapsed_(elapsed), input_rows_(input_rows), output_data_size_(output_data_size),
-          output_rows_(output_rows) {}
+          output_rows_(output_rows), filter_skipped_blocks_(filter_skipped_blocks), index_name_(std::move(index_name)) {}
 
     OperatorInformation &operator=(OperatorInformation &&other) {
         if (this != &other) {
@@ -107,6 +117,8 @@ struct OperatorInformation {
             input_rows_ = other.input_rows_;
             output_rows_ = other.output_rows_;
             output_data_size_ = other.output_data_size_;
+            filter_skipped_blocks_ = other.filter_skipped_blocks_;
+            index_name_ = std::move(other.index_name_);
         }
         return *this;
     }
@@ -116,9 +128,13 @@ struct OperatorInformation {
     i64 start_{};
     i64 end_{};
     i64 elapsed_{};
-    u16 input_rows_{};
-    i32 output_data_size_{};
-    u16 output_rows_{};
+    u64 input_rows_{};
+    u64 output_data_size_{};
+    u64 output_rows_{};
+    // blocks (or segments for index scan) pruned by the fast rough filter
+    u64 filter_skipped_blocks_{};
+    // empty when the operator did not search through an index
+    String index_name_{};
 };
 
 export struct TaskBinding {
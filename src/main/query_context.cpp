@@ -346,9 +346,9 @@ void QueryContext::CreateQueryProfiler() {
     }
     query_profiler_flag = catalog->GetProfile();
 
-    if (query_profiler_flag or explain_analyze_) {
+    if (query_profiler_flag or explain_analyze_ or profile_) {
         if (query_profiler_ == nullptr) {
-            query_profiler_ = MakeShared<QueryProfiler>(query_profiler_flag);
+            query_profiler_ = MakeShared<QueryProfiler>(query_profiler_flag or profile_);
         }
     }
 }
@@ -442,6 +442,110 @@ bool QueryContext::JoinBGStatement(BGQueryState &state, TxnTimeStamp &commit_ts,
     return true;
 }
 
+Vector<QueryResult> QueryContext::QueryStatements(const Vector<const BaseStatement *> &base_statements) {
+    Vector<QueryResult> query_results(base_statements.size());
+    if (base_statements.empty()) {
+        return query_results;
+    }
+    if (!InfinityContext::instance().InfinityContextStarted()) {
+        for (auto &query_result : query_results) {
+            query_result.result_table_ = nullptr;
+            query_result.status_ = Status::InfinityIsStarting();
+        }
+        return query_results;
+    }
+
+    query_id_ = session_ptr_->query_count();
+    Status status;
+    bool txn_begun = false;
+    try {
+        this->BeginTxn(base_statements[0]);
+        txn_begun = true;
+
+        // One plan per cpu is in flight, a large batch does not flood the scheduler queues
+        const SizeT window_size = std::max<SizeT>(cpu_number_limit_, 1);
+        for (SizeT window_begin = 0; status.ok() && window_begin < base_statements.size(); window_begin += window_size) {
+            Vector<BGQueryState> states(std::min(window_size, base_statements.size() - window_begin));
+            SizeT scheduled_n = 0;
+            try {
+                for (; scheduled_n < states.size(); ++scheduled_n) {
+                    const BaseStatement *base_statement = base_statements[window_begin + scheduled_n];
+                    BGQueryState &state = states[scheduled_n];
+                    SharedPtr<BindContext> bind_context;
+                    Status plan_status = logical_planner_->Build(base_statement, bind_context);
+                    if (!plan_status.ok()) {
+                        RecoverableError(std::move(plan_status));
+                    }
+                    current_max_node_id_ = bind_context->GetNewLogicalNodeId();
+                    state.logical_plans = logical_planner_->LogicalPlans();
+                    for (auto &logical_plan : state.logical_plans) {
+                        optimizer_->optimize(logical_plan, base_statement->type_);
+                        state.physical_plans.push_back(physical_planner_->BuildPhysicalOperator(logical_plan));
+                    }
+                    Vector<PhysicalOperator *> physical_plan_ptrs;
+                    for (auto &physical_plan : state.physical_plans) {
+                        physical_plan_ptrs.push_back(physical_plan.get());
+                    }
+                    state.plan_fragment = fragment_builder_->BuildFragment(physical_plan_ptrs);
+                    state.notifier = MakeUnique<Notifier>();
+                    FragmentContext::BuildTask(this, nullptr, state.plan_fragment.get(), state.notifier.get());
+                    scheduler_->Schedule(state.plan_fragment.get(), base_statement);
+                }
+            } catch (RecoverableException &e) {
+                status.Init(e.ErrorCode(), e.what());
+            }
+            // Tasks of the scheduled plans refer to the states, wait for them even after an error
+            for (SizeT i = 0; i < scheduled_n; ++i) {
+                QueryResult &query_result = query_results[window_begin + i];
+                try {
+                    query_result.result_table_ = states[i].plan_fragment->GetResult();
+                    query_result.root_operator_type_ = states[i].logical_plans.back()->operator_type();
+                } catch (RecoverableException &e) {
+                    query_result.result_table_ = nullptr;
+                    query_result.status_.Init(e.ErrorCode(), e.what());
+                    if (status.ok()) {
+                        status = query_result.status_.clone();
+                    }
+                }
+            }
+        }
+
+        if (status.ok()) {
+            this->CommitTxn();
+        }
+    } catch (RecoverableException &e) {
+        if (status.ok()) {
+            status.Init(e.ErrorCode(), e.what());
+        }
+    } catch (UnrecoverableException &e) {
+        printf("UnrecoverableException %s\n", e.what());
+        LOG_CRITICAL(e.what());
+        raise(SIGUSR1);
+    }
+
+    if (!status.ok()) {
+        if (txn_begun) {
+            NewTxn *new_txn = this->GetNewTxn();
+            if (new_txn != nullptr && new_txn->GetTxnState() != TxnState::kCommitted && new_txn->GetTxnState() != TxnState::kRollbacked) {
+                try {
+                    this->RollbackTxn();
+                } catch (RecoverableException &e) {
+                    LOG_ERROR(fmt::format("Rollback batch query failed: {}", e.what()));
+                }
+            }
+        }
+        // the batch fails as a whole
+        for (auto &query_result : query_results) {
+            query_result.result_table_ = nullptr;
+            query_result.status_ = status.clone();
+        }
+    }
+
+    session_ptr_->IncreaseQueryCount();
+    session_manager_->IncreaseQueryCount();
+    return query_results;
+}
+
 QueryResult QueryContext::HandleAdminStatement(const AdminStatement *admin_statement) { return AdminExecutor::Execute(this, admin_statement); }
 
 void QueryContext::BeginTxn(const BaseStatement *base_statement) {
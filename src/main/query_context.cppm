@@ -31,6 +31,7 @@ import status;
 import query_result;
 import base_statement;
 import admin_statement;
+import statement_common;
 
 export module query_context;
 
@@ -74,6 +75,9 @@ public:
 
     QueryResult QueryStatementInternal(const BaseStatement *statement);
 
+    // Run the statements in one transaction, their plans are executed by the task scheduler concurrently
+    Vector<QueryResult> QueryStatements(const Vector<const BaseStatement *> &statements);
+
     bool ExecuteBGStatement(BaseStatement *statement, BGQueryState &state);
 
     bool JoinBGStatement(BGQueryState &state, TxnTimeStamp &commit_ts, bool rollback = false);
@@ -95,6 +99,10 @@ public:
     inline void set_explain_analyze() { explain_analyze_ = true; }
     [[nodiscard]] inline bool explain_analyze() const { return explain_analyze_; }
 
+    // Collect the per-operator profile of a single query without enabling the global profile
+    inline void set_profile() { profile_ = true; }
+    [[nodiscard]] inline bool profile() const { return profile_; }
+
     inline u64 GetNextNodeID() { return ++current_max_node_id_; }
 
     void BeginTxn(const BaseStatement *statement);
@@ -130,6 +138,10 @@ public:
 
     [[nodiscard]] BaseSession *current_session() const { return session_ptr_; }
 
+    [[nodiscard]] inline QueryPriority priority() const { return priority_; }
+
+    inline void set_priority(QueryPriority priority) { priority_ = priority; }
+
     void FlushProfiler(TaskProfiler &&profiler) {
         if (query_profiler_) {
             query_profiler_->Flush(std::move(profiler));
@@ -157,6 +169,7 @@ private:
 
     SharedPtr<QueryProfiler> query_profiler_{};
     bool explain_analyze_{};
+    bool profile_{};
 
     Config *global_config_{};
     TaskScheduler *scheduler_{};
@@ -180,6 +193,8 @@ private:
     u64 cpu_number_limit_{};
     u64 memory_size_limit_{};
 
+    QueryPriority priority_{QueryPriority::kInteractive};
+
     bool initialized_{false};
 };
 
@@ -63,6 +63,8 @@ public:
 
 export struct QueryResult : public BaseResult {
     LogicalNodeType root_operator_type_{LogicalNodeType::kInvalid};
+    // Json per-operator profile, only set when the query asked for it
+    String profile_{};
     String ToString() const;
 
     static QueryResult UnusedResult() { return {}; }
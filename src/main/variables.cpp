@@ -51,6 +51,8 @@ void VarUtil::InitVariablesMap() {
     global_name_map_[MEMORY_CACHE_MISS_VAR_NAME.data()] = GlobalVariable::kMemoryCacheMiss;
     global_name_map_[DISK_CACHE_MISS_VAR_NAME.data()] = GlobalVariable::kDiskCacheMiss;
     global_name_map_[ENABLE_PROFILE_VAR_NAME.data()] = GlobalVariable::kEnableProfile;
+    global_name_map_[SCHEDULER_QUEUE_DEPTH_VAR_NAME.data()] = GlobalVariable::kSchedulerQueueDepth;
+    global_name_map_[SCHEDULER_WAIT_TIME_VAR_NAME.data()] = GlobalVariable::kSchedulerWaitTime;
 
     session_name_map_[QUERY_COUNT_VAR_NAME.data()] = SessionVariable::kQueryCount;
     session_name_map_[TOTAL_COMMIT_COUNT_VAR_NAME.data()] = SessionVariable::kTotalCommitCount;
@@ -52,6 +52,8 @@ export enum class GlobalVariable {
     kMemoryCacheMiss,         // global
     kDiskCacheMiss,           // global
     kEnableProfile,           // global
+    kSchedulerQueueDepth,     // global
+    kSchedulerWaitTime,       // global
     kInvalid,
 };
 
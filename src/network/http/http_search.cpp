@@ -70,6 +70,7 @@ void HTTPSearch::Process(Infinity *infinity_ptr,
         Vector<ParsedExpr *> *group_by_columns{nullptr};
         UniquePtr<ParsedExpr> having{};
         bool total_hits_count_flag{};
+        QueryPriority priority{QueryPriority::kInteractive};
 
         DeferFn search_fn([&]() {
             if (search_expr != nullptr) {
@@ -254,6 +255,19 @@ void HTTPSearch::Process(Infinity *infinity_ptr,
                             response["error_message"] = "Invalid total hits count type";
                             return;
                         }
+                    } else if (key == "priority") {
+                        if (!option.value().is_string()) {
+                            response["error_code"] = ErrorCode::kInvalidExpression;
+                            response["error_message"] = "Invalid priority type";
+                            return;
+                        }
+                        String value = option.value();
+                        priority = StrToQueryPriority(value);
+                        if (priority == QueryPriority::kInvalid) {
+                            response["error_code"] = ErrorCode::kInvalidQueryOption;
+                            response["error_message"] = fmt::format("Unknown priority: {}, expect interactive, batch or background", value);
+                            return;
+                        }
                     }
                 }
             } else {
@@ -274,7 +288,8 @@ void HTTPSearch::Process(Infinity *infinity_ptr,
                                                         order_by_list,
                                                         group_by_columns,
                                                         having.release(),
-                                                        total_hits_count_flag);
+                                                        total_hits_count_flag,
+                                                        priority);
 
         search_expr = nullptr;
         output_columns = nullptr;
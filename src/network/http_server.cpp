@@ -664,6 +664,8 @@ public:
                 export_options.copy_file_type_ = CopyFileType::kJSONL;
             } else if (file_type_str == "fvecs") {
                 export_options.copy_file_type_ = CopyFileType::kFVECS;
+            } else if (file_type_str == "parquet") {
+                export_options.copy_file_type_ = CopyFileType::kPARQUET;
             } else {
                 json_response["error_code"] = ErrorCode::kNotSupported;
                 json_response["error_message"] = fmt::format("Not supported file type {}", file_type_str);
@@ -826,6 +828,8 @@ public:
                 import_options.copy_file_type_ = CopyFileType::kJSONL;
             } else if (file_type_str == "fvecs") {
                 import_options.copy_file_type_ = CopyFileType::kFVECS;
+            } else if (file_type_str == "parquet") {
+                import_options.copy_file_type_ = CopyFileType::kPARQUET;
             } else {
                 json_response["error_code"] = ErrorCode::kNotSupported;
                 json_response["error_message"] = fmt::format("Not supported file type {}", file_type_str);
@@ -32,6 +32,8 @@ class InfinityServiceIf {
   virtual void Import(CommonResponse& _return, const ImportRequest& request) = 0;
   virtual void Export(CommonResponse& _return, const ExportRequest& request) = 0;
   virtual void Select(SelectResponse& _return, const SelectRequest& request) = 0;
+  virtual void MatchDenseBatch(MatchDenseBatchResponse& _return, const MatchDenseBatchRequest& request) = 0;
+  virtual void FetchCursor(SelectResponse& _return, const FetchCursorRequest& request) = 0;
   virtual void Explain(SelectResponse& _return, const ExplainRequest& request) = 0;
   virtual void Delete(DeleteResponse& _return, const DeleteRequest& request) = 0;
   virtual void Update(CommonResponse& _return, const UpdateRequest& request) = 0;
@@ -120,6 +122,12 @@ class InfinityServiceNull : virtual public InfinityServiceIf {
   void Select(SelectResponse& /* _return */, const SelectRequest& /* request */) override {
     return;
   }
+  void MatchDenseBatch(MatchDenseBatchResponse& /* _return */, const MatchDenseBatchRequest& /* request */) override {
+    return;
+  }
+  void FetchCursor(SelectResponse& /* _return */, const FetchCursorRequest& /* request */) override {
+    return;
+  }
   void Explain(SelectResponse& /* _return */, const ExplainRequest& /* request */) override {
     return;
   }
@@ -1249,6 +1257,214 @@ class InfinityService_Select_presult {
 
 };
 
+typedef struct _InfinityService_MatchDenseBatch_args__isset {
+  _InfinityService_MatchDenseBatch_args__isset() : request(false) {}
+  bool request :1;
+} _InfinityService_MatchDenseBatch_args__isset;
+
+class InfinityService_MatchDenseBatch_args {
+ public:
+
+  InfinityService_MatchDenseBatch_args(const InfinityService_MatchDenseBatch_args&);
+  InfinityService_MatchDenseBatch_args& operator=(const InfinityService_MatchDenseBatch_args&);
+  InfinityService_MatchDenseBatch_args() noexcept {
+  }
+
+  virtual ~InfinityService_MatchDenseBatch_args() noexcept;
+  MatchDenseBatchRequest request;
+
+  _InfinityService_MatchDenseBatch_args__isset __isset;
+
+  void __set_request(const MatchDenseBatchRequest& val);
+
+  bool operator == (const InfinityService_MatchDenseBatch_args & rhs) const
+  {
+    if (!(request == rhs.request))
+      return false;
+    return true;
+  }
+  bool operator != (const InfinityService_MatchDenseBatch_args &rhs) const {
+    return !(*this == rhs);
+  }
+
+  bool operator < (const InfinityService_MatchDenseBatch_args & ) const;
+
+  uint32_t read(::apache::thrift::protocol::TProtocol* iprot);
+  uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const;
+
+};
+
+
+class InfinityService_MatchDenseBatch_pargs {
+ public:
+
+
+  virtual ~InfinityService_MatchDenseBatch_pargs() noexcept;
+  const MatchDenseBatchRequest* request;
+
+  uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const;
+
+};
+
+typedef struct _InfinityService_MatchDenseBatch_result__isset {
+  _InfinityService_MatchDenseBatch_result__isset() : success(false) {}
+  bool success :1;
+} _InfinityService_MatchDenseBatch_result__isset;
+
+class InfinityService_MatchDenseBatch_result {
+ public:
+
+  InfinityService_MatchDenseBatch_result(const InfinityService_MatchDenseBatch_result&);
+  InfinityService_MatchDenseBatch_result& operator=(const InfinityService_MatchDenseBatch_result&);
+  InfinityService_MatchDenseBatch_result() noexcept {
+  }
+
+  virtual ~InfinityService_MatchDenseBatch_result() noexcept;
+  MatchDenseBatchResponse success;
+
+  _InfinityService_MatchDenseBatch_result__isset __isset;
+
+  void __set_success(const MatchDenseBatchResponse& val);
+
+  bool operator == (const InfinityService_MatchDenseBatch_result & rhs) const
+  {
+    if (!(success == rhs.success))
+      return false;
+    return true;
+  }
+  bool operator != (const InfinityService_MatchDenseBatch_result &rhs) const {
+    return !(*this == rhs);
+  }
+
+  bool operator < (const InfinityService_MatchDenseBatch_result & ) const;
+
+  uint32_t read(::apache::thrift::protocol::TProtocol* iprot);
+  uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const;
+
+};
+
+typedef struct _InfinityService_MatchDenseBatch_presult__isset {
+  _InfinityService_MatchDenseBatch_presult__isset() : success(false) {}
+  bool success :1;
+} _InfinityService_MatchDenseBatch_presult__isset;
+
+class InfinityService_MatchDenseBatch_presult {
+ public:
+
+
+  virtual ~InfinityService_MatchDenseBatch_presult() noexcept;
+  MatchDenseBatchResponse* success;
+
+  _InfinityService_MatchDenseBatch_presult__isset __isset;
+
+  uint32_t read(::apache::thrift::protocol::TProtocol* iprot);
+
+};
+
+typedef struct _InfinityService_FetchCursor_args__isset {
+  _InfinityService_FetchCursor_args__isset() : request(false) {}
+  bool request :1;
+} _InfinityService_FetchCursor_args__isset;
+
+class InfinityService_FetchCursor_args {
+ public:
+
+  InfinityService_FetchCursor_args(const InfinityService_FetchCursor_args&);
+  InfinityService_FetchCursor_args& operator=(const InfinityService_FetchCursor_args&);
+  InfinityService_FetchCursor_args() noexcept {
+  }
+
+  virtual ~InfinityService_FetchCursor_args() noexcept;
+  FetchCursorRequest request;
+
+  _InfinityService_FetchCursor_args__isset __isset;
+
+  void __set_request(const FetchCursorRequest& val);
+
+  bool operator == (const InfinityService_FetchCursor_args & rhs) const
+  {
+    if (!(request == rhs.request))
+      return false;
+    return true;
+  }
+  bool operator != (const InfinityService_FetchCursor_args &rhs) const {
+    return !(*this == rhs);
+  }
+
+  bool operator < (const InfinityService_FetchCursor_args & ) const;
+
+  uint32_t read(::apache::thrift::protocol::TProtocol* iprot);
+  uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const;
+
+};
+
+
+class InfinityService_FetchCursor_pargs {
+ public:
+
+
+  virtual ~InfinityService_FetchCursor_pargs() noexcept;
+  const FetchCursorRequest* request;
+
+  uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const;
+
+};
+
+typedef struct _InfinityService_FetchCursor_result__isset {
+  _InfinityService_FetchCursor_result__isset() : success(false) {}
+  bool success :1;
+} _InfinityService_FetchCursor_result__isset;
+
+class InfinityService_FetchCursor_result {
+ public:
+
+  InfinityService_FetchCursor_result(const InfinityService_FetchCursor_result&);
+  InfinityService_FetchCursor_result& operator=(const InfinityService_FetchCursor_result&);
+  InfinityService_FetchCursor_result() noexcept {
+  }
+
+  virtual ~InfinityService_FetchCursor_result() noexcept;
+  SelectResponse success;
+
+  _InfinityService_FetchCursor_result__isset __isset;
+
+  void __set_success(const SelectResponse& val);
+
+  bool operator == (const InfinityService_FetchCursor_result & rhs) const
+  {
+    if (!(success == rhs.success))
+      return false;
+    return true;
+  }
+  bool operator != (const InfinityService_FetchCursor_result &rhs) const {
+    return !(*this == rhs);
+  }
+
+  bool operator < (const InfinityService_FetchCursor_result & ) const;
+
+  uint32_t read(::apache::thrift::protocol::TProtocol* iprot);
+  uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const;
+
+};
+
+typedef struct _InfinityService_FetchCursor_presult__isset {
+  _InfinityService_FetchCursor_presult__isset() : success(false) {}
+  bool success :1;
+} _InfinityService_FetchCursor_presult__isset;
+
+class InfinityService_FetchCursor_presult {
+ public:
+
+
+  virtual ~InfinityService_FetchCursor_presult() noexcept;
+  SelectResponse* success;
+
+  _InfinityService_FetchCursor_presult__isset __isset;
+
+  uint32_t read(::apache::thrift::protocol::TProtocol* iprot);
+
+};
+
 typedef struct _InfinityService_Explain_args__isset {
   _InfinityService_Explain_args__isset() : request(false) {}
   bool request :1;
@@ -4320,6 +4536,12 @@ class InfinityServiceClient : virtual public InfinityServiceIf {
   void Select(SelectResponse& _return, const SelectRequest& request) override;
   void send_Select(const SelectRequest& request);
   void recv_Select(SelectResponse& _return);
+  void MatchDenseBatch(MatchDenseBatchResponse& _return, const MatchDenseBatchRequest& request) override;
+  void send_MatchDenseBatch(const MatchDenseBatchRequest& request);
+  void recv_MatchDenseBatch(MatchDenseBatchResponse& _return);
+  void FetchCursor(SelectResponse& _return, const FetchCursorRequest& request) override;
+  void send_FetchCursor(const FetchCursorRequest& request);
+  void recv_FetchCursor(SelectResponse& _return);
   void Explain(SelectResponse& _return, const ExplainRequest& request) override;
   void send_Explain(const ExplainRequest& request);
   void recv_Explain(SelectResponse& _return);
@@ -4432,6 +4654,8 @@ class InfinityServiceProcessor : public ::apache::thrift::TDispatchProcessor {
   void process_Import(int32_t seqid, ::apache::thrift::protocol::TProtocol* iprot, ::apache::thrift::protocol::TProtocol* oprot, void* callContext);
   void process_Export(int32_t seqid, ::apache::thrift::protocol::TProtocol* iprot, ::apache::thrift::protocol::TProtocol* oprot, void* callContext);
   void process_Select(int32_t seqid, ::apache::thrift::protocol::TProtocol* iprot, ::apache::thrift::protocol::TProtocol* oprot, void* callContext);
+  void process_MatchDenseBatch(int32_t seqid, ::apache::thrift::protocol::TProtocol* iprot, ::apache::thrift::protocol::TProtocol* oprot, void* callContext);
+  void process_FetchCursor(int32_t seqid, ::apache::thrift::protocol::TProtocol* iprot, ::apache::thrift::protocol::TProtocol* oprot, void* callContext);
   void process_Explain(int32_t seqid, ::apache::thrift::protocol::TProtocol* iprot, ::apache::thrift::protocol::TProtocol* oprot, void* callContext);
   void process_Delete(int32_t seqid, ::apache::thrift::protocol::TProtocol* iprot, ::apache::thrift::protocol::TProtocol* oprot, void* callContext);
   void process_Update(int32_t seqid, ::apache::thrift::protocol::TProtocol* iprot, ::apache::thrift::protocol::TProtocol* oprot, void* callContext);
@@ -4474,6 +4698,8 @@ class InfinityServiceProcessor : public ::apache::thrift::TDispatchProcessor {
     processMap_["Import"] = &InfinityServiceProcessor::process_Import;
     processMap_["Export"] = &InfinityServiceProcessor::process_Export;
     processMap_["Select"] = &InfinityServiceProcessor::process_Select;
+    processMap_["MatchDenseBatch"] = &InfinityServiceProcessor::process_MatchDenseBatch;
+    processMap_["FetchCursor"] = &InfinityServiceProcessor::process_FetchCursor;
     processMap_["Explain"] = &InfinityServiceProcessor::process_Explain;
     processMap_["Delete"] = &InfinityServiceProcessor::process_Delete;
     processMap_["Update"] = &InfinityServiceProcessor::process_Update;
@@ -4631,6 +4857,26 @@ class InfinityServiceMultiface : virtual public InfinityServiceIf {
     return;
   }
 
+  void MatchDenseBatch(MatchDenseBatchResponse& _return, const MatchDenseBatchRequest& request) override {
+    size_t sz = ifaces_.size();
+    size_t i = 0;
+    for (; i < (sz - 1); ++i) {
+      ifaces_[i]->MatchDenseBatch(_return, request);
+    }
+    ifaces_[i]->MatchDenseBatch(_return, request);
+    return;
+  }
+
+  void FetchCursor(SelectResponse& _return, const FetchCursorRequest& request) override {
+    size_t sz = ifaces_.size();
+    size_t i = 0;
+    for (; i < (sz - 1); ++i) {
+      ifaces_[i]->FetchCursor(_return, request);
+    }
+    ifaces_[i]->FetchCursor(_return, request);
+    return;
+  }
+
   void Explain(SelectResponse& _return, const ExplainRequest& request) override {
     size_t sz = ifaces_.size();
     size_t i = 0;
@@ -4983,6 +5229,12 @@ class InfinityServiceConcurrentClient : virtual public InfinityServiceIf {
   void Select(SelectResponse& _return, const SelectRequest& request) override;
   int32_t send_Select(const SelectRequest& request);
   void recv_Select(SelectResponse& _return, const int32_t seqid);
+  void MatchDenseBatch(MatchDenseBatchResponse& _return, const MatchDenseBatchRequest& request) override;
+  int32_t send_MatchDenseBatch(const MatchDenseBatchRequest& request);
+  void recv_MatchDenseBatch(MatchDenseBatchResponse& _return, const int32_t seqid);
+  void FetchCursor(SelectResponse& _return, const FetchCursorRequest& request) override;
+  int32_t send_FetchCursor(const FetchCursorRequest& request);
+  void recv_FetchCursor(SelectResponse& _return, const int32_t seqid);
   void Explain(SelectResponse& _return, const ExplainRequest& request) override;
   int32_t send_Explain(const ExplainRequest& request);
   void recv_Explain(SelectResponse& _return, const int32_t seqid);
@@ -326,7 +326,8 @@ int _kCopyFileTypeValues[] = {
   CopyFileType::JSONL,
   CopyFileType::FVECS,
   CopyFileType::CSR,
-  CopyFileType::BVECS
+  CopyFileType::BVECS,
+  CopyFileType::PARQUET
 };
 const char* _kCopyFileTypeNames[] = {
   "CSV",
@@ -334,9 +335,10 @@ const char* _kCopyFileTypeNames[] = {
   "JSONL",
   "FVECS",
   "CSR",
-  "BVECS"
+  "BVECS",
+  "PARQUET"
 };
-const std::map<int, const char*> _CopyFileType_VALUES_TO_NAMES(::apache::thrift::TEnumIterator(6, _kCopyFileTypeValues, _kCopyFileTypeNames), ::apache::thrift::TEnumIterator(-1, nullptr, nullptr));
+const std::map<int, const char*> _CopyFileType_VALUES_TO_NAMES(::apache::thrift::TEnumIterator(7, _kCopyFileTypeValues, _kCopyFileTypeNames), ::apache::thrift::TEnumIterator(-1, nullptr, nullptr));
 
 std::ostream& operator<<(std::ostream& out, const CopyFileType::type& val) {
   std::map<int, const char*>::const_iterator it = _CopyFileType_VALUES_TO_NAMES.find(val);
@@ -2405,6 +2407,11 @@ void EmbeddingData::__set_bf16_array_value(const std::vector<double> & val) {
   this->bf16_array_value = val;
 __isset.bf16_array_value = true;
 }
+
+void EmbeddingData::__set_bytes_value(const std::string& val) {
+  this->bytes_value = val;
+__isset.bytes_value = true;
+}
 std::ostream& operator<<(std::ostream& out, const EmbeddingData& obj)
 {
   obj.printTo(out);
@@ -2633,6 +2640,14 @@ uint32_t EmbeddingData::read(::apache::thrift::protocol::TProtocol* iprot) {
           xfer += iprot->skip(ftype);
         }
         break;
+      case 11:
+        if (ftype == ::apache::thrift::protocol::T_STRING) {
+          xfer += iprot->readBinary(this->bytes_value);
+          this->__isset.bytes_value = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
       default:
         xfer += iprot->skip(ftype);
         break;
@@ -2780,6 +2795,11 @@ uint32_t EmbeddingData::write(::apache::thrift::protocol::TProtocol* oprot) cons
     }
     xfer += oprot->writeFieldEnd();
   }
+  if (this->__isset.bytes_value) {
+    xfer += oprot->writeFieldBegin("bytes_value", ::apache::thrift::protocol::T_STRING, 11);
+    xfer += oprot->writeBinary(this->bytes_value);
+    xfer += oprot->writeFieldEnd();
+  }
   xfer += oprot->writeFieldStop();
   xfer += oprot->writeStructEnd();
   return xfer;
@@ -2797,6 +2817,7 @@ void swap(EmbeddingData &a, EmbeddingData &b) {
   swap(a.f64_array_value, b.f64_array_value);
   swap(a.f16_array_value, b.f16_array_value);
   swap(a.bf16_array_value, b.bf16_array_value);
+  swap(a.bytes_value, b.bytes_value);
   swap(a.__isset, b.__isset);
 }
 
@@ -2811,6 +2832,7 @@ EmbeddingData::EmbeddingData(const EmbeddingData& other104) {
   f64_array_value = other104.f64_array_value;
   f16_array_value = other104.f16_array_value;
   bf16_array_value = other104.bf16_array_value;
+  bytes_value = other104.bytes_value;
   __isset = other104.__isset;
 }
 EmbeddingData& EmbeddingData::operator=(const EmbeddingData& other105) {
@@ -2824,6 +2846,7 @@ EmbeddingData& EmbeddingData::operator=(const EmbeddingData& other105) {
   f64_array_value = other105.f64_array_value;
   f16_array_value = other105.f16_array_value;
   bf16_array_value = other105.bf16_array_value;
+  bytes_value = other105.bytes_value;
   __isset = other105.__isset;
   return *this;
 }
@@ -2840,6 +2863,7 @@ void EmbeddingData::printTo(std::ostream& out) const {
   out << ", " << "f64_array_value="; (__isset.f64_array_value ? (out << to_string(f64_array_value)) : (out << "<null>"));
   out << ", " << "f16_array_value="; (__isset.f16_array_value ? (out << to_string(f16_array_value)) : (out << "<null>"));
   out << ", " << "bf16_array_value="; (__isset.bf16_array_value ? (out << to_string(bf16_array_value)) : (out << "<null>"));
+  out << ", " << "bytes_value="; (__isset.bytes_value ? (out << to_string(bytes_value)) : (out << "<null>"));
   out << ")";
 }
 
@@ -5930,6 +5954,10 @@ void ColumnField::__set_column_vectors(const std::vector<std::string> & val) {
 void ColumnField::__set_column_name(const std::string& val) {
   this->column_name = val;
 }
+
+void ColumnField::__set_dimension(const int64_t val) {
+  this->dimension = val;
+}
 std::ostream& operator<<(std::ostream& out, const ColumnField& obj)
 {
   obj.printTo(out);
@@ -5996,6 +6024,14 @@ uint32_t ColumnField::read(::apache::thrift::protocol::TProtocol* iprot) {
           xfer += iprot->skip(ftype);
         }
         break;
+      case 4:
+        if (ftype == ::apache::thrift::protocol::T_I64) {
+          xfer += iprot->readI64(this->dimension);
+          this->__isset.dimension = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
       default:
         xfer += iprot->skip(ftype);
         break;
@@ -6033,6 +6069,10 @@ uint32_t ColumnField::write(::apache::thrift::protocol::TProtocol* oprot) const
   xfer += oprot->writeString(this->column_name);
   xfer += oprot->writeFieldEnd();
 
+  xfer += oprot->writeFieldBegin("dimension", ::apache::thrift::protocol::T_I64, 4);
+  xfer += oprot->writeI64(this->dimension);
+  xfer += oprot->writeFieldEnd();
+
   xfer += oprot->writeFieldStop();
   xfer += oprot->writeStructEnd();
   return xfer;
@@ -6043,6 +6083,7 @@ void swap(ColumnField &a, ColumnField &b) {
   swap(a.column_type, b.column_type);
   swap(a.column_vectors, b.column_vectors);
   swap(a.column_name, b.column_name);
+  swap(a.dimension, b.dimension);
   swap(a.__isset, b.__isset);
 }
 
@@ -6050,12 +6091,14 @@ ColumnField::ColumnField(const ColumnField& other288) {
   column_type = other288.column_type;
   column_vectors = other288.column_vectors;
   column_name = other288.column_name;
+  dimension = other288.dimension;
   __isset = other288.__isset;
 }
 ColumnField& ColumnField::operator=(const ColumnField& other289) {
   column_type = other289.column_type;
   column_vectors = other289.column_vectors;
   column_name = other289.column_name;
+  dimension = other289.dimension;
   __isset = other289.__isset;
   return *this;
 }
@@ -6065,6 +6108,7 @@ void ColumnField::printTo(std::ostream& out) const {
   out << "column_type=" << to_string(column_type);
   out << ", " << "column_vectors=" << to_string(column_vectors);
   out << ", " << "column_name=" << to_string(column_name);
+  out << ", " << "dimension=" << to_string(dimension);
   out << ")";
 }
 
@@ -10562,6 +10606,10 @@ void InsertRequest::__set_fields(const std::vector<Field> & val) {
 void InsertRequest::__set_session_id(const int64_t val) {
   this->session_id = val;
 }
+
+void InsertRequest::__set_column_fields(const std::vector<ColumnField> & val) {
+  this->column_fields = val;
+}
 std::ostream& operator<<(std::ostream& out, const InsertRequest& obj)
 {
   obj.printTo(out);
@@ -10634,6 +10682,26 @@ uint32_t InsertRequest::read(::apache::thrift::protocol::TProtocol* iprot) {
           xfer += iprot->skip(ftype);
         }
         break;
+      case 5:
+        if (ftype == ::apache::thrift::protocol::T_LIST) {
+          {
+            this->column_fields.clear();
+            uint32_t _size556;
+            ::apache::thrift::protocol::TType _etype559;
+            xfer += iprot->readListBegin(_etype559, _size556);
+            this->column_fields.resize(_size556);
+            uint32_t _i560;
+            for (_i560 = 0; _i560 < _size556; ++_i560)
+            {
+              xfer += this->column_fields[_i560].read(iprot);
+            }
+            xfer += iprot->readListEnd();
+          }
+          this->__isset.column_fields = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
       default:
         xfer += iprot->skip(ftype);
         break;
@@ -10675,6 +10743,18 @@ uint32_t InsertRequest::write(::apache::thrift::protocol::TProtocol* oprot) cons
   xfer += oprot->writeI64(this->session_id);
   xfer += oprot->writeFieldEnd();
 
+  xfer += oprot->writeFieldBegin("column_fields", ::apache::thrift::protocol::T_LIST, 5);
+  {
+    xfer += oprot->writeListBegin(::apache::thrift::protocol::T_STRUCT, static_cast<uint32_t>(this->column_fields.size()));
+    std::vector<ColumnField> ::const_iterator _iter561;
+    for (_iter561 = this->column_fields.begin(); _iter561 != this->column_fields.end(); ++_iter561)
+    {
+      xfer += (*_iter561).write(oprot);
+    }
+    xfer += oprot->writeListEnd();
+  }
+  xfer += oprot->writeFieldEnd();
+
   xfer += oprot->writeFieldStop();
   xfer += oprot->writeStructEnd();
   return xfer;
@@ -10686,6 +10766,7 @@ void swap(InsertRequest &a, InsertRequest &b) {
   swap(a.table_name, b.table_name);
   swap(a.fields, b.fields);
   swap(a.session_id, b.session_id);
+  swap(a.column_fields, b.column_fields);
   swap(a.__isset, b.__isset);
 }
 
@@ -10694,6 +10775,7 @@ InsertRequest::InsertRequest(const InsertRequest& other405) {
   table_name = other405.table_name;
   fields = other405.fields;
   session_id = other405.session_id;
+  column_fields = other405.column_fields;
   __isset = other405.__isset;
 }
 InsertRequest& InsertRequest::operator=(const InsertRequest& other406) {
@@ -10701,6 +10783,7 @@ InsertRequest& InsertRequest::operator=(const InsertRequest& other406) {
   table_name = other406.table_name;
   fields = other406.fields;
   session_id = other406.session_id;
+  column_fields = other406.column_fields;
   __isset = other406.__isset;
   return *this;
 }
@@ -10711,6 +10794,7 @@ void InsertRequest::printTo(std::ostream& out) const {
   out << ", " << "table_name=" << to_string(table_name);
   out << ", " << "fields=" << to_string(fields);
   out << ", " << "session_id=" << to_string(session_id);
+  out << ", " << "column_fields=" << to_string(column_fields);
   out << ")";
 }
 
@@ -11785,6 +11869,21 @@ void SelectRequest::__set_total_hits_count(const bool val) {
   this->total_hits_count = val;
 __isset.total_hits_count = true;
 }
+
+void SelectRequest::__set_batch_rows(const int64_t val) {
+  this->batch_rows = val;
+__isset.batch_rows = true;
+}
+
+void SelectRequest::__set_priority(const std::string& val) {
+  this->priority = val;
+__isset.priority = true;
+}
+
+void SelectRequest::__set_profile(const bool val) {
+  this->profile = val;
+__isset.profile = true;
+}
 std::ostream& operator<<(std::ostream& out, const SelectRequest& obj)
 {
   obj.printTo(out);
@@ -11965,6 +12064,30 @@ uint32_t SelectRequest::read(::apache::thrift::protocol::TProtocol* iprot) {
           xfer += iprot->skip(ftype);
         }
         break;
+      case 14:
+        if (ftype == ::apache::thrift::protocol::T_I64) {
+          xfer += iprot->readI64(this->batch_rows);
+          this->__isset.batch_rows = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 15:
+        if (ftype == ::apache::thrift::protocol::T_STRING) {
+          xfer += iprot->readString(this->priority);
+          this->__isset.priority = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 16:
+        if (ftype == ::apache::thrift::protocol::T_BOOL) {
+          xfer += iprot->readBool(this->profile);
+          this->__isset.profile = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
       default:
         xfer += iprot->skip(ftype);
         break;
@@ -12075,6 +12198,21 @@ uint32_t SelectRequest::write(::apache::thrift::protocol::TProtocol* oprot) cons
     xfer += oprot->writeBool(this->total_hits_count);
     xfer += oprot->writeFieldEnd();
   }
+  if (this->__isset.batch_rows) {
+    xfer += oprot->writeFieldBegin("batch_rows", ::apache::thrift::protocol::T_I64, 14);
+    xfer += oprot->writeI64(this->batch_rows);
+    xfer += oprot->writeFieldEnd();
+  }
+  if (this->__isset.priority) {
+    xfer += oprot->writeFieldBegin("priority", ::apache::thrift::protocol::T_STRING, 15);
+    xfer += oprot->writeString(this->priority);
+    xfer += oprot->writeFieldEnd();
+  }
+  if (this->__isset.profile) {
+    xfer += oprot->writeFieldBegin("profile", ::apache::thrift::protocol::T_BOOL, 16);
+    xfer += oprot->writeBool(this->profile);
+    xfer += oprot->writeFieldEnd();
+  }
   xfer += oprot->writeFieldStop();
   xfer += oprot->writeStructEnd();
   return xfer;
@@ -12095,6 +12233,9 @@ void swap(SelectRequest &a, SelectRequest &b) {
   swap(a.offset_expr, b.offset_expr);
   swap(a.order_by_list, b.order_by_list);
   swap(a.total_hits_count, b.total_hits_count);
+  swap(a.batch_rows, b.batch_rows);
+  swap(a.priority, b.priority);
+  swap(a.profile, b.profile);
   swap(a.__isset, b.__isset);
 }
 
@@ -12112,6 +12253,9 @@ SelectRequest::SelectRequest(const SelectRequest& other482) {
   offset_expr = other482.offset_expr;
   order_by_list = other482.order_by_list;
   total_hits_count = other482.total_hits_count;
+  batch_rows = other482.batch_rows;
+  priority = other482.priority;
+  profile = other482.profile;
   __isset = other482.__isset;
 }
 SelectRequest& SelectRequest::operator=(const SelectRequest& other483) {
@@ -12128,6 +12272,9 @@ SelectRequest& SelectRequest::operator=(const SelectRequest& other483) {
   offset_expr = other483.offset_expr;
   order_by_list = other483.order_by_list;
   total_hits_count = other483.total_hits_count;
+  batch_rows = other483.batch_rows;
+  priority = other483.priority;
+  profile = other483.profile;
   __isset = other483.__isset;
   return *this;
 }
@@ -12147,6 +12294,9 @@ void SelectRequest::printTo(std::ostream& out) const {
   out << ", " << "offset_expr="; (__isset.offset_expr ? (out << to_string(offset_expr)) : (out << "<null>"));
   out << ", " << "order_by_list="; (__isset.order_by_list ? (out << to_string(order_by_list)) : (out << "<null>"));
   out << ", " << "total_hits_count="; (__isset.total_hits_count ? (out << to_string(total_hits_count)) : (out << "<null>"));
+  out << ", " << "batch_rows="; (__isset.batch_rows ? (out << to_string(batch_rows)) : (out << "<null>"));
+  out << ", " << "priority="; (__isset.priority ? (out << to_string(priority)) : (out << "<null>"));
+  out << ", " << "profile="; (__isset.profile ? (out << to_string(profile)) : (out << "<null>"));
   out << ")";
 }
 
@@ -12174,6 +12324,15 @@ void SelectResponse::__set_column_fields(const std::vector<ColumnField> & val) {
 void SelectResponse::__set_extra_result(const std::string& val) {
   this->extra_result = val;
 }
+
+void SelectResponse::__set_cursor_id(const int64_t val) {
+  this->cursor_id = val;
+}
+
+void SelectResponse::__set_profile(const std::string& val) {
+  this->profile = val;
+__isset.profile = true;
+}
 std::ostream& operator<<(std::ostream& out, const SelectResponse& obj)
 {
   obj.printTo(out);
@@ -12266,6 +12425,22 @@ uint32_t SelectResponse::read(::apache::thrift::protocol::TProtocol* iprot) {
           xfer += iprot->skip(ftype);
         }
         break;
+      case 6:
+        if (ftype == ::apache::thrift::protocol::T_I64) {
+          xfer += iprot->readI64(this->cursor_id);
+          this->__isset.cursor_id = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 7:
+        if (ftype == ::apache::thrift::protocol::T_STRING) {
+          xfer += iprot->readString(this->profile);
+          this->__isset.profile = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
       default:
         xfer += iprot->skip(ftype);
         break;
@@ -12319,6 +12494,15 @@ uint32_t SelectResponse::write(::apache::thrift::protocol::TProtocol* oprot) con
   xfer += oprot->writeString(this->extra_result);
   xfer += oprot->writeFieldEnd();
 
+  xfer += oprot->writeFieldBegin("cursor_id", ::apache::thrift::protocol::T_I64, 6);
+  xfer += oprot->writeI64(this->cursor_id);
+  xfer += oprot->writeFieldEnd();
+
+  if (this->__isset.profile) {
+    xfer += oprot->writeFieldBegin("profile", ::apache::thrift::protocol::T_STRING, 7);
+    xfer += oprot->writeString(this->profile);
+    xfer += oprot->writeFieldEnd();
+  }
   xfer += oprot->writeFieldStop();
   xfer += oprot->writeStructEnd();
   return xfer;
@@ -12331,6 +12515,8 @@ void swap(SelectResponse &a, SelectResponse &b) {
   swap(a.column_defs, b.column_defs);
   swap(a.column_fields, b.column_fields);
   swap(a.extra_result, b.extra_result);
+  swap(a.cursor_id, b.cursor_id);
+  swap(a.profile, b.profile);
   swap(a.__isset, b.__isset);
 }
 
@@ -12340,6 +12526,8 @@ SelectResponse::SelectResponse(const SelectResponse& other496) {
   column_defs = other496.column_defs;
   column_fields = other496.column_fields;
   extra_result = other496.extra_result;
+  cursor_id = other496.cursor_id;
+  profile = other496.profile;
   __isset = other496.__isset;
 }
 SelectResponse& SelectResponse::operator=(const SelectResponse& other497) {
@@ -12348,6 +12536,8 @@ SelectResponse& SelectResponse::operator=(const SelectResponse& other497) {
   column_defs = other497.column_defs;
   column_fields = other497.column_fields;
   extra_result = other497.extra_result;
+  cursor_id = other497.cursor_id;
+  profile = other497.profile;
   __isset = other497.__isset;
   return *this;
 }
@@ -12359,6 +12549,692 @@ void SelectResponse::printTo(std::ostream& out) const {
   out << ", " << "column_defs=" << to_string(column_defs);
   out << ", " << "column_fields=" << to_string(column_fields);
   out << ", " << "extra_result=" << to_string(extra_result);
+  out << ", " << "cursor_id=" << to_string(cursor_id);
+  out << ", " << "profile="; (__isset.profile ? (out << to_string(profile)) : (out << "<null>"));
+  out << ")";
+}
+
+
+MatchDenseBatchRequest::~MatchDenseBatchRequest() noexcept {
+}
+
+
+void MatchDenseBatchRequest::__set_session_id(const int64_t val) {
+  this->session_id = val;
+}
+
+void MatchDenseBatchRequest::__set_db_name(const std::string& val) {
+  this->db_name = val;
+}
+
+void MatchDenseBatchRequest::__set_table_name(const std::string& val) {
+  this->table_name = val;
+}
+
+void MatchDenseBatchRequest::__set_column_name(const std::string& val) {
+  this->column_name = val;
+}
+
+void MatchDenseBatchRequest::__set_element_type(const ElementType::type val) {
+  this->element_type = val;
+}
+
+void MatchDenseBatchRequest::__set_distance_type(const KnnDistanceType::type val) {
+  this->distance_type = val;
+}
+
+void MatchDenseBatchRequest::__set_dimension(const int64_t val) {
+  this->dimension = val;
+}
+
+void MatchDenseBatchRequest::__set_query_count(const int64_t val) {
+  this->query_count = val;
+}
+
+void MatchDenseBatchRequest::__set_query_data(const std::string& val) {
+  this->query_data = val;
+}
+
+void MatchDenseBatchRequest::__set_topn(const int64_t val) {
+  this->topn = val;
+}
+
+void MatchDenseBatchRequest::__set_opt_params(const std::vector<InitParameter> & val) {
+  this->opt_params = val;
+}
+
+void MatchDenseBatchRequest::__set_where_expr(const ParsedExpr& val) {
+  this->where_expr = val;
+__isset.where_expr = true;
+}
+
+void MatchDenseBatchRequest::__set_priority(const std::string& val) {
+  this->priority = val;
+__isset.priority = true;
+}
+std::ostream& operator<<(std::ostream& out, const MatchDenseBatchRequest& obj)
+{
+  obj.printTo(out);
+  return out;
+}
+
+
+uint32_t MatchDenseBatchRequest::read(::apache::thrift::protocol::TProtocol* iprot) {
+
+  ::apache::thrift::protocol::TInputRecursionTracker tracker(*iprot);
+  uint32_t xfer = 0;
+  std::string fname;
+  ::apache::thrift::protocol::TType ftype;
+  int16_t fid;
+
+  xfer += iprot->readStructBegin(fname);
+
+  using ::apache::thrift::protocol::TProtocolException;
+
+
+  while (true)
+  {
+    xfer += iprot->readFieldBegin(fname, ftype, fid);
+    if (ftype == ::apache::thrift::protocol::T_STOP) {
+      break;
+    }
+    switch (fid)
+    {
+      case 1:
+        if (ftype == ::apache::thrift::protocol::T_I64) {
+          xfer += iprot->readI64(this->session_id);
+          this->__isset.session_id = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 2:
+        if (ftype == ::apache::thrift::protocol::T_STRING) {
+          xfer += iprot->readString(this->db_name);
+          this->__isset.db_name = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 3:
+        if (ftype == ::apache::thrift::protocol::T_STRING) {
+          xfer += iprot->readString(this->table_name);
+          this->__isset.table_name = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 4:
+        if (ftype == ::apache::thrift::protocol::T_STRING) {
+          xfer += iprot->readString(this->column_name);
+          this->__isset.column_name = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 5:
+        if (ftype == ::apache::thrift::protocol::T_I32) {
+          int32_t ecast9006;
+          xfer += iprot->readI32(ecast9006);
+          this->element_type = static_cast<ElementType::type>(ecast9006);
+          this->__isset.element_type = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 6:
+        if (ftype == ::apache::thrift::protocol::T_I32) {
+          int32_t ecast9007;
+          xfer += iprot->readI32(ecast9007);
+          this->distance_type = static_cast<KnnDistanceType::type>(ecast9007);
+          this->__isset.distance_type = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 7:
+        if (ftype == ::apache::thrift::protocol::T_I64) {
+          xfer += iprot->readI64(this->dimension);
+          this->__isset.dimension = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 8:
+        if (ftype == ::apache::thrift::protocol::T_I64) {
+          xfer += iprot->readI64(this->query_count);
+          this->__isset.query_count = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 9:
+        if (ftype == ::apache::thrift::protocol::T_STRING) {
+          xfer += iprot->readBinary(this->query_data);
+          this->__isset.query_data = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 10:
+        if (ftype == ::apache::thrift::protocol::T_I64) {
+          xfer += iprot->readI64(this->topn);
+          this->__isset.topn = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 11:
+        if (ftype == ::apache::thrift::protocol::T_LIST) {
+          {
+            this->opt_params.clear();
+            uint32_t _size9008;
+            ::apache::thrift::protocol::TType _etype9009;
+            xfer += iprot->readListBegin(_etype9009, _size9008);
+            this->opt_params.resize(_size9008);
+            uint32_t _i9010;
+            for (_i9010 = 0; _i9010 < _size9008; ++_i9010)
+            {
+              xfer += this->opt_params[_i9010].read(iprot);
+            }
+            xfer += iprot->readListEnd();
+          }
+          this->__isset.opt_params = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 12:
+        if (ftype == ::apache::thrift::protocol::T_STRUCT) {
+          xfer += this->where_expr.read(iprot);
+          this->__isset.where_expr = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 13:
+        if (ftype == ::apache::thrift::protocol::T_STRING) {
+          xfer += iprot->readString(this->priority);
+          this->__isset.priority = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      default:
+        xfer += iprot->skip(ftype);
+        break;
+    }
+    xfer += iprot->readFieldEnd();
+  }
+
+  xfer += iprot->readStructEnd();
+
+  return xfer;
+}
+
+uint32_t MatchDenseBatchRequest::write(::apache::thrift::protocol::TProtocol* oprot) const {
+  uint32_t xfer = 0;
+  ::apache::thrift::protocol::TOutputRecursionTracker tracker(*oprot);
+  xfer += oprot->writeStructBegin("MatchDenseBatchRequest");
+
+  xfer += oprot->writeFieldBegin("session_id", ::apache::thrift::protocol::T_I64, 1);
+  xfer += oprot->writeI64(this->session_id);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("db_name", ::apache::thrift::protocol::T_STRING, 2);
+  xfer += oprot->writeString(this->db_name);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("table_name", ::apache::thrift::protocol::T_STRING, 3);
+  xfer += oprot->writeString(this->table_name);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("column_name", ::apache::thrift::protocol::T_STRING, 4);
+  xfer += oprot->writeString(this->column_name);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("element_type", ::apache::thrift::protocol::T_I32, 5);
+  xfer += oprot->writeI32(static_cast<int32_t>(this->element_type));
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("distance_type", ::apache::thrift::protocol::T_I32, 6);
+  xfer += oprot->writeI32(static_cast<int32_t>(this->distance_type));
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("dimension", ::apache::thrift::protocol::T_I64, 7);
+  xfer += oprot->writeI64(this->dimension);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("query_count", ::apache::thrift::protocol::T_I64, 8);
+  xfer += oprot->writeI64(this->query_count);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("query_data", ::apache::thrift::protocol::T_STRING, 9);
+  xfer += oprot->writeBinary(this->query_data);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("topn", ::apache::thrift::protocol::T_I64, 10);
+  xfer += oprot->writeI64(this->topn);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("opt_params", ::apache::thrift::protocol::T_LIST, 11);
+  {
+    xfer += oprot->writeListBegin(::apache::thrift::protocol::T_STRUCT, static_cast<uint32_t>(this->opt_params.size()));
+    std::vector<InitParameter> ::const_iterator _iter9011;
+    for (_iter9011 = this->opt_params.begin(); _iter9011 != this->opt_params.end(); ++_iter9011)
+    {
+      xfer += (*_iter9011).write(oprot);
+    }
+    xfer += oprot->writeListEnd();
+  }
+  xfer += oprot->writeFieldEnd();
+
+  if (this->__isset.where_expr) {
+    xfer += oprot->writeFieldBegin("where_expr", ::apache::thrift::protocol::T_STRUCT, 12);
+    xfer += this->where_expr.write(oprot);
+    xfer += oprot->writeFieldEnd();
+  }
+  if (this->__isset.priority) {
+    xfer += oprot->writeFieldBegin("priority", ::apache::thrift::protocol::T_STRING, 13);
+    xfer += oprot->writeString(this->priority);
+    xfer += oprot->writeFieldEnd();
+  }
+  xfer += oprot->writeFieldStop();
+  xfer += oprot->writeStructEnd();
+  return xfer;
+}
+
+void swap(MatchDenseBatchRequest &a, MatchDenseBatchRequest &b) {
+  using ::std::swap;
+  swap(a.session_id, b.session_id);
+  swap(a.db_name, b.db_name);
+  swap(a.table_name, b.table_name);
+  swap(a.column_name, b.column_name);
+  swap(a.element_type, b.element_type);
+  swap(a.distance_type, b.distance_type);
+  swap(a.dimension, b.dimension);
+  swap(a.query_count, b.query_count);
+  swap(a.query_data, b.query_data);
+  swap(a.topn, b.topn);
+  swap(a.opt_params, b.opt_params);
+  swap(a.where_expr, b.where_expr);
+  swap(a.priority, b.priority);
+  swap(a.__isset, b.__isset);
+}
+
+MatchDenseBatchRequest::MatchDenseBatchRequest(const MatchDenseBatchRequest& other9012) {
+  session_id = other9012.session_id;
+  db_name = other9012.db_name;
+  table_name = other9012.table_name;
+  column_name = other9012.column_name;
+  element_type = other9012.element_type;
+  distance_type = other9012.distance_type;
+  dimension = other9012.dimension;
+  query_count = other9012.query_count;
+  query_data = other9012.query_data;
+  topn = other9012.topn;
+  opt_params = other9012.opt_params;
+  where_expr = other9012.where_expr;
+  priority = other9012.priority;
+  __isset = other9012.__isset;
+}
+MatchDenseBatchRequest& MatchDenseBatchRequest::operator=(const MatchDenseBatchRequest& other9013) {
+  session_id = other9013.session_id;
+  db_name = other9013.db_name;
+  table_name = other9013.table_name;
+  column_name = other9013.column_name;
+  element_type = other9013.element_type;
+  distance_type = other9013.distance_type;
+  dimension = other9013.dimension;
+  query_count = other9013.query_count;
+  query_data = other9013.query_data;
+  topn = other9013.topn;
+  opt_params = other9013.opt_params;
+  where_expr = other9013.where_expr;
+  priority = other9013.priority;
+  __isset = other9013.__isset;
+  return *this;
+}
+void MatchDenseBatchRequest::printTo(std::ostream& out) const {
+  using ::apache::thrift::to_string;
+  out << "MatchDenseBatchRequest(";
+  out << "session_id=" << to_string(session_id);
+  out << ", " << "db_name=" << to_string(db_name);
+  out << ", " << "table_name=" << to_string(table_name);
+  out << ", " << "column_name=" << to_string(column_name);
+  out << ", " << "element_type=" << to_string(element_type);
+  out << ", " << "distance_type=" << to_string(distance_type);
+  out << ", " << "dimension=" << to_string(dimension);
+  out << ", " << "query_count=" << to_string(query_count);
+  out << ", " << "query_data=" << to_string(query_data);
+  out << ", " << "topn=" << to_string(topn);
+  out << ", " << "opt_params=" << to_string(opt_params);
+  out << ", " << "where_expr="; (__isset.where_expr ? (out << to_string(where_expr)) : (out << "<null>"));
+  out << ", " << "priority="; (__isset.priority ? (out << to_string(priority)) : (out << "<null>"));
+  out << ")";
+}
+
+
+MatchDenseBatchResponse::~MatchDenseBatchResponse() noexcept {
+}
+
+
+void MatchDenseBatchResponse::__set_error_code(const int64_t val) {
+  this->error_code = val;
+}
+
+void MatchDenseBatchResponse::__set_error_msg(const std::string& val) {
+  this->error_msg = val;
+}
+
+void MatchDenseBatchResponse::__set_query_count(const int64_t val) {
+  this->query_count = val;
+}
+
+void MatchDenseBatchResponse::__set_topn(const int64_t val) {
+  this->topn = val;
+}
+
+void MatchDenseBatchResponse::__set_row_ids(const std::string& val) {
+  this->row_ids = val;
+}
+
+void MatchDenseBatchResponse::__set_distances(const std::string& val) {
+  this->distances = val;
+}
+std::ostream& operator<<(std::ostream& out, const MatchDenseBatchResponse& obj)
+{
+  obj.printTo(out);
+  return out;
+}
+
+
+uint32_t MatchDenseBatchResponse::read(::apache::thrift::protocol::TProtocol* iprot) {
+
+  ::apache::thrift::protocol::TInputRecursionTracker tracker(*iprot);
+  uint32_t xfer = 0;
+  std::string fname;
+  ::apache::thrift::protocol::TType ftype;
+  int16_t fid;
+
+  xfer += iprot->readStructBegin(fname);
+
+  using ::apache::thrift::protocol::TProtocolException;
+
+
+  while (true)
+  {
+    xfer += iprot->readFieldBegin(fname, ftype, fid);
+    if (ftype == ::apache::thrift::protocol::T_STOP) {
+      break;
+    }
+    switch (fid)
+    {
+      case 1:
+        if (ftype == ::apache::thrift::protocol::T_I64) {
+          xfer += iprot->readI64(this->error_code);
+          this->__isset.error_code = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 2:
+        if (ftype == ::apache::thrift::protocol::T_STRING) {
+          xfer += iprot->readString(this->error_msg);
+          this->__isset.error_msg = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 3:
+        if (ftype == ::apache::thrift::protocol::T_I64) {
+          xfer += iprot->readI64(this->query_count);
+          this->__isset.query_count = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 4:
+        if (ftype == ::apache::thrift::protocol::T_I64) {
+          xfer += iprot->readI64(this->topn);
+          this->__isset.topn = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 5:
+        if (ftype == ::apache::thrift::protocol::T_STRING) {
+          xfer += iprot->readBinary(this->row_ids);
+          this->__isset.row_ids = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 6:
+        if (ftype == ::apache::thrift::protocol::T_STRING) {
+          xfer += iprot->readBinary(this->distances);
+          this->__isset.distances = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      default:
+        xfer += iprot->skip(ftype);
+        break;
+    }
+    xfer += iprot->readFieldEnd();
+  }
+
+  xfer += iprot->readStructEnd();
+
+  return xfer;
+}
+
+uint32_t MatchDenseBatchResponse::write(::apache::thrift::protocol::TProtocol* oprot) const {
+  uint32_t xfer = 0;
+  ::apache::thrift::protocol::TOutputRecursionTracker tracker(*oprot);
+  xfer += oprot->writeStructBegin("MatchDenseBatchResponse");
+
+  xfer += oprot->writeFieldBegin("error_code", ::apache::thrift::protocol::T_I64, 1);
+  xfer += oprot->writeI64(this->error_code);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("error_msg", ::apache::thrift::protocol::T_STRING, 2);
+  xfer += oprot->writeString(this->error_msg);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("query_count", ::apache::thrift::protocol::T_I64, 3);
+  xfer += oprot->writeI64(this->query_count);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("topn", ::apache::thrift::protocol::T_I64, 4);
+  xfer += oprot->writeI64(this->topn);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("row_ids", ::apache::thrift::protocol::T_STRING, 5);
+  xfer += oprot->writeBinary(this->row_ids);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("distances", ::apache::thrift::protocol::T_STRING, 6);
+  xfer += oprot->writeBinary(this->distances);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldStop();
+  xfer += oprot->writeStructEnd();
+  return xfer;
+}
+
+void swap(MatchDenseBatchResponse &a, MatchDenseBatchResponse &b) {
+  using ::std::swap;
+  swap(a.error_code, b.error_code);
+  swap(a.error_msg, b.error_msg);
+  swap(a.query_count, b.query_count);
+  swap(a.topn, b.topn);
+  swap(a.row_ids, b.row_ids);
+  swap(a.distances, b.distances);
+  swap(a.__isset, b.__isset);
+}
+
+MatchDenseBatchResponse::MatchDenseBatchResponse(const MatchDenseBatchResponse& other9014) {
+  error_code = other9014.error_code;
+  error_msg = other9014.error_msg;
+  query_count = other9014.query_count;
+  topn = other9014.topn;
+  row_ids = other9014.row_ids;
+  distances = other9014.distances;
+  __isset = other9014.__isset;
+}
+MatchDenseBatchResponse& MatchDenseBatchResponse::operator=(const MatchDenseBatchResponse& other9015) {
+  error_code = other9015.error_code;
+  error_msg = other9015.error_msg;
+  query_count = other9015.query_count;
+  topn = other9015.topn;
+  row_ids = other9015.row_ids;
+  distances = other9015.distances;
+  __isset = other9015.__isset;
+  return *this;
+}
+void MatchDenseBatchResponse::printTo(std::ostream& out) const {
+  using ::apache::thrift::to_string;
+  out << "MatchDenseBatchResponse(";
+  out << "error_code=" << to_string(error_code);
+  out << ", " << "error_msg=" << to_string(error_msg);
+  out << ", " << "query_count=" << to_string(query_count);
+  out << ", " << "topn=" << to_string(topn);
+  out << ", " << "row_ids=" << to_string(row_ids);
+  out << ", " << "distances=" << to_string(distances);
+  out << ")";
+}
+
+
+FetchCursorRequest::~FetchCursorRequest() noexcept {
+}
+
+
+void FetchCursorRequest::__set_session_id(const int64_t val) {
+  this->session_id = val;
+}
+
+void FetchCursorRequest::__set_cursor_id(const int64_t val) {
+  this->cursor_id = val;
+}
+
+void FetchCursorRequest::__set_close(const bool val) {
+  this->close = val;
+}
+std::ostream& operator<<(std::ostream& out, const FetchCursorRequest& obj)
+{
+  obj.printTo(out);
+  return out;
+}
+
+
+uint32_t FetchCursorRequest::read(::apache::thrift::protocol::TProtocol* iprot) {
+
+  ::apache::thrift::protocol::TInputRecursionTracker tracker(*iprot);
+  uint32_t xfer = 0;
+  std::string fname;
+  ::apache::thrift::protocol::TType ftype;
+  int16_t fid;
+
+  xfer += iprot->readStructBegin(fname);
+
+  using ::apache::thrift::protocol::TProtocolException;
+
+
+  while (true)
+  {
+    xfer += iprot->readFieldBegin(fname, ftype, fid);
+    if (ftype == ::apache::thrift::protocol::T_STOP) {
+      break;
+    }
+    switch (fid)
+    {
+      case 1:
+        if (ftype == ::apache::thrift::protocol::T_I64) {
+          xfer += iprot->readI64(this->session_id);
+          this->__isset.session_id = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 2:
+        if (ftype == ::apache::thrift::protocol::T_I64) {
+          xfer += iprot->readI64(this->cursor_id);
+          this->__isset.cursor_id = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 3:
+        if (ftype == ::apache::thrift::protocol::T_BOOL) {
+          xfer += iprot->readBool(this->close);
+          this->__isset.close = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      default:
+        xfer += iprot->skip(ftype);
+        break;
+    }
+    xfer += iprot->readFieldEnd();
+  }
+
+  xfer += iprot->readStructEnd();
+
+  return xfer;
+}
+
+uint32_t FetchCursorRequest::write(::apache::thrift::protocol::TProtocol* oprot) const {
+  uint32_t xfer = 0;
+  ::apache::thrift::protocol::TOutputRecursionTracker tracker(*oprot);
+  xfer += oprot->writeStructBegin("FetchCursorRequest");
+
+  xfer += oprot->writeFieldBegin("session_id", ::apache::thrift::protocol::T_I64, 1);
+  xfer += oprot->writeI64(this->session_id);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("cursor_id", ::apache::thrift::protocol::T_I64, 2);
+  xfer += oprot->writeI64(this->cursor_id);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("close", ::apache::thrift::protocol::T_BOOL, 3);
+  xfer += oprot->writeBool(this->close);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldStop();
+  xfer += oprot->writeStructEnd();
+  return xfer;
+}
+
+void swap(FetchCursorRequest &a, FetchCursorRequest &b) {
+  using ::std::swap;
+  swap(a.session_id, b.session_id);
+  swap(a.cursor_id, b.cursor_id);
+  swap(a.close, b.close);
+  swap(a.__isset, b.__isset);
+}
+
+FetchCursorRequest::FetchCursorRequest(const FetchCursorRequest& other9101) {
+  session_id = other9101.session_id;
+  cursor_id = other9101.cursor_id;
+  close = other9101.close;
+  __isset = other9101.__isset;
+}
+FetchCursorRequest& FetchCursorRequest::operator=(const FetchCursorRequest& other9102) {
+  session_id = other9102.session_id;
+  cursor_id = other9102.cursor_id;
+  close = other9102.close;
+  __isset = other9102.__isset;
+  return *this;
+}
+void FetchCursorRequest::printTo(std::ostream& out) const {
+  using ::apache::thrift::to_string;
+  out << "FetchCursorRequest(";
+  out << "session_id=" << to_string(session_id);
+  out << ", " << "cursor_id=" << to_string(cursor_id);
+  out << ", " << "close=" << to_string(close);
   out << ")";
 }
 
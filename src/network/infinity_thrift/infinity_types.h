@@ -171,7 +171,8 @@ struct CopyFileType {
     JSONL = 2,
     FVECS = 3,
     CSR = 4,
-    BVECS = 5
+    BVECS = 5,
+    PARQUET = 6
   };
 };
 
@@ -385,6 +386,12 @@ class SelectRequest;
 
 class SelectResponse;
 
+class MatchDenseBatchRequest;
+
+class MatchDenseBatchResponse;
+
+class FetchCursorRequest;
+
 class DeleteRequest;
 
 class DeleteResponse;
@@ -1164,7 +1171,7 @@ void swap(ColumnExpr &a, ColumnExpr &b);
 std::ostream& operator<<(std::ostream& out, const ColumnExpr& obj);
 
 typedef struct _EmbeddingData__isset {
-  _EmbeddingData__isset() : bool_array_value(false), u8_array_value(false), i8_array_value(false), i16_array_value(false), i32_array_value(false), i64_array_value(false), f32_array_value(false), f64_array_value(false), f16_array_value(false), bf16_array_value(false) {}
+  _EmbeddingData__isset() : bool_array_value(false), u8_array_value(false), i8_array_value(false), i16_array_value(false), i32_array_value(false), i64_array_value(false), f32_array_value(false), f64_array_value(false), f16_array_value(false), bf16_array_value(false), bytes_value(false) {}
   bool bool_array_value :1;
   bool u8_array_value :1;
   bool i8_array_value :1;
@@ -1175,6 +1182,7 @@ typedef struct _EmbeddingData__isset {
   bool f64_array_value :1;
   bool f16_array_value :1;
   bool bf16_array_value :1;
+  bool bytes_value :1;
 } _EmbeddingData__isset;
 
 class EmbeddingData : public virtual ::apache::thrift::TBase {
@@ -1182,7 +1190,8 @@ class EmbeddingData : public virtual ::apache::thrift::TBase {
 
   EmbeddingData(const EmbeddingData&);
   EmbeddingData& operator=(const EmbeddingData&);
-  EmbeddingData() noexcept {
+  EmbeddingData() noexcept
+                : bytes_value() {
   }
 
   virtual ~EmbeddingData() noexcept;
@@ -1196,6 +1205,7 @@ class EmbeddingData : public virtual ::apache::thrift::TBase {
   std::vector<double>  f64_array_value;
   std::vector<double>  f16_array_value;
   std::vector<double>  bf16_array_value;
+  std::string bytes_value;
 
   _EmbeddingData__isset __isset;
 
@@ -1219,6 +1229,8 @@ class EmbeddingData : public virtual ::apache::thrift::TBase {
 
   void __set_bf16_array_value(const std::vector<double> & val);
 
+  void __set_bytes_value(const std::string& val);
+
   bool operator == (const EmbeddingData & rhs) const
   {
     if (__isset.bool_array_value != rhs.__isset.bool_array_value)
@@ -1261,6 +1273,10 @@ class EmbeddingData : public virtual ::apache::thrift::TBase {
       return false;
     else if (__isset.bf16_array_value && !(bf16_array_value == rhs.bf16_array_value))
       return false;
+    if (__isset.bytes_value != rhs.__isset.bytes_value)
+      return false;
+    else if (__isset.bytes_value && !(bytes_value == rhs.bytes_value))
+      return false;
     return true;
   }
   bool operator != (const EmbeddingData &rhs) const {
@@ -2356,10 +2372,11 @@ void swap(Field &a, Field &b);
 std::ostream& operator<<(std::ostream& out, const Field& obj);
 
 typedef struct _ColumnField__isset {
-  _ColumnField__isset() : column_type(false), column_vectors(true), column_name(false) {}
+  _ColumnField__isset() : column_type(false), column_vectors(true), column_name(false), dimension(true) {}
   bool column_type :1;
   bool column_vectors :1;
   bool column_name :1;
+  bool dimension :1;
 } _ColumnField__isset;
 
 class ColumnField : public virtual ::apache::thrift::TBase {
@@ -2369,7 +2386,8 @@ class ColumnField : public virtual ::apache::thrift::TBase {
   ColumnField& operator=(const ColumnField&);
   ColumnField() noexcept
               : column_type(static_cast<ColumnType::type>(0)),
-                column_name() {
+                column_name(),
+                dimension(0LL) {
 
   }
 
@@ -2381,6 +2399,7 @@ class ColumnField : public virtual ::apache::thrift::TBase {
   ColumnType::type column_type;
   std::vector<std::string>  column_vectors;
   std::string column_name;
+  int64_t dimension;
 
   _ColumnField__isset __isset;
 
@@ -2390,6 +2409,8 @@ class ColumnField : public virtual ::apache::thrift::TBase {
 
   void __set_column_name(const std::string& val);
 
+  void __set_dimension(const int64_t val);
+
   bool operator == (const ColumnField & rhs) const
   {
     if (!(column_type == rhs.column_type))
@@ -2398,6 +2419,8 @@ class ColumnField : public virtual ::apache::thrift::TBase {
       return false;
     if (!(column_name == rhs.column_name))
       return false;
+    if (!(dimension == rhs.dimension))
+      return false;
     return true;
   }
   bool operator != (const ColumnField &rhs) const {
@@ -4242,11 +4265,12 @@ void swap(DropTableRequest &a, DropTableRequest &b);
 std::ostream& operator<<(std::ostream& out, const DropTableRequest& obj);
 
 typedef struct _InsertRequest__isset {
-  _InsertRequest__isset() : db_name(false), table_name(false), fields(true), session_id(false) {}
+  _InsertRequest__isset() : db_name(false), table_name(false), fields(true), session_id(false), column_fields(true) {}
   bool db_name :1;
   bool table_name :1;
   bool fields :1;
   bool session_id :1;
+  bool column_fields :1;
 } _InsertRequest__isset;
 
 class InsertRequest : public virtual ::apache::thrift::TBase {
@@ -4266,6 +4290,7 @@ class InsertRequest : public virtual ::apache::thrift::TBase {
   std::string table_name;
   std::vector<Field>  fields;
   int64_t session_id;
+  std::vector<ColumnField>  column_fields;
 
   _InsertRequest__isset __isset;
 
@@ -4277,6 +4302,8 @@ class InsertRequest : public virtual ::apache::thrift::TBase {
 
   void __set_session_id(const int64_t val);
 
+  void __set_column_fields(const std::vector<ColumnField> & val);
+
   bool operator == (const InsertRequest & rhs) const
   {
     if (!(db_name == rhs.db_name))
@@ -4287,6 +4314,8 @@ class InsertRequest : public virtual ::apache::thrift::TBase {
       return false;
     if (!(session_id == rhs.session_id))
       return false;
+    if (!(column_fields == rhs.column_fields))
+      return false;
     return true;
   }
   bool operator != (const InsertRequest &rhs) const {
@@ -4658,7 +4687,7 @@ void swap(ExplainResponse &a, ExplainResponse &b);
 std::ostream& operator<<(std::ostream& out, const ExplainResponse& obj);
 
 typedef struct _SelectRequest__isset {
-  _SelectRequest__isset() : session_id(false), db_name(false), table_name(false), select_list(true), highlight_list(true), search_expr(false), where_expr(false), group_by_list(true), having_expr(false), limit_expr(false), offset_expr(false), order_by_list(true), total_hits_count(false) {}
+  _SelectRequest__isset() : session_id(false), db_name(false), table_name(false), select_list(true), highlight_list(true), search_expr(false), where_expr(false), group_by_list(true), having_expr(false), limit_expr(false), offset_expr(false), order_by_list(true), total_hits_count(false), batch_rows(false), priority(false), profile(false) {}
   bool session_id :1;
   bool db_name :1;
   bool table_name :1;
@@ -4672,6 +4701,9 @@ typedef struct _SelectRequest__isset {
   bool offset_expr :1;
   bool order_by_list :1;
   bool total_hits_count :1;
+  bool batch_rows :1;
+  bool priority :1;
+  bool profile :1;
 } _SelectRequest__isset;
 
 class SelectRequest : public virtual ::apache::thrift::TBase {
@@ -4683,7 +4715,10 @@ class SelectRequest : public virtual ::apache::thrift::TBase {
                 : session_id(0),
                   db_name(),
                   table_name(),
-                  total_hits_count(0) {
+                  total_hits_count(0),
+                  batch_rows(0),
+                  priority(),
+                  profile(0) {
 
 
 
@@ -4704,6 +4739,9 @@ class SelectRequest : public virtual ::apache::thrift::TBase {
   ParsedExpr offset_expr;
   std::vector<OrderByExpr>  order_by_list;
   bool total_hits_count;
+  int64_t batch_rows;
+  std::string priority;
+  bool profile;
 
   _SelectRequest__isset __isset;
 
@@ -4733,6 +4771,12 @@ class SelectRequest : public virtual ::apache::thrift::TBase {
 
   void __set_total_hits_count(const bool val);
 
+  void __set_batch_rows(const int64_t val);
+
+  void __set_priority(const std::string& val);
+
+  void __set_profile(const bool val);
+
   bool operator == (const SelectRequest & rhs) const
   {
     if (!(session_id == rhs.session_id))
@@ -4779,6 +4823,18 @@ class SelectRequest : public virtual ::apache::thrift::TBase {
       return false;
     else if (__isset.total_hits_count && !(total_hits_count == rhs.total_hits_count))
       return false;
+    if (__isset.batch_rows != rhs.__isset.batch_rows)
+      return false;
+    else if (__isset.batch_rows && !(batch_rows == rhs.batch_rows))
+      return false;
+    if (__isset.priority != rhs.__isset.priority)
+      return false;
+    else if (__isset.priority && !(priority == rhs.priority))
+      return false;
+    if (__isset.profile != rhs.__isset.profile)
+      return false;
+    else if (__isset.profile && !(profile == rhs.profile))
+      return false;
     return true;
   }
   bool operator != (const SelectRequest &rhs) const {
@@ -4798,12 +4854,14 @@ void swap(SelectRequest &a, SelectRequest &b);
 std::ostream& operator<<(std::ostream& out, const SelectRequest& obj);
 
 typedef struct _SelectResponse__isset {
-  _SelectResponse__isset() : error_code(false), error_msg(false), column_defs(true), column_fields(true), extra_result(false) {}
+  _SelectResponse__isset() : error_code(false), error_msg(false), column_defs(true), column_fields(true), extra_result(false), cursor_id(false), profile(false) {}
   bool error_code :1;
   bool error_msg :1;
   bool column_defs :1;
   bool column_fields :1;
   bool extra_result :1;
+  bool cursor_id :1;
+  bool profile :1;
 } _SelectResponse__isset;
 
 class SelectResponse : public virtual ::apache::thrift::TBase {
@@ -4814,7 +4872,9 @@ class SelectResponse : public virtual ::apache::thrift::TBase {
   SelectResponse() noexcept
                  : error_code(0),
                    error_msg(),
-                   extra_result() {
+                   extra_result(),
+                   cursor_id(0),
+                   profile() {
 
 
   }
@@ -4825,6 +4885,8 @@ class SelectResponse : public virtual ::apache::thrift::TBase {
   std::vector<ColumnDef>  column_defs;
   std::vector<ColumnField>  column_fields;
   std::string extra_result;
+  int64_t cursor_id;
+  std::string profile;
 
   _SelectResponse__isset __isset;
 
@@ -4838,6 +4900,10 @@ class SelectResponse : public virtual ::apache::thrift::TBase {
 
   void __set_extra_result(const std::string& val);
 
+  void __set_cursor_id(const int64_t val);
+
+  void __set_profile(const std::string& val);
+
   bool operator == (const SelectResponse & rhs) const
   {
     if (!(error_code == rhs.error_code))
@@ -4850,6 +4916,12 @@ class SelectResponse : public virtual ::apache::thrift::TBase {
       return false;
     if (!(extra_result == rhs.extra_result))
       return false;
+    if (!(cursor_id == rhs.cursor_id))
+      return false;
+    if (__isset.profile != rhs.__isset.profile)
+      return false;
+    else if (__isset.profile && !(profile == rhs.profile))
+      return false;
     return true;
   }
   bool operator != (const SelectResponse &rhs) const {
@@ -4868,6 +4940,279 @@ void swap(SelectResponse &a, SelectResponse &b);
 
 std::ostream& operator<<(std::ostream& out, const SelectResponse& obj);
 
+typedef struct _MatchDenseBatchRequest__isset {
+  _MatchDenseBatchRequest__isset() : session_id(false), db_name(false), table_name(false), column_name(false), element_type(false), distance_type(false), dimension(false), query_count(false), query_data(false), topn(false), opt_params(true), where_expr(false), priority(false) {}
+  bool session_id :1;
+  bool db_name :1;
+  bool table_name :1;
+  bool column_name :1;
+  bool element_type :1;
+  bool distance_type :1;
+  bool dimension :1;
+  bool query_count :1;
+  bool query_data :1;
+  bool topn :1;
+  bool opt_params :1;
+  bool where_expr :1;
+  bool priority :1;
+} _MatchDenseBatchRequest__isset;
+
+class MatchDenseBatchRequest : public virtual ::apache::thrift::TBase {
+ public:
+
+  MatchDenseBatchRequest(const MatchDenseBatchRequest&);
+  MatchDenseBatchRequest& operator=(const MatchDenseBatchRequest&);
+  MatchDenseBatchRequest() noexcept
+                         : session_id(0),
+                           db_name(),
+                           table_name(),
+                           column_name(),
+                           element_type(static_cast<ElementType::type>(0)),
+                           distance_type(static_cast<KnnDistanceType::type>(0)),
+                           dimension(0),
+                           query_count(0),
+                           query_data(),
+                           topn(0),
+                           priority() {
+
+  }
+
+  virtual ~MatchDenseBatchRequest() noexcept;
+  int64_t session_id;
+  std::string db_name;
+  std::string table_name;
+  std::string column_name;
+  /**
+   * 
+   * @see ElementType
+   */
+  ElementType::type element_type;
+  /**
+   * 
+   * @see KnnDistanceType
+   */
+  KnnDistanceType::type distance_type;
+  int64_t dimension;
+  int64_t query_count;
+  std::string query_data;
+  int64_t topn;
+  std::vector<InitParameter>  opt_params;
+  ParsedExpr where_expr;
+  std::string priority;
+
+  _MatchDenseBatchRequest__isset __isset;
+
+  void __set_session_id(const int64_t val);
+
+  void __set_db_name(const std::string& val);
+
+  void __set_table_name(const std::string& val);
+
+  void __set_column_name(const std::string& val);
+
+  void __set_element_type(const ElementType::type val);
+
+  void __set_distance_type(const KnnDistanceType::type val);
+
+  void __set_dimension(const int64_t val);
+
+  void __set_query_count(const int64_t val);
+
+  void __set_query_data(const std::string& val);
+
+  void __set_topn(const int64_t val);
+
+  void __set_opt_params(const std::vector<InitParameter> & val);
+
+  void __set_where_expr(const ParsedExpr& val);
+
+  void __set_priority(const std::string& val);
+
+  bool operator == (const MatchDenseBatchRequest & rhs) const
+  {
+    if (!(session_id == rhs.session_id))
+      return false;
+    if (!(db_name == rhs.db_name))
+      return false;
+    if (!(table_name == rhs.table_name))
+      return false;
+    if (!(column_name == rhs.column_name))
+      return false;
+    if (!(element_type == rhs.element_type))
+      return false;
+    if (!(distance_type == rhs.distance_type))
+      return false;
+    if (!(dimension == rhs.dimension))
+      return false;
+    if (!(query_count == rhs.query_count))
+      return false;
+    if (!(query_data == rhs.query_data))
+      return false;
+    if (!(topn == rhs.topn))
+      return false;
+    if (!(opt_params == rhs.opt_params))
+      return false;
+    if (__isset.where_expr != rhs.__isset.where_expr)
+      return false;
+    else if (__isset.where_expr && !(where_expr == rhs.where_expr))
+      return false;
+    if (__isset.priority != rhs.__isset.priority)
+      return false;
+    else if (__isset.priority && !(priority == rhs.priority))
+      return false;
+    return true;
+  }
+  bool operator != (const MatchDenseBatchRequest &rhs) const {
+    return !(*this == rhs);
+  }
+
+  bool operator < (const MatchDenseBatchRequest & ) const;
+
+  uint32_t read(::apache::thrift::protocol::TProtocol* iprot) override;
+  uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const override;
+
+  virtual void printTo(std::ostream& out) const;
+};
+
+void swap(MatchDenseBatchRequest &a, MatchDenseBatchRequest &b);
+
+std::ostream& operator<<(std::ostream& out, const MatchDenseBatchRequest& obj);
+
+typedef struct _MatchDenseBatchResponse__isset {
+  _MatchDenseBatchResponse__isset() : error_code(false), error_msg(false), query_count(false), topn(false), row_ids(false), distances(false) {}
+  bool error_code :1;
+  bool error_msg :1;
+  bool query_count :1;
+  bool topn :1;
+  bool row_ids :1;
+  bool distances :1;
+} _MatchDenseBatchResponse__isset;
+
+class MatchDenseBatchResponse : public virtual ::apache::thrift::TBase {
+ public:
+
+  MatchDenseBatchResponse(const MatchDenseBatchResponse&);
+  MatchDenseBatchResponse& operator=(const MatchDenseBatchResponse&);
+  MatchDenseBatchResponse() noexcept
+                          : error_code(0),
+                            error_msg(),
+                            query_count(0),
+                            topn(0),
+                            row_ids(),
+                            distances() {
+  }
+
+  virtual ~MatchDenseBatchResponse() noexcept;
+  int64_t error_code;
+  std::string error_msg;
+  int64_t query_count;
+  int64_t topn;
+  std::string row_ids;
+  std::string distances;
+
+  _MatchDenseBatchResponse__isset __isset;
+
+  void __set_error_code(const int64_t val);
+
+  void __set_error_msg(const std::string& val);
+
+  void __set_query_count(const int64_t val);
+
+  void __set_topn(const int64_t val);
+
+  void __set_row_ids(const std::string& val);
+
+  void __set_distances(const std::string& val);
+
+  bool operator == (const MatchDenseBatchResponse & rhs) const
+  {
+    if (!(error_code == rhs.error_code))
+      return false;
+    if (!(error_msg == rhs.error_msg))
+      return false;
+    if (!(query_count == rhs.query_count))
+      return false;
+    if (!(topn == rhs.topn))
+      return false;
+    if (!(row_ids == rhs.row_ids))
+      return false;
+    if (!(distances == rhs.distances))
+      return false;
+    return true;
+  }
+  bool operator != (const MatchDenseBatchResponse &rhs) const {
+    return !(*this == rhs);
+  }
+
+  bool operator < (const MatchDenseBatchResponse & ) const;
+
+  uint32_t read(::apache::thrift::protocol::TProtocol* iprot) override;
+  uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const override;
+
+  virtual void printTo(std::ostream& out) const;
+};
+
+void swap(MatchDenseBatchResponse &a, MatchDenseBatchResponse &b);
+
+std::ostream& operator<<(std::ostream& out, const MatchDenseBatchResponse& obj);
+
+typedef struct _FetchCursorRequest__isset {
+  _FetchCursorRequest__isset() : session_id(false), cursor_id(false), close(false) {}
+  bool session_id :1;
+  bool cursor_id :1;
+  bool close :1;
+} _FetchCursorRequest__isset;
+
+class FetchCursorRequest : public virtual ::apache::thrift::TBase {
+ public:
+
+  FetchCursorRequest(const FetchCursorRequest&);
+  FetchCursorRequest& operator=(const FetchCursorRequest&);
+  FetchCursorRequest() noexcept
+                     : session_id(0),
+                       cursor_id(0),
+                       close(0) {
+  }
+
+  virtual ~FetchCursorRequest() noexcept;
+  int64_t session_id;
+  int64_t cursor_id;
+  bool close;
+
+  _FetchCursorRequest__isset __isset;
+
+  void __set_session_id(const int64_t val);
+
+  void __set_cursor_id(const int64_t val);
+
+  void __set_close(const bool val);
+
+  bool operator == (const FetchCursorRequest & rhs) const
+  {
+    if (!(session_id == rhs.session_id))
+      return false;
+    if (!(cursor_id == rhs.cursor_id))
+      return false;
+    if (!(close == rhs.close))
+      return false;
+    return true;
+  }
+  bool operator != (const FetchCursorRequest &rhs) const {
+    return !(*this == rhs);
+  }
+
+  bool operator < (const FetchCursorRequest & ) const;
+
+  uint32_t read(::apache::thrift::protocol::TProtocol* iprot) override;
+  uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const override;
+
+  virtual void printTo(std::ostream& out) const;
+};
+
+void swap(FetchCursorRequest &a, FetchCursorRequest &b);
+
+std::ostream& operator<<(std::ostream& out, const FetchCursorRequest& obj);
+
 typedef struct _DeleteRequest__isset {
   _DeleteRequest__isset() : db_name(false), table_name(false), where_expr(false), session_id(false) {}
   bool db_name :1;
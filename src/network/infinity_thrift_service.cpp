@@ -14,8 +14,13 @@
 
 module;
 
+#include <algorithm>
+#include <cstdlib>
 #include <cstring>
+#include <limits>
 #include <string>
+#include <thread>
+#include <type_traits>
 #include <vector>
 
 module infinity_thrift_service;
@@ -110,8 +115,15 @@ Pair<const char *, Status> ClientVersions::GetVersionByIndex(i64 version_index)
 std::mutex InfinityThriftService::infinity_session_map_mutex_;
 HashMap<u64, SharedPtr<Infinity>> InfinityThriftService::infinity_session_map_;
 ClientVersions InfinityThriftService::client_version_;
+std::mutex InfinityThriftService::cursor_map_mutex_;
+HashMap<i64, InfinityThriftService::SelectCursor> InfinityThriftService::cursor_map_;
+i64 InfinityThriftService::next_cursor_id_{0};
 
 u32 InfinityThriftService::ClearSessionMap() {
+    {
+        std::lock_guard lock(cursor_map_mutex_);
+        cursor_map_.clear();
+    }
     std::lock_guard lock(infinity_session_map_mutex_);
     const auto session_count = infinity_session_map_.size();
     infinity_session_map_.clear();
@@ -151,6 +163,7 @@ void InfinityThriftService::Connect(infinity_thrift_rpc::CommonResponse &respons
 
 void InfinityThriftService::Disconnect(infinity_thrift_rpc::CommonResponse &response, const infinity_thrift_rpc::CommonRequest &request) {
     auto status = GetAndRemoveSessionID(request.session_id);
+    RemoveSessionCursors(request.session_id);
     if (status.ok()) {
         response.__set_error_code((i64)(status.code()));
         LOG_TRACE(fmt::format("THRIFT: Disconnect session {} success", request.session_id));
@@ -303,7 +316,7 @@ void InfinityThriftService::Insert(infinity_thrift_rpc::CommonResponse &response
         return;
     }
 
-    if (request.fields.empty()) {
+    if (request.fields.empty() && request.column_fields.empty()) {
         ProcessStatus(response, Status::InsertWithoutValues());
         return;
     }
@@ -320,6 +333,52 @@ void InfinityThriftService::Insert(infinity_thrift_rpc::CommonResponse &response
             insert_rows = nullptr;
         }
     });
+
+    if (!request.column_fields.empty()) {
+        // Columnar insert: every column arrives as one contiguous buffer, decode them into rows here
+        Vector<Vector<UniquePtr<ConstantExpr>>> column_values(request.column_fields.size());
+        for (SizeT column_idx = 0; column_idx < request.column_fields.size(); ++column_idx) {
+            constant_status = GetConstantsFromColumnField(column_values[column_idx], request.column_fields[column_idx]);
+            if (!constant_status.ok()) {
+                ProcessStatus(response, constant_status);
+                return;
+            }
+            if (column_values[column_idx].size() != column_values[0].size()) {
+                ProcessStatus(response,
+                              Status::ColumnCountMismatch(fmt::format("Column {} has {} rows, expect {}",
+                                                                      request.column_fields[column_idx].column_name,
+                                                                      column_values[column_idx].size(),
+                                                                      column_values[0].size())));
+                return;
+            }
+        }
+        if (column_values[0].empty()) {
+            ProcessStatus(response, Status::InsertWithoutValues());
+            return;
+        }
+
+        Vector<String> column_names;
+        column_names.reserve(request.column_fields.size());
+        for (const auto &column_field : request.column_fields) {
+            column_names.emplace_back(column_field.column_name);
+        }
+        const SizeT row_count = column_values[0].size();
+        insert_rows->reserve(row_count);
+        for (SizeT row_idx = 0; row_idx < row_count; ++row_idx) {
+            auto insert_row = std::make_unique<InsertRowExpr>();
+            insert_row->columns_ = column_names;
+            insert_row->values_.reserve(column_values.size());
+            for (auto &values : column_values) {
+                insert_row->values_.emplace_back(values[row_idx].release());
+            }
+            insert_rows->emplace_back(insert_row.release());
+        }
+        auto result = infinity->Insert(request.db_name, request.table_name, insert_rows);
+        insert_rows = nullptr;
+        ProcessQueryResult(response, result);
+        return;
+    }
+
     insert_rows->reserve(request.fields.size());
     for (auto &field : request.fields) {
         auto insert_row = std::make_unique<InsertRowExpr>();
@@ -354,6 +413,8 @@ Tuple<CopyFileType, Status> InfinityThriftService::GetCopyFileType(infinity_thri
             return {CopyFileType::kCSR, Status::OK()};
         case infinity_thrift_rpc::CopyFileType::BVECS:
             return {CopyFileType::kBVECS, Status::OK()};
+        case infinity_thrift_rpc::CopyFileType::PARQUET:
+            return {CopyFileType::kPARQUET, Status::OK()};
         default: {
             return {CopyFileType::kInvalid, Status::ImportFileFormatError("Not implemented yet")};
         }
@@ -457,6 +518,22 @@ void InfinityThriftService::Select(infinity_thrift_rpc::SelectResponse &response
         return;
     }
 
+    if (request.__isset.batch_rows && request.batch_rows <= 0) {
+        ProcessStatus(response,
+                      Status::InvalidParameterValue("batch_rows", std::to_string(request.batch_rows), "batch_rows should be greater than 0"));
+        return;
+    }
+
+    QueryPriority priority = QueryPriority::kInteractive;
+    if (request.__isset.priority) {
+        priority = StrToQueryPriority(request.priority);
+        if (priority == QueryPriority::kInvalid) {
+            ProcessStatus(response,
+                          Status::InvalidQueryOption(fmt::format("Unknown priority: {}, expect interactive, batch or background", request.priority)));
+            return;
+        }
+    }
+
     Vector<ParsedExpr *> *output_columns = new Vector<ParsedExpr *>();
     DeferFn defer_fn1([&]() {
         if (output_columns != nullptr) {
@@ -714,7 +791,9 @@ void InfinityThriftService::Select(infinity_thrift_rpc::SelectResponse &response
                                                 order_by_list,
                                                 group_by_list,
                                                 having,
-                                                request.total_hits_count);
+                                                request.total_hits_count,
+                                                priority,
+                                                request.__isset.profile and request.profile);
     output_columns = nullptr;
     highlight_columns = nullptr;
     filter = nullptr;
@@ -730,13 +809,42 @@ void InfinityThriftService::Select(infinity_thrift_rpc::SelectResponse &response
     //
     // auto start4 = std::chrono::steady_clock::now();
 
-    if (result.IsOk()) {
+    if (result.IsOk() && request.__isset.batch_rows) {
+        // the first batch goes with this response, the client fetches the rest with FetchCursor
+        SelectCursor cursor{request.session_id, result.result_table_, 0, 0, request.batch_rows};
+        SizeT blocks_count = result.result_table_->DataBlockCount();
+        for (SizeT block_idx = 0; block_idx < blocks_count; ++block_idx) {
+            cursor.size_in_bytes_ += result.result_table_->GetDataBlockById(block_idx)->GetSizeInBytes();
+        }
+        ProcessCursorBatch(cursor, response);
+        if (response.error_code == (i64)(ErrorCode::kOk) && cursor.size_in_bytes_ > kMaxCursorBytesPerSession) {
+            ProcessStatus(response,
+                          Status::OutOfMemory(fmt::format("the rest of the result takes {} bytes, a session keeps at most {} bytes under cursors",
+                                                          cursor.size_in_bytes_,
+                                                          kMaxCursorBytesPerSession)));
+            return;
+        }
+        if (result.result_table_->total_hits_count_flag_) {
+            nlohmann::json json_response;
+            json_response["total_hits_count"] = result.result_table_->total_hits_count_;
+            response.extra_result = json_response.dump();
+        }
+        if (response.error_code == (i64)(ErrorCode::kOk) && cursor.next_block_idx_ < cursor.result_table_->DataBlockCount()) {
+            std::lock_guard<std::mutex> lock(cursor_map_mutex_);
+            i64 cursor_id = ++next_cursor_id_;
+            StoreCursor(cursor_id, std::move(cursor));
+            response.__set_cursor_id(cursor_id);
+        }
+    } else if (result.IsOk()) {
         auto &columns = response.column_fields;
         columns.resize(result.result_table_->ColumnCount());
         ProcessDataBlocks(result, response, columns);
     } else {
         ProcessQueryResult(response, result);
     }
+    if (!result.profile_.empty()) {
+        response.__set_profile(result.profile_);
+    }
 
     // auto end4 = std::chrono::steady_clock::now();
     // phase_4_duration_ += end4 - start4;
@@ -762,6 +870,262 @@ void InfinityThriftService::Select(infinity_thrift_rpc::SelectResponse &response
     // }
 }
 
+void InfinityThriftService::MatchDenseBatch(infinity_thrift_rpc::MatchDenseBatchResponse &response,
+                                            const infinity_thrift_rpc::MatchDenseBatchRequest &request) {
+    auto [infinity, infinity_status] = GetInfinityBySessionID(request.session_id);
+    if (!infinity_status.ok()) {
+        ProcessStatus(response, infinity_status);
+        return;
+    }
+
+    if (GetDistanceTypeFormProto(request.distance_type) == KnnDistanceType::kInvalid) {
+        ProcessStatus(response, Status::InvalidKnnDistanceType());
+        return;
+    }
+    EmbeddingDataType embedding_data_type = GetEmbeddingDataTypeFromProto(request.element_type);
+    if (embedding_data_type == EmbeddingDataType::kElemInvalid) {
+        ProcessStatus(response, Status::InvalidEmbeddingDataType("invalid"));
+        return;
+    }
+    if (request.topn <= 0) {
+        ProcessStatus(response, Status::InvalidParameterValue("topn", std::to_string(request.topn), "topn should be greater than 0"));
+        return;
+    }
+    if (request.dimension <= 0 || request.query_count < 0) {
+        ProcessStatus(response,
+                      Status::InvalidParameterValue("dimension / query_count",
+                                                    fmt::format("{} / {}", request.dimension, request.query_count),
+                                                    "dimension should be greater than 0 and query_count should not be negative"));
+        return;
+    }
+    const SizeT query_size = EmbeddingT::EmbeddingSize(embedding_data_type, request.dimension);
+    if (request.query_data.size() != query_size * request.query_count) {
+        ProcessStatus(response,
+                      Status::InvalidParameterValue("query_data",
+                                                    fmt::format("{} bytes", request.query_data.size()),
+                                                    fmt::format("{} bytes for {} queries", query_size * request.query_count, request.query_count)));
+        return;
+    }
+    QueryPriority priority = QueryPriority::kInteractive;
+    if (request.__isset.priority) {
+        priority = StrToQueryPriority(request.priority);
+        if (priority == QueryPriority::kInvalid) {
+            ProcessStatus(response,
+                          Status::InvalidQueryOption(fmt::format("Unknown priority: {}, expect interactive, batch or background", request.priority)));
+            return;
+        }
+    }
+
+    const SizeT query_count = request.query_count;
+    const SizeT topn = request.topn;
+    // The queries are built by the same code as match_dense() and run through this session in one transaction, their plans
+    // are executed concurrently by the task scheduler. A KnnExpr built from a proto doesn't own its embedding data, so every
+    // query is built from one proto holding the first query, then pointed at its own slice of query_data without a copy.
+    infinity_thrift_rpc::KnnExpr knn_proto;
+    knn_proto.column_expr.column_name.emplace_back(request.column_name);
+    knn_proto.embedding_data.__set_bytes_value(String(request.query_data.data(), query_count > 0 ? query_size : 0));
+    knn_proto.embedding_data_type = request.element_type;
+    knn_proto.distance_type = request.distance_type;
+    knn_proto.topn = request.topn;
+    knn_proto.opt_params = request.opt_params;
+    Vector<SearchExpr *> search_exprs;
+    Vector<ParsedExpr *> filters;
+    Vector<Vector<ParsedExpr *> *> output_columns_list;
+    DeferFn defer_fn([&]() {
+        for (auto *search_expr : search_exprs) {
+            delete search_expr;
+        }
+        for (auto *filter : filters) {
+            delete filter;
+        }
+        for (auto *output_columns : output_columns_list) {
+            if (output_columns != nullptr) {
+                for (auto *expr : *output_columns) {
+                    delete expr;
+                }
+                delete output_columns;
+            }
+        }
+    });
+    search_exprs.reserve(query_count);
+    filters.reserve(query_count);
+    output_columns_list.reserve(query_count);
+    const KnnDistanceType distance_type = GetDistanceTypeFormProto(request.distance_type);
+    const bool is_distance = distance_type == KnnDistanceType::kL2 || distance_type == KnnDistanceType::kHamming;
+    for (SizeT query_idx = 0; query_idx < query_count; ++query_idx) {
+        Status status;
+        KnnExpr *knn_expr = GetKnnExprFromProto(status, knn_proto);
+        if (!status.ok()) {
+            delete knn_expr;
+            ProcessStatus(response, status);
+            return;
+        }
+        knn_expr->embedding_data_ptr_ = (void *)(request.query_data.data() + query_idx * query_size);
+        auto *search_expr = new SearchExpr();
+        search_exprs.push_back(search_expr);
+        search_expr->SetExprs(new Vector<ParsedExpr *>{knn_expr});
+
+        ParsedExpr *filter = nullptr;
+        if (request.__isset.where_expr) {
+            filter = GetParsedExprFromProto(status, request.where_expr);
+            if (!status.ok()) {
+                delete filter;
+                ProcessStatus(response, status);
+                return;
+            }
+        }
+        filters.push_back(filter);
+
+        auto row_id_expr = new FunctionExpr();
+        row_id_expr->func_name_ = "row_id";
+        auto distance_expr = new FunctionExpr();
+        distance_expr->func_name_ = is_distance ? "distance" : "similarity";
+        output_columns_list.push_back(new Vector<ParsedExpr *>{row_id_expr, distance_expr});
+    }
+
+    Vector<QueryResult> results = infinity->SearchBatch(request.db_name, request.table_name, search_exprs, filters, output_columns_list, priority);
+
+    // missing results stay -1 / NaN
+    String row_ids(query_count * topn * sizeof(RowID), '\xff');
+    Vector<f32> distances(query_count * topn, std::numeric_limits<f32>::quiet_NaN());
+    Status status;
+    for (SizeT query_idx = 0; query_idx < query_count && status.ok(); ++query_idx) {
+        if (results[query_idx].IsOk()) {
+            status = CopyMatchDenseBatchResult(results[query_idx],
+                                               topn,
+                                               row_ids.data() + query_idx * topn * sizeof(RowID),
+                                               distances.data() + query_idx * topn);
+        } else {
+            status = results[query_idx].status_.clone();
+        }
+    }
+    if (!status.ok()) {
+        ProcessStatus(response, status);
+        return;
+    }
+    response.__set_query_count(query_count);
+    response.__set_topn(topn);
+    response.__set_row_ids(std::move(row_ids));
+    response.__set_distances(String(reinterpret_cast<const char *>(distances.data()), distances.size() * sizeof(f32)));
+    ProcessStatus(response, Status::OK());
+}
+
+void InfinityThriftService::FetchCursor(infinity_thrift_rpc::SelectResponse &response, const infinity_thrift_rpc::FetchCursorRequest &request) {
+    auto [infinity, infinity_status] = GetInfinityBySessionID(request.session_id);
+    if (!infinity_status.ok()) {
+        ProcessStatus(response, infinity_status);
+        return;
+    }
+
+    // taken out of the map while the batch is serialized, a cursor has a single reader
+    SelectCursor cursor;
+    {
+        std::lock_guard<std::mutex> lock(cursor_map_mutex_);
+        auto iter = cursor_map_.find(request.cursor_id);
+        if (iter == cursor_map_.end() || iter->second.session_id_ != request.session_id) {
+            ProcessStatus(response,
+                          Status::InvalidParameterValue("cursor_id",
+                                                        std::to_string(request.cursor_id),
+                                                        "an open cursor returned by Select of this session, it may have expired"));
+            return;
+        }
+        cursor = std::move(iter->second);
+        cursor_map_.erase(iter);
+    }
+    if (request.close) {
+        response.__set_error_code((i64)(ErrorCode::kOk));
+        return;
+    }
+
+    ProcessCursorBatch(cursor, response);
+    if (response.error_code == (i64)(ErrorCode::kOk) && cursor.next_block_idx_ < cursor.result_table_->DataBlockCount()) {
+        std::lock_guard<std::mutex> lock(cursor_map_mutex_);
+        StoreCursor(request.cursor_id, std::move(cursor));
+        response.__set_cursor_id(request.cursor_id);
+    }
+}
+
+void InfinityThriftService::StoreCursor(i64 cursor_id, SelectCursor cursor) {
+    const auto now = Clock::now();
+    const i64 session_id = cursor.session_id_;
+    cursor.last_access_ = now;
+    SizeT session_cursor_count = 0;
+    SizeT session_size_in_bytes = 0;
+    auto lru_iter = cursor_map_.end();
+    for (auto iter = cursor_map_.begin(); iter != cursor_map_.end();) {
+        if (now - iter->second.last_access_ >= kCursorIdleTimeout) {
+            LOG_INFO(fmt::format("Release cursor {} of session {} idle for {}s", iter->first, iter->second.session_id_, kCursorIdleTimeout.count()));
+            iter = cursor_map_.erase(iter);
+            continue;
+        }
+        if (iter->second.session_id_ == session_id) {
+            ++session_cursor_count;
+            session_size_in_bytes += iter->second.size_in_bytes_;
+            if (lru_iter == cursor_map_.end() || iter->second.last_access_ < lru_iter->second.last_access_) {
+                lru_iter = iter;
+            }
+        }
+        ++iter;
+    }
+    while (session_cursor_count >= kMaxCursorPerSession || session_size_in_bytes + cursor.size_in_bytes_ > kMaxCursorBytesPerSession) {
+        LOG_INFO(fmt::format("Release cursor {} of session {} opening more than {} cursors or {} bytes",
+                             lru_iter->first,
+                             session_id,
+                             kMaxCursorPerSession,
+                             kMaxCursorBytesPerSession));
+        --session_cursor_count;
+        session_size_in_bytes -= lru_iter->second.size_in_bytes_;
+        cursor_map_.erase(lru_iter);
+        lru_iter = cursor_map_.end();
+        for (auto iter = cursor_map_.begin(); iter != cursor_map_.end(); ++iter) {
+            if (iter->second.session_id_ == session_id &&
+                (lru_iter == cursor_map_.end() || iter->second.last_access_ < lru_iter->second.last_access_)) {
+                lru_iter = iter;
+            }
+        }
+    }
+    cursor_map_.emplace(cursor_id, std::move(cursor));
+}
+
+void InfinityThriftService::RemoveSessionCursors(i64 session_id) {
+    std::lock_guard<std::mutex> lock(cursor_map_mutex_);
+    for (auto iter = cursor_map_.begin(); iter != cursor_map_.end();) {
+        if (iter->second.session_id_ == session_id) {
+            iter = cursor_map_.erase(iter);
+        } else {
+            ++iter;
+        }
+    }
+}
+
+Status InfinityThriftService::CopyMatchDenseBatchResult(const QueryResult &result, SizeT topn, char *row_ids, f32 *distances) {
+    SizeT row_idx = 0;
+    SizeT blocks_count = result.result_table_->DataBlockCount();
+    for (SizeT block_idx = 0; block_idx < blocks_count && row_idx < topn; ++block_idx) {
+        auto data_block = result.result_table_->GetDataBlockById(block_idx);
+        SizeT row_count = std::min<SizeT>(data_block->row_count(), topn - row_idx);
+        const auto &row_id_column = data_block->column_vectors[0];
+        const auto &distance_column = data_block->column_vectors[1];
+        std::memcpy(row_ids + row_idx * sizeof(RowID), row_id_column->data(), row_count * sizeof(RowID));
+        switch (distance_column->data_type()->type()) {
+            case LogicalType::kFloat: {
+                std::memcpy(distances + row_idx, distance_column->data(), row_count * sizeof(f32));
+                break;
+            }
+            case LogicalType::kDouble: {
+                auto src = reinterpret_cast<const f64 *>(distance_column->data());
+                std::transform(src, src + row_count, distances + row_idx, [](f64 v) { return static_cast<f32>(v); });
+                break;
+            }
+            default: {
+                return Status::NotSupport(fmt::format("Distance of type {}", distance_column->data_type()->ToString()));
+            }
+        }
+        row_idx += row_count;
+    }
+    return Status::OK();
+}
+
 void InfinityThriftService::Explain(infinity_thrift_rpc::SelectResponse &response, const infinity_thrift_rpc::ExplainRequest &request) {
     auto [infinity, infinity_status] = GetInfinityBySessionID(request.session_id);
     if (!infinity_status.ok()) {
@@ -2230,6 +2594,136 @@ ConstantExpr *InfinityThriftService::GetConstantFromProto(Status &status, const
     }
 }
 
+namespace {
+
+template <typename T>
+Status GetConstantsFromPodBuffer(Vector<UniquePtr<ConstantExpr>> &constants, const String &column_name, const String &buffer, i64 dimension) {
+    const SizeT width = dimension == 0 ? 1 : dimension;
+    const SizeT row_bytes = width * sizeof(T);
+    if (buffer.size() % row_bytes != 0) {
+        return Status::SyntaxError(fmt::format("Column {} buffer size {} isn't a multiple of row size {}", column_name, buffer.size(), row_bytes));
+    }
+    const SizeT row_count = buffer.size() / row_bytes;
+    constants.reserve(row_count);
+    for (SizeT row_idx = 0; row_idx < row_count; ++row_idx) {
+        const char *row_ptr = buffer.data() + row_idx * row_bytes;
+        UniquePtr<ConstantExpr> constant_expr;
+        if constexpr (std::is_floating_point_v<T>) {
+            if (dimension == 0) {
+                constant_expr = MakeUnique<ConstantExpr>(LiteralType::kDouble);
+                T value;
+                std::memcpy(&value, row_ptr, sizeof(T));
+                constant_expr->double_value_ = value;
+            } else {
+                constant_expr = MakeUnique<ConstantExpr>(LiteralType::kDoubleArray);
+                constant_expr->double_array_.resize(width);
+                for (SizeT i = 0; i < width; ++i) {
+                    T value;
+                    std::memcpy(&value, row_ptr + i * sizeof(T), sizeof(T));
+                    constant_expr->double_array_[i] = value;
+                }
+            }
+        } else if constexpr (std::is_same_v<T, bool>) {
+            if (dimension == 0) {
+                constant_expr = MakeUnique<ConstantExpr>(LiteralType::kBoolean);
+                constant_expr->bool_value_ = row_ptr[0] != 0;
+            } else {
+                constant_expr = MakeUnique<ConstantExpr>(LiteralType::kIntegerArray);
+                constant_expr->long_array_.resize(width);
+                for (SizeT i = 0; i < width; ++i) {
+                    constant_expr->long_array_[i] = row_ptr[i] != 0;
+                }
+            }
+        } else {
+            if (dimension == 0) {
+                constant_expr = MakeUnique<ConstantExpr>(LiteralType::kInteger);
+                T value;
+                std::memcpy(&value, row_ptr, sizeof(T));
+                constant_expr->integer_value_ = value;
+            } else {
+                constant_expr = MakeUnique<ConstantExpr>(LiteralType::kIntegerArray);
+                constant_expr->long_array_.resize(width);
+                for (SizeT i = 0; i < width; ++i) {
+                    T value;
+                    std::memcpy(&value, row_ptr + i * sizeof(T), sizeof(T));
+                    constant_expr->long_array_[i] = value;
+                }
+            }
+        }
+        constants.emplace_back(std::move(constant_expr));
+    }
+    return Status::OK();
+}
+
+Status GetConstantsFromVarcharBuffer(Vector<UniquePtr<ConstantExpr>> &constants, const String &column_name, const String &buffer) {
+    // Same layout as the varchar column of a select response: u32 length followed by the bytes
+    SizeT offset = 0;
+    while (offset < buffer.size()) {
+        if (offset + sizeof(u32) > buffer.size()) {
+            return Status::SyntaxError(fmt::format("Column {} has a truncated varchar length at offset {}", column_name, offset));
+        }
+        u32 length;
+        std::memcpy(&length, buffer.data() + offset, sizeof(u32));
+        offset += sizeof(u32);
+        if (offset + length > buffer.size()) {
+            return Status::SyntaxError(fmt::format("Column {} has a truncated varchar value at offset {}", column_name, offset));
+        }
+        auto constant_expr = MakeUnique<ConstantExpr>(LiteralType::kString);
+        constant_expr->str_value_ = static_cast<char *>(std::malloc(length + 1));
+        std::memcpy(constant_expr->str_value_, buffer.data() + offset, length);
+        constant_expr->str_value_[length] = '\0';
+        offset += length;
+        constants.emplace_back(std::move(constant_expr));
+    }
+    return Status::OK();
+}
+
+} // namespace
+
+Status InfinityThriftService::GetConstantsFromColumnField(Vector<UniquePtr<ConstantExpr>> &constants,
+                                                          const infinity_thrift_rpc::ColumnField &column_field) {
+    if (column_field.column_vectors.size() != 1) {
+        return Status::SyntaxError(
+            fmt::format("Column {} should be sent as one buffer, got {}", column_field.column_name, column_field.column_vectors.size()));
+    }
+    if (column_field.dimension < 0) {
+        return Status::SyntaxError(fmt::format("Column {} has invalid dimension {}", column_field.column_name, column_field.dimension));
+    }
+    const String &buffer = column_field.column_vectors[0];
+    switch (column_field.column_type) {
+        case infinity_thrift_rpc::ColumnType::ColumnBool: {
+            return GetConstantsFromPodBuffer<bool>(constants, column_field.column_name, buffer, column_field.dimension);
+        }
+        case infinity_thrift_rpc::ColumnType::ColumnInt8: {
+            return GetConstantsFromPodBuffer<i8>(constants, column_field.column_name, buffer, column_field.dimension);
+        }
+        case infinity_thrift_rpc::ColumnType::ColumnInt16: {
+            return GetConstantsFromPodBuffer<i16>(constants, column_field.column_name, buffer, column_field.dimension);
+        }
+        case infinity_thrift_rpc::ColumnType::ColumnInt32: {
+            return GetConstantsFromPodBuffer<i32>(constants, column_field.column_name, buffer, column_field.dimension);
+        }
+        case infinity_thrift_rpc::ColumnType::ColumnInt64: {
+            return GetConstantsFromPodBuffer<i64>(constants, column_field.column_name, buffer, column_field.dimension);
+        }
+        case infinity_thrift_rpc::ColumnType::ColumnFloat32: {
+            return GetConstantsFromPodBuffer<f32>(constants, column_field.column_name, buffer, column_field.dimension);
+        }
+        case infinity_thrift_rpc::ColumnType::ColumnFloat64: {
+            return GetConstantsFromPodBuffer<f64>(constants, column_field.column_name, buffer, column_field.dimension);
+        }
+        case infinity_thrift_rpc::ColumnType::ColumnVarchar: {
+            if (column_field.dimension != 0) {
+                return Status::SyntaxError(fmt::format("Varchar column {} can't have a dimension", column_field.column_name));
+            }
+            return GetConstantsFromVarcharBuffer(constants, column_field.column_name, buffer);
+        }
+        default: {
+            return Status::InvalidDataType();
+        }
+    }
+}
+
 ColumnExpr *InfinityThriftService::GetColumnExprFromProto(const infinity_thrift_rpc::ColumnExpr &column_expr) {
     auto parsed_expr = new ColumnExpr();
 
@@ -2286,7 +2780,7 @@ KnnExpr *InfinityThriftService::GetKnnExprFromProto(Status &status, const infini
         return nullptr;
     }
 
-    auto [embedding_data_ptr, dimension, status2] = GetEmbeddingDataTypeDataPtrFromProto(expr.embedding_data);
+    auto [embedding_data_ptr, dimension, status2] = GetEmbeddingDataTypeDataPtrFromProto(expr.embedding_data, knn_expr->embedding_data_type_);
     knn_expr->embedding_data_ptr_ = embedding_data_ptr;
     if (knn_expr->embedding_data_type_ == EmbeddingDataType::kElemBit) {
         knn_expr->dimension_ = dimension * 8;
@@ -2389,7 +2883,7 @@ MatchTensorExpr *InfinityThriftService::GetMatchTensorExprFromProto(Status &stat
     match_tensor_expr->SetSearchMethodStr(expr.search_method);
     match_tensor_expr->column_expr_.reset(GetColumnExprFromProto(expr.column_expr));
     match_tensor_expr->embedding_data_type_ = GetEmbeddingDataTypeFromProto(expr.embedding_data_type);
-    auto [embedding_data_ptr, dimension, status2] = GetEmbeddingDataTypeDataPtrFromProto(expr.embedding_data);
+    auto [embedding_data_ptr, dimension, status2] = GetEmbeddingDataTypeDataPtrFromProto(expr.embedding_data, match_tensor_expr->embedding_data_type_);
     if (!status2.ok()) {
         status = status2;
         return nullptr;
@@ -2558,8 +3052,23 @@ ExplainType InfinityThriftService::GetExplainTypeFromProto(const infinity_thrift
     }
 }
 
-Tuple<void *, i64, Status> InfinityThriftService::GetEmbeddingDataTypeDataPtrFromProto(const infinity_thrift_rpc::EmbeddingData &embedding_data) {
-    if (embedding_data.__isset.u8_array_value) {
+Tuple<void *, i64, Status> InfinityThriftService::GetEmbeddingDataTypeDataPtrFromProto(const infinity_thrift_rpc::EmbeddingData &embedding_data,
+                                                                                       EmbeddingDataType embedding_data_type) {
+    if (embedding_data.__isset.bytes_value) {
+        // already in the memory layout of embedding_data_type, no conversion needed
+        if (embedding_data_type == EmbeddingDataType::kElemInvalid) {
+            return {nullptr, 0, Status::InvalidEmbeddingDataType("invalid")};
+        }
+        const SizeT element_size = embedding_data_type == EmbeddingDataType::kElemBit ? 1 : EmbeddingT::EmbeddingDataWidth(embedding_data_type);
+        if (embedding_data.bytes_value.empty() || embedding_data.bytes_value.size() % element_size != 0) {
+            return {nullptr,
+                    0,
+                    Status::InvalidParameterValue("embedding_data",
+                                                  fmt::format("{} bytes", embedding_data.bytes_value.size()),
+                                                  fmt::format("should be a non-empty multiple of {} bytes", element_size))};
+        }
+        return {(void *)embedding_data.bytes_value.data(), embedding_data.bytes_value.size() / element_size, Status::OK()};
+    } else if (embedding_data.__isset.u8_array_value) {
         auto ptr_i16 = (int16_t *)(embedding_data.u8_array_value.data());
         auto ptr_u8 = (uint8_t *)(embedding_data.u8_array_value.data());
         for (size_t i = 0; i < embedding_data.u8_array_value.size(); ++i) {
@@ -2887,6 +3396,41 @@ void InfinityThriftService::ProcessDataBlocks(const QueryResult &result,
     HandleColumnDef(response, result.result_table_->ColumnCount(), result.result_table_->definition_ptr_, columns);
 }
 
+void InfinityThriftService::ProcessCursorBatch(SelectCursor &cursor, infinity_thrift_rpc::SelectResponse &response) {
+    // batch_rows rows, a data block is sliced if the batch ends in it and released once all its rows are sent
+    auto &result_table = cursor.result_table_;
+    auto &columns = response.column_fields;
+    columns.resize(result_table->ColumnCount());
+    SizeT blocks_count = result_table->DataBlockCount();
+    SizeT row_count = 0;
+    while (cursor.next_block_idx_ < blocks_count && row_count < (SizeT)cursor.batch_rows_) {
+        auto &data_block = result_table->GetDataBlockById(cursor.next_block_idx_);
+        SizeT block_row_count = data_block->row_count();
+        SizeT take_count = std::min(block_row_count - cursor.next_row_idx_, (SizeT)cursor.batch_rows_ - row_count);
+        Status status;
+        if (take_count == block_row_count) {
+            status = ProcessColumns(data_block, result_table->ColumnCount(), columns);
+        } else {
+            auto slice = DataBlock::Make();
+            slice->Init(data_block, cursor.next_row_idx_, cursor.next_row_idx_ + take_count);
+            status = ProcessColumns(slice, result_table->ColumnCount(), columns);
+        }
+        if (!status.ok()) {
+            ProcessStatus(response, status);
+            return;
+        }
+        row_count += take_count;
+        cursor.next_row_idx_ += take_count;
+        if (cursor.next_row_idx_ == block_row_count) {
+            cursor.size_in_bytes_ -= std::min((SizeT)data_block->GetSizeInBytes(), cursor.size_in_bytes_);
+            data_block.reset();
+            ++cursor.next_block_idx_;
+            cursor.next_row_idx_ = 0;
+        }
+    }
+    HandleColumnDef(response, result_table->ColumnCount(), result_table->definition_ptr_, columns);
+}
+
 Status
 InfinityThriftService::ProcessColumns(const SharedPtr<DataBlock> &data_block, SizeT column_count, Vector<infinity_thrift_rpc::ColumnField> &columns) {
     auto row_count = data_block->row_count();
@@ -3305,6 +3849,16 @@ void InfinityThriftService::ProcessStatus(infinity_thrift_rpc::CommonResponse &r
     }
 }
 
+void InfinityThriftService::ProcessStatus(infinity_thrift_rpc::MatchDenseBatchResponse &response,
+                                          const Status &status,
+                                          const std::string_view error_header) {
+    response.__set_error_code((i64)(status.code()));
+    if (!status.ok()) {
+        response.__set_error_msg(status.message());
+        LOG_ERROR(fmt::format("{}: {}", error_header, status.message()));
+    }
+}
+
 void InfinityThriftService::ProcessStatus(infinity_thrift_rpc::DeleteResponse &response, const Status &status, const std::string_view error_header) {
     response.__set_error_code((i64)(status.code()));
     if (!status.ok()) {
@@ -44,6 +44,7 @@ import table_def;
 import internal_types;
 import column_vector;
 import query_result;
+import data_table;
 import select_statement;
 import global_resource_usage;
 
@@ -67,6 +68,29 @@ private:
 
     static ClientVersions client_version_;
 
+    // result of a select run with batch_rows, batch_rows rows are sent at a time and a data block is released once it is sent
+    struct SelectCursor {
+        i64 session_id_{};
+        SharedPtr<DataTable> result_table_{};
+        SizeT next_block_idx_{};
+        SizeT next_row_idx_{};
+        i64 batch_rows_{};
+        // bytes of the data blocks not released yet
+        SizeT size_in_bytes_{};
+        TimePoint<Clock> last_access_{};
+    };
+
+    // A cursor not fetched for kCursorIdleTimeout is released, so does the least recently fetched one of a session opening more
+    // than kMaxCursorPerSession or holding more than kMaxCursorBytesPerSession, in case the client dropped them without closing.
+    // The result is still materialized by the executor, a select whose result alone exceeds kMaxCursorBytesPerSession fails.
+    static constexpr auto kCursorIdleTimeout = Seconds(300);
+    static constexpr SizeT kMaxCursorPerSession = 16;
+    static constexpr SizeT kMaxCursorBytesPerSession = 1024UL * 1024UL * 1024UL;
+
+    static std::mutex cursor_map_mutex_;
+    static HashMap<i64, SelectCursor> cursor_map_;
+    static i64 next_cursor_id_;
+
 public:
     static u32 ClearSessionMap();
 
@@ -104,6 +128,10 @@ public:
 
     void Select(infinity_thrift_rpc::SelectResponse &response, const infinity_thrift_rpc::SelectRequest &request) final;
 
+    void MatchDenseBatch(infinity_thrift_rpc::MatchDenseBatchResponse &response, const infinity_thrift_rpc::MatchDenseBatchRequest &request) final;
+
+    void FetchCursor(infinity_thrift_rpc::SelectResponse &response, const infinity_thrift_rpc::FetchCursorRequest &request) final;
+
     void Explain(infinity_thrift_rpc::SelectResponse &response, const infinity_thrift_rpc::ExplainRequest &request) final;
 
     void Delete(infinity_thrift_rpc::DeleteResponse &response, const infinity_thrift_rpc::DeleteRequest &request) final;
@@ -171,6 +199,11 @@ private:
 
     Status GetAndRemoveSessionID(i64 session_id);
 
+    static void RemoveSessionCursors(i64 session_id);
+
+    // Put the cursor back to the map and release the expired ones, called with cursor_map_mutex_ held
+    static void StoreCursor(i64 cursor_id, SelectCursor cursor);
+
     static Tuple<ColumnDef *, Status> GetColumnDefFromProto(const infinity_thrift_rpc::ColumnDef &column_def);
 
     static SharedPtr<DataType> GetColumnTypeFromProto(const infinity_thrift_rpc::DataType &type);
@@ -183,6 +216,8 @@ private:
 
     static ConstantExpr *GetConstantFromProto(Status &status, const infinity_thrift_rpc::ConstantExpr &expr);
 
+    static Status GetConstantsFromColumnField(Vector<UniquePtr<ConstantExpr>> &constants, const infinity_thrift_rpc::ColumnField &column_field);
+
     static ColumnExpr *GetColumnExprFromProto(const infinity_thrift_rpc::ColumnExpr &column_expr);
 
     static FunctionExpr *GetFunctionExprFromProto(Status &status, const infinity_thrift_rpc::FunctionExpr &function_expr);
@@ -209,7 +244,10 @@ private:
 
     static ExplainType GetExplainTypeFromProto(const infinity_thrift_rpc::ExplainType::type &type);
 
-    static Tuple<void *, i64, Status> GetEmbeddingDataTypeDataPtrFromProto(const infinity_thrift_rpc::EmbeddingData &embedding_data);
+    static Tuple<void *, i64, Status> GetEmbeddingDataTypeDataPtrFromProto(const infinity_thrift_rpc::EmbeddingData &embedding_data,
+                                                                           EmbeddingDataType embedding_data_type);
+
+    static Status CopyMatchDenseBatchResult(const QueryResult &result, SizeT topn, char *row_ids, f32 *distances);
 
     static Tuple<UpdateExpr *, Status> GetUpdateExprFromProto(const infinity_thrift_rpc::UpdateExpr &update_expr);
 
@@ -226,6 +264,8 @@ private:
 
     Status ProcessColumns(const SharedPtr<DataBlock> &data_block, SizeT column_count, Vector<infinity_thrift_rpc::ColumnField> &columns);
 
+    void ProcessCursorBatch(SelectCursor &cursor, infinity_thrift_rpc::SelectResponse &response);
+
     void HandleColumnDef(infinity_thrift_rpc::SelectResponse &response,
                          SizeT column_count,
                          SharedPtr<TableDef> table_def,
@@ -281,6 +321,9 @@ private:
     static void
     ProcessStatus(infinity_thrift_rpc::SelectResponse &response, const Status &status, const std::string_view error_header = ErrorMsgHeader);
 
+    static void
+    ProcessStatus(infinity_thrift_rpc::MatchDenseBatchResponse &response, const Status &status, const std::string_view error_header = ErrorMsgHeader);
+
     static void
     ProcessStatus(infinity_thrift_rpc::ListDatabaseResponse &response, const Status &status, const std::string_view error_header = ErrorMsgHeader);
 
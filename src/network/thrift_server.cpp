@@ -61,6 +61,7 @@ public:
 };
 
 // Thrift server
+// Only the thread pool server (type 0) honors 'client_protocol' and 'client_transport'
 #define THRIFT_SERVER_TYPE 0
 
 #if THRIFT_SERVER_TYPE == 2
@@ -94,12 +95,24 @@ void ThreadedThriftServer::Shutdown() {
 
 #elif THRIFT_SERVER_TYPE == 0
 
-void PoolThriftServer::Init(const String &server_address, i32 port_no, i32 pool_size) {
+void PoolThriftServer::Init(const String &server_address, i32 port_no, i32 pool_size, const String &protocol, const String &transport) {
 
     SharedPtr<TServerSocket> server_socket = MakeShared<TServerSocket>(server_address, port_no);
 
-    SharedPtr<TBinaryProtocolFactory> protocol_factory = MakeShared<TBinaryProtocolFactory>();
-    //    SharedPtr<TCompactProtocolFactory> protocol_factory = MakeShared<TCompactProtocolFactory>();
+    // Clients must be connected with the same protocol and transport, see 'client_protocol' and 'client_transport'
+    SharedPtr<TProtocolFactory> protocol_factory;
+    if (protocol == "compact") {
+        protocol_factory = MakeShared<TCompactProtocolFactory>();
+    } else {
+        protocol_factory = MakeShared<TBinaryProtocolFactory>();
+    }
+
+    SharedPtr<TTransportFactory> transport_factory;
+    if (transport == "framed") {
+        transport_factory = MakeShared<TFramedTransportFactory>();
+    } else {
+        transport_factory = MakeShared<TBufferedTransportFactory>();
+    }
 
     SharedPtr<ThreadFactory> threadFactory = MakeShared<ThreadFactory>();
 
@@ -107,13 +120,18 @@ void PoolThriftServer::Init(const String &server_address, i32 port_no, i32 pool_
     threadManager->threadFactory(threadFactory);
     threadManager->start();
 
-    fmt::print("API server(for Infinity-SDK) listen on {}: {}, connection limit: {}\n", server_address, port_no, pool_size);
+    fmt::print("API server(for Infinity-SDK) listen on {}: {}, connection limit: {}, protocol: {}, transport: {}\n",
+               server_address,
+               port_no,
+               pool_size,
+               protocol,
+               transport);
     //    std::cout << "API server listen on: " << server_address << ": " << port_no << ", thread pool: " << pool_size << std::endl;
 
     server =
         MakeUnique<TThreadPoolServer>(MakeShared<infinity_thrift_rpc::InfinityServiceProcessorFactory>(MakeShared<InfinityServiceCloneFactory>()),
                                       server_socket,
-                                      MakeShared<TBufferedTransportFactory>(),
+                                      transport_factory,
                                       protocol_factory,
                                       threadManager);
 
@@ -55,7 +55,7 @@ private:
 
 export class PoolThriftServer {
 public:
-    void Init(const String &server_address, i32 port_no, i32 pool_size);
+    void Init(const String &server_address, i32 port_no, i32 pool_size, const String &protocol, const String &transport);
     Thread Start();
 
     void Shutdown();
@@ -793,16 +793,16 @@ union yyalloc
 /* YYFINAL -- State number of the termination state.  */
 #define YYFINAL  124
 /* YYLAST -- Last index in YYTABLE.  */
-#define YYLAST   1544
+#define YYLAST   1551
 
 /* YYNTOKENS -- Number of terminals.  */
 #define YYNTOKENS  224
 /* YYNNTS -- Number of nonterminals.  */
 #define YYNNTS  119
 /* YYNRULES -- Number of rules.  */
-#define YYNRULES  548
+#define YYNRULES  549
 /* YYNSTATES -- Number of states.  */
-#define YYNSTATES  1247
+#define YYNSTATES  1248
 
 /* YYMAXUTOK -- Last valid token kind.  */
 #define YYMAXUTOK   460
@@ -897,36 +897,36 @@ static const yytype_int16 yyrline[] =
     1685,  1688,  1696,  1699,  1714,  1714,  1716,  1730,  1739,  1744,
     1753,  1758,  1763,  1769,  1776,  1779,  1783,  1786,  1791,  1803,
     1810,  1824,  1827,  1830,  1833,  1836,  1839,  1842,  1848,  1852,
-    1856,  1860,  1864,  1871,  1875,  1879,  1883,  1887,  1892,  1896,
-    1901,  1905,  1909,  1913,  1919,  1925,  1931,  1942,  1953,  1964,
-    1976,  1988,  2001,  2015,  2026,  2040,  2056,  2073,  2077,  2081,
-    2085,  2089,  2095,  2099,  2103,  2109,  2113,  2117,  2121,  2127,
-    2131,  2141,  2145,  2149,  2157,  2168,  2191,  2197,  2202,  2208,
-    2214,  2222,  2228,  2234,  2240,  2246,  2254,  2260,  2266,  2272,
-    2278,  2286,  2292,  2298,  2306,  2314,  2320,  2326,  2332,  2339,
-    2352,  2356,  2361,  2367,  2374,  2382,  2391,  2401,  2411,  2422,
-    2433,  2445,  2457,  2467,  2478,  2490,  2503,  2507,  2512,  2517,
-    2523,  2527,  2531,  2537,  2541,  2545,  2551,  2557,  2565,  2571,
-    2575,  2581,  2585,  2591,  2596,  2601,  2608,  2617,  2627,  2636,
-    2648,  2664,  2668,  2673,  2683,  2705,  2711,  2715,  2716,  2717,
-    2718,  2719,  2721,  2724,  2730,  2733,  2734,  2735,  2736,  2737,
-    2738,  2739,  2740,  2741,  2742,  2746,  2762,  2779,  2797,  2843,
-    2882,  2925,  2972,  2996,  3019,  3040,  3061,  3070,  3081,  3092,
-    3106,  3113,  3123,  3129,  3141,  3144,  3147,  3150,  3153,  3156,
-    3160,  3164,  3169,  3177,  3185,  3194,  3201,  3208,  3215,  3222,
-    3229,  3236,  3243,  3250,  3257,  3264,  3271,  3279,  3287,  3295,
-    3303,  3311,  3319,  3327,  3335,  3343,  3351,  3359,  3367,  3397,
-    3405,  3414,  3422,  3431,  3439,  3445,  3452,  3458,  3465,  3470,
-    3477,  3484,  3492,  3505,  3511,  3517,  3524,  3532,  3539,  3546,
-    3551,  3561,  3566,  3571,  3576,  3581,  3586,  3591,  3596,  3601,
-    3606,  3609,  3612,  3615,  3619,  3622,  3625,  3628,  3632,  3635,
-    3638,  3642,  3646,  3651,  3656,  3659,  3663,  3667,  3674,  3681,
-    3685,  3692,  3699,  3703,  3706,  3710,  3714,  3719,  3723,  3727,
-    3730,  3734,  3738,  3743,  3748,  3752,  3757,  3762,  3768,  3774,
-    3780,  3786,  3792,  3798,  3804,  3810,  3816,  3822,  3828,  3839,
-    3843,  3848,  3879,  3889,  3894,  3899,  3904,  3910,  3914,  3915,
-    3917,  3918,  3920,  3921,  3933,  3941,  3945,  3948,  3952,  3955,
-    3959,  3963,  3968,  3974,  3984,  3994,  4002,  4013,  4044
+    1856,  1860,  1864,  1871,  1875,  1879,  1890,  1894,  1898,  1903,
+    1907,  1912,  1916,  1920,  1924,  1930,  1936,  1942,  1953,  1964,
+    1975,  1987,  1999,  2012,  2026,  2037,  2051,  2067,  2084,  2088,
+    2092,  2096,  2100,  2106,  2110,  2114,  2120,  2124,  2128,  2132,
+    2138,  2142,  2152,  2156,  2160,  2168,  2179,  2202,  2208,  2213,
+    2219,  2225,  2233,  2239,  2245,  2251,  2257,  2265,  2271,  2277,
+    2283,  2289,  2297,  2303,  2309,  2317,  2325,  2331,  2337,  2343,
+    2350,  2363,  2367,  2372,  2378,  2385,  2393,  2402,  2412,  2422,
+    2433,  2444,  2456,  2468,  2478,  2489,  2501,  2514,  2518,  2523,
+    2528,  2534,  2538,  2542,  2548,  2552,  2556,  2562,  2568,  2576,
+    2582,  2586,  2592,  2596,  2602,  2607,  2612,  2619,  2628,  2638,
+    2647,  2659,  2675,  2679,  2684,  2694,  2716,  2722,  2726,  2727,
+    2728,  2729,  2730,  2732,  2735,  2741,  2744,  2745,  2746,  2747,
+    2748,  2749,  2750,  2751,  2752,  2753,  2757,  2773,  2790,  2808,
+    2854,  2893,  2936,  2983,  3007,  3030,  3051,  3072,  3081,  3092,
+    3103,  3117,  3124,  3134,  3140,  3152,  3155,  3158,  3161,  3164,
+    3167,  3171,  3175,  3180,  3188,  3196,  3205,  3212,  3219,  3226,
+    3233,  3240,  3247,  3254,  3261,  3268,  3275,  3282,  3290,  3298,
+    3306,  3314,  3322,  3330,  3338,  3346,  3354,  3362,  3370,  3378,
+    3408,  3416,  3425,  3433,  3442,  3450,  3456,  3463,  3469,  3476,
+    3481,  3488,  3495,  3503,  3516,  3522,  3528,  3535,  3543,  3550,
+    3557,  3562,  3572,  3577,  3582,  3587,  3592,  3597,  3602,  3607,
+    3612,  3617,  3620,  3623,  3626,  3630,  3633,  3636,  3639,  3643,
+    3646,  3649,  3653,  3657,  3662,  3667,  3670,  3674,  3678,  3685,
+    3692,  3696,  3703,  3710,  3714,  3717,  3721,  3725,  3730,  3734,
+    3738,  3741,  3745,  3749,  3754,  3759,  3763,  3768,  3773,  3779,
+    3785,  3791,  3797,  3803,  3809,  3815,  3821,  3827,  3833,  3839,
+    3850,  3854,  3859,  3890,  3900,  3905,  3910,  3915,  3921,  3925,
+    3926,  3928,  3929,  3931,  3932,  3944,  3952,  3956,  3959,  3963,
+    3966,  3970,  3974,  3979,  3985,  3995,  4005,  4013,  4024,  4055
 };
 #endif
 
@@ -1021,12 +1021,12 @@ yysymbol_name (yysymbol_kind_t yysymbol)
 }
 #endif
 
-#define YYPACT_NINF (-750)
+#define YYPACT_NINF (-751)
 
 #define yypact_value_is_default(Yyn) \
   ((Yyn) == YYPACT_NINF)
 
-#define YYTABLE_NINF (-536)
+#define YYTABLE_NINF (-537)
 
 #define yytable_value_is_error(Yyn) \
   ((Yyn) == YYTABLE_NINF)
@@ -1035,131 +1035,131 @@ yysymbol_name (yysymbol_kind_t yysymbol)
    STATE-NUM.  */
 static const yytype_int16 yypact[] =
 {
-     832,   232,    54,   277,   109,   123,   109,   293,   340,   947,
-     132,   151,   534,   197,   304,   339,   -43,    90,   159,   -51,
-     266,    61,  -750,  -750,  -750,  -750,  -750,  -750,  -750,  -750,
-     424,  -750,  -750,   321,  -750,  -750,  -750,  -750,  -750,  -750,
-    -750,   276,   276,   276,   276,    31,   382,   109,   335,   335,
-     335,   335,   335,   416,   191,   399,   109,   -21,   425,   442,
-     459,   363,  -750,  -750,  -750,  -750,  -750,  -750,  -750,   424,
-    -750,  -750,  -750,  -750,  -750,   257,   506,   109,  -750,  -750,
-    -750,  -750,  -750,    24,  -750,   225,   279,  -750,   518,  -750,
-     327,  -750,  -750,   455,   511,  -750,   531,  -750,   499,   -78,
-     109,   109,  -750,  -750,  -750,  -750,   -42,  -750,   486,   334,
-    -750,   538,   365,   371,   298,  1063,   378,   570,   398,   523,
-     386,   409,   375,   384,  -750,    65,  -750,   594,  -750,  -750,
-      19,   572,  -750,   568,   566,   636,   109,   109,   109,   638,
-     593,   608,   467,   603,   684,   109,   109,   109,   686,  -750,
-     707,   709,   652,   714,   714,   732,    43,   108,   124,  -750,
-     517,  -750,   444,  -750,  -750,  -750,   742,  -750,   743,  -750,
-    -750,   714,  -750,  -750,   748,  -750,  -750,  -750,  -750,   400,
-    -750,   109,   540,   339,   714,  -750,   750,  -750,   583,  -750,
-     752,  -750,  -750,   757,  -750,  -750,   756,  -750,   765,   760,
-    -750,   769,   721,   772,   587,   774,   779,  -750,  -750,  -750,
-    -750,    19,  -750,  -750,  -750,   732,   733,   717,   718,   657,
-     -37,  -750,   467,  -750,   109,    67,   788,   295,  -750,  -750,
-    -750,  -750,  -750,   734,  -750,   586,   -35,  -750,   732,  -750,
-    -750,   720,   723,   585,  -750,  -750,   759,   782,   589,   590,
-     495,   798,   803,   804,   805,  -750,  -750,   806,   595,   598,
-     600,   601,   602,   604,   605,   240,   606,   610,   889,   889,
-    -750,    15,   614,    46,    -8,  -750,   -20,   924,  -750,  -750,
-    -750,  -750,  -750,  -750,  -750,  -750,  -750,  -750,  -750,  -750,
-    -750,   592,  -750,  -750,  -750,   186,  -750,  -750,   207,  -750,
-     214,  -750,  -750,   407,  -750,  -750,   228,  -750,   296,  -750,
-    -750,  -750,  -750,  -750,  -750,  -750,  -750,  -750,  -750,  -750,
-    -750,  -750,  -750,  -750,  -750,  -750,   816,   821,  -750,  -750,
-    -750,  -750,  -750,  -750,  -750,   784,   789,   763,   764,   321,
-    -750,  -750,  -750,   831,    49,  -750,   844,  -750,  -750,   776,
-     474,  -750,   848,  -750,  -750,   640,   641,   -24,   732,   732,
-     795,  -750,   860,   -51,    14,   817,   656,   871,   873,  -750,
-    -750,    68,   662,  -750,   109,   732,   709,  -750,   553,   664,
-     668,   331,  -750,  -750,  -750,  -750,  -750,  -750,  -750,  -750,
-    -750,  -750,  -750,  -750,   889,   669,  1017,   810,   732,   732,
-     163,   395,  -750,  -750,  -750,  -750,   759,  -750,   732,   732,
-     732,   732,   732,   732,   885,   674,   675,   693,   694,   908,
-     910,   490,   490,  -750,   697,  -750,  -750,  -750,  -750,   705,
-     122,  -750,  -750,   849,   732,   923,   732,   732,    36,   712,
-     -29,   889,   889,   889,   889,   889,   889,   889,   889,   889,
-     889,   889,   889,   889,   889,    25,  -750,   716,  -750,   925,
-    -750,   926,    18,  -750,  -750,   927,  -750,   929,   894,   685,
-     724,   728,   933,   729,  -750,   722,  -750,   931,  -750,   146,
-     943,   785,   787,  -750,  -750,  -750,   732,   878,   735,  -750,
-     119,   553,   732,  -750,  -750,    37,  1088,   826,   740,    96,
-    -750,  -750,  -750,   -51,   954,   827,  -750,  -750,  -750,   955,
-     732,   744,  -750,   553,  -750,   227,   227,   732,  -750,   244,
-     810,   809,   745,     8,    53,   410,  -750,   732,   732,   147,
-     165,   167,   172,   178,   190,   893,   732,    32,   732,   964,
-     749,   312,   725,  -750,  -750,   714,  -750,  -750,  -750,   819,
-     755,   889,   614,   845,  -750,   514,   514,   447,   447,  1008,
-     514,   514,   447,   447,   490,   490,  -750,  -750,  -750,  -750,
-    -750,  -750,   753,  -750,   754,  -750,  -750,  -750,  -750,   969,
-     974,  -750,   788,   979,  -750,   980,  -750,  -750,   978,  -750,
-    -750,   981,   995,   781,    11,   824,   732,  -750,  -750,  -750,
-     553,   999,  -750,  -750,  -750,  -750,  -750,  -750,  -750,  -750,
-    -750,  -750,  -750,   794,  -750,  -750,  -750,  -750,  -750,  -750,
-    -750,  -750,  -750,  -750,  -750,  -750,   799,   800,   802,   811,
-     815,   822,   823,   828,   328,   830,   788,   984,    14,   424,
-     818,  1007,  -750,   318,   839,  1016,  1027,  1033,  1037,  -750,
-    1036,   326,  -750,   338,   396,  -750,   841,  -750,  1088,   732,
-    -750,   732,     4,   157,  -750,  -750,  -750,  -750,  -750,  -750,
-     889,   -84,  -750,  -110,   -71,   840,    69,   842,  -750,  1039,
-    -750,  -750,   971,   614,   514,   850,   404,  -750,   889,  1055,
-    1057,  1018,  1024,   405,   406,  -750,   865,   426,  -750,  1072,
-    -750,  -750,   -51,   862,   550,  -750,   325,  -750,   324,   652,
-    -750,  -750,  1074,  1088,  1088,   676,   917,   961,  1157,  1174,
-    1197,   957,   956,  -750,  -750,   289,  -750,   953,   788,   428,
-     874,   959,  -750,   928,  -750,  -750,   732,  -750,  -750,  -750,
-    -750,  -750,  -750,   227,  -750,  -750,  -750,   870,   553,    50,
-    -750,   732,   376,   875,   716,   879,  1090,   876,   732,  -750,
-     880,   886,   884,   430,  -750,  -750,  1017,  1089,  1098,  -750,
-    -750,   979,   546,  -750,   980,   265,    40,    11,  1051,  -750,
-    -750,  -750,  -750,  -750,  -750,  1059,  -750,  1112,  -750,  -750,
-    -750,  -750,  -750,  -750,  -750,  -750,   899,  1070,   432,   909,
-     452,  -750,   905,   907,   919,   920,   930,   932,   934,   935,
-     936,  1053,   941,   944,   950,   951,   952,   972,   982,   983,
-     992,   993,  1054,  1011,  1013,  1014,  1021,  1022,  1023,  1030,
-    1031,  1047,  1048,  1056,  1052,  1060,  1062,  1064,  1071,  1075,
-    1076,  1077,  1082,  1083,  1058,  1084,  1085,  1086,  1087,  1091,
-    1092,  1093,  1094,  1095,  1096,  1061,  1097,  1099,  1100,  1102,
-    1103,  1104,  1105,  1106,  1107,  1108,  1073,  1109,  -750,  -750,
-      18,  -750,  1041,  1067,   453,  -750,   980,  1149,  1234,   460,
-    -750,  -750,  -750,   553,  -750,   727,  1110,  1111,    26,  1113,
-    -750,  -750,  -750,  1114,  1136,  1066,   553,  -750,   227,  -750,
-    -750,  -750,  -750,  -750,  -750,  -750,  -750,  -750,  -750,  1238,
-    -750,   325,   550,    11,    11,  1040,   324,  1220,  1221,  -750,
-    1268,  -750,  -750,  1088,  1269,  1273,  1284,  1288,  1302,  1303,
-    1304,  1312,  1326,  1115,  1330,  1331,  1332,  1333,  1334,  1335,
-    1336,  1337,  1338,  1339,  1126,  1341,  1342,  1343,  1344,  1345,
-    1346,  1347,  1348,  1349,  1350,  1137,  1352,  1353,  1354,  1355,
-    1356,  1357,  1358,  1359,  1360,  1361,  1148,  1363,  1364,  1365,
-    1366,  1367,  1368,  1369,  1370,  1371,  1372,  1159,  1374,  1375,
-    1376,  1377,  1378,  1379,  1380,  1381,  1382,  1383,  1170,  1385,
-    -750,  1388,  1389,  -750,   462,  -750,   764,  -750,  -750,  1390,
-    1391,  1392,    86,  1180,  -750,   464,  1393,  -750,  -750,  1340,
-     788,  -750,   732,   732,  -750,  1181,  -750,  1184,  1185,  1186,
-    1187,  1188,  1189,  1190,  1191,  1192,  1404,  1194,  1195,  1196,
-    1198,  1199,  1200,  1201,  1202,  1203,  1204,  1408,  1205,  1206,
-    1207,  1208,  1209,  1210,  1211,  1212,  1213,  1214,  1426,  1216,
-    1217,  1218,  1219,  1222,  1223,  1224,  1225,  1226,  1227,  1431,
-    1228,  1229,  1230,  1231,  1232,  1233,  1235,  1236,  1237,  1239,
-    1432,  1240,  1241,  1242,  1243,  1244,  1245,  1246,  1247,  1248,
-    1249,  1445,  1250,  -750,  -750,  -750,  -750,  1251,  1252,  1253,
-     876,  1291,  -750,   477,   732,   471,   781,   553,  -750,  -750,
-    -750,  -750,  -750,  -750,  -750,  -750,  -750,  -750,  1257,  -750,
-    -750,  -750,  -750,  -750,  -750,  -750,  -750,  -750,  -750,  1258,
-    -750,  -750,  -750,  -750,  -750,  -750,  -750,  -750,  -750,  -750,
-    1259,  -750,  -750,  -750,  -750,  -750,  -750,  -750,  -750,  -750,
-    -750,  1260,  -750,  -750,  -750,  -750,  -750,  -750,  -750,  -750,
-    -750,  -750,  1261,  -750,  -750,  -750,  -750,  -750,  -750,  -750,
-    -750,  -750,  -750,  1262,  -750,  1464,  1465,    79,  1263,  1264,
-    1423,  1476,  1477,  -750,  -750,  -750,   553,  -750,  -750,  -750,
-    -750,  -750,  -750,  -750,  1265,  1266,   876,   764,  1320,  1271,
-    1482,   696,   125,  1272,  1486,  1274,  -750,  1446,  1488,   700,
-    1489,  -750,   876,   764,   876,   -38,  1278,  1279,  1491,  -750,
-    1452,  1282,  -750,  1283,  1463,  1466,  -750,  1498,  -750,  -750,
-    -750,    -9,   128,  -750,  1287,  1289,  1467,  1469,  -750,  1470,
-    1471,  1507,  -750,  -750,  1295,  -750,  1296,  1297,  1510,  1512,
-     764,  1299,  1300,  -750,   764,  -750,  -750
+     986,   255,   115,   283,   174,   160,   174,   183,   960,  1043,
+     250,   314,   500,   431,   437,   441,   146,   117,   460,   -31,
+     368,   175,  -751,  -751,  -751,  -751,  -751,  -751,  -751,  -751,
+     419,  -751,  -751,   390,  -751,  -751,  -751,  -751,  -751,  -751,
+    -751,   352,   352,   352,   352,   201,   454,   174,   433,   433,
+     433,   433,   433,   472,   190,   470,   174,   -20,   516,   518,
+     532,   177,  -751,  -751,  -751,  -751,  -751,  -751,  -751,   419,
+    -751,  -751,  -751,  -751,  -751,   333,   544,   174,  -751,  -751,
+    -751,   548,  -751,    24,  -751,   420,   453,  -751,   569,  -751,
+     428,  -751,  -751,   396,   583,  -751,   610,  -751,   310,  -113,
+     174,   174,  -751,  -751,  -751,  -751,   -42,  -751,   567,   425,
+    -751,   658,   479,   493,   296,   471,   502,   690,   508,   628,
+     529,   531,   509,   510,  -751,    65,  -751,   707,  -751,  -751,
+      25,   667,  -751,   668,   661,   731,   174,   174,   174,   733,
+     678,   684,   530,   673,   747,   174,   174,   174,   748,  -751,
+     749,   751,   691,   752,   752,   737,    98,   103,   108,  -751,
+     540,  -751,   378,  -751,  -751,  -751,  -751,   755,  -751,   756,
+    -751,  -751,   752,  -751,  -751,   757,  -751,  -751,  -751,  -751,
+     351,  -751,   174,   546,   441,   752,  -751,   759,  -751,   596,
+    -751,   758,  -751,  -751,   765,  -751,  -751,   767,  -751,   770,
+     773,  -751,   775,   724,   776,   587,   783,   785,  -751,  -751,
+    -751,  -751,    25,  -751,  -751,  -751,   737,   739,   726,   722,
+     664,   -37,  -751,   530,  -751,   174,   324,   794,    34,  -751,
+    -751,  -751,  -751,  -751,   743,  -751,   599,   -25,  -751,   737,
+    -751,  -751,   730,   734,   591,  -751,  -751,   386,   796,   595,
+     597,   556,   808,   810,   811,   812,  -751,  -751,   813,   601,
+     605,   606,   607,   608,   609,   614,   264,   616,   617,   885,
+     885,  -751,    15,   648,    46,   285,  -751,   109,   698,  -751,
+    -751,  -751,  -751,  -751,  -751,  -751,  -751,  -751,  -751,  -751,
+    -751,  -751,   621,  -751,  -751,  -751,  -167,  -751,  -751,   -88,
+    -751,   -51,  -751,  -751,   -86,  -751,  -751,   194,  -751,   253,
+    -751,  -751,  -751,  -751,  -751,  -751,  -751,  -751,  -751,  -751,
+    -751,  -751,  -751,  -751,  -751,  -751,  -751,   823,   828,  -751,
+    -751,  -751,  -751,  -751,  -751,  -751,   790,   795,   766,   768,
+     390,  -751,  -751,  -751,   839,   304,  -751,   840,  -751,  -751,
+     777,   462,  -751,   841,  -751,  -751,   636,   637,   -23,   737,
+     737,   793,  -751,   857,   -31,    14,   816,   647,   862,   863,
+    -751,  -751,   336,   659,  -751,   174,   737,   751,  -751,   525,
+     669,   670,   407,  -751,  -751,  -751,  -751,  -751,  -751,  -751,
+    -751,  -751,  -751,  -751,  -751,   885,   671,   220,   805,   737,
+     737,   173,   372,  -751,  -751,  -751,  -751,   386,  -751,   737,
+     737,   737,   737,   737,   737,   879,   682,   683,   686,   687,
+     888,   890,   494,   494,  -751,   677,  -751,  -751,  -751,  -751,
+     695,   119,  -751,  -751,   838,   737,   911,   737,   737,   -41,
+     699,    26,   885,   885,   885,   885,   885,   885,   885,   885,
+     885,   885,   885,   885,   885,   885,    32,  -751,   703,  -751,
+     913,  -751,   915,    18,  -751,  -751,   916,  -751,   918,   883,
+     665,   709,   710,   924,   712,  -751,   717,  -751,   923,  -751,
+     348,   932,   774,   778,  -751,  -751,  -751,   737,   866,   725,
+    -751,   208,   525,   737,  -751,  -751,    76,  1159,   817,   738,
+     338,  -751,  -751,  -751,   -31,   946,   818,  -751,  -751,  -751,
+     952,   737,   740,  -751,   525,  -751,   252,   252,   737,  -751,
+     357,   805,   800,   741,   154,   125,   401,  -751,   737,   737,
+     140,   147,   150,   170,   178,   180,   887,   737,    33,   737,
+     958,   744,   359,   705,  -751,  -751,   752,  -751,  -751,  -751,
+     824,   764,   885,   648,   836,  -751,   908,   908,   254,   254,
+     954,   908,   908,   254,   254,   494,   494,  -751,  -751,  -751,
+    -751,  -751,  -751,   769,  -751,   771,  -751,  -751,  -751,  -751,
+     975,   976,  -751,   794,   988,  -751,  1001,  -751,  -751,  1002,
+    -751,  -751,  1007,  1012,   797,    11,   845,   737,  -751,  -751,
+    -751,   525,  1023,  -751,  -751,  -751,  -751,  -751,  -751,  -751,
+    -751,  -751,  -751,  -751,   815,  -751,  -751,  -751,  -751,  -751,
+    -751,  -751,  -751,  -751,  -751,  -751,  -751,   819,   821,   826,
+     827,   829,   831,   832,   833,   289,   834,   794,   999,    14,
+     419,   822,  1029,  -751,   361,   835,  1028,  1038,  1036,  1049,
+    -751,  1047,   363,  -751,   365,   367,  -751,   837,  -751,  1159,
+     737,  -751,   737,   -55,   157,  -751,  -751,  -751,  -751,  -751,
+    -751,   885,   -95,  -751,  -147,   -71,   843,    27,   844,  -751,
+    1051,  -751,  -751,   980,   648,   908,   850,   387,  -751,   885,
+    1063,  1065,  1024,  1026,   389,   391,  -751,   867,   395,  -751,
+    1070,  -751,  -751,   -31,   858,   439,  -751,    83,  -751,   199,
+     691,  -751,  -751,  1073,  1159,  1159,   580,  1034,  1097,  1195,
+    1212,  1235,   951,   959,  -751,  -751,   273,  -751,   950,   794,
+     402,   869,   955,  -751,   925,  -751,  -751,   737,  -751,  -751,
+    -751,  -751,  -751,  -751,   252,  -751,  -751,  -751,   871,   525,
+     -16,  -751,   737,   388,   876,   703,   877,  1088,   873,   737,
+    -751,   880,   882,   892,   414,  -751,  -751,   220,  1094,  1096,
+    -751,  -751,   988,   511,  -751,  1001,   440,    41,    11,  1055,
+    -751,  -751,  -751,  -751,  -751,  -751,  1057,  -751,  1110,  -751,
+    -751,  -751,  -751,  -751,  -751,  -751,  -751,   907,  1081,   415,
+     917,   416,  -751,   912,   919,   920,   921,   922,   926,   927,
+     928,   929,  1045,   930,   931,   933,   935,   936,   939,   948,
+     949,   953,   957,  1053,   961,   962,   964,   970,   971,   974,
+     977,   978,   987,   990,  1054,   991,   995,   996,  1003,  1006,
+    1008,  1009,  1010,  1011,  1013,  1062,  1014,  1015,  1016,  1019,
+    1020,  1022,  1050,  1068,  1069,  1072,  1080,  1074,  1075,  1076,
+    1085,  1086,  1089,  1090,  1091,  1092,  1093,  1082,  1098,  -751,
+    -751,    18,  -751,  1042,  1046,   421,  -751,  1001,  1129,  1142,
+     457,  -751,  -751,  -751,   525,  -751,   708,  1100,  1101,    20,
+    1102,  -751,  -751,  -751,  1108,  1111,   963,   525,  -751,   252,
+    -751,  -751,  -751,  -751,  -751,  -751,  -751,  -751,  -751,  -751,
+    1173,  -751,    83,   439,    11,    11,   979,   199,  1145,  1170,
+    -751,  1221,  -751,  -751,  1159,  1226,  1237,  1238,  1257,  1265,
+    1267,  1268,  1287,  1311,  1109,  1326,  1327,  1328,  1329,  1334,
+    1335,  1336,  1337,  1338,  1339,  1126,  1341,  1342,  1343,  1344,
+    1345,  1346,  1347,  1348,  1349,  1350,  1137,  1352,  1354,  1355,
+    1356,  1357,  1358,  1359,  1360,  1361,  1362,  1149,  1364,  1365,
+    1366,  1367,  1368,  1369,  1370,  1371,  1372,  1373,  1160,  1375,
+    1376,  1377,  1378,  1379,  1380,  1381,  1382,  1383,  1384,  1171,
+    1386,  -751,  1389,  1390,  -751,   461,  -751,   768,  -751,  -751,
+    1391,  1392,  1393,    58,  1181,  -751,   468,  1394,  -751,  -751,
+    1351,   794,  -751,   737,   737,  -751,  1182,  -751,  1184,  1185,
+    1186,  1187,  1188,  1189,  1190,  1191,  1192,  1404,  1196,  1197,
+    1198,  1199,  1200,  1201,  1202,  1203,  1204,  1205,  1406,  1206,
+    1207,  1208,  1209,  1210,  1211,  1213,  1214,  1215,  1216,  1423,
+    1217,  1218,  1219,  1220,  1222,  1223,  1224,  1225,  1227,  1228,
+    1432,  1229,  1230,  1231,  1232,  1233,  1234,  1236,  1239,  1240,
+    1241,  1437,  1242,  1243,  1244,  1245,  1246,  1247,  1248,  1249,
+    1250,  1251,  1446,  1252,  -751,  -751,  -751,  -751,  1253,  1254,
+    1255,   873,  1290,  -751,   405,   737,   469,   797,   525,  -751,
+    -751,  -751,  -751,  -751,  -751,  -751,  -751,  -751,  -751,  1259,
+    -751,  -751,  -751,  -751,  -751,  -751,  -751,  -751,  -751,  -751,
+    1260,  -751,  -751,  -751,  -751,  -751,  -751,  -751,  -751,  -751,
+    -751,  1261,  -751,  -751,  -751,  -751,  -751,  -751,  -751,  -751,
+    -751,  -751,  1262,  -751,  -751,  -751,  -751,  -751,  -751,  -751,
+    -751,  -751,  -751,  1263,  -751,  -751,  -751,  -751,  -751,  -751,
+    -751,  -751,  -751,  -751,  1264,  -751,  1451,  1466,    79,  1266,
+    1269,  1424,  1476,  1478,  -751,  -751,  -751,   525,  -751,  -751,
+    -751,  -751,  -751,  -751,  -751,  1270,  1271,   873,   768,  1308,
+    1272,  1479,   672,   243,  1275,  1483,  1276,  -751,  1442,  1490,
+     676,  1489,  -751,   873,   768,   873,   -38,  1280,  1281,  1491,
+    -751,  1453,  1283,  -751,  1284,  1464,  1465,  -751,  1500,  -751,
+    -751,  -751,   133,   -75,  -751,  1289,  1291,  1468,  1469,  -751,
+    1471,  1472,  1508,  -751,  -751,  1296,  -751,  1297,  1298,  1511,
+    1513,   768,  1300,  1301,  -751,   768,  -751,  -751
 };
 
 /* YYDEFACT[STATE-NUM] -- Default reduction number in state STATE-NUM.
@@ -1169,163 +1169,163 @@ static const yytype_int16 yydefact[] =
 {
      235,     0,     0,     0,     0,     0,     0,     0,   235,     0,
        0,     0,     0,     0,     0,     0,     0,     0,     0,   235,
-       0,   533,     3,     5,    10,    12,    13,    11,     6,     7,
+       0,   534,     3,     5,    10,    12,    13,    11,     6,     7,
        9,   180,   179,     0,     8,    14,    15,    16,    17,    18,
-      19,   531,   531,   531,   531,   531,     0,     0,   529,   529,
-     529,   529,   529,     0,   228,     0,     0,     0,     0,     0,
+      19,   532,   532,   532,   532,   532,     0,     0,   530,   530,
+     530,   530,   530,     0,   228,     0,     0,     0,     0,     0,
        0,   235,   166,    20,    25,    27,    26,    21,    22,    24,
       23,    28,    29,    30,    31,     0,     0,     0,   249,   250,
-     248,   254,   258,     0,   255,     0,     0,   251,     0,   253,
-       0,   277,   279,   280,     0,   256,     0,   289,     0,   285,
-       0,     0,   291,   292,   293,   296,   228,   294,     0,   234,
+     248,   254,   259,     0,   256,     0,     0,   251,     0,   253,
+       0,   278,   280,   281,     0,   257,     0,   290,     0,   286,
+       0,     0,   292,   293,   294,   297,   228,   295,     0,   234,
      236,     0,     0,     0,     0,     0,     0,     0,     0,     0,
        0,     0,     0,     0,     1,   235,     2,   218,   220,   221,
        0,   203,   185,   191,     0,     0,     0,     0,     0,     0,
-       0,     0,   164,     0,     0,     0,     0,     0,     0,   316,
+       0,     0,   164,     0,     0,     0,     0,     0,     0,   317,
        0,     0,   213,     0,     0,     0,     0,     0,     0,   165,
-       0,   265,   266,   259,   260,   261,     0,   262,     0,   252,
-     278,     0,   257,   290,     0,   283,   282,   286,   287,     0,
-     319,     0,     0,     0,     0,   343,     0,   353,     0,   354,
-       0,   340,   341,     0,   336,   320,     0,   349,   351,     0,
-     344,     0,     0,     0,     0,     0,     0,   184,   183,     4,
-     219,     0,   181,   182,   202,     0,     0,   199,     0,    33,
-       0,    34,   164,   534,     0,     0,     0,   235,   528,   171,
-     173,   172,   174,     0,   229,     0,   213,   168,     0,   160,
-     527,     0,     0,   457,   461,   464,   465,     0,     0,     0,
-       0,     0,     0,     0,     0,   462,   463,     0,     0,     0,
+       0,   266,   267,   255,   260,   261,   262,     0,   263,     0,
+     252,   279,     0,   258,   291,     0,   284,   283,   287,   288,
+       0,   320,     0,     0,     0,     0,   344,     0,   354,     0,
+     355,     0,   341,   342,     0,   337,   321,     0,   350,   352,
+       0,   345,     0,     0,     0,     0,     0,     0,   184,   183,
+       4,   219,     0,   181,   182,   202,     0,     0,   199,     0,
+      33,     0,    34,   164,   535,     0,     0,     0,   235,   529,
+     171,   173,   172,   174,     0,   229,     0,   213,   168,     0,
+     160,   528,     0,     0,   458,   462,   465,   466,     0,     0,
+       0,     0,     0,     0,     0,     0,   463,   464,     0,     0,
        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
-     459,     0,   235,     0,     0,   361,   366,   367,   381,   379,
-     382,   380,   383,   384,   376,   371,   370,   369,   377,   378,
-     368,   375,   374,   472,   475,     0,   476,   484,     0,   485,
-       0,   477,   473,     0,   474,   499,     0,   500,     0,   471,
-     300,   302,   301,   298,   299,   305,   307,   306,   303,   304,
-     310,   312,   311,   308,   309,   288,     0,     0,   268,   267,
-     273,   263,   264,   281,   284,     0,     0,     0,   537,     0,
-     237,   297,   346,     0,   337,   342,   321,   350,   345,     0,
-       0,   352,     0,   317,   318,     0,     0,   205,     0,     0,
-     201,   530,     0,   235,     0,     0,     0,     0,     0,   315,
-     158,     0,     0,   162,     0,     0,     0,   167,   212,     0,
-       0,     0,   508,   507,   510,   509,   512,   511,   514,   513,
-     516,   515,   518,   517,     0,     0,   423,   235,     0,     0,
-       0,     0,   466,   467,   468,   469,     0,   470,     0,     0,
+       0,   460,     0,   235,     0,     0,   362,   367,   368,   382,
+     380,   383,   381,   384,   385,   377,   372,   371,   370,   378,
+     379,   369,   376,   375,   473,   476,     0,   477,   485,     0,
+     486,     0,   478,   474,     0,   475,   500,     0,   501,     0,
+     472,   301,   303,   302,   299,   300,   306,   308,   307,   304,
+     305,   311,   313,   312,   309,   310,   289,     0,     0,   269,
+     268,   274,   264,   265,   282,   285,     0,     0,     0,   538,
+       0,   237,   298,   347,     0,   338,   343,   322,   351,   346,
+       0,     0,   353,     0,   318,   319,     0,     0,   205,     0,
+       0,   201,   531,     0,   235,     0,     0,     0,     0,     0,
+     316,   158,     0,     0,   162,     0,     0,     0,   167,   212,
+       0,     0,     0,   509,   508,   511,   510,   513,   512,   515,
+     514,   517,   516,   519,   518,     0,     0,   424,   235,     0,
+       0,     0,     0,   467,   468,   469,   470,     0,   471,     0,
        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
-       0,   425,   424,   505,   502,   492,   482,   487,   490,     0,
-       0,   494,   495,     0,     0,     0,     0,     0,     0,     0,
+       0,     0,   426,   425,   506,   503,   493,   483,   488,   491,
+       0,     0,   495,   496,     0,     0,     0,     0,     0,     0,
        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
-       0,     0,     0,     0,     0,     0,   481,     0,   486,     0,
-     489,     0,     0,   493,   501,     0,   504,     0,   274,   269,
-       0,     0,     0,     0,   295,     0,   355,     0,   338,     0,
-       0,     0,     0,   348,   188,   187,     0,   207,   190,   192,
-     197,   198,     0,   186,    32,    36,     0,     0,     0,     0,
-      42,    46,    47,   235,     0,    40,   314,   313,   163,     0,
-       0,   161,   175,   170,   169,     0,     0,     0,   412,     0,
-     235,     0,     0,     0,     0,     0,   448,     0,     0,     0,
+       0,     0,     0,     0,     0,     0,     0,   482,     0,   487,
+       0,   490,     0,     0,   494,   502,     0,   505,     0,   275,
+     270,     0,     0,     0,     0,   296,     0,   356,     0,   339,
+       0,     0,     0,     0,   349,   188,   187,     0,   207,   190,
+     192,   197,   198,     0,   186,    32,    36,     0,     0,     0,
+       0,    42,    46,    47,   235,     0,    40,   315,   314,   163,
+       0,     0,   161,   175,   170,   169,     0,     0,     0,   413,
+       0,   235,     0,     0,     0,     0,     0,   449,     0,     0,
        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
-     211,     0,     0,   373,   372,     0,   362,   365,   441,   442,
-       0,     0,   235,     0,   422,   432,   433,   436,   437,     0,
-     439,   431,   434,   435,   427,   426,   428,   429,   430,   458,
-     460,   483,     0,   488,     0,   491,   496,   503,   506,     0,
-       0,   270,     0,     0,   358,     0,   238,   339,     0,   322,
-     347,     0,     0,   204,     0,   209,     0,   195,   196,   194,
-     200,     0,    54,    57,    58,    55,    56,    59,    60,    76,
-      61,    63,    62,    79,    66,    67,    68,    64,    65,    69,
-      70,    71,    72,    73,    74,    75,     0,     0,     0,     0,
-       0,     0,     0,     0,   537,     0,     0,   539,     0,    39,
-       0,     0,   159,     0,     0,     0,     0,     0,     0,   523,
-       0,     0,   519,     0,     0,   413,     0,   453,     0,     0,
-     446,     0,     0,     0,   420,   419,   418,   417,   416,   415,
-       0,     0,   457,     0,     0,     0,     0,     0,   402,     0,
-     498,   497,     0,   235,   440,     0,     0,   421,     0,     0,
-       0,   275,   271,     0,     0,    44,   542,     0,   540,   323,
-     356,   357,   235,   206,   222,   224,   233,   225,     0,   213,
-     193,    38,     0,     0,     0,     0,     0,     0,     0,     0,
-       0,     0,     0,   151,   152,   155,   148,   155,     0,     0,
-       0,    35,    43,   548,    41,   363,     0,   525,   524,   522,
-     521,   526,   178,     0,   176,   414,   454,     0,   450,     0,
-     449,     0,     0,     0,     0,     0,     0,   211,     0,   400,
-       0,     0,     0,     0,   455,   444,   443,     0,     0,   360,
-     359,     0,     0,   536,     0,     0,     0,     0,     0,   242,
-     243,   244,   245,   241,   246,     0,   231,     0,   226,   406,
-     404,   407,   405,   408,   409,   410,   208,   217,     0,     0,
-       0,    52,     0,     0,     0,     0,     0,     0,     0,     0,
+       0,   211,     0,     0,   374,   373,     0,   363,   366,   442,
+     443,     0,     0,   235,     0,   423,   433,   434,   437,   438,
+       0,   440,   432,   435,   436,   428,   427,   429,   430,   431,
+     459,   461,   484,     0,   489,     0,   492,   497,   504,   507,
+       0,     0,   271,     0,     0,   359,     0,   238,   340,     0,
+     323,   348,     0,     0,   204,     0,   209,     0,   195,   196,
+     194,   200,     0,    54,    57,    58,    55,    56,    59,    60,
+      76,    61,    63,    62,    79,    66,    67,    68,    64,    65,
+      69,    70,    71,    72,    73,    74,    75,     0,     0,     0,
+       0,     0,     0,     0,     0,   538,     0,     0,   540,     0,
+      39,     0,     0,   159,     0,     0,     0,     0,     0,     0,
+     524,     0,     0,   520,     0,     0,   414,     0,   454,     0,
+       0,   447,     0,     0,     0,   421,   420,   419,   418,   417,
+     416,     0,     0,   458,     0,     0,     0,     0,     0,   403,
+       0,   499,   498,     0,   235,   441,     0,     0,   422,     0,
+       0,     0,   276,   272,     0,     0,    44,   543,     0,   541,
+     324,   357,   358,   235,   206,   222,   224,   233,   225,     0,
+     213,   193,    38,     0,     0,     0,     0,     0,     0,     0,
+       0,     0,     0,     0,   151,   152,   155,   148,   155,     0,
+       0,     0,    35,    43,   549,    41,   364,     0,   526,   525,
+     523,   522,   527,   178,     0,   176,   415,   455,     0,   451,
+       0,   450,     0,     0,     0,     0,     0,     0,   211,     0,
+     401,     0,     0,     0,     0,   456,   445,   444,     0,     0,
+     361,   360,     0,     0,   537,     0,     0,     0,     0,     0,
+     242,   243,   244,   245,   241,   246,     0,   231,     0,   226,
+     407,   405,   408,   406,   409,   410,   411,   208,   217,     0,
+       0,     0,    52,     0,     0,     0,     0,     0,     0,     0,
        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
-       0,     0,     0,     0,     0,     0,     0,     0,   153,   150,
-       0,   149,    49,    48,     0,   157,     0,     0,     0,     0,
-     520,   452,   447,   451,   438,     0,     0,     0,     0,     0,
-     478,   480,   479,   211,     0,     0,   210,   403,     0,   456,
-     445,   276,   272,    45,   543,   544,   546,   545,   541,     0,
-     324,   233,   223,     0,     0,   230,     0,     0,   215,    78,
-       0,   146,   147,     0,     0,     0,     0,     0,     0,     0,
+       0,     0,     0,     0,     0,     0,     0,     0,     0,   153,
+     150,     0,   149,    49,    48,     0,   157,     0,     0,     0,
+       0,   521,   453,   448,   452,   439,     0,     0,     0,     0,
+       0,   479,   481,   480,   211,     0,     0,   210,   404,     0,
+     457,   446,   277,   273,    45,   544,   545,   547,   546,   542,
+       0,   325,   233,   223,     0,     0,   230,     0,     0,   215,
+      78,     0,   146,   147,     0,     0,     0,     0,     0,     0,
        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
-     154,     0,     0,   156,     0,    37,   537,   364,   502,     0,
-       0,     0,     0,     0,   401,     0,   325,   227,   239,     0,
-       0,   411,     0,     0,   189,     0,    53,     0,     0,     0,
+       0,   154,     0,     0,   156,     0,    37,   538,   365,   503,
+       0,     0,     0,     0,     0,   402,     0,   326,   227,   239,
+       0,     0,   412,     0,     0,   189,     0,    53,     0,     0,
        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
        0,     0,     0,     0,     0,     0,     0,     0,     0,     0,
-       0,     0,     0,    51,    50,   538,   547,     0,     0,   211,
-     211,   396,   177,     0,     0,     0,   216,   214,    77,    83,
-      84,    81,    82,    85,    86,    87,    88,    89,     0,    80,
-     127,   128,   125,   126,   129,   130,   131,   132,   133,     0,
-     124,    94,    95,    92,    93,    96,    97,    98,    99,   100,
-       0,    91,   105,   106,   103,   104,   107,   108,   109,   110,
-     111,     0,   102,   138,   139,   136,   137,   140,   141,   142,
-     143,   144,     0,   135,   116,   117,   114,   115,   118,   119,
-     120,   121,   122,     0,   113,     0,     0,     0,     0,     0,
-       0,     0,     0,   327,   326,   332,   240,   232,    90,   134,
-     101,   112,   145,   123,   211,     0,   211,   537,   397,     0,
-     333,   328,     0,     0,     0,     0,   395,     0,     0,     0,
-       0,   329,   211,   537,   211,   537,     0,     0,     0,   334,
-     330,     0,   391,     0,     0,     0,   394,     0,   398,   335,
-     331,   537,   385,   393,     0,     0,     0,     0,   390,     0,
-       0,     0,   399,   389,     0,   387,     0,     0,     0,     0,
-     537,     0,     0,   392,   537,   386,   388
+       0,     0,     0,     0,    51,    50,   539,   548,     0,     0,
+     211,   211,   397,   177,     0,     0,     0,   216,   214,    77,
+      83,    84,    81,    82,    85,    86,    87,    88,    89,     0,
+      80,   127,   128,   125,   126,   129,   130,   131,   132,   133,
+       0,   124,    94,    95,    92,    93,    96,    97,    98,    99,
+     100,     0,    91,   105,   106,   103,   104,   107,   108,   109,
+     110,   111,     0,   102,   138,   139,   136,   137,   140,   141,
+     142,   143,   144,     0,   135,   116,   117,   114,   115,   118,
+     119,   120,   121,   122,     0,   113,     0,     0,     0,     0,
+       0,     0,     0,     0,   328,   327,   333,   240,   232,    90,
+     134,   101,   112,   145,   123,   211,     0,   211,   538,   398,
+       0,   334,   329,     0,     0,     0,     0,   396,     0,     0,
+       0,     0,   330,   211,   538,   211,   538,     0,     0,     0,
+     335,   331,     0,   392,     0,     0,     0,   395,     0,   399,
+     336,   332,   538,   386,   394,     0,     0,     0,     0,   391,
+       0,     0,     0,   400,   390,     0,   388,     0,     0,     0,
+       0,   538,     0,     0,   393,   538,   387,   389
 };
 
 /* YYPGOTO[NTERM-NUM].  */
 static const yytype_int16 yypgoto[] =
 {
-    -750,  -750,  -750,  1394,  1457,   198,  -750,  -750,   882,  -568,
-    -750,  -645,  -750,   796,   797,  -750,  -572,   223,   226,  1301,
-    -750,   263,  -750,  1146,   287,   322,    -6,  1506,   -16,  1193,
-    1315,   -72,  -750,  -750,   937,  -750,  -750,  -750,  -750,  -750,
-    -750,  -750,  -749,  -229,  -750,  -750,  -750,  -750,   751,  -170,
-     101,   616,  -750,  -750,  1351,  -750,  -750,   347,   372,   379,
-     380,   388,  -750,  -750,  -214,  -750,  1101,  -238,  -228,  -672,
-    -671,  -665,  -664,  -663,  -661,   613,  -750,  -750,  -750,  -750,
-    -750,  -750,  1130,  -750,  -750,   994,  -268,  -265,  -750,  -750,
-    -750,   783,  -750,  -750,  -750,  -750,   786,  -750,  -750,  1078,
-    1079,  -260,  -750,  -750,  -750,  -750,  1285,  -505,   793,  -145,
-     512,   526,  -750,  -750,  -630,  -750,   663,   770,  -750
+    -751,  -751,  -751,  1395,  1458,   104,  -751,  -751,   884,  -569,
+    -751,  -646,  -751,   798,   799,  -751,  -573,   122,   151,  1299,
+    -751,   223,  -751,  1144,   261,   291,    -5,  1506,   -17,  1193,
+    1314,   -84,  -751,  -751,   934,  -751,  -751,  -751,  -751,  -751,
+    -751,  -751,  -750,  -230,  -751,  -751,  -751,  -751,   750,  -193,
+     101,   618,  -751,  -751,  1353,  -751,  -751,   329,   331,   335,
+     339,   346,  -751,  -751,  -215,  -751,  1099,  -239,  -229,  -681,
+    -672,  -666,  -665,  -662,  -660,   612,  -751,  -751,  -751,  -751,
+    -751,  -751,  1131,  -751,  -751,   997,  -269,  -266,  -751,  -751,
+    -751,   780,  -751,  -751,  -751,  -751,   782,  -751,  -751,  1079,
+    1078,  -306,  -751,  -751,  -751,  -751,  1285,  -508,   801,  -143,
+     515,   526,  -751,  -751,  -631,  -751,   674,   772,  -751
 };
 
 /* YYDEFGOTO[NTERM-NUM].  */
 static const yytype_int16 yydefgoto[] =
 {
-       0,    20,    21,    22,    62,    23,   499,   694,   500,   501,
-     800,   634,   725,   726,   872,   502,   371,    24,    25,   227,
-      26,    27,   236,   237,    28,    29,    30,    31,    32,   132,
-     212,   133,   217,   488,   489,   599,   360,   493,   215,   487,
-     595,   709,   677,   239,  1014,   918,   130,   703,   704,   705,
-     706,   788,    33,   109,   110,   707,   785,    34,    35,    36,
-      37,    38,    39,    40,   274,   511,   275,   276,   277,   278,
-     279,   280,   281,   282,   283,   795,   796,   284,   285,   286,
-     287,   288,   401,   289,   290,   291,   292,   293,   889,   294,
-     295,   296,   297,   298,   299,   300,   301,   302,   303,   427,
-     428,   304,   305,   306,   307,   308,   309,   651,   652,   241,
-     144,   135,   126,   140,   474,   731,   697,   698,   505
+       0,    20,    21,    22,    62,    23,   500,   695,   501,   502,
+     801,   635,   726,   727,   873,   503,   372,    24,    25,   228,
+      26,    27,   237,   238,    28,    29,    30,    31,    32,   132,
+     213,   133,   218,   489,   490,   600,   361,   494,   216,   488,
+     596,   710,   678,   240,  1015,   919,   130,   704,   705,   706,
+     707,   789,    33,   109,   110,   708,   786,    34,    35,    36,
+      37,    38,    39,    40,   275,   512,   276,   277,   278,   279,
+     280,   281,   282,   283,   284,   796,   797,   285,   286,   287,
+     288,   289,   402,   290,   291,   292,   293,   294,   890,   295,
+     296,   297,   298,   299,   300,   301,   302,   303,   304,   428,
+     429,   305,   306,   307,   308,   309,   310,   652,   653,   242,
+     144,   135,   126,   140,   475,   732,   698,   699,   506
 };
 
 /* YYTABLE[YYPACT[STATE-NUM]] -- What to do in state STATE-NUM.  If
@@ -1333,320 +1333,322 @@ static const yytype_int16 yydefgoto[] =
    number is the opposite.  If YYTABLE_NINF, syntax error.  */
 static const yytype_int16 yytable[] =
 {
-     378,   357,    69,   123,   727,   432,   426,   377,   895,   242,
-     693,   653,   400,   747,    54,   695,   363,   496,   181,   396,
-     423,   424,   244,   245,   246,    15,   333,   131,   569,   238,
-     163,   423,   424,   435,   430,   672,   789,   790,   473,   341,
-     421,   422,   553,   791,   792,   793,   310,   794,   311,   312,
-     244,   245,   246,   153,   154,    69,   486,   127,   213,   128,
-     127,   658,   128,   129,   729,  -532,   129,   473,   799,   801,
-     436,   437,     1,   757,     2,     3,     4,     5,     6,     7,
-       8,     9,    10,   436,   437,  1186,   750,   477,    11,    47,
-    1090,  -535,    12,    13,    14,  1214,   478,   112,   367,   368,
-     554,   134,   113,   313,   114,    55,   115,    57,   455,   550,
-     754,   315,    54,   316,   317,   107,   369,   251,   252,   253,
-     490,   491,   177,   254,  1226,   178,  1215,   320,   111,   321,
-     322,  1202,   882,   758,   436,   437,   753,   513,   659,   356,
-     497,    15,   498,   758,  1003,   251,   252,   253,   142,   755,
-     758,   254,   255,   256,   257,  1227,   874,   152,   436,   437,
-     523,   524,   436,   437,   100,    19,   396,   519,   318,   601,
-     529,   530,   531,   532,   533,   534,   150,   588,   162,   364,
-     255,   256,   257,   101,   323,   376,   589,   597,   598,   758,
-     120,   121,   571,   551,   576,   155,   434,    56,   548,   549,
-     105,   179,   180,   903,   436,   437,    63,   436,   437,   433,
-     314,   373,   434,   555,   556,   557,   558,   559,   560,   561,
-     562,   563,   564,   565,   566,   567,   568,   702,   164,   271,
-     425,    64,   271,    16,    65,   211,   570,   220,   221,   222,
-     273,   425,   751,   270,   789,   790,   230,   231,   232,   399,
-      17,   791,   792,   793,   600,   794,   429,   911,   116,    63,
-     271,  1229,    18,    41,    42,    43,   124,   431,   273,    44,
-      45,    66,   593,   436,   437,   319,   436,   437,  1016,   117,
-     125,    19,   338,   118,    64,   508,   119,    65,   509,   662,
-     663,   324,  1230,   645,   646,    67,   643,   909,   671,   910,
-     674,   436,   437,   654,   647,   648,   649,   106,    48,    49,
-      50,   436,   437,   637,    51,    52,   638,   436,   437,   436,
-     437,   436,   437,   684,    66,   366,   436,   437,   786,   131,
-      68,   372,   436,   437,   243,   244,   245,   246,   686,   544,
-    1168,  1169,   108,    61,   436,   437,   134,     1,    67,     2,
-       3,     4,     5,     6,     7,    70,     9,   495,   490,   415,
-     721,   416,   417,    11,   664,   418,  1086,    12,    13,    14,
-       1,    15,     2,     3,     4,     5,     6,     7,   787,     9,
-      71,   522,   665,    68,   666,   141,    11,    72,    73,   667,
-      12,    13,    14,  1005,   517,   668,    74,   165,   166,   721,
-     682,   456,   247,   248,   473,   143,   457,   669,    70,   150,
-     335,   650,   249,   151,   250,   722,    15,   723,   724,   149,
-     870,   748,   458,   749,   336,   337,    46,   459,   156,   460,
-     251,   252,   253,    71,   461,  1193,   254,  1195,  1095,    15,
-      72,    73,   752,   464,   127,   157,   128,   521,   465,    74,
-     129,   167,   168,  1211,   722,  1213,   723,   724,    58,    59,
-     766,   655,   158,    60,   434,   255,   256,   257,   258,   763,
-     259,    53,   260,   160,   261,   512,   262,   526,   263,   527,
-     797,   528,   326,   187,   188,   327,   328,   264,   189,   887,
-     329,   330,   660,   886,   661,   892,   528,   639,   243,   244,
-     245,   246,   170,   265,   656,   266,   440,   267,    16,   161,
-     265,   466,   266,   883,   267,  1171,   467,   172,  1172,  1173,
-     896,   169,   879,  1174,  1175,   441,   442,   443,   444,   678,
-     171,    16,   679,   446,   173,   735,   685,    18,   434,   182,
-     268,   269,   270,   742,   184,   271,   743,   272,   518,   904,
-     905,   906,   907,   273,   183,   744,    19,  1196,   743,   185,
-      18,   145,   146,   147,   148,   186,   247,   248,   136,   137,
-     138,   139,   201,  1212,   202,  1216,   249,   440,   250,    19,
-     205,   399,   447,   448,   449,   450,   451,   452,   453,   454,
-     203,  1228,   207,   884,   251,   252,   253,   204,  -536,  -536,
-     254,   208,   990,   206,   778,  -247,   779,   780,   781,   782,
-    1243,   783,   784,   745,  1246,   210,   434,   243,   244,   245,
-     246,   765,   769,   770,   434,   509,   771,   462,   463,   255,
-     256,   257,   258,   216,   259,   214,   260,   218,   261,   219,
-     262,   223,   263,   773,   440,   875,   774,   900,   509,   919,
-     434,   264,   920,   224,  -536,  -536,   450,   451,   452,   453,
-     454,   481,   482,  -536,  -536,   443,   444,   762,   225,   922,
-     993,  -536,   923,   509,   265,   228,   266,   997,   267,  1085,
-     434,  1092,   774,   226,   743,   247,   248,   229,  1177,   233,
-      15,   509,   102,   103,   104,   249,   776,   250,   174,   175,
-     176,   452,   453,   454,   268,   269,   270,   436,   437,   271,
-     234,   272,   235,   251,   252,   253,   238,   273,   240,   254,
-    -536,   448,   449,   450,   451,   452,   453,   454,   580,   581,
-     680,   681,   423,   998,   325,   243,   244,   245,   246,  1200,
-    1201,  1208,  1209,  1008,  1009,   331,   332,   343,   255,   256,
-     257,   258,   334,   259,   342,   260,   339,   261,   344,   262,
-     345,   263,   346,   348,   802,   803,   804,   805,   806,   347,
-     264,   807,   808,   349,   350,  1097,   351,   353,   809,   810,
-     811,   352,   354,   359,   358,   243,   244,   245,   246,   362,
-     361,   370,   375,   265,   374,   266,   379,   267,  1096,   380,
-     812,   381,   402,   247,   248,   397,   398,   403,   404,   405,
-     455,   408,   406,   249,   409,   250,   410,   411,   412,   468,
-     413,   414,   419,   268,   269,   270,   420,   469,   271,   470,
-     272,   251,   252,   253,   471,   476,   273,   254,   472,     1,
-     473,     2,     3,     4,     5,     6,     7,     8,     9,    10,
-     479,   480,   483,   394,   395,    11,  1176,   484,   485,    12,
-      13,    14,   492,   249,   494,   250,   255,   256,   257,   258,
-     503,   259,   504,   260,   506,   261,   507,   262,   510,   263,
-     515,   251,   252,   253,   516,   520,    15,   254,   264,   535,
-     536,   537,   243,   244,   245,   246,   382,   383,   384,   385,
-     386,   387,   388,   389,   390,   391,   392,   393,    15,   538,
-     539,   265,   540,   266,   541,   267,   255,   256,   257,   258,
-     542,   259,   543,   260,   545,   261,   547,   262,   552,   263,
-     271,   572,   574,   577,   578,   579,   584,   587,   264,   586,
-     582,   268,   269,   270,   583,   585,   271,   590,   272,   591,
-      75,   592,   594,   635,   273,   596,   636,   640,   642,   641,
-     394,   265,   657,   266,   644,   267,   551,   670,   675,   676,
-     249,   683,   250,   436,   687,   691,   689,   690,    76,    77,
-     692,    78,   496,   696,   699,   700,    79,    80,   251,   252,
-     253,   268,   269,   270,   254,   438,   271,   439,   272,   701,
-      16,   434,   708,   711,   273,   813,   814,   815,   816,   817,
-     712,   734,   818,   819,   730,   713,   714,    17,   715,   820,
-     821,   822,   737,   255,   256,   257,   258,   716,   259,    18,
-     260,   717,   261,   738,   262,   733,   263,   739,   718,   719,
-     740,   823,   741,   760,   720,   264,   728,   761,    19,   824,
-     825,   826,   827,   828,   440,   736,   829,   830,   746,   759,
-     756,   681,   680,   831,   832,   833,   767,   764,   265,   768,
-     266,   772,   267,   441,   442,   443,   444,   445,   775,   521,
-     798,   446,   777,   869,   870,   834,   868,   881,   521,   885,
-     876,   877,   878,   888,   893,   901,   894,   897,   268,   269,
-     270,   899,   898,   271,   902,   272,   913,    81,    82,    83,
-      84,   273,    85,    86,   914,   915,    87,    88,    89,   916,
-     917,    90,    91,    92,    93,   924,   921,   925,    94,    95,
-     447,   448,   449,   450,   451,   452,   453,   454,   440,   926,
-     927,    96,    97,   933,   944,    98,   955,   440,   966,    99,
-     928,   977,   929,   995,   930,   931,   932,   441,   442,   443,
-     444,   934,   688,   988,   935,   446,   441,   442,   443,   444,
-     936,   937,   938,   991,   446,   602,   603,   604,   605,   606,
+     379,   358,   123,    69,   728,   433,   427,   378,   896,   654,
+     694,   243,   401,   748,    54,   696,   364,   497,   182,   397,
+     424,   425,   245,   246,   247,   424,   425,   751,   790,   334,
+     164,   758,   551,   131,   431,   570,   673,   791,   474,   239,
+     422,   423,   342,   792,   793,    15,   214,   794,   457,   795,
+     245,   246,   247,   458,   153,   154,    69,   487,  1230,   437,
+     438,   127,  1091,   128,   730,  -533,   883,   129,   800,   802,
+     373,   456,     1,   755,     2,     3,     4,     5,     6,     7,
+       8,     9,    10,   437,   438,  1187,   787,   178,    11,  1231,
+     179,   759,    12,    13,    14,  1215,   127,   554,   128,   437,
+     438,   311,   129,   312,   313,    55,   316,    57,   317,   318,
+      15,   321,    63,   322,   323,   107,   552,   252,   253,   254,
+     491,   492,   759,   255,   112,   754,  1216,   459,   357,   113,
+      64,   114,   460,   115,   463,   464,   788,   514,   437,   438,
+     498,    15,   499,   759,  1004,   252,   253,   254,   142,   756,
+      47,   255,   256,   257,   258,   555,   875,   152,   314,    65,
+     524,   525,   436,   319,   461,    63,   397,   520,   324,   462,
+     530,   531,   532,   533,   534,   535,   150,    54,   162,   365,
+     256,   257,   258,    64,     1,    19,     2,     3,     4,     5,
+       6,     7,   572,     9,   577,   377,   155,   435,   549,   550,
+      11,   180,   181,   904,    12,    13,    14,   659,   602,   474,
+     660,   374,    65,   556,   557,   558,   559,   560,   561,   562,
+     563,   564,   565,   566,   567,   568,   569,   703,   165,   272,
+     426,    66,   272,    16,    56,   426,   790,   221,   222,   223,
+     274,   212,   752,   571,   271,   791,   231,   232,   233,  1203,
+      17,   792,   793,    15,   601,   794,   430,   795,   912,   400,
+     272,  -536,    18,   437,   438,   315,  1227,   432,   274,    67,
+     320,   134,   594,   437,   438,   325,   598,   599,  1017,   437,
+     438,    19,   100,   339,    66,   116,    41,    42,    43,   663,
+     664,   522,    44,    45,   437,   438,   644,  1228,   672,    68,
+     675,   437,   438,   655,   437,   438,   117,   759,   437,   438,
+     118,   437,   438,   119,    48,    49,    50,   111,   646,   647,
+      51,    52,    67,   685,   437,   438,   367,   437,   438,   648,
+     649,   650,   437,   438,   437,   438,   545,    70,   687,    71,
+    1169,  1170,   478,    72,   722,    16,   101,    73,    58,    59,
+     441,   479,    68,    60,    74,   368,   369,   665,   491,   496,
+     722,   336,   437,   438,   666,   474,  1087,   667,   124,   442,
+     443,   444,   445,   370,    18,   337,   338,   447,   266,   589,
+     267,   523,   268,   416,   441,   417,   418,   668,   590,   419,
+      70,  1006,    71,    19,   125,   669,    72,   670,   131,   723,
+      73,   724,   725,   683,   871,  -537,  -537,    74,   150,   465,
+     244,   245,   246,   247,   466,   723,   327,   724,   725,   328,
+     329,   749,   134,   750,   330,   331,   448,   449,   450,   451,
+     452,   453,   454,   455,   105,  1194,   651,  1196,  1096,   127,
+     106,   128,   753,  1172,   108,   129,  1173,  1174,   887,    46,
+     893,  1175,  1176,  1212,   527,  1214,   528,   141,   529,   522,
+     767,  -537,  -537,   451,   452,   453,   454,   455,   467,   764,
+     518,   172,   910,   468,   911,   149,   513,    53,   248,   249,
+     798,   188,   189,   661,   151,   662,   190,   529,   250,   888,
+     251,   120,   121,   779,  -247,   780,   781,   782,   783,   640,
+     784,   785,   434,   143,   657,   435,   252,   253,   254,   175,
+     176,   177,   255,   884,   905,   906,   907,   908,   441,   156,
+     897,   157,   880,   383,   384,   385,   386,   387,   388,   389,
+     390,   391,   392,   393,   394,   158,   686,   442,   443,   444,
+     445,   256,   257,   258,   259,   447,   260,   161,   261,   160,
+     262,   163,   263,   509,   264,   638,   510,  1197,   639,   244,
+     245,   246,   247,   265,   145,   146,   147,   148,   136,   137,
+     138,   139,   170,  1213,   656,  1217,   679,   435,   736,   680,
+     743,   435,   745,   744,   746,   744,   266,   435,   267,   173,
+     268,  1229,   166,   167,   448,   449,   450,   451,   452,   453,
+     454,   455,   991,   171,   766,   885,   770,   435,   771,   510,
+    1244,   772,   774,   174,  1247,   775,   269,   270,   271,   876,
+     183,   272,   510,   273,   519,   168,   169,   248,   249,   274,
+     191,   901,   920,   923,   435,   921,   924,   250,   994,   251,
+     192,   510,   400,   193,   194,   184,   195,   196,   197,   482,
+     483,   244,   245,   246,   247,   252,   253,   254,   102,   103,
+     104,   255,   198,   199,   185,   200,   201,   763,   803,   804,
+     805,   806,   807,   186,   998,   808,   809,   435,  1086,   437,
+     438,   775,   810,   811,   812,  1093,  1178,   187,   744,   510,
+     256,   257,   258,   259,   203,   260,   202,   261,   777,   262,
+     204,   263,   205,   264,   813,   453,   454,   455,   581,   582,
+     681,   682,   265,   424,   999,  1201,  1202,  1209,  1210,   248,
+     249,  1009,  1010,   206,    15,   207,   208,   209,   211,   250,
+     215,   251,   219,   217,   220,   266,   224,   267,   225,   268,
+     244,   245,   246,   247,   226,   229,   227,   252,   253,   254,
+     230,   234,   235,   255,   236,   239,   241,   326,   332,   333,
+     344,   335,   340,   343,   345,   269,   270,   271,   346,   439,
+     272,   440,   273,   347,   348,  1098,   349,   351,   274,   350,
+     352,   353,   256,   257,   258,   259,   354,   260,   355,   261,
+     359,   262,   360,   263,   362,   264,   363,   371,  1097,   244,
+     245,   246,   247,   375,   265,   376,   380,   382,   248,   249,
+     381,   398,   403,   399,   404,   405,   406,   409,   250,   407,
+     251,   410,   411,   412,   413,   414,   469,   266,   441,   267,
+     415,   268,   420,   421,   470,   471,   252,   253,   254,   456,
+     472,   473,   255,   477,   474,   484,   480,   442,   443,   444,
+     445,   446,   481,   485,   486,   447,  1177,   269,   270,   271,
+     493,   495,   272,   505,   273,   507,   508,   395,   396,   504,
+     274,   256,   257,   258,   259,   511,   260,   250,   261,   251,
+     262,    15,   263,   536,   264,   516,   517,   521,   244,   245,
+     246,   247,   541,   265,   542,   252,   253,   254,   537,   538,
+     543,   255,   539,   540,   448,   449,   450,   451,   452,   453,
+     454,   455,   544,   546,   548,   553,   266,   272,   267,   573,
+     268,   575,   578,   579,   580,   583,   584,   585,   586,   588,
+     256,   257,   258,   259,   587,   260,   591,   261,   592,   262,
+     595,   263,   593,   264,   636,   597,   269,   270,   271,   641,
+     642,   272,   265,   273,   637,   643,   395,   552,   658,   274,
+     645,   671,   676,    61,   677,   688,   250,     1,   251,     2,
+       3,     4,     5,     6,     7,   266,     9,   267,   437,   268,
+     684,   692,   693,    11,   252,   253,   254,    12,    13,    14,
+     255,   497,   690,     1,   691,     2,     3,     4,     5,     6,
+       7,     8,     9,    10,   697,   269,   270,   271,   700,    11,
+     272,   701,   273,    12,    13,    14,   702,   435,   274,   256,
+     257,   258,   259,   709,   260,   522,   261,   712,   262,   731,
+     263,   713,   264,   735,   738,   714,    15,   715,   441,   734,
+     740,   265,   716,   717,   739,   718,    75,   719,   720,   721,
+     729,   737,   741,   742,   747,   761,   762,  -537,  -537,   444,
+     445,   760,    15,   757,   266,  -537,   267,   765,   268,   682,
+     681,   769,   768,   773,    76,    77,   776,    78,   778,   799,
+     869,   871,    79,    80,   441,   877,   870,   878,   882,   879,
+     886,   889,   894,   895,   269,   270,   271,   898,   899,   272,
+     902,   273,   903,   442,   443,   444,   445,   274,   689,   900,
+     914,   447,   915,   916,  -537,   449,   450,   451,   452,   453,
+     454,   455,   814,   815,   816,   817,   818,   917,    16,   819,
+     820,   918,   925,   996,   922,   934,   821,   822,   823,   926,
+     927,   928,   929,   945,   956,   997,   930,   931,   932,   933,
+     935,   936,   967,   937,    16,   938,   939,    18,   824,   940,
+     448,   449,   450,   451,   452,   453,   454,   455,   941,   942,
+     978,    17,   989,   943,   992,   759,    19,   944,   993,  1007,
+    1005,   946,   947,    18,   948,   825,   826,   827,   828,   829,
+     949,   950,   830,   831,   951,  1011,  1013,   952,   953,   832,
+     833,   834,    19,    81,    82,    83,    84,   954,    85,    86,
+     955,   957,    87,    88,    89,   958,   959,    90,    91,    92,
+      93,   835,  1014,   960,    94,    95,   961,  1016,   962,   963,
+     964,   965,  1018,   966,   968,   969,   970,    96,    97,   971,
+     972,    98,   973,  1019,  1020,    99,   603,   604,   605,   606,
      607,   608,   609,   610,   611,   612,   613,   614,   615,   616,
-     617,   618,   939,   619,   620,   621,   622,   623,   624,   992,
-     758,   625,   940,   941,   626,   627,   628,   629,   630,   631,
-     632,   633,   942,   943,   447,   448,   449,   450,   451,   452,
-     453,   454,   190,   447,   448,   449,   450,   451,   452,   453,
-     454,   945,   191,   946,   947,   192,   193,   996,   194,   195,
-     196,   948,   949,   950,  1006,   835,   836,   837,   838,   839,
-     951,   952,   840,   841,   197,   198,  1010,   199,   200,   842,
-     843,   844,   846,   847,   848,   849,   850,   953,   954,   851,
-     852,  1012,   956,  1013,  1015,  1017,   853,   854,   855,  1018,
-     957,   845,   958,  1004,   959,   857,   858,   859,   860,   861,
-    1019,   960,   862,   863,  1020,   961,   962,   963,   856,   864,
-     865,   866,   964,   965,   967,   968,   969,   970,  1021,  1022,
-    1023,   971,   972,   973,   974,   975,   976,   978,  1024,   979,
-     980,   867,   981,   982,   983,   984,   985,   986,   987,   989,
-     999,  1000,  1025,  1001,  1002,  1026,  1027,  1028,  1029,  1030,
-    1031,  1032,  1033,  1034,  1035,  1036,  1037,  1038,  1039,  1040,
-    1041,  1042,  1043,  1044,  1045,  1046,  1047,  1048,  1049,  1050,
+     617,   618,   619,  1021,   620,   621,   622,   623,   624,   625,
+     974,  1022,   626,  1023,  1024,   627,   628,   629,   630,   631,
+     632,   633,   634,   836,   837,   838,   839,   840,   975,   976,
+     841,   842,   977,  1025,   979,   980,   981,   843,   844,   845,
+     847,   848,   849,   850,   851,   982,   983,   852,   853,   984,
+     985,   986,   987,   988,   854,   855,   856,  1026,   990,   846,
+    1000,  1001,  1002,   858,   859,   860,   861,   862,  1003,  1027,
+     863,   864,  1028,  1029,  1030,  1031,   857,   865,   866,   867,
+    1032,  1033,  1034,  1035,  1036,  1037,  1038,  1039,  1040,  1041,
+    1042,  1043,  1044,  1045,  1046,  1047,  1048,  1049,  1050,   868,
     1051,  1052,  1053,  1054,  1055,  1056,  1057,  1058,  1059,  1060,
     1061,  1062,  1063,  1064,  1065,  1066,  1067,  1068,  1069,  1070,
     1071,  1072,  1073,  1074,  1075,  1076,  1077,  1078,  1079,  1080,
-    1081,  1082,  1083,  1084,  1087,  1088,  1089,  1091,  1098,  1093,
-    1094,  1099,  1100,  1101,  1102,  1103,  1104,  1105,  1106,  1107,
-    1108,  1109,  1110,  1111,  1119,  1112,  1113,  1114,  1115,  1116,
-    1117,  1118,  1120,  1121,  1122,  1123,  1124,  1125,  1126,  1127,
-    1128,  1129,  1130,  1131,  1132,  1133,  1134,  1141,  1152,  1135,
-    1136,  1137,  1138,  1139,  1140,  1142,  1143,  1144,  1145,  1146,
-    1147,  1163,  1148,  1149,  1150,  1170,  1151,  1153,  1154,  1155,
-    1156,  1157,  1158,  1159,  1160,  1161,  1162,  1164,  1184,  1185,
-    1189,  1165,  1166,  1167,  1178,  1179,  1180,  1181,  1182,  1183,
-    1187,  1188,  1190,  1191,  1197,  1192,  1194,  1198,  1199,  1203,
-    1204,  1205,  1207,  1206,  1217,  1210,  1218,  1219,  1220,  1221,
-    1222,  1223,  1225,  1231,  1224,  1233,  1232,  1234,  1235,  1236,
-    1237,  1238,  1239,  1241,  1240,  1242,  1244,  1245,   159,   209,
-     732,   871,   514,   365,   873,   122,   355,  1007,   912,  1011,
-     525,   673,   475,   710,   340,   546,   880,   573,   890,   994,
-     575,   891,   407,     0,   908
+    1081,  1082,  1083,  1084,  1085,  1088,  1089,  1090,  1092,  1099,
+    1094,  1100,  1101,  1102,  1103,  1104,  1105,  1106,  1107,  1108,
+    1109,  1095,  1120,  1110,  1111,  1112,  1113,  1114,  1115,  1116,
+    1117,  1118,  1119,  1121,  1122,  1123,  1124,  1125,  1126,  1131,
+    1127,  1128,  1129,  1130,  1132,  1133,  1134,  1135,  1142,  1136,
+    1137,  1138,  1139,  1153,  1140,  1141,  1143,  1144,  1145,  1146,
+    1147,  1148,  1164,  1149,  1171,  1185,  1150,  1151,  1152,  1154,
+    1155,  1156,  1157,  1158,  1159,  1160,  1161,  1162,  1163,  1165,
+    1186,  1190,  1198,  1166,  1167,  1168,  1179,  1180,  1181,  1182,
+    1183,  1184,  1191,  1188,  1192,  1200,  1189,  1205,  1199,  1207,
+    1193,  1195,  1204,  1206,  1208,  1211,  1218,  1220,  1219,  1221,
+    1222,  1223,  1224,  1225,  1226,  1232,  1234,  1235,  1233,  1236,
+    1237,  1238,  1239,  1240,  1242,  1241,  1243,  1245,  1246,   159,
+     210,   515,   366,   733,   872,   122,   356,   874,   913,  1012,
+    1008,   711,   526,   476,   547,   674,   891,   341,   892,   574,
+     576,     0,     0,   408,     0,   881,     0,   909,     0,     0,
+       0,   995
 };
 
 static const yytype_int16 yycheck[] =
 {
-     238,   215,     8,    19,   634,   273,   271,   236,   757,   154,
-     582,   516,   250,   658,     3,   583,    53,     3,    60,   247,
-       5,     6,     4,     5,     6,    76,   171,     8,     3,    64,
-       6,     5,     6,    53,   272,     3,   708,   708,    76,   184,
-     268,   269,    71,   708,   708,   708,     3,   708,     5,     6,
-       4,     5,     6,    74,    75,    61,    80,    20,   130,    22,
-      20,    53,    22,    26,   636,     0,    26,    76,   713,   714,
-     154,   155,     7,     4,     9,    10,    11,    12,    13,    14,
-      15,    16,    17,   154,   155,     6,    82,    38,    23,    35,
-       4,    60,    27,    28,    29,   133,    47,     7,    31,    32,
-     129,    70,    12,    60,    14,     4,    16,     6,   218,    73,
-     220,     3,     3,     5,     6,    14,    49,    99,   100,   101,
-     358,   359,   200,   105,   133,   203,   164,     3,   171,     5,
-       6,     6,    82,    64,   154,   155,   220,   375,    85,   211,
-     126,    76,   128,    64,   893,    99,   100,   101,    47,   220,
-      64,   105,   134,   135,   136,   164,   728,    56,   154,   155,
-     398,   399,   154,   155,    32,   216,   394,   381,    60,   132,
-     408,   409,   410,   411,   412,   413,   218,    31,    77,   216,
-     134,   135,   136,    32,    60,   220,    40,    68,    69,    64,
-      31,    32,   457,   157,   462,   216,   220,    74,   436,   437,
-       3,   100,   101,   771,   154,   155,     8,   154,   155,   217,
-     167,   227,   220,   441,   442,   443,   444,   445,   446,   447,
-     448,   449,   450,   451,   452,   453,   454,   216,   204,   214,
-     215,     8,   214,   168,     8,   216,   211,   136,   137,   138,
-     222,   215,    85,   211,   916,   916,   145,   146,   147,    86,
-     185,   916,   916,   916,   492,   916,   272,   217,   168,    61,
-     214,   133,   197,    31,    32,    33,     0,   221,   222,    37,
-      38,     8,   486,   154,   155,   167,   154,   155,   923,   189,
-     219,   216,   181,   193,    61,   217,   196,    61,   220,   527,
-     528,   167,   164,    66,    67,     8,   510,    32,   536,    34,
-     538,   154,   155,   517,    77,    78,    79,     3,    31,    32,
-      33,   154,   155,   217,    37,    38,   220,   154,   155,   154,
-     155,   154,   155,   551,    61,   224,   154,   155,     3,     8,
-       8,    36,   154,   155,     3,     4,     5,     6,   552,   217,
-    1089,  1090,     3,     3,   154,   155,    70,     7,    61,     9,
-      10,    11,    12,    13,    14,     8,    16,   363,   596,   119,
-      71,   121,   122,    23,   217,   125,   996,    27,    28,    29,
-       7,    76,     9,    10,    11,    12,    13,    14,    53,    16,
-       8,   397,   217,    61,   217,     3,    23,     8,     8,   217,
-      27,    28,    29,   898,    63,   217,     8,   172,   173,    71,
-     545,   215,    71,    72,    76,    70,   220,   217,    61,   218,
-      10,   184,    81,    14,    83,   126,    76,   128,   129,     3,
-     131,   659,   215,   661,    24,    25,   194,   220,     3,   215,
-      99,   100,   101,    61,   220,  1184,   105,  1186,  1010,    76,
-      61,    61,   670,   215,    20,     3,    22,    71,   220,    61,
-      26,   172,   173,  1202,   126,  1204,   128,   129,   165,   166,
-     688,   217,     3,   170,   220,   134,   135,   136,   137,   683,
-     139,   194,   141,   216,   143,   374,   145,    82,   147,    84,
-     709,    86,    38,   185,   186,    41,    42,   156,   190,   754,
-      46,    47,    82,   753,    84,   755,    86,   503,     3,     4,
-       5,     6,   175,   179,   520,   181,   130,   183,   168,     3,
-     179,   215,   181,   751,   183,    38,   220,     6,    41,    42,
-     758,     3,   736,    46,    47,   149,   150,   151,   152,   217,
-      75,   168,   220,   157,     3,   217,   552,   197,   220,    53,
-     209,   210,   211,   217,     6,   214,   220,   216,   217,     3,
-       4,     5,     6,   222,   220,   217,   216,  1187,   220,   194,
-     197,    49,    50,    51,    52,   194,    71,    72,    42,    43,
-      44,    45,   194,  1203,     4,  1205,    81,   130,    83,   216,
-     194,    86,   206,   207,   208,   209,   210,   211,   212,   213,
-     192,  1221,   217,   217,    99,   100,   101,    74,   151,   152,
-     105,   217,   870,   194,    54,    55,    56,    57,    58,    59,
-    1240,    61,    62,   217,  1244,    21,   220,     3,     4,     5,
-       6,   217,   217,   217,   220,   220,   220,   220,   221,   134,
-     135,   136,   137,    65,   139,    63,   141,    71,   143,     3,
-     145,     3,   147,   217,   130,   217,   220,   217,   220,   217,
-     220,   156,   220,    60,   207,   208,   209,   210,   211,   212,
-     213,   187,   188,   149,   150,   151,   152,   683,    60,   217,
-     217,   157,   220,   220,   179,    72,   181,   217,   183,   217,
-     220,   217,   220,   216,   220,    71,    72,     3,   217,     3,
-      76,   220,   158,   159,   160,    81,   702,    83,   199,   200,
-     201,   211,   212,   213,   209,   210,   211,   154,   155,   214,
-       3,   216,     3,    99,   100,   101,    64,   222,     4,   105,
-     206,   207,   208,   209,   210,   211,   212,   213,    43,    44,
-       5,     6,     5,     6,   217,     3,     4,     5,     6,    43,
-      44,    41,    42,   913,   914,     3,     3,   164,   134,   135,
-     136,   137,     4,   139,     4,   141,   216,   143,     6,   145,
-       3,   147,     6,     3,    88,    89,    90,    91,    92,     4,
-     156,    95,    96,     4,    53,  1013,     4,     3,   102,   103,
-     104,   194,     3,    66,    51,     3,     4,     5,     6,   132,
-      72,     3,   206,   179,    60,   181,    76,   183,  1012,    76,
-     124,   216,     4,    71,    72,   216,   216,     4,     4,     4,
-     218,   216,     6,    81,   216,    83,   216,   216,   216,     3,
-     216,   216,   216,   209,   210,   211,   216,     6,   214,    45,
-     216,    99,   100,   101,    45,     4,   222,   105,    75,     7,
-      76,     9,    10,    11,    12,    13,    14,    15,    16,    17,
-       6,    75,     4,    71,    72,    23,  1094,   217,   217,    27,
-      28,    29,    67,    81,     4,    83,   134,   135,   136,   137,
-      53,   139,   216,   141,     3,   143,     3,   145,   216,   147,
-     216,    99,   100,   101,   216,   216,    76,   105,   156,     4,
-     216,   216,     3,     4,     5,     6,   137,   138,   139,   140,
-     141,   142,   143,   144,   145,   146,   147,   148,    76,   216,
-     216,   179,     4,   181,     4,   183,   134,   135,   136,   137,
-     223,   139,   217,   141,    75,   143,     3,   145,   216,   147,
-     214,     6,     6,     6,     5,    41,     3,     6,   156,   217,
-     216,   209,   210,   211,   216,   216,   214,     4,   216,   164,
-       3,   164,    74,   127,   222,   220,   216,     3,     3,   132,
-      71,   179,   217,   181,   220,   183,   157,    74,     4,   220,
-      81,   216,    83,   154,   129,     6,   223,   223,    31,    32,
-       6,    34,     3,     3,     6,     4,    39,    40,    99,   100,
-     101,   209,   210,   211,   105,    71,   214,    73,   216,     4,
-     168,   220,   178,     4,   222,    88,    89,    90,    91,    92,
-     216,     4,    95,    96,    30,   216,   216,   185,   216,   102,
-     103,   104,     6,   134,   135,   136,   137,   216,   139,   197,
-     141,   216,   143,     6,   145,   217,   147,     4,   216,   216,
-       3,   124,     6,     4,   216,   156,   216,    76,   216,    88,
-      89,    90,    91,    92,   130,   216,    95,    96,   217,   217,
-     220,     6,     5,   102,   103,   104,    48,   217,   179,    45,
-     181,   206,   183,   149,   150,   151,   152,   153,     6,    71,
-       6,   157,   220,   127,   131,   124,   129,   217,    71,   214,
-     216,   132,   164,   214,     4,     6,   220,   217,   209,   210,
-     211,   217,   216,   214,     6,   216,    55,   160,   161,   162,
-     163,   222,   165,   166,    55,     3,   169,   170,   171,   220,
-      50,   174,   175,   176,   177,   220,   217,   220,   181,   182,
-     206,   207,   208,   209,   210,   211,   212,   213,   130,   220,
-     220,   194,   195,    90,    90,   198,    90,   130,    90,   202,
-     220,    90,   220,     4,   220,   220,   220,   149,   150,   151,
-     152,   220,   154,    90,   220,   157,   149,   150,   151,   152,
-     220,   220,   220,   132,   157,    87,    88,    89,    90,    91,
-      92,    93,    94,    95,    96,    97,    98,    99,   100,   101,
-     102,   103,   220,   105,   106,   107,   108,   109,   110,   132,
-      64,   113,   220,   220,   116,   117,   118,   119,   120,   121,
-     122,   123,   220,   220,   206,   207,   208,   209,   210,   211,
-     212,   213,   159,   206,   207,   208,   209,   210,   211,   212,
-     213,   220,   169,   220,   220,   172,   173,     3,   175,   176,
-     177,   220,   220,   220,     6,    88,    89,    90,    91,    92,
-     220,   220,    95,    96,   191,   192,   216,   194,   195,   102,
-     103,   104,    88,    89,    90,    91,    92,   220,   220,    95,
-      96,    51,   220,    52,     6,     6,   102,   103,   104,     6,
-     220,   124,   220,   217,   220,    88,    89,    90,    91,    92,
-       6,   220,    95,    96,     6,   220,   220,   220,   124,   102,
-     103,   104,   220,   220,   220,   220,   220,   220,     6,     6,
-       6,   220,   220,   220,   220,   220,   220,   220,     6,   220,
-     220,   124,   220,   220,   220,   220,   220,   220,   220,   220,
-     220,   220,     6,   220,   220,   220,     6,     6,     6,     6,
+     239,   216,    19,     8,   635,   274,   272,   237,   758,   517,
+     583,   154,   251,   659,     3,   584,    53,     3,    60,   248,
+       5,     6,     4,     5,     6,     5,     6,    82,   709,   172,
+       6,     4,    73,     8,   273,     3,     3,   709,    76,    64,
+     269,   270,   185,   709,   709,    76,   130,   709,   215,   709,
+       4,     5,     6,   220,    74,    75,    61,    80,   133,   154,
+     155,    20,     4,    22,   637,     0,    82,    26,   714,   715,
+      36,   218,     7,   220,     9,    10,    11,    12,    13,    14,
+      15,    16,    17,   154,   155,     6,     3,   200,    23,   164,
+     203,    64,    27,    28,    29,   133,    20,    71,    22,   154,
+     155,     3,    26,     5,     6,     4,     3,     6,     5,     6,
+      76,     3,     8,     5,     6,    14,   157,    99,   100,   101,
+     359,   360,    64,   105,     7,   220,   164,   215,   212,    12,
+       8,    14,   220,    16,   220,   221,    53,   376,   154,   155,
+     126,    76,   128,    64,   894,    99,   100,   101,    47,   220,
+      35,   105,   134,   135,   136,   129,   729,    56,    60,     8,
+     399,   400,    53,    60,   215,    61,   395,   382,    60,   220,
+     409,   410,   411,   412,   413,   414,   218,     3,    77,   216,
+     134,   135,   136,    61,     7,   216,     9,    10,    11,    12,
+      13,    14,   458,    16,   463,   220,   216,   220,   437,   438,
+      23,   100,   101,   772,    27,    28,    29,    53,   132,    76,
+      85,   228,    61,   442,   443,   444,   445,   446,   447,   448,
+     449,   450,   451,   452,   453,   454,   455,   216,   204,   214,
+     215,     8,   214,   168,    74,   215,   917,   136,   137,   138,
+     222,   216,    85,   211,   211,   917,   145,   146,   147,     6,
+     185,   917,   917,    76,   493,   917,   273,   917,   217,    86,
+     214,    60,   197,   154,   155,   167,   133,   221,   222,     8,
+     167,    70,   487,   154,   155,   167,    68,    69,   924,   154,
+     155,   216,    32,   182,    61,   168,    31,    32,    33,   528,
+     529,    71,    37,    38,   154,   155,   511,   164,   537,     8,
+     539,   154,   155,   518,   154,   155,   189,    64,   154,   155,
+     193,   154,   155,   196,    31,    32,    33,   171,    66,    67,
+      37,    38,    61,   552,   154,   155,   225,   154,   155,    77,
+      78,    79,   154,   155,   154,   155,   217,     8,   553,     8,
+    1090,  1091,    38,     8,    71,   168,    32,     8,   165,   166,
+     130,    47,    61,   170,     8,    31,    32,   217,   597,   364,
+      71,    10,   154,   155,   217,    76,   997,   217,     0,   149,
+     150,   151,   152,    49,   197,    24,    25,   157,   179,    31,
+     181,   398,   183,   119,   130,   121,   122,   217,    40,   125,
+      61,   899,    61,   216,   219,   217,    61,   217,     8,   126,
+      61,   128,   129,   546,   131,   151,   152,    61,   218,   215,
+       3,     4,     5,     6,   220,   126,    38,   128,   129,    41,
+      42,   660,    70,   662,    46,    47,   206,   207,   208,   209,
+     210,   211,   212,   213,     3,  1185,   184,  1187,  1011,    20,
+       3,    22,   671,    38,     3,    26,    41,    42,   754,   194,
+     756,    46,    47,  1203,    82,  1205,    84,     3,    86,    71,
+     689,   207,   208,   209,   210,   211,   212,   213,   215,   684,
+      63,    75,    32,   220,    34,     3,   375,   194,    71,    72,
+     710,   185,   186,    82,    14,    84,   190,    86,    81,   755,
+      83,    31,    32,    54,    55,    56,    57,    58,    59,   504,
+      61,    62,   217,    70,   521,   220,    99,   100,   101,   199,
+     200,   201,   105,   752,     3,     4,     5,     6,   130,     3,
+     759,     3,   737,   137,   138,   139,   140,   141,   142,   143,
+     144,   145,   146,   147,   148,     3,   553,   149,   150,   151,
+     152,   134,   135,   136,   137,   157,   139,     3,   141,   216,
+     143,     3,   145,   217,   147,   217,   220,  1188,   220,     3,
+       4,     5,     6,   156,    49,    50,    51,    52,    42,    43,
+      44,    45,     3,  1204,   217,  1206,   217,   220,   217,   220,
+     217,   220,   217,   220,   217,   220,   179,   220,   181,     6,
+     183,  1222,   172,   173,   206,   207,   208,   209,   210,   211,
+     212,   213,   871,   175,   217,   217,   217,   220,   217,   220,
+    1241,   220,   217,     3,  1245,   220,   209,   210,   211,   217,
+      53,   214,   220,   216,   217,   172,   173,    71,    72,   222,
+     159,   217,   217,   217,   220,   220,   220,    81,   217,    83,
+     169,   220,    86,   172,   173,   220,   175,   176,   177,   187,
+     188,     3,     4,     5,     6,    99,   100,   101,   158,   159,
+     160,   105,   191,   192,     6,   194,   195,   684,    88,    89,
+      90,    91,    92,   194,   217,    95,    96,   220,   217,   154,
+     155,   220,   102,   103,   104,   217,   217,   194,   220,   220,
+     134,   135,   136,   137,     4,   139,   194,   141,   703,   143,
+     192,   145,    74,   147,   124,   211,   212,   213,    43,    44,
+       5,     6,   156,     5,     6,    43,    44,    41,    42,    71,
+      72,   914,   915,   194,    76,   194,   217,   217,    21,    81,
+      63,    83,    71,    65,     3,   179,     3,   181,    60,   183,
+       3,     4,     5,     6,    60,    72,   216,    99,   100,   101,
+       3,     3,     3,   105,     3,    64,     4,   217,     3,     3,
+     164,     4,   216,     4,     6,   209,   210,   211,     3,    71,
+     214,    73,   216,     6,     4,  1014,     3,    53,   222,     4,
+       4,   194,   134,   135,   136,   137,     3,   139,     3,   141,
+      51,   143,    66,   145,    72,   147,   132,     3,  1013,     3,
+       4,     5,     6,    60,   156,   206,    76,   216,    71,    72,
+      76,   216,     4,   216,     4,     4,     4,   216,    81,     6,
+      83,   216,   216,   216,   216,   216,     3,   179,   130,   181,
+     216,   183,   216,   216,     6,    45,    99,   100,   101,   218,
+      45,    75,   105,     4,    76,     4,     6,   149,   150,   151,
+     152,   153,    75,   217,   217,   157,  1095,   209,   210,   211,
+      67,     4,   214,   216,   216,     3,     3,    71,    72,    53,
+     222,   134,   135,   136,   137,   216,   139,    81,   141,    83,
+     143,    76,   145,     4,   147,   216,   216,   216,     3,     4,
+       5,     6,     4,   156,     4,    99,   100,   101,   216,   216,
+     223,   105,   216,   216,   206,   207,   208,   209,   210,   211,
+     212,   213,   217,    75,     3,   216,   179,   214,   181,     6,
+     183,     6,     6,     5,    41,   216,   216,     3,   216,     6,
+     134,   135,   136,   137,   217,   139,     4,   141,   164,   143,
+      74,   145,   164,   147,   127,   220,   209,   210,   211,     3,
+     132,   214,   156,   216,   216,     3,    71,   157,   217,   222,
+     220,    74,     4,     3,   220,   129,    81,     7,    83,     9,
+      10,    11,    12,    13,    14,   179,    16,   181,   154,   183,
+     216,     6,     6,    23,    99,   100,   101,    27,    28,    29,
+     105,     3,   223,     7,   223,     9,    10,    11,    12,    13,
+      14,    15,    16,    17,     3,   209,   210,   211,     6,    23,
+     214,     4,   216,    27,    28,    29,     4,   220,   222,   134,
+     135,   136,   137,   178,   139,    71,   141,     4,   143,    30,
+     145,   216,   147,     4,     6,   216,    76,   216,   130,   217,
+       4,   156,   216,   216,     6,   216,     3,   216,   216,   216,
+     216,   216,     3,     6,   217,     4,    76,   149,   150,   151,
+     152,   217,    76,   220,   179,   157,   181,   217,   183,     6,
+       5,    45,    48,   206,    31,    32,     6,    34,   220,     6,
+     129,   131,    39,    40,   130,   216,   127,   132,   217,   164,
+     214,   214,     4,   220,   209,   210,   211,   217,   216,   214,
+       6,   216,     6,   149,   150,   151,   152,   222,   154,   217,
+      55,   157,    55,     3,   206,   207,   208,   209,   210,   211,
+     212,   213,    88,    89,    90,    91,    92,   220,   168,    95,
+      96,    50,   220,     4,   217,    90,   102,   103,   104,   220,
+     220,   220,   220,    90,    90,     3,   220,   220,   220,   220,
+     220,   220,    90,   220,   168,   220,   220,   197,   124,   220,
+     206,   207,   208,   209,   210,   211,   212,   213,   220,   220,
+      90,   185,    90,   220,   132,    64,   216,   220,   132,     6,
+     217,   220,   220,   197,   220,    88,    89,    90,    91,    92,
+     220,   220,    95,    96,   220,   216,    51,   220,   220,   102,
+     103,   104,   216,   160,   161,   162,   163,   220,   165,   166,
+     220,   220,   169,   170,   171,   220,   220,   174,   175,   176,
+     177,   124,    52,   220,   181,   182,   220,     6,   220,   220,
+     220,   220,     6,   220,   220,   220,   220,   194,   195,   220,
+     220,   198,   220,     6,     6,   202,    87,    88,    89,    90,
+      91,    92,    93,    94,    95,    96,    97,    98,    99,   100,
+     101,   102,   103,     6,   105,   106,   107,   108,   109,   110,
+     220,     6,   113,     6,     6,   116,   117,   118,   119,   120,
+     121,   122,   123,    88,    89,    90,    91,    92,   220,   220,
+      95,    96,   220,     6,   220,   220,   220,   102,   103,   104,
+      88,    89,    90,    91,    92,   220,   220,    95,    96,   220,
+     220,   220,   220,   220,   102,   103,   104,     6,   220,   124,
+     220,   220,   220,    88,    89,    90,    91,    92,   220,   220,
+      95,    96,     6,     6,     6,     6,   124,   102,   103,   104,
        6,     6,     6,     6,     6,     6,   220,     6,     6,     6,
-       6,     6,     6,     6,     6,     6,     6,   220,     6,     6,
-       6,     6,     6,     6,     6,     6,     6,     6,   220,     6,
+       6,     6,     6,     6,     6,     6,     6,   220,     6,   124,
        6,     6,     6,     6,     6,     6,     6,     6,     6,   220,
        6,     6,     6,     6,     6,     6,     6,     6,     6,     6,
-     220,     6,     4,     4,     4,     4,     4,   217,   217,     6,
-      60,   217,   217,   217,   217,   217,   217,   217,   217,   217,
-       6,   217,   217,   217,     6,   217,   217,   217,   217,   217,
-     217,   217,   217,   217,   217,   217,   217,   217,   217,   217,
-     217,   217,     6,   217,   217,   217,   217,     6,     6,   217,
+     220,     6,     6,     6,     6,     6,     6,     6,     6,     6,
+       6,   220,     6,     4,     4,     4,     4,     4,   217,   217,
+       6,   217,   217,   217,   217,   217,   217,   217,   217,   217,
+       6,    60,     6,   217,   217,   217,   217,   217,   217,   217,
+     217,   217,   217,   217,   217,   217,   217,   217,   217,     6,
+     217,   217,   217,   217,   217,   217,   217,   217,     6,   217,
+     217,   217,   217,     6,   217,   217,   217,   217,   217,   217,
+     217,   217,     6,   217,   164,     4,   217,   217,   217,   217,
      217,   217,   217,   217,   217,   217,   217,   217,   217,   217,
-     217,     6,   217,   217,   217,   164,   217,   217,   217,   217,
-     217,   217,   217,   217,   217,   217,   217,   217,     4,     4,
-      47,   220,   220,   220,   217,   217,   217,   217,   217,   217,
-     217,   217,     6,     6,   164,   220,   220,   216,     6,   217,
-       4,   217,     4,    47,   216,     6,   217,     6,    46,   217,
-     217,    38,     4,   216,    38,    38,   217,    38,    38,    38,
-       3,   216,   216,     3,   217,     3,   217,   217,    61,   125,
-     638,   725,   376,   222,   727,    19,   211,   911,   777,   916,
-     400,   537,   339,   596,   183,   434,   743,   459,   755,   876,
-     461,   755,   257,    -1,   774
+       4,    47,   164,   220,   220,   220,   217,   217,   217,   217,
+     217,   217,     6,   217,     6,     6,   217,     4,   216,    47,
+     220,   220,   217,   217,     4,     6,   216,     6,   217,    46,
+     217,   217,    38,    38,     4,   216,    38,    38,   217,    38,
+      38,     3,   216,   216,     3,   217,     3,   217,   217,    61,
+     125,   377,   223,   639,   726,    19,   212,   728,   778,   917,
+     912,   597,   401,   340,   435,   538,   756,   184,   756,   460,
+     462,    -1,    -1,   258,    -1,   744,    -1,   775,    -1,    -1,
+      -1,   877
 };
 
 /* YYSTOS[STATE-NUM] -- The symbol kind of the accessing symbol of
@@ -1669,115 +1671,115 @@ static const yytype_int16 yystos[] =
      270,     8,   253,   255,    70,   335,   335,   335,   335,   335,
      337,     3,   274,    70,   334,   334,   334,   334,   334,     3,
      218,    14,   274,    74,    75,   216,     3,     3,     3,   228,
-     216,     3,   274,     6,   204,   172,   173,   172,   173,     3,
-     175,    75,     6,     3,   199,   200,   201,   200,   203,   274,
-     274,    60,    53,   220,     6,   194,   194,   185,   186,   190,
-     159,   169,   172,   173,   175,   176,   177,   191,   192,   194,
-     195,   194,     4,   192,    74,   194,   194,   217,   217,   227,
-      21,   216,   254,   255,    63,   262,    65,   256,    71,     3,
-     274,   274,   274,     3,    60,    60,   216,   243,    72,     3,
-     274,   274,   274,     3,     3,     3,   246,   247,    64,   267,
-       4,   333,   333,     3,     4,     5,     6,    71,    72,    81,
-      83,    99,   100,   101,   105,   134,   135,   136,   137,   139,
-     141,   143,   145,   147,   156,   179,   181,   183,   209,   210,
-     211,   214,   216,   222,   288,   290,   291,   292,   293,   294,
-     295,   296,   297,   298,   301,   302,   303,   304,   305,   307,
-     308,   309,   310,   311,   313,   314,   315,   316,   317,   318,
-     319,   320,   321,   322,   325,   326,   327,   328,   329,   330,
-       3,     5,     6,    60,   167,     3,     5,     6,    60,   167,
-       3,     5,     6,    60,   167,   217,    38,    41,    42,    46,
-      47,     3,     3,   333,     4,    10,    24,    25,   274,   216,
-     278,   333,     4,   164,     6,     3,     6,     4,     3,     4,
-      53,     4,   194,     3,     3,   254,   255,   288,    51,    66,
-     260,    72,   132,    53,   216,   243,   274,    31,    32,    49,
-       3,   240,    36,   252,    60,   206,   220,   267,   291,    76,
-      76,   216,   137,   138,   139,   140,   141,   142,   143,   144,
-     145,   146,   147,   148,    71,    72,   292,   216,   216,    86,
-     291,   306,     4,     4,     4,     4,     6,   330,   216,   216,
-     216,   216,   216,   216,   216,   119,   121,   122,   125,   216,
-     216,   292,   292,     5,     6,   215,   311,   323,   324,   252,
-     291,   221,   310,   217,   220,    53,   154,   155,    71,    73,
-     130,   149,   150,   151,   152,   153,   157,   206,   207,   208,
-     209,   210,   211,   212,   213,   218,   215,   220,   215,   220,
-     215,   220,   220,   221,   215,   220,   215,   220,     3,     6,
-      45,    45,    75,    76,   338,   253,     4,    38,    47,     6,
-      75,   187,   188,     4,   217,   217,    80,   263,   257,   258,
-     291,   291,    67,   261,     4,   250,     3,   126,   128,   230,
-     232,   233,   239,    53,   216,   342,     3,     3,   217,   220,
-     216,   289,   274,   291,   247,   216,   216,    63,   217,   288,
-     216,    71,   252,   291,   291,   306,    82,    84,    86,   291,
-     291,   291,   291,   291,   291,     4,   216,   216,   216,   216,
-       4,     4,   223,   217,   217,    75,   290,     3,   291,   291,
-      73,   157,   216,    71,   129,   292,   292,   292,   292,   292,
-     292,   292,   292,   292,   292,   292,   292,   292,   292,     3,
-     211,   311,     6,   323,     6,   324,   310,     6,     5,    41,
-      43,    44,   216,   216,     3,   216,   217,     6,    31,    40,
-       4,   164,   164,   288,    74,   264,   220,    68,    69,   259,
-     291,   132,    87,    88,    89,    90,    91,    92,    93,    94,
-      95,    96,    97,    98,    99,   100,   101,   102,   103,   105,
-     106,   107,   108,   109,   110,   113,   116,   117,   118,   119,
-     120,   121,   122,   123,   235,   127,   216,   217,   220,   250,
-       3,   132,     3,   288,   220,    66,    67,    77,    78,    79,
-     184,   331,   332,   331,   288,   217,   252,   217,    53,    85,
-      82,    84,   291,   291,   217,   217,   217,   217,   217,   217,
-      74,   291,     3,   309,   291,     4,   220,   266,   217,   220,
-       5,     6,   333,   216,   292,   252,   288,   129,   154,   223,
-     223,     6,     6,   240,   231,   233,     3,   340,   341,     6,
-       4,     4,   216,   271,   272,   273,   274,   279,   178,   265,
-     258,     4,   216,   216,   216,   216,   216,   216,   216,   216,
-     216,    71,   126,   128,   129,   236,   237,   338,   216,   240,
-      30,   339,   232,   217,     4,   217,   216,     6,     6,     4,
-       3,     6,   217,   220,   217,   217,   217,   235,   291,   291,
-      82,    85,   292,   220,   220,   220,   220,     4,    64,   217,
-       4,    76,   252,   288,   217,   217,   292,    48,    45,   217,
-     217,   220,   206,   217,   220,     6,   250,   220,    54,    56,
-      57,    58,    59,    61,    62,   280,     3,    53,   275,   293,
-     294,   295,   296,   297,   298,   299,   300,   267,     6,   235,
-     234,   235,    88,    89,    90,    91,    92,    95,    96,   102,
-     103,   104,   124,    88,    89,    90,    91,    92,    95,    96,
+     216,     3,   274,     3,     6,   204,   172,   173,   172,   173,
+       3,   175,    75,     6,     3,   199,   200,   201,   200,   203,
+     274,   274,    60,    53,   220,     6,   194,   194,   185,   186,
+     190,   159,   169,   172,   173,   175,   176,   177,   191,   192,
+     194,   195,   194,     4,   192,    74,   194,   194,   217,   217,
+     227,    21,   216,   254,   255,    63,   262,    65,   256,    71,
+       3,   274,   274,   274,     3,    60,    60,   216,   243,    72,
+       3,   274,   274,   274,     3,     3,     3,   246,   247,    64,
+     267,     4,   333,   333,     3,     4,     5,     6,    71,    72,
+      81,    83,    99,   100,   101,   105,   134,   135,   136,   137,
+     139,   141,   143,   145,   147,   156,   179,   181,   183,   209,
+     210,   211,   214,   216,   222,   288,   290,   291,   292,   293,
+     294,   295,   296,   297,   298,   301,   302,   303,   304,   305,
+     307,   308,   309,   310,   311,   313,   314,   315,   316,   317,
+     318,   319,   320,   321,   322,   325,   326,   327,   328,   329,
+     330,     3,     5,     6,    60,   167,     3,     5,     6,    60,
+     167,     3,     5,     6,    60,   167,   217,    38,    41,    42,
+      46,    47,     3,     3,   333,     4,    10,    24,    25,   274,
+     216,   278,   333,     4,   164,     6,     3,     6,     4,     3,
+       4,    53,     4,   194,     3,     3,   254,   255,   288,    51,
+      66,   260,    72,   132,    53,   216,   243,   274,    31,    32,
+      49,     3,   240,    36,   252,    60,   206,   220,   267,   291,
+      76,    76,   216,   137,   138,   139,   140,   141,   142,   143,
+     144,   145,   146,   147,   148,    71,    72,   292,   216,   216,
+      86,   291,   306,     4,     4,     4,     4,     6,   330,   216,
+     216,   216,   216,   216,   216,   216,   119,   121,   122,   125,
+     216,   216,   292,   292,     5,     6,   215,   311,   323,   324,
+     252,   291,   221,   310,   217,   220,    53,   154,   155,    71,
+      73,   130,   149,   150,   151,   152,   153,   157,   206,   207,
+     208,   209,   210,   211,   212,   213,   218,   215,   220,   215,
+     220,   215,   220,   220,   221,   215,   220,   215,   220,     3,
+       6,    45,    45,    75,    76,   338,   253,     4,    38,    47,
+       6,    75,   187,   188,     4,   217,   217,    80,   263,   257,
+     258,   291,   291,    67,   261,     4,   250,     3,   126,   128,
+     230,   232,   233,   239,    53,   216,   342,     3,     3,   217,
+     220,   216,   289,   274,   291,   247,   216,   216,    63,   217,
+     288,   216,    71,   252,   291,   291,   306,    82,    84,    86,
+     291,   291,   291,   291,   291,   291,     4,   216,   216,   216,
+     216,     4,     4,   223,   217,   217,    75,   290,     3,   291,
+     291,    73,   157,   216,    71,   129,   292,   292,   292,   292,
+     292,   292,   292,   292,   292,   292,   292,   292,   292,   292,
+       3,   211,   311,     6,   323,     6,   324,   310,     6,     5,
+      41,    43,    44,   216,   216,     3,   216,   217,     6,    31,
+      40,     4,   164,   164,   288,    74,   264,   220,    68,    69,
+     259,   291,   132,    87,    88,    89,    90,    91,    92,    93,
+      94,    95,    96,    97,    98,    99,   100,   101,   102,   103,
+     105,   106,   107,   108,   109,   110,   113,   116,   117,   118,
+     119,   120,   121,   122,   123,   235,   127,   216,   217,   220,
+     250,     3,   132,     3,   288,   220,    66,    67,    77,    78,
+      79,   184,   331,   332,   331,   288,   217,   252,   217,    53,
+      85,    82,    84,   291,   291,   217,   217,   217,   217,   217,
+     217,    74,   291,     3,   309,   291,     4,   220,   266,   217,
+     220,     5,     6,   333,   216,   292,   252,   288,   129,   154,
+     223,   223,     6,     6,   240,   231,   233,     3,   340,   341,
+       6,     4,     4,   216,   271,   272,   273,   274,   279,   178,
+     265,   258,     4,   216,   216,   216,   216,   216,   216,   216,
+     216,   216,    71,   126,   128,   129,   236,   237,   338,   216,
+     240,    30,   339,   232,   217,     4,   217,   216,     6,     6,
+       4,     3,     6,   217,   220,   217,   217,   217,   235,   291,
+     291,    82,    85,   292,   220,   220,   220,   220,     4,    64,
+     217,     4,    76,   252,   288,   217,   217,   292,    48,    45,
+     217,   217,   220,   206,   217,   220,     6,   250,   220,    54,
+      56,    57,    58,    59,    61,    62,   280,     3,    53,   275,
+     293,   294,   295,   296,   297,   298,   299,   300,   267,     6,
+     235,   234,   235,    88,    89,    90,    91,    92,    95,    96,
      102,   103,   104,   124,    88,    89,    90,    91,    92,    95,
       96,   102,   103,   104,   124,    88,    89,    90,    91,    92,
       95,    96,   102,   103,   104,   124,    88,    89,    90,    91,
       92,    95,    96,   102,   103,   104,   124,    88,    89,    90,
-      91,    92,    95,    96,   102,   103,   104,   124,   129,   127,
-     131,   237,   238,   238,   240,   217,   216,   132,   164,   288,
-     332,   217,    82,   291,   217,   214,   325,   311,   214,   312,
-     315,   320,   325,     4,   220,   266,   291,   217,   216,   217,
-     217,     6,     6,   233,     3,     4,     5,     6,   341,    32,
-      34,   217,   272,    55,    55,     3,   220,    50,   269,   217,
-     220,   217,   217,   220,   220,   220,   220,   220,   220,   220,
-     220,   220,   220,    90,   220,   220,   220,   220,   220,   220,
+      91,    92,    95,    96,   102,   103,   104,   124,    88,    89,
+      90,    91,    92,    95,    96,   102,   103,   104,   124,   129,
+     127,   131,   237,   238,   238,   240,   217,   216,   132,   164,
+     288,   332,   217,    82,   291,   217,   214,   325,   311,   214,
+     312,   315,   320,   325,     4,   220,   266,   291,   217,   216,
+     217,   217,     6,     6,   233,     3,     4,     5,     6,   341,
+      32,    34,   217,   272,    55,    55,     3,   220,    50,   269,
+     217,   220,   217,   217,   220,   220,   220,   220,   220,   220,
      220,   220,   220,   220,    90,   220,   220,   220,   220,   220,
      220,   220,   220,   220,   220,    90,   220,   220,   220,   220,
      220,   220,   220,   220,   220,   220,    90,   220,   220,   220,
      220,   220,   220,   220,   220,   220,   220,    90,   220,   220,
      220,   220,   220,   220,   220,   220,   220,   220,    90,   220,
-     310,   132,   132,   217,   340,     4,     3,   217,     6,   220,
-     220,   220,   220,   266,   217,   331,     6,   275,   273,   273,
-     216,   299,    51,    52,   268,     6,   235,     6,     6,     6,
-       6,     6,     6,     6,     6,     6,   220,     6,     6,     6,
+     220,   220,   220,   220,   220,   220,   220,   220,   220,    90,
+     220,   310,   132,   132,   217,   340,     4,     3,   217,     6,
+     220,   220,   220,   220,   266,   217,   331,     6,   275,   273,
+     273,   216,   299,    51,    52,   268,     6,   235,     6,     6,
        6,     6,     6,     6,     6,     6,     6,   220,     6,     6,
        6,     6,     6,     6,     6,     6,     6,     6,   220,     6,
        6,     6,     6,     6,     6,     6,     6,     6,     6,   220,
        6,     6,     6,     6,     6,     6,     6,     6,     6,     6,
      220,     6,     6,     6,     6,     6,     6,     6,     6,     6,
-       6,   220,     6,     4,     4,   217,   338,     4,     4,     4,
-       4,   217,   217,     6,    60,   240,   288,   291,   217,   217,
-     217,   217,   217,   217,   217,   217,   217,   217,     6,   217,
+       6,   220,     6,     6,     6,     6,     6,     6,     6,     6,
+       6,     6,   220,     6,     4,     4,   217,   338,     4,     4,
+       4,     4,   217,   217,     6,    60,   240,   288,   291,   217,
      217,   217,   217,   217,   217,   217,   217,   217,   217,     6,
      217,   217,   217,   217,   217,   217,   217,   217,   217,   217,
        6,   217,   217,   217,   217,   217,   217,   217,   217,   217,
      217,     6,   217,   217,   217,   217,   217,   217,   217,   217,
      217,   217,     6,   217,   217,   217,   217,   217,   217,   217,
-     217,   217,   217,     6,   217,   220,   220,   220,   266,   266,
-     164,    38,    41,    42,    46,    47,   291,   217,   217,   217,
-     217,   217,   217,   217,     4,     4,     6,   217,   217,    47,
-       6,     6,   220,   266,   220,   266,   338,   164,   216,     6,
-      43,    44,     6,   217,     4,   217,    47,     4,    41,    42,
-       6,   266,   338,   266,   133,   164,   338,   216,   217,     6,
-      46,   217,   217,    38,    38,     4,   133,   164,   338,   133,
-     164,   216,   217,    38,    38,    38,    38,     3,   216,   216,
-     217,     3,     3,   338,   217,   217,   338
+     217,   217,   217,     6,   217,   217,   217,   217,   217,   217,
+     217,   217,   217,   217,     6,   217,   220,   220,   220,   266,
+     266,   164,    38,    41,    42,    46,    47,   291,   217,   217,
+     217,   217,   217,   217,   217,     4,     4,     6,   217,   217,
+      47,     6,     6,   220,   266,   220,   266,   338,   164,   216,
+       6,    43,    44,     6,   217,     4,   217,    47,     4,    41,
+      42,     6,   266,   338,   266,   133,   164,   338,   216,   217,
+       6,    46,   217,   217,    38,    38,     4,   133,   164,   338,
+     133,   164,   216,   217,    38,    38,    38,    38,     3,   216,
+     216,   217,     3,     3,   338,   217,   217,   338
 };
 
 /* YYR1[RULE-NUM] -- Symbol kind of the left-hand side of rule RULE-NUM.  */
@@ -1812,32 +1814,32 @@ static const yytype_int16 yyr1[] =
      281,   281,   281,   281,   281,   281,   281,   281,   281,   281,
      281,   281,   281,   281,   281,   281,   281,   281,   281,   281,
      281,   281,   281,   281,   281,   281,   281,   281,   281,   281,
-     281,   282,   282,   282,   283,   283,   284,   284,   284,   284,
+     281,   281,   282,   282,   282,   283,   283,   284,   284,   284,
      284,   284,   284,   284,   284,   284,   284,   284,   284,   284,
-     284,   284,   284,   284,   284,   284,   284,   284,   284,   285,
-     286,   286,   286,   286,   286,   286,   286,   286,   286,   286,
+     284,   284,   284,   284,   284,   284,   284,   284,   284,   284,
+     285,   286,   286,   286,   286,   286,   286,   286,   286,   286,
      286,   286,   286,   286,   286,   286,   286,   286,   286,   286,
      286,   286,   286,   286,   286,   286,   286,   286,   286,   286,
-     286,   286,   286,   286,   286,   286,   286,   286,   287,   287,
-     287,   288,   288,   289,   289,   290,   290,   291,   291,   291,
-     291,   291,   292,   292,   292,   292,   292,   292,   292,   292,
-     292,   292,   292,   292,   292,   293,   293,   293,   294,   294,
-     294,   294,   295,   295,   295,   295,   296,   296,   296,   296,
-     297,   297,   298,   298,   299,   299,   299,   299,   299,   299,
-     300,   300,   301,   301,   301,   301,   301,   301,   301,   301,
+     286,   286,   286,   286,   286,   286,   286,   286,   286,   287,
+     287,   287,   288,   288,   289,   289,   290,   290,   291,   291,
+     291,   291,   291,   292,   292,   292,   292,   292,   292,   292,
+     292,   292,   292,   292,   292,   292,   293,   293,   293,   294,
+     294,   294,   294,   295,   295,   295,   295,   296,   296,   296,
+     296,   297,   297,   298,   298,   299,   299,   299,   299,   299,
+     299,   300,   300,   301,   301,   301,   301,   301,   301,   301,
      301,   301,   301,   301,   301,   301,   301,   301,   301,   301,
      301,   301,   301,   301,   301,   301,   301,   301,   301,   301,
-     301,   302,   302,   303,   304,   304,   305,   305,   305,   305,
-     306,   306,   307,   308,   308,   308,   308,   309,   309,   309,
-     309,   310,   310,   310,   310,   310,   310,   310,   310,   310,
-     310,   310,   310,   310,   311,   311,   311,   311,   312,   312,
-     312,   313,   314,   314,   315,   315,   316,   317,   317,   318,
-     319,   319,   320,   321,   321,   322,   322,   323,   324,   325,
-     325,   326,   327,   327,   328,   329,   329,   330,   330,   330,
-     330,   330,   330,   330,   330,   330,   330,   330,   330,   331,
-     331,   332,   332,   332,   332,   332,   332,   333,   334,   334,
-     335,   335,   336,   336,   337,   337,   338,   338,   339,   339,
-     340,   340,   341,   341,   341,   341,   341,   342,   342
+     301,   301,   302,   302,   303,   304,   304,   305,   305,   305,
+     305,   306,   306,   307,   308,   308,   308,   308,   309,   309,
+     309,   309,   310,   310,   310,   310,   310,   310,   310,   310,
+     310,   310,   310,   310,   310,   311,   311,   311,   311,   312,
+     312,   312,   313,   314,   314,   315,   315,   316,   317,   317,
+     318,   319,   319,   320,   321,   321,   322,   322,   323,   324,
+     325,   325,   326,   327,   327,   328,   329,   329,   330,   330,
+     330,   330,   330,   330,   330,   330,   330,   330,   330,   330,
+     331,   331,   332,   332,   332,   332,   332,   332,   333,   334,
+     334,   335,   335,   336,   336,   337,   337,   338,   338,   339,
+     339,   340,   340,   341,   341,   341,   341,   341,   342,   342
 };
 
 /* YYR2[RULE-NUM] -- Number of symbols on the right-hand side of rule RULE-NUM.  */
@@ -1868,36 +1870,36 @@ static const yytype_int8 yyr2[] =
        1,     1,     1,     3,     1,     1,     2,     4,     1,     3,
        2,     1,     5,     0,     2,     0,     1,     3,     5,     4,
        6,     1,     1,     1,     1,     1,     1,     0,     2,     2,
-       2,     2,     3,     2,     2,     2,     2,     3,     2,     3,
-       3,     3,     3,     4,     4,     3,     3,     4,     4,     5,
-       6,     7,     9,     4,     5,     7,     9,     2,     3,     2,
-       2,     4,     3,     3,     4,     2,     3,     3,     4,     2,
-       3,     2,     2,     2,     2,     5,     2,     4,     4,     4,
+       2,     2,     3,     2,     2,     3,     2,     2,     3,     2,
+       3,     3,     3,     3,     4,     4,     3,     3,     4,     4,
+       5,     6,     7,     9,     4,     5,     7,     9,     2,     3,
+       2,     2,     4,     3,     3,     4,     2,     3,     3,     4,
+       2,     3,     2,     2,     2,     2,     5,     2,     4,     4,
        4,     4,     4,     4,     4,     4,     4,     4,     4,     4,
-       4,     4,     4,     6,     6,     5,     3,     4,     4,     3,
-       3,     4,     6,     7,     9,    10,    12,    12,    13,    14,
-      15,    16,    12,    13,    15,    16,     3,     4,     5,     6,
-       3,     3,     4,     3,     3,     4,     4,     6,     5,     3,
-       4,     3,     4,     3,     3,     5,     7,     7,     6,     8,
-       8,     1,     3,     3,     5,     3,     1,     1,     1,     1,
-       1,     1,     3,     3,     1,     1,     1,     1,     1,     1,
-       1,     1,     1,     1,     1,    14,    19,    16,    20,    16,
-      15,    13,    18,    14,    13,    11,     8,    10,    13,    15,
-       5,     7,     4,     6,     1,     1,     1,     1,     1,     1,
-       1,     3,     3,     4,     5,     4,     4,     4,     4,     4,
-       4,     4,     3,     2,     2,     2,     3,     3,     3,     3,
-       3,     3,     3,     3,     3,     3,     3,     3,     6,     3,
-       4,     3,     3,     5,     5,     6,     4,     6,     3,     5,
-       4,     5,     6,     4,     5,     5,     6,     1,     3,     1,
-       3,     1,     1,     1,     1,     1,     2,     2,     2,     2,
-       2,     1,     1,     1,     1,     1,     1,     1,     1,     1,
-       1,     2,     2,     3,     1,     1,     2,     2,     3,     2,
-       2,     3,     2,     2,     2,     2,     3,     3,     3,     1,
-       1,     2,     2,     3,     2,     2,     3,     2,     2,     2,
-       2,     2,     2,     2,     2,     2,     2,     2,     2,     1,
-       3,     2,     2,     1,     2,     2,     2,     1,     2,     0,
-       3,     0,     1,     0,     2,     0,     4,     0,     4,     0,
-       1,     3,     1,     3,     3,     3,     3,     6,     3
+       4,     4,     4,     4,     6,     6,     5,     3,     4,     4,
+       3,     3,     4,     6,     7,     9,    10,    12,    12,    13,
+      14,    15,    16,    12,    13,    15,    16,     3,     4,     5,
+       6,     3,     3,     4,     3,     3,     4,     4,     6,     5,
+       3,     4,     3,     4,     3,     3,     5,     7,     7,     6,
+       8,     8,     1,     3,     3,     5,     3,     1,     1,     1,
+       1,     1,     1,     3,     3,     1,     1,     1,     1,     1,
+       1,     1,     1,     1,     1,     1,    14,    19,    16,    20,
+      16,    15,    13,    18,    14,    13,    11,     8,    10,    13,
+      15,     5,     7,     4,     6,     1,     1,     1,     1,     1,
+       1,     1,     3,     3,     4,     5,     4,     4,     4,     4,
+       4,     4,     4,     3,     2,     2,     2,     3,     3,     3,
+       3,     3,     3,     3,     3,     3,     3,     3,     3,     6,
+       3,     4,     3,     3,     5,     5,     6,     4,     6,     3,
+       5,     4,     5,     6,     4,     5,     5,     6,     1,     3,
+       1,     3,     1,     1,     1,     1,     1,     2,     2,     2,
+       2,     2,     1,     1,     1,     1,     1,     1,     1,     1,
+       1,     1,     2,     2,     3,     1,     1,     2,     2,     3,
+       2,     2,     3,     2,     2,     2,     2,     3,     3,     3,
+       1,     1,     2,     2,     3,     2,     2,     3,     2,     2,
+       2,     2,     2,     2,     2,     2,     2,     2,     2,     2,
+       1,     3,     2,     2,     1,     2,     2,     2,     1,     2,
+       0,     3,     0,     1,     0,     2,     0,     4,     0,     4,
+       0,     1,     3,     1,     3,     3,     3,     3,     6,     3
 };
 
 
@@ -2465,7 +2467,7 @@ yydestruct (const char *yymsg,
             {
     free(((*yyvaluep).str_value));
 }
-#line 2469 "parser.cpp"
+#line 2471 "parser.cpp"
         break;
 
     case YYSYMBOL_STRING: /* STRING  */
@@ -2473,7 +2475,7 @@ yydestruct (const char *yymsg,
             {
     free(((*yyvaluep).str_value));
 }
-#line 2477 "parser.cpp"
+#line 2479 "parser.cpp"
         break;
 
     case YYSYMBOL_statement_list: /* statement_list  */
@@ -2487,7 +2489,7 @@ yydestruct (const char *yymsg,
         delete (((*yyvaluep).stmt_array));
     }
 }
-#line 2491 "parser.cpp"
+#line 2493 "parser.cpp"
         break;
 
     case YYSYMBOL_table_element_array: /* table_element_array  */
@@ -2501,7 +2503,7 @@ yydestruct (const char *yymsg,
         delete (((*yyvaluep).table_element_array_t));
     }
 }
-#line 2505 "parser.cpp"
+#line 2507 "parser.cpp"
         break;
 
     case YYSYMBOL_column_def_array: /* column_def_array  */
@@ -2515,7 +2517,7 @@ yydestruct (const char *yymsg,
         delete (((*yyvaluep).column_def_array_t));
     }
 }
-#line 2519 "parser.cpp"
+#line 2521 "parser.cpp"
         break;
 
     case YYSYMBOL_column_type_array: /* column_type_array  */
@@ -2524,7 +2526,7 @@ yydestruct (const char *yymsg,
     fprintf(stderr, "destroy column_type_array\n");
     delete (((*yyvaluep).column_type_array_t));
 }
-#line 2528 "parser.cpp"
+#line 2530 "parser.cpp"
         break;
 
     case YYSYMBOL_column_type: /* column_type  */
@@ -2533,7 +2535,7 @@ yydestruct (const char *yymsg,
     fprintf(stderr, "destroy column_type\n");
     delete (((*yyvaluep).column_type_t));
 }
-#line 2537 "parser.cpp"
+#line 2539 "parser.cpp"
         break;
 
     case YYSYMBOL_column_constraints: /* column_constraints  */
@@ -2544,7 +2546,7 @@ yydestruct (const char *yymsg,
         delete (((*yyvaluep).column_constraints_t));
     }
 }
-#line 2548 "parser.cpp"
+#line 2550 "parser.cpp"
         break;
 
     case YYSYMBOL_default_expr: /* default_expr  */
@@ -2552,7 +2554,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).const_expr_t));
 }
-#line 2556 "parser.cpp"
+#line 2558 "parser.cpp"
         break;
 
     case YYSYMBOL_identifier_array: /* identifier_array  */
@@ -2561,7 +2563,7 @@ yydestruct (const char *yymsg,
     fprintf(stderr, "destroy identifier array\n");
     delete (((*yyvaluep).identifier_array_t));
 }
-#line 2565 "parser.cpp"
+#line 2567 "parser.cpp"
         break;
 
     case YYSYMBOL_optional_identifier_array: /* optional_identifier_array  */
@@ -2570,7 +2572,7 @@ yydestruct (const char *yymsg,
     fprintf(stderr, "destroy identifier array\n");
     delete (((*yyvaluep).identifier_array_t));
 }
-#line 2574 "parser.cpp"
+#line 2576 "parser.cpp"
         break;
 
     case YYSYMBOL_update_expr_array: /* update_expr_array  */
@@ -2584,7 +2586,7 @@ yydestruct (const char *yymsg,
         delete (((*yyvaluep).update_expr_array_t));
     }
 }
-#line 2588 "parser.cpp"
+#line 2590 "parser.cpp"
         break;
 
     case YYSYMBOL_update_expr: /* update_expr  */
@@ -2595,7 +2597,7 @@ yydestruct (const char *yymsg,
         delete ((*yyvaluep).update_expr_t);
     }
 }
-#line 2599 "parser.cpp"
+#line 2601 "parser.cpp"
         break;
 
     case YYSYMBOL_select_statement: /* select_statement  */
@@ -2605,7 +2607,7 @@ yydestruct (const char *yymsg,
         delete ((*yyvaluep).select_stmt);
     }
 }
-#line 2609 "parser.cpp"
+#line 2611 "parser.cpp"
         break;
 
     case YYSYMBOL_select_with_paren: /* select_with_paren  */
@@ -2615,7 +2617,7 @@ yydestruct (const char *yymsg,
         delete ((*yyvaluep).select_stmt);
     }
 }
-#line 2619 "parser.cpp"
+#line 2621 "parser.cpp"
         break;
 
     case YYSYMBOL_select_without_paren: /* select_without_paren  */
@@ -2625,7 +2627,7 @@ yydestruct (const char *yymsg,
         delete ((*yyvaluep).select_stmt);
     }
 }
-#line 2629 "parser.cpp"
+#line 2631 "parser.cpp"
         break;
 
     case YYSYMBOL_select_clause_with_modifier: /* select_clause_with_modifier  */
@@ -2635,7 +2637,7 @@ yydestruct (const char *yymsg,
         delete ((*yyvaluep).select_stmt);
     }
 }
-#line 2639 "parser.cpp"
+#line 2641 "parser.cpp"
         break;
 
     case YYSYMBOL_select_clause_without_modifier_paren: /* select_clause_without_modifier_paren  */
@@ -2645,7 +2647,7 @@ yydestruct (const char *yymsg,
         delete ((*yyvaluep).select_stmt);
     }
 }
-#line 2649 "parser.cpp"
+#line 2651 "parser.cpp"
         break;
 
     case YYSYMBOL_select_clause_without_modifier: /* select_clause_without_modifier  */
@@ -2655,7 +2657,7 @@ yydestruct (const char *yymsg,
         delete ((*yyvaluep).select_stmt);
     }
 }
-#line 2659 "parser.cpp"
+#line 2661 "parser.cpp"
         break;
 
     case YYSYMBOL_order_by_clause: /* order_by_clause  */
@@ -2669,7 +2671,7 @@ yydestruct (const char *yymsg,
         delete (((*yyvaluep).order_by_expr_list_t));
     }
 }
-#line 2673 "parser.cpp"
+#line 2675 "parser.cpp"
         break;
 
     case YYSYMBOL_order_by_expr_list: /* order_by_expr_list  */
@@ -2683,7 +2685,7 @@ yydestruct (const char *yymsg,
         delete (((*yyvaluep).order_by_expr_list_t));
     }
 }
-#line 2687 "parser.cpp"
+#line 2689 "parser.cpp"
         break;
 
     case YYSYMBOL_order_by_expr: /* order_by_expr  */
@@ -2693,7 +2695,7 @@ yydestruct (const char *yymsg,
     delete ((*yyvaluep).order_by_expr_t)->expr_;
     delete ((*yyvaluep).order_by_expr_t);
 }
-#line 2697 "parser.cpp"
+#line 2699 "parser.cpp"
         break;
 
     case YYSYMBOL_limit_expr: /* limit_expr  */
@@ -2701,7 +2703,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).expr_t));
 }
-#line 2705 "parser.cpp"
+#line 2707 "parser.cpp"
         break;
 
     case YYSYMBOL_offset_expr: /* offset_expr  */
@@ -2709,7 +2711,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).expr_t));
 }
-#line 2713 "parser.cpp"
+#line 2715 "parser.cpp"
         break;
 
     case YYSYMBOL_highlight_clause: /* highlight_clause  */
@@ -2723,7 +2725,7 @@ yydestruct (const char *yymsg,
         delete (((*yyvaluep).expr_array_t));
     }
 }
-#line 2727 "parser.cpp"
+#line 2729 "parser.cpp"
         break;
 
     case YYSYMBOL_from_clause: /* from_clause  */
@@ -2732,7 +2734,7 @@ yydestruct (const char *yymsg,
     fprintf(stderr, "destroy table reference\n");
     delete (((*yyvaluep).table_reference_t));
 }
-#line 2736 "parser.cpp"
+#line 2738 "parser.cpp"
         break;
 
     case YYSYMBOL_search_clause: /* search_clause  */
@@ -2740,7 +2742,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).expr_t));
 }
-#line 2744 "parser.cpp"
+#line 2746 "parser.cpp"
         break;
 
     case YYSYMBOL_optional_search_filter_expr: /* optional_search_filter_expr  */
@@ -2748,7 +2750,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).expr_t));
 }
-#line 2752 "parser.cpp"
+#line 2754 "parser.cpp"
         break;
 
     case YYSYMBOL_where_clause: /* where_clause  */
@@ -2756,7 +2758,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).expr_t));
 }
-#line 2760 "parser.cpp"
+#line 2762 "parser.cpp"
         break;
 
     case YYSYMBOL_having_clause: /* having_clause  */
@@ -2764,7 +2766,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).expr_t));
 }
-#line 2768 "parser.cpp"
+#line 2770 "parser.cpp"
         break;
 
     case YYSYMBOL_group_by_clause: /* group_by_clause  */
@@ -2778,7 +2780,7 @@ yydestruct (const char *yymsg,
         delete (((*yyvaluep).expr_array_t));
     }
 }
-#line 2782 "parser.cpp"
+#line 2784 "parser.cpp"
         break;
 
     case YYSYMBOL_table_reference: /* table_reference  */
@@ -2787,7 +2789,7 @@ yydestruct (const char *yymsg,
     fprintf(stderr, "destroy table reference\n");
     delete (((*yyvaluep).table_reference_t));
 }
-#line 2791 "parser.cpp"
+#line 2793 "parser.cpp"
         break;
 
     case YYSYMBOL_table_reference_unit: /* table_reference_unit  */
@@ -2796,7 +2798,7 @@ yydestruct (const char *yymsg,
     fprintf(stderr, "destroy table reference\n");
     delete (((*yyvaluep).table_reference_t));
 }
-#line 2800 "parser.cpp"
+#line 2802 "parser.cpp"
         break;
 
     case YYSYMBOL_table_reference_name: /* table_reference_name  */
@@ -2805,7 +2807,7 @@ yydestruct (const char *yymsg,
     fprintf(stderr, "destroy table reference\n");
     delete (((*yyvaluep).table_reference_t));
 }
-#line 2809 "parser.cpp"
+#line 2811 "parser.cpp"
         break;
 
     case YYSYMBOL_table_name: /* table_name  */
@@ -2818,7 +2820,7 @@ yydestruct (const char *yymsg,
         delete (((*yyvaluep).table_name_t));
     }
 }
-#line 2822 "parser.cpp"
+#line 2824 "parser.cpp"
         break;
 
     case YYSYMBOL_table_alias: /* table_alias  */
@@ -2827,7 +2829,7 @@ yydestruct (const char *yymsg,
     fprintf(stderr, "destroy table alias\n");
     delete (((*yyvaluep).table_alias_t));
 }
-#line 2831 "parser.cpp"
+#line 2833 "parser.cpp"
         break;
 
     case YYSYMBOL_with_clause: /* with_clause  */
@@ -2841,7 +2843,7 @@ yydestruct (const char *yymsg,
         delete (((*yyvaluep).with_expr_list_t));
     }
 }
-#line 2845 "parser.cpp"
+#line 2847 "parser.cpp"
         break;
 
     case YYSYMBOL_with_expr_list: /* with_expr_list  */
@@ -2855,7 +2857,7 @@ yydestruct (const char *yymsg,
         delete (((*yyvaluep).with_expr_list_t));
     }
 }
-#line 2859 "parser.cpp"
+#line 2861 "parser.cpp"
         break;
 
     case YYSYMBOL_with_expr: /* with_expr  */
@@ -2865,7 +2867,7 @@ yydestruct (const char *yymsg,
     delete ((*yyvaluep).with_expr_t)->select_;
     delete ((*yyvaluep).with_expr_t);
 }
-#line 2869 "parser.cpp"
+#line 2871 "parser.cpp"
         break;
 
     case YYSYMBOL_join_clause: /* join_clause  */
@@ -2874,7 +2876,7 @@ yydestruct (const char *yymsg,
     fprintf(stderr, "destroy table reference\n");
     delete (((*yyvaluep).table_reference_t));
 }
-#line 2878 "parser.cpp"
+#line 2880 "parser.cpp"
         break;
 
     case YYSYMBOL_expr_array: /* expr_array  */
@@ -2888,7 +2890,7 @@ yydestruct (const char *yymsg,
         delete (((*yyvaluep).expr_array_t));
     }
 }
-#line 2892 "parser.cpp"
+#line 2894 "parser.cpp"
         break;
 
     case YYSYMBOL_insert_row_list: /* insert_row_list  */
@@ -2902,7 +2904,7 @@ yydestruct (const char *yymsg,
         delete (((*yyvaluep).insert_row_list_t));
     }
 }
-#line 2906 "parser.cpp"
+#line 2908 "parser.cpp"
         break;
 
     case YYSYMBOL_expr_alias: /* expr_alias  */
@@ -2910,7 +2912,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).expr_t));
 }
-#line 2914 "parser.cpp"
+#line 2916 "parser.cpp"
         break;
 
     case YYSYMBOL_expr: /* expr  */
@@ -2918,7 +2920,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).expr_t));
 }
-#line 2922 "parser.cpp"
+#line 2924 "parser.cpp"
         break;
 
     case YYSYMBOL_operand: /* operand  */
@@ -2926,7 +2928,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).expr_t));
 }
-#line 2930 "parser.cpp"
+#line 2932 "parser.cpp"
         break;
 
     case YYSYMBOL_match_tensor_expr: /* match_tensor_expr  */
@@ -2934,7 +2936,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).expr_t));
 }
-#line 2938 "parser.cpp"
+#line 2940 "parser.cpp"
         break;
 
     case YYSYMBOL_match_vector_expr: /* match_vector_expr  */
@@ -2942,7 +2944,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).expr_t));
 }
-#line 2946 "parser.cpp"
+#line 2948 "parser.cpp"
         break;
 
     case YYSYMBOL_match_sparse_expr: /* match_sparse_expr  */
@@ -2950,7 +2952,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).expr_t));
 }
-#line 2954 "parser.cpp"
+#line 2956 "parser.cpp"
         break;
 
     case YYSYMBOL_match_text_expr: /* match_text_expr  */
@@ -2958,7 +2960,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).expr_t));
 }
-#line 2962 "parser.cpp"
+#line 2964 "parser.cpp"
         break;
 
     case YYSYMBOL_query_expr: /* query_expr  */
@@ -2966,7 +2968,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).expr_t));
 }
-#line 2970 "parser.cpp"
+#line 2972 "parser.cpp"
         break;
 
     case YYSYMBOL_fusion_expr: /* fusion_expr  */
@@ -2974,7 +2976,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).expr_t));
 }
-#line 2978 "parser.cpp"
+#line 2980 "parser.cpp"
         break;
 
     case YYSYMBOL_sub_search: /* sub_search  */
@@ -2982,7 +2984,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).expr_t));
 }
-#line 2986 "parser.cpp"
+#line 2988 "parser.cpp"
         break;
 
     case YYSYMBOL_sub_search_array: /* sub_search_array  */
@@ -2996,7 +2998,7 @@ yydestruct (const char *yymsg,
         delete (((*yyvaluep).expr_array_t));
     }
 }
-#line 3000 "parser.cpp"
+#line 3002 "parser.cpp"
         break;
 
     case YYSYMBOL_function_expr: /* function_expr  */
@@ -3004,7 +3006,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).expr_t));
 }
-#line 3008 "parser.cpp"
+#line 3010 "parser.cpp"
         break;
 
     case YYSYMBOL_conjunction_expr: /* conjunction_expr  */
@@ -3012,7 +3014,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).expr_t));
 }
-#line 3016 "parser.cpp"
+#line 3018 "parser.cpp"
         break;
 
     case YYSYMBOL_between_expr: /* between_expr  */
@@ -3020,7 +3022,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).expr_t));
 }
-#line 3024 "parser.cpp"
+#line 3026 "parser.cpp"
         break;
 
     case YYSYMBOL_in_expr: /* in_expr  */
@@ -3028,7 +3030,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).expr_t));
 }
-#line 3032 "parser.cpp"
+#line 3034 "parser.cpp"
         break;
 
     case YYSYMBOL_case_expr: /* case_expr  */
@@ -3036,7 +3038,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).expr_t));
 }
-#line 3040 "parser.cpp"
+#line 3042 "parser.cpp"
         break;
 
     case YYSYMBOL_case_check_array: /* case_check_array  */
@@ -3049,7 +3051,7 @@ yydestruct (const char *yymsg,
         }
     }
 }
-#line 3053 "parser.cpp"
+#line 3055 "parser.cpp"
         break;
 
     case YYSYMBOL_cast_expr: /* cast_expr  */
@@ -3057,7 +3059,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).expr_t));
 }
-#line 3061 "parser.cpp"
+#line 3063 "parser.cpp"
         break;
 
     case YYSYMBOL_subquery_expr: /* subquery_expr  */
@@ -3065,7 +3067,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).expr_t));
 }
-#line 3069 "parser.cpp"
+#line 3071 "parser.cpp"
         break;
 
     case YYSYMBOL_column_expr: /* column_expr  */
@@ -3073,7 +3075,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).expr_t));
 }
-#line 3077 "parser.cpp"
+#line 3079 "parser.cpp"
         break;
 
     case YYSYMBOL_constant_expr: /* constant_expr  */
@@ -3081,7 +3083,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).const_expr_t));
 }
-#line 3085 "parser.cpp"
+#line 3087 "parser.cpp"
         break;
 
     case YYSYMBOL_common_array_expr: /* common_array_expr  */
@@ -3089,7 +3091,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).const_expr_t));
 }
-#line 3093 "parser.cpp"
+#line 3095 "parser.cpp"
         break;
 
     case YYSYMBOL_common_sparse_array_expr: /* common_sparse_array_expr  */
@@ -3097,7 +3099,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).const_expr_t));
 }
-#line 3101 "parser.cpp"
+#line 3103 "parser.cpp"
         break;
 
     case YYSYMBOL_subarray_array_expr: /* subarray_array_expr  */
@@ -3105,7 +3107,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).const_expr_t));
 }
-#line 3109 "parser.cpp"
+#line 3111 "parser.cpp"
         break;
 
     case YYSYMBOL_unclosed_subarray_array_expr: /* unclosed_subarray_array_expr  */
@@ -3113,7 +3115,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).const_expr_t));
 }
-#line 3117 "parser.cpp"
+#line 3119 "parser.cpp"
         break;
 
     case YYSYMBOL_sparse_array_expr: /* sparse_array_expr  */
@@ -3121,7 +3123,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).const_expr_t));
 }
-#line 3125 "parser.cpp"
+#line 3127 "parser.cpp"
         break;
 
     case YYSYMBOL_long_sparse_array_expr: /* long_sparse_array_expr  */
@@ -3129,7 +3131,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).const_expr_t));
 }
-#line 3133 "parser.cpp"
+#line 3135 "parser.cpp"
         break;
 
     case YYSYMBOL_unclosed_long_sparse_array_expr: /* unclosed_long_sparse_array_expr  */
@@ -3137,7 +3139,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).const_expr_t));
 }
-#line 3141 "parser.cpp"
+#line 3143 "parser.cpp"
         break;
 
     case YYSYMBOL_double_sparse_array_expr: /* double_sparse_array_expr  */
@@ -3145,7 +3147,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).const_expr_t));
 }
-#line 3149 "parser.cpp"
+#line 3151 "parser.cpp"
         break;
 
     case YYSYMBOL_unclosed_double_sparse_array_expr: /* unclosed_double_sparse_array_expr  */
@@ -3153,7 +3155,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).const_expr_t));
 }
-#line 3157 "parser.cpp"
+#line 3159 "parser.cpp"
         break;
 
     case YYSYMBOL_empty_array_expr: /* empty_array_expr  */
@@ -3161,7 +3163,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).const_expr_t));
 }
-#line 3165 "parser.cpp"
+#line 3167 "parser.cpp"
         break;
 
     case YYSYMBOL_curly_brackets_expr: /* curly_brackets_expr  */
@@ -3169,7 +3171,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).const_expr_t));
 }
-#line 3173 "parser.cpp"
+#line 3175 "parser.cpp"
         break;
 
     case YYSYMBOL_unclosed_curly_brackets_expr: /* unclosed_curly_brackets_expr  */
@@ -3177,7 +3179,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).const_expr_t));
 }
-#line 3181 "parser.cpp"
+#line 3183 "parser.cpp"
         break;
 
     case YYSYMBOL_int_sparse_ele: /* int_sparse_ele  */
@@ -3185,7 +3187,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).int_sparse_ele_t));
 }
-#line 3189 "parser.cpp"
+#line 3191 "parser.cpp"
         break;
 
     case YYSYMBOL_float_sparse_ele: /* float_sparse_ele  */
@@ -3193,7 +3195,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).float_sparse_ele_t));
 }
-#line 3197 "parser.cpp"
+#line 3199 "parser.cpp"
         break;
 
     case YYSYMBOL_array_expr: /* array_expr  */
@@ -3201,7 +3203,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).const_expr_t));
 }
-#line 3205 "parser.cpp"
+#line 3207 "parser.cpp"
         break;
 
     case YYSYMBOL_long_array_expr: /* long_array_expr  */
@@ -3209,7 +3211,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).const_expr_t));
 }
-#line 3213 "parser.cpp"
+#line 3215 "parser.cpp"
         break;
 
     case YYSYMBOL_unclosed_long_array_expr: /* unclosed_long_array_expr  */
@@ -3217,7 +3219,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).const_expr_t));
 }
-#line 3221 "parser.cpp"
+#line 3223 "parser.cpp"
         break;
 
     case YYSYMBOL_double_array_expr: /* double_array_expr  */
@@ -3225,7 +3227,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).const_expr_t));
 }
-#line 3229 "parser.cpp"
+#line 3231 "parser.cpp"
         break;
 
     case YYSYMBOL_unclosed_double_array_expr: /* unclosed_double_array_expr  */
@@ -3233,7 +3235,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).const_expr_t));
 }
-#line 3237 "parser.cpp"
+#line 3239 "parser.cpp"
         break;
 
     case YYSYMBOL_interval_expr: /* interval_expr  */
@@ -3241,7 +3243,7 @@ yydestruct (const char *yymsg,
             {
     delete (((*yyvaluep).const_expr_t));
 }
-#line 3245 "parser.cpp"
+#line 3247 "parser.cpp"
         break;
 
     case YYSYMBOL_file_path: /* file_path  */
@@ -3249,7 +3251,7 @@ yydestruct (const char *yymsg,
             {
     free(((*yyvaluep).str_value));
 }
-#line 3253 "parser.cpp"
+#line 3255 "parser.cpp"
         break;
 
     case YYSYMBOL_if_not_exists_info: /* if_not_exists_info  */
@@ -3260,7 +3262,7 @@ yydestruct (const char *yymsg,
         delete (((*yyvaluep).if_not_exists_info_t));
     }
 }
-#line 3264 "parser.cpp"
+#line 3266 "parser.cpp"
         break;
 
     case YYSYMBOL_with_index_param_list: /* with_index_param_list  */
@@ -3274,7 +3276,7 @@ yydestruct (const char *yymsg,
         delete (((*yyvaluep).with_index_param_list_t));
     }
 }
-#line 3278 "parser.cpp"
+#line 3280 "parser.cpp"
         break;
 
     case YYSYMBOL_optional_table_properties_list: /* optional_table_properties_list  */
@@ -3288,7 +3290,7 @@ yydestruct (const char *yymsg,
         delete (((*yyvaluep).with_index_param_list_t));
     }
 }
-#line 3292 "parser.cpp"
+#line 3294 "parser.cpp"
         break;
 
     case YYSYMBOL_index_info: /* index_info  */
@@ -3299,7 +3301,7 @@ yydestruct (const char *yymsg,
         delete (((*yyvaluep).index_info_t));
     }
 }
-#line 3303 "parser.cpp"
+#line 3305 "parser.cpp"
         break;
 
       default:
@@ -3407,7 +3409,7 @@ YYLTYPE yylloc = yyloc_default;
   yylloc.string_length = 0;
 }
 
-#line 3411 "parser.cpp"
+#line 3413 "parser.cpp"
 
   yylsp[0] = yylloc;
   goto yysetstate;
@@ -3622,7 +3624,7 @@ yyreduce:
                                          {
     result->statements_ptr_ = (yyvsp[-1].stmt_array);
 }
-#line 3626 "parser.cpp"
+#line 3628 "parser.cpp"
     break;
 
   case 3: /* statement_list: statement  */
@@ -3633,7 +3635,7 @@ yyreduce:
     (yyval.stmt_array) = new std::vector<infinity::BaseStatement*>();
     (yyval.stmt_array)->push_back((yyvsp[0].base_stmt));
 }
-#line 3637 "parser.cpp"
+#line 3639 "parser.cpp"
     break;
 
   case 4: /* statement_list: statement_list ';' statement  */
@@ -3644,169 +3646,169 @@ yyreduce:
     (yyvsp[-2].stmt_array)->push_back((yyvsp[0].base_stmt));
     (yyval.stmt_array) = (yyvsp[-2].stmt_array);
 }
-#line 3648 "parser.cpp"
+#line 3650 "parser.cpp"
     break;
 
   case 5: /* statement: create_statement  */
 #line 534 "parser.y"
                              { (yyval.base_stmt) = (yyvsp[0].create_stmt); }
-#line 3654 "parser.cpp"
+#line 3656 "parser.cpp"
     break;
 
   case 6: /* statement: drop_statement  */
 #line 535 "parser.y"
                  { (yyval.base_stmt) = (yyvsp[0].drop_stmt); }
-#line 3660 "parser.cpp"
+#line 3662 "parser.cpp"
     break;
 
   case 7: /* statement: copy_statement  */
 #line 536 "parser.y"
                  { (yyval.base_stmt) = (yyvsp[0].copy_stmt); }
-#line 3666 "parser.cpp"
+#line 3668 "parser.cpp"
     break;
 
   case 8: /* statement: show_statement  */
 #line 537 "parser.y"
                  { (yyval.base_stmt) = (yyvsp[0].show_stmt); }
-#line 3672 "parser.cpp"
+#line 3674 "parser.cpp"
     break;
 
   case 9: /* statement: select_statement  */
 #line 538 "parser.y"
                    { (yyval.base_stmt) = (yyvsp[0].select_stmt); }
-#line 3678 "parser.cpp"
+#line 3680 "parser.cpp"
     break;
 
   case 10: /* statement: delete_statement  */
 #line 539 "parser.y"
                    { (yyval.base_stmt) = (yyvsp[0].delete_stmt); }
-#line 3684 "parser.cpp"
+#line 3686 "parser.cpp"
     break;
 
   case 11: /* statement: update_statement  */
 #line 540 "parser.y"
                    { (yyval.base_stmt) = (yyvsp[0].update_stmt); }
-#line 3690 "parser.cpp"
+#line 3692 "parser.cpp"
     break;
 
   case 12: /* statement: insert_statement  */
 #line 541 "parser.y"
                    { (yyval.base_stmt) = (yyvsp[0].insert_stmt); }
-#line 3696 "parser.cpp"
+#line 3698 "parser.cpp"
     break;
 
   case 13: /* statement: explain_statement  */
 #line 542 "parser.y"
                     { (yyval.base_stmt) = (yyvsp[0].explain_stmt); }
-#line 3702 "parser.cpp"
+#line 3704 "parser.cpp"
     break;
 
   case 14: /* statement: flush_statement  */
 #line 543 "parser.y"
                   { (yyval.base_stmt) = (yyvsp[0].flush_stmt); }
-#line 3708 "parser.cpp"
+#line 3710 "parser.cpp"
     break;
 
   case 15: /* statement: optimize_statement  */
 #line 544 "parser.y"
                      { (yyval.base_stmt) = (yyvsp[0].optimize_stmt); }
-#line 3714 "parser.cpp"
+#line 3716 "parser.cpp"
     break;
 
   case 16: /* statement: command_statement  */
 #line 545 "parser.y"
                     { (yyval.base_stmt) = (yyvsp[0].command_stmt); }
-#line 3720 "parser.cpp"
+#line 3722 "parser.cpp"
     break;
 
   case 17: /* statement: compact_statement  */
 #line 546 "parser.y"
                     { (yyval.base_stmt) = (yyvsp[0].compact_stmt); }
-#line 3726 "parser.cpp"
+#line 3728 "parser.cpp"
     break;
 
   case 18: /* statement: admin_statement  */
 #line 547 "parser.y"
                   { (yyval.base_stmt) = (yyvsp[0].admin_stmt); }
-#line 3732 "parser.cpp"
+#line 3734 "parser.cpp"
     break;
 
   case 19: /* statement: alter_statement  */
 #line 548 "parser.y"
                   { (yyval.base_stmt) = (yyvsp[0].alter_stmt); }
-#line 3738 "parser.cpp"
+#line 3740 "parser.cpp"
     break;
 
   case 20: /* explainable_statement: create_statement  */
 #line 550 "parser.y"
                                          { (yyval.base_stmt) = (yyvsp[0].create_stmt); }
-#line 3744 "parser.cpp"
+#line 3746 "parser.cpp"
     break;
 
   case 21: /* explainable_statement: drop_statement  */
 #line 551 "parser.y"
                  { (yyval.base_stmt) = (yyvsp[0].drop_stmt); }
-#line 3750 "parser.cpp"
+#line 3752 "parser.cpp"
     break;
 
   case 22: /* explainable_statement: copy_statement  */
 #line 552 "parser.y"
                  { (yyval.base_stmt) = (yyvsp[0].copy_stmt); }
-#line 3756 "parser.cpp"
+#line 3758 "parser.cpp"
     break;
 
   case 23: /* explainable_statement: show_statement  */
 #line 553 "parser.y"
                  { (yyval.base_stmt) = (yyvsp[0].show_stmt); }
-#line 3762 "parser.cpp"
+#line 3764 "parser.cpp"
     break;
 
   case 24: /* explainable_statement: select_statement  */
 #line 554 "parser.y"
                    { (yyval.base_stmt) = (yyvsp[0].select_stmt); }
-#line 3768 "parser.cpp"
+#line 3770 "parser.cpp"
     break;
 
   case 25: /* explainable_statement: delete_statement  */
 #line 555 "parser.y"
                    { (yyval.base_stmt) = (yyvsp[0].delete_stmt); }
-#line 3774 "parser.cpp"
+#line 3776 "parser.cpp"
     break;
 
   case 26: /* explainable_statement: update_statement  */
 #line 556 "parser.y"
                    { (yyval.base_stmt) = (yyvsp[0].update_stmt); }
-#line 3780 "parser.cpp"
+#line 3782 "parser.cpp"
     break;
 
   case 27: /* explainable_statement: insert_statement  */
 #line 557 "parser.y"
                    { (yyval.base_stmt) = (yyvsp[0].insert_stmt); }
-#line 3786 "parser.cpp"
+#line 3788 "parser.cpp"
     break;
 
   case 28: /* explainable_statement: flush_statement  */
 #line 558 "parser.y"
                   { (yyval.base_stmt) = (yyvsp[0].flush_stmt); }
-#line 3792 "parser.cpp"
+#line 3794 "parser.cpp"
     break;
 
   case 29: /* explainable_statement: optimize_statement  */
 #line 559 "parser.y"
                      { (yyval.base_stmt) = (yyvsp[0].optimize_stmt); }
-#line 3798 "parser.cpp"
+#line 3800 "parser.cpp"
     break;
 
   case 30: /* explainable_statement: command_statement  */
 #line 560 "parser.y"
                     { (yyval.base_stmt) = (yyvsp[0].command_stmt); }
-#line 3804 "parser.cpp"
+#line 3806 "parser.cpp"
     break;
 
   case 31: /* explainable_statement: compact_statement  */
 #line 561 "parser.y"
                     { (yyval.base_stmt) = (yyvsp[0].compact_stmt); }
-#line 3810 "parser.cpp"
+#line 3812 "parser.cpp"
     break;
 
   case 32: /* create_statement: CREATE DATABASE if_not_exists IDENTIFIER COMMENT STRING  */
@@ -3828,7 +3830,7 @@ yyreduce:
     (yyval.create_stmt)->create_info_->comment_ = (yyvsp[0].str_value);
     free((yyvsp[0].str_value));
 }
-#line 3832 "parser.cpp"
+#line 3834 "parser.cpp"
     break;
 
   case 33: /* create_statement: CREATE DATABASE if_not_exists IDENTIFIER  */
@@ -3848,7 +3850,7 @@ yyreduce:
     (yyval.create_stmt)->create_info_ = create_schema_info;
     (yyval.create_stmt)->create_info_->conflict_type_ = (yyvsp[-1].bool_value) ? infinity::ConflictType::kIgnore : infinity::ConflictType::kError;
 }
-#line 3852 "parser.cpp"
+#line 3854 "parser.cpp"
     break;
 
   case 34: /* create_statement: CREATE COLLECTION if_not_exists table_name  */
@@ -3866,7 +3868,7 @@ yyreduce:
     (yyval.create_stmt)->create_info_->conflict_type_ = (yyvsp[-1].bool_value) ? infinity::ConflictType::kIgnore : infinity::ConflictType::kError;
     delete (yyvsp[0].table_name_t);
 }
-#line 3870 "parser.cpp"
+#line 3872 "parser.cpp"
     break;
 
   case 35: /* create_statement: CREATE TABLE if_not_exists table_name '(' table_element_array ')' optional_table_properties_list  */
@@ -3899,7 +3901,7 @@ yyreduce:
     (yyval.create_stmt)->create_info_ = create_table_info;
     (yyval.create_stmt)->create_info_->conflict_type_ = (yyvsp[-5].bool_value) ? infinity::ConflictType::kIgnore : infinity::ConflictType::kError;
 }
-#line 3903 "parser.cpp"
+#line 3905 "parser.cpp"
     break;
 
   case 36: /* create_statement: CREATE TABLE if_not_exists table_name AS select_statement  */
@@ -3919,7 +3921,7 @@ yyreduce:
     create_table_info->select_ = (yyvsp[0].select_stmt);
     (yyval.create_stmt)->create_info_ = create_table_info;
 }
-#line 3923 "parser.cpp"
+#line 3925 "parser.cpp"
     break;
 
   case 37: /* create_statement: CREATE TABLE if_not_exists table_name '(' table_element_array ')' optional_table_properties_list COMMENT STRING  */
@@ -3955,7 +3957,7 @@ yyreduce:
     (yyval.create_stmt)->create_info_ = create_table_info;
     (yyval.create_stmt)->create_info_->conflict_type_ = (yyvsp[-7].bool_value) ? infinity::ConflictType::kIgnore : infinity::ConflictType::kError;
 }
-#line 3959 "parser.cpp"
+#line 3961 "parser.cpp"
     break;
 
   case 38: /* create_statement: CREATE TABLE if_not_exists table_name AS select_statement COMMENT STRING  */
@@ -3977,7 +3979,7 @@ yyreduce:
     free((yyvsp[0].str_value));
     (yyval.create_stmt)->create_info_ = create_table_info;
 }
-#line 3981 "parser.cpp"
+#line 3983 "parser.cpp"
     break;
 
   case 39: /* create_statement: CREATE VIEW if_not_exists table_name optional_identifier_array AS select_statement  */
@@ -3998,7 +4000,7 @@ yyreduce:
     create_view_info->conflict_type_ = (yyvsp[-4].bool_value) ? infinity::ConflictType::kIgnore : infinity::ConflictType::kError;
     (yyval.create_stmt)->create_info_ = create_view_info;
 }
-#line 4002 "parser.cpp"
+#line 4004 "parser.cpp"
     break;
 
   case 40: /* create_statement: CREATE INDEX if_not_exists_info ON table_name index_info  */
@@ -4031,7 +4033,7 @@ yyreduce:
     (yyval.create_stmt) = new infinity::CreateStatement();
     (yyval.create_stmt)->create_info_ = create_index_info;
 }
-#line 4035 "parser.cpp"
+#line 4037 "parser.cpp"
     break;
 
   case 41: /* create_statement: CREATE INDEX if_not_exists_info ON table_name index_info COMMENT STRING  */
@@ -4066,7 +4068,7 @@ yyreduce:
     (yyval.create_stmt) = new infinity::CreateStatement();
     (yyval.create_stmt)->create_info_ = create_index_info;
 }
-#line 4070 "parser.cpp"
+#line 4072 "parser.cpp"
     break;
 
   case 42: /* table_element_array: table_element  */
@@ -4075,7 +4077,7 @@ yyreduce:
     (yyval.table_element_array_t) = new std::vector<infinity::TableElement*>();
     (yyval.table_element_array_t)->push_back((yyvsp[0].table_element_t));
 }
-#line 4079 "parser.cpp"
+#line 4081 "parser.cpp"
     break;
 
   case 43: /* table_element_array: table_element_array ',' table_element  */
@@ -4084,7 +4086,7 @@ yyreduce:
     (yyvsp[-2].table_element_array_t)->push_back((yyvsp[0].table_element_t));
     (yyval.table_element_array_t) = (yyvsp[-2].table_element_array_t);
 }
-#line 4088 "parser.cpp"
+#line 4090 "parser.cpp"
     break;
 
   case 44: /* column_def_array: table_column  */
@@ -4093,7 +4095,7 @@ yyreduce:
     (yyval.column_def_array_t) = new std::vector<infinity::ColumnDef*>();
     (yyval.column_def_array_t)->push_back((yyvsp[0].table_column_t));
 }
-#line 4097 "parser.cpp"
+#line 4099 "parser.cpp"
     break;
 
   case 45: /* column_def_array: column_def_array ',' table_column  */
@@ -4102,7 +4104,7 @@ yyreduce:
     (yyvsp[-2].column_def_array_t)->push_back((yyvsp[0].table_column_t));
     (yyval.column_def_array_t) = (yyvsp[-2].column_def_array_t);
 }
-#line 4106 "parser.cpp"
+#line 4108 "parser.cpp"
     break;
 
   case 46: /* table_element: table_column  */
@@ -4110,7 +4112,7 @@ yyreduce:
                              {
     (yyval.table_element_t) = (yyvsp[0].table_column_t);
 }
-#line 4114 "parser.cpp"
+#line 4116 "parser.cpp"
     break;
 
   case 47: /* table_element: table_constraint  */
@@ -4118,7 +4120,7 @@ yyreduce:
                    {
     (yyval.table_element_t) = (yyvsp[0].table_constraint_t);
 }
-#line 4122 "parser.cpp"
+#line 4124 "parser.cpp"
     break;
 
   case 48: /* table_column: IDENTIFIER column_type with_index_param_list default_expr  */
@@ -4143,7 +4145,7 @@ yyreduce:
     }
     */
 }
-#line 4147 "parser.cpp"
+#line 4149 "parser.cpp"
     break;
 
   case 49: /* table_column: IDENTIFIER column_type column_constraints default_expr  */
@@ -4170,7 +4172,7 @@ yyreduce:
     }
     */
 }
-#line 4174 "parser.cpp"
+#line 4176 "parser.cpp"
     break;
 
   case 50: /* table_column: IDENTIFIER column_type with_index_param_list default_expr COMMENT STRING  */
@@ -4199,7 +4201,7 @@ yyreduce:
     }
     */
 }
-#line 4203 "parser.cpp"
+#line 4205 "parser.cpp"
     break;
 
   case 51: /* table_column: IDENTIFIER column_type column_constraints default_expr COMMENT STRING  */
@@ -4229,7 +4231,7 @@ yyreduce:
     }
     */
 }
-#line 4233 "parser.cpp"
+#line 4235 "parser.cpp"
     break;
 
   case 52: /* column_type_array: column_type  */
@@ -4238,7 +4240,7 @@ yyreduce:
     (yyval.column_type_array_t) = new std::vector<std::unique_ptr<infinity::ColumnType>>();
     (yyval.column_type_array_t)->emplace_back((yyvsp[0].column_type_t));
 }
-#line 4242 "parser.cpp"
+#line 4244 "parser.cpp"
     break;
 
   case 53: /* column_type_array: column_type_array ',' column_type  */
@@ -4247,559 +4249,559 @@ yyreduce:
     (yyval.column_type_array_t) = (yyvsp[-2].column_type_array_t);
     (yyval.column_type_array_t)->emplace_back((yyvsp[0].column_type_t));
 }
-#line 4251 "parser.cpp"
+#line 4253 "parser.cpp"
     break;
 
   case 54: /* column_type: BOOLEAN  */
 #line 920 "parser.y"
         { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kBoolean, 0, 0, 0, infinity::EmbeddingDataType::kElemInvalid}; }
-#line 4257 "parser.cpp"
+#line 4259 "parser.cpp"
     break;
 
   case 55: /* column_type: TINYINT  */
 #line 921 "parser.y"
           { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kTinyInt, 0, 0, 0, infinity::EmbeddingDataType::kElemInvalid}; }
-#line 4263 "parser.cpp"
+#line 4265 "parser.cpp"
     break;
 
   case 56: /* column_type: SMALLINT  */
 #line 922 "parser.y"
            { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kSmallInt, 0, 0, 0, infinity::EmbeddingDataType::kElemInvalid}; }
-#line 4269 "parser.cpp"
+#line 4271 "parser.cpp"
     break;
 
   case 57: /* column_type: INTEGER  */
 #line 923 "parser.y"
           { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kInteger, 0, 0, 0, infinity::EmbeddingDataType::kElemInvalid}; }
-#line 4275 "parser.cpp"
+#line 4277 "parser.cpp"
     break;
 
   case 58: /* column_type: INT  */
 #line 924 "parser.y"
       { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kInteger, 0, 0, 0, infinity::EmbeddingDataType::kElemInvalid}; }
-#line 4281 "parser.cpp"
+#line 4283 "parser.cpp"
     break;
 
   case 59: /* column_type: BIGINT  */
 #line 925 "parser.y"
          { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kBigInt, 0, 0, 0, infinity::EmbeddingDataType::kElemInvalid}; }
-#line 4287 "parser.cpp"
+#line 4289 "parser.cpp"
     break;
 
   case 60: /* column_type: HUGEINT  */
 #line 926 "parser.y"
           { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kHugeInt, 0, 0, 0, infinity::EmbeddingDataType::kElemInvalid}; }
-#line 4293 "parser.cpp"
+#line 4295 "parser.cpp"
     break;
 
   case 61: /* column_type: FLOAT  */
 #line 927 "parser.y"
         { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kFloat, 0, 0, 0, infinity::EmbeddingDataType::kElemInvalid}; }
-#line 4299 "parser.cpp"
+#line 4301 "parser.cpp"
     break;
 
   case 62: /* column_type: REAL  */
 #line 928 "parser.y"
         { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kFloat, 0, 0, 0, infinity::EmbeddingDataType::kElemInvalid}; }
-#line 4305 "parser.cpp"
+#line 4307 "parser.cpp"
     break;
 
   case 63: /* column_type: DOUBLE  */
 #line 929 "parser.y"
          { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kDouble, 0, 0, 0, infinity::EmbeddingDataType::kElemInvalid}; }
-#line 4311 "parser.cpp"
+#line 4313 "parser.cpp"
     break;
 
   case 64: /* column_type: FLOAT16  */
 #line 930 "parser.y"
           { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kFloat16, 0, 0, 0, infinity::EmbeddingDataType::kElemInvalid}; }
-#line 4317 "parser.cpp"
+#line 4319 "parser.cpp"
     break;
 
   case 65: /* column_type: BFLOAT16  */
 #line 931 "parser.y"
            { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kBFloat16, 0, 0, 0, infinity::EmbeddingDataType::kElemInvalid}; }
-#line 4323 "parser.cpp"
+#line 4325 "parser.cpp"
     break;
 
   case 66: /* column_type: DATE  */
 #line 932 "parser.y"
        { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kDate, 0, 0, 0, infinity::EmbeddingDataType::kElemInvalid}; }
-#line 4329 "parser.cpp"
+#line 4331 "parser.cpp"
     break;
 
   case 67: /* column_type: TIME  */
 #line 933 "parser.y"
        { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kTime, 0, 0, 0, infinity::EmbeddingDataType::kElemInvalid}; }
-#line 4335 "parser.cpp"
+#line 4337 "parser.cpp"
     break;
 
   case 68: /* column_type: DATETIME  */
 #line 934 "parser.y"
            { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kDateTime, 0, 0, 0, infinity::EmbeddingDataType::kElemInvalid}; }
-#line 4341 "parser.cpp"
+#line 4343 "parser.cpp"
     break;
 
   case 69: /* column_type: TIMESTAMP  */
 #line 935 "parser.y"
             { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kTimestamp, 0, 0, 0, infinity::EmbeddingDataType::kElemInvalid}; }
-#line 4347 "parser.cpp"
+#line 4349 "parser.cpp"
     break;
 
   case 70: /* column_type: UUID  */
 #line 936 "parser.y"
        { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kUuid, 0, 0, 0, infinity::EmbeddingDataType::kElemInvalid}; }
-#line 4353 "parser.cpp"
+#line 4355 "parser.cpp"
     break;
 
   case 71: /* column_type: POINT  */
 #line 937 "parser.y"
         { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kPoint, 0, 0, 0, infinity::EmbeddingDataType::kElemInvalid}; }
-#line 4359 "parser.cpp"
+#line 4361 "parser.cpp"
     break;
 
   case 72: /* column_type: LINE  */
 #line 938 "parser.y"
        { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kLine, 0, 0, 0, infinity::EmbeddingDataType::kElemInvalid}; }
-#line 4365 "parser.cpp"
+#line 4367 "parser.cpp"
     break;
 
   case 73: /* column_type: LSEG  */
 #line 939 "parser.y"
        { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kLineSeg, 0, 0, 0, infinity::EmbeddingDataType::kElemInvalid}; }
-#line 4371 "parser.cpp"
+#line 4373 "parser.cpp"
     break;
 
   case 74: /* column_type: BOX  */
 #line 940 "parser.y"
       { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kBox, 0, 0, 0, infinity::EmbeddingDataType::kElemInvalid}; }
-#line 4377 "parser.cpp"
+#line 4379 "parser.cpp"
     break;
 
   case 75: /* column_type: CIRCLE  */
 #line 943 "parser.y"
          { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kCircle, 0, 0, 0, infinity::EmbeddingDataType::kElemInvalid}; }
-#line 4383 "parser.cpp"
+#line 4385 "parser.cpp"
     break;
 
   case 76: /* column_type: VARCHAR  */
 #line 945 "parser.y"
           { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kVarchar, 0, 0, 0, infinity::EmbeddingDataType::kElemInvalid}; }
-#line 4389 "parser.cpp"
+#line 4391 "parser.cpp"
     break;
 
   case 77: /* column_type: DECIMAL '(' LONG_VALUE ',' LONG_VALUE ')'  */
 #line 946 "parser.y"
                                             { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kDecimal, 0, (yyvsp[-3].long_value), (yyvsp[-1].long_value), infinity::EmbeddingDataType::kElemInvalid}; }
-#line 4395 "parser.cpp"
+#line 4397 "parser.cpp"
     break;
 
   case 78: /* column_type: DECIMAL '(' LONG_VALUE ')'  */
 #line 947 "parser.y"
                              { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kDecimal, 0, (yyvsp[-1].long_value), 0, infinity::EmbeddingDataType::kElemInvalid}; }
-#line 4401 "parser.cpp"
+#line 4403 "parser.cpp"
     break;
 
   case 79: /* column_type: DECIMAL  */
 #line 948 "parser.y"
           { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kDecimal, 0, 0, 0, infinity::EmbeddingDataType::kElemInvalid}; }
-#line 4407 "parser.cpp"
+#line 4409 "parser.cpp"
     break;
 
   case 80: /* column_type: EMBEDDING '(' BIT ',' LONG_VALUE ')'  */
 #line 951 "parser.y"
                                        { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kEmbedding, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemBit}; }
-#line 4413 "parser.cpp"
+#line 4415 "parser.cpp"
     break;
 
   case 81: /* column_type: EMBEDDING '(' TINYINT ',' LONG_VALUE ')'  */
 #line 952 "parser.y"
                                            { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kEmbedding, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemInt8}; }
-#line 4419 "parser.cpp"
+#line 4421 "parser.cpp"
     break;
 
   case 82: /* column_type: EMBEDDING '(' SMALLINT ',' LONG_VALUE ')'  */
 #line 953 "parser.y"
                                             { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kEmbedding, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemInt16}; }
-#line 4425 "parser.cpp"
+#line 4427 "parser.cpp"
     break;
 
   case 83: /* column_type: EMBEDDING '(' INTEGER ',' LONG_VALUE ')'  */
 #line 954 "parser.y"
                                            { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kEmbedding, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemInt32}; }
-#line 4431 "parser.cpp"
+#line 4433 "parser.cpp"
     break;
 
   case 84: /* column_type: EMBEDDING '(' INT ',' LONG_VALUE ')'  */
 #line 955 "parser.y"
                                        { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kEmbedding, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemInt32}; }
-#line 4437 "parser.cpp"
+#line 4439 "parser.cpp"
     break;
 
   case 85: /* column_type: EMBEDDING '(' BIGINT ',' LONG_VALUE ')'  */
 #line 956 "parser.y"
                                           { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kEmbedding, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemInt64}; }
-#line 4443 "parser.cpp"
+#line 4445 "parser.cpp"
     break;
 
   case 86: /* column_type: EMBEDDING '(' FLOAT ',' LONG_VALUE ')'  */
 #line 957 "parser.y"
                                          { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kEmbedding, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemFloat}; }
-#line 4449 "parser.cpp"
+#line 4451 "parser.cpp"
     break;
 
   case 87: /* column_type: EMBEDDING '(' DOUBLE ',' LONG_VALUE ')'  */
 #line 958 "parser.y"
                                           { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kEmbedding, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemDouble}; }
-#line 4455 "parser.cpp"
+#line 4457 "parser.cpp"
     break;
 
   case 88: /* column_type: EMBEDDING '(' FLOAT16 ',' LONG_VALUE ')'  */
 #line 959 "parser.y"
                                            { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kEmbedding, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemFloat16}; }
-#line 4461 "parser.cpp"
+#line 4463 "parser.cpp"
     break;
 
   case 89: /* column_type: EMBEDDING '(' BFLOAT16 ',' LONG_VALUE ')'  */
 #line 960 "parser.y"
                                             { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kEmbedding, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemBFloat16}; }
-#line 4467 "parser.cpp"
+#line 4469 "parser.cpp"
     break;
 
   case 90: /* column_type: EMBEDDING '(' UNSIGNED TINYINT ',' LONG_VALUE ')'  */
 #line 961 "parser.y"
                                                     { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kEmbedding, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemUInt8}; }
-#line 4473 "parser.cpp"
+#line 4475 "parser.cpp"
     break;
 
   case 91: /* column_type: MULTIVECTOR '(' BIT ',' LONG_VALUE ')'  */
 #line 962 "parser.y"
                                          { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kMultiVector, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemBit}; }
-#line 4479 "parser.cpp"
+#line 4481 "parser.cpp"
     break;
 
   case 92: /* column_type: MULTIVECTOR '(' TINYINT ',' LONG_VALUE ')'  */
 #line 963 "parser.y"
                                              { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kMultiVector, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemInt8}; }
-#line 4485 "parser.cpp"
+#line 4487 "parser.cpp"
     break;
 
   case 93: /* column_type: MULTIVECTOR '(' SMALLINT ',' LONG_VALUE ')'  */
 #line 964 "parser.y"
                                               { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kMultiVector, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemInt16}; }
-#line 4491 "parser.cpp"
+#line 4493 "parser.cpp"
     break;
 
   case 94: /* column_type: MULTIVECTOR '(' INTEGER ',' LONG_VALUE ')'  */
 #line 965 "parser.y"
                                              { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kMultiVector, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemInt32}; }
-#line 4497 "parser.cpp"
+#line 4499 "parser.cpp"
     break;
 
   case 95: /* column_type: MULTIVECTOR '(' INT ',' LONG_VALUE ')'  */
 #line 966 "parser.y"
                                          { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kMultiVector, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemInt32}; }
-#line 4503 "parser.cpp"
+#line 4505 "parser.cpp"
     break;
 
   case 96: /* column_type: MULTIVECTOR '(' BIGINT ',' LONG_VALUE ')'  */
 #line 967 "parser.y"
                                             { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kMultiVector, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemInt64}; }
-#line 4509 "parser.cpp"
+#line 4511 "parser.cpp"
     break;
 
   case 97: /* column_type: MULTIVECTOR '(' FLOAT ',' LONG_VALUE ')'  */
 #line 968 "parser.y"
                                            { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kMultiVector, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemFloat}; }
-#line 4515 "parser.cpp"
+#line 4517 "parser.cpp"
     break;
 
   case 98: /* column_type: MULTIVECTOR '(' DOUBLE ',' LONG_VALUE ')'  */
 #line 969 "parser.y"
                                             { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kMultiVector, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemDouble}; }
-#line 4521 "parser.cpp"
+#line 4523 "parser.cpp"
     break;
 
   case 99: /* column_type: MULTIVECTOR '(' FLOAT16 ',' LONG_VALUE ')'  */
 #line 970 "parser.y"
                                              { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kMultiVector, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemFloat16}; }
-#line 4527 "parser.cpp"
+#line 4529 "parser.cpp"
     break;
 
   case 100: /* column_type: MULTIVECTOR '(' BFLOAT16 ',' LONG_VALUE ')'  */
 #line 971 "parser.y"
                                               { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kMultiVector, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemBFloat16}; }
-#line 4533 "parser.cpp"
+#line 4535 "parser.cpp"
     break;
 
   case 101: /* column_type: MULTIVECTOR '(' UNSIGNED TINYINT ',' LONG_VALUE ')'  */
 #line 972 "parser.y"
                                                       { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kMultiVector, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemUInt8}; }
-#line 4539 "parser.cpp"
+#line 4541 "parser.cpp"
     break;
 
   case 102: /* column_type: TENSOR '(' BIT ',' LONG_VALUE ')'  */
 #line 973 "parser.y"
                                     { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kTensor, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemBit}; }
-#line 4545 "parser.cpp"
+#line 4547 "parser.cpp"
     break;
 
   case 103: /* column_type: TENSOR '(' TINYINT ',' LONG_VALUE ')'  */
 #line 974 "parser.y"
                                         { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kTensor, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemInt8}; }
-#line 4551 "parser.cpp"
+#line 4553 "parser.cpp"
     break;
 
   case 104: /* column_type: TENSOR '(' SMALLINT ',' LONG_VALUE ')'  */
 #line 975 "parser.y"
                                          { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kTensor, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemInt16}; }
-#line 4557 "parser.cpp"
+#line 4559 "parser.cpp"
     break;
 
   case 105: /* column_type: TENSOR '(' INTEGER ',' LONG_VALUE ')'  */
 #line 976 "parser.y"
                                         { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kTensor, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemInt32}; }
-#line 4563 "parser.cpp"
+#line 4565 "parser.cpp"
     break;
 
   case 106: /* column_type: TENSOR '(' INT ',' LONG_VALUE ')'  */
 #line 977 "parser.y"
                                     { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kTensor, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemInt32}; }
-#line 4569 "parser.cpp"
+#line 4571 "parser.cpp"
     break;
 
   case 107: /* column_type: TENSOR '(' BIGINT ',' LONG_VALUE ')'  */
 #line 978 "parser.y"
                                        { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kTensor, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemInt64}; }
-#line 4575 "parser.cpp"
+#line 4577 "parser.cpp"
     break;
 
   case 108: /* column_type: TENSOR '(' FLOAT ',' LONG_VALUE ')'  */
 #line 979 "parser.y"
                                       { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kTensor, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemFloat}; }
-#line 4581 "parser.cpp"
+#line 4583 "parser.cpp"
     break;
 
   case 109: /* column_type: TENSOR '(' DOUBLE ',' LONG_VALUE ')'  */
 #line 980 "parser.y"
                                        { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kTensor, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemDouble}; }
-#line 4587 "parser.cpp"
+#line 4589 "parser.cpp"
     break;
 
   case 110: /* column_type: TENSOR '(' FLOAT16 ',' LONG_VALUE ')'  */
 #line 981 "parser.y"
                                         { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kTensor, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemFloat16}; }
-#line 4593 "parser.cpp"
+#line 4595 "parser.cpp"
     break;
 
   case 111: /* column_type: TENSOR '(' BFLOAT16 ',' LONG_VALUE ')'  */
 #line 982 "parser.y"
                                          { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kTensor, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemBFloat16}; }
-#line 4599 "parser.cpp"
+#line 4601 "parser.cpp"
     break;
 
   case 112: /* column_type: TENSOR '(' UNSIGNED TINYINT ',' LONG_VALUE ')'  */
 #line 983 "parser.y"
                                                  { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kTensor, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemUInt8}; }
-#line 4605 "parser.cpp"
+#line 4607 "parser.cpp"
     break;
 
   case 113: /* column_type: TENSORARRAY '(' BIT ',' LONG_VALUE ')'  */
 #line 984 "parser.y"
                                          { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kTensorArray, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemBit}; }
-#line 4611 "parser.cpp"
+#line 4613 "parser.cpp"
     break;
 
   case 114: /* column_type: TENSORARRAY '(' TINYINT ',' LONG_VALUE ')'  */
 #line 985 "parser.y"
                                              { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kTensorArray, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemInt8}; }
-#line 4617 "parser.cpp"
+#line 4619 "parser.cpp"
     break;
 
   case 115: /* column_type: TENSORARRAY '(' SMALLINT ',' LONG_VALUE ')'  */
 #line 986 "parser.y"
                                               { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kTensorArray, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemInt16}; }
-#line 4623 "parser.cpp"
+#line 4625 "parser.cpp"
     break;
 
   case 116: /* column_type: TENSORARRAY '(' INTEGER ',' LONG_VALUE ')'  */
 #line 987 "parser.y"
                                              { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kTensorArray, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemInt32}; }
-#line 4629 "parser.cpp"
+#line 4631 "parser.cpp"
     break;
 
   case 117: /* column_type: TENSORARRAY '(' INT ',' LONG_VALUE ')'  */
 #line 988 "parser.y"
                                          { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kTensorArray, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemInt32}; }
-#line 4635 "parser.cpp"
+#line 4637 "parser.cpp"
     break;
 
   case 118: /* column_type: TENSORARRAY '(' BIGINT ',' LONG_VALUE ')'  */
 #line 989 "parser.y"
                                             { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kTensorArray, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemInt64}; }
-#line 4641 "parser.cpp"
+#line 4643 "parser.cpp"
     break;
 
   case 119: /* column_type: TENSORARRAY '(' FLOAT ',' LONG_VALUE ')'  */
 #line 990 "parser.y"
                                            { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kTensorArray, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemFloat}; }
-#line 4647 "parser.cpp"
+#line 4649 "parser.cpp"
     break;
 
   case 120: /* column_type: TENSORARRAY '(' DOUBLE ',' LONG_VALUE ')'  */
 #line 991 "parser.y"
                                             { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kTensorArray, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemDouble}; }
-#line 4653 "parser.cpp"
+#line 4655 "parser.cpp"
     break;
 
   case 121: /* column_type: TENSORARRAY '(' FLOAT16 ',' LONG_VALUE ')'  */
 #line 992 "parser.y"
                                              { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kTensorArray, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemFloat16}; }
-#line 4659 "parser.cpp"
+#line 4661 "parser.cpp"
     break;
 
   case 122: /* column_type: TENSORARRAY '(' BFLOAT16 ',' LONG_VALUE ')'  */
 #line 993 "parser.y"
                                               { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kTensorArray, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemBFloat16}; }
-#line 4665 "parser.cpp"
+#line 4667 "parser.cpp"
     break;
 
   case 123: /* column_type: TENSORARRAY '(' UNSIGNED TINYINT ',' LONG_VALUE ')'  */
 #line 994 "parser.y"
                                                       { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kTensorArray, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemUInt8}; }
-#line 4671 "parser.cpp"
+#line 4673 "parser.cpp"
     break;
 
   case 124: /* column_type: VECTOR '(' BIT ',' LONG_VALUE ')'  */
 #line 995 "parser.y"
                                     { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kEmbedding, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemBit}; }
-#line 4677 "parser.cpp"
+#line 4679 "parser.cpp"
     break;
 
   case 125: /* column_type: VECTOR '(' TINYINT ',' LONG_VALUE ')'  */
 #line 996 "parser.y"
                                         { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kEmbedding, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemInt8}; }
-#line 4683 "parser.cpp"
+#line 4685 "parser.cpp"
     break;
 
   case 126: /* column_type: VECTOR '(' SMALLINT ',' LONG_VALUE ')'  */
 #line 997 "parser.y"
                                          { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kEmbedding, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemInt16}; }
-#line 4689 "parser.cpp"
+#line 4691 "parser.cpp"
     break;
 
   case 127: /* column_type: VECTOR '(' INTEGER ',' LONG_VALUE ')'  */
 #line 998 "parser.y"
                                         { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kEmbedding, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemInt32}; }
-#line 4695 "parser.cpp"
+#line 4697 "parser.cpp"
     break;
 
   case 128: /* column_type: VECTOR '(' INT ',' LONG_VALUE ')'  */
 #line 999 "parser.y"
                                     { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kEmbedding, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemInt32}; }
-#line 4701 "parser.cpp"
+#line 4703 "parser.cpp"
     break;
 
   case 129: /* column_type: VECTOR '(' BIGINT ',' LONG_VALUE ')'  */
 #line 1000 "parser.y"
                                        { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kEmbedding, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemInt64}; }
-#line 4707 "parser.cpp"
+#line 4709 "parser.cpp"
     break;
 
   case 130: /* column_type: VECTOR '(' FLOAT ',' LONG_VALUE ')'  */
 #line 1001 "parser.y"
                                       { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kEmbedding, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemFloat}; }
-#line 4713 "parser.cpp"
+#line 4715 "parser.cpp"
     break;
 
   case 131: /* column_type: VECTOR '(' DOUBLE ',' LONG_VALUE ')'  */
 #line 1002 "parser.y"
                                        { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kEmbedding, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemDouble}; }
-#line 4719 "parser.cpp"
+#line 4721 "parser.cpp"
     break;
 
   case 132: /* column_type: VECTOR '(' FLOAT16 ',' LONG_VALUE ')'  */
 #line 1003 "parser.y"
                                         { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kEmbedding, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemFloat16}; }
-#line 4725 "parser.cpp"
+#line 4727 "parser.cpp"
     break;
 
   case 133: /* column_type: VECTOR '(' BFLOAT16 ',' LONG_VALUE ')'  */
 #line 1004 "parser.y"
                                          { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kEmbedding, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemBFloat16}; }
-#line 4731 "parser.cpp"
+#line 4733 "parser.cpp"
     break;
 
   case 134: /* column_type: VECTOR '(' UNSIGNED TINYINT ',' LONG_VALUE ')'  */
 #line 1005 "parser.y"
                                                  { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kEmbedding, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemUInt8}; }
-#line 4737 "parser.cpp"
+#line 4739 "parser.cpp"
     break;
 
   case 135: /* column_type: SPARSE '(' BIT ',' LONG_VALUE ')'  */
 #line 1006 "parser.y"
                                     { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kSparse, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemBit}; }
-#line 4743 "parser.cpp"
+#line 4745 "parser.cpp"
     break;
 
   case 136: /* column_type: SPARSE '(' TINYINT ',' LONG_VALUE ')'  */
 #line 1007 "parser.y"
                                         { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kSparse, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemInt8}; }
-#line 4749 "parser.cpp"
+#line 4751 "parser.cpp"
     break;
 
   case 137: /* column_type: SPARSE '(' SMALLINT ',' LONG_VALUE ')'  */
 #line 1008 "parser.y"
                                          { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kSparse, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemInt16}; }
-#line 4755 "parser.cpp"
+#line 4757 "parser.cpp"
     break;
 
   case 138: /* column_type: SPARSE '(' INTEGER ',' LONG_VALUE ')'  */
 #line 1009 "parser.y"
                                         { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kSparse, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemInt32}; }
-#line 4761 "parser.cpp"
+#line 4763 "parser.cpp"
     break;
 
   case 139: /* column_type: SPARSE '(' INT ',' LONG_VALUE ')'  */
 #line 1010 "parser.y"
                                     { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kSparse, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemInt32}; }
-#line 4767 "parser.cpp"
+#line 4769 "parser.cpp"
     break;
 
   case 140: /* column_type: SPARSE '(' BIGINT ',' LONG_VALUE ')'  */
 #line 1011 "parser.y"
                                        { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kSparse, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemInt64}; }
-#line 4773 "parser.cpp"
+#line 4775 "parser.cpp"
     break;
 
   case 141: /* column_type: SPARSE '(' FLOAT ',' LONG_VALUE ')'  */
 #line 1012 "parser.y"
                                       { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kSparse, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemFloat}; }
-#line 4779 "parser.cpp"
+#line 4781 "parser.cpp"
     break;
 
   case 142: /* column_type: SPARSE '(' DOUBLE ',' LONG_VALUE ')'  */
 #line 1013 "parser.y"
                                        { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kSparse, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemDouble}; }
-#line 4785 "parser.cpp"
+#line 4787 "parser.cpp"
     break;
 
   case 143: /* column_type: SPARSE '(' FLOAT16 ',' LONG_VALUE ')'  */
 #line 1014 "parser.y"
                                         { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kSparse, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemFloat16}; }
-#line 4791 "parser.cpp"
+#line 4793 "parser.cpp"
     break;
 
   case 144: /* column_type: SPARSE '(' BFLOAT16 ',' LONG_VALUE ')'  */
 #line 1015 "parser.y"
                                          { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kSparse, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemBFloat16}; }
-#line 4797 "parser.cpp"
+#line 4799 "parser.cpp"
     break;
 
   case 145: /* column_type: SPARSE '(' UNSIGNED TINYINT ',' LONG_VALUE ')'  */
 #line 1016 "parser.y"
                                                  { (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kSparse, (yyvsp[-1].long_value), 0, 0, infinity::EmbeddingDataType::kElemUInt8}; }
-#line 4803 "parser.cpp"
+#line 4805 "parser.cpp"
     break;
 
   case 146: /* column_type: ARRAY '(' column_type ')'  */
@@ -4808,7 +4810,7 @@ yyreduce:
   (yyval.column_type_t) = new infinity::ColumnType{infinity::LogicalType::kArray, 0, 0, 0, infinity::EmbeddingDataType::kElemInvalid};
   (yyval.column_type_t)->element_types_.emplace_back((yyvsp[-1].column_type_t));
 }
-#line 4812 "parser.cpp"
+#line 4814 "parser.cpp"
     break;
 
   case 147: /* column_type: TUPLE '(' column_type_array ')'  */
@@ -4818,7 +4820,7 @@ yyreduce:
   (yyval.column_type_t)->element_types_ = std::move(*((yyvsp[-1].column_type_array_t)));
   delete (yyvsp[-1].column_type_array_t);
 }
-#line 4822 "parser.cpp"
+#line 4824 "parser.cpp"
     break;
 
   case 148: /* column_constraints: column_constraint  */
@@ -4827,7 +4829,7 @@ yyreduce:
     (yyval.column_constraints_t) = new std::set<infinity::ConstraintType>();
     (yyval.column_constraints_t)->insert((yyvsp[0].column_constraint_t));
 }
-#line 4831 "parser.cpp"
+#line 4833 "parser.cpp"
     break;
 
   case 149: /* column_constraints: column_constraints column_constraint  */
@@ -4841,7 +4843,7 @@ yyreduce:
     (yyvsp[-1].column_constraints_t)->insert((yyvsp[0].column_constraint_t));
     (yyval.column_constraints_t) = (yyvsp[-1].column_constraints_t);
 }
-#line 4845 "parser.cpp"
+#line 4847 "parser.cpp"
     break;
 
   case 150: /* column_constraint: PRIMARY KEY  */
@@ -4849,7 +4851,7 @@ yyreduce:
                                 {
     (yyval.column_constraint_t) = infinity::ConstraintType::kPrimaryKey;
 }
-#line 4853 "parser.cpp"
+#line 4855 "parser.cpp"
     break;
 
   case 151: /* column_constraint: UNIQUE  */
@@ -4857,7 +4859,7 @@ yyreduce:
          {
     (yyval.column_constraint_t) = infinity::ConstraintType::kUnique;
 }
-#line 4861 "parser.cpp"
+#line 4863 "parser.cpp"
     break;
 
   case 152: /* column_constraint: NULLABLE  */
@@ -4865,7 +4867,7 @@ yyreduce:
            {
     (yyval.column_constraint_t) = infinity::ConstraintType::kNull;
 }
-#line 4869 "parser.cpp"
+#line 4871 "parser.cpp"
     break;
 
   case 153: /* column_constraint: NOT NULLABLE  */
@@ -4873,7 +4875,7 @@ yyreduce:
                {
     (yyval.column_constraint_t) = infinity::ConstraintType::kNotNull;
 }
-#line 4877 "parser.cpp"
+#line 4879 "parser.cpp"
     break;
 
   case 154: /* default_expr: DEFAULT constant_expr  */
@@ -4881,7 +4883,7 @@ yyreduce:
                                      {
     (yyval.const_expr_t) = (yyvsp[0].const_expr_t);
 }
-#line 4885 "parser.cpp"
+#line 4887 "parser.cpp"
     break;
 
   case 155: /* default_expr: %empty  */
@@ -4889,7 +4891,7 @@ yyreduce:
                             {
     (yyval.const_expr_t) = nullptr;
 }
-#line 4893 "parser.cpp"
+#line 4895 "parser.cpp"
     break;
 
   case 156: /* table_constraint: PRIMARY KEY '(' identifier_array ')'  */
@@ -4899,7 +4901,7 @@ yyreduce:
     (yyval.table_constraint_t)->names_ptr_ = (yyvsp[-1].identifier_array_t);
     (yyval.table_constraint_t)->constraint_ = infinity::ConstraintType::kPrimaryKey;
 }
-#line 4903 "parser.cpp"
+#line 4905 "parser.cpp"
     break;
 
   case 157: /* table_constraint: UNIQUE '(' identifier_array ')'  */
@@ -4909,7 +4911,7 @@ yyreduce:
     (yyval.table_constraint_t)->names_ptr_ = (yyvsp[-1].identifier_array_t);
     (yyval.table_constraint_t)->constraint_ = infinity::ConstraintType::kUnique;
 }
-#line 4913 "parser.cpp"
+#line 4915 "parser.cpp"
     break;
 
   case 158: /* identifier_array: IDENTIFIER  */
@@ -4920,7 +4922,7 @@ yyreduce:
     (yyval.identifier_array_t)->emplace_back((yyvsp[0].str_value));
     free((yyvsp[0].str_value));
 }
-#line 4924 "parser.cpp"
+#line 4926 "parser.cpp"
     break;
 
   case 159: /* identifier_array: identifier_array ',' IDENTIFIER  */
@@ -4931,7 +4933,7 @@ yyreduce:
     free((yyvsp[0].str_value));
     (yyval.identifier_array_t) = (yyvsp[-2].identifier_array_t);
 }
-#line 4935 "parser.cpp"
+#line 4937 "parser.cpp"
     break;
 
   case 160: /* delete_statement: DELETE FROM table_name where_clause  */
@@ -4948,7 +4950,7 @@ yyreduce:
     delete (yyvsp[-1].table_name_t);
     (yyval.delete_stmt)->where_expr_ = (yyvsp[0].expr_t);
 }
-#line 4952 "parser.cpp"
+#line 4954 "parser.cpp"
     break;
 
   case 161: /* insert_statement: INSERT INTO table_name optional_identifier_array VALUES insert_row_list  */
@@ -4991,7 +4993,7 @@ yyreduce:
     delete (yyvsp[-2].identifier_array_t);
     delete (yyvsp[0].insert_row_list_t);
 }
-#line 4995 "parser.cpp"
+#line 4997 "parser.cpp"
     break;
 
   case 162: /* insert_statement: INSERT INTO table_name optional_identifier_array select_without_paren  */
@@ -5011,7 +5013,7 @@ yyreduce:
     }
     (yyval.insert_stmt)->select_.reset((yyvsp[0].select_stmt));
 }
-#line 5015 "parser.cpp"
+#line 5017 "parser.cpp"
     break;
 
   case 163: /* optional_identifier_array: '(' identifier_array ')'  */
@@ -5019,7 +5021,7 @@ yyreduce:
                                                     {
     (yyval.identifier_array_t) = (yyvsp[-1].identifier_array_t);
 }
-#line 5023 "parser.cpp"
+#line 5025 "parser.cpp"
     break;
 
   case 164: /* optional_identifier_array: %empty  */
@@ -5027,7 +5029,7 @@ yyreduce:
   {
     (yyval.identifier_array_t) = nullptr;
 }
-#line 5031 "parser.cpp"
+#line 5033 "parser.cpp"
     break;
 
   case 165: /* explain_statement: EXPLAIN IDENTIFIER explainable_statement  */
@@ -5050,7 +5052,7 @@ yyreduce:
     free((yyvsp[-1].str_value));
     (yyval.explain_stmt)->statement_ = (yyvsp[0].base_stmt);
 }
-#line 5054 "parser.cpp"
+#line 5056 "parser.cpp"
     break;
 
   case 166: /* explain_statement: EXPLAIN explainable_statement  */
@@ -5060,7 +5062,7 @@ yyreduce:
     (yyval.explain_stmt)->type_ =infinity::ExplainType::kPhysical;
     (yyval.explain_stmt)->statement_ = (yyvsp[0].base_stmt);
 }
-#line 5064 "parser.cpp"
+#line 5066 "parser.cpp"
     break;
 
   case 167: /* update_statement: UPDATE table_name SET update_expr_array where_clause  */
@@ -5077,7 +5079,7 @@ yyreduce:
     (yyval.update_stmt)->where_expr_ = (yyvsp[0].expr_t);
     (yyval.update_stmt)->update_expr_array_ = (yyvsp[-1].update_expr_array_t);
 }
-#line 5081 "parser.cpp"
+#line 5083 "parser.cpp"
     break;
 
   case 168: /* update_expr_array: update_expr  */
@@ -5086,7 +5088,7 @@ yyreduce:
     (yyval.update_expr_array_t) = new std::vector<infinity::UpdateExpr*>();
     (yyval.update_expr_array_t)->emplace_back((yyvsp[0].update_expr_t));
 }
-#line 5090 "parser.cpp"
+#line 5092 "parser.cpp"
     break;
 
   case 169: /* update_expr_array: update_expr_array ',' update_expr  */
@@ -5095,7 +5097,7 @@ yyreduce:
     (yyvsp[-2].update_expr_array_t)->emplace_back((yyvsp[0].update_expr_t));
     (yyval.update_expr_array_t) = (yyvsp[-2].update_expr_array_t);
 }
-#line 5099 "parser.cpp"
+#line 5101 "parser.cpp"
     break;
 
   case 170: /* update_expr: IDENTIFIER '=' expr  */
@@ -5107,7 +5109,7 @@ yyreduce:
     free((yyvsp[-2].str_value));
     (yyval.update_expr_t)->value = (yyvsp[0].expr_t);
 }
-#line 5111 "parser.cpp"
+#line 5113 "parser.cpp"
     break;
 
   case 171: /* drop_statement: DROP DATABASE if_exists IDENTIFIER  */
@@ -5123,7 +5125,7 @@ yyreduce:
     (yyval.drop_stmt)->drop_info_ = drop_schema_info;
     (yyval.drop_stmt)->drop_info_->conflict_type_ = (yyvsp[-1].bool_value) ? infinity::ConflictType::kIgnore : infinity::ConflictType::kError;
 }
-#line 5127 "parser.cpp"
+#line 5129 "parser.cpp"
     break;
 
   case 172: /* drop_statement: DROP COLLECTION if_exists table_name  */
@@ -5141,7 +5143,7 @@ yyreduce:
     (yyval.drop_stmt)->drop_info_->conflict_type_ = (yyvsp[-1].bool_value) ? infinity::ConflictType::kIgnore : infinity::ConflictType::kError;
     delete (yyvsp[0].table_name_t);
 }
-#line 5145 "parser.cpp"
+#line 5147 "parser.cpp"
     break;
 
   case 173: /* drop_statement: DROP TABLE if_exists table_name  */
@@ -5159,7 +5161,7 @@ yyreduce:
     (yyval.drop_stmt)->drop_info_->conflict_type_ = (yyvsp[-1].bool_value) ? infinity::ConflictType::kIgnore : infinity::ConflictType::kError;
     delete (yyvsp[0].table_name_t);
 }
-#line 5163 "parser.cpp"
+#line 5165 "parser.cpp"
     break;
 
   case 174: /* drop_statement: DROP VIEW if_exists table_name  */
@@ -5177,7 +5179,7 @@ yyreduce:
     (yyval.drop_stmt)->drop_info_->conflict_type_ = (yyvsp[-1].bool_value) ? infinity::ConflictType::kIgnore : infinity::ConflictType::kError;
     delete (yyvsp[0].table_name_t);
 }
-#line 5181 "parser.cpp"
+#line 5183 "parser.cpp"
     break;
 
   case 175: /* drop_statement: DROP INDEX if_exists IDENTIFIER ON table_name  */
@@ -5200,7 +5202,7 @@ yyreduce:
     free((yyvsp[0].table_name_t)->table_name_ptr_);
     delete (yyvsp[0].table_name_t);
 }
-#line 5204 "parser.cpp"
+#line 5206 "parser.cpp"
     break;
 
   case 176: /* copy_statement: COPY table_name TO file_path WITH '(' copy_option_list ')'  */
@@ -5258,7 +5260,7 @@ yyreduce:
     }
     delete (yyvsp[-1].copy_option_array);
 }
-#line 5262 "parser.cpp"
+#line 5264 "parser.cpp"
     break;
 
   case 177: /* copy_statement: COPY table_name '(' expr_array ')' TO file_path WITH '(' copy_option_list ')'  */
@@ -5318,7 +5320,7 @@ yyreduce:
     }
     delete (yyvsp[-1].copy_option_array);
 }
-#line 5322 "parser.cpp"
+#line 5324 "parser.cpp"
     break;
 
   case 178: /* copy_statement: COPY table_name FROM file_path WITH '(' copy_option_list ')'  */
@@ -5370,7 +5372,7 @@ yyreduce:
     }
     delete (yyvsp[-1].copy_option_array);
 }
-#line 5374 "parser.cpp"
+#line 5376 "parser.cpp"
     break;
 
   case 179: /* select_statement: select_without_paren  */
@@ -5378,7 +5380,7 @@ yyreduce:
                                         {
     (yyval.select_stmt) = (yyvsp[0].select_stmt);
 }
-#line 5382 "parser.cpp"
+#line 5384 "parser.cpp"
     break;
 
   case 180: /* select_statement: select_with_paren  */
@@ -5386,7 +5388,7 @@ yyreduce:
                     {
     (yyval.select_stmt) = (yyvsp[0].select_stmt);
 }
-#line 5390 "parser.cpp"
+#line 5392 "parser.cpp"
     break;
 
   case 181: /* select_statement: select_statement set_operator select_clause_without_modifier_paren  */
@@ -5400,7 +5402,7 @@ yyreduce:
     node->nested_select_ = (yyvsp[0].select_stmt);
     (yyval.select_stmt) = (yyvsp[-2].select_stmt);
 }
-#line 5404 "parser.cpp"
+#line 5406 "parser.cpp"
     break;
 
   case 182: /* select_statement: select_statement set_operator select_clause_without_modifier  */
@@ -5414,7 +5416,7 @@ yyreduce:
     node->nested_select_ = (yyvsp[0].select_stmt);
     (yyval.select_stmt) = (yyvsp[-2].select_stmt);
 }
-#line 5418 "parser.cpp"
+#line 5420 "parser.cpp"
     break;
 
   case 183: /* select_with_paren: '(' select_without_paren ')'  */
@@ -5422,7 +5424,7 @@ yyreduce:
                                                  {
     (yyval.select_stmt) = (yyvsp[-1].select_stmt);
 }
-#line 5426 "parser.cpp"
+#line 5428 "parser.cpp"
     break;
 
   case 184: /* select_with_paren: '(' select_with_paren ')'  */
@@ -5430,7 +5432,7 @@ yyreduce:
                             {
     (yyval.select_stmt) = (yyvsp[-1].select_stmt);
 }
-#line 5434 "parser.cpp"
+#line 5436 "parser.cpp"
     break;
 
   case 185: /* select_without_paren: with_clause select_clause_with_modifier  */
@@ -5439,7 +5441,7 @@ yyreduce:
     (yyvsp[0].select_stmt)->with_exprs_ = (yyvsp[-1].with_expr_list_t);
     (yyval.select_stmt) = (yyvsp[0].select_stmt);
 }
-#line 5443 "parser.cpp"
+#line 5445 "parser.cpp"
     break;
 
   case 186: /* select_clause_with_modifier: select_clause_without_modifier order_by_clause limit_expr offset_expr  */
@@ -5470,7 +5472,7 @@ yyreduce:
     (yyvsp[-3].select_stmt)->offset_expr_ = (yyvsp[0].expr_t);
     (yyval.select_stmt) = (yyvsp[-3].select_stmt);
 }
-#line 5474 "parser.cpp"
+#line 5476 "parser.cpp"
     break;
 
   case 187: /* select_clause_without_modifier_paren: '(' select_clause_without_modifier ')'  */
@@ -5478,7 +5480,7 @@ yyreduce:
                                                                              {
   (yyval.select_stmt) = (yyvsp[-1].select_stmt);
 }
-#line 5482 "parser.cpp"
+#line 5484 "parser.cpp"
     break;
 
   case 188: /* select_clause_without_modifier_paren: '(' select_clause_without_modifier_paren ')'  */
@@ -5486,7 +5488,7 @@ yyreduce:
                                                {
     (yyval.select_stmt) = (yyvsp[-1].select_stmt);
 }
-#line 5490 "parser.cpp"
+#line 5492 "parser.cpp"
     break;
 
   case 189: /* select_clause_without_modifier: SELECT distinct expr_array highlight_clause from_clause search_clause where_clause group_by_clause having_clause  */
@@ -5507,7 +5509,7 @@ yyreduce:
         YYERROR;
     }
 }
-#line 5511 "parser.cpp"
+#line 5513 "parser.cpp"
     break;
 
   case 190: /* order_by_clause: ORDER BY order_by_expr_list  */
@@ -5515,7 +5517,7 @@ yyreduce:
                                               {
     (yyval.order_by_expr_list_t) = (yyvsp[0].order_by_expr_list_t);
 }
-#line 5519 "parser.cpp"
+#line 5521 "parser.cpp"
     break;
 
   case 191: /* order_by_clause: %empty  */
@@ -5523,7 +5525,7 @@ yyreduce:
                        {
     (yyval.order_by_expr_list_t) = nullptr;
 }
-#line 5527 "parser.cpp"
+#line 5529 "parser.cpp"
     break;
 
   case 192: /* order_by_expr_list: order_by_expr  */
@@ -5532,7 +5534,7 @@ yyreduce:
     (yyval.order_by_expr_list_t) = new std::vector<infinity::OrderByExpr*>();
     (yyval.order_by_expr_list_t)->emplace_back((yyvsp[0].order_by_expr_t));
 }
-#line 5536 "parser.cpp"
+#line 5538 "parser.cpp"
     break;
 
   case 193: /* order_by_expr_list: order_by_expr_list ',' order_by_expr  */
@@ -5541,7 +5543,7 @@ yyreduce:
     (yyvsp[-2].order_by_expr_list_t)->emplace_back((yyvsp[0].order_by_expr_t));
     (yyval.order_by_expr_list_t) = (yyvsp[-2].order_by_expr_list_t);
 }
-#line 5545 "parser.cpp"
+#line 5547 "parser.cpp"
     break;
 
   case 194: /* order_by_expr: expr order_by_type  */
@@ -5551,7 +5553,7 @@ yyreduce:
     (yyval.order_by_expr_t)->expr_ = (yyvsp[-1].expr_t);
     (yyval.order_by_expr_t)->type_ = (yyvsp[0].order_by_type_t);
 }
-#line 5555 "parser.cpp"
+#line 5557 "parser.cpp"
     break;
 
   case 195: /* order_by_type: ASC  */
@@ -5559,7 +5561,7 @@ yyreduce:
                    {
     (yyval.order_by_type_t) = infinity::kAsc;
 }
-#line 5563 "parser.cpp"
+#line 5565 "parser.cpp"
     break;
 
   case 196: /* order_by_type: DESC  */
@@ -5567,7 +5569,7 @@ yyreduce:
        {
     (yyval.order_by_type_t) = infinity::kDesc;
 }
-#line 5571 "parser.cpp"
+#line 5573 "parser.cpp"
     break;
 
   case 197: /* order_by_type: %empty  */
@@ -5575,7 +5577,7 @@ yyreduce:
   {
     (yyval.order_by_type_t) = infinity::kAsc;
 }
-#line 5579 "parser.cpp"
+#line 5581 "parser.cpp"
     break;
 
   case 198: /* limit_expr: LIMIT expr  */
@@ -5583,13 +5585,13 @@ yyreduce:
                        {
     (yyval.expr_t) = (yyvsp[0].expr_t);
 }
-#line 5587 "parser.cpp"
+#line 5589 "parser.cpp"
     break;
 
   case 199: /* limit_expr: %empty  */
 #line 1613 "parser.y"
 {   (yyval.expr_t) = nullptr; }
-#line 5593 "parser.cpp"
+#line 5595 "parser.cpp"
     break;
 
   case 200: /* offset_expr: OFFSET expr  */
@@ -5597,13 +5599,13 @@ yyreduce:
                          {
     (yyval.expr_t) = (yyvsp[0].expr_t);
 }
-#line 5601 "parser.cpp"
+#line 5603 "parser.cpp"
     break;
 
   case 201: /* offset_expr: %empty  */
 #line 1619 "parser.y"
 {   (yyval.expr_t) = nullptr; }
-#line 5607 "parser.cpp"
+#line 5609 "parser.cpp"
     break;
 
   case 202: /* distinct: DISTINCT  */
@@ -5611,7 +5613,7 @@ yyreduce:
                     {
     (yyval.bool_value) = true;
 }
-#line 5615 "parser.cpp"
+#line 5617 "parser.cpp"
     break;
 
   case 203: /* distinct: %empty  */
@@ -5619,7 +5621,7 @@ yyreduce:
   {
     (yyval.bool_value) = false;
 }
-#line 5623 "parser.cpp"
+#line 5625 "parser.cpp"
     break;
 
   case 204: /* highlight_clause: HIGHLIGHT expr_array  */
@@ -5627,7 +5629,7 @@ yyreduce:
                                        {
     (yyval.expr_array_t) = (yyvsp[0].expr_array_t);
 }
-#line 5631 "parser.cpp"
+#line 5633 "parser.cpp"
     break;
 
   case 205: /* highlight_clause: %empty  */
@@ -5635,7 +5637,7 @@ yyreduce:
   {
     (yyval.expr_array_t) = nullptr;
 }
-#line 5639 "parser.cpp"
+#line 5641 "parser.cpp"
     break;
 
   case 206: /* from_clause: FROM table_reference  */
@@ -5643,7 +5645,7 @@ yyreduce:
                                   {
     (yyval.table_reference_t) = (yyvsp[0].table_reference_t);
 }
-#line 5647 "parser.cpp"
+#line 5649 "parser.cpp"
     break;
 
   case 207: /* from_clause: %empty  */
@@ -5651,7 +5653,7 @@ yyreduce:
                        {
     (yyval.table_reference_t) = nullptr;
 }
-#line 5655 "parser.cpp"
+#line 5657 "parser.cpp"
     break;
 
   case 208: /* search_clause: SEARCH sub_search_array  */
@@ -5661,7 +5663,7 @@ yyreduce:
     search_expr->SetExprs((yyvsp[0].expr_array_t));
     (yyval.expr_t) = search_expr;
 }
-#line 5665 "parser.cpp"
+#line 5667 "parser.cpp"
     break;
 
   case 209: /* search_clause: %empty  */
@@ -5669,7 +5671,7 @@ yyreduce:
                          {
     (yyval.expr_t) = nullptr;
 }
-#line 5673 "parser.cpp"
+#line 5675 "parser.cpp"
     break;
 
   case 210: /* optional_search_filter_expr: ',' WHERE expr  */
@@ -5677,7 +5679,7 @@ yyreduce:
                                             {
     (yyval.expr_t) = (yyvsp[0].expr_t);
 }
-#line 5681 "parser.cpp"
+#line 5683 "parser.cpp"
     break;
 
   case 211: /* optional_search_filter_expr: %empty  */
@@ -5685,7 +5687,7 @@ yyreduce:
                         {
     (yyval.expr_t) = nullptr;
 }
-#line 5689 "parser.cpp"
+#line 5691 "parser.cpp"
     break;
 
   case 212: /* where_clause: WHERE expr  */
@@ -5693,7 +5695,7 @@ yyreduce:
                          {
     (yyval.expr_t) = (yyvsp[0].expr_t);
 }
-#line 5697 "parser.cpp"
+#line 5699 "parser.cpp"
     break;
 
   case 213: /* where_clause: %empty  */
@@ -5701,7 +5703,7 @@ yyreduce:
                         {
     (yyval.expr_t) = nullptr;
 }
-#line 5705 "parser.cpp"
+#line 5707 "parser.cpp"
     break;
 
   case 214: /* having_clause: HAVING expr  */
@@ -5709,7 +5711,7 @@ yyreduce:
                            {
     (yyval.expr_t) = (yyvsp[0].expr_t);
 }
-#line 5713 "parser.cpp"
+#line 5715 "parser.cpp"
     break;
 
   case 215: /* having_clause: %empty  */
@@ -5717,7 +5719,7 @@ yyreduce:
                         {
     (yyval.expr_t) = nullptr;
 }
-#line 5721 "parser.cpp"
+#line 5723 "parser.cpp"
     break;
 
   case 216: /* group_by_clause: GROUP BY expr_array  */
@@ -5725,7 +5727,7 @@ yyreduce:
                                      {
     (yyval.expr_array_t) = (yyvsp[0].expr_array_t);
 }
-#line 5729 "parser.cpp"
+#line 5731 "parser.cpp"
     break;
 
   case 217: /* group_by_clause: %empty  */
@@ -5733,7 +5735,7 @@ yyreduce:
   {
     (yyval.expr_array_t) = nullptr;
 }
-#line 5737 "parser.cpp"
+#line 5739 "parser.cpp"
     break;
 
   case 218: /* set_operator: UNION  */
@@ -5741,7 +5743,7 @@ yyreduce:
                      {
     (yyval.set_operator_t) = infinity::SetOperatorType::kUnion;
 }
-#line 5745 "parser.cpp"
+#line 5747 "parser.cpp"
     break;
 
   case 219: /* set_operator: UNION ALL  */
@@ -5749,7 +5751,7 @@ yyreduce:
             {
     (yyval.set_operator_t) = infinity::SetOperatorType::kUnionAll;
 }
-#line 5753 "parser.cpp"
+#line 5755 "parser.cpp"
     break;
 
   case 220: /* set_operator: INTERSECT  */
@@ -5757,7 +5759,7 @@ yyreduce:
             {
     (yyval.set_operator_t) = infinity::SetOperatorType::kIntersect;
 }
-#line 5761 "parser.cpp"
+#line 5763 "parser.cpp"
     break;
 
   case 221: /* set_operator: EXCEPT  */
@@ -5765,7 +5767,7 @@ yyreduce:
          {
     (yyval.set_operator_t) = infinity::SetOperatorType::kExcept;
 }
-#line 5769 "parser.cpp"
+#line 5771 "parser.cpp"
     break;
 
   case 222: /* table_reference: table_reference_unit  */
@@ -5773,7 +5775,7 @@ yyreduce:
                                        {
     (yyval.table_reference_t) = (yyvsp[0].table_reference_t);
 }
-#line 5777 "parser.cpp"
+#line 5779 "parser.cpp"
     break;
 
   case 223: /* table_reference: table_reference ',' table_reference_unit  */
@@ -5791,7 +5793,7 @@ yyreduce:
 
     (yyval.table_reference_t) = cross_product_ref;
 }
-#line 5795 "parser.cpp"
+#line 5797 "parser.cpp"
     break;
 
   case 226: /* table_reference_name: table_name table_alias  */
@@ -5809,7 +5811,7 @@ yyreduce:
     table_ref->alias_ = (yyvsp[0].table_alias_t);
     (yyval.table_reference_t) = table_ref;
 }
-#line 5813 "parser.cpp"
+#line 5815 "parser.cpp"
     break;
 
   case 227: /* table_reference_name: '(' select_statement ')' table_alias  */
@@ -5820,7 +5822,7 @@ yyreduce:
     subquery_reference->alias_ = (yyvsp[0].table_alias_t);
     (yyval.table_reference_t) = subquery_reference;
 }
-#line 5824 "parser.cpp"
+#line 5826 "parser.cpp"
     break;
 
   case 228: /* table_name: IDENTIFIER  */
@@ -5830,7 +5832,7 @@ yyreduce:
     ParserHelper::ToLower((yyvsp[0].str_value));
     (yyval.table_name_t)->table_name_ptr_ = (yyvsp[0].str_value);
 }
-#line 5834 "parser.cpp"
+#line 5836 "parser.cpp"
     break;
 
   case 229: /* table_name: IDENTIFIER '.' IDENTIFIER  */
@@ -5842,7 +5844,7 @@ yyreduce:
     (yyval.table_name_t)->schema_name_ptr_ = (yyvsp[-2].str_value);
     (yyval.table_name_t)->table_name_ptr_ = (yyvsp[0].str_value);
 }
-#line 5846 "parser.cpp"
+#line 5848 "parser.cpp"
     break;
 
   case 230: /* table_alias: AS IDENTIFIER  */
@@ -5852,7 +5854,7 @@ yyreduce:
     ParserHelper::ToLower((yyvsp[0].str_value));
     (yyval.table_alias_t)->alias_ = (yyvsp[0].str_value);
 }
-#line 5856 "parser.cpp"
+#line 5858 "parser.cpp"
     break;
 
   case 231: /* table_alias: IDENTIFIER  */
@@ -5862,7 +5864,7 @@ yyreduce:
     ParserHelper::ToLower((yyvsp[0].str_value));
     (yyval.table_alias_t)->alias_ = (yyvsp[0].str_value);
 }
-#line 5866 "parser.cpp"
+#line 5868 "parser.cpp"
     break;
 
   case 232: /* table_alias: AS IDENTIFIER '(' identifier_array ')'  */
@@ -5873,7 +5875,7 @@ yyreduce:
     (yyval.table_alias_t)->alias_ = (yyvsp[-3].str_value);
     (yyval.table_alias_t)->column_alias_array_ = (yyvsp[-1].identifier_array_t);
 }
-#line 5877 "parser.cpp"
+#line 5879 "parser.cpp"
     break;
 
   case 233: /* table_alias: %empty  */
@@ -5881,7 +5883,7 @@ yyreduce:
   {
     (yyval.table_alias_t) = nullptr;
 }
-#line 5885 "parser.cpp"
+#line 5887 "parser.cpp"
     break;
 
   case 234: /* with_clause: WITH with_expr_list  */
@@ -5889,7 +5891,7 @@ yyreduce:
                                   {
     (yyval.with_expr_list_t) = (yyvsp[0].with_expr_list_t);
 }
-#line 5893 "parser.cpp"
+#line 5895 "parser.cpp"
     break;
 
   case 235: /* with_clause: %empty  */
@@ -5897,7 +5899,7 @@ yyreduce:
                           {
     (yyval.with_expr_list_t) = nullptr;
 }
-#line 5901 "parser.cpp"
+#line 5903 "parser.cpp"
     break;
 
   case 236: /* with_expr_list: with_expr  */
@@ -5906,7 +5908,7 @@ yyreduce:
     (yyval.with_expr_list_t) = new std::vector<infinity::WithExpr*>();
     (yyval.with_expr_list_t)->emplace_back((yyvsp[0].with_expr_t));
 }
-#line 5910 "parser.cpp"
+#line 5912 "parser.cpp"
     break;
 
   case 237: /* with_expr_list: with_expr_list ',' with_expr  */
@@ -5915,7 +5917,7 @@ yyreduce:
     (yyvsp[-2].with_expr_list_t)->emplace_back((yyvsp[0].with_expr_t));
     (yyval.with_expr_list_t) = (yyvsp[-2].with_expr_list_t);
 }
-#line 5919 "parser.cpp"
+#line 5921 "parser.cpp"
     break;
 
   case 238: /* with_expr: IDENTIFIER AS '(' select_clause_with_modifier ')'  */
@@ -5927,7 +5929,7 @@ yyreduce:
     free((yyvsp[-4].str_value));
     (yyval.with_expr_t)->select_ = (yyvsp[-1].select_stmt);
 }
-#line 5931 "parser.cpp"
+#line 5933 "parser.cpp"
     break;
 
   case 239: /* join_clause: table_reference_unit NATURAL JOIN table_reference_name  */
@@ -5939,7 +5941,7 @@ yyreduce:
     join_reference->join_type_ = infinity::JoinType::kNatural;
     (yyval.table_reference_t) = join_reference;
 }
-#line 5943 "parser.cpp"
+#line 5945 "parser.cpp"
     break;
 
   case 240: /* join_clause: table_reference_unit join_type JOIN table_reference_name ON expr  */
@@ -5952,7 +5954,7 @@ yyreduce:
     join_reference->condition_ = (yyvsp[0].expr_t);
     (yyval.table_reference_t) = join_reference;
 }
-#line 5956 "parser.cpp"
+#line 5958 "parser.cpp"
     break;
 
   case 241: /* join_type: INNER  */
@@ -5960,7 +5962,7 @@ yyreduce:
                   {
     (yyval.join_type_t) = infinity::JoinType::kInner;
 }
-#line 5964 "parser.cpp"
+#line 5966 "parser.cpp"
     break;
 
   case 242: /* join_type: LEFT  */
@@ -5968,7 +5970,7 @@ yyreduce:
        {
     (yyval.join_type_t) = infinity::JoinType::kLeft;
 }
-#line 5972 "parser.cpp"
+#line 5974 "parser.cpp"
     break;
 
   case 243: /* join_type: RIGHT  */
@@ -5976,7 +5978,7 @@ yyreduce:
         {
     (yyval.join_type_t) = infinity::JoinType::kRight;
 }
-#line 5980 "parser.cpp"
+#line 5982 "parser.cpp"
     break;
 
   case 244: /* join_type: OUTER  */
@@ -5984,7 +5986,7 @@ yyreduce:
         {
     (yyval.join_type_t) = infinity::JoinType::kFull;
 }
-#line 5988 "parser.cpp"
+#line 5990 "parser.cpp"
     break;
 
   case 245: /* join_type: FULL  */
@@ -5992,7 +5994,7 @@ yyreduce:
        {
     (yyval.join_type_t) = infinity::JoinType::kFull;
 }
-#line 5996 "parser.cpp"
+#line 5998 "parser.cpp"
     break;
 
   case 246: /* join_type: CROSS  */
@@ -6000,14 +6002,14 @@ yyreduce:
         {
     (yyval.join_type_t) = infinity::JoinType::kCross;
 }
-#line 6004 "parser.cpp"
+#line 6006 "parser.cpp"
     break;
 
   case 247: /* join_type: %empty  */
 #line 1842 "parser.y"
                 {
 }
-#line 6011 "parser.cpp"
+#line 6013 "parser.cpp"
     break;
 
   case 248: /* show_statement: SHOW DATABASES  */
@@ -6016,7 +6018,7 @@ yyreduce:
     (yyval.show_stmt) = new infinity::ShowStatement();
     (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kDatabases;
 }
-#line 6020 "parser.cpp"
+#line 6022 "parser.cpp"
     break;
 
   case 249: /* show_statement: SHOW TABLES  */
@@ -6025,7 +6027,7 @@ yyreduce:
     (yyval.show_stmt) = new infinity::ShowStatement();
     (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kTables;
 }
-#line 6029 "parser.cpp"
+#line 6031 "parser.cpp"
     break;
 
   case 250: /* show_statement: SHOW VIEWS  */
@@ -6034,7 +6036,7 @@ yyreduce:
     (yyval.show_stmt) = new infinity::ShowStatement();
     (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kViews;
 }
-#line 6038 "parser.cpp"
+#line 6040 "parser.cpp"
     break;
 
   case 251: /* show_statement: SHOW CONFIGS  */
@@ -6043,7 +6045,7 @@ yyreduce:
     (yyval.show_stmt) = new infinity::ShowStatement();
     (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kConfigs;
 }
-#line 6047 "parser.cpp"
+#line 6049 "parser.cpp"
     break;
 
   case 252: /* show_statement: SHOW CONFIG IDENTIFIER  */
@@ -6055,7 +6057,7 @@ yyreduce:
     (yyval.show_stmt)->var_name_ = std::string((yyvsp[0].str_value));
     free((yyvsp[0].str_value));
 }
-#line 6059 "parser.cpp"
+#line 6061 "parser.cpp"
     break;
 
   case 253: /* show_statement: SHOW PROFILES  */
@@ -6064,7 +6066,7 @@ yyreduce:
     (yyval.show_stmt) = new infinity::ShowStatement();
     (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kProfiles;
 }
-#line 6068 "parser.cpp"
+#line 6070 "parser.cpp"
     break;
 
   case 254: /* show_statement: SHOW BUFFER  */
@@ -6073,118 +6075,134 @@ yyreduce:
     (yyval.show_stmt) = new infinity::ShowStatement();
     (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kBuffer;
 }
-#line 6077 "parser.cpp"
+#line 6079 "parser.cpp"
     break;
 
-  case 255: /* show_statement: SHOW MEMINDEX  */
+  case 255: /* show_statement: SHOW BUFFER IDENTIFIER  */
 #line 1879 "parser.y"
+                         {
+    ParserHelper::ToLower((yyvsp[0].str_value));
+    bool is_cache = !strcmp((yyvsp[0].str_value), "cache");
+    free((yyvsp[0].str_value));
+    if(!is_cache) {
+        yyerror(&yyloc, scanner, result, "invalid show buffer option");
+        YYERROR;
+    }
+    (yyval.show_stmt) = new infinity::ShowStatement();
+    (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kBufferCache;
+}
+#line 6095 "parser.cpp"
+    break;
+
+  case 256: /* show_statement: SHOW MEMINDEX  */
+#line 1890 "parser.y"
                 {
     (yyval.show_stmt) = new infinity::ShowStatement();
     (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kMemIndex;
 }
-#line 6086 "parser.cpp"
+#line 6104 "parser.cpp"
     break;
 
-  case 256: /* show_statement: SHOW QUERIES  */
-#line 1883 "parser.y"
+  case 257: /* show_statement: SHOW QUERIES  */
+#line 1894 "parser.y"
                {
     (yyval.show_stmt) = new infinity::ShowStatement();
     (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kQueries;
 }
-#line 6095 "parser.cpp"
+#line 6113 "parser.cpp"
     break;
 
-  case 257: /* show_statement: SHOW QUERY LONG_VALUE  */
-#line 1887 "parser.y"
+  case 258: /* show_statement: SHOW QUERY LONG_VALUE  */
+#line 1898 "parser.y"
                         {
     (yyval.show_stmt) = new infinity::ShowStatement();
     (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kQuery;
     (yyval.show_stmt)->session_id_ = (yyvsp[0].long_value);
 }
-#line 6105 "parser.cpp"
+#line 6123 "parser.cpp"
     break;
 
-  case 258: /* show_statement: SHOW TRANSACTIONS  */
-#line 1892 "parser.y"
+  case 259: /* show_statement: SHOW TRANSACTIONS  */
+#line 1903 "parser.y"
                     {
     (yyval.show_stmt) = new infinity::ShowStatement();
     (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kTransactions;
 }
-#line 6114 "parser.cpp"
+#line 6132 "parser.cpp"
     break;
 
-  case 259: /* show_statement: SHOW TRANSACTION LONG_VALUE  */
-#line 1896 "parser.y"
+  case 260: /* show_statement: SHOW TRANSACTION LONG_VALUE  */
+#line 1907 "parser.y"
                               {
     (yyval.show_stmt) = new infinity::ShowStatement();
     (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kTransaction;
     (yyval.show_stmt)->txn_id_ = (yyvsp[0].long_value);
 }
-#line 6124 "parser.cpp"
+#line 6142 "parser.cpp"
     break;
 
-  case 260: /* show_statement: SHOW TRANSACTION HISTORY  */
-#line 1901 "parser.y"
+  case 261: /* show_statement: SHOW TRANSACTION HISTORY  */
+#line 1912 "parser.y"
                            {
     (yyval.show_stmt) = new infinity::ShowStatement();
     (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kTransactionHistory;
 }
-#line 6133 "parser.cpp"
+#line 6151 "parser.cpp"
     break;
 
-  case 261: /* show_statement: SHOW SESSION VARIABLES  */
-#line 1905 "parser.y"
+  case 262: /* show_statement: SHOW SESSION VARIABLES  */
+#line 1916 "parser.y"
                          {
     (yyval.show_stmt) = new infinity::ShowStatement();
     (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kSessionVariables;
 }
-#line 6142 "parser.cpp"
+#line 6160 "parser.cpp"
     break;
 
-  case 262: /* show_statement: SHOW GLOBAL VARIABLES  */
-#line 1909 "parser.y"
+  case 263: /* show_statement: SHOW GLOBAL VARIABLES  */
+#line 1920 "parser.y"
                         {
     (yyval.show_stmt) = new infinity::ShowStatement();
     (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kGlobalVariables;
 }
-#line 6151 "parser.cpp"
+#line 6169 "parser.cpp"
     break;
 
-  case 263: /* show_statement: SHOW SESSION VARIABLE IDENTIFIER  */
-#line 1913 "parser.y"
+  case 264: /* show_statement: SHOW SESSION VARIABLE IDENTIFIER  */
+#line 1924 "parser.y"
                                    {
     (yyval.show_stmt) = new infinity::ShowStatement();
     (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kSessionVariable;
     (yyval.show_stmt)->var_name_ = std::string((yyvsp[0].str_value));
     free((yyvsp[0].str_value));
 }
-#line 6162 "parser.cpp"
+#line 6180 "parser.cpp"
     break;
 
-  case 264: /* show_statement: SHOW GLOBAL VARIABLE IDENTIFIER  */
-#line 1919 "parser.y"
+  case 265: /* show_statement: SHOW GLOBAL VARIABLE IDENTIFIER  */
+#line 1930 "parser.y"
                                   {
     (yyval.show_stmt) = new infinity::ShowStatement();
     (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kGlobalVariable;
     (yyval.show_stmt)->var_name_ = std::string((yyvsp[0].str_value));
     free((yyvsp[0].str_value));
 }
-#line 6173 "parser.cpp"
+#line 6191 "parser.cpp"
     break;
 
-  case 265: /* show_statement: SHOW DATABASE IDENTIFIER  */
-#line 1925 "parser.y"
+  case 266: /* show_statement: SHOW DATABASE IDENTIFIER  */
+#line 1936 "parser.y"
                            {
     (yyval.show_stmt) = new infinity::ShowStatement();
     (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kDatabase;
     (yyval.show_stmt)->schema_name_ = (yyvsp[0].str_value);
     free((yyvsp[0].str_value));
 }
-#line 6184 "parser.cpp"
+#line 6202 "parser.cpp"
     break;
 
-  case 266: /* show_statement: SHOW TABLE table_name  */
-#line 1931 "parser.y"
+  case 267: /* show_statement: SHOW TABLE table_name  */
+#line 1942 "parser.y"
                         {
     (yyval.show_stmt) = new infinity::ShowStatement();
     (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kTable;
@@ -6196,11 +6214,11 @@ yyreduce:
     free((yyvsp[0].table_name_t)->table_name_ptr_);
     delete (yyvsp[0].table_name_t);
 }
-#line 6200 "parser.cpp"
+#line 6218 "parser.cpp"
     break;
 
-  case 267: /* show_statement: SHOW TABLE table_name COLUMNS  */
-#line 1942 "parser.y"
+  case 268: /* show_statement: SHOW TABLE table_name COLUMNS  */
+#line 1953 "parser.y"
                                 {
     (yyval.show_stmt) = new infinity::ShowStatement();
     (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kColumns;
@@ -6212,11 +6230,11 @@ yyreduce:
     free((yyvsp[-1].table_name_t)->table_name_ptr_);
     delete (yyvsp[-1].table_name_t);
 }
-#line 6216 "parser.cpp"
+#line 6234 "parser.cpp"
     break;
 
-  case 268: /* show_statement: SHOW TABLE table_name SEGMENTS  */
-#line 1953 "parser.y"
+  case 269: /* show_statement: SHOW TABLE table_name SEGMENTS  */
+#line 1964 "parser.y"
                                  {
     (yyval.show_stmt) = new infinity::ShowStatement();
     (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kSegments;
@@ -6228,11 +6246,11 @@ yyreduce:
     free((yyvsp[-1].table_name_t)->table_name_ptr_);
     delete (yyvsp[-1].table_name_t);
 }
-#line 6232 "parser.cpp"
+#line 6250 "parser.cpp"
     break;
 
-  case 269: /* show_statement: SHOW TABLE table_name SEGMENT LONG_VALUE  */
-#line 1964 "parser.y"
+  case 270: /* show_statement: SHOW TABLE table_name SEGMENT LONG_VALUE  */
+#line 1975 "parser.y"
                                            {
     (yyval.show_stmt) = new infinity::ShowStatement();
     (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kSegment;
@@ -6245,11 +6263,11 @@ yyreduce:
     (yyval.show_stmt)->segment_id_ = (yyvsp[0].long_value);
     delete (yyvsp[-2].table_name_t);
 }
-#line 6249 "parser.cpp"
+#line 6267 "parser.cpp"
     break;
 
-  case 270: /* show_statement: SHOW TABLE table_name SEGMENT LONG_VALUE BLOCKS  */
-#line 1976 "parser.y"
+  case 271: /* show_statement: SHOW TABLE table_name SEGMENT LONG_VALUE BLOCKS  */
+#line 1987 "parser.y"
                                                   {
     (yyval.show_stmt) = new infinity::ShowStatement();
     (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kBlocks;
@@ -6262,11 +6280,11 @@ yyreduce:
     (yyval.show_stmt)->segment_id_ = (yyvsp[-1].long_value);
     delete (yyvsp[-3].table_name_t);
 }
-#line 6266 "parser.cpp"
+#line 6284 "parser.cpp"
     break;
 
-  case 271: /* show_statement: SHOW TABLE table_name SEGMENT LONG_VALUE BLOCK LONG_VALUE  */
-#line 1988 "parser.y"
+  case 272: /* show_statement: SHOW TABLE table_name SEGMENT LONG_VALUE BLOCK LONG_VALUE  */
+#line 1999 "parser.y"
                                                             {
     (yyval.show_stmt) = new infinity::ShowStatement();
     (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kBlock;
@@ -6280,11 +6298,11 @@ yyreduce:
     (yyval.show_stmt)->block_id_ = (yyvsp[0].long_value);
     delete (yyvsp[-4].table_name_t);
 }
-#line 6284 "parser.cpp"
+#line 6302 "parser.cpp"
     break;
 
-  case 272: /* show_statement: SHOW TABLE table_name SEGMENT LONG_VALUE BLOCK LONG_VALUE COLUMN LONG_VALUE  */
-#line 2001 "parser.y"
+  case 273: /* show_statement: SHOW TABLE table_name SEGMENT LONG_VALUE BLOCK LONG_VALUE COLUMN LONG_VALUE  */
+#line 2012 "parser.y"
                                                                               {
     (yyval.show_stmt) = new infinity::ShowStatement();
     (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kBlockColumn;
@@ -6299,11 +6317,11 @@ yyreduce:
     (yyval.show_stmt)->column_id_ = (yyvsp[0].long_value);
     delete (yyvsp[-6].table_name_t);
 }
-#line 6303 "parser.cpp"
+#line 6321 "parser.cpp"
     break;
 
-  case 273: /* show_statement: SHOW TABLE table_name INDEXES  */
-#line 2015 "parser.y"
+  case 274: /* show_statement: SHOW TABLE table_name INDEXES  */
+#line 2026 "parser.y"
                                 {
     (yyval.show_stmt) = new infinity::ShowStatement();
     (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kIndexes;
@@ -6315,11 +6333,11 @@ yyreduce:
     free((yyvsp[-1].table_name_t)->table_name_ptr_);
     delete (yyvsp[-1].table_name_t);
 }
-#line 6319 "parser.cpp"
+#line 6337 "parser.cpp"
     break;
 
-  case 274: /* show_statement: SHOW TABLE table_name INDEX IDENTIFIER  */
-#line 2026 "parser.y"
+  case 275: /* show_statement: SHOW TABLE table_name INDEX IDENTIFIER  */
+#line 2037 "parser.y"
                                          {
     (yyval.show_stmt) = new infinity::ShowStatement();
     (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kIndex;
@@ -6334,11 +6352,11 @@ yyreduce:
     (yyval.show_stmt)->index_name_ = (yyvsp[0].str_value);
     free((yyvsp[0].str_value));
 }
-#line 6338 "parser.cpp"
+#line 6356 "parser.cpp"
     break;
 
-  case 275: /* show_statement: SHOW TABLE table_name INDEX IDENTIFIER SEGMENT LONG_VALUE  */
-#line 2040 "parser.y"
+  case 276: /* show_statement: SHOW TABLE table_name INDEX IDENTIFIER SEGMENT LONG_VALUE  */
+#line 2051 "parser.y"
                                                             {
     (yyval.show_stmt) = new infinity::ShowStatement();
     (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kIndexSegment;
@@ -6355,11 +6373,11 @@ yyreduce:
 
     (yyval.show_stmt)->segment_id_ = (yyvsp[0].long_value);
 }
-#line 6359 "parser.cpp"
+#line 6377 "parser.cpp"
     break;
 
-  case 276: /* show_statement: SHOW TABLE table_name INDEX IDENTIFIER SEGMENT LONG_VALUE CHUNK LONG_VALUE  */
-#line 2056 "parser.y"
+  case 277: /* show_statement: SHOW TABLE table_name INDEX IDENTIFIER SEGMENT LONG_VALUE CHUNK LONG_VALUE  */
+#line 2067 "parser.y"
                                                                              {
       (yyval.show_stmt) = new infinity::ShowStatement();
       (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kIndexChunk;
@@ -6377,172 +6395,172 @@ yyreduce:
       (yyval.show_stmt)->segment_id_ = (yyvsp[-2].long_value);
       (yyval.show_stmt)->chunk_id_ = (yyvsp[0].long_value);
 }
-#line 6381 "parser.cpp"
+#line 6399 "parser.cpp"
     break;
 
-  case 277: /* show_statement: SHOW LOGS  */
-#line 2073 "parser.y"
+  case 278: /* show_statement: SHOW LOGS  */
+#line 2084 "parser.y"
             {
       (yyval.show_stmt) = new infinity::ShowStatement();
       (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kLogs;
 }
-#line 6390 "parser.cpp"
+#line 6408 "parser.cpp"
     break;
 
-  case 278: /* show_statement: SHOW DELTA LOGS  */
-#line 2077 "parser.y"
+  case 279: /* show_statement: SHOW DELTA LOGS  */
+#line 2088 "parser.y"
                   {
       (yyval.show_stmt) = new infinity::ShowStatement();
       (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kDeltaLogs;
 }
-#line 6399 "parser.cpp"
+#line 6417 "parser.cpp"
     break;
 
-  case 279: /* show_statement: SHOW CATALOGS  */
-#line 2081 "parser.y"
+  case 280: /* show_statement: SHOW CATALOGS  */
+#line 2092 "parser.y"
                 {
       (yyval.show_stmt) = new infinity::ShowStatement();
       (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kCatalogs;
 }
-#line 6408 "parser.cpp"
+#line 6426 "parser.cpp"
     break;
 
-  case 280: /* show_statement: SHOW CATALOG  */
-#line 2085 "parser.y"
+  case 281: /* show_statement: SHOW CATALOG  */
+#line 2096 "parser.y"
                {
       (yyval.show_stmt) = new infinity::ShowStatement();
       (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kCatalog;
 }
-#line 6417 "parser.cpp"
+#line 6435 "parser.cpp"
     break;
 
-  case 281: /* show_statement: SHOW CATALOG TO file_path  */
-#line 2089 "parser.y"
+  case 282: /* show_statement: SHOW CATALOG TO file_path  */
+#line 2100 "parser.y"
                             {
       (yyval.show_stmt) = new infinity::ShowStatement();
       (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kCatalogToFile;
       (yyval.show_stmt)->file_path_ = (yyvsp[0].str_value);
       free((yyvsp[0].str_value));
 }
-#line 6428 "parser.cpp"
+#line 6446 "parser.cpp"
     break;
 
-  case 282: /* show_statement: SHOW PERSISTENCE FILES  */
-#line 2095 "parser.y"
+  case 283: /* show_statement: SHOW PERSISTENCE FILES  */
+#line 2106 "parser.y"
                          {
       (yyval.show_stmt) = new infinity::ShowStatement();
       (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kPersistenceFiles;
 }
-#line 6437 "parser.cpp"
+#line 6455 "parser.cpp"
     break;
 
-  case 283: /* show_statement: SHOW PERSISTENCE OBJECTS  */
-#line 2099 "parser.y"
+  case 284: /* show_statement: SHOW PERSISTENCE OBJECTS  */
+#line 2110 "parser.y"
                            {
       (yyval.show_stmt) = new infinity::ShowStatement();
       (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kPersistenceObjects;
 }
-#line 6446 "parser.cpp"
+#line 6464 "parser.cpp"
     break;
 
-  case 284: /* show_statement: SHOW PERSISTENCE OBJECT STRING  */
-#line 2103 "parser.y"
+  case 285: /* show_statement: SHOW PERSISTENCE OBJECT STRING  */
+#line 2114 "parser.y"
                                  {
       (yyval.show_stmt) = new infinity::ShowStatement();
       (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kPersistenceObject;
       (yyval.show_stmt)->file_name_ = (yyvsp[0].str_value);
       free((yyvsp[0].str_value));
 }
-#line 6457 "parser.cpp"
+#line 6475 "parser.cpp"
     break;
 
-  case 285: /* show_statement: SHOW MEMORY  */
-#line 2109 "parser.y"
+  case 286: /* show_statement: SHOW MEMORY  */
+#line 2120 "parser.y"
               {
       (yyval.show_stmt) = new infinity::ShowStatement();
       (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kMemory;
 }
-#line 6466 "parser.cpp"
+#line 6484 "parser.cpp"
     break;
 
-  case 286: /* show_statement: SHOW MEMORY OBJECTS  */
-#line 2113 "parser.y"
+  case 287: /* show_statement: SHOW MEMORY OBJECTS  */
+#line 2124 "parser.y"
                       {
       (yyval.show_stmt) = new infinity::ShowStatement();
       (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kMemoryObjects;
 }
-#line 6475 "parser.cpp"
+#line 6493 "parser.cpp"
     break;
 
-  case 287: /* show_statement: SHOW MEMORY ALLOCATION  */
-#line 2117 "parser.y"
+  case 288: /* show_statement: SHOW MEMORY ALLOCATION  */
+#line 2128 "parser.y"
                          {
       (yyval.show_stmt) = new infinity::ShowStatement();
       (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kMemoryAllocation;
 }
-#line 6484 "parser.cpp"
+#line 6502 "parser.cpp"
     break;
 
-  case 288: /* show_statement: SHOW IDENTIFIER '(' ')'  */
-#line 2121 "parser.y"
+  case 289: /* show_statement: SHOW IDENTIFIER '(' ')'  */
+#line 2132 "parser.y"
                           {
       (yyval.show_stmt) = new infinity::ShowStatement();
       (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kFunction;
       (yyval.show_stmt)->function_name_ = (yyvsp[-2].str_value);
       free((yyvsp[-2].str_value));
 }
-#line 6495 "parser.cpp"
+#line 6513 "parser.cpp"
     break;
 
-  case 289: /* show_statement: SHOW SNAPSHOTS  */
-#line 2127 "parser.y"
+  case 290: /* show_statement: SHOW SNAPSHOTS  */
+#line 2138 "parser.y"
                  {
      (yyval.show_stmt) = new infinity::ShowStatement();
      (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kListSnapshots;
 }
-#line 6504 "parser.cpp"
+#line 6522 "parser.cpp"
     break;
 
-  case 290: /* show_statement: SHOW SNAPSHOT IDENTIFIER  */
-#line 2131 "parser.y"
+  case 291: /* show_statement: SHOW SNAPSHOT IDENTIFIER  */
+#line 2142 "parser.y"
                            {
      (yyval.show_stmt) = new infinity::ShowStatement();
      (yyval.show_stmt)->show_type_ = infinity::ShowStmtType::kShowSnapshot;
      (yyval.show_stmt)->snapshot_name_ = (yyvsp[0].str_value);
      free((yyvsp[0].str_value));
 }
-#line 6515 "parser.cpp"
+#line 6533 "parser.cpp"
     break;
 
-  case 291: /* flush_statement: FLUSH DATA  */
-#line 2141 "parser.y"
+  case 292: /* flush_statement: FLUSH DATA  */
+#line 2152 "parser.y"
                             {
     (yyval.flush_stmt) = new infinity::FlushStatement();
     (yyval.flush_stmt)->type_ = infinity::FlushType::kData;
 }
-#line 6524 "parser.cpp"
+#line 6542 "parser.cpp"
     break;
 
-  case 292: /* flush_statement: FLUSH LOG  */
-#line 2145 "parser.y"
+  case 293: /* flush_statement: FLUSH LOG  */
+#line 2156 "parser.y"
             {
     (yyval.flush_stmt) = new infinity::FlushStatement();
     (yyval.flush_stmt)->type_ = infinity::FlushType::kLog;
 }
-#line 6533 "parser.cpp"
+#line 6551 "parser.cpp"
     break;
 
-  case 293: /* flush_statement: FLUSH BUFFER  */
-#line 2149 "parser.y"
+  case 294: /* flush_statement: FLUSH BUFFER  */
+#line 2160 "parser.y"
                {
     (yyval.flush_stmt) = new infinity::FlushStatement();
     (yyval.flush_stmt)->type_ = infinity::FlushType::kBuffer;
 }
-#line 6542 "parser.cpp"
+#line 6560 "parser.cpp"
     break;
 
-  case 294: /* optimize_statement: OPTIMIZE table_name  */
-#line 2157 "parser.y"
+  case 295: /* optimize_statement: OPTIMIZE table_name  */
+#line 2168 "parser.y"
                                         {
     (yyval.optimize_stmt) = new infinity::OptimizeStatement();
     if((yyvsp[0].table_name_t)->schema_name_ptr_ != nullptr) {
@@ -6553,11 +6571,11 @@ yyreduce:
     free((yyvsp[0].table_name_t)->table_name_ptr_);
     delete (yyvsp[0].table_name_t);
 }
-#line 6557 "parser.cpp"
+#line 6575 "parser.cpp"
     break;
 
-  case 295: /* optimize_statement: OPTIMIZE IDENTIFIER ON table_name with_index_param_list  */
-#line 2168 "parser.y"
+  case 296: /* optimize_statement: OPTIMIZE IDENTIFIER ON table_name with_index_param_list  */
+#line 2179 "parser.y"
                                                          {
     (yyval.optimize_stmt) = new infinity::OptimizeStatement();
     if((yyvsp[-1].table_name_t)->schema_name_ptr_ != nullptr) {
@@ -6577,54 +6595,54 @@ yyreduce:
     }
     delete (yyvsp[0].with_index_param_list_t);
 }
-#line 6581 "parser.cpp"
+#line 6599 "parser.cpp"
     break;
 
-  case 296: /* command_statement: USE IDENTIFIER  */
-#line 2191 "parser.y"
+  case 297: /* command_statement: USE IDENTIFIER  */
+#line 2202 "parser.y"
                                   {
     (yyval.command_stmt) = new infinity::CommandStatement();
     ParserHelper::ToLower((yyvsp[0].str_value));
     (yyval.command_stmt)->command_info_ = std::make_shared<infinity::UseCmd>((yyvsp[0].str_value));
     free((yyvsp[0].str_value));
 }
-#line 6592 "parser.cpp"
+#line 6610 "parser.cpp"
     break;
 
-  case 297: /* command_statement: EXPORT PROFILES LONG_VALUE file_path  */
-#line 2197 "parser.y"
+  case 298: /* command_statement: EXPORT PROFILES LONG_VALUE file_path  */
+#line 2208 "parser.y"
                                        {
     (yyval.command_stmt) = new infinity::CommandStatement();
     (yyval.command_stmt)->command_info_ = std::make_shared<infinity::ExportCmd>((yyvsp[0].str_value), infinity::ExportType::kProfileRecord, (yyvsp[-1].long_value));
     free((yyvsp[0].str_value));
 }
-#line 6602 "parser.cpp"
+#line 6620 "parser.cpp"
     break;
 
-  case 298: /* command_statement: SET SESSION IDENTIFIER ON  */
-#line 2202 "parser.y"
+  case 299: /* command_statement: SET SESSION IDENTIFIER ON  */
+#line 2213 "parser.y"
                             {
     ParserHelper::ToLower((yyvsp[-1].str_value));
     (yyval.command_stmt) = new infinity::CommandStatement();
     (yyval.command_stmt)->command_info_ = std::make_shared<infinity::SetCmd>(infinity::SetScope::kSession, infinity::SetVarType::kBool, (yyvsp[-1].str_value), true);
     free((yyvsp[-1].str_value));
 }
-#line 6613 "parser.cpp"
+#line 6631 "parser.cpp"
     break;
 
-  case 299: /* command_statement: SET SESSION IDENTIFIER OFF  */
-#line 2208 "parser.y"
+  case 300: /* command_statement: SET SESSION IDENTIFIER OFF  */
+#line 2219 "parser.y"
                              {
     ParserHelper::ToLower((yyvsp[-1].str_value));
     (yyval.command_stmt) = new infinity::CommandStatement();
     (yyval.command_stmt)->command_info_ = std::make_shared<infinity::SetCmd>(infinity::SetScope::kSession, infinity::SetVarType::kBool, (yyvsp[-1].str_value), false);
     free((yyvsp[-1].str_value));
 }
-#line 6624 "parser.cpp"
+#line 6642 "parser.cpp"
     break;
 
-  case 300: /* command_statement: SET SESSION IDENTIFIER IDENTIFIER  */
-#line 2214 "parser.y"
+  case 301: /* command_statement: SET SESSION IDENTIFIER IDENTIFIER  */
+#line 2225 "parser.y"
                                     {
     ParserHelper::ToLower((yyvsp[-1].str_value));
     ParserHelper::ToLower((yyvsp[0].str_value));
@@ -6633,55 +6651,55 @@ yyreduce:
     free((yyvsp[-1].str_value));
     free((yyvsp[0].str_value));
 }
-#line 6637 "parser.cpp"
+#line 6655 "parser.cpp"
     break;
 
-  case 301: /* command_statement: SET SESSION IDENTIFIER LONG_VALUE  */
-#line 2222 "parser.y"
+  case 302: /* command_statement: SET SESSION IDENTIFIER LONG_VALUE  */
+#line 2233 "parser.y"
                                     {
     ParserHelper::ToLower((yyvsp[-1].str_value));
     (yyval.command_stmt) = new infinity::CommandStatement();
     (yyval.command_stmt)->command_info_ = std::make_shared<infinity::SetCmd>(infinity::SetScope::kSession, infinity::SetVarType::kInteger, (yyvsp[-1].str_value), (yyvsp[0].long_value));
     free((yyvsp[-1].str_value));
 }
-#line 6648 "parser.cpp"
+#line 6666 "parser.cpp"
     break;
 
-  case 302: /* command_statement: SET SESSION IDENTIFIER DOUBLE_VALUE  */
-#line 2228 "parser.y"
+  case 303: /* command_statement: SET SESSION IDENTIFIER DOUBLE_VALUE  */
+#line 2239 "parser.y"
                                       {
     ParserHelper::ToLower((yyvsp[-1].str_value));
     (yyval.command_stmt) = new infinity::CommandStatement();
     (yyval.command_stmt)->command_info_ = std::make_shared<infinity::SetCmd>(infinity::SetScope::kSession, infinity::SetVarType::kDouble, (yyvsp[-1].str_value), (yyvsp[0].double_value));
     free((yyvsp[-1].str_value));
 }
-#line 6659 "parser.cpp"
+#line 6677 "parser.cpp"
     break;
 
-  case 303: /* command_statement: SET GLOBAL IDENTIFIER ON  */
-#line 2234 "parser.y"
+  case 304: /* command_statement: SET GLOBAL IDENTIFIER ON  */
+#line 2245 "parser.y"
                            {
     ParserHelper::ToLower((yyvsp[-1].str_value));
     (yyval.command_stmt) = new infinity::CommandStatement();
     (yyval.command_stmt)->command_info_ = std::make_shared<infinity::SetCmd>(infinity::SetScope::kGlobal, infinity::SetVarType::kBool, (yyvsp[-1].str_value), true);
     free((yyvsp[-1].str_value));
 }
-#line 6670 "parser.cpp"
+#line 6688 "parser.cpp"
     break;
 
-  case 304: /* command_statement: SET GLOBAL IDENTIFIER OFF  */
-#line 2240 "parser.y"
+  case 305: /* command_statement: SET GLOBAL IDENTIFIER OFF  */
+#line 2251 "parser.y"
                             {
     ParserHelper::ToLower((yyvsp[-1].str_value));
     (yyval.command_stmt) = new infinity::CommandStatement();
     (yyval.command_stmt)->command_info_ = std::make_shared<infinity::SetCmd>(infinity::SetScope::kGlobal, infinity::SetVarType::kBool, (yyvsp[-1].str_value), false);
     free((yyvsp[-1].str_value));
 }
-#line 6681 "parser.cpp"
+#line 6699 "parser.cpp"
     break;
 
-  case 305: /* command_statement: SET GLOBAL IDENTIFIER IDENTIFIER  */
-#line 2246 "parser.y"
+  case 306: /* command_statement: SET GLOBAL IDENTIFIER IDENTIFIER  */
+#line 2257 "parser.y"
                                    {
     ParserHelper::ToLower((yyvsp[-1].str_value));
     ParserHelper::ToLower((yyvsp[0].str_value));
@@ -6690,55 +6708,55 @@ yyreduce:
     free((yyvsp[-1].str_value));
     free((yyvsp[0].str_value));
 }
-#line 6694 "parser.cpp"
+#line 6712 "parser.cpp"
     break;
 
-  case 306: /* command_statement: SET GLOBAL IDENTIFIER LONG_VALUE  */
-#line 2254 "parser.y"
+  case 307: /* command_statement: SET GLOBAL IDENTIFIER LONG_VALUE  */
+#line 2265 "parser.y"
                                    {
     ParserHelper::ToLower((yyvsp[-1].str_value));
     (yyval.command_stmt) = new infinity::CommandStatement();
     (yyval.command_stmt)->command_info_ = std::make_shared<infinity::SetCmd>(infinity::SetScope::kGlobal, infinity::SetVarType::kInteger, (yyvsp[-1].str_value), (yyvsp[0].long_value));
     free((yyvsp[-1].str_value));
 }
-#line 6705 "parser.cpp"
+#line 6723 "parser.cpp"
     break;
 
-  case 307: /* command_statement: SET GLOBAL IDENTIFIER DOUBLE_VALUE  */
-#line 2260 "parser.y"
+  case 308: /* command_statement: SET GLOBAL IDENTIFIER DOUBLE_VALUE  */
+#line 2271 "parser.y"
                                      {
     ParserHelper::ToLower((yyvsp[-1].str_value));
     (yyval.command_stmt) = new infinity::CommandStatement();
     (yyval.command_stmt)->command_info_ = std::make_shared<infinity::SetCmd>(infinity::SetScope::kGlobal, infinity::SetVarType::kDouble, (yyvsp[-1].str_value), (yyvsp[0].double_value));
     free((yyvsp[-1].str_value));
 }
-#line 6716 "parser.cpp"
+#line 6734 "parser.cpp"
     break;
 
-  case 308: /* command_statement: SET CONFIG IDENTIFIER ON  */
-#line 2266 "parser.y"
+  case 309: /* command_statement: SET CONFIG IDENTIFIER ON  */
+#line 2277 "parser.y"
                            {
     ParserHelper::ToLower((yyvsp[-1].str_value));
     (yyval.command_stmt) = new infinity::CommandStatement();
     (yyval.command_stmt)->command_info_ = std::make_shared<infinity::SetCmd>(infinity::SetScope::kConfig, infinity::SetVarType::kBool, (yyvsp[-1].str_value), true);
     free((yyvsp[-1].str_value));
 }
-#line 6727 "parser.cpp"
+#line 6745 "parser.cpp"
     break;
 
-  case 309: /* command_statement: SET CONFIG IDENTIFIER OFF  */
-#line 2272 "parser.y"
+  case 310: /* command_statement: SET CONFIG IDENTIFIER OFF  */
+#line 2283 "parser.y"
                             {
     ParserHelper::ToLower((yyvsp[-1].str_value));
     (yyval.command_stmt) = new infinity::CommandStatement();
     (yyval.command_stmt)->command_info_ = std::make_shared<infinity::SetCmd>(infinity::SetScope::kConfig, infinity::SetVarType::kBool, (yyvsp[-1].str_value), false);
     free((yyvsp[-1].str_value));
 }
-#line 6738 "parser.cpp"
+#line 6756 "parser.cpp"
     break;
 
-  case 310: /* command_statement: SET CONFIG IDENTIFIER IDENTIFIER  */
-#line 2278 "parser.y"
+  case 311: /* command_statement: SET CONFIG IDENTIFIER IDENTIFIER  */
+#line 2289 "parser.y"
                                    {
     ParserHelper::ToLower((yyvsp[-1].str_value));
     ParserHelper::ToLower((yyvsp[0].str_value));
@@ -6747,33 +6765,33 @@ yyreduce:
     free((yyvsp[-1].str_value));
     free((yyvsp[0].str_value));
 }
-#line 6751 "parser.cpp"
+#line 6769 "parser.cpp"
     break;
 
-  case 311: /* command_statement: SET CONFIG IDENTIFIER LONG_VALUE  */
-#line 2286 "parser.y"
+  case 312: /* command_statement: SET CONFIG IDENTIFIER LONG_VALUE  */
+#line 2297 "parser.y"
                                    {
     ParserHelper::ToLower((yyvsp[-1].str_value));
     (yyval.command_stmt) = new infinity::CommandStatement();
     (yyval.command_stmt)->command_info_ = std::make_shared<infinity::SetCmd>(infinity::SetScope::kConfig, infinity::SetVarType::kInteger, (yyvsp[-1].str_value), (yyvsp[0].long_value));
     free((yyvsp[-1].str_value));
 }
-#line 6762 "parser.cpp"
+#line 6780 "parser.cpp"
     break;
 
-  case 312: /* command_statement: SET CONFIG IDENTIFIER DOUBLE_VALUE  */
-#line 2292 "parser.y"
+  case 313: /* command_statement: SET CONFIG IDENTIFIER DOUBLE_VALUE  */
+#line 2303 "parser.y"
                                      {
     ParserHelper::ToLower((yyvsp[-1].str_value));
     (yyval.command_stmt) = new infinity::CommandStatement();
     (yyval.command_stmt)->command_info_ = std::make_shared<infinity::SetCmd>(infinity::SetScope::kConfig, infinity::SetVarType::kDouble, (yyvsp[-1].str_value), (yyvsp[0].double_value));
     free((yyvsp[-1].str_value));
 }
-#line 6773 "parser.cpp"
+#line 6791 "parser.cpp"
     break;
 
-  case 313: /* command_statement: CREATE SNAPSHOT IDENTIFIER ON TABLE IDENTIFIER  */
-#line 2298 "parser.y"
+  case 314: /* command_statement: CREATE SNAPSHOT IDENTIFIER ON TABLE IDENTIFIER  */
+#line 2309 "parser.y"
                                                  {
     ParserHelper::ToLower((yyvsp[-3].str_value));
     ParserHelper::ToLower((yyvsp[0].str_value));
@@ -6782,11 +6800,11 @@ yyreduce:
     free((yyvsp[-3].str_value));
     free((yyvsp[0].str_value));
 }
-#line 6786 "parser.cpp"
+#line 6804 "parser.cpp"
     break;
 
-  case 314: /* command_statement: CREATE SNAPSHOT IDENTIFIER ON DATABASE IDENTIFIER  */
-#line 2306 "parser.y"
+  case 315: /* command_statement: CREATE SNAPSHOT IDENTIFIER ON DATABASE IDENTIFIER  */
+#line 2317 "parser.y"
                                                     {
     ParserHelper::ToLower((yyvsp[-3].str_value));
     ParserHelper::ToLower((yyvsp[0].str_value));
@@ -6795,55 +6813,55 @@ yyreduce:
     free((yyvsp[-3].str_value));
     free((yyvsp[0].str_value));
 }
-#line 6799 "parser.cpp"
+#line 6817 "parser.cpp"
     break;
 
-  case 315: /* command_statement: CREATE SNAPSHOT IDENTIFIER ON SYSTEM  */
-#line 2314 "parser.y"
+  case 316: /* command_statement: CREATE SNAPSHOT IDENTIFIER ON SYSTEM  */
+#line 2325 "parser.y"
                                        {
     ParserHelper::ToLower((yyvsp[-2].str_value));
     (yyval.command_stmt) = new infinity::CommandStatement();
     (yyval.command_stmt)->command_info_ = std::make_shared<infinity::SnapshotCmd>((yyvsp[-2].str_value), infinity::SnapshotOp::kCreate, infinity::SnapshotScope::kSystem);
     free((yyvsp[-2].str_value));
 }
-#line 6810 "parser.cpp"
+#line 6828 "parser.cpp"
     break;
 
-  case 316: /* command_statement: DROP SNAPSHOT IDENTIFIER  */
-#line 2320 "parser.y"
+  case 317: /* command_statement: DROP SNAPSHOT IDENTIFIER  */
+#line 2331 "parser.y"
                            {
     ParserHelper::ToLower((yyvsp[0].str_value));
     (yyval.command_stmt) = new infinity::CommandStatement();
     (yyval.command_stmt)->command_info_ = std::make_shared<infinity::SnapshotCmd>((yyvsp[0].str_value), infinity::SnapshotOp::kDrop, infinity::SnapshotScope::kIgnore);
     free((yyvsp[0].str_value));
 }
-#line 6821 "parser.cpp"
+#line 6839 "parser.cpp"
     break;
 
-  case 317: /* command_statement: RESTORE DATABASE SNAPSHOT IDENTIFIER  */
-#line 2326 "parser.y"
+  case 318: /* command_statement: RESTORE DATABASE SNAPSHOT IDENTIFIER  */
+#line 2337 "parser.y"
                                        {
     ParserHelper::ToLower((yyvsp[0].str_value));
     (yyval.command_stmt) = new infinity::CommandStatement();
     (yyval.command_stmt)->command_info_ = std::make_shared<infinity::SnapshotCmd>((yyvsp[0].str_value), infinity::SnapshotOp::kRestore, infinity::SnapshotScope::kDatabase);
     free((yyvsp[0].str_value));
 }
-#line 6832 "parser.cpp"
+#line 6850 "parser.cpp"
     break;
 
-  case 318: /* command_statement: RESTORE TABLE SNAPSHOT IDENTIFIER  */
-#line 2332 "parser.y"
+  case 319: /* command_statement: RESTORE TABLE SNAPSHOT IDENTIFIER  */
+#line 2343 "parser.y"
                                     {
     ParserHelper::ToLower((yyvsp[0].str_value));
     (yyval.command_stmt) = new infinity::CommandStatement();
     (yyval.command_stmt)->command_info_ = std::make_shared<infinity::SnapshotCmd>((yyvsp[0].str_value), infinity::SnapshotOp::kRestore, infinity::SnapshotScope::kTable);
     free((yyvsp[0].str_value));
 }
-#line 6843 "parser.cpp"
+#line 6861 "parser.cpp"
     break;
 
-  case 319: /* compact_statement: COMPACT TABLE table_name  */
-#line 2339 "parser.y"
+  case 320: /* compact_statement: COMPACT TABLE table_name  */
+#line 2350 "parser.y"
                                             {
     std::string schema_name;
     if ((yyvsp[0].table_name_t)->schema_name_ptr_ != nullptr) {
@@ -6856,41 +6874,41 @@ yyreduce:
     (yyval.compact_stmt) = new infinity::ManualCompactStatement(std::move(schema_name), std::move(table_name));
     delete (yyvsp[0].table_name_t);
 }
-#line 6860 "parser.cpp"
+#line 6878 "parser.cpp"
     break;
 
-  case 320: /* admin_statement: ADMIN SHOW CATALOGS  */
-#line 2352 "parser.y"
+  case 321: /* admin_statement: ADMIN SHOW CATALOGS  */
+#line 2363 "parser.y"
                                      {
      (yyval.admin_stmt) = new infinity::AdminStatement();
      (yyval.admin_stmt)->admin_type_ = infinity::AdminStmtType::kListCatalogs;
 }
-#line 6869 "parser.cpp"
+#line 6887 "parser.cpp"
     break;
 
-  case 321: /* admin_statement: ADMIN SHOW CATALOG LONG_VALUE  */
-#line 2356 "parser.y"
+  case 322: /* admin_statement: ADMIN SHOW CATALOG LONG_VALUE  */
+#line 2367 "parser.y"
                                 {
      (yyval.admin_stmt) = new infinity::AdminStatement();
      (yyval.admin_stmt)->admin_type_ = infinity::AdminStmtType::kShowCatalog;
      (yyval.admin_stmt)->catalog_file_index_ = (yyvsp[0].long_value);
 }
-#line 6879 "parser.cpp"
+#line 6897 "parser.cpp"
     break;
 
-  case 322: /* admin_statement: ADMIN SHOW CATALOG LONG_VALUE LONG_VALUE DATABASES  */
-#line 2361 "parser.y"
+  case 323: /* admin_statement: ADMIN SHOW CATALOG LONG_VALUE LONG_VALUE DATABASES  */
+#line 2372 "parser.y"
                                                      {
      (yyval.admin_stmt) = new infinity::AdminStatement();
      (yyval.admin_stmt)->admin_type_ = infinity::AdminStmtType::kListDatabases;
      (yyval.admin_stmt)->catalog_file_start_index_ = (yyvsp[-2].long_value);
      (yyval.admin_stmt)->catalog_file_end_index_ = (yyvsp[-1].long_value);
 }
-#line 6890 "parser.cpp"
+#line 6908 "parser.cpp"
     break;
 
-  case 323: /* admin_statement: ADMIN SHOW CATALOG LONG_VALUE LONG_VALUE DATABASE LONG_VALUE  */
-#line 2367 "parser.y"
+  case 324: /* admin_statement: ADMIN SHOW CATALOG LONG_VALUE LONG_VALUE DATABASE LONG_VALUE  */
+#line 2378 "parser.y"
                                                                {
      (yyval.admin_stmt) = new infinity::AdminStatement();
      (yyval.admin_stmt)->admin_type_ = infinity::AdminStmtType::kShowDatabase;
@@ -6898,11 +6916,11 @@ yyreduce:
      (yyval.admin_stmt)->catalog_file_end_index_ = (yyvsp[-2].long_value);
      (yyval.admin_stmt)->database_meta_index_ = (yyvsp[0].long_value);
 }
-#line 6902 "parser.cpp"
+#line 6920 "parser.cpp"
     break;
 
-  case 324: /* admin_statement: ADMIN SHOW CATALOG LONG_VALUE LONG_VALUE DATABASE LONG_VALUE LONG_VALUE TABLES  */
-#line 2374 "parser.y"
+  case 325: /* admin_statement: ADMIN SHOW CATALOG LONG_VALUE LONG_VALUE DATABASE LONG_VALUE LONG_VALUE TABLES  */
+#line 2385 "parser.y"
                                                                                  {
      (yyval.admin_stmt) = new infinity::AdminStatement();
      (yyval.admin_stmt)->admin_type_ = infinity::AdminStmtType::kListTables;
@@ -6911,11 +6929,11 @@ yyreduce:
      (yyval.admin_stmt)->database_meta_index_ = (yyvsp[-2].long_value);
      (yyval.admin_stmt)->database_entry_index_ = (yyvsp[-1].long_value);
 }
-#line 6915 "parser.cpp"
+#line 6933 "parser.cpp"
     break;
 
-  case 325: /* admin_statement: ADMIN SHOW CATALOG LONG_VALUE LONG_VALUE DATABASE LONG_VALUE LONG_VALUE TABLE LONG_VALUE  */
-#line 2382 "parser.y"
+  case 326: /* admin_statement: ADMIN SHOW CATALOG LONG_VALUE LONG_VALUE DATABASE LONG_VALUE LONG_VALUE TABLE LONG_VALUE  */
+#line 2393 "parser.y"
                                                                                            {
      (yyval.admin_stmt) = new infinity::AdminStatement();
      (yyval.admin_stmt)->admin_type_ = infinity::AdminStmtType::kShowTable;
@@ -6925,11 +6943,11 @@ yyreduce:
      (yyval.admin_stmt)->database_entry_index_ = (yyvsp[-2].long_value);
      (yyval.admin_stmt)->table_meta_index_ = (yyvsp[0].long_value);
 }
-#line 6929 "parser.cpp"
+#line 6947 "parser.cpp"
     break;
 
-  case 326: /* admin_statement: ADMIN SHOW CATALOG LONG_VALUE LONG_VALUE DATABASE LONG_VALUE LONG_VALUE TABLE LONG_VALUE LONG_VALUE COLUMNS  */
-#line 2391 "parser.y"
+  case 327: /* admin_statement: ADMIN SHOW CATALOG LONG_VALUE LONG_VALUE DATABASE LONG_VALUE LONG_VALUE TABLE LONG_VALUE LONG_VALUE COLUMNS  */
+#line 2402 "parser.y"
                                                                                                               {
      (yyval.admin_stmt) = new infinity::AdminStatement();
      (yyval.admin_stmt)->admin_type_ = infinity::AdminStmtType::kShowColumn;
@@ -6940,11 +6958,11 @@ yyreduce:
      (yyval.admin_stmt)->table_meta_index_ = (yyvsp[-2].long_value);
      (yyval.admin_stmt)->table_entry_index_ = (yyvsp[-1].long_value);
 }
-#line 6944 "parser.cpp"
+#line 6962 "parser.cpp"
     break;
 
-  case 327: /* admin_statement: ADMIN SHOW CATALOG LONG_VALUE LONG_VALUE DATABASE LONG_VALUE LONG_VALUE TABLE LONG_VALUE LONG_VALUE SEGMENTS  */
-#line 2401 "parser.y"
+  case 328: /* admin_statement: ADMIN SHOW CATALOG LONG_VALUE LONG_VALUE DATABASE LONG_VALUE LONG_VALUE TABLE LONG_VALUE LONG_VALUE SEGMENTS  */
+#line 2412 "parser.y"
                                                                                                                {
      (yyval.admin_stmt) = new infinity::AdminStatement();
      (yyval.admin_stmt)->admin_type_ = infinity::AdminStmtType::kListSegments;
@@ -6955,11 +6973,11 @@ yyreduce:
      (yyval.admin_stmt)->table_meta_index_ = (yyvsp[-2].long_value);
      (yyval.admin_stmt)->table_entry_index_ = (yyvsp[-1].long_value);
 }
-#line 6959 "parser.cpp"
+#line 6977 "parser.cpp"
     break;
 
-  case 328: /* admin_statement: ADMIN SHOW CATALOG LONG_VALUE LONG_VALUE DATABASE LONG_VALUE LONG_VALUE TABLE LONG_VALUE LONG_VALUE SEGMENT LONG_VALUE  */
-#line 2411 "parser.y"
+  case 329: /* admin_statement: ADMIN SHOW CATALOG LONG_VALUE LONG_VALUE DATABASE LONG_VALUE LONG_VALUE TABLE LONG_VALUE LONG_VALUE SEGMENT LONG_VALUE  */
+#line 2422 "parser.y"
                                                                                                                          {
      (yyval.admin_stmt) = new infinity::AdminStatement();
      (yyval.admin_stmt)->admin_type_ = infinity::AdminStmtType::kShowSegment;
@@ -6971,11 +6989,11 @@ yyreduce:
      (yyval.admin_stmt)->table_entry_index_ = (yyvsp[-2].long_value);
      (yyval.admin_stmt)->segment_index_ = (yyvsp[0].long_value);
 }
-#line 6975 "parser.cpp"
+#line 6993 "parser.cpp"
     break;
 
-  case 329: /* admin_statement: ADMIN SHOW CATALOG LONG_VALUE LONG_VALUE DATABASE LONG_VALUE LONG_VALUE TABLE LONG_VALUE LONG_VALUE SEGMENT LONG_VALUE BLOCKS  */
-#line 2422 "parser.y"
+  case 330: /* admin_statement: ADMIN SHOW CATALOG LONG_VALUE LONG_VALUE DATABASE LONG_VALUE LONG_VALUE TABLE LONG_VALUE LONG_VALUE SEGMENT LONG_VALUE BLOCKS  */
+#line 2433 "parser.y"
                                                                                                                                 {
      (yyval.admin_stmt) = new infinity::AdminStatement();
      (yyval.admin_stmt)->admin_type_ = infinity::AdminStmtType::kListBlocks;
@@ -6987,11 +7005,11 @@ yyreduce:
      (yyval.admin_stmt)->table_entry_index_ = (yyvsp[-3].long_value);
      (yyval.admin_stmt)->segment_index_ = (yyvsp[-1].long_value);
 }
-#line 6991 "parser.cpp"
+#line 7009 "parser.cpp"
     break;
 
-  case 330: /* admin_statement: ADMIN SHOW CATALOG LONG_VALUE LONG_VALUE DATABASE LONG_VALUE LONG_VALUE TABLE LONG_VALUE LONG_VALUE SEGMENT LONG_VALUE BLOCK LONG_VALUE  */
-#line 2433 "parser.y"
+  case 331: /* admin_statement: ADMIN SHOW CATALOG LONG_VALUE LONG_VALUE DATABASE LONG_VALUE LONG_VALUE TABLE LONG_VALUE LONG_VALUE SEGMENT LONG_VALUE BLOCK LONG_VALUE  */
+#line 2444 "parser.y"
                                                                                                                                           {
      (yyval.admin_stmt) = new infinity::AdminStatement();
      (yyval.admin_stmt)->admin_type_ = infinity::AdminStmtType::kShowBlock;
@@ -7004,11 +7022,11 @@ yyreduce:
      (yyval.admin_stmt)->segment_index_ = (yyvsp[-2].long_value);
      (yyval.admin_stmt)->block_index_ = (yyvsp[0].long_value);
 }
-#line 7008 "parser.cpp"
+#line 7026 "parser.cpp"
     break;
 
-  case 331: /* admin_statement: ADMIN SHOW CATALOG LONG_VALUE LONG_VALUE DATABASE LONG_VALUE LONG_VALUE TABLE LONG_VALUE LONG_VALUE SEGMENT LONG_VALUE BLOCK LONG_VALUE COLUMNS  */
-#line 2445 "parser.y"
+  case 332: /* admin_statement: ADMIN SHOW CATALOG LONG_VALUE LONG_VALUE DATABASE LONG_VALUE LONG_VALUE TABLE LONG_VALUE LONG_VALUE SEGMENT LONG_VALUE BLOCK LONG_VALUE COLUMNS  */
+#line 2456 "parser.y"
                                                                                                                                                   {
      (yyval.admin_stmt) = new infinity::AdminStatement();
      (yyval.admin_stmt)->admin_type_ = infinity::AdminStmtType::kListColumns;
@@ -7021,11 +7039,11 @@ yyreduce:
      (yyval.admin_stmt)->segment_index_ = (yyvsp[-3].long_value);
      (yyval.admin_stmt)->block_index_ = (yyvsp[-1].long_value);
 }
-#line 7025 "parser.cpp"
+#line 7043 "parser.cpp"
     break;
 
-  case 332: /* admin_statement: ADMIN SHOW CATALOG LONG_VALUE LONG_VALUE DATABASE LONG_VALUE LONG_VALUE TABLE LONG_VALUE LONG_VALUE INDEXES  */
-#line 2457 "parser.y"
+  case 333: /* admin_statement: ADMIN SHOW CATALOG LONG_VALUE LONG_VALUE DATABASE LONG_VALUE LONG_VALUE TABLE LONG_VALUE LONG_VALUE INDEXES  */
+#line 2468 "parser.y"
                                                                                                               {
      (yyval.admin_stmt) = new infinity::AdminStatement();
      (yyval.admin_stmt)->admin_type_ = infinity::AdminStmtType::kListIndexes;
@@ -7036,11 +7054,11 @@ yyreduce:
      (yyval.admin_stmt)->table_meta_index_ = (yyvsp[-2].long_value);
      (yyval.admin_stmt)->table_entry_index_ = (yyvsp[-1].long_value);
 }
-#line 7040 "parser.cpp"
+#line 7058 "parser.cpp"
     break;
 
-  case 333: /* admin_statement: ADMIN SHOW CATALOG LONG_VALUE LONG_VALUE DATABASE LONG_VALUE LONG_VALUE TABLE LONG_VALUE LONG_VALUE INDEX LONG_VALUE  */
-#line 2467 "parser.y"
+  case 334: /* admin_statement: ADMIN SHOW CATALOG LONG_VALUE LONG_VALUE DATABASE LONG_VALUE LONG_VALUE TABLE LONG_VALUE LONG_VALUE INDEX LONG_VALUE  */
+#line 2478 "parser.y"
                                                                                                                        {
      (yyval.admin_stmt) = new infinity::AdminStatement();
      (yyval.admin_stmt)->admin_type_ = infinity::AdminStmtType::kShowIndex;
@@ -7052,11 +7070,11 @@ yyreduce:
      (yyval.admin_stmt)->table_entry_index_ = (yyvsp[-2].long_value);
      (yyval.admin_stmt)->index_meta_index_ = (yyvsp[0].long_value);
 }
-#line 7056 "parser.cpp"
+#line 7074 "parser.cpp"
     break;
 
-  case 334: /* admin_statement: ADMIN SHOW CATALOG LONG_VALUE LONG_VALUE DATABASE LONG_VALUE LONG_VALUE TABLE LONG_VALUE LONG_VALUE INDEX LONG_VALUE LONG_VALUE SEGMENTS  */
-#line 2478 "parser.y"
+  case 335: /* admin_statement: ADMIN SHOW CATALOG LONG_VALUE LONG_VALUE DATABASE LONG_VALUE LONG_VALUE TABLE LONG_VALUE LONG_VALUE INDEX LONG_VALUE LONG_VALUE SEGMENTS  */
+#line 2489 "parser.y"
                                                                                                                                            {
      (yyval.admin_stmt) = new infinity::AdminStatement();
      (yyval.admin_stmt)->admin_type_ = infinity::AdminStmtType::kListIndexSegments;
@@ -7069,11 +7087,11 @@ yyreduce:
      (yyval.admin_stmt)->index_meta_index_ = (yyvsp[-2].long_value);
      (yyval.admin_stmt)->index_entry_index_ = (yyvsp[-1].long_value);
 }
-#line 7073 "parser.cpp"
+#line 7091 "parser.cpp"
     break;
 
-  case 335: /* admin_statement: ADMIN SHOW CATALOG LONG_VALUE LONG_VALUE DATABASE LONG_VALUE LONG_VALUE TABLE LONG_VALUE LONG_VALUE INDEX LONG_VALUE LONG_VALUE SEGMENT LONG_VALUE  */
-#line 2490 "parser.y"
+  case 336: /* admin_statement: ADMIN SHOW CATALOG LONG_VALUE LONG_VALUE DATABASE LONG_VALUE LONG_VALUE TABLE LONG_VALUE LONG_VALUE INDEX LONG_VALUE LONG_VALUE SEGMENT LONG_VALUE  */
+#line 2501 "parser.y"
                                                                                                                                                      {
      (yyval.admin_stmt) = new infinity::AdminStatement();
      (yyval.admin_stmt)->admin_type_ = infinity::AdminStmtType::kShowIndexSegment;
@@ -7087,120 +7105,120 @@ yyreduce:
      (yyval.admin_stmt)->index_entry_index_ = (yyvsp[-2].long_value);
      (yyval.admin_stmt)->segment_index_ = (yyvsp[0].long_value);
 }
-#line 7091 "parser.cpp"
+#line 7109 "parser.cpp"
     break;
 
-  case 336: /* admin_statement: ADMIN SHOW LOGS  */
-#line 2503 "parser.y"
+  case 337: /* admin_statement: ADMIN SHOW LOGS  */
+#line 2514 "parser.y"
                   {
      (yyval.admin_stmt) = new infinity::AdminStatement();
      (yyval.admin_stmt)->admin_type_ = infinity::AdminStmtType::kListLogFiles;
 }
-#line 7100 "parser.cpp"
+#line 7118 "parser.cpp"
     break;
 
-  case 337: /* admin_statement: ADMIN SHOW LOG LONG_VALUE  */
-#line 2507 "parser.y"
+  case 338: /* admin_statement: ADMIN SHOW LOG LONG_VALUE  */
+#line 2518 "parser.y"
                             {
      (yyval.admin_stmt) = new infinity::AdminStatement();
      (yyval.admin_stmt)->admin_type_ = infinity::AdminStmtType::kShowLogFile;
      (yyval.admin_stmt)->log_file_index_ = (yyvsp[0].long_value);
 }
-#line 7110 "parser.cpp"
+#line 7128 "parser.cpp"
     break;
 
-  case 338: /* admin_statement: ADMIN SHOW LOG LONG_VALUE INDEXES  */
-#line 2512 "parser.y"
+  case 339: /* admin_statement: ADMIN SHOW LOG LONG_VALUE INDEXES  */
+#line 2523 "parser.y"
                                     {
      (yyval.admin_stmt) = new infinity::AdminStatement();
      (yyval.admin_stmt)->admin_type_ = infinity::AdminStmtType::kListLogIndexes;
      (yyval.admin_stmt)->log_file_index_ = (yyvsp[-1].long_value);
 }
-#line 7120 "parser.cpp"
+#line 7138 "parser.cpp"
     break;
 
-  case 339: /* admin_statement: ADMIN SHOW LOG LONG_VALUE INDEX LONG_VALUE  */
-#line 2517 "parser.y"
+  case 340: /* admin_statement: ADMIN SHOW LOG LONG_VALUE INDEX LONG_VALUE  */
+#line 2528 "parser.y"
                                              {
      (yyval.admin_stmt) = new infinity::AdminStatement();
      (yyval.admin_stmt)->admin_type_ = infinity::AdminStmtType::kShowLogIndex;
      (yyval.admin_stmt)->log_file_index_ = (yyvsp[-2].long_value);
      (yyval.admin_stmt)->log_index_in_file_ = (yyvsp[0].long_value);
 }
-#line 7131 "parser.cpp"
+#line 7149 "parser.cpp"
     break;
 
-  case 340: /* admin_statement: ADMIN SHOW CONFIGS  */
-#line 2523 "parser.y"
+  case 341: /* admin_statement: ADMIN SHOW CONFIGS  */
+#line 2534 "parser.y"
                      {
      (yyval.admin_stmt) = new infinity::AdminStatement();
      (yyval.admin_stmt)->admin_type_ = infinity::AdminStmtType::kListConfigs;
 }
-#line 7140 "parser.cpp"
+#line 7158 "parser.cpp"
     break;
 
-  case 341: /* admin_statement: ADMIN SHOW VARIABLES  */
-#line 2527 "parser.y"
+  case 342: /* admin_statement: ADMIN SHOW VARIABLES  */
+#line 2538 "parser.y"
                        {
      (yyval.admin_stmt) = new infinity::AdminStatement();
      (yyval.admin_stmt)->admin_type_ = infinity::AdminStmtType::kListVariables;
 }
-#line 7149 "parser.cpp"
+#line 7167 "parser.cpp"
     break;
 
-  case 342: /* admin_statement: ADMIN SHOW VARIABLE IDENTIFIER  */
-#line 2531 "parser.y"
+  case 343: /* admin_statement: ADMIN SHOW VARIABLE IDENTIFIER  */
+#line 2542 "parser.y"
                                  {
      (yyval.admin_stmt) = new infinity::AdminStatement();
      (yyval.admin_stmt)->admin_type_ = infinity::AdminStmtType::kShowVariable;
      (yyval.admin_stmt)->variable_name_ = (yyvsp[0].str_value);
      free((yyvsp[0].str_value));
 }
-#line 7160 "parser.cpp"
+#line 7178 "parser.cpp"
     break;
 
-  case 343: /* admin_statement: ADMIN CREATE SNAPSHOT  */
-#line 2537 "parser.y"
+  case 344: /* admin_statement: ADMIN CREATE SNAPSHOT  */
+#line 2548 "parser.y"
                         {
      (yyval.admin_stmt) = new infinity::AdminStatement();
      (yyval.admin_stmt)->admin_type_ = infinity::AdminStmtType::kCreateSnapshot;
 }
-#line 7169 "parser.cpp"
+#line 7187 "parser.cpp"
     break;
 
-  case 344: /* admin_statement: ADMIN SHOW SNAPSHOTS  */
-#line 2541 "parser.y"
+  case 345: /* admin_statement: ADMIN SHOW SNAPSHOTS  */
+#line 2552 "parser.y"
                        {
      (yyval.admin_stmt) = new infinity::AdminStatement();
      (yyval.admin_stmt)->admin_type_ = infinity::AdminStmtType::kListSnapshots;
 }
-#line 7178 "parser.cpp"
+#line 7196 "parser.cpp"
     break;
 
-  case 345: /* admin_statement: ADMIN SHOW SNAPSHOT IDENTIFIER  */
-#line 2545 "parser.y"
+  case 346: /* admin_statement: ADMIN SHOW SNAPSHOT IDENTIFIER  */
+#line 2556 "parser.y"
                                  {
      (yyval.admin_stmt) = new infinity::AdminStatement();
      (yyval.admin_stmt)->admin_type_ = infinity::AdminStmtType::kShowSnapshot;
      (yyval.admin_stmt)->snapshot_name_ = (yyvsp[0].str_value);
      free((yyvsp[0].str_value));
 }
-#line 7189 "parser.cpp"
+#line 7207 "parser.cpp"
     break;
 
-  case 346: /* admin_statement: ADMIN DELETE SNAPSHOT STRING  */
-#line 2551 "parser.y"
+  case 347: /* admin_statement: ADMIN DELETE SNAPSHOT STRING  */
+#line 2562 "parser.y"
                                {
      (yyval.admin_stmt) = new infinity::AdminStatement();
      (yyval.admin_stmt)->admin_type_ = infinity::AdminStmtType::kDeleteSnapshot;
      (yyval.admin_stmt)->snapshot_name_ = (yyvsp[0].str_value);
      free((yyvsp[0].str_value));
 }
-#line 7200 "parser.cpp"
+#line 7218 "parser.cpp"
     break;
 
-  case 347: /* admin_statement: ADMIN EXPORT SNAPSHOT STRING TO STRING  */
-#line 2557 "parser.y"
+  case 348: /* admin_statement: ADMIN EXPORT SNAPSHOT STRING TO STRING  */
+#line 2568 "parser.y"
                                          {
      (yyval.admin_stmt) = new infinity::AdminStatement();
      (yyval.admin_stmt)->admin_type_ = infinity::AdminStmtType::kExportSnapshot;
@@ -7209,82 +7227,82 @@ yyreduce:
      free((yyvsp[-2].str_value));
      free((yyvsp[0].str_value));
 }
-#line 7213 "parser.cpp"
+#line 7231 "parser.cpp"
     break;
 
-  case 348: /* admin_statement: ADMIN RECOVER FROM SNAPSHOT STRING  */
-#line 2565 "parser.y"
+  case 349: /* admin_statement: ADMIN RECOVER FROM SNAPSHOT STRING  */
+#line 2576 "parser.y"
                                      {
      (yyval.admin_stmt) = new infinity::AdminStatement();
      (yyval.admin_stmt)->admin_type_ = infinity::AdminStmtType::kRecoverFromSnapshot;
      (yyval.admin_stmt)->snapshot_name_ = (yyvsp[0].str_value);
      free((yyvsp[0].str_value));
 }
-#line 7224 "parser.cpp"
+#line 7242 "parser.cpp"
     break;
 
-  case 349: /* admin_statement: ADMIN SHOW NODES  */
-#line 2571 "parser.y"
+  case 350: /* admin_statement: ADMIN SHOW NODES  */
+#line 2582 "parser.y"
                    {
      (yyval.admin_stmt) = new infinity::AdminStatement();
      (yyval.admin_stmt)->admin_type_ = infinity::AdminStmtType::kListNodes;
 }
-#line 7233 "parser.cpp"
+#line 7251 "parser.cpp"
     break;
 
-  case 350: /* admin_statement: ADMIN SHOW NODE STRING  */
-#line 2575 "parser.y"
+  case 351: /* admin_statement: ADMIN SHOW NODE STRING  */
+#line 2586 "parser.y"
                          {
      (yyval.admin_stmt) = new infinity::AdminStatement();
      (yyval.admin_stmt)->admin_type_ = infinity::AdminStmtType::kShowNode;
      (yyval.admin_stmt)->node_name_ = (yyvsp[0].str_value);
      free((yyvsp[0].str_value));
 }
-#line 7244 "parser.cpp"
+#line 7262 "parser.cpp"
     break;
 
-  case 351: /* admin_statement: ADMIN SHOW NODE  */
-#line 2581 "parser.y"
+  case 352: /* admin_statement: ADMIN SHOW NODE  */
+#line 2592 "parser.y"
                   {
      (yyval.admin_stmt) = new infinity::AdminStatement();
      (yyval.admin_stmt)->admin_type_ = infinity::AdminStmtType::kShowCurrentNode;
 }
-#line 7253 "parser.cpp"
+#line 7271 "parser.cpp"
     break;
 
-  case 352: /* admin_statement: ADMIN REMOVE NODE STRING  */
-#line 2585 "parser.y"
+  case 353: /* admin_statement: ADMIN REMOVE NODE STRING  */
+#line 2596 "parser.y"
                            {
      (yyval.admin_stmt) = new infinity::AdminStatement();
      (yyval.admin_stmt)->admin_type_ = infinity::AdminStmtType::kRemoveNode;
      (yyval.admin_stmt)->node_name_ = (yyvsp[0].str_value);
      free((yyvsp[0].str_value));
 }
-#line 7264 "parser.cpp"
+#line 7282 "parser.cpp"
     break;
 
-  case 353: /* admin_statement: ADMIN SET ADMIN  */
-#line 2591 "parser.y"
+  case 354: /* admin_statement: ADMIN SET ADMIN  */
+#line 2602 "parser.y"
                   {
      (yyval.admin_stmt) = new infinity::AdminStatement();
      (yyval.admin_stmt)->admin_type_ = infinity::AdminStmtType::kSetRole;
      (yyval.admin_stmt)->node_role_ = infinity::NodeRole::kAdmin;
 }
-#line 7274 "parser.cpp"
+#line 7292 "parser.cpp"
     break;
 
-  case 354: /* admin_statement: ADMIN SET STANDALONE  */
-#line 2596 "parser.y"
+  case 355: /* admin_statement: ADMIN SET STANDALONE  */
+#line 2607 "parser.y"
                        {
      (yyval.admin_stmt) = new infinity::AdminStatement();
      (yyval.admin_stmt)->admin_type_ = infinity::AdminStmtType::kSetRole;
      (yyval.admin_stmt)->node_role_ = infinity::NodeRole::kStandalone;
 }
-#line 7284 "parser.cpp"
+#line 7302 "parser.cpp"
     break;
 
-  case 355: /* admin_statement: ADMIN SET LEADER USING STRING  */
-#line 2601 "parser.y"
+  case 356: /* admin_statement: ADMIN SET LEADER USING STRING  */
+#line 2612 "parser.y"
                                 {
      (yyval.admin_stmt) = new infinity::AdminStatement();
      (yyval.admin_stmt)->admin_type_ = infinity::AdminStmtType::kSetRole;
@@ -7292,11 +7310,11 @@ yyreduce:
      (yyval.admin_stmt)->node_name_ = (yyvsp[0].str_value);
      free((yyvsp[0].str_value));
 }
-#line 7296 "parser.cpp"
+#line 7314 "parser.cpp"
     break;
 
-  case 356: /* admin_statement: ADMIN CONNECT STRING AS FOLLOWER USING STRING  */
-#line 2608 "parser.y"
+  case 357: /* admin_statement: ADMIN CONNECT STRING AS FOLLOWER USING STRING  */
+#line 2619 "parser.y"
                                                 {
      (yyval.admin_stmt) = new infinity::AdminStatement();
      (yyval.admin_stmt)->admin_type_ = infinity::AdminStmtType::kSetRole;
@@ -7306,11 +7324,11 @@ yyreduce:
      free((yyvsp[-4].str_value));
      free((yyvsp[0].str_value));
 }
-#line 7310 "parser.cpp"
+#line 7328 "parser.cpp"
     break;
 
-  case 357: /* admin_statement: ADMIN CONNECT STRING AS LEARNER USING STRING  */
-#line 2617 "parser.y"
+  case 358: /* admin_statement: ADMIN CONNECT STRING AS LEARNER USING STRING  */
+#line 2628 "parser.y"
                                                {
      (yyval.admin_stmt) = new infinity::AdminStatement();
      (yyval.admin_stmt)->admin_type_ = infinity::AdminStmtType::kSetRole;
@@ -7320,11 +7338,11 @@ yyreduce:
      free((yyvsp[-4].str_value));
      free((yyvsp[0].str_value));
 }
-#line 7324 "parser.cpp"
+#line 7342 "parser.cpp"
     break;
 
-  case 358: /* alter_statement: ALTER TABLE table_name RENAME TO IDENTIFIER  */
-#line 2627 "parser.y"
+  case 359: /* alter_statement: ALTER TABLE table_name RENAME TO IDENTIFIER  */
+#line 2638 "parser.y"
                                                               {
     auto *ret = new infinity::RenameTableStatement((yyvsp[-3].table_name_t)->schema_name_ptr_, (yyvsp[-3].table_name_t)->table_name_ptr_);
     (yyval.alter_stmt) = ret;
@@ -7334,11 +7352,11 @@ yyreduce:
     free((yyvsp[-3].table_name_t)->table_name_ptr_);
     delete (yyvsp[-3].table_name_t);
 }
-#line 7338 "parser.cpp"
+#line 7356 "parser.cpp"
     break;
 
-  case 359: /* alter_statement: ALTER TABLE table_name ADD COLUMN '(' column_def_array ')'  */
-#line 2636 "parser.y"
+  case 360: /* alter_statement: ALTER TABLE table_name ADD COLUMN '(' column_def_array ')'  */
+#line 2647 "parser.y"
                                                              {
     auto *ret = new infinity::AddColumnsStatement((yyvsp[-5].table_name_t)->schema_name_ptr_, (yyvsp[-5].table_name_t)->table_name_ptr_);
     (yyval.alter_stmt) = ret;
@@ -7351,11 +7369,11 @@ yyreduce:
     free((yyvsp[-5].table_name_t)->table_name_ptr_);
     delete (yyvsp[-5].table_name_t);
 }
-#line 7355 "parser.cpp"
+#line 7373 "parser.cpp"
     break;
 
-  case 360: /* alter_statement: ALTER TABLE table_name DROP COLUMN '(' identifier_array ')'  */
-#line 2648 "parser.y"
+  case 361: /* alter_statement: ALTER TABLE table_name DROP COLUMN '(' identifier_array ')'  */
+#line 2659 "parser.y"
                                                               {
     auto *ret = new infinity::DropColumnsStatement((yyvsp[-5].table_name_t)->schema_name_ptr_, (yyvsp[-5].table_name_t)->table_name_ptr_);
     (yyval.alter_stmt) = ret;
@@ -7367,29 +7385,29 @@ yyreduce:
     free((yyvsp[-5].table_name_t)->table_name_ptr_);
     delete (yyvsp[-5].table_name_t);
 }
-#line 7371 "parser.cpp"
+#line 7389 "parser.cpp"
     break;
 
-  case 361: /* expr_array: expr_alias  */
-#line 2664 "parser.y"
+  case 362: /* expr_array: expr_alias  */
+#line 2675 "parser.y"
                         {
     (yyval.expr_array_t) = new std::vector<infinity::ParsedExpr*>();
     (yyval.expr_array_t)->emplace_back((yyvsp[0].expr_t));
 }
-#line 7380 "parser.cpp"
+#line 7398 "parser.cpp"
     break;
 
-  case 362: /* expr_array: expr_array ',' expr_alias  */
-#line 2668 "parser.y"
+  case 363: /* expr_array: expr_array ',' expr_alias  */
+#line 2679 "parser.y"
                             {
     (yyvsp[-2].expr_array_t)->emplace_back((yyvsp[0].expr_t));
     (yyval.expr_array_t) = (yyvsp[-2].expr_array_t);
 }
-#line 7389 "parser.cpp"
+#line 7407 "parser.cpp"
     break;
 
-  case 363: /* insert_row_list: '(' expr_array ')'  */
-#line 2673 "parser.y"
+  case 364: /* insert_row_list: '(' expr_array ')'  */
+#line 2684 "parser.y"
                                      {
     auto res = std::make_unique<infinity::InsertRowExpr>();
     for (auto* &expr : *(yyvsp[-1].expr_array_t)) {
@@ -7400,11 +7418,11 @@ yyreduce:
     (yyval.insert_row_list_t) = new std::vector<infinity::InsertRowExpr*>();
     (yyval.insert_row_list_t)->emplace_back(res.release());
 }
-#line 7404 "parser.cpp"
+#line 7422 "parser.cpp"
     break;
 
-  case 364: /* insert_row_list: insert_row_list ',' '(' expr_array ')'  */
-#line 2683 "parser.y"
+  case 365: /* insert_row_list: insert_row_list ',' '(' expr_array ')'  */
+#line 2694 "parser.y"
                                          {
     (yyval.insert_row_list_t) = (yyvsp[-4].insert_row_list_t);
     auto res = std::make_unique<infinity::InsertRowExpr>();
@@ -7415,57 +7433,57 @@ yyreduce:
     delete (yyvsp[-1].expr_array_t);
     (yyval.insert_row_list_t)->emplace_back(res.release());
 }
-#line 7419 "parser.cpp"
+#line 7437 "parser.cpp"
     break;
 
-  case 365: /* expr_alias: expr AS IDENTIFIER  */
-#line 2705 "parser.y"
+  case 366: /* expr_alias: expr AS IDENTIFIER  */
+#line 2716 "parser.y"
                                 {
     (yyval.expr_t) = (yyvsp[-2].expr_t);
     ParserHelper::ToLower((yyvsp[0].str_value));
     (yyval.expr_t)->alias_ = (yyvsp[0].str_value);
     free((yyvsp[0].str_value));
 }
-#line 7430 "parser.cpp"
+#line 7448 "parser.cpp"
     break;
 
-  case 366: /* expr_alias: expr  */
-#line 2711 "parser.y"
+  case 367: /* expr_alias: expr  */
+#line 2722 "parser.y"
        {
     (yyval.expr_t) = (yyvsp[0].expr_t);
 }
-#line 7438 "parser.cpp"
+#line 7456 "parser.cpp"
     break;
 
-  case 372: /* operand: '(' expr ')'  */
-#line 2721 "parser.y"
+  case 373: /* operand: '(' expr ')'  */
+#line 2732 "parser.y"
                       {
     (yyval.expr_t) = (yyvsp[-1].expr_t);
 }
-#line 7446 "parser.cpp"
+#line 7464 "parser.cpp"
     break;
 
-  case 373: /* operand: '(' select_without_paren ')'  */
-#line 2724 "parser.y"
+  case 374: /* operand: '(' select_without_paren ')'  */
+#line 2735 "parser.y"
                                {
     infinity::SubqueryExpr* subquery_expr = new infinity::SubqueryExpr();
     subquery_expr->subquery_type_ = infinity::SubqueryType::kScalar;
     subquery_expr->select_ = (yyvsp[-1].select_stmt);
     (yyval.expr_t) = subquery_expr;
 }
-#line 7457 "parser.cpp"
+#line 7475 "parser.cpp"
     break;
 
-  case 374: /* operand: constant_expr  */
-#line 2730 "parser.y"
+  case 375: /* operand: constant_expr  */
+#line 2741 "parser.y"
                 {
     (yyval.expr_t) = (yyvsp[0].const_expr_t);
 }
-#line 7465 "parser.cpp"
+#line 7483 "parser.cpp"
     break;
 
-  case 385: /* match_tensor_expr: MATCH TENSOR '(' column_expr ',' common_array_expr ',' STRING ',' STRING ',' STRING optional_search_filter_expr ')'  */
-#line 2746 "parser.y"
+  case 386: /* match_tensor_expr: MATCH TENSOR '(' column_expr ',' common_array_expr ',' STRING ',' STRING ',' STRING optional_search_filter_expr ')'  */
+#line 2757 "parser.y"
                                                                                                                                         {
     auto match_tensor_expr = std::make_unique<infinity::MatchTensorExpr>();
     // search column
@@ -7481,11 +7499,11 @@ yyreduce:
     match_tensor_expr->SetOptionalFilter((yyvsp[-1].expr_t));
     (yyval.expr_t) = match_tensor_expr.release();
 }
-#line 7485 "parser.cpp"
+#line 7503 "parser.cpp"
     break;
 
-  case 386: /* match_tensor_expr: MATCH TENSOR '(' column_expr ',' common_array_expr ',' STRING ',' STRING ',' STRING optional_search_filter_expr ')' USING INDEX '(' IDENTIFIER ')'  */
-#line 2762 "parser.y"
+  case 387: /* match_tensor_expr: MATCH TENSOR '(' column_expr ',' common_array_expr ',' STRING ',' STRING ',' STRING optional_search_filter_expr ')' USING INDEX '(' IDENTIFIER ')'  */
+#line 2773 "parser.y"
                                                                                                                                                    {
     auto match_tensor_expr = std::make_unique<infinity::MatchTensorExpr>();
     // search column
@@ -7502,11 +7520,11 @@ yyreduce:
     match_tensor_expr->index_name_ = (yyvsp[-1].str_value);
     (yyval.expr_t) = match_tensor_expr.release();
 }
-#line 7506 "parser.cpp"
+#line 7524 "parser.cpp"
     break;
 
-  case 387: /* match_tensor_expr: MATCH TENSOR '(' column_expr ',' common_array_expr ',' STRING ',' STRING ',' STRING optional_search_filter_expr ')' IGNORE INDEX  */
-#line 2779 "parser.y"
+  case 388: /* match_tensor_expr: MATCH TENSOR '(' column_expr ',' common_array_expr ',' STRING ',' STRING ',' STRING optional_search_filter_expr ')' IGNORE INDEX  */
+#line 2790 "parser.y"
                                                                                                                                  {
     auto match_tensor_expr = std::make_unique<infinity::MatchTensorExpr>();
     // search column
@@ -7523,11 +7541,11 @@ yyreduce:
     match_tensor_expr->SetOptionalFilter((yyvsp[-3].expr_t));
     (yyval.expr_t) = match_tensor_expr.release();
 }
-#line 7527 "parser.cpp"
+#line 7545 "parser.cpp"
     break;
 
-  case 388: /* match_vector_expr: MATCH VECTOR '(' expr ',' array_expr ',' STRING ',' STRING ',' LONG_VALUE optional_search_filter_expr ')' USING INDEX '(' IDENTIFIER ')' with_index_param_list  */
-#line 2797 "parser.y"
+  case 389: /* match_vector_expr: MATCH VECTOR '(' expr ',' array_expr ',' STRING ',' STRING ',' LONG_VALUE optional_search_filter_expr ')' USING INDEX '(' IDENTIFIER ')' with_index_param_list  */
+#line 2808 "parser.y"
                                                                                                                                                                                    {
     infinity::KnnExpr* match_vector_expr = new infinity::KnnExpr();
     (yyval.expr_t) = match_vector_expr;
@@ -7573,11 +7591,11 @@ Error1:
 Return1:
     ;
 }
-#line 7577 "parser.cpp"
+#line 7595 "parser.cpp"
     break;
 
-  case 389: /* match_vector_expr: MATCH VECTOR '(' expr ',' array_expr ',' STRING ',' STRING ',' LONG_VALUE optional_search_filter_expr ')' IGNORE INDEX  */
-#line 2843 "parser.y"
+  case 390: /* match_vector_expr: MATCH VECTOR '(' expr ',' array_expr ',' STRING ',' STRING ',' LONG_VALUE optional_search_filter_expr ')' IGNORE INDEX  */
+#line 2854 "parser.y"
                                                                                                                        {
     infinity::KnnExpr* match_vector_expr = new infinity::KnnExpr();
     (yyval.expr_t) = match_vector_expr;
@@ -7616,11 +7634,11 @@ Error2:
 Return2:
     ;
 }
-#line 7620 "parser.cpp"
+#line 7638 "parser.cpp"
     break;
 
-  case 390: /* match_vector_expr: MATCH VECTOR '(' expr ',' array_expr ',' STRING ',' STRING ',' LONG_VALUE optional_search_filter_expr ')' with_index_param_list  */
-#line 2882 "parser.y"
+  case 391: /* match_vector_expr: MATCH VECTOR '(' expr ',' array_expr ',' STRING ',' STRING ',' LONG_VALUE optional_search_filter_expr ')' with_index_param_list  */
+#line 2893 "parser.y"
                                                                                                                                 {
     infinity::KnnExpr* match_vector_expr = new infinity::KnnExpr();
     (yyval.expr_t) = match_vector_expr;
@@ -7663,11 +7681,11 @@ Error3:
 Return3:
     ;
 }
-#line 7667 "parser.cpp"
+#line 7685 "parser.cpp"
     break;
 
-  case 391: /* match_vector_expr: MATCH VECTOR '(' expr ',' array_expr ',' STRING ',' STRING optional_search_filter_expr ')' with_index_param_list  */
-#line 2925 "parser.y"
+  case 392: /* match_vector_expr: MATCH VECTOR '(' expr ',' array_expr ',' STRING ',' STRING optional_search_filter_expr ')' with_index_param_list  */
+#line 2936 "parser.y"
                                                                                                                  {
     infinity::KnnExpr* match_vector_expr = new infinity::KnnExpr();
     (yyval.expr_t) = match_vector_expr;
@@ -7711,11 +7729,11 @@ Error4:
 Return4:
     ;
 }
-#line 7715 "parser.cpp"
+#line 7733 "parser.cpp"
     break;
 
-  case 392: /* match_sparse_expr: MATCH SPARSE '(' expr ',' common_sparse_array_expr ',' STRING ',' LONG_VALUE optional_search_filter_expr ')' USING INDEX '(' IDENTIFIER ')' with_index_param_list  */
-#line 2972 "parser.y"
+  case 393: /* match_sparse_expr: MATCH SPARSE '(' expr ',' common_sparse_array_expr ',' STRING ',' LONG_VALUE optional_search_filter_expr ')' USING INDEX '(' IDENTIFIER ')' with_index_param_list  */
+#line 2983 "parser.y"
                                                                                                                                                                                      {
     auto match_sparse_expr = new infinity::MatchSparseExpr();
     (yyval.expr_t) = match_sparse_expr;
@@ -7739,11 +7757,11 @@ Return4:
     match_sparse_expr->index_name_ = (yyvsp[-2].str_value);
     free((yyvsp[-2].str_value));
 }
-#line 7743 "parser.cpp"
+#line 7761 "parser.cpp"
     break;
 
-  case 393: /* match_sparse_expr: MATCH SPARSE '(' expr ',' common_sparse_array_expr ',' STRING ',' LONG_VALUE optional_search_filter_expr ')' IGNORE INDEX  */
-#line 2996 "parser.y"
+  case 394: /* match_sparse_expr: MATCH SPARSE '(' expr ',' common_sparse_array_expr ',' STRING ',' LONG_VALUE optional_search_filter_expr ')' IGNORE INDEX  */
+#line 3007 "parser.y"
                                                                                                                           {
     auto match_sparse_expr = new infinity::MatchSparseExpr();
     (yyval.expr_t) = match_sparse_expr;
@@ -7766,11 +7784,11 @@ Return4:
 
     match_sparse_expr->ignore_index_ = true;
 }
-#line 7770 "parser.cpp"
+#line 7788 "parser.cpp"
     break;
 
-  case 394: /* match_sparse_expr: MATCH SPARSE '(' expr ',' common_sparse_array_expr ',' STRING ',' LONG_VALUE optional_search_filter_expr ')' with_index_param_list  */
-#line 3019 "parser.y"
+  case 395: /* match_sparse_expr: MATCH SPARSE '(' expr ',' common_sparse_array_expr ',' STRING ',' LONG_VALUE optional_search_filter_expr ')' with_index_param_list  */
+#line 3030 "parser.y"
                                                                                                                                    {
     auto match_sparse_expr = new infinity::MatchSparseExpr();
     (yyval.expr_t) = match_sparse_expr;
@@ -7791,11 +7809,11 @@ Return4:
     // topn and options
     match_sparse_expr->SetOptParams((yyvsp[-3].long_value), (yyvsp[0].with_index_param_list_t));
 }
-#line 7795 "parser.cpp"
+#line 7813 "parser.cpp"
     break;
 
-  case 395: /* match_sparse_expr: MATCH SPARSE '(' expr ',' common_sparse_array_expr ',' STRING optional_search_filter_expr ')' with_index_param_list  */
-#line 3040 "parser.y"
+  case 396: /* match_sparse_expr: MATCH SPARSE '(' expr ',' common_sparse_array_expr ',' STRING optional_search_filter_expr ')' with_index_param_list  */
+#line 3051 "parser.y"
                                                                                                                     {
     auto match_sparse_expr = new infinity::MatchSparseExpr();
     (yyval.expr_t) = match_sparse_expr;
@@ -7816,11 +7834,11 @@ Return4:
     // topn and options
     match_sparse_expr->SetOptParams(infinity::DEFAULT_MATCH_SPARSE_TOP_N, (yyvsp[0].with_index_param_list_t));
 }
-#line 7820 "parser.cpp"
+#line 7838 "parser.cpp"
     break;
 
-  case 396: /* match_text_expr: MATCH TEXT '(' STRING ',' STRING optional_search_filter_expr ')'  */
-#line 3061 "parser.y"
+  case 397: /* match_text_expr: MATCH TEXT '(' STRING ',' STRING optional_search_filter_expr ')'  */
+#line 3072 "parser.y"
                                                                                    {
     infinity::MatchExpr* match_text_expr = new infinity::MatchExpr();
     match_text_expr->fields_ = std::string((yyvsp[-4].str_value));
@@ -7830,11 +7848,11 @@ Return4:
     free((yyvsp[-2].str_value));
     (yyval.expr_t) = match_text_expr;
 }
-#line 7834 "parser.cpp"
+#line 7852 "parser.cpp"
     break;
 
-  case 397: /* match_text_expr: MATCH TEXT '(' STRING ',' STRING ',' STRING optional_search_filter_expr ')'  */
-#line 3070 "parser.y"
+  case 398: /* match_text_expr: MATCH TEXT '(' STRING ',' STRING ',' STRING optional_search_filter_expr ')'  */
+#line 3081 "parser.y"
                                                                               {
     infinity::MatchExpr* match_text_expr = new infinity::MatchExpr();
     match_text_expr->fields_ = std::string((yyvsp[-6].str_value));
@@ -7846,11 +7864,11 @@ Return4:
     free((yyvsp[-2].str_value));
     (yyval.expr_t) = match_text_expr;
 }
-#line 7850 "parser.cpp"
+#line 7868 "parser.cpp"
     break;
 
-  case 398: /* match_text_expr: MATCH TEXT '(' STRING ',' STRING optional_search_filter_expr ')' USING INDEXES '(' STRING ')'  */
-#line 3081 "parser.y"
+  case 399: /* match_text_expr: MATCH TEXT '(' STRING ',' STRING optional_search_filter_expr ')' USING INDEXES '(' STRING ')'  */
+#line 3092 "parser.y"
                                                                                                 {
     infinity::MatchExpr* match_text_expr = new infinity::MatchExpr();
     match_text_expr->fields_ = std::string((yyvsp[-9].str_value));
@@ -7862,11 +7880,11 @@ Return4:
     free((yyvsp[-1].str_value));
     (yyval.expr_t) = match_text_expr;
 }
-#line 7866 "parser.cpp"
+#line 7884 "parser.cpp"
     break;
 
-  case 399: /* match_text_expr: MATCH TEXT '(' STRING ',' STRING ',' STRING optional_search_filter_expr ')' USING INDEXES '(' STRING ')'  */
-#line 3092 "parser.y"
+  case 400: /* match_text_expr: MATCH TEXT '(' STRING ',' STRING ',' STRING optional_search_filter_expr ')' USING INDEXES '(' STRING ')'  */
+#line 3103 "parser.y"
                                                                                                            {
     infinity::MatchExpr* match_text_expr = new infinity::MatchExpr();
     match_text_expr->fields_ = std::string((yyvsp[-11].str_value));
@@ -7880,11 +7898,11 @@ Return4:
     free((yyvsp[-1].str_value));
     (yyval.expr_t) = match_text_expr;
 }
-#line 7884 "parser.cpp"
+#line 7902 "parser.cpp"
     break;
 
-  case 400: /* query_expr: QUERY '(' STRING optional_search_filter_expr ')'  */
-#line 3106 "parser.y"
+  case 401: /* query_expr: QUERY '(' STRING optional_search_filter_expr ')'  */
+#line 3117 "parser.y"
                                                               {
     infinity::MatchExpr* match_text_expr = new infinity::MatchExpr();
     match_text_expr->matching_text_ = std::string((yyvsp[-2].str_value));
@@ -7892,11 +7910,11 @@ Return4:
     free((yyvsp[-2].str_value));
     (yyval.expr_t) = match_text_expr;
 }
-#line 7896 "parser.cpp"
+#line 7914 "parser.cpp"
     break;
 
-  case 401: /* query_expr: QUERY '(' STRING ',' STRING optional_search_filter_expr ')'  */
-#line 3113 "parser.y"
+  case 402: /* query_expr: QUERY '(' STRING ',' STRING optional_search_filter_expr ')'  */
+#line 3124 "parser.y"
                                                               {
     infinity::MatchExpr* match_text_expr = new infinity::MatchExpr();
     match_text_expr->matching_text_ = std::string((yyvsp[-4].str_value));
@@ -7906,22 +7924,22 @@ Return4:
     free((yyvsp[-2].str_value));
     (yyval.expr_t) = match_text_expr;
 }
-#line 7910 "parser.cpp"
+#line 7928 "parser.cpp"
     break;
 
-  case 402: /* fusion_expr: FUSION '(' STRING ')'  */
-#line 3123 "parser.y"
+  case 403: /* fusion_expr: FUSION '(' STRING ')'  */
+#line 3134 "parser.y"
                                     {
     infinity::FusionExpr* fusion_expr = new infinity::FusionExpr();
     fusion_expr->method_ = std::string((yyvsp[-1].str_value));
     free((yyvsp[-1].str_value));
     (yyval.expr_t) = fusion_expr;
 }
-#line 7921 "parser.cpp"
+#line 7939 "parser.cpp"
     break;
 
-  case 403: /* fusion_expr: FUSION '(' STRING ',' STRING ')'  */
-#line 3129 "parser.y"
+  case 404: /* fusion_expr: FUSION '(' STRING ',' STRING ')'  */
+#line 3140 "parser.y"
                                    {
     auto fusion_expr = std::make_unique<infinity::FusionExpr>();
     fusion_expr->method_ = std::string((yyvsp[-3].str_value));
@@ -7933,77 +7951,77 @@ Return4:
     fusion_expr->JobAfterParser();
     (yyval.expr_t) = fusion_expr.release();
 }
-#line 7937 "parser.cpp"
+#line 7955 "parser.cpp"
     break;
 
-  case 404: /* sub_search: match_vector_expr  */
-#line 3141 "parser.y"
+  case 405: /* sub_search: match_vector_expr  */
+#line 3152 "parser.y"
                                {
     (yyval.expr_t) = (yyvsp[0].expr_t);
 }
-#line 7945 "parser.cpp"
+#line 7963 "parser.cpp"
     break;
 
-  case 405: /* sub_search: match_text_expr  */
-#line 3144 "parser.y"
+  case 406: /* sub_search: match_text_expr  */
+#line 3155 "parser.y"
                   {
     (yyval.expr_t) = (yyvsp[0].expr_t);
 }
-#line 7953 "parser.cpp"
+#line 7971 "parser.cpp"
     break;
 
-  case 406: /* sub_search: match_tensor_expr  */
-#line 3147 "parser.y"
+  case 407: /* sub_search: match_tensor_expr  */
+#line 3158 "parser.y"
                     {
     (yyval.expr_t) = (yyvsp[0].expr_t);
 }
-#line 7961 "parser.cpp"
+#line 7979 "parser.cpp"
     break;
 
-  case 407: /* sub_search: match_sparse_expr  */
-#line 3150 "parser.y"
+  case 408: /* sub_search: match_sparse_expr  */
+#line 3161 "parser.y"
                     {
     (yyval.expr_t) = (yyvsp[0].expr_t);
 }
-#line 7969 "parser.cpp"
+#line 7987 "parser.cpp"
     break;
 
-  case 408: /* sub_search: query_expr  */
-#line 3153 "parser.y"
+  case 409: /* sub_search: query_expr  */
+#line 3164 "parser.y"
              {
     (yyval.expr_t) = (yyvsp[0].expr_t);
 }
-#line 7977 "parser.cpp"
+#line 7995 "parser.cpp"
     break;
 
-  case 409: /* sub_search: fusion_expr  */
-#line 3156 "parser.y"
+  case 410: /* sub_search: fusion_expr  */
+#line 3167 "parser.y"
               {
     (yyval.expr_t) = (yyvsp[0].expr_t);
 }
-#line 7985 "parser.cpp"
+#line 8003 "parser.cpp"
     break;
 
-  case 410: /* sub_search_array: sub_search  */
-#line 3160 "parser.y"
+  case 411: /* sub_search_array: sub_search  */
+#line 3171 "parser.y"
                               {
     (yyval.expr_array_t) = new std::vector<infinity::ParsedExpr*>();
     (yyval.expr_array_t)->emplace_back((yyvsp[0].expr_t));
 }
-#line 7994 "parser.cpp"
+#line 8012 "parser.cpp"
     break;
 
-  case 411: /* sub_search_array: sub_search_array ',' sub_search  */
-#line 3164 "parser.y"
+  case 412: /* sub_search_array: sub_search_array ',' sub_search  */
+#line 3175 "parser.y"
                                   {
     (yyvsp[-2].expr_array_t)->emplace_back((yyvsp[0].expr_t));
     (yyval.expr_array_t) = (yyvsp[-2].expr_array_t);
 }
-#line 8003 "parser.cpp"
+#line 8021 "parser.cpp"
     break;
 
-  case 412: /* function_expr: IDENTIFIER '(' ')'  */
-#line 3169 "parser.y"
+  case 413: /* function_expr: IDENTIFIER '(' ')'  */
+#line 3180 "parser.y"
                                    {
     infinity::FunctionExpr* func_expr = new infinity::FunctionExpr();
     ParserHelper::ToLower((yyvsp[-2].str_value));
@@ -8012,11 +8030,11 @@ Return4:
     func_expr->arguments_ = nullptr;
     (yyval.expr_t) = func_expr;
 }
-#line 8016 "parser.cpp"
+#line 8034 "parser.cpp"
     break;
 
-  case 413: /* function_expr: IDENTIFIER '(' expr_array ')'  */
-#line 3177 "parser.y"
+  case 414: /* function_expr: IDENTIFIER '(' expr_array ')'  */
+#line 3188 "parser.y"
                                 {
     infinity::FunctionExpr* func_expr = new infinity::FunctionExpr();
     ParserHelper::ToLower((yyvsp[-3].str_value));
@@ -8025,11 +8043,11 @@ Return4:
     func_expr->arguments_ = (yyvsp[-1].expr_array_t);
     (yyval.expr_t) = func_expr;
 }
-#line 8029 "parser.cpp"
+#line 8047 "parser.cpp"
     break;
 
-  case 414: /* function_expr: IDENTIFIER '(' DISTINCT expr_array ')'  */
-#line 3185 "parser.y"
+  case 415: /* function_expr: IDENTIFIER '(' DISTINCT expr_array ')'  */
+#line 3196 "parser.y"
                                          {
     infinity::FunctionExpr* func_expr = new infinity::FunctionExpr();
     ParserHelper::ToLower((yyvsp[-4].str_value));
@@ -8039,11 +8057,11 @@ Return4:
     func_expr->distinct_ = true;
     (yyval.expr_t) = func_expr;
 }
-#line 8043 "parser.cpp"
+#line 8061 "parser.cpp"
     break;
 
-  case 415: /* function_expr: YEAR '(' expr ')'  */
-#line 3194 "parser.y"
+  case 416: /* function_expr: YEAR '(' expr ')'  */
+#line 3205 "parser.y"
                     {
     infinity::FunctionExpr* func_expr = new infinity::FunctionExpr();
     func_expr->func_name_ = "year";
@@ -8051,11 +8069,11 @@ Return4:
     func_expr->arguments_->emplace_back((yyvsp[-1].expr_t));
     (yyval.expr_t) = func_expr;
 }
-#line 8055 "parser.cpp"
+#line 8073 "parser.cpp"
     break;
 
-  case 416: /* function_expr: MONTH '(' expr ')'  */
-#line 3201 "parser.y"
+  case 417: /* function_expr: MONTH '(' expr ')'  */
+#line 3212 "parser.y"
                      {
     infinity::FunctionExpr* func_expr = new infinity::FunctionExpr();
     func_expr->func_name_ = "month";
@@ -8063,11 +8081,11 @@ Return4:
     func_expr->arguments_->emplace_back((yyvsp[-1].expr_t));
     (yyval.expr_t) = func_expr;
 }
-#line 8067 "parser.cpp"
+#line 8085 "parser.cpp"
     break;
 
-  case 417: /* function_expr: DAY '(' expr ')'  */
-#line 3208 "parser.y"
+  case 418: /* function_expr: DAY '(' expr ')'  */
+#line 3219 "parser.y"
                    {
     infinity::FunctionExpr* func_expr = new infinity::FunctionExpr();
     func_expr->func_name_ = "day";
@@ -8075,11 +8093,11 @@ Return4:
     func_expr->arguments_->emplace_back((yyvsp[-1].expr_t));
     (yyval.expr_t) = func_expr;
 }
-#line 8079 "parser.cpp"
+#line 8097 "parser.cpp"
     break;
 
-  case 418: /* function_expr: HOUR '(' expr ')'  */
-#line 3215 "parser.y"
+  case 419: /* function_expr: HOUR '(' expr ')'  */
+#line 3226 "parser.y"
                     {
     infinity::FunctionExpr* func_expr = new infinity::FunctionExpr();
     func_expr->func_name_ = "hour";
@@ -8087,11 +8105,11 @@ Return4:
     func_expr->arguments_->emplace_back((yyvsp[-1].expr_t));
     (yyval.expr_t) = func_expr;
 }
-#line 8091 "parser.cpp"
+#line 8109 "parser.cpp"
     break;
 
-  case 419: /* function_expr: MINUTE '(' expr ')'  */
-#line 3222 "parser.y"
+  case 420: /* function_expr: MINUTE '(' expr ')'  */
+#line 3233 "parser.y"
                       {
     infinity::FunctionExpr* func_expr = new infinity::FunctionExpr();
     func_expr->func_name_ = "minute";
@@ -8099,11 +8117,11 @@ Return4:
     func_expr->arguments_->emplace_back((yyvsp[-1].expr_t));
     (yyval.expr_t) = func_expr;
 }
-#line 8103 "parser.cpp"
+#line 8121 "parser.cpp"
     break;
 
-  case 420: /* function_expr: SECOND '(' expr ')'  */
-#line 3229 "parser.y"
+  case 421: /* function_expr: SECOND '(' expr ')'  */
+#line 3240 "parser.y"
                       {
     infinity::FunctionExpr* func_expr = new infinity::FunctionExpr();
     func_expr->func_name_ = "second";
@@ -8111,11 +8129,11 @@ Return4:
     func_expr->arguments_->emplace_back((yyvsp[-1].expr_t));
     (yyval.expr_t) = func_expr;
 }
-#line 8115 "parser.cpp"
+#line 8133 "parser.cpp"
     break;
 
-  case 421: /* function_expr: operand IS NOT NULLABLE  */
-#line 3236 "parser.y"
+  case 422: /* function_expr: operand IS NOT NULLABLE  */
+#line 3247 "parser.y"
                           {
     infinity::FunctionExpr* func_expr = new infinity::FunctionExpr();
     func_expr->func_name_ = "is_not_null";
@@ -8123,11 +8141,11 @@ Return4:
     func_expr->arguments_->emplace_back((yyvsp[-3].expr_t));
     (yyval.expr_t) = func_expr;
 }
-#line 8127 "parser.cpp"
+#line 8145 "parser.cpp"
     break;
 
-  case 422: /* function_expr: operand IS NULLABLE  */
-#line 3243 "parser.y"
+  case 423: /* function_expr: operand IS NULLABLE  */
+#line 3254 "parser.y"
                       {
     infinity::FunctionExpr* func_expr = new infinity::FunctionExpr();
     func_expr->func_name_ = "is_null";
@@ -8135,11 +8153,11 @@ Return4:
     func_expr->arguments_->emplace_back((yyvsp[-2].expr_t));
     (yyval.expr_t) = func_expr;
 }
-#line 8139 "parser.cpp"
+#line 8157 "parser.cpp"
     break;
 
-  case 423: /* function_expr: NOT operand  */
-#line 3250 "parser.y"
+  case 424: /* function_expr: NOT operand  */
+#line 3261 "parser.y"
               {
     infinity::FunctionExpr* func_expr = new infinity::FunctionExpr();
     func_expr->func_name_ = "not";
@@ -8147,11 +8165,11 @@ Return4:
     func_expr->arguments_->emplace_back((yyvsp[0].expr_t));
     (yyval.expr_t) = func_expr;
 }
-#line 8151 "parser.cpp"
+#line 8169 "parser.cpp"
     break;
 
-  case 424: /* function_expr: '-' operand  */
-#line 3257 "parser.y"
+  case 425: /* function_expr: '-' operand  */
+#line 3268 "parser.y"
               {
     infinity::FunctionExpr* func_expr = new infinity::FunctionExpr();
     func_expr->func_name_ = "-";
@@ -8159,11 +8177,11 @@ Return4:
     func_expr->arguments_->emplace_back((yyvsp[0].expr_t));
     (yyval.expr_t) = func_expr;
 }
-#line 8163 "parser.cpp"
+#line 8181 "parser.cpp"
     break;
 
-  case 425: /* function_expr: '+' operand  */
-#line 3264 "parser.y"
+  case 426: /* function_expr: '+' operand  */
+#line 3275 "parser.y"
               {
     infinity::FunctionExpr* func_expr = new infinity::FunctionExpr();
     func_expr->func_name_ = "+";
@@ -8171,11 +8189,11 @@ Return4:
     func_expr->arguments_->emplace_back((yyvsp[0].expr_t));
     (yyval.expr_t) = func_expr;
 }
-#line 8175 "parser.cpp"
+#line 8193 "parser.cpp"
     break;
 
-  case 426: /* function_expr: operand '-' operand  */
-#line 3271 "parser.y"
+  case 427: /* function_expr: operand '-' operand  */
+#line 3282 "parser.y"
                       {
     infinity::FunctionExpr* func_expr = new infinity::FunctionExpr();
     func_expr->func_name_ = "-";
@@ -8184,11 +8202,11 @@ Return4:
     func_expr->arguments_->emplace_back((yyvsp[0].expr_t));
     (yyval.expr_t) = func_expr;
 }
-#line 8188 "parser.cpp"
+#line 8206 "parser.cpp"
     break;
 
-  case 427: /* function_expr: operand '+' operand  */
-#line 3279 "parser.y"
+  case 428: /* function_expr: operand '+' operand  */
+#line 3290 "parser.y"
                       {
     infinity::FunctionExpr* func_expr = new infinity::FunctionExpr();
     func_expr->func_name_ = "+";
@@ -8197,11 +8215,11 @@ Return4:
     func_expr->arguments_->emplace_back((yyvsp[0].expr_t));
     (yyval.expr_t) = func_expr;
 }
-#line 8201 "parser.cpp"
+#line 8219 "parser.cpp"
     break;
 
-  case 428: /* function_expr: operand '*' operand  */
-#line 3287 "parser.y"
+  case 429: /* function_expr: operand '*' operand  */
+#line 3298 "parser.y"
                       {
     infinity::FunctionExpr* func_expr = new infinity::FunctionExpr();
     func_expr->func_name_ = "*";
@@ -8210,11 +8228,11 @@ Return4:
     func_expr->arguments_->emplace_back((yyvsp[0].expr_t));
     (yyval.expr_t) = func_expr;
 }
-#line 8214 "parser.cpp"
+#line 8232 "parser.cpp"
     break;
 
-  case 429: /* function_expr: operand '/' operand  */
-#line 3295 "parser.y"
+  case 430: /* function_expr: operand '/' operand  */
+#line 3306 "parser.y"
                       {
     infinity::FunctionExpr* func_expr = new infinity::FunctionExpr();
     func_expr->func_name_ = "/";
@@ -8223,11 +8241,11 @@ Return4:
     func_expr->arguments_->emplace_back((yyvsp[0].expr_t));
     (yyval.expr_t) = func_expr;
 }
-#line 8227 "parser.cpp"
+#line 8245 "parser.cpp"
     break;
 
-  case 430: /* function_expr: operand '%' operand  */
-#line 3303 "parser.y"
+  case 431: /* function_expr: operand '%' operand  */
+#line 3314 "parser.y"
                       {
     infinity::FunctionExpr* func_expr = new infinity::FunctionExpr();
     func_expr->func_name_ = "%";
@@ -8236,11 +8254,11 @@ Return4:
     func_expr->arguments_->emplace_back((yyvsp[0].expr_t));
     (yyval.expr_t) = func_expr;
 }
-#line 8240 "parser.cpp"
+#line 8258 "parser.cpp"
     break;
 
-  case 431: /* function_expr: operand '=' operand  */
-#line 3311 "parser.y"
+  case 432: /* function_expr: operand '=' operand  */
+#line 3322 "parser.y"
                       {
     infinity::FunctionExpr* func_expr = new infinity::FunctionExpr();
     func_expr->func_name_ = "=";
@@ -8249,11 +8267,11 @@ Return4:
     func_expr->arguments_->emplace_back((yyvsp[0].expr_t));
     (yyval.expr_t) = func_expr;
 }
-#line 8253 "parser.cpp"
+#line 8271 "parser.cpp"
     break;
 
-  case 432: /* function_expr: operand EQUAL operand  */
-#line 3319 "parser.y"
+  case 433: /* function_expr: operand EQUAL operand  */
+#line 3330 "parser.y"
                         {
     infinity::FunctionExpr* func_expr = new infinity::FunctionExpr();
     func_expr->func_name_ = "=";
@@ -8262,11 +8280,11 @@ Return4:
     func_expr->arguments_->emplace_back((yyvsp[0].expr_t));
     (yyval.expr_t) = func_expr;
 }
-#line 8266 "parser.cpp"
+#line 8284 "parser.cpp"
     break;
 
-  case 433: /* function_expr: operand NOT_EQ operand  */
-#line 3327 "parser.y"
+  case 434: /* function_expr: operand NOT_EQ operand  */
+#line 3338 "parser.y"
                          {
     infinity::FunctionExpr* func_expr = new infinity::FunctionExpr();
     func_expr->func_name_ = "<>";
@@ -8275,11 +8293,11 @@ Return4:
     func_expr->arguments_->emplace_back((yyvsp[0].expr_t));
     (yyval.expr_t) = func_expr;
 }
-#line 8279 "parser.cpp"
+#line 8297 "parser.cpp"
     break;
 
-  case 434: /* function_expr: operand '<' operand  */
-#line 3335 "parser.y"
+  case 435: /* function_expr: operand '<' operand  */
+#line 3346 "parser.y"
                       {
     infinity::FunctionExpr* func_expr = new infinity::FunctionExpr();
     func_expr->func_name_ = "<";
@@ -8288,11 +8306,11 @@ Return4:
     func_expr->arguments_->emplace_back((yyvsp[0].expr_t));
     (yyval.expr_t) = func_expr;
 }
-#line 8292 "parser.cpp"
+#line 8310 "parser.cpp"
     break;
 
-  case 435: /* function_expr: operand '>' operand  */
-#line 3343 "parser.y"
+  case 436: /* function_expr: operand '>' operand  */
+#line 3354 "parser.y"
                       {
     infinity::FunctionExpr* func_expr = new infinity::FunctionExpr();
     func_expr->func_name_ = ">";
@@ -8301,11 +8319,11 @@ Return4:
     func_expr->arguments_->emplace_back((yyvsp[0].expr_t));
     (yyval.expr_t) = func_expr;
 }
-#line 8305 "parser.cpp"
+#line 8323 "parser.cpp"
     break;
 
-  case 436: /* function_expr: operand LESS_EQ operand  */
-#line 3351 "parser.y"
+  case 437: /* function_expr: operand LESS_EQ operand  */
+#line 3362 "parser.y"
                           {
     infinity::FunctionExpr* func_expr = new infinity::FunctionExpr();
     func_expr->func_name_ = "<=";
@@ -8314,11 +8332,11 @@ Return4:
     func_expr->arguments_->emplace_back((yyvsp[0].expr_t));
     (yyval.expr_t) = func_expr;
 }
-#line 8318 "parser.cpp"
+#line 8336 "parser.cpp"
     break;
 
-  case 437: /* function_expr: operand GREATER_EQ operand  */
-#line 3359 "parser.y"
+  case 438: /* function_expr: operand GREATER_EQ operand  */
+#line 3370 "parser.y"
                              {
     infinity::FunctionExpr* func_expr = new infinity::FunctionExpr();
     func_expr->func_name_ = ">=";
@@ -8327,11 +8345,11 @@ Return4:
     func_expr->arguments_->emplace_back((yyvsp[0].expr_t));
     (yyval.expr_t) = func_expr;
 }
-#line 8331 "parser.cpp"
+#line 8349 "parser.cpp"
     break;
 
-  case 438: /* function_expr: EXTRACT '(' STRING FROM operand ')'  */
-#line 3367 "parser.y"
+  case 439: /* function_expr: EXTRACT '(' STRING FROM operand ')'  */
+#line 3378 "parser.y"
                                       {
     infinity::FunctionExpr* func_expr = new infinity::FunctionExpr();
     ParserHelper::ToLower((yyvsp[-3].str_value));
@@ -8362,11 +8380,11 @@ Return4:
     func_expr->arguments_->emplace_back((yyvsp[-1].expr_t));
     (yyval.expr_t) = func_expr;
 }
-#line 8366 "parser.cpp"
+#line 8384 "parser.cpp"
     break;
 
-  case 439: /* function_expr: operand LIKE operand  */
-#line 3397 "parser.y"
+  case 440: /* function_expr: operand LIKE operand  */
+#line 3408 "parser.y"
                        {
     infinity::FunctionExpr* func_expr = new infinity::FunctionExpr();
     func_expr->func_name_ = "like";
@@ -8375,11 +8393,11 @@ Return4:
     func_expr->arguments_->emplace_back((yyvsp[0].expr_t));
     (yyval.expr_t) = func_expr;
 }
-#line 8379 "parser.cpp"
+#line 8397 "parser.cpp"
     break;
 
-  case 440: /* function_expr: operand NOT LIKE operand  */
-#line 3405 "parser.y"
+  case 441: /* function_expr: operand NOT LIKE operand  */
+#line 3416 "parser.y"
                            {
     infinity::FunctionExpr* func_expr = new infinity::FunctionExpr();
     func_expr->func_name_ = "not_like";
@@ -8388,11 +8406,11 @@ Return4:
     func_expr->arguments_->emplace_back((yyvsp[0].expr_t));
     (yyval.expr_t) = func_expr;
 }
-#line 8392 "parser.cpp"
+#line 8410 "parser.cpp"
     break;
 
-  case 441: /* conjunction_expr: expr AND expr  */
-#line 3414 "parser.y"
+  case 442: /* conjunction_expr: expr AND expr  */
+#line 3425 "parser.y"
                                 {
     infinity::FunctionExpr* func_expr = new infinity::FunctionExpr();
     func_expr->func_name_ = "and";
@@ -8401,11 +8419,11 @@ Return4:
     func_expr->arguments_->emplace_back((yyvsp[0].expr_t));
     (yyval.expr_t) = func_expr;
 }
-#line 8405 "parser.cpp"
+#line 8423 "parser.cpp"
     break;
 
-  case 442: /* conjunction_expr: expr OR expr  */
-#line 3422 "parser.y"
+  case 443: /* conjunction_expr: expr OR expr  */
+#line 3433 "parser.y"
                {
     infinity::FunctionExpr* func_expr = new infinity::FunctionExpr();
     func_expr->func_name_ = "or";
@@ -8414,11 +8432,11 @@ Return4:
     func_expr->arguments_->emplace_back((yyvsp[0].expr_t));
     (yyval.expr_t) = func_expr;
 }
-#line 8418 "parser.cpp"
+#line 8436 "parser.cpp"
     break;
 
-  case 443: /* between_expr: operand BETWEEN operand AND operand  */
-#line 3431 "parser.y"
+  case 444: /* between_expr: operand BETWEEN operand AND operand  */
+#line 3442 "parser.y"
                                                   {
     infinity::BetweenExpr* between_expr = new infinity::BetweenExpr();
     between_expr->value_ = (yyvsp[-4].expr_t);
@@ -8426,44 +8444,44 @@ Return4:
     between_expr->upper_bound_ = (yyvsp[0].expr_t);
     (yyval.expr_t) = between_expr;
 }
-#line 8430 "parser.cpp"
+#line 8448 "parser.cpp"
     break;
 
-  case 444: /* in_expr: operand IN '(' expr_array ')'  */
-#line 3439 "parser.y"
+  case 445: /* in_expr: operand IN '(' expr_array ')'  */
+#line 3450 "parser.y"
                                        {
     infinity::InExpr* in_expr = new infinity::InExpr(true);
     in_expr->left_ = (yyvsp[-4].expr_t);
     in_expr->arguments_ = (yyvsp[-1].expr_array_t);
     (yyval.expr_t) = in_expr;
 }
-#line 8441 "parser.cpp"
+#line 8459 "parser.cpp"
     break;
 
-  case 445: /* in_expr: operand NOT IN '(' expr_array ')'  */
-#line 3445 "parser.y"
+  case 446: /* in_expr: operand NOT IN '(' expr_array ')'  */
+#line 3456 "parser.y"
                                     {
     infinity::InExpr* in_expr = new infinity::InExpr(false);
     in_expr->left_ = (yyvsp[-5].expr_t);
     in_expr->arguments_ = (yyvsp[-1].expr_array_t);
     (yyval.expr_t) = in_expr;
 }
-#line 8452 "parser.cpp"
+#line 8470 "parser.cpp"
     break;
 
-  case 446: /* case_expr: CASE expr case_check_array END  */
-#line 3452 "parser.y"
+  case 447: /* case_expr: CASE expr case_check_array END  */
+#line 3463 "parser.y"
                                           {
     infinity::CaseExpr* case_expr = new infinity::CaseExpr();
     case_expr->expr_ = (yyvsp[-2].expr_t);
     case_expr->case_check_array_ = (yyvsp[-1].case_check_array_t);
     (yyval.expr_t) = case_expr;
 }
-#line 8463 "parser.cpp"
+#line 8481 "parser.cpp"
     break;
 
-  case 447: /* case_expr: CASE expr case_check_array ELSE expr END  */
-#line 3458 "parser.y"
+  case 448: /* case_expr: CASE expr case_check_array ELSE expr END  */
+#line 3469 "parser.y"
                                            {
     infinity::CaseExpr* case_expr = new infinity::CaseExpr();
     case_expr->expr_ = (yyvsp[-4].expr_t);
@@ -8471,32 +8489,32 @@ Return4:
     case_expr->else_expr_ = (yyvsp[-1].expr_t);
     (yyval.expr_t) = case_expr;
 }
-#line 8475 "parser.cpp"
+#line 8493 "parser.cpp"
     break;
 
-  case 448: /* case_expr: CASE case_check_array END  */
-#line 3465 "parser.y"
+  case 449: /* case_expr: CASE case_check_array END  */
+#line 3476 "parser.y"
                             {
     infinity::CaseExpr* case_expr = new infinity::CaseExpr();
     case_expr->case_check_array_ = (yyvsp[-1].case_check_array_t);
     (yyval.expr_t) = case_expr;
 }
-#line 8485 "parser.cpp"
+#line 8503 "parser.cpp"
     break;
 
-  case 449: /* case_expr: CASE case_check_array ELSE expr END  */
-#line 3470 "parser.y"
+  case 450: /* case_expr: CASE case_check_array ELSE expr END  */
+#line 3481 "parser.y"
                                       {
     infinity::CaseExpr* case_expr = new infinity::CaseExpr();
     case_expr->case_check_array_ = (yyvsp[-3].case_check_array_t);
     case_expr->else_expr_ = (yyvsp[-1].expr_t);
     (yyval.expr_t) = case_expr;
 }
-#line 8496 "parser.cpp"
+#line 8514 "parser.cpp"
     break;
 
-  case 450: /* case_check_array: WHEN expr THEN expr  */
-#line 3477 "parser.y"
+  case 451: /* case_check_array: WHEN expr THEN expr  */
+#line 3488 "parser.y"
                                       {
     (yyval.case_check_array_t) = new std::vector<infinity::WhenThen*>();
     infinity::WhenThen* when_then_ptr = new infinity::WhenThen();
@@ -8504,11 +8522,11 @@ Return4:
     when_then_ptr->then_ = (yyvsp[0].expr_t);
     (yyval.case_check_array_t)->emplace_back(when_then_ptr);
 }
-#line 8508 "parser.cpp"
+#line 8526 "parser.cpp"
     break;
 
-  case 451: /* case_check_array: case_check_array WHEN expr THEN expr  */
-#line 3484 "parser.y"
+  case 452: /* case_check_array: case_check_array WHEN expr THEN expr  */
+#line 3495 "parser.y"
                                        {
     infinity::WhenThen* when_then_ptr = new infinity::WhenThen();
     when_then_ptr->when_ = (yyvsp[-2].expr_t);
@@ -8516,11 +8534,11 @@ Return4:
     (yyvsp[-4].case_check_array_t)->emplace_back(when_then_ptr);
     (yyval.case_check_array_t) = (yyvsp[-4].case_check_array_t);
 }
-#line 8520 "parser.cpp"
+#line 8538 "parser.cpp"
     break;
 
-  case 452: /* cast_expr: CAST '(' expr AS column_type ')'  */
-#line 3492 "parser.y"
+  case 453: /* cast_expr: CAST '(' expr AS column_type ')'  */
+#line 3503 "parser.y"
                                             {
     auto [data_type_result, fail_reason] = infinity::ColumnType::GetDataTypeFromColumnType(*((yyvsp[-1].column_type_t)), std::vector<std::unique_ptr<infinity::InitParameter>>{});
     delete (yyvsp[-1].column_type_t);
@@ -8533,33 +8551,33 @@ Return4:
     cast_expr->expr_ = (yyvsp[-3].expr_t);
     (yyval.expr_t) = cast_expr;
 }
-#line 8537 "parser.cpp"
+#line 8555 "parser.cpp"
     break;
 
-  case 453: /* subquery_expr: EXISTS '(' select_without_paren ')'  */
-#line 3505 "parser.y"
+  case 454: /* subquery_expr: EXISTS '(' select_without_paren ')'  */
+#line 3516 "parser.y"
                                                    {
     infinity::SubqueryExpr* subquery_expr = new infinity::SubqueryExpr();
     subquery_expr->subquery_type_ = infinity::SubqueryType::kExists;
     subquery_expr->select_ = (yyvsp[-1].select_stmt);
     (yyval.expr_t) = subquery_expr;
 }
-#line 8548 "parser.cpp"
+#line 8566 "parser.cpp"
     break;
 
-  case 454: /* subquery_expr: NOT EXISTS '(' select_without_paren ')'  */
-#line 3511 "parser.y"
+  case 455: /* subquery_expr: NOT EXISTS '(' select_without_paren ')'  */
+#line 3522 "parser.y"
                                           {
     infinity::SubqueryExpr* subquery_expr = new infinity::SubqueryExpr();
     subquery_expr->subquery_type_ = infinity::SubqueryType::kNotExists;
     subquery_expr->select_ = (yyvsp[-1].select_stmt);
     (yyval.expr_t) = subquery_expr;
 }
-#line 8559 "parser.cpp"
+#line 8577 "parser.cpp"
     break;
 
-  case 455: /* subquery_expr: operand IN '(' select_without_paren ')'  */
-#line 3517 "parser.y"
+  case 456: /* subquery_expr: operand IN '(' select_without_paren ')'  */
+#line 3528 "parser.y"
                                           {
     infinity::SubqueryExpr* subquery_expr = new infinity::SubqueryExpr();
     subquery_expr->subquery_type_ = infinity::SubqueryType::kIn;
@@ -8567,11 +8585,11 @@ Return4:
     subquery_expr->select_ = (yyvsp[-1].select_stmt);
     (yyval.expr_t) = subquery_expr;
 }
-#line 8571 "parser.cpp"
+#line 8589 "parser.cpp"
     break;
 
-  case 456: /* subquery_expr: operand NOT IN '(' select_without_paren ')'  */
-#line 3524 "parser.y"
+  case 457: /* subquery_expr: operand NOT IN '(' select_without_paren ')'  */
+#line 3535 "parser.y"
                                               {
     infinity::SubqueryExpr* subquery_expr = new infinity::SubqueryExpr();
     subquery_expr->subquery_type_ = infinity::SubqueryType::kNotIn;
@@ -8579,11 +8597,11 @@ Return4:
     subquery_expr->select_ = (yyvsp[-1].select_stmt);
     (yyval.expr_t) = subquery_expr;
 }
-#line 8583 "parser.cpp"
+#line 8601 "parser.cpp"
     break;
 
-  case 457: /* column_expr: IDENTIFIER  */
-#line 3532 "parser.y"
+  case 458: /* column_expr: IDENTIFIER  */
+#line 3543 "parser.y"
                          {
     infinity::ColumnExpr* column_expr = new infinity::ColumnExpr();
     ParserHelper::ToLower((yyvsp[0].str_value));
@@ -8591,11 +8609,11 @@ Return4:
     free((yyvsp[0].str_value));
     (yyval.expr_t) = column_expr;
 }
-#line 8595 "parser.cpp"
+#line 8613 "parser.cpp"
     break;
 
-  case 458: /* column_expr: column_expr '.' IDENTIFIER  */
-#line 3539 "parser.y"
+  case 459: /* column_expr: column_expr '.' IDENTIFIER  */
+#line 3550 "parser.y"
                              {
     infinity::ColumnExpr* column_expr = (infinity::ColumnExpr*)(yyvsp[-2].expr_t);
     ParserHelper::ToLower((yyvsp[0].str_value));
@@ -8603,21 +8621,21 @@ Return4:
     free((yyvsp[0].str_value));
     (yyval.expr_t) = column_expr;
 }
-#line 8607 "parser.cpp"
+#line 8625 "parser.cpp"
     break;
 
-  case 459: /* column_expr: '*'  */
-#line 3546 "parser.y"
+  case 460: /* column_expr: '*'  */
+#line 3557 "parser.y"
       {
     infinity::ColumnExpr* column_expr = new infinity::ColumnExpr();
     column_expr->star_ = true;
     (yyval.expr_t) = column_expr;
 }
-#line 8617 "parser.cpp"
+#line 8635 "parser.cpp"
     break;
 
-  case 460: /* column_expr: column_expr '.' '*'  */
-#line 3551 "parser.y"
+  case 461: /* column_expr: column_expr '.' '*'  */
+#line 3562 "parser.y"
                       {
     infinity::ColumnExpr* column_expr = (infinity::ColumnExpr*)(yyvsp[-2].expr_t);
     if(column_expr->star_) {
@@ -8627,240 +8645,240 @@ Return4:
     column_expr->star_ = true;
     (yyval.expr_t) = column_expr;
 }
-#line 8631 "parser.cpp"
+#line 8649 "parser.cpp"
     break;
 
-  case 461: /* constant_expr: STRING  */
-#line 3561 "parser.y"
+  case 462: /* constant_expr: STRING  */
+#line 3572 "parser.y"
                       {
     infinity::ConstantExpr* const_expr = new infinity::ConstantExpr(infinity::LiteralType::kString);
     const_expr->str_value_ = (yyvsp[0].str_value);
     (yyval.const_expr_t) = const_expr;
 }
-#line 8641 "parser.cpp"
+#line 8659 "parser.cpp"
     break;
 
-  case 462: /* constant_expr: TRUE  */
-#line 3566 "parser.y"
+  case 463: /* constant_expr: TRUE  */
+#line 3577 "parser.y"
        {
     infinity::ConstantExpr* const_expr = new infinity::ConstantExpr(infinity::LiteralType::kBoolean);
     const_expr->bool_value_ = true;
     (yyval.const_expr_t) = const_expr;
 }
-#line 8651 "parser.cpp"
+#line 8669 "parser.cpp"
     break;
 
-  case 463: /* constant_expr: FALSE  */
-#line 3571 "parser.y"
+  case 464: /* constant_expr: FALSE  */
+#line 3582 "parser.y"
         {
     infinity::ConstantExpr* const_expr = new infinity::ConstantExpr(infinity::LiteralType::kBoolean);
     const_expr->bool_value_ = false;
     (yyval.const_expr_t) = const_expr;
 }
-#line 8661 "parser.cpp"
+#line 8679 "parser.cpp"
     break;
 
-  case 464: /* constant_expr: DOUBLE_VALUE  */
-#line 3576 "parser.y"
+  case 465: /* constant_expr: DOUBLE_VALUE  */
+#line 3587 "parser.y"
                {
     infinity::ConstantExpr* const_expr = new infinity::ConstantExpr(infinity::LiteralType::kDouble);
     const_expr->double_value_ = (yyvsp[0].double_value);
     (yyval.const_expr_t) = const_expr;
 }
-#line 8671 "parser.cpp"
+#line 8689 "parser.cpp"
     break;
 
-  case 465: /* constant_expr: LONG_VALUE  */
-#line 3581 "parser.y"
+  case 466: /* constant_expr: LONG_VALUE  */
+#line 3592 "parser.y"
              {
     infinity::ConstantExpr* const_expr = new infinity::ConstantExpr(infinity::LiteralType::kInteger);
     const_expr->integer_value_ = (yyvsp[0].long_value);
     (yyval.const_expr_t) = const_expr;
 }
-#line 8681 "parser.cpp"
+#line 8699 "parser.cpp"
     break;
 
-  case 466: /* constant_expr: DATE STRING  */
-#line 3586 "parser.y"
+  case 467: /* constant_expr: DATE STRING  */
+#line 3597 "parser.y"
               {
     infinity::ConstantExpr* const_expr = new infinity::ConstantExpr(infinity::LiteralType::kDate);
     const_expr->date_value_ = (yyvsp[0].str_value);
     (yyval.const_expr_t) = const_expr;
 }
-#line 8691 "parser.cpp"
+#line 8709 "parser.cpp"
     break;
 
-  case 467: /* constant_expr: TIME STRING  */
-#line 3591 "parser.y"
+  case 468: /* constant_expr: TIME STRING  */
+#line 3602 "parser.y"
               {
     infinity::ConstantExpr* const_expr = new infinity::ConstantExpr(infinity::LiteralType::kTime);
     const_expr->date_value_ = (yyvsp[0].str_value);
     (yyval.const_expr_t) = const_expr;
 }
-#line 8701 "parser.cpp"
+#line 8719 "parser.cpp"
     break;
 
-  case 468: /* constant_expr: DATETIME STRING  */
-#line 3596 "parser.y"
+  case 469: /* constant_expr: DATETIME STRING  */
+#line 3607 "parser.y"
                   {
     infinity::ConstantExpr* const_expr = new infinity::ConstantExpr(infinity::LiteralType::kDateTime);
     const_expr->date_value_ = (yyvsp[0].str_value);
     (yyval.const_expr_t) = const_expr;
 }
-#line 8711 "parser.cpp"
+#line 8729 "parser.cpp"
     break;
 
-  case 469: /* constant_expr: TIMESTAMP STRING  */
-#line 3601 "parser.y"
+  case 470: /* constant_expr: TIMESTAMP STRING  */
+#line 3612 "parser.y"
                    {
     infinity::ConstantExpr* const_expr = new infinity::ConstantExpr(infinity::LiteralType::kTimestamp);
     const_expr->date_value_ = (yyvsp[0].str_value);
     (yyval.const_expr_t) = const_expr;
 }
-#line 8721 "parser.cpp"
+#line 8739 "parser.cpp"
     break;
 
-  case 470: /* constant_expr: INTERVAL interval_expr  */
-#line 3606 "parser.y"
+  case 471: /* constant_expr: INTERVAL interval_expr  */
+#line 3617 "parser.y"
                          {
     (yyval.const_expr_t) = (yyvsp[0].const_expr_t);
 }
-#line 8729 "parser.cpp"
+#line 8747 "parser.cpp"
     break;
 
-  case 471: /* constant_expr: interval_expr  */
-#line 3609 "parser.y"
+  case 472: /* constant_expr: interval_expr  */
+#line 3620 "parser.y"
                 {
     (yyval.const_expr_t) = (yyvsp[0].const_expr_t);
 }
-#line 8737 "parser.cpp"
+#line 8755 "parser.cpp"
     break;
 
-  case 472: /* constant_expr: common_array_expr  */
-#line 3612 "parser.y"
+  case 473: /* constant_expr: common_array_expr  */
+#line 3623 "parser.y"
                     {
     (yyval.const_expr_t) = (yyvsp[0].const_expr_t);
 }
-#line 8745 "parser.cpp"
+#line 8763 "parser.cpp"
     break;
 
-  case 473: /* constant_expr: curly_brackets_expr  */
-#line 3615 "parser.y"
+  case 474: /* constant_expr: curly_brackets_expr  */
+#line 3626 "parser.y"
                       {
     (yyval.const_expr_t) = (yyvsp[0].const_expr_t);
 }
-#line 8753 "parser.cpp"
+#line 8771 "parser.cpp"
     break;
 
-  case 474: /* common_array_expr: array_expr  */
-#line 3619 "parser.y"
+  case 475: /* common_array_expr: array_expr  */
+#line 3630 "parser.y"
                               {
     (yyval.const_expr_t) = (yyvsp[0].const_expr_t);
 }
-#line 8761 "parser.cpp"
+#line 8779 "parser.cpp"
     break;
 
-  case 475: /* common_array_expr: subarray_array_expr  */
-#line 3622 "parser.y"
+  case 476: /* common_array_expr: subarray_array_expr  */
+#line 3633 "parser.y"
                       {
     (yyval.const_expr_t) = (yyvsp[0].const_expr_t);
 }
-#line 8769 "parser.cpp"
+#line 8787 "parser.cpp"
     break;
 
-  case 476: /* common_array_expr: sparse_array_expr  */
-#line 3625 "parser.y"
+  case 477: /* common_array_expr: sparse_array_expr  */
+#line 3636 "parser.y"
                     {
     (yyval.const_expr_t) = (yyvsp[0].const_expr_t);
 }
-#line 8777 "parser.cpp"
+#line 8795 "parser.cpp"
     break;
 
-  case 477: /* common_array_expr: empty_array_expr  */
-#line 3628 "parser.y"
+  case 478: /* common_array_expr: empty_array_expr  */
+#line 3639 "parser.y"
                    {
     (yyval.const_expr_t) = (yyvsp[0].const_expr_t);
 }
-#line 8785 "parser.cpp"
+#line 8803 "parser.cpp"
     break;
 
-  case 478: /* common_sparse_array_expr: sparse_array_expr  */
-#line 3632 "parser.y"
+  case 479: /* common_sparse_array_expr: sparse_array_expr  */
+#line 3643 "parser.y"
                                             {
     (yyval.const_expr_t) = (yyvsp[0].const_expr_t);
 }
-#line 8793 "parser.cpp"
+#line 8811 "parser.cpp"
     break;
 
-  case 479: /* common_sparse_array_expr: array_expr  */
-#line 3635 "parser.y"
+  case 480: /* common_sparse_array_expr: array_expr  */
+#line 3646 "parser.y"
              {
     (yyval.const_expr_t) = (yyvsp[0].const_expr_t);
 }
-#line 8801 "parser.cpp"
+#line 8819 "parser.cpp"
     break;
 
-  case 480: /* common_sparse_array_expr: empty_array_expr  */
-#line 3638 "parser.y"
+  case 481: /* common_sparse_array_expr: empty_array_expr  */
+#line 3649 "parser.y"
                    {
     (yyval.const_expr_t) = (yyvsp[0].const_expr_t);
 }
-#line 8809 "parser.cpp"
+#line 8827 "parser.cpp"
     break;
 
-  case 481: /* subarray_array_expr: unclosed_subarray_array_expr ']'  */
-#line 3642 "parser.y"
+  case 482: /* subarray_array_expr: unclosed_subarray_array_expr ']'  */
+#line 3653 "parser.y"
                                                       {
     (yyval.const_expr_t) = (yyvsp[-1].const_expr_t);
 }
-#line 8817 "parser.cpp"
+#line 8835 "parser.cpp"
     break;
 
-  case 482: /* unclosed_subarray_array_expr: '[' common_array_expr  */
-#line 3646 "parser.y"
+  case 483: /* unclosed_subarray_array_expr: '[' common_array_expr  */
+#line 3657 "parser.y"
                                                     {
     infinity::ConstantExpr* const_expr = new infinity::ConstantExpr(infinity::LiteralType::kSubArrayArray);
     const_expr->sub_array_array_.emplace_back((yyvsp[0].const_expr_t));
     (yyval.const_expr_t) = const_expr;
 }
-#line 8827 "parser.cpp"
+#line 8845 "parser.cpp"
     break;
 
-  case 483: /* unclosed_subarray_array_expr: unclosed_subarray_array_expr ',' common_array_expr  */
-#line 3651 "parser.y"
+  case 484: /* unclosed_subarray_array_expr: unclosed_subarray_array_expr ',' common_array_expr  */
+#line 3662 "parser.y"
                                                      {
     (yyvsp[-2].const_expr_t)->sub_array_array_.emplace_back((yyvsp[0].const_expr_t));
     (yyval.const_expr_t) = (yyvsp[-2].const_expr_t);
 }
-#line 8836 "parser.cpp"
+#line 8854 "parser.cpp"
     break;
 
-  case 484: /* sparse_array_expr: long_sparse_array_expr  */
-#line 3656 "parser.y"
+  case 485: /* sparse_array_expr: long_sparse_array_expr  */
+#line 3667 "parser.y"
                                           {
     (yyval.const_expr_t) = (yyvsp[0].const_expr_t);
 }
-#line 8844 "parser.cpp"
+#line 8862 "parser.cpp"
     break;
 
-  case 485: /* sparse_array_expr: double_sparse_array_expr  */
-#line 3659 "parser.y"
+  case 486: /* sparse_array_expr: double_sparse_array_expr  */
+#line 3670 "parser.y"
                            {
     (yyval.const_expr_t) = (yyvsp[0].const_expr_t);
 }
-#line 8852 "parser.cpp"
+#line 8870 "parser.cpp"
     break;
 
-  case 486: /* long_sparse_array_expr: unclosed_long_sparse_array_expr ']'  */
-#line 3663 "parser.y"
+  case 487: /* long_sparse_array_expr: unclosed_long_sparse_array_expr ']'  */
+#line 3674 "parser.y"
                                                             {
     (yyval.const_expr_t) = (yyvsp[-1].const_expr_t);
 }
-#line 8860 "parser.cpp"
+#line 8878 "parser.cpp"
     break;
 
-  case 487: /* unclosed_long_sparse_array_expr: '[' int_sparse_ele  */
-#line 3667 "parser.y"
+  case 488: /* unclosed_long_sparse_array_expr: '[' int_sparse_ele  */
+#line 3678 "parser.y"
                                                     {
     infinity::ConstantExpr* const_expr = new infinity::ConstantExpr(infinity::LiteralType::kLongSparseArray);
     const_expr->long_sparse_array_.first.emplace_back((yyvsp[0].int_sparse_ele_t)->first);
@@ -8868,30 +8886,30 @@ Return4:
     delete (yyvsp[0].int_sparse_ele_t);
     (yyval.const_expr_t) = const_expr;
 }
-#line 8872 "parser.cpp"
+#line 8890 "parser.cpp"
     break;
 
-  case 488: /* unclosed_long_sparse_array_expr: unclosed_long_sparse_array_expr ',' int_sparse_ele  */
-#line 3674 "parser.y"
+  case 489: /* unclosed_long_sparse_array_expr: unclosed_long_sparse_array_expr ',' int_sparse_ele  */
+#line 3685 "parser.y"
                                                      {
     (yyvsp[-2].const_expr_t)->long_sparse_array_.first.emplace_back((yyvsp[0].int_sparse_ele_t)->first);
     (yyvsp[-2].const_expr_t)->long_sparse_array_.second.emplace_back((yyvsp[0].int_sparse_ele_t)->second);
     delete (yyvsp[0].int_sparse_ele_t);
     (yyval.const_expr_t) = (yyvsp[-2].const_expr_t);
 }
-#line 8883 "parser.cpp"
+#line 8901 "parser.cpp"
     break;
 
-  case 489: /* double_sparse_array_expr: unclosed_double_sparse_array_expr ']'  */
-#line 3681 "parser.y"
+  case 490: /* double_sparse_array_expr: unclosed_double_sparse_array_expr ']'  */
+#line 3692 "parser.y"
                                                                 {
     (yyval.const_expr_t) = (yyvsp[-1].const_expr_t);
 }
-#line 8891 "parser.cpp"
+#line 8909 "parser.cpp"
     break;
 
-  case 490: /* unclosed_double_sparse_array_expr: '[' float_sparse_ele  */
-#line 3685 "parser.y"
+  case 491: /* unclosed_double_sparse_array_expr: '[' float_sparse_ele  */
+#line 3696 "parser.y"
                                                         {
     infinity::ConstantExpr* const_expr = new infinity::ConstantExpr(infinity::LiteralType::kDoubleSparseArray);
     const_expr->double_sparse_array_.first.emplace_back((yyvsp[0].float_sparse_ele_t)->first);
@@ -8899,300 +8917,300 @@ Return4:
     delete (yyvsp[0].float_sparse_ele_t);
     (yyval.const_expr_t) = const_expr;
 }
-#line 8903 "parser.cpp"
+#line 8921 "parser.cpp"
     break;
 
-  case 491: /* unclosed_double_sparse_array_expr: unclosed_double_sparse_array_expr ',' float_sparse_ele  */
-#line 3692 "parser.y"
+  case 492: /* unclosed_double_sparse_array_expr: unclosed_double_sparse_array_expr ',' float_sparse_ele  */
+#line 3703 "parser.y"
                                                          {
     (yyvsp[-2].const_expr_t)->double_sparse_array_.first.emplace_back((yyvsp[0].float_sparse_ele_t)->first);
     (yyvsp[-2].const_expr_t)->double_sparse_array_.second.emplace_back((yyvsp[0].float_sparse_ele_t)->second);
     delete (yyvsp[0].float_sparse_ele_t);
     (yyval.const_expr_t) = (yyvsp[-2].const_expr_t);
 }
-#line 8914 "parser.cpp"
+#line 8932 "parser.cpp"
     break;
 
-  case 492: /* empty_array_expr: '[' ']'  */
-#line 3699 "parser.y"
+  case 493: /* empty_array_expr: '[' ']'  */
+#line 3710 "parser.y"
                           {
     (yyval.const_expr_t) = new infinity::ConstantExpr(infinity::LiteralType::kEmptyArray);
 }
-#line 8922 "parser.cpp"
+#line 8940 "parser.cpp"
     break;
 
-  case 493: /* curly_brackets_expr: unclosed_curly_brackets_expr '}'  */
-#line 3703 "parser.y"
+  case 494: /* curly_brackets_expr: unclosed_curly_brackets_expr '}'  */
+#line 3714 "parser.y"
                                                       {
     (yyval.const_expr_t) = (yyvsp[-1].const_expr_t);
 }
-#line 8930 "parser.cpp"
+#line 8948 "parser.cpp"
     break;
 
-  case 494: /* curly_brackets_expr: '{' '}'  */
-#line 3706 "parser.y"
+  case 495: /* curly_brackets_expr: '{' '}'  */
+#line 3717 "parser.y"
           {
     (yyval.const_expr_t) = new infinity::ConstantExpr(infinity::LiteralType::kCurlyBracketsArray);
 }
-#line 8938 "parser.cpp"
+#line 8956 "parser.cpp"
     break;
 
-  case 495: /* unclosed_curly_brackets_expr: '{' constant_expr  */
-#line 3710 "parser.y"
+  case 496: /* unclosed_curly_brackets_expr: '{' constant_expr  */
+#line 3721 "parser.y"
                                                 {
     (yyval.const_expr_t) = new infinity::ConstantExpr(infinity::LiteralType::kCurlyBracketsArray);
     (yyval.const_expr_t)->curly_brackets_array_.emplace_back((yyvsp[0].const_expr_t));
 }
-#line 8947 "parser.cpp"
+#line 8965 "parser.cpp"
     break;
 
-  case 496: /* unclosed_curly_brackets_expr: unclosed_curly_brackets_expr ',' constant_expr  */
-#line 3714 "parser.y"
+  case 497: /* unclosed_curly_brackets_expr: unclosed_curly_brackets_expr ',' constant_expr  */
+#line 3725 "parser.y"
                                                  {
     (yyvsp[-2].const_expr_t)->curly_brackets_array_.emplace_back((yyvsp[0].const_expr_t));
     (yyval.const_expr_t) = (yyvsp[-2].const_expr_t);
 }
-#line 8956 "parser.cpp"
+#line 8974 "parser.cpp"
     break;
 
-  case 497: /* int_sparse_ele: LONG_VALUE ':' LONG_VALUE  */
-#line 3719 "parser.y"
+  case 498: /* int_sparse_ele: LONG_VALUE ':' LONG_VALUE  */
+#line 3730 "parser.y"
                                           {
     (yyval.int_sparse_ele_t) = new std::pair<int64_t, int64_t>{(yyvsp[-2].long_value), (yyvsp[0].long_value)};
 }
-#line 8964 "parser.cpp"
+#line 8982 "parser.cpp"
     break;
 
-  case 498: /* float_sparse_ele: LONG_VALUE ':' DOUBLE_VALUE  */
-#line 3723 "parser.y"
+  case 499: /* float_sparse_ele: LONG_VALUE ':' DOUBLE_VALUE  */
+#line 3734 "parser.y"
                                               {
     (yyval.float_sparse_ele_t) = new std::pair<int64_t, double>{(yyvsp[-2].long_value), (yyvsp[0].double_value)};
 }
-#line 8972 "parser.cpp"
+#line 8990 "parser.cpp"
     break;
 
-  case 499: /* array_expr: long_array_expr  */
-#line 3727 "parser.y"
+  case 500: /* array_expr: long_array_expr  */
+#line 3738 "parser.y"
                             {
     (yyval.const_expr_t) = (yyvsp[0].const_expr_t);
 }
-#line 8980 "parser.cpp"
+#line 8998 "parser.cpp"
     break;
 
-  case 500: /* array_expr: double_array_expr  */
-#line 3730 "parser.y"
+  case 501: /* array_expr: double_array_expr  */
+#line 3741 "parser.y"
                     {
     (yyval.const_expr_t) = (yyvsp[0].const_expr_t);
 }
-#line 8988 "parser.cpp"
+#line 9006 "parser.cpp"
     break;
 
-  case 501: /* long_array_expr: unclosed_long_array_expr ']'  */
-#line 3734 "parser.y"
+  case 502: /* long_array_expr: unclosed_long_array_expr ']'  */
+#line 3745 "parser.y"
                                               {
     (yyval.const_expr_t) = (yyvsp[-1].const_expr_t);
 }
-#line 8996 "parser.cpp"
+#line 9014 "parser.cpp"
     break;
 
-  case 502: /* unclosed_long_array_expr: '[' LONG_VALUE  */
-#line 3738 "parser.y"
+  case 503: /* unclosed_long_array_expr: '[' LONG_VALUE  */
+#line 3749 "parser.y"
                                          {
     infinity::ConstantExpr* const_expr = new infinity::ConstantExpr(infinity::LiteralType::kIntegerArray);
     const_expr->long_array_.emplace_back((yyvsp[0].long_value));
     (yyval.const_expr_t) = const_expr;
 }
-#line 9006 "parser.cpp"
+#line 9024 "parser.cpp"
     break;
 
-  case 503: /* unclosed_long_array_expr: unclosed_long_array_expr ',' LONG_VALUE  */
-#line 3743 "parser.y"
+  case 504: /* unclosed_long_array_expr: unclosed_long_array_expr ',' LONG_VALUE  */
+#line 3754 "parser.y"
                                           {
     (yyvsp[-2].const_expr_t)->long_array_.emplace_back((yyvsp[0].long_value));
     (yyval.const_expr_t) = (yyvsp[-2].const_expr_t);
 }
-#line 9015 "parser.cpp"
+#line 9033 "parser.cpp"
     break;
 
-  case 504: /* double_array_expr: unclosed_double_array_expr ']'  */
-#line 3748 "parser.y"
+  case 505: /* double_array_expr: unclosed_double_array_expr ']'  */
+#line 3759 "parser.y"
                                                   {
     (yyval.const_expr_t) = (yyvsp[-1].const_expr_t);
 }
-#line 9023 "parser.cpp"
+#line 9041 "parser.cpp"
     break;
 
-  case 505: /* unclosed_double_array_expr: '[' DOUBLE_VALUE  */
-#line 3752 "parser.y"
+  case 506: /* unclosed_double_array_expr: '[' DOUBLE_VALUE  */
+#line 3763 "parser.y"
                                              {
     infinity::ConstantExpr* const_expr = new infinity::ConstantExpr(infinity::LiteralType::kDoubleArray);
     const_expr->double_array_.emplace_back((yyvsp[0].double_value));
     (yyval.const_expr_t) = const_expr;
 }
-#line 9033 "parser.cpp"
+#line 9051 "parser.cpp"
     break;
 
-  case 506: /* unclosed_double_array_expr: unclosed_double_array_expr ',' DOUBLE_VALUE  */
-#line 3757 "parser.y"
+  case 507: /* unclosed_double_array_expr: unclosed_double_array_expr ',' DOUBLE_VALUE  */
+#line 3768 "parser.y"
                                               {
     (yyvsp[-2].const_expr_t)->double_array_.emplace_back((yyvsp[0].double_value));
     (yyval.const_expr_t) = (yyvsp[-2].const_expr_t);
 }
-#line 9042 "parser.cpp"
+#line 9060 "parser.cpp"
     break;
 
-  case 507: /* interval_expr: LONG_VALUE SECONDS  */
-#line 3762 "parser.y"
+  case 508: /* interval_expr: LONG_VALUE SECONDS  */
+#line 3773 "parser.y"
                                   {
     infinity::ConstantExpr* const_expr = new infinity::ConstantExpr(infinity::LiteralType::kInterval);
     const_expr->interval_type_ = infinity::TimeUnit::kSecond;
     const_expr->integer_value_ = (yyvsp[-1].long_value);
     (yyval.const_expr_t) = const_expr;
 }
-#line 9053 "parser.cpp"
+#line 9071 "parser.cpp"
     break;
 
-  case 508: /* interval_expr: LONG_VALUE SECOND  */
-#line 3768 "parser.y"
+  case 509: /* interval_expr: LONG_VALUE SECOND  */
+#line 3779 "parser.y"
                     {
     infinity::ConstantExpr* const_expr = new infinity::ConstantExpr(infinity::LiteralType::kInterval);
     const_expr->interval_type_ = infinity::TimeUnit::kSecond;
     const_expr->integer_value_ = (yyvsp[-1].long_value);
     (yyval.const_expr_t) = const_expr;
 }
-#line 9064 "parser.cpp"
+#line 9082 "parser.cpp"
     break;
 
-  case 509: /* interval_expr: LONG_VALUE MINUTES  */
-#line 3774 "parser.y"
+  case 510: /* interval_expr: LONG_VALUE MINUTES  */
+#line 3785 "parser.y"
                      {
     infinity::ConstantExpr* const_expr = new infinity::ConstantExpr(infinity::LiteralType::kInterval);
     const_expr->interval_type_ = infinity::TimeUnit::kMinute;
     const_expr->integer_value_ = (yyvsp[-1].long_value);
     (yyval.const_expr_t) = const_expr;
 }
-#line 9075 "parser.cpp"
+#line 9093 "parser.cpp"
     break;
 
-  case 510: /* interval_expr: LONG_VALUE MINUTE  */
-#line 3780 "parser.y"
+  case 511: /* interval_expr: LONG_VALUE MINUTE  */
+#line 3791 "parser.y"
                     {
     infinity::ConstantExpr* const_expr = new infinity::ConstantExpr(infinity::LiteralType::kInterval);
     const_expr->interval_type_ = infinity::TimeUnit::kMinute;
     const_expr->integer_value_ = (yyvsp[-1].long_value);
     (yyval.const_expr_t) = const_expr;
 }
-#line 9086 "parser.cpp"
+#line 9104 "parser.cpp"
     break;
 
-  case 511: /* interval_expr: LONG_VALUE HOURS  */
-#line 3786 "parser.y"
+  case 512: /* interval_expr: LONG_VALUE HOURS  */
+#line 3797 "parser.y"
                    {
     infinity::ConstantExpr* const_expr = new infinity::ConstantExpr(infinity::LiteralType::kInterval);
     const_expr->interval_type_ = infinity::TimeUnit::kHour;
     const_expr->integer_value_ = (yyvsp[-1].long_value);
     (yyval.const_expr_t) = const_expr;
 }
-#line 9097 "parser.cpp"
+#line 9115 "parser.cpp"
     break;
 
-  case 512: /* interval_expr: LONG_VALUE HOUR  */
-#line 3792 "parser.y"
+  case 513: /* interval_expr: LONG_VALUE HOUR  */
+#line 3803 "parser.y"
                   {
     infinity::ConstantExpr* const_expr = new infinity::ConstantExpr(infinity::LiteralType::kInterval);
     const_expr->interval_type_ = infinity::TimeUnit::kHour;
     const_expr->integer_value_ = (yyvsp[-1].long_value);
     (yyval.const_expr_t) = const_expr;
 }
-#line 9108 "parser.cpp"
+#line 9126 "parser.cpp"
     break;
 
-  case 513: /* interval_expr: LONG_VALUE DAYS  */
-#line 3798 "parser.y"
+  case 514: /* interval_expr: LONG_VALUE DAYS  */
+#line 3809 "parser.y"
                   {
     infinity::ConstantExpr* const_expr = new infinity::ConstantExpr(infinity::LiteralType::kInterval);
     const_expr->interval_type_ = infinity::TimeUnit::kDay;
     const_expr->integer_value_ = (yyvsp[-1].long_value);
     (yyval.const_expr_t) = const_expr;
 }
-#line 9119 "parser.cpp"
+#line 9137 "parser.cpp"
     break;
 
-  case 514: /* interval_expr: LONG_VALUE DAY  */
-#line 3804 "parser.y"
+  case 515: /* interval_expr: LONG_VALUE DAY  */
+#line 3815 "parser.y"
                  {
     infinity::ConstantExpr* const_expr = new infinity::ConstantExpr(infinity::LiteralType::kInterval);
     const_expr->interval_type_ = infinity::TimeUnit::kDay;
     const_expr->integer_value_ = (yyvsp[-1].long_value);
     (yyval.const_expr_t) = const_expr;
 }
-#line 9130 "parser.cpp"
+#line 9148 "parser.cpp"
     break;
 
-  case 515: /* interval_expr: LONG_VALUE MONTHS  */
-#line 3810 "parser.y"
+  case 516: /* interval_expr: LONG_VALUE MONTHS  */
+#line 3821 "parser.y"
                     {
     infinity::ConstantExpr* const_expr = new infinity::ConstantExpr(infinity::LiteralType::kInterval);
     const_expr->interval_type_ = infinity::TimeUnit::kMonth;
     const_expr->integer_value_ = (yyvsp[-1].long_value);
     (yyval.const_expr_t) = const_expr;
 }
-#line 9141 "parser.cpp"
+#line 9159 "parser.cpp"
     break;
 
-  case 516: /* interval_expr: LONG_VALUE MONTH  */
-#line 3816 "parser.y"
+  case 517: /* interval_expr: LONG_VALUE MONTH  */
+#line 3827 "parser.y"
                    {
     infinity::ConstantExpr* const_expr = new infinity::ConstantExpr(infinity::LiteralType::kInterval);
     const_expr->interval_type_ = infinity::TimeUnit::kMonth;
     const_expr->integer_value_ = (yyvsp[-1].long_value);
     (yyval.const_expr_t) = const_expr;
 }
-#line 9152 "parser.cpp"
+#line 9170 "parser.cpp"
     break;
 
-  case 517: /* interval_expr: LONG_VALUE YEARS  */
-#line 3822 "parser.y"
+  case 518: /* interval_expr: LONG_VALUE YEARS  */
+#line 3833 "parser.y"
                    {
     infinity::ConstantExpr* const_expr = new infinity::ConstantExpr(infinity::LiteralType::kInterval);
     const_expr->interval_type_ = infinity::TimeUnit::kYear;
     const_expr->integer_value_ = (yyvsp[-1].long_value);
     (yyval.const_expr_t) = const_expr;
 }
-#line 9163 "parser.cpp"
+#line 9181 "parser.cpp"
     break;
 
-  case 518: /* interval_expr: LONG_VALUE YEAR  */
-#line 3828 "parser.y"
+  case 519: /* interval_expr: LONG_VALUE YEAR  */
+#line 3839 "parser.y"
                   {
     infinity::ConstantExpr* const_expr = new infinity::ConstantExpr(infinity::LiteralType::kInterval);
     const_expr->interval_type_ = infinity::TimeUnit::kYear;
     const_expr->integer_value_ = (yyvsp[-1].long_value);
     (yyval.const_expr_t) = const_expr;
 }
-#line 9174 "parser.cpp"
+#line 9192 "parser.cpp"
     break;
 
-  case 519: /* copy_option_list: copy_option  */
-#line 3839 "parser.y"
+  case 520: /* copy_option_list: copy_option  */
+#line 3850 "parser.y"
                                {
     (yyval.copy_option_array) = new std::vector<infinity::CopyOption*>();
     (yyval.copy_option_array)->push_back((yyvsp[0].copy_option_t));
 }
-#line 9183 "parser.cpp"
+#line 9201 "parser.cpp"
     break;
 
-  case 520: /* copy_option_list: copy_option_list ',' copy_option  */
-#line 3843 "parser.y"
+  case 521: /* copy_option_list: copy_option_list ',' copy_option  */
+#line 3854 "parser.y"
                                    {
     (yyvsp[-2].copy_option_array)->push_back((yyvsp[0].copy_option_t));
     (yyval.copy_option_array) = (yyvsp[-2].copy_option_array);
 }
-#line 9192 "parser.cpp"
+#line 9210 "parser.cpp"
     break;
 
-  case 521: /* copy_option: FORMAT IDENTIFIER  */
-#line 3848 "parser.y"
+  case 522: /* copy_option: FORMAT IDENTIFIER  */
+#line 3859 "parser.y"
                                 {
     (yyval.copy_option_t) = new infinity::CopyOption();
     (yyval.copy_option_t)->option_type_ = infinity::CopyOptionType::kFormat;
@@ -9224,11 +9242,11 @@ Return4:
         YYERROR;
     }
 }
-#line 9228 "parser.cpp"
+#line 9246 "parser.cpp"
     break;
 
-  case 522: /* copy_option: DELIMITER STRING  */
-#line 3879 "parser.y"
+  case 523: /* copy_option: DELIMITER STRING  */
+#line 3890 "parser.y"
                    {
     (yyval.copy_option_t) = new infinity::CopyOption();
     (yyval.copy_option_t)->option_type_ = infinity::CopyOptionType::kDelimiter;
@@ -9239,83 +9257,83 @@ Return4:
     }
     free((yyvsp[0].str_value));
 }
-#line 9243 "parser.cpp"
+#line 9261 "parser.cpp"
     break;
 
-  case 523: /* copy_option: HEADER  */
-#line 3889 "parser.y"
+  case 524: /* copy_option: HEADER  */
+#line 3900 "parser.y"
          {
     (yyval.copy_option_t) = new infinity::CopyOption();
     (yyval.copy_option_t)->option_type_ = infinity::CopyOptionType::kHeader;
     (yyval.copy_option_t)->header_ = true;
 }
-#line 9253 "parser.cpp"
+#line 9271 "parser.cpp"
     break;
 
-  case 524: /* copy_option: OFFSET LONG_VALUE  */
-#line 3894 "parser.y"
+  case 525: /* copy_option: OFFSET LONG_VALUE  */
+#line 3905 "parser.y"
                     {
     (yyval.copy_option_t) = new infinity::CopyOption();
     (yyval.copy_option_t)->option_type_ = infinity::CopyOptionType::kOffset;
     (yyval.copy_option_t)->offset_ = (yyvsp[0].long_value);
 }
-#line 9263 "parser.cpp"
+#line 9281 "parser.cpp"
     break;
 
-  case 525: /* copy_option: LIMIT LONG_VALUE  */
-#line 3899 "parser.y"
+  case 526: /* copy_option: LIMIT LONG_VALUE  */
+#line 3910 "parser.y"
                    {
     (yyval.copy_option_t) = new infinity::CopyOption();
     (yyval.copy_option_t)->option_type_ = infinity::CopyOptionType::kLimit;
     (yyval.copy_option_t)->limit_ = (yyvsp[0].long_value);
 }
-#line 9273 "parser.cpp"
+#line 9291 "parser.cpp"
     break;
 
-  case 526: /* copy_option: ROWLIMIT LONG_VALUE  */
-#line 3904 "parser.y"
+  case 527: /* copy_option: ROWLIMIT LONG_VALUE  */
+#line 3915 "parser.y"
                       {
     (yyval.copy_option_t) = new infinity::CopyOption();
     (yyval.copy_option_t)->option_type_ = infinity::CopyOptionType::kRowLimit;
     (yyval.copy_option_t)->row_limit_ = (yyvsp[0].long_value);
 }
-#line 9283 "parser.cpp"
+#line 9301 "parser.cpp"
     break;
 
-  case 527: /* file_path: STRING  */
-#line 3910 "parser.y"
+  case 528: /* file_path: STRING  */
+#line 3921 "parser.y"
                    {
     (yyval.str_value) = (yyvsp[0].str_value);
 }
-#line 9291 "parser.cpp"
+#line 9309 "parser.cpp"
     break;
 
-  case 528: /* if_exists: IF EXISTS  */
-#line 3914 "parser.y"
+  case 529: /* if_exists: IF EXISTS  */
+#line 3925 "parser.y"
                      { (yyval.bool_value) = true; }
-#line 9297 "parser.cpp"
+#line 9315 "parser.cpp"
     break;
 
-  case 529: /* if_exists: %empty  */
-#line 3915 "parser.y"
+  case 530: /* if_exists: %empty  */
+#line 3926 "parser.y"
   { (yyval.bool_value) = false; }
-#line 9303 "parser.cpp"
+#line 9321 "parser.cpp"
     break;
 
-  case 530: /* if_not_exists: IF NOT EXISTS  */
-#line 3917 "parser.y"
+  case 531: /* if_not_exists: IF NOT EXISTS  */
+#line 3928 "parser.y"
                               { (yyval.bool_value) = true; }
-#line 9309 "parser.cpp"
+#line 9327 "parser.cpp"
     break;
 
-  case 531: /* if_not_exists: %empty  */
-#line 3918 "parser.y"
+  case 532: /* if_not_exists: %empty  */
+#line 3929 "parser.y"
   { (yyval.bool_value) = false; }
-#line 9315 "parser.cpp"
+#line 9333 "parser.cpp"
     break;
 
-  case 534: /* if_not_exists_info: if_not_exists IDENTIFIER  */
-#line 3933 "parser.y"
+  case 535: /* if_not_exists_info: if_not_exists IDENTIFIER  */
+#line 3944 "parser.y"
                                               {
     (yyval.if_not_exists_info_t) = new infinity::IfNotExistsInfo();
     (yyval.if_not_exists_info_t)->exists_ = true;
@@ -9324,80 +9342,80 @@ Return4:
     (yyval.if_not_exists_info_t)->info_ = (yyvsp[0].str_value);
     free((yyvsp[0].str_value));
 }
-#line 9328 "parser.cpp"
+#line 9346 "parser.cpp"
     break;
 
-  case 535: /* if_not_exists_info: %empty  */
-#line 3941 "parser.y"
+  case 536: /* if_not_exists_info: %empty  */
+#line 3952 "parser.y"
   {
     (yyval.if_not_exists_info_t) = new infinity::IfNotExistsInfo();
 }
-#line 9336 "parser.cpp"
+#line 9354 "parser.cpp"
     break;
 
-  case 536: /* with_index_param_list: WITH '(' index_param_list ')'  */
-#line 3945 "parser.y"
+  case 537: /* with_index_param_list: WITH '(' index_param_list ')'  */
+#line 3956 "parser.y"
                                                       {
     (yyval.with_index_param_list_t) = (yyvsp[-1].index_param_list_t);
 }
-#line 9344 "parser.cpp"
+#line 9362 "parser.cpp"
     break;
 
-  case 537: /* with_index_param_list: %empty  */
-#line 3948 "parser.y"
+  case 538: /* with_index_param_list: %empty  */
+#line 3959 "parser.y"
   {
     (yyval.with_index_param_list_t) = new std::vector<infinity::InitParameter*>();
 }
-#line 9352 "parser.cpp"
+#line 9370 "parser.cpp"
     break;
 
-  case 538: /* optional_table_properties_list: PROPERTIES '(' index_param_list ')'  */
-#line 3952 "parser.y"
+  case 539: /* optional_table_properties_list: PROPERTIES '(' index_param_list ')'  */
+#line 3963 "parser.y"
                                                                      {
     (yyval.with_index_param_list_t) = (yyvsp[-1].index_param_list_t);
 }
-#line 9360 "parser.cpp"
+#line 9378 "parser.cpp"
     break;
 
-  case 539: /* optional_table_properties_list: %empty  */
-#line 3955 "parser.y"
+  case 540: /* optional_table_properties_list: %empty  */
+#line 3966 "parser.y"
   {
     (yyval.with_index_param_list_t) = nullptr;
 }
-#line 9368 "parser.cpp"
+#line 9386 "parser.cpp"
     break;
 
-  case 540: /* index_param_list: index_param  */
-#line 3959 "parser.y"
+  case 541: /* index_param_list: index_param  */
+#line 3970 "parser.y"
                                {
     (yyval.index_param_list_t) = new std::vector<infinity::InitParameter*>();
     (yyval.index_param_list_t)->push_back((yyvsp[0].index_param_t));
 }
-#line 9377 "parser.cpp"
+#line 9395 "parser.cpp"
     break;
 
-  case 541: /* index_param_list: index_param_list ',' index_param  */
-#line 3963 "parser.y"
+  case 542: /* index_param_list: index_param_list ',' index_param  */
+#line 3974 "parser.y"
                                    {
     (yyvsp[-2].index_param_list_t)->push_back((yyvsp[0].index_param_t));
     (yyval.index_param_list_t) = (yyvsp[-2].index_param_list_t);
 }
-#line 9386 "parser.cpp"
+#line 9404 "parser.cpp"
     break;
 
-  case 542: /* index_param: IDENTIFIER  */
-#line 3968 "parser.y"
+  case 543: /* index_param: IDENTIFIER  */
+#line 3979 "parser.y"
                          {
     ParserHelper::ToLower((yyvsp[0].str_value));
     (yyval.index_param_t) = new infinity::InitParameter();
     (yyval.index_param_t)->param_name_ = (yyvsp[0].str_value);
     free((yyvsp[0].str_value));
 }
-#line 9397 "parser.cpp"
+#line 9415 "parser.cpp"
     break;
 
-  case 543: /* index_param: IDENTIFIER '=' IDENTIFIER  */
-#line 3974 "parser.y"
+  case 544: /* index_param: IDENTIFIER '=' IDENTIFIER  */
+#line 3985 "parser.y"
                             {
     ParserHelper::ToLower((yyvsp[-2].str_value));
     ParserHelper::ToLower((yyvsp[0].str_value));
@@ -9408,11 +9426,11 @@ Return4:
     (yyval.index_param_t)->param_value_ = (yyvsp[0].str_value);
     free((yyvsp[0].str_value));
 }
-#line 9412 "parser.cpp"
+#line 9430 "parser.cpp"
     break;
 
-  case 544: /* index_param: IDENTIFIER '=' STRING  */
-#line 3984 "parser.y"
+  case 545: /* index_param: IDENTIFIER '=' STRING  */
+#line 3995 "parser.y"
                         {
     ParserHelper::ToLower((yyvsp[-2].str_value));
     ParserHelper::ToLower((yyvsp[0].str_value));
@@ -9423,11 +9441,11 @@ Return4:
     (yyval.index_param_t)->param_value_ = (yyvsp[0].str_value);
     free((yyvsp[0].str_value));
 }
-#line 9427 "parser.cpp"
+#line 9445 "parser.cpp"
     break;
 
-  case 545: /* index_param: IDENTIFIER '=' LONG_VALUE  */
-#line 3994 "parser.y"
+  case 546: /* index_param: IDENTIFIER '=' LONG_VALUE  */
+#line 4005 "parser.y"
                             {
     ParserHelper::ToLower((yyvsp[-2].str_value));
     (yyval.index_param_t) = new infinity::InitParameter();
@@ -9436,11 +9454,11 @@ Return4:
 
     (yyval.index_param_t)->param_value_ = std::to_string((yyvsp[0].long_value));
 }
-#line 9440 "parser.cpp"
+#line 9458 "parser.cpp"
     break;
 
-  case 546: /* index_param: IDENTIFIER '=' DOUBLE_VALUE  */
-#line 4002 "parser.y"
+  case 547: /* index_param: IDENTIFIER '=' DOUBLE_VALUE  */
+#line 4013 "parser.y"
                               {
     ParserHelper::ToLower((yyvsp[-2].str_value));
     (yyval.index_param_t) = new infinity::InitParameter();
@@ -9449,11 +9467,11 @@ Return4:
 
     (yyval.index_param_t)->param_value_ = std::to_string((yyvsp[0].double_value));
 }
-#line 9453 "parser.cpp"
+#line 9471 "parser.cpp"
     break;
 
-  case 547: /* index_info: '(' IDENTIFIER ')' USING IDENTIFIER with_index_param_list  */
-#line 4013 "parser.y"
+  case 548: /* index_info: '(' IDENTIFIER ')' USING IDENTIFIER with_index_param_list  */
+#line 4024 "parser.y"
                                                                        {
     ParserHelper::ToLower((yyvsp[-1].str_value));
     infinity::IndexType index_type = infinity::IndexType::kInvalid;
@@ -9485,22 +9503,22 @@ Return4:
     (yyval.index_info_t)->index_param_list_ = (yyvsp[0].with_index_param_list_t);
     free((yyvsp[-4].str_value));
 }
-#line 9489 "parser.cpp"
+#line 9507 "parser.cpp"
     break;
 
-  case 548: /* index_info: '(' IDENTIFIER ')'  */
-#line 4044 "parser.y"
+  case 549: /* index_info: '(' IDENTIFIER ')'  */
+#line 4055 "parser.y"
                      {
     (yyval.index_info_t) = new infinity::IndexInfo();
     (yyval.index_info_t)->index_type_ = infinity::IndexType::kSecondary;
     (yyval.index_info_t)->column_name_ = (yyvsp[-1].str_value);
     free((yyvsp[-1].str_value));
 }
-#line 9500 "parser.cpp"
+#line 9518 "parser.cpp"
     break;
 
 
-#line 9504 "parser.cpp"
+#line 9522 "parser.cpp"
 
       default: break;
     }
@@ -9729,7 +9747,7 @@ yyreturnlab:
   return yyresult;
 }
 
-#line 4051 "parser.y"
+#line 4062 "parser.y"
 
 
 void
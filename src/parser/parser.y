@@ -1876,6 +1876,17 @@ show_statement: SHOW DATABASES {
     $$ = new infinity::ShowStatement();
     $$->show_type_ = infinity::ShowStmtType::kBuffer;
 }
+| SHOW BUFFER IDENTIFIER {
+    ParserHelper::ToLower($3);
+    bool is_cache = !strcmp($3, "cache");
+    free($3);
+    if(!is_cache) {
+        yyerror(&yyloc, scanner, result, "invalid show buffer option");
+        YYERROR;
+    }
+    $$ = new infinity::ShowStatement();
+    $$->show_type_ = infinity::ShowStmtType::kBufferCache;
+}
 | SHOW MEMINDEX {
     $$ = new infinity::ShowStatement();
     $$->show_type_ = infinity::ShowStmtType::kMemIndex;
@@ -15,6 +15,7 @@
 #pragma once
 
 #include "base_statement.h"
+#include "statement_common.h"
 #include "expr/column_expr.h"
 #include "expr/constant_expr.h"
 #include "table_reference/base_table_reference.h"
@@ -69,6 +70,8 @@ public:
     SelectStatement *nested_select_{nullptr};
 
     bool total_hits_count_flag_{false};
+
+    QueryPriority priority_{QueryPriority::kInteractive};
 };
 
 } // namespace infinity
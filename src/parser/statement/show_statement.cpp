@@ -40,6 +40,10 @@ std::string ShowStatement::ToString() const {
             ss << "Show buffer";
             break;
         }
+        case ShowStmtType::kBufferCache: {
+            ss << "Show buffer cache";
+            break;
+        }
         case ShowStmtType::kMemIndex: {
             ss << "Show mem index";
             break;
@@ -43,6 +43,7 @@ enum class ShowStmtType {
     kGlobalVariables,
     kConfig,
     kBuffer,
+    kBufferCache,
     kMemIndex,
     kQueries,
     kQuery,
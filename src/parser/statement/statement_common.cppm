@@ -23,5 +23,8 @@ namespace infinity {
 export using infinity::InitParameter;
 export using infinity::CopyFileType;
 export using infinity::CopyFileTypeToStr;
+export using infinity::QueryPriority;
+export using infinity::QueryPriorityToStr;
+export using infinity::StrToQueryPriority;
 
 } // namespace infinity
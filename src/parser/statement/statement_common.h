@@ -14,7 +14,10 @@
 
 #pragma once
 
+#include "../parser_assert.h"
 #include "../type/serialize.h"
+#include <algorithm>
+#include <cctype>
 #include <memory>
 #include <string>
 #include <vector>
@@ -56,6 +59,41 @@ inline std::shared_ptr<std::string> CopyFileTypeToStr(CopyFileType copy_file_typ
     }
 }
 
+// Scheduling class of a query, workers run the queued tasks of a higher class first
+enum class QueryPriority {
+    kInteractive,
+    kBatch,
+    kBackground,
+    kInvalid,
+};
+
+inline std::string QueryPriorityToStr(QueryPriority priority) {
+    switch (priority) {
+        case QueryPriority::kInteractive:
+            return "interactive";
+        case QueryPriority::kBatch:
+            return "batch";
+        case QueryPriority::kBackground:
+            return "background";
+        case QueryPriority::kInvalid:
+            return "invalid";
+    }
+    ParserError("Unreachable");
+    return "invalid";
+}
+
+inline QueryPriority StrToQueryPriority(std::string priority_str) {
+    std::transform(priority_str.begin(), priority_str.end(), priority_str.begin(), [](unsigned char c) { return std::tolower(c); });
+    if (priority_str == "interactive") {
+        return QueryPriority::kInteractive;
+    } else if (priority_str == "batch") {
+        return QueryPriority::kBatch;
+    } else if (priority_str == "background") {
+        return QueryPriority::kBackground;
+    }
+    return QueryPriority::kInvalid;
+}
+
 struct TableName {
     char *schema_name_ptr_{nullptr};
     char *table_name_ptr_{nullptr};
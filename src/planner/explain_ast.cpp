@@ -590,6 +590,10 @@ Status ExplainAST::BuildShow(const ShowStatement *show_statement, SharedPtr<Vect
             result->emplace_back(MakeShared<String>("SHOW BUFFER"));
             break;
         }
+        case ShowStmtType::kBufferCache: {
+            result->emplace_back(MakeShared<String>("SHOW BUFFER CACHE"));
+            break;
+        }
         case ShowStmtType::kMemIndex: {
             result->emplace_back(MakeShared<String>("SHOW MEMINDEX"));
             break;
@@ -1671,6 +1671,14 @@ Status LogicalPlanner::BuildShow(ShowStatement *statement, SharedPtr<BindContext
                                                           bind_context_ptr->GenerateTableIndex());
             break;
         }
+        case ShowStmtType::kBufferCache: {
+            this->logical_plan_ = MakeShared<LogicalShow>(bind_context_ptr->GetNewLogicalNodeId(),
+                                                          ShowStmtType::kBufferCache,
+                                                          statement->schema_name_,
+                                                          statement->var_name_,
+                                                          bind_context_ptr->GenerateTableIndex());
+            break;
+        }
         case ShowStmtType::kMemIndex: {
             this->logical_plan_ = MakeShared<LogicalShow>(bind_context_ptr->GetNewLogicalNodeId(),
                                                           ShowStmtType::kMemIndex,
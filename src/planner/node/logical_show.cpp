@@ -74,6 +74,8 @@ String ToString(ShowStmtType type) {
             return "Show config";
         case ShowStmtType::kBuffer:
             return "Show buffer";
+        case ShowStmtType::kBufferCache:
+            return "Show buffer cache";
         case ShowStmtType::kMemIndex:
             return "Sow memindex";
         case ShowStmtType::kQueries:
@@ -39,10 +39,125 @@ import extra_ddl_info;
 import create_statement;
 import command_statement;
 import global_resource_usage;
+import statement_common;
+import select_statement;
 
 namespace infinity {
 
-Worker::Worker(u64 cpu_id, UniquePtr<FragmentTaskBlockQueue> queue, UniquePtr<Thread> thread)
+namespace {
+
+inline SizeT PriorityIndex(FragmentTask *task) {
+    QueryPriority priority = task->fragment_context()->query_context()->priority();
+    if (priority == QueryPriority::kInvalid) {
+        return static_cast<SizeT>(QueryPriority::kInteractive);
+    }
+    return static_cast<SizeT>(priority);
+}
+
+} // namespace
+
+SizeT TaskPicker::Pick(const TaskLists &task_lists) {
+    SizeT priority_idx = 0;
+    while (priority_idx < kQueryPriorityCount && task_lists[priority_idx].empty()) {
+        ++priority_idx;
+    }
+    if (priority_idx == kQueryPriorityCount) {
+        return priority_idx;
+    }
+    if (++pick_count_ % kAgingPickInterval == 0) {
+        for (SizeT i = 1; i < kQueryPriorityCount; ++i) {
+            SizeT lower_priority_idx = (aging_priority_idx_ + i) % kQueryPriorityCount;
+            if (lower_priority_idx > priority_idx && !task_lists[lower_priority_idx].empty()) {
+                priority_idx = lower_priority_idx;
+                aging_priority_idx_ = lower_priority_idx;
+                break;
+            }
+        }
+    }
+    return priority_idx;
+}
+
+bool WorkerQueue::Push(FragmentTask *task, SizeT priority_idx) {
+    bool idle = false;
+    {
+        std::unique_lock<std::mutex> lock(mutex_);
+        tasks_[priority_idx].emplace_back(task, Clock::now());
+        ++size_;
+        idle = idle_;
+    }
+    cv_.notify_one();
+    return idle;
+}
+
+SizeT WorkerQueue::TakeAll(TaskLists &task_lists, const TakeFunc &take_func) {
+    std::unique_lock<std::mutex> lock(mutex_);
+    SizeT taken_count = size_;
+    for (SizeT priority_idx = 0; priority_idx < kQueryPriorityCount; ++priority_idx) {
+        for (auto &[task, enqueue_time] : tasks_[priority_idx]) {
+            take_func(priority_idx, enqueue_time);
+            task_lists[priority_idx].push_back(task);
+        }
+        tasks_[priority_idx].clear();
+    }
+    size_ = 0;
+    return taken_count;
+}
+
+SizeT WorkerQueue::Steal(TaskLists &task_lists, const TakeFunc &take_func) {
+    std::unique_lock<std::mutex> lock(mutex_);
+    for (SizeT priority_idx = 0; priority_idx < kQueryPriorityCount; ++priority_idx) {
+        auto &tasks = tasks_[priority_idx];
+        if (tasks.empty()) {
+            continue;
+        }
+        // the owner keeps the newer half
+        SizeT stolen_count = (tasks.size() + 1) / 2;
+        for (SizeT i = 0; i < stolen_count; ++i) {
+            auto &[task, enqueue_time] = tasks.front();
+            take_func(priority_idx, enqueue_time);
+            task_lists[priority_idx].push_back(task);
+            tasks.pop_front();
+        }
+        size_ -= stolen_count;
+        return stolen_count;
+    }
+    return 0;
+}
+
+void WorkerQueue::SetIdle(bool idle) {
+    std::unique_lock<std::mutex> lock(mutex_);
+    idle_ = idle;
+    wakeup_ = false;
+}
+
+void WorkerQueue::Wait(const Atomic<bool> &stopped) {
+    std::unique_lock<std::mutex> lock(mutex_);
+    cv_.wait(lock, [&] { return stopped || size_ > 0 || wakeup_; });
+    idle_ = false;
+    wakeup_ = false;
+}
+
+bool WorkerQueue::Wakeup() {
+    {
+        std::unique_lock<std::mutex> lock(mutex_);
+        if (!idle_ || wakeup_) {
+            return false;
+        }
+        wakeup_ = true;
+    }
+    cv_.notify_one();
+    return true;
+}
+
+void WorkerQueue::Notify() {
+    {
+        std::unique_lock<std::mutex> lock(mutex_);
+        wakeup_ = true;
+    }
+    cv_.notify_one();
+}
+
+Worker::Worker(u64 cpu_id, UniquePtr<WorkerQueue> queue, UniquePtr<Thread> thread)
     : cpu_id_(cpu_id), queue_(std::move(queue)), thread_(std::move(thread)) {}
 
 // Non-static memory methods
@@ -79,7 +194,7 @@ void TaskScheduler::Init(Config *config_ptr) {
 
     for (u64 worker_id = 0; worker_id < worker_count_; ++worker_id) {
         const u64 cpu_id = cpu_id_vec[worker_id];
-        UniquePtr<FragmentTaskBlockQueue> worker_queue = MakeUnique<FragmentTaskBlockQueue>("TaskScheduler");
+        UniquePtr<WorkerQueue> worker_queue = MakeUnique<WorkerQueue>();
         UniquePtr<Thread> worker_thread = MakeUnique<Thread>(&TaskScheduler::WorkerLoop, this, worker_queue.get(), worker_id);
         // Pin the thread to specific cpu
         ThreadUtil::pin(*worker_thread, cpu_id);
@@ -98,10 +213,12 @@ void TaskScheduler::Init(Config *config_ptr) {
 
 void TaskScheduler::UnInit() {
     initialized_ = false;
-    UniquePtr<FragmentTask> terminate_task = MakeUnique<FragmentTask>(true);
+    stopped_ = true;
 
     for (const auto &worker : worker_array_) {
-        worker.queue_->Enqueue(terminate_task.get());
+        worker.queue_->Notify();
+    }
+    for (const auto &worker : worker_array_) {
         worker.thread_->join();
     }
 }
@@ -126,13 +243,26 @@ void TaskScheduler::Schedule(PlanFragment *plan_fragment, const BaseStatement *b
     }
     // DumpPlanFragment(plan_fragment);
     bool use_scheduler = false;
+    QueryPriority priority = QueryPriority::kInteractive;
     switch (base_statement->Type()) {
-        case StatementType::kSelect:
-        case StatementType::kExplain:
+        case StatementType::kSelect: {
+            use_scheduler = true;
+            priority = static_cast<const SelectStatement *>(base_statement)->priority_;
+            break;
+        }
+        case StatementType::kExplain: {
+            use_scheduler = true;
+            break;
+        }
         case StatementType::kDelete:
-        case StatementType::kUpdate:
+        case StatementType::kUpdate: {
+            use_scheduler = true;
+            priority = QueryPriority::kBatch;
+            break;
+        }
         case StatementType::kCompact: {
-            use_scheduler = true; // continue;
+            use_scheduler = true;
+            priority = QueryPriority::kBackground;
             break;
         }
         case StatementType::kCreate: {
@@ -140,6 +270,7 @@ void TaskScheduler::Schedule(PlanFragment *plan_fragment, const BaseStatement *b
             if (create_statement->create_info_->type_ == DDLType::kIndex) {
                 // Create index will generate multiple tasks
                 use_scheduler = true;
+                priority = QueryPriority::kBackground;
             }
             break;
         }
@@ -164,6 +295,9 @@ void TaskScheduler::Schedule(PlanFragment *plan_fragment, const BaseStatement *b
         }
     }
 
+    // the tasks of the later fragments find the priority through their query context
+    plan_fragment->GetContext()->query_context()->set_priority(priority);
+
     Vector<PlanFragment *> start_fragments;
     SizeT task_n = plan_fragment->GetStartFragments(start_fragments);
     plan_fragment->GetContext()->notifier()->SetTaskN(task_n);
@@ -220,34 +354,84 @@ void TaskScheduler::ScheduleFragment(PlanFragment *plan_fragment) {
 }
 
 void TaskScheduler::ScheduleTask(FragmentTask *task, u64 worker_id) {
+    const SizeT priority_idx = PriorityIndex(task);
     ++worker_workloads_[worker_id];
-    worker_array_[worker_id].queue_->Enqueue(task);
+    ++queue_depth_[priority_idx];
+
+    if (!worker_array_[worker_id].queue_->Push(task, priority_idx)) {
+        // the worker is running a task, let an idle one take the new task instead of waiting for it
+        WakeIdleWorker(worker_id);
+    }
+}
+
+void TaskScheduler::WakeIdleWorker(u64 busy_worker_id) {
+    for (u64 i = 1; i < worker_count_; ++i) {
+        if (worker_array_[(busy_worker_id + i) % worker_count_].queue_->Wakeup()) {
+            return;
+        }
+    }
+}
+
+void TaskScheduler::RecordWaitTime(SizeT priority_idx, const TimePoint<Clock> &enqueue_time) {
+    const u64 wait_us = ChronoCast<MicroSeconds>(ElapsedFromStart(Clock::now(), enqueue_time)).count();
+    --queue_depth_[priority_idx];
+    ++started_count_[priority_idx];
+    total_wait_us_[priority_idx] += wait_us;
+    u64 max_wait_us = max_wait_us_[priority_idx];
+    while (wait_us > max_wait_us && !max_wait_us_[priority_idx].compare_exchange_weak(max_wait_us, wait_us)) {
+    }
 }
 
-void TaskScheduler::WorkerLoop(FragmentTaskBlockQueue *task_queue, i64 worker_id) {
-    List<FragmentTask *> task_lists;
-    auto iter = task_lists.end();
-    auto last_iter = task_lists.end();
+bool TaskScheduler::TakeTasks(WorkerQueue *task_queue, i64 worker_id, TaskLists &task_lists, bool wait) {
+    auto record_wait_time = [this](SizeT priority_idx, const TimePoint<Clock> &enqueue_time) { RecordWaitTime(priority_idx, enqueue_time); };
     while (true) {
-        if (iter == last_iter) {
-            Vector<FragmentTask *> dequeue_output;
-            if (task_lists.empty()) {
-                task_queue->DequeueBulk(dequeue_output);
-            } else {
-                task_queue->TryDequeueBulk(dequeue_output);
-            }
-            if (!dequeue_output.empty()) {
-                task_lists.insert(task_lists.end(), dequeue_output.begin(), dequeue_output.end());
-            }
-            last_iter = task_lists.end();
+        if (stopped_) {
+            return false;
+        }
+        if (task_queue->TakeAll(task_lists, record_wait_time) > 0 || !wait) {
+            return true;
         }
-        if (iter == task_lists.end()) {
-            iter = task_lists.begin();
+        // Idle before looking for tasks to steal, so a task queued to a busy worker after the look wakes this worker up
+        task_queue->SetIdle(true);
+        if (StealTasks(worker_id, task_lists, record_wait_time)) {
+            task_queue->SetIdle(false);
+            return true;
+        }
+        task_queue->Wait(stopped_);
+    }
+}
+
+bool TaskScheduler::StealTasks(i64 thief_id, TaskLists &task_lists, const WorkerQueue::TakeFunc &take_func) {
+    for (u64 i = 1; i < worker_count_; ++i) {
+        const u64 victim_id = (thief_id + i) % worker_count_;
+        WorkerQueue *victim_queue = worker_array_[victim_id].queue_.get();
+        if (victim_queue->size() == 0) {
+            continue;
         }
-        auto *fragment_task = *iter;
-        if (fragment_task->IsTerminator()) {
+        SizeT stolen_count = victim_queue->Steal(task_lists, take_func);
+        if (stolen_count > 0) {
+            worker_workloads_[victim_id] -= stolen_count;
+            worker_workloads_[thief_id] += stolen_count;
+            return true;
+        }
+    }
+    return false;
+}
+
+void TaskScheduler::WorkerLoop(WorkerQueue *task_queue, i64 worker_id) {
+    TaskLists task_lists;
+    TaskPicker task_picker;
+    while (true) {
+        bool has_task = std::any_of(task_lists.begin(), task_lists.end(), [](const auto &task_list) { return !task_list.empty(); });
+        // pick up the newly queued tasks before every run, so an interactive task doesn't wait for a round over the batch ones
+        if (!TakeTasks(task_queue, worker_id, task_lists, !has_task)) {
             break;
         }
+        SizeT priority_idx = task_picker.Pick(task_lists);
+
+        // round robin in the class: run the first task and move it to the back if it isn't done
+        auto &task_list = task_lists[priority_idx];
+        auto *fragment_task = task_list.front();
         auto *fragment_ctx = fragment_task->fragment_context();
 
         bool error = false;
@@ -265,19 +449,19 @@ void TaskScheduler::WorkerLoop(FragmentTaskBlockQueue *task_queue, i64 worker_id
             if (fragment_task->IsComplete()) {
                 --worker_workloads_[worker_id];
                 fragment_task->CompleteTask();
-                iter = task_lists.erase(iter);
+                task_list.pop_front();
                 finish = true;
             } else if (fragment_task->QuitFromWorkerLoop()) {
                 --worker_workloads_[worker_id];
-                iter = task_lists.erase(iter);
+                task_list.pop_front();
             } else {
-                ++iter;
+                task_list.splice(task_list.end(), task_list, task_list.begin());
             }
         } else {
             --worker_workloads_[worker_id];
             fragment_ctx->notifier()->SetError(fragment_ctx);
             fragment_task->CompleteTask();
-            iter = task_lists.erase(iter);
+            task_list.pop_front();
         }
         if (finish || error) {
             fragment_ctx->notifier()->FinishTask();
@@ -285,6 +469,16 @@ void TaskScheduler::WorkerLoop(FragmentTaskBlockQueue *task_queue, i64 worker_id
     }
 }
 
+TaskPriorityStats TaskScheduler::GetPriorityStats(QueryPriority priority) const {
+    const SizeT priority_idx = static_cast<SizeT>(priority);
+    TaskPriorityStats stats;
+    stats.queue_depth_ = queue_depth_[priority_idx];
+    stats.started_count_ = started_count_[priority_idx];
+    stats.total_wait_us_ = total_wait_us_[priority_idx];
+    stats.max_wait_us_ = max_wait_us_[priority_idx];
+    return stats;
+}
+
 void TaskScheduler::DumpPlanFragment(PlanFragment *root) {
     std::function<void(PlanFragment *)> TraverseFragmentTree = [&](PlanFragment *fragment) {
         auto *fragment_ctx = fragment->GetContext();
@@ -19,23 +19,86 @@ export module task_scheduler;
 import config;
 import stl;
 import fragment_task;
-import blocking_queue;
 import base_statement;
+import statement_common;
 
 namespace infinity {
 
 class QueryContext;
 class PlanFragment;
 
-using FragmentTaskBlockQueue = BlockingQueue<FragmentTask *>;
+export constexpr SizeT kQueryPriorityCount = static_cast<SizeT>(QueryPriority::kInvalid);
+
+export using TaskLists = Array<List<FragmentTask *>, kQueryPriorityCount>;
+
+// Tasks scheduled to a worker and not taken by it yet, one FIFO per priority class. Other workers steal from it when idle.
+export class WorkerQueue {
+public:
+    // Called with the class and the enqueue time of every task taken out of the queue
+    using TakeFunc = std::function<void(SizeT priority_idx, const TimePoint<Clock> &enqueue_time)>;
+
+    // Return false if the worker is busy, it takes the task only after its current one
+    bool Push(FragmentTask *task, SizeT priority_idx);
+
+    // Move all queued tasks into `task_lists`
+    SizeT TakeAll(TaskLists &task_lists, const TakeFunc &take_func);
+
+    // Move the older half of the highest non-empty class into `task_lists`
+    SizeT Steal(TaskLists &task_lists, const TakeFunc &take_func);
+
+    // An idle worker is woken up by Wakeup() when a task is queued to a busy worker
+    void SetIdle(bool idle);
+
+    // Wait until a task is queued, Wakeup() is called or `stopped` is set, then the worker is busy again
+    void Wait(const Atomic<bool> &stopped);
+
+    // Return false if the worker isn't idle or is being woken up already
+    bool Wakeup();
+
+    // Wake the worker up whatever its state is
+    void Notify();
+
+    SizeT size() const { return size_; }
+
+private:
+    std::mutex mutex_{};
+    std::condition_variable cv_{};
+    Array<Deque<Pair<FragmentTask *, TimePoint<Clock>>>, kQueryPriorityCount> tasks_{};
+    Atomic<SizeT> size_{0};
+    bool idle_{false};
+    bool wakeup_{false};
+};
+
+// Choose the class of the next task a worker runs: the highest non-empty one, but every kAgingPickInterval-th pick goes to a
+// lower non-empty class in turn, so batch and background queries still make progress under a steady interactive load
+export class TaskPicker {
+public:
+    static constexpr u64 kAgingPickInterval = 8;
+
+    // Return kQueryPriorityCount if all lists are empty
+    SizeT Pick(const TaskLists &task_lists);
+
+private:
+    u64 pick_count_{0};
+    SizeT aging_priority_idx_{0};
+};
 
 struct Worker {
-    Worker(u64 cpu_id, UniquePtr<FragmentTaskBlockQueue> queue, UniquePtr<Thread> thread);
+    Worker(u64 cpu_id, UniquePtr<WorkerQueue> queue, UniquePtr<Thread> thread);
     u64 cpu_id_{0};
-    UniquePtr<FragmentTaskBlockQueue> queue_{};
+    UniquePtr<WorkerQueue> queue_{};
     UniquePtr<Thread> thread_{};
 };
 
+export struct TaskPriorityStats {
+    // tasks scheduled and not started by a worker yet
+    u64 queue_depth_{0};
+    // tasks started so far, and the time they waited in the queue
+    u64 started_count_{0};
+    u64 total_wait_us_{0};
+    u64 max_wait_us_{0};
+};
+
 export class TaskScheduler {
 public:
     explicit TaskScheduler(Config *config_ptr);
@@ -54,6 +117,8 @@ public:
 
     void DumpPlanFragment(PlanFragment *plan_fragment);
 
+    TaskPriorityStats GetPriorityStats(QueryPriority priority) const;
+
 private:
     u64 FindLeastWorkloadWorker();
 
@@ -61,15 +126,31 @@ private:
 
     void RunTask(FragmentTask *task);
 
-    void WorkerLoop(FragmentTaskBlockQueue *task_queue, i64 worker_id);
+    void WorkerLoop(WorkerQueue *task_queue, i64 worker_id);
+
+    // Move the queued tasks of the worker into its task lists, steal or wait for tasks if `wait` and there is none.
+    // Return false when the scheduler is stopped.
+    bool TakeTasks(WorkerQueue *task_queue, i64 worker_id, TaskLists &task_lists, bool wait);
+
+    bool StealTasks(i64 thief_id, TaskLists &task_lists, const WorkerQueue::TakeFunc &take_func);
+
+    void WakeIdleWorker(u64 busy_worker_id);
+
+    void RecordWaitTime(SizeT priority_idx, const TimePoint<Clock> &enqueue_time);
 
 private:
     bool initialized_{false};
+    Atomic<bool> stopped_{false};
 
     Vector<Worker> worker_array_{};
     Deque<Atomic<u64>> worker_workloads_{};
 
     u64 worker_count_{0};
+
+    Array<Atomic<u64>, kQueryPriorityCount> queue_depth_{};
+    Array<Atomic<u64>, kQueryPriorityCount> started_count_{};
+    Array<Atomic<u64>, kQueryPriorityCount> total_wait_us_{};
+    Array<Atomic<u64>, kQueryPriorityCount> max_wait_us_{};
 };
 
 } // namespace infinity
@@ -33,13 +33,52 @@ import global_resource_usage;
 
 namespace infinity {
 
+namespace {
+
+thread_local bool no_cache_hint = false;
+
+} // namespace
+
+BufferReplacePolicy BufferReplacePolicyFromString(const String &policy) {
+    if (policy == "lru") {
+        return BufferReplacePolicy::kLRU;
+    }
+    if (policy == "2q") {
+        return BufferReplacePolicy::k2Q;
+    }
+    UnrecoverableError(fmt::format("Invalid buffer replacement policy: {}", policy));
+    return BufferReplacePolicy::kLRU;
+}
+
+String BufferReplacePolicyToString(BufferReplacePolicy policy) {
+    switch (policy) {
+        case BufferReplacePolicy::kLRU:
+            return "lru";
+        case BufferReplacePolicy::k2Q:
+            return "2q";
+    }
+    return "unknown";
+}
+
+BufferNoCacheScope::BufferNoCacheScope() : prev_(no_cache_hint) { no_cache_hint = true; }
+
+BufferNoCacheScope::~BufferNoCacheScope() { no_cache_hint = prev_; }
+
+bool BufferNoCacheScope::Active() { return no_cache_hint; }
+
 void LRUCache::RemoveClean(const Vector<BufferObj *> &buffer_obj) {
     std::unique_lock lock(locker_);
     for (auto *buffer_obj : buffer_obj) {
         if (auto iter = gc_map_.find(buffer_obj); iter != gc_map_.end()) {
-            gc_list_.erase(iter->second);
+            auto &gc_list = iter->second.protected_ ? protected_list_ : gc_list_;
+            gc_list.erase(iter->second.iter_);
             gc_map_.erase(iter);
         }
+        reloaded_map_.erase(buffer_obj->id());
+        if (auto iter = ghost_map_.find(buffer_obj->id()); iter != ghost_map_.end()) {
+            ghost_list_.erase(iter->second);
+            ghost_map_.erase(iter);
+        }
     }
 }
 
@@ -49,17 +88,40 @@ SizeT LRUCache::WaitingGCObjectCount() {
 }
 
 SizeT LRUCache::RequestSpace(SizeT need_space) {
-    SizeT free_space = 0;
     std::unique_lock lock(locker_);
-    auto iter = gc_list_.begin();
-    while (free_space < need_space && iter != gc_list_.end()) {
+    if (policy_ == BufferReplacePolicy::kLRU) {
+        return FreeFromList(gc_list_, need_space);
+    }
+    // probation is evicted first while it holds at least a quarter of the unpinned buffers
+    SizeT free_space = 0;
+    if (gc_list_.size() * 4 >= gc_map_.size()) {
+        free_space += FreeFromList(gc_list_, need_space);
+    }
+    if (free_space < need_space) {
+        free_space += FreeFromList(protected_list_, need_space - free_space);
+    }
+    if (free_space < need_space) {
+        free_space += FreeFromList(gc_list_, need_space - free_space);
+    }
+    return free_space;
+}
+
+SizeT LRUCache::FreeFromList(List<BufferObj *> &gc_list, SizeT need_space) {
+    SizeT free_space = 0;
+    auto iter = gc_list.begin();
+    while (free_space < need_space && iter != gc_list.end()) {
         auto *buffer_obj = *iter;
         // Free return false when the buffer is freed by cleanup
         // will not dead lock because caller is in kNew or kFree state, and `buffer_obj` is in kUnloaded or state
         if (buffer_obj->Free()) {
             free_space += buffer_obj->GetBufferSize();
-            iter = gc_list_.erase(iter);
-            gc_map_.erase(buffer_obj);
+            iter = gc_list.erase(iter);
+            auto map_iter = gc_map_.find(buffer_obj);
+            if (policy_ == BufferReplacePolicy::k2Q && !map_iter->second.protected_ && !map_iter->second.no_cache_) {
+                AddGhost(buffer_obj->id());
+            }
+            gc_map_.erase(map_iter);
+            ++evict_count_;
         } else {
             ++iter;
         }
@@ -67,33 +129,93 @@ SizeT LRUCache::RequestSpace(SizeT need_space) {
     return free_space;
 }
 
-void LRUCache::PushGCQueue(BufferObj *buffer_obj) {
+void LRUCache::AddGhost(u32 buffer_id) {
+    if (ghost_map_.contains(buffer_id)) {
+        return;
+    }
+    ghost_list_.push_back(buffer_id);
+    ghost_map_[buffer_id] = --ghost_list_.end();
+    // remember about as many evicted buffers as there are unpinned ones
+    while (ghost_list_.size() > std::max(gc_map_.size(), SizeT(1))) {
+        ghost_map_.erase(ghost_list_.front());
+        ghost_list_.pop_front();
+    }
+}
+
+void LRUCache::PushGCQueue(BufferObj *buffer_obj, bool no_cache) {
+    // the plain LRU keeps evicting in recency order, scans are only kept from flushing the cache by k2Q
+    no_cache = no_cache && policy_ == BufferReplacePolicy::k2Q;
     std::unique_lock lock(locker_);
     auto iter = gc_map_.find(buffer_obj);
     if (iter != gc_map_.end()) {
-        gc_list_.erase(iter->second);
+        auto &gc_list = iter->second.protected_ ? protected_list_ : gc_list_;
+        gc_list.erase(iter->second.iter_);
+    }
+    bool protect = false;
+    if (auto reload_iter = reloaded_map_.find(buffer_obj->id()); reload_iter != reloaded_map_.end()) {
+        protect = reload_iter->second;
+        reloaded_map_.erase(reload_iter);
+    } else if (auto ghost_iter = ghost_map_.find(buffer_obj->id()); ghost_iter != ghost_map_.end()) {
+        protect = !no_cache;
+        ghost_list_.erase(ghost_iter->second);
+        ghost_map_.erase(ghost_iter);
+    }
+
+    GCEntry entry;
+    entry.no_cache_ = no_cache;
+    if (policy_ == BufferReplacePolicy::k2Q && protect) {
+        protected_list_.push_back(buffer_obj);
+        entry.iter_ = --protected_list_.end();
+        entry.protected_ = true;
+    } else if (no_cache) {
+        gc_list_.push_front(buffer_obj);
+        entry.iter_ = gc_list_.begin();
+    } else {
+        gc_list_.push_back(buffer_obj);
+        entry.iter_ = --gc_list_.end();
     }
-    gc_list_.push_back(buffer_obj);
-    gc_map_[buffer_obj] = --gc_list_.end();
+    gc_map_[buffer_obj] = entry;
 }
 
-bool LRUCache::RemoveFromGCQueue(BufferObj *buffer_obj) {
+bool LRUCache::RemoveFromGCQueue(BufferObj *buffer_obj, bool reload, bool no_cache) {
     std::unique_lock lock(locker_);
     if (auto iter = gc_map_.find(buffer_obj); iter != gc_map_.end()) {
-        gc_list_.erase(iter->second);
+        auto &gc_list = iter->second.protected_ ? protected_list_ : gc_list_;
+        gc_list.erase(iter->second.iter_);
+        if (reload) {
+            // referenced again while resident, a scan only keeps the buffer where it was
+            reloaded_map_[buffer_obj->id()] = iter->second.protected_ || !no_cache;
+        }
         gc_map_.erase(iter);
         return true;
     }
     return false;
 }
 
+BufferCacheInfo LRUCache::GetInfo() {
+    BufferCacheInfo info;
+    {
+        std::unique_lock lock(locker_);
+        info.unused_count_ = gc_map_.size();
+        info.protected_count_ = protected_list_.size();
+    }
+    info.hit_count_ = hit_count_;
+    info.miss_count_ = miss_count_;
+    info.evict_count_ = evict_count_;
+    return info;
+}
+
 BufferManager::BufferManager(u64 memory_limit,
                              SharedPtr<String> data_dir,
                              SharedPtr<String> temp_dir,
                              PersistenceManager *persistence_manager,
-                             SizeT lru_count)
+                             SizeT lru_count,
+                             BufferReplacePolicy policy)
     : data_dir_(std::move(data_dir)), temp_dir_(std::move(temp_dir)), memory_limit_(memory_limit), persistence_manager_(persistence_manager),
-      current_memory_size_(0), lru_caches_(lru_count) {
+      current_memory_size_(0), policy_(policy), lru_caches_(lru_count) {
+    for (auto &lru_cache : lru_caches_) {
+        lru_cache.SetPolicy(policy);
+    }
 #ifdef INFINITY_DEBUG
     GlobalResourceUsage::IncrObjectCount("BufferManager");
 #endif
@@ -169,6 +291,22 @@ Vector<SizeT> BufferManager::WaitingGCObjectCount() {
     return size_list;
 }
 
+Vector<BufferCacheInfo> BufferManager::GetBufferCacheInfo() {
+    Vector<BufferCacheInfo> info_list;
+    info_list.reserve(lru_caches_.size());
+    for (auto &lru_cache : lru_caches_) {
+        info_list.push_back(lru_cache.GetInfo());
+    }
+    return info_list;
+}
+
+void BufferManager::AddCacheHitCount(BufferObj *buffer_obj) { lru_caches_[LRUIdx(buffer_obj)].AddHitCount(); }
+
+void BufferManager::AddCacheMissCount(BufferObj *buffer_obj) {
+    ++cache_miss_count_;
+    lru_caches_[LRUIdx(buffer_obj)].AddMissCount();
+}
+
 SizeT BufferManager::BufferedObjectCount() {
     std::unique_lock lock(w_locker_);
     return buffer_map_.size();
@@ -247,9 +385,9 @@ bool BufferManager::RequestSpace(SizeT need_size) {
     return free_success;
 }
 
-void BufferManager::PushGCQueue(BufferObj *buffer_obj) {
+void BufferManager::PushGCQueue(BufferObj *buffer_obj, bool no_cache) {
     SizeT idx = LRUIdx(buffer_obj);
-    lru_caches_[idx].PushGCQueue(buffer_obj);
+    lru_caches_[idx].PushGCQueue(buffer_obj, no_cache);
 
     if (auto mem_usage = memory_usage(); mem_usage > memory_limit_) {
         SizeT need_size = mem_usage - memory_limit_;
@@ -260,7 +398,12 @@ void BufferManager::PushGCQueue(BufferObj *buffer_obj) {
 
 bool BufferManager::RemoveFromGCQueue(BufferObj *buffer_obj) {
     SizeT idx = LRUIdx(buffer_obj);
-    return lru_caches_[idx].RemoveFromGCQueue(buffer_obj);
+    return lru_caches_[idx].RemoveFromGCQueue(buffer_obj, false /*reload*/, false /*no_cache*/);
+}
+
+bool BufferManager::ReloadFromGCQueue(BufferObj *buffer_obj, bool no_cache) {
+    SizeT idx = LRUIdx(buffer_obj);
+    return lru_caches_[idx].RemoveFromGCQueue(buffer_obj, true /*reload*/, no_cache);
 }
 
 void BufferManager::AddToCleanList(BufferObj *buffer_obj, bool do_free) {
@@ -27,23 +27,90 @@ namespace infinity {
 class BufferObj;
 class BufferObjectInfo;
 
+export enum class BufferReplacePolicy {
+    kLRU,
+    // Buffers enter a FIFO probation queue and are promoted to the LRU protected queue when referenced again while unpinned or
+    // shortly after being evicted from probation, so one pass over cold data can only evict probation buffers.
+    k2Q,
+};
+
+export BufferReplacePolicy BufferReplacePolicyFromString(const String &policy);
+
+export String BufferReplacePolicyToString(BufferReplacePolicy policy);
+
+export struct BufferCacheInfo {
+    SizeT unused_count_{};
+    SizeT protected_count_{};
+    u64 hit_count_{};
+    u64 miss_count_{};
+    u64 evict_count_{};
+};
+
+// Buffers loaded while an instance is alive on the thread are evicted before others once unpinned, unless they were already
+// resident. Sequential operators hold it so that a pass over a large table does not flush the buffers serving queries.
+// Only honored by the k2Q replacement policy, the plain LRU ignores it.
+export class BufferNoCacheScope {
+public:
+    BufferNoCacheScope();
+    ~BufferNoCacheScope();
+
+    BufferNoCacheScope(const BufferNoCacheScope &) = delete;
+    BufferNoCacheScope &operator=(const BufferNoCacheScope &) = delete;
+
+    static bool Active();
+
+private:
+    bool prev_{};
+};
+
 class LRUCache {
 public:
+    void SetPolicy(BufferReplacePolicy policy) { policy_ = policy; }
+
     void RemoveClean(const Vector<BufferObj *> &buffer_obj);
 
     SizeT WaitingGCObjectCount();
 
     SizeT RequestSpace(SizeT need_space);
 
-    void PushGCQueue(BufferObj *buffer_obj);
+    void PushGCQueue(BufferObj *buffer_obj, bool no_cache);
 
-    bool RemoveFromGCQueue(BufferObj *buffer_obj);
+    // reload: the buffer is pinned again, remembered to decide its queue when it is unpinned
+    bool RemoveFromGCQueue(BufferObj *buffer_obj, bool reload, bool no_cache);
+
+    void AddHitCount() { ++hit_count_; }
+
+    void AddMissCount() { ++miss_count_; }
+
+    BufferCacheInfo GetInfo();
 
 private:
-    std::mutex locker_{};
     using GCListIter = List<BufferObj *>::iterator;
-    HashMap<BufferObj *, GCListIter> gc_map_{};
+    struct GCEntry {
+        GCListIter iter_;
+        bool protected_{};
+        bool no_cache_{};
+    };
+
+    SizeT FreeFromList(List<BufferObj *> &gc_list, SizeT need_space);
+
+    void AddGhost(u32 buffer_id);
+
+    std::mutex locker_{};
+    BufferReplacePolicy policy_{BufferReplacePolicy::kLRU};
+    HashMap<BufferObj *, GCEntry> gc_map_{};
+    // Only queue of kLRU, the probation queue of k2Q
     List<BufferObj *> gc_list_{};
+    List<BufferObj *> protected_list_{};
+    // Ids of the buffers recently evicted from probation
+    List<u32> ghost_list_{};
+    HashMap<u32, List<u32>::iterator> ghost_map_{};
+    // Ids of pinned buffers that were taken back from the queues, and whether to protect them when unpinned
+    HashMap<u32, bool> reloaded_map_{};
+
+    Atomic<u64> hit_count_{};
+    Atomic<u64> miss_count_{};
+    Atomic<u64> evict_count_{};
 };
 
 export class BufferManager {
@@ -52,7 +119,8 @@ public:
                            SharedPtr<String> data_dir,
                            SharedPtr<String> temp_dir,
                            PersistenceManager *persistence_manager,
-                           SizeT lru_count = DEFAULT_BUFFER_MANAGER_LRU_COUNT);
+                           SizeT lru_count = DEFAULT_BUFFER_MANAGER_LRU_COUNT,
+                           BufferReplacePolicy policy = BufferReplacePolicy::kLRU);
 
     ~BufferManager();
 
@@ -81,6 +149,10 @@ public:
 
     Vector<SizeT> WaitingGCObjectCount();
 
+    Vector<BufferCacheInfo> GetBufferCacheInfo();
+
+    BufferReplacePolicy replace_policy() const { return policy_; }
+
     SizeT BufferedObjectCount();
 
     void RemoveClean();
@@ -92,7 +164,8 @@ public:
     inline PersistenceManager *persistence_manager() const { return persistence_manager_; }
 
     inline void AddRequestCount() { ++total_request_count_; }
-    inline void AddCacheMissCount() { ++cache_miss_count_; }
+    void AddCacheHitCount(BufferObj *buffer_obj);
+    void AddCacheMissCount(BufferObj *buffer_obj);
     inline u64 TotalRequestCount() { return total_request_count_; }
     inline u64 CacheMissCount() { return cache_miss_count_; }
 
@@ -104,10 +177,13 @@ private:
     bool RequestSpace(SizeT need_size);
 
     // BufferHandle calls it, after unload.
-    void PushGCQueue(BufferObj *buffer_obj);
+    void PushGCQueue(BufferObj *buffer_obj, bool no_cache);
 
     bool RemoveFromGCQueue(BufferObj *buffer_obj);
 
+    // BufferObj calls it, when an unloaded buffer is loaded again.
+    bool ReloadFromGCQueue(BufferObj *buffer_obj, bool no_cache);
+
     void AddToCleanList(BufferObj *buffer_obj, bool do_free);
 
     void FreeUnloadBuffer(BufferObj *buffer_obj);
@@ -134,6 +210,7 @@ private:
     Atomic<u32> buffer_id_{};
 
     std::mutex gc_locker_{};
+    const BufferReplacePolicy policy_{};
     Vector<LRUCache> lru_caches_{};
     SizeT round_robin_{};
 
@@ -69,6 +69,7 @@ void BufferObj::UpdateFileWorkerInfo(UniquePtr<FileWorker> new_file_worker) {
 
 BufferHandle BufferObj::Load() {
     buffer_mgr_->AddRequestCount();
+    bool no_cache = BufferNoCacheScope::Active();
     std::unique_lock<std::mutex> locker(w_locker_);
     if (type_ == BufferType::kMmap) {
         switch (status_) {
@@ -93,17 +94,22 @@ BufferHandle BufferObj::Load() {
     }
     switch (status_) {
         case BufferStatus::kLoaded: {
+            buffer_mgr_->AddCacheHitCount(this);
+            no_cache_ = no_cache_ && no_cache;
             break;
         }
         case BufferStatus::kUnloaded: {
-            if (!buffer_mgr_->RemoveFromGCQueue(this)) {
+            buffer_mgr_->AddCacheHitCount(this);
+            if (!buffer_mgr_->ReloadFromGCQueue(this, no_cache)) {
                 String error_message = fmt::format("attempt to buffer: {} status is UNLOADED, but not in GC queue", GetFilename());
                 UnrecoverableError(error_message);
             }
+            no_cache_ = no_cache_ && no_cache;
             break;
         }
         case BufferStatus::kFreed: {
-            buffer_mgr_->AddCacheMissCount();
+            buffer_mgr_->AddCacheMissCount(this);
+            no_cache_ = no_cache;
             bool free_success = buffer_mgr_->RequestSpace(GetBufferSize());
             if (!free_success) {
                 String error_message = "Out of memory.";
@@ -118,7 +124,8 @@ BufferHandle BufferObj::Load() {
             break;
         }
         case BufferStatus::kNew: {
-            buffer_mgr_->AddCacheMissCount();
+            buffer_mgr_->AddCacheMissCount(this);
+            no_cache_ = no_cache;
             LOG_TRACE(fmt::format("Request memory {}", GetBufferSize()));
             bool free_success = buffer_mgr_->RequestSpace(GetBufferSize());
             if (!free_success) {
@@ -353,7 +360,7 @@ void BufferObj::UnloadInner() {
             file_worker_->MmapNotNeed();
             status_ = BufferStatus::kUnloaded;
         } else {
-            buffer_mgr_->PushGCQueue(this);
+            buffer_mgr_->PushGCQueue(this, no_cache_);
             status_ = BufferStatus::kUnloaded;
         }
     }
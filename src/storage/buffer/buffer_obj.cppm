@@ -161,6 +161,8 @@ protected:
     BufferStatus status_{BufferStatus::kNew};
     BufferType type_{BufferType::kTemp};
     u64 rc_{0};
+    // loaded under BufferNoCacheScope and not referenced outside of it since
+    bool no_cache_{false};
     UniquePtr<FileWorker> file_worker_;
 
 private:
@@ -43,6 +43,8 @@ HnswEncodeType StringToHnswEncodeType(const String &str) {
         return HnswEncodeType::kPlain;
     } else if (str == "lvq") {
         return HnswEncodeType::kLVQ;
+    } else if (str == "rabitq") {
+        return HnswEncodeType::kRaBitQ;
     } else {
         return HnswEncodeType::kInvalid;
     }
@@ -54,6 +56,8 @@ String HnswEncodeTypeToString(HnswEncodeType encode_type) {
             return "plain";
         case HnswEncodeType::kLVQ:
             return "lvq";
+        case HnswEncodeType::kRaBitQ:
+            return "rabitq";
         default:
             return "invalid";
     }
@@ -203,6 +207,11 @@ SharedPtr<IndexBase> IndexHnsw::Make(SharedPtr<String> index_name,
         RecoverableError(status);
     }
 
+    if (encode_type == HnswEncodeType::kRaBitQ && build_type != HnswBuildType::kPlain) {
+        Status status = Status::InvalidIndexParam("Build type");
+        RecoverableError(status);
+    }
+
     return MakeShared<IndexHnsw>(index_name,
                                  index_comment,
                                  file_name,
@@ -321,6 +330,14 @@ void IndexHnsw::ValidateColumnDataType(const SharedPtr<BaseTableRef> &base_table
                                 data_type_ptr->ToString())));
             }
         }
+        if (param->param_name_ == "encode" && StringToHnswEncodeType(param->param_value_) == HnswEncodeType::kRaBitQ) {
+            if (embedding_data_type != EmbeddingDataType::kElemFloat) {
+                RecoverableError(Status::InvalidIndexDefinition(
+                    fmt::format("Attempt to create HNSW index with RaBitQ encoding on column: {}, data type: {}. now only support float element type.",
+                                column_name,
+                                data_type_ptr->ToString())));
+            }
+        }
     }
     // TODO: now only support float, int8, uint8?
     switch (embedding_data_type) {
@@ -30,6 +30,7 @@ namespace infinity {
 export enum class HnswEncodeType {
     kPlain,
     kLVQ,
+    kRaBitQ,
     kInvalid,
 };
 
@@ -176,6 +176,31 @@ AbstractHnsw InitAbstractIndexT(const IndexHnsw *index_hnsw) {
                     }
                 }
             }
+            return nullptr;
+        }
+        case HnswEncodeType::kRaBitQ: {
+            if constexpr (!std::is_same_v<DataType, float>) {
+                return nullptr;
+            } else if (index_hnsw->build_type_ == HnswBuildType::kPlain) {
+                switch (index_hnsw->metric_type_) {
+                    case MetricType::kMetricL2: {
+                        using HnswIndex = KnnHnsw<RaBitQL2VecStoreType<DataType>, SegmentOffset, OwnMem>;
+                        return static_cast<HnswIndex *>(nullptr);
+                    }
+                    case MetricType::kMetricInnerProduct: {
+                        using HnswIndex = KnnHnsw<RaBitQIPVecStoreType<DataType>, SegmentOffset, OwnMem>;
+                        return static_cast<HnswIndex *>(nullptr);
+                    }
+                    case MetricType::kMetricCosine: {
+                        using HnswIndex = KnnHnsw<RaBitQCosVecStoreType<DataType>, SegmentOffset, OwnMem>;
+                        return static_cast<HnswIndex *>(nullptr);
+                    }
+                    default: {
+                        return nullptr;
+                    }
+                }
+            }
+            return nullptr;
         }
         default: {
             return nullptr;
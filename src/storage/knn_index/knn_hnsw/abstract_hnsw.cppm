@@ -65,6 +65,9 @@ export using AbstractHnsw = std::variant<KnnHnsw<PlainCosVecStoreType<float>, Se
                                          KnnHnsw<LVQCosVecStoreType<float, i8>, SegmentOffset> *,
                                          KnnHnsw<LVQIPVecStoreType<float, i8>, SegmentOffset> *,
                                          KnnHnsw<LVQL2VecStoreType<float, i8>, SegmentOffset> *,
+                                         KnnHnsw<RaBitQCosVecStoreType<float>, SegmentOffset> *,
+                                         KnnHnsw<RaBitQIPVecStoreType<float>, SegmentOffset> *,
+                                         KnnHnsw<RaBitQL2VecStoreType<float>, SegmentOffset> *,
                                          KnnHnsw<PlainCosVecStoreType<float, true>, SegmentOffset> *,
                                          KnnHnsw<PlainIPVecStoreType<float, true>, SegmentOffset> *,
                                          KnnHnsw<PlainL2VecStoreType<float, true>, SegmentOffset> *,
@@ -87,6 +90,9 @@ export using AbstractHnsw = std::variant<KnnHnsw<PlainCosVecStoreType<float>, Se
                                          KnnHnsw<LVQCosVecStoreType<float, i8>, SegmentOffset, false> *,
                                          KnnHnsw<LVQIPVecStoreType<float, i8>, SegmentOffset, false> *,
                                          KnnHnsw<LVQL2VecStoreType<float, i8>, SegmentOffset, false> *,
+                                         KnnHnsw<RaBitQCosVecStoreType<float>, SegmentOffset, false> *,
+                                         KnnHnsw<RaBitQIPVecStoreType<float>, SegmentOffset, false> *,
+                                         KnnHnsw<RaBitQL2VecStoreType<float>, SegmentOffset, false> *,
                                          KnnHnsw<PlainCosVecStoreType<float, true>, SegmentOffset, false> *,
                                          KnnHnsw<PlainIPVecStoreType<float, true>, SegmentOffset, false> *,
                                          KnnHnsw<PlainL2VecStoreType<float, true>, SegmentOffset, false> *,
@@ -149,6 +149,9 @@ public:
         if constexpr (Base::template has_compress_type<VecStoreT>::value) {
             normalize = std::is_same_v<VecStoreMeta, typename LVQCosVecStoreType<DataType, typename VecStoreT::CompressType>::template Meta<OwnMem>>;
         }
+        if constexpr (std::is_same_v<VecStoreT, RaBitQCosVecStoreType<DataType>>) {
+            normalize = true;
+        }
         VecStoreMeta vec_store_meta = VecStoreMeta::Make(dim, normalize);
         GraphStoreMeta graph_store_meta = GraphStoreMeta::Make(Mmax0, Mmax);
         This ret(chunk_size, max_chunk_n, std::move(vec_store_meta), std::move(graph_store_meta));
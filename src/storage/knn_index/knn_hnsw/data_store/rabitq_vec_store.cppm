@@ -0,0 +1,513 @@
+// Copyright(C) 2024 InfiniFlow, Inc. All rights reserved.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     https://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+module;
+
+#include <algorithm>
+#include <bit>
+#include <cassert>
+#include <cmath>
+#include <ostream>
+
+#if defined(__GNUC__) && (defined(__x86_64__) || defined(__i386__))
+#include <xmmintrin.h>
+#elif defined(__GNUC__) && defined(__aarch64__)
+#include <simde/x86/sse.h>
+#endif
+
+export module rabitq_vec_store;
+
+import stl;
+import local_file_handle;
+import hnsw_common;
+import serialize;
+import data_store_util;
+
+namespace infinity {
+
+// 1 bit per dimension of the rotated residual x - c, plus the scalars needed to estimate distances from the codes.
+// norm_: |x - c|
+// ip_factor_: <o_bar, o>, o is the normalized rotated residual, o_bar its sign code scaled to unit length
+// bias_: <x, c> - |c|^2 / 2, so that <x, y> = <x - c, y - c> + bias_x + bias_y
+export struct RaBitQData {
+    f32 norm_;
+    f32 ip_factor_;
+    f32 bias_;
+    u64 code_[];
+};
+
+// The residual is rotated by a randomized hadamard transform, the code length is dim padded to a power of 2
+export SizeT RaBitQCodeDim(SizeT dim) { return std::max(SizeT(64), std::bit_ceil(dim)); }
+
+export SizeT RaBitQCodeWords(SizeT dim) { return RaBitQCodeDim(dim) / 64; }
+
+// A query keeps its rotated unit residual q at kRaBitQQueryBits bits, q ~ lower_ + step_ * q_u, stored as bit planes of
+// q_u after its 1 bit code.
+constexpr SizeT kRaBitQQueryBits = 4;
+
+struct RaBitQQueryData {
+    f32 lower_;
+    f32 step_;
+    f32 code_sum_;
+    u64 planes_[];
+};
+
+// Estimate <x - c, y - c> from two codes: <o_bar_x, o_bar_y> = (D - 2 * hamming) / D
+export f32 RaBitQResidualIP(const RaBitQData *v1, const RaBitQData *v2, SizeT code_words) {
+    SizeT hamming = 0;
+    for (SizeT i = 0; i < code_words; ++i) {
+        hamming += std::popcount(v1->code_[i] ^ v2->code_[i]);
+    }
+    SizeT code_dim = code_words * 64;
+    f32 code_ip = static_cast<f32>(static_cast<i64>(code_dim) - 2 * static_cast<i64>(hamming)) / code_dim;
+    f32 cos = std::clamp(code_ip / (v1->ip_factor_ * v2->ip_factor_), -1.0f, 1.0f);
+    return v1->norm_ * v2->norm_ * cos;
+}
+
+// Estimate <q - c, y - c> for a query made by MakeQuery: <o_bar_y, q> is computed with one popcount per bit plane
+export f32 RaBitQQueryResidualIP(const RaBitQData *query, const RaBitQData *v2, SizeT code_words) {
+    const auto *query_data = reinterpret_cast<const RaBitQQueryData *>(query->code_ + code_words);
+    u64 weighted = 0;
+    SizeT ones = 0;
+    for (SizeT i = 0; i < code_words; ++i) {
+        u64 code = v2->code_[i];
+        ones += std::popcount(code);
+        for (SizeT b = 0; b < kRaBitQQueryBits; ++b) {
+            weighted += static_cast<u64>(std::popcount(code & query_data->planes_[b * code_words + i])) << b;
+        }
+    }
+    SizeT code_dim = code_words * 64;
+    // sum of (2 * bit - 1) * (lower + step * q_u)
+    f32 sign_ip = 2 * query_data->step_ * weighted + 2 * query_data->lower_ * ones - query_data->step_ * query_data->code_sum_ -
+                  query_data->lower_ * code_dim;
+    f32 cos = std::clamp(sign_ip / std::sqrt(f32(code_dim)) / v2->ip_factor_, -1.0f, 1.0f);
+    return query->norm_ * v2->norm_ * cos;
+}
+
+// The distances of a binary code store only shortlist candidates, search results need to be reranked on the original vectors
+export template <typename Distance>
+concept IsRaBitQDistance = requires { typename Distance::RaBitQ; };
+
+export template <typename DataType, bool OwnMem>
+class RaBitQVecStoreInner;
+
+export template <typename DataType>
+class RaBitQVecStoreMetaType {
+public:
+    struct RaBitQQuery {
+        UniquePtr<RaBitQData> inner_;
+        operator const RaBitQData *() const { return inner_.get(); }
+
+        RaBitQQuery(SizeT compress_data_size) : inner_(new(new char[compress_data_size]) RaBitQData) {}
+        RaBitQQuery(RaBitQQuery &&other) = default;
+        ~RaBitQQuery() { delete[] reinterpret_cast<char *>(inner_.release()); }
+    };
+
+    using StoreType = const RaBitQData *;
+    using QueryType = RaBitQQuery;
+    using DistanceType = f32;
+};
+
+template <typename DataType, bool OwnMem>
+class RaBitQVecStoreMetaBase {
+public:
+    static_assert(std::is_same_v<DataType, f32>);
+
+    using This = RaBitQVecStoreMetaBase<DataType, OwnMem>;
+    using Inner = RaBitQVecStoreInner<DataType, OwnMem>;
+    using RaBitQQuery = RaBitQVecStoreMetaType<DataType>::RaBitQQuery;
+
+public:
+    RaBitQVecStoreMetaBase() : dim_(0), code_dim_(0), compress_data_size_(0), normalize_(false) {}
+    RaBitQVecStoreMetaBase(This &&other)
+        : dim_(std::exchange(other.dim_, 0)), code_dim_(std::exchange(other.code_dim_, 0)),
+          compress_data_size_(std::exchange(other.compress_data_size_, 0)), centroid_(std::move(other.centroid_)), normalize_(other.normalize_) {}
+    RaBitQVecStoreMetaBase &operator=(This &&other) {
+        if (this != &other) {
+            dim_ = std::exchange(other.dim_, 0);
+            code_dim_ = std::exchange(other.code_dim_, 0);
+            compress_data_size_ = std::exchange(other.compress_data_size_, 0);
+            centroid_ = std::move(other.centroid_);
+            normalize_ = other.normalize_;
+        }
+        return *this;
+    }
+
+    SizeT GetSizeInBytes() const { return sizeof(dim_) + sizeof(normalize_) + sizeof(MeanType) * dim_; }
+
+    void Save(LocalFileHandle &file_handle) const {
+        file_handle.Append(&dim_, sizeof(dim_));
+        file_handle.Append(&normalize_, sizeof(normalize_));
+        file_handle.Append(centroid_.get(), sizeof(MeanType) * dim_);
+    }
+
+    RaBitQQuery MakeQuery(const DataType *vec) const {
+        SizeT code_words = code_dim_ / 64;
+        RaBitQQuery query(compress_data_size_ + sizeof(RaBitQQueryData) + kRaBitQQueryBits * code_words * sizeof(u64));
+        auto residual = MakeUnique<f32[]>(code_dim_);
+        Encode(vec, query.inner_.get(), residual.get());
+
+        auto *query_data = reinterpret_cast<RaBitQQueryData *>(query.inner_->code_ + code_words);
+        std::fill(query_data->planes_, query_data->planes_ + kRaBitQQueryBits * code_words, 0);
+        f32 lower = 0;
+        f32 upper = 0;
+        if (f32 norm = query.inner_->norm_; norm != 0) {
+            for (SizeT j = 0; j < code_dim_; ++j) {
+                residual[j] /= norm;
+            }
+            lower = *std::min_element(residual.get(), residual.get() + code_dim_);
+            upper = *std::max_element(residual.get(), residual.get() + code_dim_);
+        }
+        constexpr u32 max_level = (1u << kRaBitQQueryBits) - 1;
+        f32 step = (upper - lower) / max_level;
+        u64 code_sum = 0;
+        if (step != 0) {
+            for (SizeT j = 0; j < code_dim_; ++j) {
+                auto level = static_cast<u32>(std::min<f32>(std::floor((residual[j] - lower) / step + 0.5), max_level));
+                code_sum += level;
+                for (SizeT b = 0; b < kRaBitQQueryBits; ++b) {
+                    if ((level >> b) & 1) {
+                        query_data->planes_[b * code_words + j / 64] |= u64(1) << (j % 64);
+                    }
+                }
+            }
+        }
+        query_data->lower_ = lower;
+        query_data->step_ = step;
+        query_data->code_sum_ = code_sum;
+        return query;
+    }
+
+    void CompressTo(const DataType *src, RaBitQData *dest) const {
+        auto residual = MakeUnique<f32[]>(code_dim_);
+        Encode(src, dest, residual.get());
+    }
+
+    SizeT dim() const { return dim_; }
+    SizeT code_dim() const { return code_dim_; }
+    SizeT compress_data_size() const { return compress_data_size_; }
+
+    // for unit test
+    const MeanType *centroid() const { return centroid_.get(); }
+
+protected:
+    void Init(SizeT dim) {
+        dim_ = dim;
+        code_dim_ = RaBitQCodeDim(dim);
+        compress_data_size_ = sizeof(RaBitQData) + code_dim_ / 8;
+    }
+
+    // residual is left with the rotated residual, code_dim_ long and zero initialized
+    void Encode(const DataType *src, RaBitQData *dest, f32 *residual) const {
+        f64 src_norm = 1;
+        if (normalize_) {
+            f64 norm_sq = 0;
+            for (SizeT j = 0; j < dim_; ++j) {
+                norm_sq += f64(src[j]) * src[j];
+            }
+            src_norm = norm_sq == 0 ? 0 : std::sqrt(norm_sq);
+        }
+        f64 xc_ip = 0;
+        f64 cc_ip = 0;
+        f64 norm_sq = 0;
+        for (SizeT j = 0; j < dim_; ++j) {
+            f64 x = src_norm == 0 ? 0 : src[j] / src_norm;
+            f64 r = x - centroid_[j];
+            residual[j] = r;
+            xc_ip += x * centroid_[j];
+            cc_ip += centroid_[j] * centroid_[j];
+            norm_sq += r * r;
+        }
+        Rotate(residual);
+
+        f64 abs_sum = 0;
+        u64 *code = dest->code_;
+        std::fill(code, code + code_dim_ / 64, 0);
+        for (SizeT j = 0; j < code_dim_; ++j) {
+            abs_sum += std::abs(residual[j]);
+            if (residual[j] > 0) {
+                code[j / 64] |= u64(1) << (j % 64);
+            }
+        }
+        f64 norm = std::sqrt(norm_sq);
+        dest->norm_ = norm;
+        dest->ip_factor_ = norm == 0 ? 1 : abs_sum / (norm * std::sqrt(f64(code_dim_)));
+        dest->bias_ = xc_ip - cc_ip / 2;
+    }
+
+    // Random sign flip followed by an orthonormal fast walsh-hadamard transform, the signs are fixed so that the
+    // rotation need not be saved.
+    void Rotate(f32 *vec) const {
+        u64 state = 0x9E3779B97F4A7C15ULL;
+        for (SizeT j = 0; j < code_dim_; j += 64) {
+            state = state * 6364136223846793005ULL + 1442695040888963407ULL;
+            u64 bits = state ^ (state >> 29);
+            for (SizeT k = 0; k < 64; ++k) {
+                if ((bits >> k) & 1) {
+                    vec[j + k] = -vec[j + k];
+                }
+            }
+        }
+        for (SizeT h = 1; h < code_dim_; h <<= 1) {
+            for (SizeT i = 0; i < code_dim_; i += h << 1) {
+                for (SizeT j = i; j < i + h; ++j) {
+                    f32 a = vec[j];
+                    f32 b = vec[j + h];
+                    vec[j] = a + b;
+                    vec[j + h] = a - b;
+                }
+            }
+        }
+        f32 scale = 1 / std::sqrt(f32(code_dim_));
+        for (SizeT j = 0; j < code_dim_; ++j) {
+            vec[j] *= scale;
+        }
+    }
+
+protected:
+    SizeT dim_;
+    SizeT code_dim_;
+    SizeT compress_data_size_;
+
+    ArrayPtr<MeanType, OwnMem> centroid_;
+
+    bool normalize_{false};
+
+public:
+    void Dump(std::ostream &os) const {
+        os << "[CONST] dim: " << dim_ << ", code_dim: " << code_dim_ << ", compress_data_size: " << compress_data_size_
+           << ", normalize: " << normalize_ << std::endl;
+        os << "centroid: ";
+        for (SizeT i = 0; i < dim_; ++i) {
+            os << centroid_[i] << " ";
+        }
+        os << std::endl;
+    }
+};
+
+export template <typename DataType, bool OwnMem>
+class RaBitQVecStoreMeta : public RaBitQVecStoreMetaBase<DataType, OwnMem> {
+    using This = RaBitQVecStoreMeta<DataType, OwnMem>;
+    using Inner = RaBitQVecStoreInner<DataType, OwnMem>;
+
+private:
+    RaBitQVecStoreMeta(SizeT dim) {
+        this->Init(dim);
+        this->centroid_ = MakeUnique<MeanType[]>(dim);
+        std::fill(this->centroid_.get(), this->centroid_.get() + dim, 0);
+    }
+
+public:
+    RaBitQVecStoreMeta() = default;
+    static This Make(SizeT dim) { return This(dim); }
+    static This Make(SizeT dim, bool normalize) {
+        This ret(dim);
+        ret.normalize_ = normalize;
+        return ret;
+    }
+
+    static This Load(LocalFileHandle &file_handle) {
+        SizeT dim;
+        file_handle.Read(&dim, sizeof(dim));
+        This meta(dim);
+        file_handle.Read(&meta.normalize_, sizeof(meta.normalize_));
+        file_handle.Read(meta.centroid_.get(), sizeof(MeanType) * dim);
+        return meta;
+    }
+
+    static This LoadFromPtr(const char *&ptr) {
+        SizeT dim = ReadBufAdv<SizeT>(ptr);
+        This meta(dim);
+        meta.normalize_ = ReadBufAdv<bool>(ptr);
+        std::memcpy(meta.centroid_.get(), ptr, sizeof(MeanType) * dim);
+        ptr += sizeof(MeanType) * dim;
+        return meta;
+    }
+
+    // The codes can not be rebuilt without the original vectors, so the centroid is only taken from the first batch
+    // inserted into an empty store.
+    template <typename LabelType, DataIteratorConcept<const DataType *, LabelType> Iterator>
+    void Optimize(Iterator &&query_iter, const Vector<Pair<Inner *, SizeT>> &inners, SizeT &mem_usage) {
+        for (const auto &[inner, size] : inners) {
+            if (size > 0) {
+                return;
+            }
+        }
+        auto new_centroid = MakeUnique<MeanType[]>(this->dim_);
+        SizeT cur_vec_num = 0;
+        while (true) {
+            if (auto ret = query_iter.Next(); ret) {
+                auto &[vec, _] = *ret;
+                MeanType norm = 1;
+                if (this->normalize_) {
+                    MeanType norm_sq = 0;
+                    for (SizeT i = 0; i < this->dim_; ++i) {
+                        norm_sq += MeanType(vec[i]) * vec[i];
+                    }
+                    norm = norm_sq == 0 ? 0 : std::sqrt(norm_sq);
+                }
+                if (norm != 0) {
+                    for (SizeT i = 0; i < this->dim_; ++i) {
+                        new_centroid[i] += vec[i] / norm;
+                    }
+                }
+                ++cur_vec_num;
+            } else {
+                break;
+            }
+        }
+        if (cur_vec_num == 0) {
+            return;
+        }
+        for (SizeT i = 0; i < this->dim_; ++i) {
+            new_centroid[i] /= cur_vec_num;
+        }
+        this->centroid_.exchange(std::move(new_centroid));
+    }
+};
+
+export template <typename DataType>
+class RaBitQVecStoreMeta<DataType, false> : public RaBitQVecStoreMetaBase<DataType, false> {
+    using This = RaBitQVecStoreMeta<DataType, false>;
+
+private:
+    RaBitQVecStoreMeta(SizeT dim, bool normalize, const MeanType *centroid) {
+        this->Init(dim);
+        this->normalize_ = normalize;
+        this->centroid_ = centroid;
+    }
+
+public:
+    RaBitQVecStoreMeta() = default;
+
+    static This LoadFromPtr(const char *&ptr) {
+        SizeT dim = ReadBufAdv<SizeT>(ptr);
+        bool normalize = ReadBufAdv<bool>(ptr);
+        const auto *centroid = reinterpret_cast<const MeanType *>(ptr);
+        ptr += sizeof(MeanType) * dim;
+        This meta(dim, normalize, centroid);
+        return meta;
+    }
+};
+
+template <typename DataType, bool OwnMem>
+class RaBitQVecStoreInnerBase {
+public:
+    using This = RaBitQVecStoreInnerBase<DataType, OwnMem>;
+    using Meta = RaBitQVecStoreMetaBase<DataType, OwnMem>;
+
+public:
+    RaBitQVecStoreInnerBase() = default;
+
+    SizeT GetSizeInBytes(SizeT cur_vec_num, const Meta &meta) const { return cur_vec_num * meta.compress_data_size(); }
+
+    void Save(LocalFileHandle &file_handle, SizeT cur_vec_num, const Meta &meta) const {
+        file_handle.Append(ptr_.get(), cur_vec_num * meta.compress_data_size());
+    }
+
+    static void
+    SaveToPtr(LocalFileHandle &file_handle, const Vector<const This *> &inners, const Meta &meta, SizeT ck_size, SizeT chunk_num, SizeT last_chunk_size) {
+        for (SizeT i = 0; i < chunk_num; ++i) {
+            SizeT chunk_size = (i < chunk_num - 1) ? ck_size : last_chunk_size;
+            file_handle.Append(inners[i]->ptr_.get(), chunk_size * meta.compress_data_size());
+        }
+    }
+
+    const RaBitQData *GetVec(SizeT idx, const Meta &meta) const {
+        return reinterpret_cast<const RaBitQData *>(ptr_.get() + idx * meta.compress_data_size());
+    }
+
+    void Prefetch(VertexType vec_i, const Meta &meta) const { _mm_prefetch(reinterpret_cast<const char *>(GetVec(vec_i, meta)), _MM_HINT_T0); }
+
+protected:
+    ArrayPtr<char, OwnMem> ptr_;
+
+public:
+    void Dump(std::ostream &os, SizeT offset, SizeT chunk_size, const Meta &meta) const {
+        for (int i = 0; i < (int)chunk_size; ++i) {
+            os << "vec " << i << "(" << offset + i << "): ";
+            const RaBitQData *vec = GetVec(i, meta);
+            os << "norm: " << vec->norm_ << ", ip_factor: " << vec->ip_factor_ << ", bias: " << vec->bias_ << std::endl;
+            os << "code: ";
+            for (SizeT j = 0; j < meta.code_dim() / 64; ++j) {
+                os << std::hex << vec->code_[j] << std::dec << " ";
+            }
+            os << std::endl;
+        }
+    }
+};
+
+export template <typename DataType, bool OwnMem>
+class RaBitQVecStoreInner : public RaBitQVecStoreInnerBase<DataType, OwnMem> {
+public:
+    using This = RaBitQVecStoreInner<DataType, OwnMem>;
+    using Meta = RaBitQVecStoreMetaBase<DataType, OwnMem>;
+    using Base = RaBitQVecStoreInnerBase<DataType, OwnMem>;
+
+private:
+    RaBitQVecStoreInner(SizeT max_vec_num, const Meta &meta) { this->ptr_ = MakeUnique<char[]>(max_vec_num * meta.compress_data_size()); }
+
+public:
+    RaBitQVecStoreInner() = default;
+
+    static This Make(SizeT max_vec_num, const Meta &meta, SizeT &mem_usage) {
+        auto ret = This(max_vec_num, meta);
+        mem_usage += max_vec_num * meta.compress_data_size();
+        return ret;
+    }
+
+    static This Load(LocalFileHandle &file_handle, SizeT cur_vec_num, SizeT max_vec_num, const Meta &meta, SizeT &mem_usage) {
+        assert(cur_vec_num <= max_vec_num);
+        This ret(max_vec_num, meta);
+        file_handle.Read(ret.ptr_.get(), cur_vec_num * meta.compress_data_size());
+        mem_usage += max_vec_num * meta.compress_data_size();
+        return ret;
+    }
+
+    static This LoadFromPtr(const char *&ptr, SizeT cur_vec_num, SizeT max_vec_num, const Meta &meta, SizeT &mem_usage) {
+        This ret(max_vec_num, meta);
+        std::memcpy(ret.ptr_.get(), ptr, cur_vec_num * meta.compress_data_size());
+        ptr += cur_vec_num * meta.compress_data_size();
+        mem_usage += max_vec_num * meta.compress_data_size();
+        return ret;
+    }
+
+    void SetVec(SizeT idx, const DataType *vec, const Meta &meta, SizeT &mem_usage) { meta.CompressTo(vec, GetVecMut(idx, meta)); }
+
+private:
+    RaBitQData *GetVecMut(SizeT idx, const Meta &meta) { return reinterpret_cast<RaBitQData *>(this->ptr_.get() + idx * meta.compress_data_size()); }
+};
+
+export template <typename DataType>
+class RaBitQVecStoreInner<DataType, false> : public RaBitQVecStoreInnerBase<DataType, false> {
+public:
+    using This = RaBitQVecStoreInner<DataType, false>;
+    using Meta = RaBitQVecStoreMetaBase<DataType, false>;
+    using Base = RaBitQVecStoreInnerBase<DataType, false>;
+
+private:
+    RaBitQVecStoreInner(const char *ptr) { this->ptr_ = ptr; }
+
+public:
+    RaBitQVecStoreInner() = default;
+
+    static This LoadFromPtr(const char *&ptr, SizeT cur_vec_num, const Meta &meta) {
+        const char *p = ptr;
+        This ret(p);
+        ptr += cur_vec_num * meta.compress_data_size();
+        return ret;
+    }
+};
+
+} // namespace infinity
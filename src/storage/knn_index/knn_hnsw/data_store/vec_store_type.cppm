@@ -20,6 +20,7 @@ import stl;
 import plain_vec_store;
 import sparse_vec_store;
 import lvq_vec_store;
+import rabitq_vec_store;
 import dist_func_cos;
 import dist_func_l2;
 import dist_func_ip;
@@ -195,4 +196,73 @@ public:
     }
 };
 
+export template <typename DataT>
+class RaBitQCosVecStoreType {
+public:
+    using DataType = DataT;
+    using CompressType = void;
+    template <bool OwnMem>
+    using Meta = RaBitQVecStoreMeta<DataType, OwnMem>;
+    template <bool OwnMem>
+    using Inner = RaBitQVecStoreInner<DataType, OwnMem>;
+    using QueryVecType = const DataType *;
+    using MetaType = RaBitQVecStoreMetaType<DataType>;
+    using StoreType = typename MetaType::StoreType;
+    using QueryType = typename MetaType::QueryType;
+    using Distance = RaBitQCosDist<DataType>;
+
+    static constexpr bool HasOptimize = true;
+
+    template <typename CompressType>
+    static constexpr RaBitQCosVecStoreType<DataType> ToLVQ() {
+        return {};
+    }
+};
+
+export template <typename DataT>
+class RaBitQL2VecStoreType {
+public:
+    using DataType = DataT;
+    using CompressType = void;
+    template <bool OwnMem>
+    using Meta = RaBitQVecStoreMeta<DataType, OwnMem>;
+    template <bool OwnMem>
+    using Inner = RaBitQVecStoreInner<DataType, OwnMem>;
+    using QueryVecType = const DataType *;
+    using MetaType = RaBitQVecStoreMetaType<DataType>;
+    using StoreType = typename MetaType::StoreType;
+    using QueryType = typename MetaType::QueryType;
+    using Distance = RaBitQL2Dist<DataType>;
+
+    static constexpr bool HasOptimize = true;
+
+    template <typename CompressType>
+    static constexpr RaBitQL2VecStoreType<DataType> ToLVQ() {
+        return {};
+    }
+};
+
+export template <typename DataT>
+class RaBitQIPVecStoreType {
+public:
+    using DataType = DataT;
+    using CompressType = void;
+    template <bool OwnMem>
+    using Meta = RaBitQVecStoreMeta<DataType, OwnMem>;
+    template <bool OwnMem>
+    using Inner = RaBitQVecStoreInner<DataType, OwnMem>;
+    using QueryVecType = const DataType *;
+    using MetaType = RaBitQVecStoreMetaType<DataType>;
+    using StoreType = typename MetaType::StoreType;
+    using QueryType = typename MetaType::QueryType;
+    using Distance = RaBitQIPDist<DataType>;
+
+    static constexpr bool HasOptimize = true;
+
+    template <typename CompressType>
+    static constexpr RaBitQIPVecStoreType<DataType> ToLVQ() {
+        return {};
+    }
+};
+
 } // namespace infinity
@@ -20,6 +20,7 @@ import stl;
 import hnsw_common;
 import plain_vec_store;
 import lvq_vec_store;
+import rabitq_vec_store;
 import simd_functions;
 
 export module dist_func_l2;
@@ -200,4 +201,51 @@ LVQL2Dist<DataType, i8> PlainL2Dist<DataType>::ToLVQDistance(SizeT dim) && {
     return LVQL2Dist<DataType, i8>(dim);
 }
 
+export template <typename DataType>
+class RaBitQL2Dist {
+public:
+    using This = RaBitQL2Dist<DataType>;
+    using VecStoreMetaType = RaBitQVecStoreMetaType<DataType>;
+    using StoreType = typename VecStoreMetaType::StoreType;
+    using DistanceType = typename VecStoreMetaType::DistanceType;
+    using RaBitQ = void;
+
+private:
+    SizeT code_words_ = 0;
+
+public:
+    RaBitQL2Dist() = default;
+    RaBitQL2Dist(RaBitQL2Dist &&other) : code_words_(std::exchange(other.code_words_, 0)) {}
+    RaBitQL2Dist &operator=(RaBitQL2Dist &&other) {
+        if (this != &other) {
+            code_words_ = std::exchange(other.code_words_, 0);
+        }
+        return *this;
+    }
+    ~RaBitQL2Dist() = default;
+    RaBitQL2Dist(SizeT dim) : code_words_(RaBitQCodeWords(dim)) {}
+
+    template <typename DataStore>
+    DistanceType operator()(VertexType v1_i, VertexType v2_i, const DataStore &data_store) const {
+        const StoreType &v1 = data_store.GetVec(v1_i);
+        const StoreType &v2 = data_store.GetVec(v2_i);
+        return Inner(RaBitQResidualIP(v1, v2, code_words_), v1, v2);
+    }
+
+    // v1 without a vertex is a search query made by MakeQuery, it is compared at the higher query precision
+    template <typename DataStore>
+    DistanceType operator()(const StoreType &v1, VertexType v2_i, const DataStore &data_store, VertexType v1_i = kInvalidVertex) const {
+        const StoreType &v2 = data_store.GetVec(v2_i);
+        if (v1_i == kInvalidVertex) {
+            return Inner(RaBitQQueryResidualIP(v1, v2, code_words_), v1, v2);
+        }
+        return Inner(RaBitQResidualIP(v1, v2, code_words_), v1, v2);
+    }
+
+private:
+    DistanceType Inner(f32 r1r2_ip, const StoreType &v1, const StoreType &v2) const {
+        return v1->norm_ * v1->norm_ + v2->norm_ * v2->norm_ - 2 * r1r2_ip;
+    }
+};
+
 } // namespace infinity
\ No newline at end of file
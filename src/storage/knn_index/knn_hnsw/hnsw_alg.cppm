@@ -30,6 +30,7 @@ import data_store;
 import third_party;
 import serialize;
 import dist_func_lsg_wrapper;
+import rabitq_vec_store;
 
 // Fixme: some variable has implicit type conversion.
 // Fixme: some variable has confusing name.
@@ -63,6 +64,7 @@ public:
     using DistHeap = Heap<PDV, CMP>;
 
     constexpr static bool LSG = IsLSGDistance<Distance>;
+    constexpr static bool kRerank = IsRaBitQDistance<Distance>;
 
     constexpr static int prefetch_offset_ = 0;
     constexpr static int prefetch_step_ = 2;
@@ -355,9 +355,12 @@ void NewTxnManager::CommitReplayTxn(NewTxn *txn) {
     if (!status.ok()) {
         UnrecoverableError(fmt::format("Fail to commit replay txn: {}", status.message()));
     }
+    SetReplayCommitTS(txn->CommitTS());
+}
 
-    current_ts_ = txn->CommitTS();
-    prepare_commit_ts_ = txn->CommitTS();
+void NewTxnManager::SetReplayCommitTS(TxnTimeStamp commit_ts) {
+    current_ts_ = commit_ts;
+    prepare_commit_ts_ = commit_ts;
 }
 
 Status NewTxnManager::RollBackTxn(NewTxn *txn) {
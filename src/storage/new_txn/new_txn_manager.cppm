@@ -83,6 +83,8 @@ public:
     Status CommitTxn(NewTxn *txn, TxnTimeStamp *commit_ts_ptr = nullptr);
     void CommitReplayTxn(NewTxn *txn);
 
+    void SetReplayCommitTS(TxnTimeStamp commit_ts);
+
     Status RollBackTxn(NewTxn *txn);
 
     SizeT ActiveTxnCount();
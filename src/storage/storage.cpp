@@ -209,7 +209,8 @@ Status Storage::AdminToReader() {
                                             MakeShared<String>(config_ptr_->DataDir()),
                                             MakeShared<String>(config_ptr_->TempDir()),
                                             persistence_manager_.get(),
-                                            config_ptr_->LRUNum());
+                                            config_ptr_->LRUNum(),
+                                            BufferReplacePolicyFromString(config_ptr_->BufferReplacementPolicy()));
     buffer_mgr_->Start();
 
     LOG_INFO("No checkpoint found in READER mode, waiting for log replication");
@@ -255,7 +256,8 @@ Status Storage::AdminToWriter() {
                                             MakeShared<String>(config_ptr_->DataDir()),
                                             MakeShared<String>(config_ptr_->TempDir()),
                                             persistence_manager_.get(),
-                                            config_ptr_->LRUNum());
+                                            config_ptr_->LRUNum(),
+                                            BufferReplacePolicyFromString(config_ptr_->BufferReplacementPolicy()));
     buffer_mgr_->Start();
 
     // Must init catalog before txn manager.
@@ -266,7 +268,7 @@ Status Storage::AdminToWriter() {
 
     Vector<SharedPtr<WalEntry>> replay_entries;
     LOG_INFO("Read WAL files");
-    auto [system_start_ts, max_checkpoint_ts] = wal_mgr_->GetReplayEntries(StorageMode::kWritable, replay_entries);
+    auto [system_start_ts, max_checkpoint_ts] = wal_mgr_->GetReplayEntries(StorageMode::kWritable, replay_entries, config_ptr_->ReplayWalWorker());
     // Init database, need to create default_db
     LOG_INFO(fmt::format("Init a new catalog"));
     catalog_ = Catalog::NewCatalog();
@@ -282,7 +284,7 @@ Status Storage::AdminToWriter() {
     wal_mgr_->Start();
 
     if (config_ptr_->ReplayWal()) {
-        wal_mgr_->ReplayWalEntries(replay_entries);
+        wal_mgr_->ReplayWalEntries(replay_entries, config_ptr_->ReplayWalWorker());
     }
 
     if (memory_index_tracer_ != nullptr) {
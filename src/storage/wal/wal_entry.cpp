@@ -15,6 +15,7 @@
 module;
 
 #include <cassert>
+#include <future>
 #include <sstream>
 #include <vector>
 
@@ -2961,14 +2962,63 @@ Vector<SharedPtr<WalEntry>> WalEntryIterator::GetAllEntries() {
 
 bool WalEntryIterator::IsGood() const { return (is_backward_ && off_ == 0) || (!is_backward_ && off_ == buf_.size()); }
 
-WalListIterator::WalListIterator(const Vector<String> &wal_list) {
+WalListIterator::WalListIterator(const Vector<String> &wal_list, SizeT decode_worker) {
     assert(!wal_list.empty());
     for (SizeT i = 0; i < wal_list.size(); ++i) {
         wal_list_.push_back(wal_list[i]);
     }
     PurgeBadEntriesAfterLatestCheckpoint();
-    if (!wal_list_.empty())
+    if (decode_worker > 1 && wal_list_.size() > 1) {
+        decode_pool_ = MakeUnique<ThreadPool>(std::min(decode_worker, wal_list_.size()));
+        decode_files_.assign(wal_list_.begin(), wal_list_.end());
+    } else if (!wal_list_.empty()) {
         iter_ = WalEntryIterator::Make(wal_list_.front(), true);
+    }
+}
+
+bool WalListIterator::DecodeNextFiles() {
+    if (decoded_file_count_ == decode_files_.size()) {
+        return false;
+    }
+    const SizeT file_count = std::min<SizeT>(decode_pool_->size(), decode_files_.size() - decoded_file_count_);
+    decoded_entries_.clear();
+    decoded_entries_.resize(file_count);
+    file_idx_ = 0;
+    entry_idx_ = 0;
+
+    Vector<std::future<void>> futs;
+    futs.reserve(file_count);
+    for (SizeT i = 0; i < file_count; ++i) {
+        futs.emplace_back(decode_pool_->push([this, i](int) {
+            const String &wal_file = decode_files_[decoded_file_count_ + i];
+            auto iter = WalEntryIterator::Make(wal_file, true);
+            auto &entries = decoded_entries_[i];
+            while (iter->HasNext()) {
+                auto entry = iter->Next();
+                entries.push_back(entry);
+                if (entry.get() == nullptr) {
+                    LOG_WARN(fmt::format("Found bad wal entry {}@{}", wal_file, iter->GetOffset()));
+                    break;
+                }
+            }
+        }));
+    }
+    // wait for every task before rethrowing, they write into decoded_entries_
+    std::exception_ptr task_exception;
+    for (auto &fut : futs) {
+        try {
+            fut.get();
+        } catch (...) {
+            if (!task_exception) {
+                task_exception = std::current_exception();
+            }
+        }
+    }
+    if (task_exception) {
+        std::rethrow_exception(task_exception);
+    }
+    decoded_file_count_ += file_count;
+    return true;
 }
 
 void WalListIterator::PurgeBadEntriesAfterLatestCheckpoint() {
@@ -3029,6 +3079,18 @@ void WalListIterator::PurgeBadEntriesAfterLatestCheckpoint() {
 }
 
 bool WalListIterator::HasNext() {
+    if (decode_pool_.get() != nullptr) {
+        while (true) {
+            for (; file_idx_ < decoded_entries_.size(); ++file_idx_, entry_idx_ = 0) {
+                if (entry_idx_ < decoded_entries_[file_idx_].size()) {
+                    return true;
+                }
+            }
+            if (!DecodeNextFiles()) {
+                return false;
+            }
+        }
+    }
     if (iter_.get() == nullptr) {
         return false;
     }
@@ -3048,6 +3110,9 @@ bool WalListIterator::HasNext() {
 }
 
 SharedPtr<WalEntry> WalListIterator::Next() {
+    if (decode_pool_.get() != nullptr) {
+        return decoded_entries_[file_idx_][entry_idx_++];
+    }
     auto entry = iter_->Next();
     if (entry.get() == nullptr) {
         auto off = iter_->GetOffset();
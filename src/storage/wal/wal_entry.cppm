@@ -1072,7 +1072,9 @@ private:
 // Backward iterator of WAL entries in given WAL files
 export class WalListIterator {
 public:
-    explicit WalListIterator(const Vector<String> &wal_list);
+    // decode_worker > 1 decodes the next decode_worker files on that many threads when the reader reaches them, instead of one
+    // file at a time
+    explicit WalListIterator(const Vector<String> &wal_list, SizeT decode_worker = 1);
 
     [[nodiscard]] bool HasNext();
 
@@ -1081,8 +1083,19 @@ public:
 private:
     // Locate the latest full checkpoint entry, and purge bad entries after it.
     void PurgeBadEntriesAfterLatestCheckpoint();
+    // Decode the next files into decoded_entries_, releasing the entries of the previous ones. Return false if no file is left.
+    bool DecodeNextFiles();
     List<String> wal_list_{};
     UniquePtr<WalEntryIterator> iter_{};
+
+    // Files are decoded only as far as the reader goes, replay stopping at the checkpoint leaves the older ones alone.
+    UniquePtr<ThreadPool> decode_pool_{};
+    Vector<String> decode_files_{};
+    SizeT decoded_file_count_{};
+    // Entries of each decoded file in backward order, a trailing nullptr marks a bad entry.
+    Vector<Vector<SharedPtr<WalEntry>>> decoded_entries_{};
+    SizeT file_idx_{};
+    SizeT entry_idx_{};
 };
 
 } // namespace infinity
@@ -16,6 +16,7 @@ module;
 
 #include <filesystem>
 #include <fstream>
+#include <future>
 #include <thread>
 
 import stl;
@@ -1108,7 +1109,8 @@ i64 WalManager::ReplayWalFile(StorageMode targe_storage_mode) {
     return system_start_ts;
 }
 
-Pair<TxnTimeStamp, TxnTimeStamp> WalManager::GetReplayEntries(StorageMode targe_storage_mode, Vector<SharedPtr<WalEntry>> &replay_entries) {
+Pair<TxnTimeStamp, TxnTimeStamp>
+WalManager::GetReplayEntries(StorageMode targe_storage_mode, Vector<SharedPtr<WalEntry>> &replay_entries, SizeT replay_worker) {
     Vector<String> wal_list{};
     {
         auto [temp_wal_info, wal_infos] = WalFile::ParseWalFilenames(wal_dir_);
@@ -1140,7 +1142,7 @@ Pair<TxnTimeStamp, TxnTimeStamp> WalManager::GetReplayEntries(StorageMode targe_
     TxnTimeStamp last_commit_ts = 0; // last wal commit ts
 
     { // if no checkpoint, max_checkpoint_ts is 0
-        WalListIterator iterator(wal_list);
+        WalListIterator iterator(wal_list, replay_worker);
         // phase 1: find the max commit ts and catalog path
         LOG_INFO("Replay phase 1: find the max commit ts and catalog path");
         while (iterator.HasNext()) {
@@ -1205,48 +1207,133 @@ Pair<TxnTimeStamp, TxnTimeStamp> WalManager::GetReplayEntries(StorageMode targe_
     return {last_commit_ts, max_checkpoint_ts};
 }
 
-void WalManager::ReplayWalEntries(const Vector<SharedPtr<WalEntry>> &replay_entries) {
-    // phase 3: replay the entries
+namespace {
 
-    LOG_INFO(fmt::format("Replay phase 3: replay {} entries", replay_entries.size()));
-    // TransactionID last_txn_id = 0;
+// The table an entry writes to, if the entry only appends to or deletes from a single table.
+Optional<Pair<String, String>> DataEntryTable(const WalEntry &entry) {
+    Optional<Pair<String, String>> table;
+    for (const auto &cmd : entry.cmds_) {
+        const String *db_name = nullptr;
+        const String *table_name = nullptr;
+        switch (cmd->GetType()) {
+            case WalCommandType::APPEND_V2: {
+                auto *append_cmd = static_cast<WalCmdAppendV2 *>(cmd.get());
+                db_name = &append_cmd->db_name_;
+                table_name = &append_cmd->table_name_;
+                break;
+            }
+            case WalCommandType::DELETE_V2: {
+                auto *delete_cmd = static_cast<WalCmdDeleteV2 *>(cmd.get());
+                db_name = &delete_cmd->db_name_;
+                table_name = &delete_cmd->table_name_;
+                break;
+            }
+            default: {
+                return None;
+            }
+        }
+        if (!table.has_value()) {
+            table = Pair<String, String>(*db_name, *table_name);
+        } else if (table->first != *db_name || table->second != *table_name) {
+            return None;
+        }
+    }
+    return table;
+}
 
-    NewTxnManager *txn_mgr = storage_->new_txn_manager();
+UniquePtr<NewTxn> ReplayEntryCmds(NewTxnManager *txn_mgr, const SharedPtr<WalEntry> &replay_entry) {
+    LOG_DEBUG(replay_entry->ToString());
+    UniquePtr<NewTxn> replay_txn = txn_mgr->BeginReplayTxn(replay_entry);
+    for (const auto &cmd : replay_entry->cmds_) {
+        LOG_INFO(fmt::format("Replay wal cmd: {}, commit ts: {}", WalCmd::WalCommandTypeToString(cmd->GetType()).c_str(), replay_entry->commit_ts_));
 
-    for (SizeT replay_count = 0; replay_count < replay_entries.size(); ++replay_count) {
-        // if (replay_entries[replay_count]->commit_ts_ < max_checkpoint_ts) {
-        //     String error_message = fmt::format("Wal Replay: Commit ts should be greater than max commit ts, commit_ts: {}, max_commit: {}",
-        //                                        replay_entries[replay_count]->commit_ts_,
-        //                                        max_checkpoint_ts);
-        //     UnrecoverableError(error_message);
-        // }
-        // last_commit_ts = replay_entries[replay_count]->commit_ts_;
-        // last_txn_id = replay_entries[replay_count]->txn_id_;
+        Status status = replay_txn->ReplayWalCmd(cmd);
+        if (!status.ok()) {
+            UnrecoverableError(fmt::format("Fail to replay wal entry: {}", status.message()));
+        }
+    }
+    return replay_txn;
+}
+
+// Commits without advancing the txn manager's commit ts, the concurrent replay advances it once per run.
+void ReplayEntry(NewTxnManager *txn_mgr, const SharedPtr<WalEntry> &replay_entry) {
+    UniquePtr<NewTxn> replay_txn = ReplayEntryCmds(txn_mgr, replay_entry);
+    Status status = replay_txn->CommitReplay();
+    if (!status.ok()) {
+        UnrecoverableError(fmt::format("Fail to commit replay txn: {}", status.message()));
+    }
+}
 
-        const SharedPtr<WalEntry> &replay_entry = replay_entries[replay_count];
-        LOG_DEBUG(replay_entry->ToString());
-        // ReplayWalOptions options{.on_startup_ = false, .is_replay_ = true, .sync_from_leader_ = false};
+} // namespace
 
-        UniquePtr<NewTxn> replay_txn = txn_mgr->BeginReplayTxn(replay_entry);
-        for (const auto &cmd : replay_entry->cmds_) {
-            LOG_INFO(
-                fmt::format("Replay wal cmd: {}, commit ts: {}", WalCmd::WalCommandTypeToString(cmd->GetType()).c_str(), replay_entry->commit_ts_));
+void WalManager::ReplayWalEntries(const Vector<SharedPtr<WalEntry>> &replay_entries, SizeT replay_worker) {
+    // phase 3: replay the entries
+
+    LOG_INFO(fmt::format("Replay phase 3: replay {} entries with {} worker", replay_entries.size(), replay_worker));
 
-            Status status = replay_txn->ReplayWalCmd(cmd);
-            if (!status.ok()) {
-                UnrecoverableError(fmt::format("Fail to replay wal entry: {}", status.message()));
+    NewTxnManager *txn_mgr = storage_->new_txn_manager();
+
+    // Entries touching more than one table, or anything but appends and deletes, are replayed alone and order the runs between them.
+    SizeT begin = 0;
+    while (begin < replay_entries.size()) {
+        SizeT end = begin;
+        if (replay_worker > 1) {
+            while (end < replay_entries.size() && DataEntryTable(*replay_entries[end]).has_value()) {
+                ++end;
             }
         }
+        if (end - begin > 1) {
+            ReplayWalEntries(replay_entries, begin, end, replay_worker);
+            begin = end;
+            continue;
+        }
 
+        UniquePtr<NewTxn> replay_txn = ReplayEntryCmds(txn_mgr, replay_entries[begin]);
         txn_mgr->CommitReplayTxn(replay_txn.get());
+        ++begin;
     }
+}
 
-    // LOG_INFO(fmt::format("Latest txn commit_ts: {}, latest txn id: {}", last_commit_ts, last_txn_id));
-    // storage_->catalog()->next_txn_id_ = last_txn_id;
-    // UpdateCommitState(last_commit_ts, 0);
+void WalManager::ReplayWalEntries(const Vector<SharedPtr<WalEntry>> &replay_entries, SizeT begin, SizeT end, SizeT replay_worker) {
+    // entries of a table stay in commit order
+    Vector<Vector<SizeT>> table_entries;
+    Map<Pair<String, String>, SizeT> table_idx;
+    for (SizeT i = begin; i < end; ++i) {
+        auto [iter, inserted] = table_idx.emplace(*DataEntryTable(*replay_entries[i]), table_entries.size());
+        if (inserted) {
+            table_entries.emplace_back();
+        }
+        table_entries[iter->second].push_back(i);
+    }
+    LOG_INFO(fmt::format("Replay {} entries of {} tables concurrently", end - begin, table_entries.size()));
 
-    // TxnTimeStamp system_start_ts = last_commit_ts + 1;
-    // LOG_INFO(fmt::format("System start ts: {}", system_start_ts));
+    NewTxnManager *txn_mgr = storage_->new_txn_manager();
+    {
+        ThreadPool thread_pool(std::min(replay_worker, table_entries.size()));
+        Vector<std::future<void>> futs;
+        futs.reserve(table_entries.size());
+        for (const auto &entry_indices : table_entries) {
+            futs.emplace_back(thread_pool.push([txn_mgr, &replay_entries, &entry_indices](int) {
+                for (SizeT i : entry_indices) {
+                    ReplayEntry(txn_mgr, replay_entries[i]);
+                }
+            }));
+        }
+        std::exception_ptr task_exception;
+        for (auto &fut : futs) {
+            try {
+                fut.get();
+            } catch (...) {
+                if (!task_exception) {
+                    task_exception = std::current_exception();
+                }
+            }
+        }
+        if (task_exception) {
+            std::rethrow_exception(task_exception);
+        }
+    }
+    txn_mgr->SetReplayCommitTS(replay_entries[end - 1]->commit_ts_);
 }
 
 Optional<Pair<FullCatalogFileInfo, Vector<DeltaCatalogFileInfo>>> WalManager::GetCatalogFiles() const {
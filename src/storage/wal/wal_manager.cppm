@@ -127,9 +127,11 @@ public:
 
     i64 ReplayWalFile(StorageMode targe_storage_mode);
 
-    Pair<TxnTimeStamp, TxnTimeStamp> GetReplayEntries(StorageMode targe_storage_mode, Vector<SharedPtr<WalEntry>> &replay_entries);
+    Pair<TxnTimeStamp, TxnTimeStamp>
+    GetReplayEntries(StorageMode targe_storage_mode, Vector<SharedPtr<WalEntry>> &replay_entries, SizeT replay_worker = 1);
 
-    void ReplayWalEntries(const Vector<SharedPtr<WalEntry>> &replay_entries);
+    // With replay_worker > 1, consecutive append / delete entries are grouped by table and the tables are replayed concurrently.
+    void ReplayWalEntries(const Vector<SharedPtr<WalEntry>> &replay_entries, SizeT replay_worker = 1);
 
     Optional<Pair<FullCatalogFileInfo, Vector<DeltaCatalogFileInfo>>> GetCatalogFiles() const;
 
@@ -144,6 +146,8 @@ public:
     void UpdateCommitState(TxnTimeStamp commit_ts, i64 wal_size);
 
 private:
+    void ReplayWalEntries(const Vector<SharedPtr<WalEntry>> &replay_entries, SizeT begin, SizeT end, SizeT replay_worker);
+
     // Checkpoint Helper
     void FullCheckpointInner(Txn *txn);
     void DeltaCheckpointInner(Txn *txn);
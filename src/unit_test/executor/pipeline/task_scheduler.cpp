@@ -0,0 +1,151 @@
+// Copyright(C) 2025 InfiniFlow, Inc. All rights reserved.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     https://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#include "gtest/gtest.h"
+import base_test;
+
+import stl;
+import task_scheduler;
+import fragment_task;
+import statement_common;
+
+using namespace infinity;
+
+class TaskSchedulerTest : public BaseTest {
+protected:
+    static constexpr SizeT kInteractive = static_cast<SizeT>(QueryPriority::kInteractive);
+    static constexpr SizeT kBatch = static_cast<SizeT>(QueryPriority::kBatch);
+    static constexpr SizeT kBackground = static_cast<SizeT>(QueryPriority::kBackground);
+
+    static void NoRecord(SizeT, const TimePoint<Clock> &) {}
+
+    // Run the picked task: pop it if `finish` else move it to the back of its class as the worker loop does
+    static FragmentTask *Run(TaskLists &task_lists, SizeT priority_idx, bool finish) {
+        auto &task_list = task_lists[priority_idx];
+        FragmentTask *task = task_list.front();
+        if (finish) {
+            task_list.pop_front();
+        } else {
+            task_list.splice(task_list.end(), task_list, task_list.begin());
+        }
+        return task;
+    }
+};
+
+TEST_F(TaskSchedulerTest, test_priority_order) {
+    FragmentTask batch_task(false), background_task(false), interactive_task1(false), interactive_task2(false);
+    WorkerQueue queue;
+    queue.Push(&background_task, kBackground);
+    queue.Push(&batch_task, kBatch);
+    queue.Push(&interactive_task1, kInteractive);
+    queue.Push(&interactive_task2, kInteractive);
+
+    TaskLists task_lists;
+    EXPECT_EQ(queue.TakeAll(task_lists, NoRecord), 4ul);
+    EXPECT_EQ(queue.size(), 0ul);
+
+    TaskPicker task_picker;
+    Vector<FragmentTask *> run_order;
+    for (SizeT priority_idx = task_picker.Pick(task_lists); priority_idx < kQueryPriorityCount; priority_idx = task_picker.Pick(task_lists)) {
+        run_order.push_back(Run(task_lists, priority_idx, true));
+    }
+    Vector<FragmentTask *> expected{&interactive_task1, &interactive_task2, &batch_task, &background_task};
+    EXPECT_EQ(run_order, expected);
+}
+
+TEST_F(TaskSchedulerTest, test_aging) {
+    // interactive tasks that never finish keep their class non-empty
+    Vector<UniquePtr<FragmentTask>> interactive_tasks;
+    TaskLists task_lists;
+    for (SizeT i = 0; i < 4; ++i) {
+        interactive_tasks.push_back(MakeUnique<FragmentTask>(false));
+        task_lists[kInteractive].push_back(interactive_tasks.back().get());
+    }
+    FragmentTask batch_task(false), background_task(false);
+    task_lists[kBatch].push_back(&batch_task);
+    task_lists[kBackground].push_back(&background_task);
+
+    TaskPicker task_picker;
+    Vector<SizeT> lower_picks;
+    for (SizeT pick = 1; pick <= 4 * TaskPicker::kAgingPickInterval; ++pick) {
+        SizeT priority_idx = task_picker.Pick(task_lists);
+        ASSERT_LT(priority_idx, kQueryPriorityCount);
+        bool finish = priority_idx != kInteractive;
+        Run(task_lists, priority_idx, finish);
+        if (finish) {
+            lower_picks.push_back(pick);
+        }
+    }
+    // the waiting classes get their turn in order, one every kAgingPickInterval picks
+    Vector<SizeT> expected{TaskPicker::kAgingPickInterval, 2 * TaskPicker::kAgingPickInterval};
+    EXPECT_EQ(lower_picks, expected);
+    EXPECT_TRUE(task_lists[kBatch].empty());
+    EXPECT_TRUE(task_lists[kBackground].empty());
+}
+
+TEST_F(TaskSchedulerTest, test_steal) {
+    Atomic<bool> stopped{false};
+    WorkerQueue busy_queue;
+    WorkerQueue idle_queue;
+    TaskLists stolen_tasks;
+    // the loop of an idle worker: mark idle, look for tasks to steal, wait for a wakeup
+    auto steal_loop = [&] {
+        while (true) {
+            idle_queue.SetIdle(true);
+            if (busy_queue.Steal(stolen_tasks, NoRecord) > 0) {
+                idle_queue.SetIdle(false);
+                return;
+            }
+            idle_queue.Wait(stopped);
+        }
+    };
+
+    {
+        // a task queued to the busy worker wakes the idle worker up, which steals it
+        FragmentTask task(false);
+        Thread thief(steal_loop);
+        EXPECT_FALSE(busy_queue.Push(&task, kInteractive));
+        bool woken = false;
+        while (!woken && busy_queue.size() > 0) {
+            woken = idle_queue.Wakeup();
+        }
+        thief.join();
+        EXPECT_EQ(busy_queue.size(), 0ul);
+        ASSERT_EQ(stolen_tasks[kInteractive].size(), 1ul);
+        EXPECT_EQ(stolen_tasks[kInteractive].front(), &task);
+        stolen_tasks[kInteractive].clear();
+    }
+    {
+        // the older half of the highest class is stolen, the busy worker keeps the rest
+        Vector<UniquePtr<FragmentTask>> tasks;
+        for (SizeT i = 0; i < 4; ++i) {
+            tasks.push_back(MakeUnique<FragmentTask>(false));
+            busy_queue.Push(tasks.back().get(), kInteractive);
+        }
+        FragmentTask batch_task(false);
+        busy_queue.Push(&batch_task, kBatch);
+        Thread thief(steal_loop);
+        thief.join();
+        ASSERT_EQ(stolen_tasks[kInteractive].size(), 2ul);
+        EXPECT_EQ(stolen_tasks[kInteractive].front(), tasks[0].get());
+        EXPECT_EQ(stolen_tasks[kInteractive].back(), tasks[1].get());
+        EXPECT_TRUE(stolen_tasks[kBatch].empty());
+
+        TaskLists kept_tasks;
+        EXPECT_EQ(busy_queue.TakeAll(kept_tasks, NoRecord), 3ul);
+        ASSERT_EQ(kept_tasks[kInteractive].size(), 2ul);
+        EXPECT_EQ(kept_tasks[kInteractive].front(), tasks[2].get());
+        EXPECT_EQ(kept_tasks[kBatch].size(), 1ul);
+    }
+}
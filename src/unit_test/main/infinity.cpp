@@ -297,6 +297,16 @@ TEST_F(InfinityTest, test2) {
         EXPECT_EQ(result.IsOk(), true);
     }
 
+    {
+        QueryResult result = infinity->ShowVariable("scheduler_queue_depth", SetScope::kGlobal);
+        EXPECT_EQ(result.IsOk(), true);
+    }
+
+    {
+        QueryResult result = infinity->ShowVariable("scheduler_wait_time", SetScope::kGlobal);
+        EXPECT_EQ(result.IsOk(), true);
+    }
+
     {
         QueryResult result = infinity->ShowVariable("active_wal_filename", SetScope::kGlobal);
         EXPECT_EQ(result.IsOk(), true);
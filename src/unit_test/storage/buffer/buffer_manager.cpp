@@ -280,6 +280,62 @@ struct FileInfo {
     std::shared_mutex mtx_{};
 };
 
+TEST_F(BufferManagerTest, scan_resistant_test) {
+    const SizeT file_size = 100;
+    const SizeT hot_num = 4;
+    const SizeT scan_num = 50;
+    const SizeT buffer_size = 16 * file_size;
+
+    auto Run = [&](BufferReplacePolicy policy, bool no_cache) {
+        ResetDir();
+        BufferManager buffer_mgr(buffer_size, data_dir_, temp_dir_, nullptr, 1, policy);
+        auto Allocate = [&](const String &name) {
+            auto file_worker = MakeUnique<DataFileWorker>(data_dir_,
+                                                          temp_dir_,
+                                                          MakeShared<String>(""),
+                                                          MakeShared<String>(name),
+                                                          file_size,
+                                                          buffer_mgr.persistence_manager());
+            auto *buffer_obj = buffer_mgr.AllocateBufferObject(std::move(file_worker));
+            buffer_obj->AddObjRc();
+            return buffer_obj;
+        };
+        Vector<BufferObj *> hot_objs;
+        for (SizeT i = 0; i < hot_num; ++i) {
+            hot_objs.push_back(Allocate(fmt::format("hot_{}", i)));
+            for (SizeT j = 0; j < 2; ++j) {
+                auto buffer_handle = hot_objs.back()->Load();
+            }
+        }
+        {
+            Optional<BufferNoCacheScope> no_cache_scope;
+            if (no_cache) {
+                no_cache_scope.emplace();
+            }
+            for (SizeT i = 0; i < scan_num; ++i) {
+                auto buffer_handle = Allocate(fmt::format("scan_{}", i))->Load();
+            }
+        }
+        SizeT resident_n = 0;
+        for (auto *buffer_obj : hot_objs) {
+            resident_n += buffer_obj->status() == BufferStatus::kUnloaded;
+        }
+
+        auto cache_info = buffer_mgr.GetBufferCacheInfo();
+        EXPECT_EQ(cache_info.size(), 1ul);
+        EXPECT_EQ(cache_info[0].hit_count_, hot_num);
+        EXPECT_EQ(cache_info[0].miss_count_, hot_num + scan_num);
+        EXPECT_GT(cache_info[0].evict_count_, 0ul);
+        return resident_n;
+    };
+
+    // one pass over cold buffers flushes the hot set out of the plain LRU, which ignores the no cache hint
+    EXPECT_EQ(Run(BufferReplacePolicy::kLRU, false), 0ul);
+    EXPECT_EQ(Run(BufferReplacePolicy::k2Q, false), hot_num);
+    EXPECT_EQ(Run(BufferReplacePolicy::kLRU, true), 0ul);
+    EXPECT_EQ(Run(BufferReplacePolicy::k2Q, true), hot_num);
+}
+
 class TestObj {
 public:
     virtual ~TestObj() = default;
@@ -0,0 +1,171 @@
+// Copyright(C) 2024 InfiniFlow, Inc. All rights reserved.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//     https://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+
+#include "gtest/gtest.h"
+#include <random>
+import base_test;
+
+import stl;
+import hnsw_alg;
+import data_store;
+import dist_func_l2;
+import dist_func_ip;
+import dist_func_cos;
+import vec_store_type;
+import rabitq_vec_store;
+import hnsw_common;
+import infinity_exception;
+import virtual_store;
+import local_file_handle;
+
+using namespace infinity;
+
+class HnswRaBitQTest : public BaseTest {
+public:
+    using LabelT = u64;
+
+    static constexpr SizeT dim_ = 64;
+    static constexpr SizeT element_size_ = 2000;
+    static constexpr SizeT topk_ = 10;
+    static constexpr SizeT rerank_factor_ = 8;
+    const std::string save_dir_ = GetFullTmpDir();
+
+    void SetUp() override {
+        BaseTest::SetUp();
+        // clustered data, 1-bit codes are too coarse for i.i.d. gaussian vectors
+        std::mt19937 rng(0);
+        std::normal_distribution<float> distrib;
+        SizeT cluster_n = 20;
+        auto centers = MakeUnique<float[]>(dim_ * cluster_n);
+        for (SizeT i = 0; i < dim_ * cluster_n; ++i) {
+            centers[i] = distrib(rng) * 2;
+        }
+        data_ = MakeUnique<float[]>(dim_ * element_size_);
+        for (SizeT i = 0; i < element_size_; ++i) {
+            SizeT cluster = rng() % cluster_n;
+            for (SizeT j = 0; j < dim_; ++j) {
+                data_[i * dim_ + j] = centers[cluster * dim_ + j] + distrib(rng);
+            }
+        }
+    }
+
+    static float L2(const float *v1, const float *v2) {
+        float res = 0;
+        for (SizeT i = 0; i < dim_; ++i) {
+            res += (v1[i] - v2[i]) * (v1[i] - v2[i]);
+        }
+        return res;
+    }
+
+    // search on the codes, then rerank the candidates on the original vectors as the knn scan does
+    template <typename Hnsw>
+    float Recall(const Hnsw &hnsw_index) {
+        KnnSearchOption search_option{.ef_ = topk_ * rerank_factor_};
+        SizeT hits = 0;
+        SizeT query_n = 100;
+        for (SizeT q = 0; q < query_n; ++q) {
+            const float *query = data_.get() + (q * 7 % element_size_) * dim_;
+            auto candidates = hnsw_index->KnnSearchSorted(query, topk_ * rerank_factor_, search_option);
+            Vector<Pair<float, LabelT>> reranked;
+            for (const auto &[_, label] : candidates) {
+                reranked.emplace_back(L2(query, data_.get() + label * dim_), label);
+            }
+            std::sort(reranked.begin(), reranked.end());
+            reranked.resize(std::min(reranked.size(), topk_));
+
+            Vector<Pair<float, LabelT>> truth;
+            for (SizeT i = 0; i < element_size_; ++i) {
+                truth.emplace_back(L2(query, data_.get() + i * dim_), i);
+            }
+            std::partial_sort(truth.begin(), truth.begin() + topk_, truth.end());
+            for (SizeT i = 0; i < topk_; ++i) {
+                for (const auto &[_, label] : reranked) {
+                    if (label == truth[i].second) {
+                        ++hits;
+                        break;
+                    }
+                }
+            }
+        }
+        return float(hits) / (query_n * topk_);
+    }
+
+    UniquePtr<float[]> data_;
+};
+
+TEST_F(HnswRaBitQTest, test_distance) {
+    using VecStoreType = RaBitQL2VecStoreType<float>;
+    auto store = DataStore<VecStoreType, LabelT>::Make(element_size_, 1 /*chunk_n*/, dim_, 0 /*Mmax0*/, 0 /*Mmax*/);
+    auto iter = DenseVectorIter<float, LabelT>(data_.get(), dim_, element_size_);
+    store.OptAddVec(std::move(iter));
+
+    // centroid is taken from the first batch
+    const auto *centroid = store.vec_store_meta().centroid();
+    for (SizeT j = 0; j < dim_; ++j) {
+        double mean = 0;
+        for (SizeT i = 0; i < element_size_; ++i) {
+            mean += data_[i * dim_ + j];
+        }
+        EXPECT_NEAR(centroid[j], mean / element_size_, 1e-4);
+    }
+    EXPECT_EQ(store.vec_store_meta().compress_data_size(), sizeof(RaBitQData) + dim_ / 8);
+
+    RaBitQL2Dist<float> distance(dim_);
+    SizeT pair_n = 100;
+    float relative_error = 0;
+    for (SizeT i = 0; i < pair_n; ++i) {
+        auto query = store.MakeQuery(data_.get() + i * dim_);
+        float exact = L2(data_.get() + i * dim_, data_.get() + (i + 1) * dim_);
+        EXPECT_LE(distance(query, i, store), exact * 0.2);
+        relative_error += std::abs(distance(query, i + 1, store) - exact) / exact;
+        // distances between stored vectors use the 1-bit codes on both sides
+        float code_distance = distance(i, i + 1, store);
+        EXPECT_NEAR(code_distance, exact, exact);
+    }
+    EXPECT_LE(relative_error / pair_n, 0.15);
+}
+
+TEST_F(HnswRaBitQTest, test_recall) {
+    int M = 16;
+    int ef_construction = 200;
+    int chunk_size = 1024;
+    int max_chunk_n = 4;
+
+    String filepath = save_dir_ + "/test_hnsw_rabitq.bin";
+    {
+        using Hnsw = KnnHnsw<RaBitQL2VecStoreType<float>, LabelT>;
+        auto hnsw_index = Hnsw::Make(chunk_size, max_chunk_n, dim_, M, ef_construction);
+        HnswInsertConfig insert_config;
+        insert_config.optimize_ = true;
+        auto iter = DenseVectorIter<float, LabelT>(data_.get(), dim_, element_size_);
+        hnsw_index->InsertVecs(std::move(iter), insert_config);
+        hnsw_index->Check();
+        EXPECT_GE(Recall(hnsw_index), 0.9);
+
+        auto [file_handle, status] = VirtualStore::Open(filepath, FileAccessMode::kWrite);
+        if (!status.ok()) {
+            UnrecoverableError(status.message());
+        }
+        hnsw_index->Save(*file_handle);
+    }
+    {
+        using Hnsw = KnnHnsw<RaBitQL2VecStoreType<float>, LabelT>;
+        auto [file_handle, status] = VirtualStore::Open(filepath, FileAccessMode::kRead);
+        if (!status.ok()) {
+            UnrecoverableError(status.message());
+        }
+        auto hnsw_index = Hnsw::Load(*file_handle);
+        EXPECT_GE(Recall(hnsw_index), 0.9);
+    }
+}
@@ -171,6 +171,7 @@ union EmbeddingData {
 8: list<double> f64_array_value,
 9: list<double> f16_array_value,
 10: list<double> bf16_array_value,
+11: binary bytes_value, // raw little endian elements of the embedding data type, packed bits for bit
 }
 
 struct InitParameter {
@@ -297,6 +298,7 @@ JSONL,
 FVECS,
 CSR,
 BVECS,
+PARQUET,
 }
 
 enum ColumnType {
@@ -329,6 +331,7 @@ struct ColumnField {
 1: ColumnType column_type,
 2: list<binary> column_vectors = [],
 3: string column_name,
+4: i64 dimension = 0,
 }
 
 struct ImportOption {
@@ -544,6 +547,7 @@ struct InsertRequest {
 2:  string table_name,
 3:  list<Field> fields = [],
 4:  i64 session_id,
+5:  list<ColumnField> column_fields = [],
 }
 
 struct ImportRequest{
@@ -610,6 +614,9 @@ struct SelectRequest {
 11: optional ParsedExpr offset_expr,
 12: optional list<OrderByExpr> order_by_list = [],
 13: optional bool total_hits_count,
+14: optional i64 batch_rows, // > 0: return the result batch_rows rows at a time through a cursor
+15: optional string priority, // interactive, batch or background
+16: optional bool profile, // collect the per-operator profile of this query
 }
 
 struct SelectResponse {
@@ -618,6 +625,41 @@ struct SelectResponse {
 3: list<ColumnDef> column_defs = [],
 4: list<ColumnField> column_fields = [];
 5: string extra_result;
+6: i64 cursor_id, // non zero while the cursor has more rows, see FetchCursor
+7: optional string profile, // json profile when SelectRequest.profile is set
+}
+
+// query_count dense queries packed row by row in query_data (little endian), one knn search each
+struct MatchDenseBatchRequest {
+1: i64 session_id,
+2: string db_name,
+3: string table_name,
+4: string column_name,
+5: ElementType element_type,
+6: KnnDistanceType distance_type,
+7: i64 dimension,
+8: i64 query_count,
+9: binary query_data,
+10: i64 topn,
+11: list<InitParameter> opt_params = [],
+12: optional ParsedExpr where_expr,
+13: optional string priority, // interactive, batch or background
+}
+
+// query_count x topn row ids (i64) and distances (f32), padded with -1 / NaN when a query has fewer than topn results
+struct MatchDenseBatchResponse {
+1: i64 error_code,
+2: string error_msg,
+3: i64 query_count,
+4: i64 topn,
+5: binary row_ids,
+6: binary distances,
+}
+
+struct FetchCursorRequest {
+1: i64 session_id,
+2: i64 cursor_id,
+3: bool close, // release the cursor without fetching the rest
 }
 
 struct DeleteRequest {
@@ -781,6 +823,8 @@ CommonResponse Insert(1:InsertRequest request),
 CommonResponse Import(1:ImportRequest request),
 CommonResponse Export(1:ExportRequest request),
 SelectResponse Select(1:SelectRequest request),
+MatchDenseBatchResponse MatchDenseBatch(1:MatchDenseBatchRequest request),
+SelectResponse FetchCursor(1:FetchCursorRequest request),
 SelectResponse Explain(1:ExplainRequest request),
 DeleteResponse Delete(1:DeleteRequest request),
 CommonResponse Update(1:UpdateRequest request),